@@ -111,6 +111,10 @@ setup(
 
     # console entry point
     entry_points = {
+        'console_scripts': [
+            'genie-parser-daemon = genie.libs.parser.utils.daemon:main',
+            'genie-parser-bulk = genie.libs.parser.utils.bulk:main',
+        ],
     },
 
     # package dependencies
@@ -22,4 +22,10 @@ from .base import tcl_invoke_ats_cmd,\
 from genie import abstract
 abstract.declare_package(__name__)
 
+# Hit and miss statistics of the parser patterns, see utils.pattern_stats
+import os as _os
+if _os.environ.get('GENIE_PATTERN_STATS'):
+    from .utils.pattern_stats import enable_from_env
+    enable_from_env()
+
 
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # =============================================
@@ -19,7 +20,7 @@ class ShowArpSchema(MetaParser):
         * show arp
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
     	Any(): {
             'ipv4': {
                 'neighbors': {
@@ -32,7 +33,7 @@ class ShowArpSchema(MetaParser):
                 }
             }
         },
-    }
+    })
 
 # =============================================
 # Parser for 'show arp'
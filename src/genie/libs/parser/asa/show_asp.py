@@ -6,6 +6,7 @@ Parser for the following show command(s):
 
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                                 Any, \
                                                 Optional
@@ -19,7 +20,7 @@ class ShowAspDropSchema(MetaParser):
     Schema for
          * show asp drop
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'frame_drop': {
             Any(): int,
             'last_clearing': str,
@@ -28,7 +29,7 @@ class ShowAspDropSchema(MetaParser):
             Any(): int,
             'last_clearing': str,
         }
-    }
+    })
 
 
 # =============================================
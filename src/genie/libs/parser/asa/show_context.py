@@ -7,6 +7,7 @@ Parser for the following show commands:
 
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                                 Any, \
                                                 Optional
@@ -18,7 +19,7 @@ class ShowContextSchema(MetaParser):
     """Schema for
         * show context
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'candidate_default': bool,
             'class': str,
@@ -26,7 +27,7 @@ class ShowContextSchema(MetaParser):
             'url': str,
             'interfaces': list
         }
-    }
+    })
 
 # =============================================
 # Parser for 'show context'
@@ -117,7 +118,7 @@ class ShowContextDetailSchema(MetaParser):
     """Schema for
         * show context detail
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'id': int,
             'flags': str,
@@ -129,7 +130,7 @@ class ShowContextDetailSchema(MetaParser):
                 Optional('mapped_interfaces'): list
             }
         }
-    }
+    })
 
 # =============================================
 # Parser for 'show context detail'
@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # =============================================
@@ -21,7 +22,7 @@ class ShowInterfaceSummarySchema(MetaParser):
         * show interface summary
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'link_status': bool,
@@ -41,7 +42,7 @@ class ShowInterfaceSummarySchema(MetaParser):
                 Optional('config_issue'): str
             },
         }
-    }
+    })
 
 # =============================================
 # Parser for 'show interface summary'
@@ -156,7 +157,7 @@ class ShowInterfaceIpBriefSchema(MetaParser):
         * show interface ip brief
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 Optional('ipv4'): {
@@ -174,7 +175,7 @@ class ShowInterfaceIpBriefSchema(MetaParser):
                 Optional('line_protocol'): str
                 },
             }
-        }
+        })
 
 # =============================================
 # Parser for 'show interface ip brief'
@@ -253,7 +254,7 @@ class ShowInterfaceDetailSchema(MetaParser):
         * show interface detail
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'link_status': bool,
@@ -291,7 +292,7 @@ class ShowInterfaceDetailSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 # =============================================
 # Parser for 'show interface detail'
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any
 
 # =============================================
@@ -19,14 +20,14 @@ class ShowInventorySchema(MetaParser):
         * show inventory
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'description': str,
             'pid': str,
             'vid': str,
             'sn': str
         }
-    }
+    })
 
 # =============================================
 # Parser for 'show inventory'
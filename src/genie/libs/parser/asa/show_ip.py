@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import (Schema, 
                                                 Any,
                                                 Optional)
@@ -21,7 +22,7 @@ class ShowIpLocalPoolSchema(MetaParser):
         * show ip local pool {pool}
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'pool': {
             str: {
                 'available_addresses': list,
@@ -34,7 +35,7 @@ class ShowIpLocalPoolSchema(MetaParser):
                 'mask': str,
             }
         }
-    }
+    })
 
 # =============================================
 # Parser for 'show ip local pool {pool}'
@@ -6,6 +6,7 @@ Parser for the following show commands:
 
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                                 Any, \
                                                 Optional
@@ -18,7 +19,7 @@ class ShowResourceUsageSchema(MetaParser):
     """Schema for
         * show resource usage
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'context': {
             Any(): {
                 'resource': {
@@ -31,7 +32,7 @@ class ShowResourceUsageSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =============================================
@@ -7,6 +7,7 @@ Parser for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 from netaddr import IPAddress
 
@@ -19,7 +20,7 @@ class ShowRouteSchema(MetaParser):
     """Schema for
         * show route
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             'default': {
                 'address_family': {
@@ -55,7 +56,7 @@ class ShowRouteSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
     """
     Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
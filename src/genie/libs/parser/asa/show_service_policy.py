@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import (Schema, 
                                                 Any,
                                                 Optional)
@@ -21,7 +22,7 @@ class ShowServicePolicySchema(MetaParser):
         * show service-policy
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'global_policy': {
             'service_policy': {
                 str: {
@@ -48,7 +49,7 @@ class ShowServicePolicySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # =============================================
 # Parser for 'show service-policy'
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # =============================================
@@ -18,7 +19,7 @@ class ShowTrafficSchema(MetaParser):
     """Schema for
         * show traffic
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'received': {
                 'duration': int,
@@ -45,7 +46,7 @@ class ShowTrafficSchema(MetaParser):
             'bytes_output_5_minute': int,
             'packets_drop_rate_5_minute': int
         },
-    }
+    })
 
 # =============================================
 # Parser for 'show traffic'
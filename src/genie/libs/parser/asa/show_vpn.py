@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import (Schema, 
                                                 Any,
                                                 Optional)
@@ -22,7 +23,7 @@ class ShowVPNLoadBalancingSchema(MetaParser):
         * show vpn load-balancing
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'status': str,
         'role': str,
         'failover': str,
@@ -53,7 +54,7 @@ class ShowVPNLoadBalancingSchema(MetaParser):
                 'public_ip': str,
             }
         }
-    }
+    })
 
 
 # =============================================
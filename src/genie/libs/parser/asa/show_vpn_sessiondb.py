@@ -13,6 +13,7 @@ Parser for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                                 Any, \
                                                 Optional
@@ -29,7 +30,7 @@ class ShowVPNSessionDBSummarySchema(MetaParser):
         * show vpn-sessiondb
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'summary': {
             'VPN Session': {
                 'total_active_and_inactive': int,
@@ -128,7 +129,7 @@ class ShowVPNSessionDBSummarySchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 
 # =============================================
@@ -324,7 +325,7 @@ class ShowVPNSessionDBSummary(ShowVPNSessionDBSummarySchema):
 
 
 class ShowVpnSessiondbSuperSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'session_type': {
             Any(): {
                 'username': {
@@ -376,7 +377,7 @@ class ShowVpnSessiondbSuperSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # =============================================
 # Super Parser for
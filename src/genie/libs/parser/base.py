@@ -4,6 +4,8 @@ __all__ = (
     'tcl_package_require_caas_parsers',
     'tcl_invoke_caas_abstract_parser',
     'CaasMetaParser',
+    'LazySchema',
+    'JSON_CONTEXT_LIST',
 )
 
 import os
@@ -75,4 +77,41 @@ class CaasMetaParser(MetaParser):
         super().__init__(*args, **kwargs)
         tcl_package_require_caas_parsers()
 
+
+# Contexts accepted by MetaParser.parse, and the json context of the parsers
+# with a json() method, which set CONTEXT_LIST = JSON_CONTEXT_LIST
+JSON_CONTEXT_LIST = tuple(MetaParser.CONTEXT_LIST) + ('json',)
+
+
+class LazySchema(object):
+    '''Schema of a MetaParser class, built on first access.
+
+        class ShowVersionSchema(MetaParser):
+            schema = LazySchema(lambda: {
+                'version': str,
+                Optional('uptime'): str,
+            })
+
+    The schemaengine objects of a schema are only built for the parsers in
+    use, instead of for every parser class at import. The built schema then
+    replaces the LazySchema on its class.
+    '''
+
+    def __init__(self, builder):
+        self.builder = builder
+        self.owner = None
+        self.name = None
+        self.schema = None
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if self.schema is None:
+            self.schema = self.builder()
+            if self.owner is not None:
+                setattr(self.owner, self.name, self.schema)
+        return self.schema
+
 # vim: ft=python ts=8 sw=4 et
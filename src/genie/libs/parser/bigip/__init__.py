@@ -1,3 +1,26 @@
 from genie import abstract
 abstract.declare_token(__name__)
 
+import importlib
+
+# The parser modules, such as get_ltm_pool, are built from the endpoint
+# table when first imported
+from .icontrol import install, endpoints, module_of, snapshot, \
+                      EndpointResult
+install()
+
+
+def __getattr__(name):
+    '''Parser modules, and parser classes by name'''
+    if name in endpoints():
+        return importlib.import_module(__name__ + '.' + name)
+    module = module_of(name)
+    if module:
+        return getattr(importlib.import_module(__name__ + '.' + module), name)
+    raise AttributeError("module '{m}' has no attribute '{n}'".format(
+        m=__name__, n=name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(endpoints()))
+
@@ -0,0 +1,748 @@
+'''iControl REST endpoints of the bigip parsers
+
+One line per parser: name of the parser module, name of the parser class
+and path of the resource below /mgmt/tm. The parser classes are built from
+this table by `genie.libs.parser.bigip.icontrol` when first looked up.
+'''
+
+ENDPOINTS = '''\
+get_access_acl_stats AccessAclstats access/acl-stats
+get_access_bundle_install_tasks AccessBundleinstalltasks access/bundle-install-tasks
+get_access_profile_access_misc_stats AccessProfileaccessmiscstats access/profile-access-misc-stats
+get_access_profile_rewrite_stats AccessProfilerewritestats access/profile-rewrite-stats
+get_access_profile_rewritestats AccessProfilerewriteStats access/profile-rewrite/stats
+get_access_redeploy_iapp_tasks AccessRedeployiapptasks access/redeploy-iapp-tasks
+get_access_sessionkill_sessions AccessSessionKillsessions access/session/kill-sessions
+get_access_usecase_pack_info AccessUsecasepackinfo access/usecase-pack-info
+get_adc_fileobjectssl_cert AdcFileobjectSslcert adc/fileobject/ssl-cert
+get_adc_fileobjectssl_crl AdcFileobjectSslcrl adc/fileobject/ssl-crl
+get_adc_fileobjectssl_csr AdcFileobjectSslcsr adc/fileobject/ssl-csr
+get_adc_fileobjectssl_key AdcFileobjectSslkey adc/fileobject/ssl-key
+get_analytics_afm_sweepergenerate_report AnalyticsAfmsweeperGeneratereport analytics/afm-sweeper/generate-report
+get_analytics_afm_sweeperreport_results AnalyticsAfmsweeperReportresults analytics/afm-sweeper/report-results
+get_analytics_application_security_anomaliesgenerate_report AnalyticsApplicationsecurityanomaliesGeneratereport analytics/application-security-anomalies/generate-report
+get_analytics_application_security_anomaliesreport_results AnalyticsApplicationsecurityanomaliesReportresults analytics/application-security-anomalies/report-results
+get_analytics_application_security_incidentsgenerate_report AnalyticsApplicationsecurityincidentsGeneratereport analytics/application-security-incidents/generate-report
+get_analytics_application_security_incidentsreport_results AnalyticsApplicationsecurityincidentsReportresults analytics/application-security-incidents/report-results
+get_analytics_application_security_networkgenerate_report AnalyticsApplicationsecuritynetworkGeneratereport analytics/application-security-network/generate-report
+get_analytics_application_security_networkreport_results AnalyticsApplicationsecuritynetworkReportresults analytics/application-security-network/report-results
+get_analytics_application_securitygenerate_report AnalyticsApplicationsecurityGeneratereport analytics/application-security/generate-report
+get_analytics_application_securityreport_results AnalyticsApplicationsecurityReportresults analytics/application-security/report-results
+get_analytics_asm_bypassgenerate_report AnalyticsAsmbypassGeneratereport analytics/asm-bypass/generate-report
+get_analytics_asm_bypassreport_results AnalyticsAsmbypassReportresults analytics/asm-bypass/report-results
+get_analytics_asm_cpugenerate_report AnalyticsAsmcpuGeneratereport analytics/asm-cpu/generate-report
+get_analytics_asm_cpureport_results AnalyticsAsmcpuReportresults analytics/asm-cpu/report-results
+get_analytics_asm_enforced_entitiesgenerate_report AnalyticsAsmenforcedentitiesGeneratereport analytics/asm-enforced-entities/generate-report
+get_analytics_asm_enforced_entitiesreport_results AnalyticsAsmenforcedentitiesReportresults analytics/asm-enforced-entities/report-results
+get_analytics_asm_learning_suggestionsgenerate_report AnalyticsAsmlearningsuggestionsGeneratereport analytics/asm-learning-suggestions/generate-report
+get_analytics_asm_learning_suggestionsreport_results AnalyticsAsmlearningsuggestionsReportresults analytics/asm-learning-suggestions/report-results
+get_analytics_asm_memorygenerate_report AnalyticsAsmmemoryGeneratereport analytics/asm-memory/generate-report
+get_analytics_asm_memoryreport_results AnalyticsAsmmemoryReportresults analytics/asm-memory/report-results
+get_analytics_asm_policy_changesgenerate_report AnalyticsAsmpolicychangesGeneratereport analytics/asm-policy-changes/generate-report
+get_analytics_asm_policy_changesreport_results AnalyticsAsmpolicychangesReportresults analytics/asm-policy-changes/report-results
+get_analytics_bot_defense_eventgenerate_report AnalyticsBotdefenseeventGeneratereport analytics/bot-defense-event/generate-report
+get_analytics_bot_defense_eventreport_results AnalyticsBotdefenseeventReportresults analytics/bot-defense-event/report-results
+get_analytics_cpu_per_vipgenerate_report AnalyticsCpupervipGeneratereport analytics/cpu-per-vip/generate-report
+get_analytics_cpu_per_vipreport_results AnalyticsCpupervipReportresults analytics/cpu-per-vip/report-results
+get_analytics_cpugenerate_report AnalyticsCpuGeneratereport analytics/cpu/generate-report
+get_analytics_cpureport_results AnalyticsCpuReportresults analytics/cpu/report-results
+get_analytics_disk_infogenerate_report AnalyticsDiskinfoGeneratereport analytics/disk-info/generate-report
+get_analytics_disk_inforeport_results AnalyticsDiskinfoReportresults analytics/disk-info/report-results
+get_analytics_dns_rpzgenerate_report AnalyticsDnsrpzGeneratereport analytics/dns-rpz/generate-report
+get_analytics_dns_rpzreport_results AnalyticsDnsrpzReportresults analytics/dns-rpz/report-results
+get_analytics_dnsgenerate_report AnalyticsDnsGeneratereport analytics/dns/generate-report
+get_analytics_dnsreport_results AnalyticsDnsReportresults analytics/dns/report-results
+get_analytics_dos_l3generate_report AnalyticsDosl3Generatereport analytics/dos-l3/generate-report
+get_analytics_dos_l3report_results AnalyticsDosl3Reportresults analytics/dos-l3/report-results
+get_analytics_dos_vis_attacksgenerate_report AnalyticsDosvisattacksGeneratereport analytics/dos-vis-attacks/generate-report
+get_analytics_dos_vis_attacksreport_results AnalyticsDosvisattacksReportresults analytics/dos-vis-attacks/report-results
+get_analytics_dos_vis_commongenerate_report AnalyticsDosviscommonGeneratereport analytics/dos-vis-common/generate-report
+get_analytics_dos_vis_commonreport_results AnalyticsDosviscommonReportresults analytics/dos-vis-common/report-results
+get_analytics_dos_vis_vipsgenerate_report AnalyticsDosvisvipsGeneratereport analytics/dos-vis-vips/generate-report
+get_analytics_dos_vis_vipsreport_results AnalyticsDosvisvipsReportresults analytics/dos-vis-vips/report-results
+get_analytics_fw_natgenerate_report AnalyticsFwnatGeneratereport analytics/fw-nat/generate-report
+get_analytics_fw_natreport_results AnalyticsFwnatReportresults analytics/fw-nat/report-results
+get_analytics_genericgenerate_report AnalyticsGenericGeneratereport analytics/generic/generate-report
+get_analytics_genericreport_results AnalyticsGenericReportresults analytics/generic/report-results
+get_analytics_httpgenerate_report AnalyticsHttpGeneratereport analytics/http/generate-report
+get_analytics_httpreport_results AnalyticsHttpReportresults analytics/http/report-results
+get_analytics_ip_intelligencegenerate_report AnalyticsIpintelligenceGeneratereport analytics/ip-intelligence/generate-report
+get_analytics_ip_intelligencereport_results AnalyticsIpintelligenceReportresults analytics/ip-intelligence/report-results
+get_analytics_ip_layergenerate_report AnalyticsIplayerGeneratereport analytics/ip-layer/generate-report
+get_analytics_ip_layerreport_results AnalyticsIplayerReportresults analytics/ip-layer/report-results
+get_analytics_lsn_poolgenerate_report AnalyticsLsnpoolGeneratereport analytics/lsn-pool/generate-report
+get_analytics_lsn_poolreport_results AnalyticsLsnpoolReportresults analytics/lsn-pool/report-results
+get_analytics_memory_per_processgenerate_report AnalyticsMemoryperprocessGeneratereport analytics/memory-per-process/generate-report
+get_analytics_memory_per_processreport_results AnalyticsMemoryperprocessReportresults analytics/memory-per-process/report-results
+get_analytics_memorygenerate_report AnalyticsMemoryGeneratereport analytics/memory/generate-report
+get_analytics_memoryreport_results AnalyticsMemoryReportresults analytics/memory/report-results
+get_analytics_networkgenerate_report AnalyticsNetworkGeneratereport analytics/network/generate-report
+get_analytics_networkreport_results AnalyticsNetworkReportresults analytics/network/report-results
+get_analytics_pemgenerate_report AnalyticsPemGeneratereport analytics/pem/generate-report
+get_analytics_pemreport_results AnalyticsPemReportresults analytics/pem/report-results
+get_analytics_proc_cpugenerate_report AnalyticsProccpuGeneratereport analytics/proc-cpu/generate-report
+get_analytics_proc_cpureport_results AnalyticsProccpuReportresults analytics/proc-cpu/report-results
+get_analytics_protocol_inspectiongenerate_report AnalyticsProtocolinspectionGeneratereport analytics/protocol-inspection/generate-report
+get_analytics_protocol_inspectionreport_results AnalyticsProtocolinspectionReportresults analytics/protocol-inspection/report-results
+get_analytics_protocol_security_httpgenerate_report AnalyticsProtocolsecurityhttpGeneratereport analytics/protocol-security-http/generate-report
+get_analytics_protocol_security_httpreport_results AnalyticsProtocolsecurityhttpReportresults analytics/protocol-security-http/report-results
+get_analytics_protocol_securitygenerate_report AnalyticsProtocolsecurityGeneratereport analytics/protocol-security/generate-report
+get_analytics_protocol_securityreport_results AnalyticsProtocolsecurityReportresults analytics/protocol-security/report-results
+get_analytics_sipgenerate_report AnalyticsSipGeneratereport analytics/sip/generate-report
+get_analytics_sipreport_results AnalyticsSipReportresults analytics/sip/report-results
+get_analytics_ssl_orchestrator_service_virtualgenerate_report AnalyticsSslorchestratorservicevirtualGeneratereport analytics/ssl-orchestrator-service-virtual/generate-report
+get_analytics_ssl_orchestrator_service_virtualreport_results AnalyticsSslorchestratorservicevirtualReportresults analytics/ssl-orchestrator-service-virtual/report-results
+get_analytics_ssl_orchestratorgenerate_report AnalyticsSslorchestratorGeneratereport analytics/ssl-orchestrator/generate-report
+get_analytics_ssl_orchestratorreport_results AnalyticsSslorchestratorReportresults analytics/ssl-orchestrator/report-results
+get_analytics_swg_blockedgenerate_report AnalyticsSwgblockedGeneratereport analytics/swg-blocked/generate-report
+get_analytics_swg_blockedreport_results AnalyticsSwgblockedReportresults analytics/swg-blocked/report-results
+get_analytics_swggenerate_report AnalyticsSwgGeneratereport analytics/swg/generate-report
+get_analytics_swgreport_results AnalyticsSwgReportresults analytics/swg/report-results
+get_analytics_system_monitorgenerate_report AnalyticsSystemmonitorGeneratereport analytics/system-monitor/generate-report
+get_analytics_system_monitorreport_results AnalyticsSystemmonitorReportresults analytics/system-monitor/report-results
+get_analytics_tcp_analyticsgenerate_report AnalyticsTcpanalyticsGeneratereport analytics/tcp-analytics/generate-report
+get_analytics_tcp_analyticsreport_results AnalyticsTcpanalyticsReportresults analytics/tcp-analytics/report-results
+get_analytics_tcpgenerate_report AnalyticsTcpGeneratereport analytics/tcp/generate-report
+get_analytics_tcpreport_results AnalyticsTcpReportresults analytics/tcp/report-results
+get_analytics_traffic_classificationgenerate_report AnalyticsTrafficclassificationGeneratereport analytics/traffic-classification/generate-report
+get_analytics_traffic_classificationreport_results AnalyticsTrafficclassificationReportresults analytics/traffic-classification/report-results
+get_analytics_udpgenerate_report AnalyticsUdpGeneratereport analytics/udp/generate-report
+get_analytics_udpreport_results AnalyticsUdpReportresults analytics/udp/report-results
+get_analytics_vcmpgenerate_report AnalyticsVcmpGeneratereport analytics/vcmp/generate-report
+get_analytics_vcmpreport_results AnalyticsVcmpReportresults analytics/vcmp/report-results
+get_analytics_virtualgenerate_report AnalyticsVirtualGeneratereport analytics/virtual/generate-report
+get_analytics_virtualreport_results AnalyticsVirtualReportresults analytics/virtual/report-results
+get_auth_cert_ldap AuthCertldap auth/cert-ldap
+get_auth_ldap AuthLdap auth/ldap
+get_auth_login_failures AuthLoginfailures auth/login-failures
+get_auth_partition AuthPartition auth/partition
+get_auth_password_policy AuthPasswordpolicy auth/password-policy
+get_auth_radius AuthRadius auth/radius
+get_auth_radius_server AuthRadiusserver auth/radius-server
+get_auth_remote_role AuthRemoterole auth/remote-role
+get_auth_remote_user AuthRemoteuser auth/remote-user
+get_auth_source AuthSource auth/source
+get_auth_tacacs AuthTacacs auth/tacacs
+get_auth_user AuthUser auth/user
+get_cli_alias CliAlias cli/alias
+get_cli_aliasprivate CliAliasPrivate cli/alias/private
+get_cli_aliasshared CliAliasShared cli/alias/shared
+get_cli_global_settings CliGlobalsettings cli/global-settings
+get_cli_history CliHistory cli/history
+get_cli_preference CliPreference cli/preference
+get_cli_script CliScript cli/script
+get_cli_version CliVersion cli/version
+get_cloud_cmdevice_group CloudCmDevicegroup cloud/cm/device-group
+get_cloud_ltmnode_addresses CloudLtmNodeaddresses cloud/ltm/node-addresses
+get_cloud_ltmpool_members CloudLtmPoolmembers cloud/ltm/pool-members
+get_cloud_ltmpools CloudLtmPools cloud/ltm/pools
+get_cloud_ltmvirtual_servers CloudLtmVirtualservers cloud/ltm/virtual-servers
+get_cloud_servicesiapp CloudServicesIapp cloud/services/iapp
+get_cloud_templatesiapp CloudTemplatesIapp cloud/templates/iapp
+get_cm_cert CmCert cm/cert
+get_cm_device CmDevice cm/device
+get_cm_device_group CmDevicegroup cm/device-group
+get_cm_failover_status CmFailoverstatus cm/failover-status
+get_cm_key CmKey cm/key
+get_cm_sha1_fingerprint CmSha1fingerprint cm/sha1-fingerprint
+get_cm_sync_status CmSyncstatus cm/sync-status
+get_cm_traffic_group CmTrafficgroup cm/traffic-group
+get_cm_trust_domain CmTrustdomain cm/trust-domain
+get_file_apmcustomization_group FileApmCustomizationgroup file/apm/policy/customization-group
+get_file_apmcustomization_image_file FileApmCustomizationimagefile file/apm/policy/customization-image-file
+get_file_apmcustomization_template_file FileApmCustomizationtemplatefile file/apm/policy/customization-template-file
+get_file_apmepsec_file_object FileApmEpsecfileobject file/apm/epsec/epsec-file-object
+get_file_apmkerberos_keytab_file FileApmKerberoskeytabfile file/apm/aaa/kerberos-keytab-file
+get_file_apmping_access_properties_files FileApmPingaccesspropertiesfiles file/apm/aaa/ping-access-properties-files
+get_file_apmsandbox_file FileApmSandboxfile file/apm/resource/sandbox-file
+get_file_apmsecurid_config_files FileApmSecuridconfigfiles file/apm/aaa/securid-config-files
+get_gtm_datacenter GtmDatacenter gtm/datacenter
+get_gtm_distributed_app GtmDistributedapp gtm/distributed-app
+get_gtm_global_settings GtmGlobalsettings gtm/global-settings
+get_gtm_global_settingsgeneral GtmGlobalsettingsGeneral gtm/global-settings/general
+get_gtm_global_settingsload_balancing GtmGlobalsettingsLoadbalancing gtm/global-settings/load-balancing
+get_gtm_global_settingsmetrics GtmGlobalsettingsMetrics gtm/global-settings/metrics
+get_gtm_global_settingsmetrics_exclusions GtmGlobalsettingsMetricsexclusions gtm/global-settings/metrics-exclusions
+get_gtm_iquery GtmIquery gtm/iquery
+get_gtm_ldns GtmLdns gtm/ldns
+get_gtm_link GtmLink gtm/link
+get_gtm_listener GtmListener gtm/listener
+get_gtm_monitor GtmMonitor gtm/monitor
+get_gtm_monitorbigip GtmMonitorBigip gtm/monitor/bigip
+get_gtm_monitorbigip_link GtmMonitorBigiplink gtm/monitor/bigip-link
+get_gtm_monitorexternal GtmMonitorExternal gtm/monitor/external
+get_gtm_monitorfirepass GtmMonitorFirepass gtm/monitor/firepass
+get_gtm_monitorftp GtmMonitorFtp gtm/monitor/ftp
+get_gtm_monitorgateway_icmp GtmMonitorGatewayicmp gtm/monitor/gateway-icmp
+get_gtm_monitorgtp GtmMonitorGtp gtm/monitor/gtp
+get_gtm_monitorhttp GtmMonitorHttp gtm/monitor/http
+get_gtm_monitorhttps GtmMonitorHttps gtm/monitor/https
+get_gtm_monitorimap GtmMonitorImap gtm/monitor/imap
+get_gtm_monitorldap GtmMonitorLdap gtm/monitor/ldap
+get_gtm_monitormssql GtmMonitorMssql gtm/monitor/mssql
+get_gtm_monitormysql GtmMonitorMysql gtm/monitor/mysql
+get_gtm_monitornntp GtmMonitorNntp gtm/monitor/nntp
+get_gtm_monitornone GtmMonitorNone gtm/monitor/none
+get_gtm_monitororacle GtmMonitorOracle gtm/monitor/oracle
+get_gtm_monitorpop3 GtmMonitorPop3 gtm/monitor/pop3
+get_gtm_monitorpostgresql GtmMonitorPostgresql gtm/monitor/postgresql
+get_gtm_monitorradius GtmMonitorRadius gtm/monitor/radius
+get_gtm_monitorradius_accounting GtmMonitorRadiusaccounting gtm/monitor/radius-accounting
+get_gtm_monitorreal_server GtmMonitorRealserver gtm/monitor/real-server
+get_gtm_monitorscripted GtmMonitorScripted gtm/monitor/scripted
+get_gtm_monitorsip GtmMonitorSip gtm/monitor/sip
+get_gtm_monitorsmtp GtmMonitorSmtp gtm/monitor/smtp
+get_gtm_monitorsnmp GtmMonitorSnmp gtm/monitor/snmp
+get_gtm_monitorsnmp_link GtmMonitorSnmplink gtm/monitor/snmp-link
+get_gtm_monitorsoap GtmMonitorSoap gtm/monitor/soap
+get_gtm_monitortcp GtmMonitorTcp gtm/monitor/tcp
+get_gtm_monitortcp_half_open GtmMonitorTcphalfopen gtm/monitor/tcp-half-open
+get_gtm_monitorudp GtmMonitorUdp gtm/monitor/udp
+get_gtm_monitorwap GtmMonitorWap gtm/monitor/wap
+get_gtm_monitorwmi GtmMonitorWmi gtm/monitor/wmi
+get_gtm_path GtmPath gtm/path
+get_gtm_persist GtmPersist gtm/persist
+get_gtm_pool GtmPool gtm/pool
+get_gtm_poola GtmPoolA gtm/pool/a
+get_gtm_poolaaaa GtmPoolAaaa gtm/pool/aaaa
+get_gtm_poolcname GtmPoolCname gtm/pool/cname
+get_gtm_poolmx GtmPoolMx gtm/pool/mx
+get_gtm_poolnaptr GtmPoolNaptr gtm/pool/naptr
+get_gtm_poolsrv GtmPoolSrv gtm/pool/srv
+get_gtm_prober_pool GtmProberpool gtm/prober-pool
+get_gtm_region GtmRegion gtm/region
+get_gtm_rule GtmRule gtm/rule
+get_gtm_server GtmServer gtm/server
+get_gtm_sync_status GtmSyncstatus gtm/sync-status
+get_gtm_topology GtmTopology gtm/topology
+get_gtm_traffic GtmTraffic gtm/traffic
+get_gtm_wideip GtmWideip gtm/wideip
+get_gtm_wideipa GtmWideipA gtm/wideip/a
+get_gtm_wideipaaaa GtmWideipAaaa gtm/wideip/aaaa
+get_gtm_wideipcname GtmWideipCname gtm/wideip/cname
+get_gtm_wideipmx GtmWideipMx gtm/wideip/mx
+get_gtm_wideipnaptr GtmWideipNaptr gtm/wideip/naptr
+get_gtm_wideipsrv GtmWideipSrv gtm/wideip/srv
+get_live_update_asm_attack_signatures Live_updateAsmattacksignatures live-update/asm-attack-signatures
+get_live_update_asm_attack_signaturesavailability Live_updateAsmattacksignaturesAvailability live-update/asm-attack-signatures/availability
+get_live_update_asm_attack_signaturesinstall_schedule Live_updateAsmattacksignaturesInstallschedule live-update/asm-attack-signatures/install-schedule
+get_live_update_asm_attack_signaturesinstallations Live_updateAsmattacksignaturesInstallations live-update/asm-attack-signatures/installations
+get_live_update_asm_attack_signaturesupdate_files Live_updateAsmattacksignaturesUpdatefiles live-update/asm-attack-signatures/update-files
+get_live_update_bot_signatures Live_updateBotsignatures live-update/bot-signatures
+get_live_update_bot_signaturesavailability Live_updateBotsignaturesAvailability live-update/bot-signatures/availability
+get_live_update_bot_signaturesinstall_schedule Live_updateBotsignaturesInstallschedule live-update/bot-signatures/install-schedule
+get_live_update_bot_signaturesinstallations Live_updateBotsignaturesInstallations live-update/bot-signatures/installations
+get_live_update_bot_signaturesupdate_files Live_updateBotsignaturesUpdatefiles live-update/bot-signatures/update-files
+get_live_update_browser_challenges Live_updateBrowserchallenges live-update/browser-challenges
+get_live_update_browser_challengesavailability Live_updateBrowserchallengesAvailability live-update/browser-challenges/availability
+get_live_update_browser_challengesinstall_schedule Live_updateBrowserchallengesInstallschedule live-update/browser-challenges/install-schedule
+get_live_update_browser_challengesinstallations Live_updateBrowserchallengesInstallations live-update/browser-challenges/installations
+get_live_update_browser_challengesupdate_files Live_updateBrowserchallengesUpdatefiles live-update/browser-challenges/update-files
+get_live_update_server_technologies Live_updateServertechnologies live-update/server-technologies
+get_live_update_server_technologiesavailability Live_updateServertechnologiesAvailability live-update/server-technologies/availability
+get_live_update_server_technologiesinstall_schedule Live_updateServertechnologiesInstallschedule live-update/server-technologies/install-schedule
+get_live_update_server_technologiesinstallations Live_updateServertechnologiesInstallations live-update/server-technologies/installations
+get_live_update_server_technologiesupdate_files Live_updateServertechnologiesUpdatefiles live-update/server-technologies/update-files
+get_live_update_threat_campaigns Live_updateThreatcampaigns live-update/threat-campaigns
+get_live_update_threat_campaignsavailability Live_updateThreatcampaignsAvailability live-update/threat-campaigns/availability
+get_live_update_threat_campaignsinstall_schedule Live_updateThreatcampaignsInstallschedule live-update/threat-campaigns/install-schedule
+get_live_update_threat_campaignsinstallations Live_updateThreatcampaignsInstallations live-update/threat-campaigns/installations
+get_live_update_threat_campaignsupdate_files Live_updateThreatcampaignsUpdatefiles live-update/threat-campaigns/update-files
+get_ltm_auth LtmAuth ltm/auth
+get_ltm_authcrldp_server LtmAuthCrldpserver ltm/auth/crldp-server
+get_ltm_authkerberos_delegation LtmAuthKerberosdelegation ltm/auth/kerberos-delegation
+get_ltm_authldap LtmAuthLdap ltm/auth/ldap
+get_ltm_authocsp_responder LtmAuthOcspresponder ltm/auth/ocsp-responder
+get_ltm_authprofile LtmAuthProfile ltm/auth/profile
+get_ltm_authradius LtmAuthRadius ltm/auth/radius
+get_ltm_authradius_server LtmAuthRadiusserver ltm/auth/radius-server
+get_ltm_authssl_cc_ldap LtmAuthSslccldap ltm/auth/ssl-cc-ldap
+get_ltm_authssl_crldp LtmAuthSslcrldp ltm/auth/ssl-crldp
+get_ltm_authssl_ocsp LtmAuthSslocsp ltm/auth/ssl-ocsp
+get_ltm_authtacacs LtmAuthTacacs ltm/auth/tacacs
+get_ltm_cipher LtmCipher ltm/cipher
+get_ltm_ciphergroup LtmCipherGroup ltm/cipher/group
+get_ltm_cipherrule LtmCipherRule ltm/cipher/rule
+get_ltm_data_group LtmDatagroup ltm/data-group
+get_ltm_data_groupexternal LtmDatagroupExternal ltm/data-group/external
+get_ltm_data_groupinternal LtmDatagroupInternal ltm/data-group/internal
+get_ltm_default_node_monitor LtmDefaultnodemonitor ltm/default-node-monitor
+get_ltm_dns LtmDns ltm/dns
+get_ltm_dnsanalytics LtmDnsAnalytics ltm/dns/analytics
+get_ltm_dnscache LtmDnsCache ltm/dns/cache
+get_ltm_dnsdnssec LtmDnsDnssec ltm/dns/dnssec
+get_ltm_dnsglobal_settings LtmDnsGlobalsettings ltm/dns/analytics/global-settings
+get_ltm_dnskey LtmDnsKey ltm/dns/dnssec/key
+get_ltm_dnsnameserver LtmDnsNameserver ltm/dns/nameserver
+get_ltm_dnsresolver LtmDnsResolver ltm/dns/cache/resolver
+get_ltm_dnstransparent LtmDnsTransparent ltm/dns/cache/transparent
+get_ltm_dnstsig_key LtmDnsTsigkey ltm/dns/tsig-key
+get_ltm_dnsvalidating_resolver LtmDnsValidatingresolver ltm/dns/cache/validating-resolver
+get_ltm_dnszone LtmDnsZone ltm/dns/zone
+get_ltm_eviction_policy LtmEvictionpolicy ltm/eviction-policy
+get_ltm_global_settings LtmGlobalsettings ltm/global-settings
+get_ltm_global_settingsconnection LtmGlobalsettingsConnection ltm/global-settings/connection
+get_ltm_global_settingsgeneral LtmGlobalsettingsGeneral ltm/global-settings/general
+get_ltm_global_settingsrule LtmGlobalsettingsRule ltm/global-settings/rule
+get_ltm_global_settingstraffic_control LtmGlobalsettingsTrafficcontrol ltm/global-settings/traffic-control
+get_ltm_html_rule LtmHtmlrule ltm/html-rule
+get_ltm_html_rulecomment_raise_event LtmHtmlruleCommentraiseevent ltm/html-rule/comment-raise-event
+get_ltm_html_rulecomment_remove LtmHtmlruleCommentremove ltm/html-rule/comment-remove
+get_ltm_html_ruletag_append_html LtmHtmlruleTagappendhtml ltm/html-rule/tag-append-html
+get_ltm_html_ruletag_prepend_html LtmHtmlruleTagprependhtml ltm/html-rule/tag-prepend-html
+get_ltm_html_ruletag_raise_event LtmHtmlruleTagraiseevent ltm/html-rule/tag-raise-event
+get_ltm_html_ruletag_remove LtmHtmlruleTagremove ltm/html-rule/tag-remove
+get_ltm_html_ruletag_remove_attribute LtmHtmlruleTagremoveattribute ltm/html-rule/tag-remove-attribute
+get_ltm_ifile LtmIfile ltm/ifile
+get_ltm_message_routing LtmMessagerouting ltm/message-routing
+get_ltm_message_routingdiameter LtmMessageroutingDiameter ltm/message-routing/diameter
+get_ltm_message_routinggeneric LtmMessageroutingGeneric ltm/message-routing/generic
+get_ltm_message_routingmqtt LtmMessageroutingMqtt ltm/message-routing/mqtt
+get_ltm_message_routingpeer LtmMessageroutingPeer ltm/message-routing/diameter/peer
+get_ltm_message_routingprofile LtmMessageroutingProfile ltm/message-routing/diameter/profile
+get_ltm_message_routingprotocol LtmMessageroutingProtocol ltm/message-routing/generic/protocol
+get_ltm_message_routingroute LtmMessageroutingRoute ltm/message-routing/generic/route
+get_ltm_message_routingrouter LtmMessageroutingRouter ltm/message-routing/mqtt/profile/router
+get_ltm_message_routingsession LtmMessageroutingSession ltm/message-routing/mqtt/profile/session
+get_ltm_message_routingsip LtmMessageroutingSip ltm/message-routing/sip
+get_ltm_message_routingtransport_config LtmMessageroutingTransportconfig ltm/message-routing/generic/transport-config
+get_ltm_monitor LtmMonitor ltm/monitor
+get_ltm_monitordiameter LtmMonitorDiameter ltm/monitor/diameter
+get_ltm_monitordns LtmMonitorDns ltm/monitor/dns
+get_ltm_monitorexternal LtmMonitorExternal ltm/monitor/external
+get_ltm_monitorfirepass LtmMonitorFirepass ltm/monitor/firepass
+get_ltm_monitorftp LtmMonitorFtp ltm/monitor/ftp
+get_ltm_monitorgateway_icmp LtmMonitorGatewayicmp ltm/monitor/gateway-icmp
+get_ltm_monitorhttp LtmMonitorHttp ltm/monitor/http
+get_ltm_monitorhttps LtmMonitorHttps ltm/monitor/https
+get_ltm_monitoricmp LtmMonitorIcmp ltm/monitor/icmp
+get_ltm_monitorimap LtmMonitorImap ltm/monitor/imap
+get_ltm_monitorinband LtmMonitorInband ltm/monitor/inband
+get_ltm_monitorldap LtmMonitorLdap ltm/monitor/ldap
+get_ltm_monitormodule_score LtmMonitorModulescore ltm/monitor/module-score
+get_ltm_monitormqtt LtmMonitorMqtt ltm/monitor/mqtt
+get_ltm_monitormssql LtmMonitorMssql ltm/monitor/mssql
+get_ltm_monitormysql LtmMonitorMysql ltm/monitor/mysql
+get_ltm_monitornntp LtmMonitorNntp ltm/monitor/nntp
+get_ltm_monitornone LtmMonitorNone ltm/monitor/none
+get_ltm_monitororacle LtmMonitorOracle ltm/monitor/oracle
+get_ltm_monitorpop3 LtmMonitorPop3 ltm/monitor/pop3
+get_ltm_monitorpostgresql LtmMonitorPostgresql ltm/monitor/postgresql
+get_ltm_monitorradius LtmMonitorRadius ltm/monitor/radius
+get_ltm_monitorradius_accounting LtmMonitorRadiusaccounting ltm/monitor/radius-accounting
+get_ltm_monitorreal_server LtmMonitorRealserver ltm/monitor/real-server
+get_ltm_monitorrpc LtmMonitorRpc ltm/monitor/rpc
+get_ltm_monitorsasp LtmMonitorSasp ltm/monitor/sasp
+get_ltm_monitorscripted LtmMonitorScripted ltm/monitor/scripted
+get_ltm_monitorsip LtmMonitorSip ltm/monitor/sip
+get_ltm_monitorsmb LtmMonitorSmb ltm/monitor/smb
+get_ltm_monitorsmtp LtmMonitorSmtp ltm/monitor/smtp
+get_ltm_monitorsnmp_dca LtmMonitorSnmpdca ltm/monitor/snmp-dca
+get_ltm_monitorsnmp_dca_base LtmMonitorSnmpdcabase ltm/monitor/snmp-dca-base
+get_ltm_monitorsoap LtmMonitorSoap ltm/monitor/soap
+get_ltm_monitortcp LtmMonitorTcp ltm/monitor/tcp
+get_ltm_monitortcp_echo LtmMonitorTcpecho ltm/monitor/tcp-echo
+get_ltm_monitortcp_half_open LtmMonitorTcphalfopen ltm/monitor/tcp-half-open
+get_ltm_monitorudp LtmMonitorUdp ltm/monitor/udp
+get_ltm_monitorvirtual_location LtmMonitorVirtuallocation ltm/monitor/virtual-location
+get_ltm_monitorwap LtmMonitorWap ltm/monitor/wap
+get_ltm_monitorwmi LtmMonitorWmi ltm/monitor/wmi
+get_ltm_nat LtmNat ltm/nat
+get_ltm_node LtmNode ltm/node
+get_ltm_persistence LtmPersistence ltm/persistence
+get_ltm_persistencecookie LtmPersistenceCookie ltm/persistence/cookie
+get_ltm_persistencedest_addr LtmPersistenceDestaddr ltm/persistence/dest-addr
+get_ltm_persistenceglobal_settings LtmPersistenceGlobalsettings ltm/persistence/global-settings
+get_ltm_persistencehash LtmPersistenceHash ltm/persistence/hash
+get_ltm_persistencehost LtmPersistenceHost ltm/persistence/host
+get_ltm_persistencemsrdp LtmPersistenceMsrdp ltm/persistence/msrdp
+get_ltm_persistencepersist_records LtmPersistencePersistrecords ltm/persistence/persist-records
+get_ltm_persistencesip LtmPersistenceSip ltm/persistence/sip
+get_ltm_persistencesource_addr LtmPersistenceSourceaddr ltm/persistence/source-addr
+get_ltm_persistencessl LtmPersistenceSsl ltm/persistence/ssl
+get_ltm_persistenceuniversal LtmPersistenceUniversal ltm/persistence/universal
+get_ltm_policy LtmPolicy ltm/policy
+get_ltm_policy_strategy LtmPolicystrategy ltm/policy-strategy
+get_ltm_pool LtmPool ltm/pool
+get_ltm_profile LtmProfile ltm/profile
+get_ltm_profilecertificate_authority LtmProfileCertificateauthority ltm/profile/certificate-authority
+get_ltm_profileclient_ldap LtmProfileClientldap ltm/profile/client-ldap
+get_ltm_profileclient_ssl LtmProfileClientssl ltm/profile/client-ssl
+get_ltm_profileconnector LtmProfileConnector ltm/profile/connector
+get_ltm_profiledhcpv4 LtmProfileDhcpv4 ltm/profile/dhcpv4
+get_ltm_profiledhcpv6 LtmProfileDhcpv6 ltm/profile/dhcpv6
+get_ltm_profilediameter LtmProfileDiameter ltm/profile/diameter
+get_ltm_profiledns LtmProfileDns ltm/profile/dns
+get_ltm_profiledns_logging LtmProfileDnslogging ltm/profile/dns-logging
+get_ltm_profilefasthttp LtmProfileFasthttp ltm/profile/fasthttp
+get_ltm_profilefastl4 LtmProfileFastl4 ltm/profile/fastl4
+get_ltm_profilefix LtmProfileFix ltm/profile/fix
+get_ltm_profileftp LtmProfileFtp ltm/profile/ftp
+get_ltm_profilegtp LtmProfileGtp ltm/profile/gtp
+get_ltm_profilehtml LtmProfileHtml ltm/profile/html
+get_ltm_profilehttp LtmProfileHttp ltm/profile/http
+get_ltm_profilehttp2 LtmProfileHttp2 ltm/profile/http2
+get_ltm_profilehttp_compression LtmProfileHttpcompression ltm/profile/http-compression
+get_ltm_profilehttp_proxy_connect LtmProfileHttpproxyconnect ltm/profile/http-proxy-connect
+get_ltm_profilehttprouter LtmProfileHttprouter ltm/profile/httprouter
+get_ltm_profileicap LtmProfileIcap ltm/profile/icap
+get_ltm_profileimap LtmProfileImap ltm/profile/imap
+get_ltm_profileipother LtmProfileIpother ltm/profile/ipother
+get_ltm_profileipsecalg LtmProfileIpsecalg ltm/profile/ipsecalg
+get_ltm_profilemblb LtmProfileMblb ltm/profile/mblb
+get_ltm_profilemqtt LtmProfileMqtt ltm/profile/mqtt
+get_ltm_profilenetflow LtmProfileNetflow ltm/profile/netflow
+get_ltm_profilentlm LtmProfileNtlm ltm/profile/ntlm
+get_ltm_profileocsp_stapling_params LtmProfileOcspstaplingparams ltm/profile/ocsp-stapling-params
+get_ltm_profileone_connect LtmProfileOneconnect ltm/profile/one-connect
+get_ltm_profilepop3 LtmProfilePop3 ltm/profile/pop3
+get_ltm_profilepptp LtmProfilePptp ltm/profile/pptp
+get_ltm_profileqoe LtmProfileQoe ltm/profile/qoe
+get_ltm_profileradius LtmProfileRadius ltm/profile/radius
+get_ltm_profilerequest_adapt LtmProfileRequestadapt ltm/profile/request-adapt
+get_ltm_profilerequest_log LtmProfileRequestlog ltm/profile/request-log
+get_ltm_profileresponse_adapt LtmProfileResponseadapt ltm/profile/response-adapt
+get_ltm_profilerewrite LtmProfileRewrite ltm/profile/rewrite
+get_ltm_profilertsp LtmProfileRtsp ltm/profile/rtsp
+get_ltm_profilesctp LtmProfileSctp ltm/profile/sctp
+get_ltm_profileserver_ldap LtmProfileServerldap ltm/profile/server-ldap
+get_ltm_profileserver_ssl LtmProfileServerssl ltm/profile/server-ssl
+get_ltm_profileservice LtmProfileService ltm/profile/service
+get_ltm_profilesip LtmProfileSip ltm/profile/sip
+get_ltm_profilesmtps LtmProfileSmtps ltm/profile/smtps
+get_ltm_profilesocks LtmProfileSocks ltm/profile/socks
+get_ltm_profilesplitsessionclient LtmProfileSplitsessionclient ltm/profile/splitsessionclient
+get_ltm_profilesplitsessionserver LtmProfileSplitsessionserver ltm/profile/splitsessionserver
+get_ltm_profilestatistics LtmProfileStatistics ltm/profile/statistics
+get_ltm_profilestream LtmProfileStream ltm/profile/stream
+get_ltm_profiletcp LtmProfileTcp ltm/profile/tcp
+get_ltm_profiletcp_analytics LtmProfileTcpanalytics ltm/profile/tcp-analytics
+get_ltm_profiletftp LtmProfileTftp ltm/profile/tftp
+get_ltm_profileudp LtmProfileUdp ltm/profile/udp
+get_ltm_profileweb_acceleration LtmProfileWebacceleration ltm/profile/web-acceleration
+get_ltm_profilewebsocket LtmProfileWebsocket ltm/profile/websocket
+get_ltm_profilexml LtmProfileXml ltm/profile/xml
+get_ltm_rule LtmRule ltm/rule
+get_ltm_rule_profiler LtmRuleprofiler ltm/rule-profiler
+get_ltm_snat LtmSnat ltm/snat
+get_ltm_snat_translation LtmSnattranslation ltm/snat-translation
+get_ltm_snatpool LtmSnatpool ltm/snatpool
+get_ltm_tacdb LtmTacdb ltm/tacdb
+get_ltm_tacdbcustomdb LtmTacdbCustomdb ltm/tacdb/customdb
+get_ltm_tacdbcustomdb_file LtmTacdbCustomdbfile ltm/tacdb/customdb-file
+get_ltm_tacdblicenseddb LtmTacdbLicenseddb ltm/tacdb/licenseddb
+get_ltm_tacdblicenseddb_file LtmTacdbLicenseddbfile ltm/tacdb/licenseddb-file
+get_ltm_tacdbquery LtmTacdbQuery ltm/tacdb/query
+get_ltm_traffic_class LtmTrafficclass ltm/traffic-class
+get_ltm_traffic_matching_criteria LtmTrafficmatchingcriteria ltm/traffic-matching-criteria
+get_ltm_urlcat_query LtmUrlcatquery ltm/urlcat-query
+get_ltm_virtual LtmVirtual ltm/virtual
+get_ltm_virtual_address LtmVirtualaddress ltm/virtual-address
+get_net_address_list NetAddresslist net/address-list
+get_net_arp NetArp net/arp
+get_net_bwc NetBwc net/bwc
+get_net_bwcpolicy NetBwcPolicy net/bwc/policy
+get_net_bwcpriority_group NetBwcPrioritygroup net/bwc/priority-group
+get_net_bwcprobe NetBwcProbe net/bwc/probe
+get_net_clone_stats NetClonestats net/clone-stats
+get_net_cmetrics NetCmetrics net/cmetrics
+get_net_cos NetCos net/cos
+get_net_cosglobal_settings NetCosGlobalsettings net/cos/global-settings
+get_net_cosmap_8021p NetCosMap8021p net/cos/map-8021p
+get_net_cosmap_dscp NetCosMapdscp net/cos/map-dscp
+get_net_costraffic_priority NetCosTrafficpriority net/cos/traffic-priority
+get_net_dag_globals NetDagglobals net/dag-globals
+get_net_dns_resolver NetDnsresolver net/dns-resolver
+get_net_fdb NetFdb net/fdb
+get_net_fdbtunnel NetFdbTunnel net/fdb/tunnel
+get_net_fdbvlan NetFdbVlan net/fdb/vlan
+get_net_ike_evt_stat NetIkeevtstat net/ike-evt-stat
+get_net_ike_msg_stat NetIkemsgstat net/ike-msg-stat
+get_net_interface NetInterface net/interface
+get_net_interface_cos NetInterfacecos net/interface-cos
+get_net_interface_ddm NetInterfaceddm net/interface-ddm
+get_net_ipsec NetIpsec net/ipsec
+get_net_ipsec_stat NetIpsecstat net/ipsec-stat
+get_net_ipsecike_daemon NetIpsecIkedaemon net/ipsec/ike-daemon
+get_net_ipsecike_peer NetIpsecIkepeer net/ipsec/ike-peer
+get_net_ipsecike_sa NetIpsecIkesa net/ipsec/ike-sa
+get_net_ipsecipsec_policy NetIpsecIpsecpolicy net/ipsec/ipsec-policy
+get_net_ipsecipsec_sa NetIpsecIpsecsa net/ipsec/ipsec-sa
+get_net_ipsecmanual_security_association NetIpsecManualsecurityassociation net/ipsec/manual-security-association
+get_net_ipsectraffic_selector NetIpsecTrafficselector net/ipsec/traffic-selector
+get_net_lldp_globals NetLldpglobals net/lldp-globals
+get_net_lldp_neighbors NetLldpneighbors net/lldp-neighbors
+get_net_mroute NetMroute net/mroute
+get_net_multicast_globals NetMulticastglobals net/multicast-globals
+get_net_ndp NetNdp net/ndp
+get_net_packet_filter NetPacketfilter net/packet-filter
+get_net_packet_filter_trusted NetPacketfiltertrusted net/packet-filter-trusted
+get_net_packet_tester NetPackettester net/packet-tester
+get_net_packet_testersecurity NetPackettesterSecurity net/packet-tester/security
+get_net_port_list NetPortlist net/port-list
+get_net_port_mirror NetPortmirror net/port-mirror
+get_net_rate_shaping NetRateshaping net/rate-shaping
+get_net_rate_shapingclass NetRateshapingClass net/rate-shaping/class
+get_net_rate_shapingcolor_policer NetRateshapingColorpolicer net/rate-shaping/color-policer
+get_net_rate_shapingdrop_policy NetRateshapingDroppolicy net/rate-shaping/drop-policy
+get_net_rate_shapingqueue NetRateshapingQueue net/rate-shaping/queue
+get_net_rate_shapingshaping_policy NetRateshapingShapingpolicy net/rate-shaping/shaping-policy
+get_net_route NetRoute net/route
+get_net_route_domain NetRoutedomain net/route-domain
+get_net_router_advertisement NetRouteradvertisement net/router-advertisement
+get_net_routing NetRouting net/routing
+get_net_routingaccess_list NetRoutingAccesslist net/routing/access-list
+get_net_routingas_path NetRoutingAspath net/routing/as-path
+get_net_routingbfd NetRoutingBfd net/routing/bfd
+get_net_routingbgp NetRoutingBgp net/routing/bgp
+get_net_routingcommunity_list NetRoutingCommunitylist net/routing/community-list
+get_net_routingdebug NetRoutingDebug net/routing/debug
+get_net_routingextcommunity_list NetRoutingExtcommunitylist net/routing/extcommunity-list
+get_net_routingprefix_list NetRoutingPrefixlist net/routing/prefix-list
+get_net_routingprofile NetRoutingProfile net/routing/profile
+get_net_routingroute_map NetRoutingRoutemap net/routing/route-map
+get_net_rst_cause NetRstcause net/rst-cause
+get_net_self NetSelf net/self
+get_net_self_allow NetSelfallow net/self-allow
+get_net_service_policy NetServicepolicy net/service-policy
+get_net_sfc NetSfc net/sfc
+get_net_sfcchain NetSfcChain net/sfc/chain
+get_net_sfchop NetSfcHop net/sfc/hop
+get_net_sfcsf NetSfcSf net/sfc/sf
+get_net_stp NetStp net/stp
+get_net_stp_globals NetStpglobals net/stp-globals
+get_net_timer_policy NetTimerpolicy net/timer-policy
+get_net_trunk NetTrunk net/trunk
+get_net_tunnels NetTunnels net/tunnels
+get_net_tunnelsetherip NetTunnelsEtherip net/tunnels/etherip
+get_net_tunnelsfec NetTunnelsFec net/tunnels/fec
+get_net_tunnelsfec_stat NetTunnelsFecstat net/tunnels/fec-stat
+get_net_tunnelsgeneve NetTunnelsGeneve net/tunnels/geneve
+get_net_tunnelsgre NetTunnelsGre net/tunnels/gre
+get_net_tunnelsipip NetTunnelsIpip net/tunnels/ipip
+get_net_tunnelsipsec NetTunnelsIpsec net/tunnels/ipsec
+get_net_tunnelslw4o6 NetTunnelsLw4o6 net/tunnels/lw4o6
+get_net_tunnelsmap NetTunnelsMap net/tunnels/map
+get_net_tunnelsppp NetTunnelsPpp net/tunnels/ppp
+get_net_tunnelstcp_forward NetTunnelsTcpforward net/tunnels/tcp-forward
+get_net_tunnelstunnel NetTunnelsTunnel net/tunnels/tunnel
+get_net_tunnelsv6rd NetTunnelsV6rd net/tunnels/v6rd
+get_net_tunnelsvxlan NetTunnelsVxlan net/tunnels/vxlan
+get_net_tunnelswccp NetTunnelsWccp net/tunnels/wccp
+get_net_vlan NetVlan net/vlan
+get_net_vlan_allowed NetVlanallowed net/vlan-allowed
+get_net_vlan_group NetVlangroup net/vlan-group
+get_net_wccp NetWccp net/wccp
+get_security_firewall SecurityFirewall security/firewall
+get_security_firewallmanagement_ip_rules SecurityFirewallManagementiprules security/firewall/management-ip-rules
+get_security_firewalluuid_default_autogenerate SecurityFirewallUuiddefaultautogenerate security/firewall/uuid-default-autogenerate
+get_shared_bigip_failover_state SharedBigipfailoverstate shared/bigip-failover-state
+get_shared_licensingactivation SharedLicensingActivation shared/licensing/activation
+get_shared_licensingregistration SharedLicensingRegistration shared/licensing/registration
+get_shared_sysbackup SharedSysBackup shared/sys/backup
+get_sys_alert SysAlert sys/alert
+get_sys_alertlcd SysAlertLcd sys/alert/lcd
+get_sys_aom SysAom sys/aom
+get_sys_application SysApplication sys/application
+get_sys_applicationapl_script SysApplicationAplscript sys/application/apl-script
+get_sys_applicationcustom_stat SysApplicationCustomstat sys/application/custom-stat
+get_sys_applicationservice SysApplicationService sys/application/service
+get_sys_applicationtemplate SysApplicationTemplate sys/application/template
+get_sys_applicationtemplate_model_tasks SysApplicationTemplatemodeltasks sys/application/template-model-tasks
+get_sys_autoscale_group SysAutoscalegroup sys/autoscale-group
+get_sys_clock SysClock sys/clock
+get_sys_cluster SysCluster sys/cluster
+get_sys_connection SysConnection sys/connection
+get_sys_console SysConsole sys/console
+get_sys_cpu SysCpu sys/cpu
+get_sys_crypto SysCrypto sys/crypto
+get_sys_cryptoallow_key_export SysCryptoAllowkeyexport sys/crypto/allow-key-export
+get_sys_cryptoca_bundle_manager SysCryptoCabundlemanager sys/crypto/ca-bundle-manager
+get_sys_cryptocert SysCryptoCert sys/crypto/cert
+get_sys_cryptocert_order_manager SysCryptoCertordermanager sys/crypto/cert-order-manager
+get_sys_cryptocert_validator SysCryptoCertvalidator sys/crypto/cert-validator
+get_sys_cryptoclient SysCryptoClient sys/crypto/client
+get_sys_cryptocrl SysCryptoCrl sys/crypto/cert-validator/crl
+get_sys_cryptocsr SysCryptoCsr sys/crypto/csr
+get_sys_cryptoencrypted_attributes SysCryptoEncryptedattributes sys/crypto/encrypted-attributes
+get_sys_cryptoexternal_hsm SysCryptoExternalhsm sys/crypto/fips/external-hsm
+get_sys_cryptofips SysCryptoFips sys/crypto/fips
+get_sys_cryptokey SysCryptoKey sys/crypto/key
+get_sys_cryptomaster_key SysCryptoMasterkey sys/crypto/master-key
+get_sys_cryptonethsm_partition SysCryptoNethsmpartition sys/crypto/fips/nethsm-partition
+get_sys_cryptoocsp SysCryptoOcsp sys/crypto/cert-validator/ocsp
+get_sys_cryptoserver SysCryptoServer sys/crypto/server
+get_sys_daemon_ha SysDaemonha sys/daemon-ha
+get_sys_daemon_log_settings SysDaemonlogsettings sys/daemon-log-settings
+get_sys_daemon_log_settingsclusterd SysDaemonlogsettingsClusterd sys/daemon-log-settings/clusterd
+get_sys_daemon_log_settingscsyncd SysDaemonlogsettingsCsyncd sys/daemon-log-settings/csyncd
+get_sys_daemon_log_settingsicr_eventd SysDaemonlogsettingsIcreventd sys/daemon-log-settings/icr-eventd
+get_sys_daemon_log_settingsicrd SysDaemonlogsettingsIcrd sys/daemon-log-settings/icrd
+get_sys_daemon_log_settingslind SysDaemonlogsettingsLind sys/daemon-log-settings/lind
+get_sys_daemon_log_settingsmcpd SysDaemonlogsettingsMcpd sys/daemon-log-settings/mcpd
+get_sys_daemon_log_settingstmm SysDaemonlogsettingsTmm sys/daemon-log-settings/tmm
+get_sys_datastor SysDatastor sys/datastor
+get_sys_db SysDb sys/db
+get_sys_diags SysDiags sys/diags
+get_sys_diagsihealth SysDiagsIhealth sys/diags/ihealth
+get_sys_diagsihealth_request SysDiagsIhealthrequest sys/diags/ihealth-request
+get_sys_diagsihealth_result SysDiagsIhealthresult sys/diags/ihealth-result
+get_sys_disk SysDisk sys/disk
+get_sys_diskapplication_volume SysDiskApplicationvolume sys/disk/application-volume
+get_sys_diskdirectory SysDiskDirectory sys/disk/directory
+get_sys_disklogical_disk SysDiskLogicaldisk sys/disk/logical-disk
+get_sys_dns SysDns sys/dns
+get_sys_dynad SysDynad sys/dynad
+get_sys_dynadinstrumentation SysDynadInstrumentation sys/dynad/instrumentation
+get_sys_dynadkey SysDynadKey sys/dynad/key
+get_sys_dynadrpm SysDynadRpm sys/dynad/rpm
+get_sys_dynadsettings SysDynadSettings sys/dynad/settings
+get_sys_dynadstatus SysDynadStatus sys/dynad/status
+get_sys_ecm SysEcm sys/ecm
+get_sys_ecmcloud_provider SysEcmCloudprovider sys/ecm/cloud-provider
+get_sys_ecmconfig SysEcmConfig sys/ecm/config
+get_sys_failover SysFailover sys/failover
+get_sys_feature_module SysFeaturemodule sys/feature-module
+get_sys_file SysFile sys/file
+get_sys_fileapache_ssl_cert SysFileApachesslcert sys/file/apache-ssl-cert
+get_sys_filebrowser_capabilities_db SysFileBrowsercapabilitiesdb sys/file/browser-capabilities-db
+get_sys_filedashboard_viewset SysFileDashboardviewset sys/file/dashboard-viewset
+get_sys_filedata_group SysFileDatagroup sys/file/data-group
+get_sys_filedevice_capabilities_db SysFileDevicecapabilitiesdb sys/file/device-capabilities-db
+get_sys_fileexternal_monitor SysFileExternalmonitor sys/file/external-monitor
+get_sys_fileifile SysFileIfile sys/file/ifile
+get_sys_filelwtunneltbl SysFileLwtunneltbl sys/file/lwtunneltbl
+get_sys_filessl_cert SysFileSslcert sys/file/ssl-cert
+get_sys_filessl_crl SysFileSslcrl sys/file/ssl-crl
+get_sys_filessl_csr SysFileSslcsr sys/file/ssl-csr
+get_sys_filessl_key SysFileSslkey sys/file/ssl-key
+get_sys_filesystem_ssl_cert SysFileSystemsslcert sys/file/system-ssl-cert
+get_sys_filesystem_ssl_key SysFileSystemsslkey sys/file/system-ssl-key
+get_sys_fix_connection SysFixconnection sys/fix-connection
+get_sys_folder SysFolder sys/folder
+get_sys_fpga SysFpga sys/fpga
+get_sys_fpgafirmware_config SysFpgaFirmwareconfig sys/fpga/firmware-config
+get_sys_fpgainfo SysFpgaInfo sys/fpga/info
+get_sys_fpgaturboflex_profile SysFpgaTurboflexprofile sys/fpga/turboflex-profile
+get_sys_global_settings SysGlobalsettings sys/global-settings
+get_sys_ha_group SysHagroup sys/ha-group
+get_sys_ha_mirror SysHamirror sys/ha-mirror
+get_sys_ha_status SysHastatus sys/ha-status
+get_sys_hardware SysHardware sys/hardware
+get_sys_host_info SysHostinfo sys/host-info
+get_sys_httpd SysHttpd sys/httpd
+get_sys_hypervisor_info SysHypervisorinfo sys/hypervisor-info
+get_sys_icall SysIcall sys/icall
+get_sys_icallhandler SysIcallHandler sys/icall/handler
+get_sys_icallistats_trigger SysIcallIstatstrigger sys/icall/istats-trigger
+get_sys_icallperiodic SysIcallPeriodic sys/icall/handler/periodic
+get_sys_icallperpetual SysIcallPerpetual sys/icall/handler/perpetual
+get_sys_icallpublisher SysIcallPublisher sys/icall/publisher
+get_sys_icallscript SysIcallScript sys/icall/script
+get_sys_icalltriggered SysIcallTriggered sys/icall/handler/triggered
+get_sys_icmp_stat SysIcmpstat sys/icmp-stat
+get_sys_icontrol_soap SysIcontrolsoap sys/icontrol-soap
+get_sys_internal_proxy SysInternalproxy sys/internal-proxy
+get_sys_ip_address SysIpaddress sys/ip-address
+get_sys_ip_stat SysIpstat sys/ip-stat
+get_sys_ipfix SysIpfix sys/ipfix
+get_sys_ipfixdestination SysIpfixDestination sys/ipfix/destination
+get_sys_ipfixelement SysIpfixElement sys/ipfix/element
+get_sys_ipfixirules SysIpfixIrules sys/ipfix/irules
+get_sys_iprep_status SysIprepstatus sys/iprep-status
+get_sys_license SysLicense sys/license
+get_sys_log SysLog sys/log
+get_sys_log_config SysLogconfig sys/log-config
+get_sys_log_configalertd SysLogconfigAlertd sys/log-config/destination/alertd
+get_sys_log_configarcsight SysLogconfigArcsight sys/log-config/destination/arcsight
+get_sys_log_configdestination SysLogconfigDestination sys/log-config/destination
+get_sys_log_configfilter SysLogconfigFilter sys/log-config/filter
+get_sys_log_configipfix SysLogconfigIpfix sys/log-config/destination/ipfix
+get_sys_log_configlocal_database SysLogconfigLocaldatabase sys/log-config/destination/local-database
+get_sys_log_configlocal_syslog SysLogconfigLocalsyslog sys/log-config/destination/local-syslog
+get_sys_log_configmanagement_port SysLogconfigManagementport sys/log-config/destination/management-port
+get_sys_log_configpublisher SysLogconfigPublisher sys/log-config/publisher
+get_sys_log_configremote_high_speed_log SysLogconfigRemotehighspeedlog sys/log-config/destination/remote-high-speed-log
+get_sys_log_configremote_syslog SysLogconfigRemotesyslog sys/log-config/destination/remote-syslog
+get_sys_log_configsplunk SysLogconfigSplunk sys/log-config/destination/splunk
+get_sys_log_rotate SysLogrotate sys/log-rotate
+get_sys_mac_address SysMacaddress sys/mac-address
+get_sys_management_dhcp SysManagementdhcp sys/management-dhcp
+get_sys_management_ip SysManagementip sys/management-ip
+get_sys_management_ovsdb SysManagementovsdb sys/management-ovsdb
+get_sys_management_proxy_config SysManagementproxyconfig sys/management-proxy-config
+get_sys_management_route SysManagementroute sys/management-route
+get_sys_mcp_state SysMcpstate sys/mcp-state
+get_sys_memory SysMemory sys/memory
+get_sys_nethsm SysNethsm sys/nethsm
+get_sys_nethsmasync_queue_stat SysNethsmAsyncqueuestat sys/nethsm/async-queue-stat
+get_sys_nethsmpkcs11d_stat SysNethsmPkcs11dstat sys/nethsm/pkcs11d-stat
+get_sys_nethsmsync_queue_stat SysNethsmSyncqueuestat sys/nethsm/sync-queue-stat
+get_sys_ntp SysNtp sys/ntp
+get_sys_outbound_smtp SysOutboundsmtp sys/outbound-smtp
+get_sys_performance SysPerformance sys/performance
+get_sys_performanceall_stats SysPerformanceAllstats sys/performance/all-stats
+get_sys_performanceconnections SysPerformanceConnections sys/performance/connections
+get_sys_performancednsexpress SysPerformanceDnsexpress sys/performance/dnsexpress
+get_sys_performancednssec SysPerformanceDnssec sys/performance/dnssec
+get_sys_performancegtm SysPerformanceGtm sys/performance/gtm
+get_sys_performanceramcache SysPerformanceRamcache sys/performance/ramcache
+get_sys_performancesystem SysPerformanceSystem sys/performance/system
+get_sys_performancethroughput SysPerformanceThroughput sys/performance/throughput
+get_sys_pfman SysPfman sys/pfman
+get_sys_pfmanconsumer SysPfmanConsumer sys/pfman/consumer
+get_sys_pfmandevice SysPfmanDevice sys/pfman/device
+get_sys_pptp_call_info SysPptpcallinfo sys/pptp-call-info
+get_sys_proc_info SysProcinfo sys/proc-info
+get_sys_provision SysProvision sys/provision
+get_sys_pva_traffic SysPvatraffic sys/pva-traffic
+get_sys_raid SysRaid sys/raid
+get_sys_raidarray SysRaidArray sys/raid/array
+get_sys_raidbay SysRaidBay sys/raid/bay
+get_sys_raiddisk SysRaidDisk sys/raid/disk
+get_sys_ready SysReady sys/ready
+get_sys_scriptd SysScriptd sys/scriptd
+get_sys_service SysService sys/service
+get_sys_sflow SysSflow sys/sflow
+get_sys_sflowdata_source SysSflowDatasource sys/sflow/data-source
+get_sys_sflowglobal_settings SysSflowGlobalsettings sys/sflow/global-settings
+get_sys_sflowhttp SysSflowHttp sys/sflow/data-source/http
+get_sys_sflowinterface SysSflowInterface sys/sflow/data-source/interface
+get_sys_sflowreceiver SysSflowReceiver sys/sflow/receiver
+get_sys_sflowsystem SysSflowSystem sys/sflow/data-source/system
+get_sys_sflowvlan SysSflowVlan sys/sflow/global-settings/vlan
+get_sys_smtp_server SysSmtpserver sys/smtp-server
+get_sys_snmp SysSnmp sys/snmp
+get_sys_software SysSoftware sys/software
+get_sys_softwareblock_device_hotfix SysSoftwareBlockdevicehotfix sys/software/block-device-hotfix
+get_sys_softwareblock_device_image SysSoftwareBlockdeviceimage sys/software/block-device-image
+get_sys_softwarehotfix SysSoftwareHotfix sys/software/hotfix
+get_sys_softwareimage SysSoftwareImage sys/software/image
+get_sys_softwaresignature SysSoftwareSignature sys/software/signature
+get_sys_softwarestatus SysSoftwareStatus sys/software/status
+get_sys_softwareupdate SysSoftwareUpdate sys/software/update
+get_sys_softwareupdate_status SysSoftwareUpdatestatus sys/software/update-status
+get_sys_softwarevolume SysSoftwareVolume sys/software/volume
+get_sys_sshd SysSshd sys/sshd
+get_sys_state_mirroring SysStatemirroring sys/state-mirroring
+get_sys_sync_sys_files SysSyncsysfiles sys/sync-sys-files
+get_sys_syslog SysSyslog sys/syslog
+get_sys_tmm_info SysTmminfo sys/tmm-info
+get_sys_tmm_traffic SysTmmtraffic sys/tmm-traffic
+get_sys_traffic SysTraffic sys/traffic
+get_sys_turboflex SysTurboflex sys/turboflex
+get_sys_turboflexall SysTurboflexAll sys/turboflex/profile/all
+get_sys_turboflexfeature SysTurboflexFeature sys/turboflex/profile/feature
+get_sys_turboflexfeatures SysTurboflexFeatures sys/turboflex/features
+get_sys_turboflexprofile SysTurboflexProfile sys/turboflex/profile
+get_sys_turboflexprofile_config SysTurboflexProfileconfig sys/turboflex/profile-config
+get_sys_turboflexwarning SysTurboflexWarning sys/turboflex/warning
+get_sys_ucs SysUcs sys/ucs
+get_sys_url_db SysUrldb sys/url-db
+get_sys_url_dbdownload_result SysUrldbDownloadresult sys/url-db/download-result
+get_sys_url_dbdownload_schedule SysUrldbDownloadschedule sys/url-db/download-schedule
+get_sys_url_dburl_category SysUrldbUrlcategory sys/url-db/url-category
+get_sys_version SysVersion sys/version
+get_wom_profile WomProfile wom/profile
+get_wom_profileisession WomProfileIsession wom/profile/isession
+'''
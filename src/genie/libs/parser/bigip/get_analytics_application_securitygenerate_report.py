@@ -1,35 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/analytics/application-security/generate-report' resources
-# =============================================
-
-
-class AnalyticsApplicationsecurityGeneratereportSchema(MetaParser):
-
-    schema = {}
-
-
-class AnalyticsApplicationsecurityGeneratereport(
-    AnalyticsApplicationsecurityGeneratereportSchema
-):
-    """ To F5 resource for /mgmt/tm/analytics/application-security/generate-report
-    """
-
-    cli_command = "/mgmt/tm/analytics/application-security/generate-report"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
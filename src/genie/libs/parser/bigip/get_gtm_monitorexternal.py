@@ -1,33 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/gtm/monitor/external' resources
-# =============================================
-
-
-class GtmMonitorExternalSchema(MetaParser):
-
-    schema = {}
-
-
-class GtmMonitorExternal(GtmMonitorExternalSchema):
-    """ To F5 resource for /mgmt/tm/gtm/monitor/external
-    """
-
-    cli_command = "/mgmt/tm/gtm/monitor/external"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
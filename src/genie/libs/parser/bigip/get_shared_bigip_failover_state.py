@@ -1,33 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/shared/bigip-failover-state' resources
-# =============================================
-
-
-class SharedBigipfailoverstateSchema(MetaParser):
-
-    schema = {}
-
-
-class SharedBigipfailoverstate(SharedBigipfailoverstateSchema):
-    """ To F5 resource for /mgmt/tm/shared/bigip-failover-state
-    """
-
-    cli_command = "/mgmt/tm/shared/bigip-failover-state"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
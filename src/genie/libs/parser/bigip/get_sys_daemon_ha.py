@@ -1,33 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/sys/daemon-ha' resources
-# =============================================
-
-
-class SysDaemonhaSchema(MetaParser):
-
-    schema = {}
-
-
-class SysDaemonha(SysDaemonhaSchema):
-    """ To F5 resource for /mgmt/tm/sys/daemon-ha
-    """
-
-    cli_command = "/mgmt/tm/sys/daemon-ha"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -0,0 +1,260 @@
+'''Generic iControl REST parser of the bigip resources
+
+Every bigip parser returns the json document of one iControl REST resource.
+Instead of one module per resource, the parsers are described by the
+`endpoints.ENDPOINTS` table, and their modules and classes are built the
+first time they are looked up:
+
+    >>> from genie.libs.parser.bigip.get_ltm_pool import LtmPool
+    >>> from genie.libs.parser.bigip import LtmPool
+
+`snapshot` reads several resources of a device concurrently:
+
+    >>> results = snapshot(device, [LtmPool, '/mgmt/tm/ltm/virtual'])
+    >>> results['/mgmt/tm/ltm/pool'].parsed
+    >>> results['/mgmt/tm/ltm/pool'].latency
+
+The parsers accept the query options of iControl REST:
+
+    >>> LtmPool(device=device).parse(select=['name', 'partition'])
+    >>> LtmPool(device=device).parse(expand_subcollections=True)
+
+    >>> # collection read by pages of 500 items, merged
+    >>> LtmPool(device=device).parse(top=500)
+
+    >>> # items of the collection, as the pages are read
+    >>> for pool in LtmPool(device=device).iter_items(top=500):
+    ...     pass
+'''
+
+# Global Imports
+import sys
+import time
+import importlib
+import importlib.abc
+import importlib.util
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Metaparser
+from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
+
+# Endpoints
+from .endpoints import ENDPOINTS
+
+# Package of the parser modules
+PACKAGE = __name__.rpartition('.')[0]
+
+# Root of the resources
+BASE_PATH = '/mgmt/tm/'
+
+# Keys of a collection describing the current page
+PAGE_KEYS = ('currentItemCount', 'itemsPerPage', 'pageIndex', 'startIndex',
+             'totalItems', 'totalPages', 'nextLink', 'previousLink')
+
+# Result of the read of one resource by snapshot()
+EndpointResult = namedtuple('EndpointResult', ['parser',
+                                               'parsed',
+                                               'exception',
+                                               'start',
+                                               'latency'])
+
+# {module name: (class name, path)}, {class name: module name} and
+# {path: module name}, read from ENDPOINTS on first use
+_modules = {}
+_classes = {}
+_paths = {}
+
+
+def endpoints():
+    '''Return {module name: (class name, path)} of the bigip parsers'''
+    if not _modules:
+        modules, classes, paths = {}, {}, {}
+        for line in ENDPOINTS.splitlines():
+            module, cls, path = line.split()
+            classes[cls] = module
+            paths[BASE_PATH + path] = module
+            modules[module] = (cls, BASE_PATH + path)
+        _classes.update(classes)
+        _paths.update(paths)
+        _modules.update(modules)
+    return _modules
+
+
+def module_of(cls):
+    '''Return the name of the module of the parser class cls, or None'''
+    endpoints()
+    return _classes.get(cls)
+
+
+def parser_of(path):
+    '''Return the parser class of the resource at path, a generic parser
+    if the resource is not in ENDPOINTS'''
+    endpoints()
+    module = _paths.get(path)
+    if not module:
+        return type('IcontrolRest', (IcontrolRest,), {'cli_command': path})
+    module = importlib.import_module(PACKAGE + '.' + module)
+    return getattr(module, _modules[module.__name__.rpartition('.')[2]][0])
+
+
+class IcontrolRestSchema(MetaParser):
+
+    schema = LazySchema(lambda: {})
+
+
+class IcontrolRest(IcontrolRestSchema):
+    """ Generic parser of an F5 iControl REST resource, at cli_command
+    """
+
+    cli_command = BASE_PATH
+
+    def _query(self, select=None, expand_subcollections=False, top=None,
+               skip=None):
+        params = []
+        if select:
+            if not isinstance(select, str):
+                select = ','.join(select)
+            params.append('$select=' + select)
+        if expand_subcollections:
+            params.append('expandSubcollections=true')
+        if top:
+            params.append('$top={}'.format(top))
+        if skip:
+            params.append('$skip={}'.format(skip))
+
+        if not params:
+            return self.cli_command
+        return self.cli_command + '?' + '&'.join(params)
+
+    def _get(self, cmd):
+        return self.device.get(cmd).json()
+
+    def _pages(self, select=None, expand_subcollections=False, top=500):
+        skip = 0
+        while True:
+            page = self._get(self._query(select, expand_subcollections, top,
+                                         skip))
+            if not page:
+                break
+            yield page
+            # The last page, or a resource which is not paged, has no link
+            # to the next page
+            items = page.get('items')
+            if not items or 'nextLink' not in page:
+                break
+            skip += len(items)
+
+    def iter_items(self, select=None, expand_subcollections=False, top=500):
+        """ Yield the items of the collection, reading top items at a time
+        """
+        for page in self._pages(select, expand_subcollections, top):
+            for item in page.get('items') or []:
+                yield item
+
+    def rest(self, select=None, expand_subcollections=False, top=None,
+             output=None):
+
+        if output is not None:
+            response_json = output
+        elif top:
+            # Collection read by pages, returned as a single page
+            response_json = {}
+            items = []
+            for page in self._pages(select, expand_subcollections, top):
+                for key, value in page.items():
+                    if key == 'items':
+                        items.extend(value)
+                    elif key not in PAGE_KEYS:
+                        response_json.setdefault(key, value)
+            if items:
+                response_json['items'] = items
+        else:
+            response_json = self._get(self._query(select,
+                                                  expand_subcollections))
+
+        if not response_json:
+            return {}
+
+        return response_json
+
+
+def build_module(module):
+    '''Set the schema and parser classes of the endpoint module'''
+    cls, path = endpoints()[module.__name__.rpartition('.')[2]]
+    schema = type(cls + 'Schema', (IcontrolRestSchema,),
+                  {'__module__': module.__name__, 'schema': {}})
+    parser = type(cls, (IcontrolRest, schema),
+                  {'__module__': module.__name__,
+                   '__doc__': ' To F5 resource for {}\n    '.format(path),
+                   'cli_command': path})
+    module.__dict__.update({schema.__name__: schema, cls: parser})
+
+
+class EndpointFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    '''Import hook building the modules of ENDPOINTS, for example
+    genie.libs.parser.bigip.get_ltm_pool'''
+
+    def find_spec(self, fullname, path, target=None):
+        package, _, name = fullname.rpartition('.')
+        if package != PACKAGE or name not in endpoints():
+            return None
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        build_module(module)
+
+
+def install():
+    '''Add the import hook of the endpoint modules, once'''
+    if not any(isinstance(finder, EndpointFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, EndpointFinder())
+
+
+def snapshot(device, parsers, max_workers=8, **kwargs):
+    '''Read several resources of a device concurrently
+
+    The resources are read through the rest connection of the device, so
+    that the requests share its pool of HTTP connections, at most
+    max_workers at a time. A resource which cannot be read does not stop
+    the others: its exception is returned in its result. A resource given
+    several times, by its class or its path, is read once, by the first
+    parser given for it.
+
+    Args:
+        device (`Device`): device with a rest connection
+        parsers (`list`): parser classes, or paths of resources such as
+                          '/mgmt/tm/ltm/pool'
+        max_workers (`int`): maximum number of requests running at once
+        kwargs (`dict`): query options given to every parser, for example
+                         select or top
+
+    Returns:
+        `OrderedDict` of path -> `EndpointResult`, in the order of parsers
+    '''
+    unique = OrderedDict()
+    for parser in parsers:
+        if isinstance(parser, str):
+            parser = parser_of(parser)
+        unique.setdefault(parser.cli_command, parser)
+    parsers = list(unique.values())
+
+    def read(parser):
+        parsed = exception = None
+        start = time.monotonic()
+        try:
+            parsed = parser(device=device, context='rest').parse(**kwargs)
+        except Exception as e:
+            exception = e
+        return EndpointResult(parser, parsed, exception, start,
+                              time.monotonic() - start)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(read, parsers))
+
+    return OrderedDict((parser.cli_command, result)
+                       for parser, result in zip(parsers, results))
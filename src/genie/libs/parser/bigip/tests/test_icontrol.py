@@ -0,0 +1,194 @@
+# Python
+import json
+import time
+import threading
+import unittest
+import urllib.request
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+from unittest.mock import Mock
+
+# Parser
+from genie.libs.parser import bigip
+from genie.libs.parser.bigip.icontrol import IcontrolRest, snapshot
+from genie.libs.parser.bigip.get_ltm_pool import LtmPool, LtmPoolSchema
+
+
+def pool_page(names, next_link=True):
+    page = {'kind': 'tm:ltm:pool:poolcollectionstate',
+            'selfLink': 'https://localhost/mgmt/tm/ltm/pool',
+            'currentItemCount': len(names),
+            'totalItems': 5,
+            'items': [{'kind': 'tm:ltm:pool:poolstate', 'name': name}
+                      for name in names]}
+    if next_link:
+        page['nextLink'] = 'https://localhost/mgmt/tm/ltm/pool?$top=2&$skip=2'
+    return page
+
+
+class TestIcontrolRest(unittest.TestCase):
+
+    def device(self, *responses):
+        return Mock(**{'get.return_value.json.side_effect': list(responses)})
+
+    def test_modules(self):
+        self.assertIs(bigip.get_ltm_pool.LtmPool, LtmPool)
+        self.assertIs(bigip.LtmPool, LtmPool)
+        self.assertTrue(issubclass(LtmPool, LtmPoolSchema))
+        self.assertTrue(issubclass(LtmPool, IcontrolRest))
+        self.assertEqual(LtmPool.cli_command, '/mgmt/tm/ltm/pool')
+        self.assertEqual(LtmPool.__module__,
+                         'genie.libs.parser.bigip.get_ltm_pool')
+        self.assertIn('get_ltm_pool', dir(bigip))
+        with self.assertRaises(AttributeError):
+            bigip.get_ltm_unknown
+        with self.assertRaises(ImportError):
+            from genie.libs.parser.bigip import get_ltm_unknown
+
+    def test_empty(self):
+        # The schema is empty, MetaParser does not validate the result
+        obj = LtmPool(device=self.device({}), context='rest')
+        self.assertEqual(obj.parse(), {})
+
+    def test_golden(self):
+        device = self.device(pool_page(['p1'], next_link=False))
+        parsed_output = LtmPool(device=device, context='rest').parse()
+        self.assertEqual(parsed_output, pool_page(['p1'], next_link=False))
+        device.get.assert_called_once_with('/mgmt/tm/ltm/pool')
+
+    def test_query(self):
+        device = self.device(pool_page(['p1'], next_link=False))
+        obj = LtmPool(device=device, context='rest')
+        obj.parse(select=['name', 'partition'], expand_subcollections=True)
+        device.get.assert_called_once_with(
+            '/mgmt/tm/ltm/pool?$select=name,partition'
+            '&expandSubcollections=true')
+
+    def test_pages(self):
+        device = self.device(pool_page(['p1', 'p2']),
+                             pool_page(['p3', 'p4']),
+                             pool_page(['p5'], next_link=False))
+        parsed_output = LtmPool(device=device, context='rest').parse(top=2)
+        self.assertEqual(parsed_output, {
+            'kind': 'tm:ltm:pool:poolcollectionstate',
+            'selfLink': 'https://localhost/mgmt/tm/ltm/pool',
+            'items': pool_page(['p1', 'p2', 'p3', 'p4', 'p5'])['items']})
+        self.assertEqual([call[0][0] for call in device.get.call_args_list],
+                         ['/mgmt/tm/ltm/pool?$top=2',
+                          '/mgmt/tm/ltm/pool?$top=2&$skip=2',
+                          '/mgmt/tm/ltm/pool?$top=2&$skip=4'])
+
+    def test_iter_items(self):
+        device = self.device(pool_page(['p1', 'p2']),
+                             pool_page(['p3'], next_link=False))
+        obj = LtmPool(device=device, context='rest')
+        names = [item['name']
+                 for item in obj.iter_items(select='name', top=2)]
+        self.assertEqual(names, ['p1', 'p2', 'p3'])
+        self.assertEqual(device.get.call_args_list[1][0][0],
+                         '/mgmt/tm/ltm/pool?$select=name&$top=2&$skip=2')
+
+
+class BigipHandler(BaseHTTPRequestHandler):
+    """Resources of /mgmt/tm answering after server.delay seconds"""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.running += 1
+            server.requests += 1
+            server.max_running = max(server.max_running, server.running)
+        time.sleep(server.delay)
+        with server.lock:
+            server.running -= 1
+
+        if not self.path.startswith('/mgmt/tm/ltm/'):
+            self.send_error(404)
+            return
+        body = json.dumps({'kind': 'tm:' + self.path[9:].replace('/', ':'),
+                           'items': []}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class BigipServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class RestDevice(object):
+    """Device whose get() reads the local server"""
+
+    def __init__(self, url):
+        self.url = url
+
+    def get(self, api_url):
+        with urllib.request.urlopen(self.url + api_url) as f:
+            body = json.loads(f.read().decode())
+        return Mock(**{'json.return_value': body})
+
+
+class TestSnapshot(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = BigipServer(('127.0.0.1', 0), BigipHandler)
+        cls.server.delay = 0.1
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.device = RestDevice('http://127.0.0.1:{}'.format(
+            cls.server.server_address[1]))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.running = 0
+        self.server.requests = 0
+        self.server.max_running = 0
+
+    def test_snapshot(self):
+        paths = ['/mgmt/tm/ltm/pool', '/mgmt/tm/ltm/virtual',
+                 '/mgmt/tm/ltm/node', '/mgmt/tm/ltm/rule',
+                 '/mgmt/tm/ltm/monitor', '/mgmt/tm/ltm/profile',
+                 '/mgmt/tm/ltm/snat', '/mgmt/tm/ltm/example',
+                 '/mgmt/tm/net/interface']
+        results = snapshot(self.device, [LtmPool] + paths[1:], max_workers=3)
+
+        self.assertEqual(list(results), paths)
+        self.assertIs(results['/mgmt/tm/ltm/pool'].parser, LtmPool)
+        self.assertEqual(results['/mgmt/tm/ltm/virtual'].parsed,
+                         {'kind': 'tm:ltm:virtual', 'items': []})
+        # Not in the endpoints table, read by a generic parser
+        self.assertEqual(results['/mgmt/tm/ltm/example'].parsed,
+                         {'kind': 'tm:ltm:example', 'items': []})
+        self.assertEqual(results['/mgmt/tm/ltm/example'].parser.__module__,
+                         IcontrolRest.__module__)
+        # A failed read does not stop the others
+        self.assertIsNone(results['/mgmt/tm/net/interface'].parsed)
+        self.assertIsNotNone(results['/mgmt/tm/net/interface'].exception)
+
+        for result in results.values():
+            self.assertGreaterEqual(result.latency, 0.1)
+        self.assertEqual(self.server.max_running, 3)
+
+    def test_duplicates(self):
+        # Read once, by the first parser given for the resource
+        results = snapshot(self.device, [LtmPool, '/mgmt/tm/ltm/virtual',
+                                         '/mgmt/tm/ltm/pool',
+                                         '/mgmt/tm/ltm/virtual'])
+        self.assertEqual(list(results), ['/mgmt/tm/ltm/pool',
+                                         '/mgmt/tm/ltm/virtual'])
+        self.assertIs(results['/mgmt/tm/ltm/pool'].parser, LtmPool)
+        self.assertEqual(self.server.requests, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
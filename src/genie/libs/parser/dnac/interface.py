@@ -6,16 +6,20 @@
 """
 
 import os
+import time
 import logging
+import threading
 import pprint
 import re
 import unittest
 from genie import parsergen
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from pyats.log.utils import banner
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util import merge_dict, keynames_convert
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
@@ -35,7 +39,7 @@ logger = logging.getLogger(__name__)
 class InterfaceSchema(MetaParser):
     """schema for /dna/intent/api/v1/interface, /dna/intent/api/v1/interface/{interface}"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'hostname': {
             Any(): {
                 'interfaces': {
@@ -74,7 +78,36 @@ class InterfaceSchema(MetaParser):
                 }
             }
         }
-    }
+    })
+
+
+# ============================================
+# Cache of the hostnames of the devices
+# ============================================
+class HostnameCache(object):
+    """Hostname of the devices known by each controller, kept for ttl
+    seconds. Shared by the parses of all the threads."""
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._hostnames = {}
+        self._lock = threading.Lock()
+
+    def get(self, controller, device_id):
+        """Return the hostname of device_id, or None if unknown or expired"""
+        with self._lock:
+            hostname, added = self._hostnames.get((controller, device_id),
+                                                  (None, 0))
+        return hostname if time.monotonic() - added < self.ttl else None
+
+    def set(self, controller, device_id, hostname):
+        with self._lock:
+            self._hostnames[(controller, device_id)] = \
+                (hostname, time.monotonic())
+
+    def clear(self):
+        with self._lock:
+            self._hostnames.clear()
 
 
 # ============================================
@@ -85,41 +118,97 @@ class Interface(InterfaceSchema):
     parser for 
     /dna/intent/api/v1/interface, 
     /dna/intent/api/v1/interface/{interface}
+
+    The interfaces are read by pages of page_size entries. The hostnames of
+    the devices of each page are looked up while the next pages are read,
+    batch_size devices per request and max_workers requests at a time, over
+    the session of the device connection. Hostnames are cached for
+    hostnames.ttl seconds across parses.
     """
 
     cli_command = ['/dna/intent/api/v1/interface', 
                    '/dna/intent/api/v1/interface/{interface}']
+    device_command = '/dna/intent/api/v1/network-device'
+
+    page_size = 500
+    batch_size = 100
+    max_workers = 8
+    hostnames = HostnameCache()
+
+    def _get(self, cmd):
+        return self.device.get(cmd).json()['response']
+
+    def _pages(self, cmd):
+        """Yield the pages of interfaces, as they are read"""
+        offset = 1
+        while True:
+            page = self._get('{cmd}?offset={offset}&limit={limit}'.format(
+                cmd=cmd, offset=offset, limit=self.page_size))
+            yield page
+            # A controller without paging returns every interface at once
+            if len(page) != self.page_size:
+                break
+            offset += len(page)
+
+    def _lookup(self, device_ids):
+        """Return {device id: hostname} of the devices, with one request"""
+        cmd = '{cmd}?id={ids}'.format(cmd=self.device_command,
+                                      ids=','.join(device_ids))
+        return {device['id']: device['hostname']
+                for device in self._get(cmd)}
 
     def cli(self,interface="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.get(cmd).json()['response']
-
+        if output is not None:
+            pages = [output]
+        elif interface:
+            pages = [self._get(self.cli_command[1].format(interface=interface))]
         else:
-            out = output
+            pages = self._pages(self.cli_command[0])
 
-        # get device by id
-        cmd = '/dna/intent/api/v1/network-device/{device_id}'
+        controller = getattr(self.device, 'name', None)
+        id_to_hostname = {}
+        # interfaces of each device, until its hostname is known
+        id_to_interfaces = {}
+        lookups = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for page in pages:
+                if isinstance(page, dict):
+                    page = [page]
+
+                missing = []
+                for intf_dict in page:
+                    device_id = intf_dict['deviceId']
+                    if device_id not in id_to_interfaces:
+                        id_to_interfaces[device_id] = {}
+                        hostname = self.hostnames.get(controller, device_id)
+                        if hostname is None:
+                            missing.append(device_id)
+                        else:
+                            id_to_hostname[device_id] = hostname
+
+                    # remove None values
+                    id_to_interfaces[device_id][intf_dict['portName']] = \
+                        {k: v for k, v in intf_dict.items() if v is not None}
+
+                for i in range(0, len(missing), self.batch_size):
+                    lookups.append(pool.submit(
+                        self._lookup, missing[i:i + self.batch_size]))
+
+            for lookup in lookups:
+                for device_id, hostname in lookup.result().items():
+                    self.hostnames.set(controller, device_id, hostname)
+                    id_to_hostname[device_id] = hostname
 
         result_dict={}
-        id_to_hostname = {}
-        for intf_dict in out:
-            device_id = intf_dict['deviceId']
+        for device_id, interfaces in id_to_interfaces.items():
             if device_id not in id_to_hostname:
-                device_id_cmd = cmd.format(device_id=device_id)
-                device_info = self.device.get(device_id_cmd).json()['response']
-                hostname = device_info['hostname']
-                id_to_hostname[device_id] = hostname
-            else:
-                hostname = id_to_hostname[device_id]
-
-            host_info = result_dict.setdefault('hostname', {}).setdefault(hostname, {}).setdefault('interfaces', {})
-            # remove None values
-            host_info[intf_dict['portName']] = {k: v 
-                                                for k, v in intf_dict.items() 
-                                                if v is not None}
+                logger.warning('Device {id} of {n} interfaces is not known by '
+                               'the controller'.format(id=device_id,
+                                                       n=len(interfaces)))
+                continue
+            host_info = result_dict.setdefault('hostname', {}).setdefault(
+                id_to_hostname[device_id], {}).setdefault('interfaces', {})
+            host_info.update(interfaces)
 
         return result_dict
@@ -1,5 +1,11 @@
 # Python
+import json
+import threading
 import unittest
+import urllib.request
+from urllib.parse import urlsplit, parse_qs
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
 from unittest.mock import Mock
 from requests.models import Response
 # ATS
@@ -15,6 +21,9 @@ from genie.libs.parser.dnac.interface import Interface
 class TestInterfaceRest(unittest.TestCase):
     device = Device(name='aDevice')
 
+    def setUp(self):
+        Interface.hostnames.clear()
+
     golden_parsed_output = {
         'hostname': {
             'csrl': {
@@ -145,7 +154,7 @@ class TestInterfaceRest(unittest.TestCase):
     }
 
     golden_response_output2 = {
-        'response': {
+        'response': [{
             'memorySize': 'NA',
             'family': 'Routers',
             'lastUpdateTime': 1575478820235,
@@ -186,7 +195,7 @@ class TestInterfaceRest(unittest.TestCase):
             'instanceUuid': 'f34890c0-ff08-4562-af83-dfe516b2dcab',
             'instanceTenantId': '5bde9f95041e6f004dcc24e6',
             'id': 'f34890c0-ff08-4562-af83-dfe516b2dcab'
-        },
+        }],
         'version': '1.0'
     }
 
@@ -215,5 +224,119 @@ class TestInterfaceRest(unittest.TestCase):
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
 
+def interface_row(i):
+    """Interface i of the controller, a golden interface with its own
+    device and port"""
+    return dict(TestInterfaceRest.golden_response_output1['response'][0],
+                deviceId='id-{}'.format(i // 8),
+                portName='GigabitEthernet0/0/{}'.format(i % 8))
+
+
+class DnacHandler(BaseHTTPRequestHandler):
+    """Interface and network-device endpoints of a controller managing
+    server.devices devices with 8 interfaces each"""
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        self.server.requests.append(url.path)
+
+        if url.path == '/dna/intent/api/v1/interface':
+            offset = int(query['offset'][0])
+            limit = int(query['limit'][0])
+            response = [interface_row(i)
+                        for i in range(offset - 1, min(offset - 1 + limit,
+                                                       self.server.devices * 8))]
+        elif url.path == '/dna/intent/api/v1/network-device':
+            response = [{'id': device_id,
+                         'hostname': 'host-' + device_id[3:]}
+                        for device_id in query['id'][0].split(',')]
+        else:
+            self.send_error(404)
+            return
+
+        body = json.dumps({'response': response}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class DnacServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class RestDevice(object):
+    """Device whose get() reads the local controller"""
+
+    def __init__(self, name, url):
+        self.name = name
+        self.url = url
+
+    def get(self, api_url):
+        with urllib.request.urlopen(self.url + api_url) as f:
+            body = json.loads(f.read().decode())
+        return Mock(**{'json.return_value': body})
+
+
+class TestInterfaceRestServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = DnacServer(('127.0.0.1', 0), DnacHandler)
+        cls.server.devices = 250
+        cls.server.requests = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.device = RestDevice('dnac', 'http://127.0.0.1:{}'.format(
+            cls.server.server_address[1]))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        Interface.hostnames.clear()
+        self.server.requests.clear()
+
+    def test_paging(self):
+        parsed_output = Interface(device=self.device).parse()
+
+        self.assertEqual(len(parsed_output['hostname']), 250)
+        self.assertEqual(
+            parsed_output['hostname']['host-249']['interfaces']
+                         ['GigabitEthernet0/0/7'],
+            {k: v for k, v in interface_row(249 * 8 + 7).items()
+             if v is not None})
+        # 2000 interfaces by pages of 500, 250 devices by batches of 100
+        # looked up as the pages are read
+        self.assertEqual(
+            self.server.requests.count('/dna/intent/api/v1/interface'), 5)
+        self.assertEqual(
+            self.server.requests.count('/dna/intent/api/v1/network-device'),
+            4)
+
+    def test_cache(self):
+        expected = Interface(device=self.device).parse()
+        self.server.requests.clear()
+
+        self.assertEqual(Interface(device=self.device).parse(), expected)
+        self.assertNotIn('/dna/intent/api/v1/network-device',
+                         self.server.requests)
+
+        # Expired hostnames are looked up again
+        Interface.hostnames.ttl = 0
+        try:
+            self.assertEqual(Interface(device=self.device).parse(), expected)
+        finally:
+            Interface.hostnames.ttl = 300
+        self.assertIn('/dna/intent/api/v1/network-device',
+                      self.server.requests)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,6 +5,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -12,7 +13,7 @@ class ShowVersionSchema(MetaParser):
     """
     Schema for show version
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'version': {
             'os': str,
             'platform': str,
@@ -66,7 +67,7 @@ class ShowVersionSchema(MetaParser):
                 'serial': int,
             }
         }
-    }
+    })
 
 
 class ShowVersion(ShowVersionSchema):
@@ -438,7 +439,7 @@ class DirSchema(MetaParser):
     Schema for command:
         * dir
     """
-    schema = {
+    schema = LazySchema(lambda: {
                 'dir': {
                     'dir': str,
                     Any(): {
@@ -454,7 +455,7 @@ class DirSchema(MetaParser):
                         Optional('bytes_free'): str
                     }
                 }
-            }
+            })
 
 
 class Dir(DirSchema):
@@ -526,7 +527,7 @@ class ShowRedundancySchema(MetaParser):
     Schema for command:
         * show redundancy
     """
-    schema = {
+    schema = LazySchema(lambda: {
                 'red_sys_info': {
                     'available_system_uptime': str,
                     'switchovers_system_experienced': str,
@@ -556,7 +557,7 @@ class ShowRedundancySchema(MetaParser):
                         'compiled_date': str,
                     }
                 }
-            }
+            })
 
 
 class ShowRedundancy(ShowRedundancySchema):
@@ -812,7 +813,7 @@ class ShowInventorySchema(MetaParser):
         * 'show inventory'
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'index': {
             Any():
                 {'name': str,
@@ -822,7 +823,7 @@ class ShowInventorySchema(MetaParser):
                  Optional('sn'): str,
                 },
             }
-        }
+        })
 
 
 class ShowInventory(ShowInventorySchema):
@@ -885,7 +886,7 @@ class ShowModuleSchema(MetaParser):
     """ Schema for commands:
         * show module
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'slot': {
             Any(): {
                 Optional('rp'): {
@@ -952,7 +953,7 @@ class ShowModuleSchema(MetaParser):
                 } 
             }
         }
-    }
+    })
 
 
 class ShowModule(ShowModuleSchema):
@@ -13,6 +13,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 # import iosxe parser
 from genie.libs.parser.iosxe.show_ntp import ShowNtpAssociationsDetail as ShowNtpAssociationsDetail_iosxe,\
@@ -25,7 +26,7 @@ from genie.libs.parser.iosxe.show_ntp import ShowNtpAssociationsDetail as ShowNt
 class ShowNtpAssociationsSchema(MetaParser):
     """Schema for show ntp associations"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'peer': {
             Any(): {
                 'local_mode': {
@@ -57,7 +58,7 @@ class ShowNtpAssociationsSchema(MetaParser):
                 Optional('associations_local_mode'): str,
             }
         }
-    }
+    })
 
 
 # ==============================================
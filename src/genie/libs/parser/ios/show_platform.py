@@ -20,6 +20,7 @@ import re
 
 # genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
     Any, Optional
 
@@ -71,7 +72,7 @@ class Dir(Dir_iosxe):
 
 class ShowRedundancyIosSchema(MetaParser):
     """Schema for show redundancy """
-    schema = {
+    schema = LazySchema(lambda: {
         'red_sys_info': {
             'available_system_uptime': str,
             'switchovers_system_experienced': str,
@@ -95,7 +96,7 @@ class ShowRedundancyIosSchema(MetaParser):
                 'config_register': str,
             }
         }
-    }
+    })
 
 
 class ShowRedundancy(ShowRedundancyIosSchema, ShowRedundancy_iosxe):
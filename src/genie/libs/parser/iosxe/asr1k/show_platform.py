@@ -4,6 +4,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -17,7 +18,7 @@ class ShowEnvironmentAllSchema(MetaParser):
     """Schema for show environment all
                   show environment all | include <WORD>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'sensor_list': {
             Any(): {
                 'sensor': {
@@ -29,7 +30,7 @@ class ShowEnvironmentAllSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowEnvironmentAll(ShowEnvironmentAllSchema):
@@ -85,7 +86,7 @@ class ShowEnvironmentAllIncludeLocationSchema(MetaParser):
     """Schema for show environment all
                   show environment all | include <WORD>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'sensor_list': {
             Any(): {
                 'sensor': {
@@ -97,7 +98,7 @@ class ShowEnvironmentAllIncludeLocationSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowEnvironmentAllIncludeLocation(ShowEnvironmentAllIncludeLocationSchema):
@@ -4,6 +4,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -15,7 +16,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 class ShowEnvironmentAllSchema(MetaParser):
     """Schema for show environment all"""
-    schema = {
+    schema = LazySchema(lambda: {
         'switch': {
             Any(): {
                 'fan': {
@@ -56,7 +57,7 @@ class ShowEnvironmentAllSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowEnvironmentAll(ShowEnvironmentAllSchema):
@@ -8,6 +8,7 @@ import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 
@@ -19,7 +20,7 @@ class ShowInventorySchema(MetaParser):
     """ Schema for:
         * show inventory
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'index': {
             Any():
                 {'name': str,
@@ -29,7 +30,7 @@ class ShowInventorySchema(MetaParser):
                  Optional('sn'): str,
                 }
             }
-        }
+        })
 
 
 # ============================
@@ -95,7 +96,7 @@ class ShowInventory(ShowInventorySchema):
 
 class ShowEnvironmentAllSchema(MetaParser):
     """Schema for show environment all"""
-    schema = {
+    schema = LazySchema(lambda: {
         'switch': {
             Any(): {
                 'fan': {
@@ -143,7 +144,7 @@ class ShowEnvironmentAllSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowEnvironmentAll(ShowEnvironmentAllSchema):
@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                                Default, Use
 
@@ -24,7 +25,7 @@ class ShowIssuStateDetailSchema(MetaParser):
 
     """Schema for show issu state detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'slot':
             {Any():
                 {
@@ -41,7 +42,7 @@ class ShowIssuStateDetailSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 # ====================================
 #  Parser for 'show issu state detail'
@@ -202,11 +203,11 @@ class ShowIssuRollbackTimerSchema(MetaParser):
 
     """Schema for show issu rollback-timer"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'rollback_timer_state': str,
         Optional('rollback_timer_reason'): str,
         Optional('rollback_timer_time'): str,
-        }
+        })
 
 # ======================================
 #  Parser for 'show issu rollback-timer'
@@ -13,6 +13,7 @@ import logging
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 
@@ -23,7 +24,7 @@ class ShowVersionSchema(MetaParser):
 
     """Schema for show version"""
 
-    schema = {
+    schema = LazySchema(lambda: {
                 'version': {
                     'version_short': str,
                     'os': str,
@@ -68,7 +69,7 @@ class ShowVersionSchema(MetaParser):
                         }
                     },
                 }
-            }
+            })
 
 
 # ==========================
@@ -462,7 +463,7 @@ class ShowRedundancySchema(MetaParser):
 
     """Schema for show redundancy """
 
-    schema = {
+    schema = LazySchema(lambda: {
                 'red_sys_info': {
                     'available_system_uptime': str,
                     'switchovers_system_experienced': str,
@@ -486,7 +487,7 @@ class ShowRedundancySchema(MetaParser):
                         'compiled_date': str,
                     }
                 }
-            }
+            })
 
 
 # =============================
@@ -706,7 +707,7 @@ class ShowInventorySchema(MetaParser):
         * 'show inventory'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'index': {
             Any():
                 {'name': str,
@@ -716,7 +717,7 @@ class ShowInventorySchema(MetaParser):
                  Optional('sn'): str,
                 },
             }
-        }
+        })
 
 
 # ============================
@@ -785,7 +786,7 @@ class ShowPlatformSchema(MetaParser):
 
     """Schema for show platform"""
 
-    schema = {
+    schema = LazySchema(lambda: {
             'chassis': str,
             'slot': {
                 Any(): {
@@ -805,7 +806,7 @@ class ShowPlatformSchema(MetaParser):
                     }
                 },
             }
-        }
+        })
 
 
 # ===========================
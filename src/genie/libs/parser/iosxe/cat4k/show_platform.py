@@ -4,12 +4,13 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
 class ShowModuleSchema(MetaParser):
     """Schema for show module"""
-    schema = {
+    schema = LazySchema(lambda: {
         'chassis_type': str,
         'power_consumed': str,
         'mod': {
@@ -32,7 +33,7 @@ class ShowModuleSchema(MetaParser):
         Optional('system_failures'): {
             'power_supply': str
         }
-    }
+    })
 
 
 class ShowModule(ShowModuleSchema):
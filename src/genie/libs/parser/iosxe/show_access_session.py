@@ -8,6 +8,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -28,7 +29,7 @@ from genie.libs.parser.iosxe.show_authentication_sessions import \
 # ====================================
 class ShowAccessSessionSchema(MetaParser):
     """Schema for show access-session"""
-    schema = {
+    schema = LazySchema(lambda: {
         'session_count': int,
         Optional('interfaces'): {
             Any(): {
@@ -48,7 +49,7 @@ class ShowAccessSessionSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowAccessSession(ShowAccessSessionSchema):
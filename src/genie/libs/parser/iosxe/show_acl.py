@@ -9,6 +9,7 @@ import random
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import (Schema,
                                                 Any,
                                                 Optional,
@@ -28,7 +29,7 @@ class ShowAccessListsSchema(MetaParser):
                   show ip access-lists <acl>
                   show ipv6 access-list
                   show ipv6 access-list <acl>"""
-    schema = {
+    schema = LazySchema(lambda: {
         Any():{
             'name': str,
             'type': str,
@@ -115,7 +116,7 @@ class ShowAccessListsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowAccessLists(ShowAccessListsSchema):
     """Parser for show access-lists
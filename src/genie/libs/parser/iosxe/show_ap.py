@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -11,7 +12,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowApSummarySchema(MetaParser):
     """Schema for show ap summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "ap_neighbor_count": int,
         "ap_name": {
             str: {
@@ -24,7 +25,7 @@ class ShowApSummarySchema(MetaParser):
                 "state": str
             }
         }
-    }
+    })
 
 # ====================
 # Parser for:
@@ -124,7 +125,7 @@ class ShowApSummary(ShowApSummarySchema):
 class ShowApRfProfileSummarySchema(MetaParser):
     """Schema for show ap rf-profile summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "rf_profile_summary": {
             "rf_profile_count": int,
             "rf_profiles": {
@@ -136,7 +137,7 @@ class ShowApRfProfileSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ===============================
@@ -229,7 +230,7 @@ class ShowApRfProfileSummary(ShowApRfProfileSummarySchema):
 class ShowApDot11DualBandSummarySchema(MetaParser):
     """Schema for show ap dot11 dual-band summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "ap_dot11_dual-band_summary": {
             "index": {
                 int: {
@@ -246,7 +247,7 @@ class ShowApDot11DualBandSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ====================================
@@ -304,7 +305,7 @@ class ShowApDot11DualBandSummary(ShowApDot11DualBandSummarySchema):
 class ShowApDot115GhzChannelSchema(MetaParser):
     """Schema for show ap dot11 5ghz channel."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "channel_assignment": {
             "chan_assn_mode": str,
             "chan_upd_int": str,
@@ -337,7 +338,7 @@ class ShowApDot115GhzChannelSchema(MetaParser):
             "allowed_channel_list": str,
             "unused_channel_list": str
         }
-    }
+    })
 
 
 
@@ -685,7 +686,7 @@ class ShowApDot115GhzChannel(ShowApDot115GhzChannelSchema):
 class ShowApDot115GhzSummarySchema(MetaParser):
     """Schema for show ap dot11 5ghz summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "ap_name": {
             str: {
                 "mac_address": str,
@@ -697,7 +698,7 @@ class ShowApDot115GhzSummarySchema(MetaParser):
                 "channel": str
             }
         } 
-    }     
+    })     
 
 
 # ===============================
@@ -797,7 +798,7 @@ class ShowApDot115GhzSummary(ShowApDot115GhzSummarySchema):
 class ShowApRfProfileSummarySchema(MetaParser):
     """Schema for show ap rf-profile summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "rf_profile_summary": {
             "rf_profile_count": int,
             "rf_profiles": {
@@ -809,7 +810,7 @@ class ShowApRfProfileSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ===============================
@@ -903,13 +904,13 @@ class ShowApRfProfileSummary(ShowApRfProfileSummarySchema):
 class ShowApLedBrightnessLevelSummarySchema(MetaParser):
     """Schema for show ap led-brightness-level summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "ap_name": {
             str: {
                 "led_brightness_level": int
             }
         }
-    }
+    })
 
 
 # =========================================
@@ -993,7 +994,7 @@ class ShowApLedBrightnessLevelSummary(ShowApLedBrightnessLevelSummarySchema):
 class ShowApCdpNeighborSchema(MetaParser):
     """Schema for show ap cdp neighbor."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "ap_cdp_neighbor_count": int,
         "ap_name": {
             Optional(str): {
@@ -1004,7 +1005,7 @@ class ShowApCdpNeighborSchema(MetaParser):
                 Optional("neighbor_ip_addresses"): list
             }
         }
-    }
+    })
     
 # =========================
 # Parser for:
@@ -1112,7 +1113,7 @@ class ShowApCdpNeighbor(ShowApCdpNeighborSchema):
 class ShowApConfigGeneralSchema(MetaParser):
     """Schema for show ap config general."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "ap_name": {
             str: {
                 Optional("cisco_ap_identifier"): str,
@@ -1232,7 +1233,7 @@ class ShowApConfigGeneralSchema(MetaParser):
                 Optional("dual_dfs_statistics"): str
             }
         }
-    }
+    })
 
 
 # ===========================
@@ -2671,7 +2672,7 @@ class ShowApConfigGeneral(ShowApConfigGeneralSchema):
 class ShowApTagSummarySchema(MetaParser):
     """Schema for show ap tag summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "ap_name": {
             Any(): {
                 "ap_mac": str,
@@ -2683,7 +2684,7 @@ class ShowApTagSummarySchema(MetaParser):
             },
         },
         "number_of_aps": int,
-    }
+    })
 
 
 # ========================
@@ -1,6 +1,7 @@
 # Metaparser
 from genie.metaparser import MetaParser
-import genie.parsergen as pg
+from genie.libs.parser.base import LazySchema
+from genie.libs.parser.utils.table import Table
 import re
 
 
@@ -10,13 +11,13 @@ import re
 
 class ShowApphostingListSchema(MetaParser):
     """ Schema for show app-hosting list """
-    schema = {
+    schema = LazySchema(lambda: {
         'app_id': {
             str: {
                 'state': str,
                 }
             }
-         }
+         })
 # ===========================================
 # Parser for 'show app-hosting list'
 # ===========================================
@@ -25,6 +26,8 @@ class ShowApphostingList(ShowApphostingListSchema):
 
     cli_command = "show app-hosting list"
 
+    app_table = Table(header_fields=["App id", "State"], index=[0])
+
     def cli(self, output=None):
         parsed_dict = {}
         if output is None:
@@ -35,10 +38,7 @@ class ShowApphostingList(ShowApphostingListSchema):
         # ---------------------------------------------------------                                                                                                 
         # utd                                      RUNNING   
         if out:
-            out = pg.oper_fill_tabular(device_output=out,
-                                    header_fields=["App id", "State"],
-                                    index=[0])
-            return_dict = out.entries
+            return_dict = self.app_table.entries(out)
             app_id ={}
             for keys in return_dict.keys() :
                 app_dict={}
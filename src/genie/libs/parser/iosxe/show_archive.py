@@ -13,6 +13,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -25,7 +26,7 @@ class ShowArchiveSchema(MetaParser):
     Schema for show archive
     """
 
-    schema = {'archive': {
+    schema = LazySchema(lambda: {'archive': {
                 'total': int,
                 Optional('max_archive_configurations'): int,
                 'most_recent_file': str,
@@ -33,7 +34,7 @@ class ShowArchiveSchema(MetaParser):
                     'file': str,
                 },
             }
-        }
+        })
 
 class ShowArchive(ShowArchiveSchema):
     """ Parser for show archive """
@@ -107,10 +108,10 @@ class ShowArchiveConfigDifferencesSchema(MetaParser):
     * show archive config incremental-diff {fileA}
     """
     
-    schema = {
+    schema = LazySchema(lambda: {
             Optional('diff'): list,
             Optional('list_of_commands'): list
-    }
+    })
 
 class ShowArchiveConfigDifferences(ShowArchiveConfigDifferencesSchema):
     """ Parser for the following commands:
@@ -18,6 +18,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
@@ -35,7 +36,7 @@ class ShowArpSchema(MetaParser):
                   show arp vrf <vrf> <WORD>
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('global_static_table'): {
             Any(): {
                 'ip_address': str,
@@ -61,7 +62,7 @@ class ShowArpSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowArp(ShowArpSchema):
@@ -153,10 +154,10 @@ class ShowIpArp(ShowArp):
 class ShowIpArpSummarySchema(MetaParser):
     """Schema for show ip arp summary"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'total_entries': int,
         'incomp_entries': int,
-        }
+        })
 
 # =====================================
 # Parser for 'show ip arp summary'
@@ -198,7 +199,7 @@ class ShowIpArpSummary(ShowIpArpSummarySchema):
 class ShowIpTrafficSchema(MetaParser):
     """Schema for show ip traffic"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'arp_statistics': {
             'arp_in_requests': int,
             'arp_in_replies': int,
@@ -369,7 +370,7 @@ class ShowIpTrafficSchema(MetaParser):
             'bgp_sent_keepalives': int,
             'bgp_sent_route_refresh': int,
         },
-    }
+    })
 
 # =====================================
 # Parser for 'show ip traffic'
@@ -1196,7 +1197,7 @@ class ShowArpApplicationSchema(MetaParser):
     Schema for show arp application
     """
     
-    schema = {
+    schema = LazySchema(lambda: {
         'num_of_clients_registered': int,
         'applications': {
             Any(): {
@@ -1204,7 +1205,7 @@ class ShowArpApplicationSchema(MetaParser):
                 'num_of_subblocks': int
             }
         }
-    }
+    })
 
 class ShowArpApplication(ShowArpApplicationSchema):
     """
@@ -1259,7 +1260,7 @@ class ShowArpSummarySchema(MetaParser):
     Schema for 'show arp summary'
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'total_num_of_entries':{
             Any(): int
         },
@@ -1271,7 +1272,7 @@ class ShowArpSummarySchema(MetaParser):
         },
         Optional('arp_entry_threshold'): int,
         Optional('permit_threshold'): int
-    }
+    })
 
 class ShowArpSummary(ShowArpSummarySchema):
     """ Parser for 'show arp summary'"""
@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional, \
@@ -40,7 +41,7 @@ class ShowAuthenticationSessionsSchema(MetaParser):
                   show authentication sessions interface {interface}
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'interface': str,
@@ -60,7 +61,7 @@ class ShowAuthenticationSessionsSchema(MetaParser):
             }
         },
         Optional('session_count'): int,
-    }
+    })
 
 
 class ShowAuthenticationSessions(ShowAuthenticationSessionsSchema):
@@ -153,7 +154,7 @@ class ShowAuthenticationSessions(ShowAuthenticationSessionsSchema):
 class ShowAuthenticationSessionsInterfaceDetailsSchema(MetaParser):
     """Schema for 'show authentication sessions interface {interface} details'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'mac_address': {
@@ -212,7 +213,7 @@ class ShowAuthenticationSessionsInterfaceDetailsSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 class ShowAuthenticationSessionsInterfaceDetails(ShowAuthenticationSessionsInterfaceDetailsSchema):
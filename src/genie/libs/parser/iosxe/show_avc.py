@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -11,7 +12,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowAvcSdServiceInfoSummarySchema(MetaParser):
     """Schema for show avc sd-service info summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional("active_controller"): {
             "ip": str,
             "last_connection": str,
@@ -25,7 +26,7 @@ class ShowAvcSdServiceInfoSummarySchema(MetaParser):
         },
         Optional("status"): str,
         Optional("sd_vac_status"): str,
-    }
+    })
 
 
 # =====================================
@@ -10,6 +10,7 @@ import pprint
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
 											Optional,\
 											Any
@@ -31,7 +32,7 @@ class ShowBfdNeighborsDetailsSchema(MetaParser):
         * show bfd neighbors interface {interface} details
 	"""
 
-	schema = {
+	schema = LazySchema(lambda: {
 		'our_address': {
 			Any(): {
 				'neighbor_address': {
@@ -115,7 +116,7 @@ class ShowBfdNeighborsDetailsSchema(MetaParser):
 				}
 			}
 		}
-	}	
+	})	
 
 
 class ShowBfdNeighborsDetails(ShowBfdNeighborsDetailsSchema):
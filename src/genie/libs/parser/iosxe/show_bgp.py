@@ -111,6 +111,9 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+                                                    CompiledMetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
@@ -130,7 +133,7 @@ from genie.libs.parser.iosxe.show_vrf import ShowVrf
 #   * 'show ip bgp {address_family} rd {rd}'
 #   * 'show ip bgp {address_family} vrf {vrf}'
 # ============================================
-class ShowBgpSchema(MetaParser):
+class ShowBgpSchema(CompiledMetaParser):
 
     ''' Schema for:
         * 'show bgp all'
@@ -145,7 +148,7 @@ class ShowBgpSchema(MetaParser):
         * 'show ip bgp {address_family} vrf {vrf}'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         'vrf':
             {Any():
                 {'address_family':
@@ -177,7 +180,7 @@ class ShowBgpSchema(MetaParser):
                     },
                 },
             },
-        }
+        }))
 
 
 # ============================================
@@ -208,6 +211,10 @@ class ShowBgpSuperParser(ShowBgpSchema):
         * 'show ip bgp {address_family} vrf {vrf}'
     '''
 
+    # cli() only loops over output.splitlines(), a MappedOutput is parsed
+    # without loading the whole output
+    mapped_output = True
+
     def cli(self, address_family='', vrf='', output=None):
 
         # Init dictionary
@@ -788,7 +795,7 @@ class ShowIpBgpRegexp(ShowBgpSuperParser, ShowBgpSchema):
 #   * 'show ip bgp {address_family} vrf {vrf} detail'
 #   * 'show ip bgp {address_family} rd {rd} detail'
 # ======================================================
-class ShowBgpAllDetailSchema(MetaParser):
+class ShowBgpAllDetailSchema(CompiledMetaParser):
 
     ''' Schema for:
         * 'show bgp all detail'
@@ -799,7 +806,7 @@ class ShowBgpAllDetailSchema(MetaParser):
         * 'show ip bgp {address_family} rd {rd} detail'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         'instance':
             {'default':
                 {'vrf':
@@ -878,7 +885,7 @@ class ShowBgpAllDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        }))
 
 
 # ======================================================
@@ -1752,7 +1759,7 @@ class ShowBgpSummarySchema(MetaParser):
         * 'show ip bgp {address_family} all summary'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'bgp_id': int,
         'vrf':
             {Any():
@@ -1808,7 +1815,7 @@ class ShowBgpSummarySchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==================================================
@@ -2501,7 +2508,7 @@ class ShowBgpAllNeighborsSchema(MetaParser):
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor}'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('list_of_neighbors'): list,
         'vrf':
             {Any():
@@ -2734,7 +2741,7 @@ class ShowBgpAllNeighborsSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==================================================================
@@ -4287,7 +4294,7 @@ class ShowBgpNeighborsAdvertisedRoutesSchema(MetaParser):
         * 'show ip bgp {address_family} neighbors {neighbor} advertised-routes'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'neighbor':
@@ -4320,7 +4327,7 @@ class ShowBgpNeighborsAdvertisedRoutesSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==============================================================================
@@ -4961,7 +4968,7 @@ class ShowBgpNeighborsReceivedRoutesSchema(MetaParser):
         * 'show ip bgp {address_family} neighbors {neighbor} received-routes'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'neighbor':
@@ -4994,7 +5001,7 @@ class ShowBgpNeighborsReceivedRoutesSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===========================================================================
@@ -5557,7 +5564,7 @@ class ShowBgpAllNeighborsRoutesSchema(MetaParser):
         * 'show ip bgp all neighbors {neighbor} routes'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'neighbor':
@@ -5590,7 +5597,7 @@ class ShowBgpAllNeighborsRoutesSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===================================================================
@@ -6196,7 +6203,7 @@ class ShowBgpAllClusterIdsSchema(MetaParser):
 
     ''' Schema for "show bgp all cluster-ids" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {Optional('cluster_id'): str,
@@ -6213,7 +6220,7 @@ class ShowBgpAllClusterIdsSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==============================
@@ -6360,7 +6367,7 @@ class ShowBgpAllNeighborsPolicySchema(MetaParser):
 
     ''' Schema for "show bgp all neighbors {neighbor} policy" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'neighbor':
@@ -6375,7 +6382,7 @@ class ShowBgpAllNeighborsPolicySchema(MetaParser):
                     },
                 }
             },
-        }
+        })
 
 
 # ==============================================
@@ -6454,7 +6461,7 @@ class ShowIpBgpTemplatePeerSessionSchema(MetaParser):
 
     ''' Schema "show ip bgp template peer-session {template_name}" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'peer_session':
             {Any():
                 {Optional('local_policies'): str ,
@@ -6492,7 +6499,7 @@ class ShowIpBgpTemplatePeerSessionSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =======================================================
@@ -6738,7 +6745,7 @@ class ShowIpBgpTemplatePeerPolicySchema(MetaParser):
 
     ''' Schema for "show ip bgp template peer-policy {template_name}" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'peer_policy':
             {Any():
                 {Optional('local_policies'): str,
@@ -6782,7 +6789,7 @@ class ShowIpBgpTemplatePeerPolicySchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ======================================================
@@ -7059,7 +7066,7 @@ class ShowIpBgpAllDampeningParametersSchema(MetaParser):
 
     ''' Schema for "show ip bgp all dampening parameters" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                  {Optional('address_family'):
@@ -7075,7 +7082,7 @@ class ShowIpBgpAllDampeningParametersSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==========================================
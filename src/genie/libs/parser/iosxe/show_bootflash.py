@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # parser utils
@@ -22,7 +23,7 @@ from genie.libs.parser.utils.common import Common
 
 class ShowBootflashSchema(MetaParser):
     """Schema for show bootflash:."""
-    schema = {
+    schema = LazySchema(lambda: {
         'bytes_available': int,
         'bytes_used': int,
         'files': {
@@ -32,7 +33,7 @@ class ShowBootflashSchema(MetaParser):
                 'file_name': str
                 }
             }
-    }
+    })
 
 # =================
 # Parser for:
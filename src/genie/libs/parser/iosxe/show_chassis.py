@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -11,7 +12,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowChassisSchema(MetaParser):
     """Schema for show chassis."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "chassis_mac_address": str,
         "mac_wait_time": str,
         "redun_port_type": str,
@@ -25,7 +26,7 @@ class ShowChassisSchema(MetaParser):
                 "ip_address": str
             }
         }
-    }
+    })
 
 
 # =================
@@ -135,7 +136,7 @@ class ShowChassis(ShowChassisSchema):
 class ShowChassisRmiSchema(MetaParser):
     """Schema for show chassis rmi."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "chassis_mac_address": str,
         "mac_wait_time": str,
         "redun_port_type": str,
@@ -150,7 +151,7 @@ class ShowChassisRmiSchema(MetaParser):
                 "rmi_ip": str
             }
         }
-    }
+    })
 
 
 # =====================
@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -11,7 +12,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowClassMapSchema(MetaParser):
     """Schema for show class-map."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "class_maps": {
             str: {
               "match_criteria": str,
@@ -26,7 +27,7 @@ class ShowClassMapSchema(MetaParser):
               }
             }
         }
-    }
+    })
 
 
 # ===================
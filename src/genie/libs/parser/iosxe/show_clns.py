@@ -11,6 +11,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                                Any, \
                                                Optional
@@ -22,7 +23,7 @@ class ShowClnsInterfaceSchema(MetaParser):
     """Schema for show clns interface,
                   show clns interface {interface}"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces':{
             Any():{
                 'status':str,
@@ -76,7 +77,7 @@ class ShowClnsInterfaceSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowClnsInterface(ShowClnsInterfaceSchema):
     """Parser for show clns interface
@@ -337,7 +338,7 @@ class ShowClnsInterface(ShowClnsInterfaceSchema):
 class ShowClnsProtocolSchema(MetaParser):
     """Schema for show clns protocol"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
              Any(): {
                 'system_id': str,
@@ -362,7 +363,7 @@ class ShowClnsProtocolSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowClnsProtocol(ShowClnsProtocolSchema):
     """Parser for show clns protocol"""
@@ -557,7 +558,7 @@ class ShowClnsProtocol(ShowClnsProtocolSchema):
 class ShowClnsNeighborsDetailSchema(MetaParser):
     """Schema for show clns neighbors detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'tag': {
             Any(): {
                 Optional('system_id'):{
@@ -581,7 +582,7 @@ class ShowClnsNeighborsDetailSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 class ShowClnsNeighborsDetail(ShowClnsNeighborsDetailSchema):
     """Parser for show clns neighbors detail"""
@@ -718,7 +719,7 @@ class ShowClnsNeighborsDetail(ShowClnsNeighborsDetailSchema):
 class ShowClnsIsNeighborsDetailSchema(MetaParser):
     """Schema for show clns is-neighbors detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'tag': {
             Any(): {
                 Optional('system_id'): {
@@ -742,7 +743,7 @@ class ShowClnsIsNeighborsDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowClnsIsNeighborsDetail(ShowClnsIsNeighborsDetailSchema):
     """Parser for show clns is-neighbors detail"""
@@ -872,7 +873,7 @@ class ShowClnsIsNeighborsDetail(ShowClnsIsNeighborsDetailSchema):
 class ShowClnsTrafficSchema(MetaParser):
     """Schema for show clns traffic"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'clns': {
             'last_clear': str,
             'output': int,
@@ -991,7 +992,7 @@ class ShowClnsTrafficSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowClnsTraffic(ShowClnsTrafficSchema):
     """Parser for show clns traffic"""
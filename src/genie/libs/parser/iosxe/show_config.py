@@ -8,6 +8,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                             Optional, \
                                             Any
@@ -20,7 +21,7 @@ class ShowConfigurationLockSchema(MetaParser):
     Schema for show configuration lock
     """
     
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('config_session_lock'): {
             Optional('owner_pid'): {
                 Any(): {
@@ -52,7 +53,7 @@ class ShowConfigurationLockSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowConfigurationLock(ShowConfigurationLockSchema):
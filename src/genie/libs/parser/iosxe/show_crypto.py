@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # Genie Libs
@@ -20,7 +21,7 @@ from genie.libs.parser.utils.common import Common
 # =================================================
 class ShowCryptoPkiCertificatesSchema(MetaParser):
     """Schema for show crypto pki certificates <WORD>"""
-    schema = {
+    schema = LazySchema(lambda: {
         'trustpoints':
             {Any():
                 {'associated_trustpoints':
@@ -49,7 +50,7 @@ class ShowCryptoPkiCertificatesSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =================================================
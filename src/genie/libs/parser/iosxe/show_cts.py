@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Optional, Any
 
 # ===================================
@@ -10,7 +11,7 @@ from genie.metaparser.util.schemaengine import Optional, Any
 class ShowCtsSxpConnectionsBriefSchema(MetaParser):
     """Schema for show cts sxp connections brief."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "sxp_connections": {
             "total_sxp_connections": int,
             "status": {
@@ -34,7 +35,7 @@ class ShowCtsSxpConnectionsBriefSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ===================================
@@ -229,7 +230,7 @@ class ShowCtsSxpConnectionsBrief(ShowCtsSxpConnectionsBriefSchema):
 class ShowCtsPacsSchema(MetaParser):
     """Schema for show cts pacs."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "aid": str,
         "pac_info": {
             "aid": str,
@@ -240,7 +241,7 @@ class ShowCtsPacsSchema(MetaParser):
         },
         "pac_opaque": str,
         "refresh_timer": str,
-    }
+    })
 
 
 # ==================
@@ -376,7 +377,7 @@ class ShowCtsPacs(ShowCtsPacsSchema):
 class ShowCtsRoleBasedCountersSchema(MetaParser):
     """Schema for show cts role-based counters."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "cts_rb_count": {
             int: {
                 "src_group": str,
@@ -389,7 +390,7 @@ class ShowCtsRoleBasedCountersSchema(MetaParser):
                 "hw_monitor_count": int
             }
         }
-    }
+    })
 
 
 # =================================
@@ -468,7 +469,7 @@ class ShowCtsRoleBasedCounters(ShowCtsRoleBasedCountersSchema):
 class ShowCtsSchema(MetaParser):
     """Schema for show cts."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional("dot1x_feature"): str,
         "cts_device_identity": str,
         Optional("cts_sgt_caching"): str,
@@ -567,7 +568,7 @@ class ShowCtsSchema(MetaParser):
             Optional("number_trusted_links"): int,
             Optional("number_untrusted_links"): int
         }
-    }
+    })
 
 
 # =============
@@ -1327,7 +1328,7 @@ class ShowCts(ShowCtsSchema):
 class ShowCtsEnvironmentDataSchema(MetaParser):
     """Schema for show cts environment-data."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "cts_env": {
             "current_state": str,
             "last_status": str,
@@ -1365,7 +1366,7 @@ class ShowCtsEnvironmentDataSchema(MetaParser):
           Optional("retry_timer_status"): str,
           Optional("cache_data_status"): str
         }
-    }
+    })
 
 
 # ==============================
@@ -1634,7 +1635,7 @@ class ShowCtsEnvironmentData(ShowCtsEnvironmentDataSchema):
 class ShowCtsRbaclSchema(MetaParser):
     """Schema for show cts rbacl."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "cts_rbacl": {
             "ip_ver_support": str,
             "name": {
@@ -1654,7 +1655,7 @@ class ShowCtsRbaclSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ======================
@@ -1803,7 +1804,7 @@ class ShowCtsRbacl(ShowCtsRbaclSchema):
 class ShowCtsRoleBasedPermissionsSchema(MetaParser):
     """Schema for show cts role-based permissions."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "indexes": {
             int: {
                 Optional("policy_name"): str,
@@ -1819,7 +1820,7 @@ class ShowCtsRoleBasedPermissionsSchema(MetaParser):
             "monitor_dynamic": bool,
             "monitor_configured": bool
         }
-    }
+    })
 
 
 
@@ -1955,7 +1956,7 @@ class ShowCtsRoleBasedPermissions(ShowCtsRoleBasedPermissionsSchema):
 class ShowCtsWirelessProfilePolicySchema(MetaParser):
     """Schema for show cts wireless profile policy {policy}."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "policy_name": {
             str: {
                 "role_based_enforcement": str,
@@ -1963,7 +1964,7 @@ class ShowCtsWirelessProfilePolicySchema(MetaParser):
                 "default_sgt": str
             }
         }
-    }
+    })
 
 
 # =====================================
@@ -2059,7 +2060,7 @@ class ShowCtsWirelessProfilePolicy(ShowCtsWirelessProfilePolicySchema):
 class ShowCtsApSgtInfoSchema(MetaParser):
     """Schema for show cts ap sgt info {ap_name}."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "ap": {
             Any(): {
                 "number_of_sgts_referred_by_the_ap": int,
@@ -2071,7 +2072,7 @@ class ShowCtsApSgtInfoSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =========================
@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -11,7 +12,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowDeviceTrackingDatabaseSchema(MetaParser):
     """Schema for show device-tracking database."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "binding_table_count": int,
         "dynamic_entry_count": int,
         "binding_table_limit": int,
@@ -27,7 +28,7 @@ class ShowDeviceTrackingDatabaseSchema(MetaParser):
                 "state": str
             }
         }
-    }   
+    })   
 
 
 # ==================================
@@ -170,7 +171,7 @@ class ShowDeviceTrackingDatabase(ShowDeviceTrackingDatabaseSchema):
 class ShowDeviceTrackingDatabaseInterfaceSchema(MetaParser):
     """Schema for show device-tracking database interface {interface}."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "binding_table": {"dynamic": int, "entries": int, "limit": int},
         "network_layer_address": {
             Any(): {
@@ -184,7 +185,7 @@ class ShowDeviceTrackingDatabaseInterfaceSchema(MetaParser):
                 "vlan": int,
             }
         },
-    }
+    })
 
 
 # ======================================
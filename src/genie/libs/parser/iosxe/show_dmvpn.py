@@ -6,6 +6,7 @@
 # Metaparser
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 
 
@@ -22,7 +23,7 @@ class ShowDmvpnSchema(MetaParser):
     """
 
     # These are the key-value pairs to add to the parsed dictionary
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'nhrp_peers': int,
@@ -47,7 +48,7 @@ class ShowDmvpnSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # Python (this imports the Python re module for RegEx)
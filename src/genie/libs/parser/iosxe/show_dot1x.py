@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -26,7 +27,7 @@ from genie.libs.parser.utils.common import Common
 # ====================================
 class ShowDot1xAllDetailSchema(MetaParser):
     """Schema for show dot1x all details"""
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('system_auth_control'): bool,
         Optional('version'): int,
         Optional('interfaces'): {
@@ -77,7 +78,7 @@ class ShowDot1xAllDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowDot1xAllDetail(ShowDot1xAllDetailSchema):
@@ -258,10 +259,10 @@ class ShowDot1xAllDetail(ShowDot1xAllDetailSchema):
 # ====================================
 class ShowDot1xSchema(MetaParser):
     """Schema for show dot1x"""
-    schema = {
+    schema = LazySchema(lambda: {
         'system_auth_control': bool,
         'version': int,
-    }
+    })
 
 class ShowDot1x(ShowDot1xAllDetail, ShowDot1xSchema):
     """Parser for show dot1x"""
@@ -274,7 +275,7 @@ class ShowDot1x(ShowDot1xAllDetail, ShowDot1xSchema):
 # ======================================
 class ShowDot1xAllStatisticsSchema(MetaParser):
     """Schema for show dot1x all statistics"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'interface': str,
@@ -298,7 +299,7 @@ class ShowDot1xAllStatisticsSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 class ShowDot1xAllStatistics(ShowDot1xAllStatisticsSchema):
@@ -360,7 +361,7 @@ class ShowDot1xAllStatistics(ShowDot1xAllStatisticsSchema):
 # ======================================
 class ShowDot1xAllSummarySchema(MetaParser):
     """Schema for show dot1x all summary"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'interface': str,
@@ -373,7 +374,7 @@ class ShowDot1xAllSummarySchema(MetaParser):
                }
             }
         }   
-    }
+    })
 
 
 class ShowDot1xAllSummary(ShowDot1xAllSummarySchema):
@@ -441,13 +442,13 @@ class ShowDot1xAllSummary(ShowDot1xAllSummarySchema):
 # ======================================
 class ShowDot1xAllCountSchema(MetaParser):
     """Schema for show dot1x all count"""
-    schema = {
+    schema = LazySchema(lambda: {
         'sessions': {
             'authorized_clients': int,
             'unauthorized_clients': int,
             'total': int,
         },  
-    }
+    })
 
 
 class ShowDot1xAllCount(ShowDot1xAllCountSchema):
@@ -15,6 +15,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # Libs
@@ -29,7 +30,7 @@ class ShowEigrpNeighborsSchema(MetaParser):
         * 'show ipv6 eigrp vrf <vrf> neighbors'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'eigrp_instance': {
             Any(): {
                 'vrf': {
@@ -57,7 +58,7 @@ class ShowEigrpNeighborsSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 
 # ====================================
@@ -327,7 +328,7 @@ class ShowIpEigrpNeighborsDetailSchema(MetaParser):
         * 'show ipv6 eigrp neighbors detail'        
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'eigrp_instance': {
             Any(): {
                 'vrf': {
@@ -365,7 +366,7 @@ class ShowIpEigrpNeighborsDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===========================================
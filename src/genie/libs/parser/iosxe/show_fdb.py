@@ -10,6 +10,9 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+                                                    CompiledMetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -22,9 +25,9 @@ from genie.metaparser.util.schemaengine import Schema, \
 from genie.libs.parser.utils.common import Common
 
 
-class ShowMacAddressTableSchema(MetaParser):
+class ShowMacAddressTableSchema(CompiledMetaParser):
     """Schema for show mac address-table"""
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         'mac_table': {
             'vlans': {
                 Any(): {
@@ -52,7 +55,7 @@ class ShowMacAddressTableSchema(MetaParser):
             }
         },
         Optional('total_mac_addresses'): int,
-    }
+    }))
 
 class ShowMacAddressTable(ShowMacAddressTableSchema):
     """Parser for show mac address-table"""
@@ -258,7 +261,7 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
     """Schema for show mac address-table aging-time"""
-    schema = {
+    schema = LazySchema(lambda: {
         'mac_aging_time': int,
         Optional('vlans'): {
             Any(): {
@@ -266,7 +269,7 @@ class ShowMacAddressTableAgingTimeSchema(MetaParser):
                 'vlan': Or(int, str)
             }
         }
-    }
+    })
 
 class ShowMacAddressTableAgingTime(ShowMacAddressTableAgingTimeSchema):
     """Parser for show mac address-table aging-time"""
@@ -316,14 +319,14 @@ class ShowMacAddressTableAgingTime(ShowMacAddressTableAgingTimeSchema):
 
 class ShowMacAddressTableLearningSchema(MetaParser):
     """Schema for show mac address-table learning"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vlans': {
             Any(): {
                 'mac_learning': bool,
                 'vlan': Or(int, str)
             }
         }
-    }
+    })
 
 class ShowMacAddressTableLearning(ShowMacAddressTableLearningSchema):
     """Parser for show mac address-table learning"""
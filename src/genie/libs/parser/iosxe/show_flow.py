@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, Default, Use
 
 # Common
@@ -22,7 +23,7 @@ from genie.libs.parser.utils.common import Common
 class ShowFlowMonitorSchema(MetaParser):
     ''' Schema for "show flow monitor {name} cache format table" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'cache_type': str,
         'cache_size': int,
         'current_entries': int,
@@ -47,7 +48,7 @@ class ShowFlowMonitorSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # =========================================================
 # Parser for 'show flow monitor {name} cache format table'
@@ -176,7 +177,7 @@ class ShowFlowMonitorCacheSchema(MetaParser):
         "show flow monitor {name} cache format record"
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'cache_type': str,
         'cache_size': int,
         'current_entries': int,
@@ -202,7 +203,7 @@ class ShowFlowMonitorCacheSchema(MetaParser):
                 'pkts': int,
             },
         },
-    }
+    })
 
 # =========================================================
 # Parser for 'show flow monitor {name} cache'
@@ -413,7 +414,7 @@ class ShowFlowExporterStatisticsSchema(MetaParser):
             * show flow exporter statistics
             * show flow exporter {exporter} statistics
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'flow_exporter': {
             Any(): {
                 'pkt_send_stats': {
@@ -436,7 +437,7 @@ class ShowFlowExporterStatisticsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowFlowExporterStatistics(ShowFlowExporterStatisticsSchema):
@@ -6,6 +6,7 @@ IOSXE parsers for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 # from genie.metaparser.util.schemaengine import Any, Optional
 
 # parser utils
@@ -19,7 +20,7 @@ from genie.metaparser import MetaParser
 class ShowHwModuleStatusSchema(MetaParser):
     """Schema for show hw module subslot {subslot} transceiver {transceiver} status."""
 
-    schema = {
+    schema = LazySchema(lambda: {
     "transceiver_status": {
         "slot_id": int,
         "subslot": int,
@@ -30,7 +31,7 @@ class ShowHwModuleStatusSchema(MetaParser):
         "tx_power_dBm": float,
         "optical_power_dBm": float
     }
-}
+})
 
 
 # ==========================
@@ -16,6 +16,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -30,7 +31,7 @@ class ShowIpIgmpInterfaceSchema(MetaParser):
     Schema for 'show ip igmp vrf <WORD> interface'
     """
 
-    schema = {'vrf':
+    schema = LazySchema(lambda: {'vrf':
                 {Any(): {
                     Optional('global_max_groups'): int,
                     Optional('global_active_groups'): int,
@@ -75,7 +76,7 @@ class ShowIpIgmpInterfaceSchema(MetaParser):
                     }
                 }
             },
-        }
+        })
 
 class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
     """
@@ -353,7 +354,7 @@ class ShowIpIgmpGroupsDetailSchema(MetaParser):
     Schema for 'show ip igmp vrf <WORD> groups detail'
     """
 
-    schema = {'vrf':
+    schema = LazySchema(lambda: {'vrf':
                 {Any(): {
                     'interface': {
                         Any(): {
@@ -407,7 +408,7 @@ class ShowIpIgmpGroupsDetailSchema(MetaParser):
                     }
                 },
             }
-        }
+        })
 
 class ShowIpIgmpGroupsDetail(ShowIpIgmpGroupsDetailSchema):
     """
@@ -635,7 +636,7 @@ class ShowIpIgmpSsmMappingSchema(MetaParser):
     Schema for 'show ip igmp vrf <WORD> ssm-mapping <WORD>'
     """
 
-    schema = {'vrf':
+    schema = LazySchema(lambda: {'vrf':
                 {Any(): {
                     'ssm_map': {
                         Any(): {
@@ -646,7 +647,7 @@ class ShowIpIgmpSsmMappingSchema(MetaParser):
                     }
                 },
             }
-        }
+        })
 
 class ShowIpIgmpSsmMapping(ShowIpIgmpSsmMappingSchema):
     """
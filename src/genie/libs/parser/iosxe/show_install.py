@@ -9,6 +9,7 @@ import random
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import (Schema,
                                                 Any,
                                                 Optional)
@@ -19,7 +20,7 @@ from genie.libs.parser.utils.common import Common
 
 class ShowInstallSummarySchema(MetaParser):
     """Schema for show install summary"""
-    schema = {
+    schema = LazySchema(lambda: {
         'location': {
             Any(): {
                 'pkg_state': {
@@ -33,7 +34,7 @@ class ShowInstallSummarySchema(MetaParser):
                 Optional('time_before_rollback'): str,
             },
         },
-    }
+    })
 
 class ShowInstallSummary(ShowInstallSummarySchema):
     """Parser for show install summary"""
@@ -25,6 +25,7 @@ from collections import defaultdict
 
 from pyats.log.utils import banner
 import xmltodict
+from genie.libs.parser.base import LazySchema
 try:
     import iptools
     from cnetconf import testmodel
@@ -55,7 +56,7 @@ class ShowInterfacesSchema(MetaParser):
     """schema for show interfaces
                   show interfaces <interface>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
             Any(): {
                 'oper_status': str,
                 Optional('line_protocol'): str,
@@ -190,7 +191,7 @@ class ShowInterfacesSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowInterfaces(ShowInterfacesSchema):
@@ -1184,7 +1185,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 # ----------------------
 class ShowIpInterfaceBriefSchema(MetaParser):
     """Parser for show ip interface brief"""
-    schema = {'interface':
+    schema = LazySchema(lambda: {'interface':
                 {Any():
                     {Optional('vlan_id'):
                         {Optional(Any()):
@@ -1200,7 +1201,7 @@ class ShowIpInterfaceBriefSchema(MetaParser):
                      Optional('status'): str,
                      Optional('protocol'): str}
                 },
-            }
+            })
 
 
 class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
@@ -1379,7 +1380,7 @@ class ShowIpInterfaceBriefPipeVlan(ShowIpInterfaceBrief):
 
 class ShowIpInterfaceBriefPipeIpSchema(MetaParser):
     """Schema for show ip interface brief | include <WORD>"""
-    schema = {'interface':
+    schema = LazySchema(lambda: {'interface':
                 {Any():
                     {Optional('ip_address'): str,
                     Optional('interface_ok'): str,
@@ -1387,7 +1388,7 @@ class ShowIpInterfaceBriefPipeIpSchema(MetaParser):
                     Optional('interface_status'): str,
                     Optional('protocol_status'): str}
                 },
-            }
+            })
 
 
 class ShowIpInterfaceBriefPipeIp(ShowIpInterfaceBriefPipeIpSchema):
@@ -1445,7 +1446,7 @@ class ShowIpInterfaceBriefPipeIp(ShowIpInterfaceBriefPipeIpSchema):
 
 class ShowInterfacesSwitchportSchema(MetaParser):
     """Schema for show interfaces switchport"""
-    schema = {
+    schema = LazySchema(lambda: {
                 Any(): {
                     'switchport_enable': bool,
                     'switchport_mode': str,
@@ -1487,7 +1488,7 @@ class ShowInterfacesSwitchportSchema(MetaParser):
                     Optional('unknown_multicast_blocked'): bool,
                     Optional('appliance_trust'): str,
                 },
-            }
+            })
 
 
 class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
@@ -1873,7 +1874,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 class ShowIpInterfaceSchema(MetaParser):
     """Schema for show ip interface
                   show ip interface <interface>"""
-    schema = {
+    schema = LazySchema(lambda: {
                 Any(): {
                     'enabled': bool,
                     'oper_status': str,
@@ -1935,7 +1936,7 @@ class ShowIpInterfaceSchema(MetaParser):
                     Optional('input_features'): list,
                     Optional('multicast_groups'): list,
                 },
-            }
+            })
 
 
 class ShowIpInterface(ShowIpInterfaceSchema):
@@ -2567,7 +2568,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
 class ShowIpv6InterfaceSchema(MetaParser):
     """Schema for show ipv6 interface"""
-    schema = {
+    schema = LazySchema(lambda: {
                 Any(): {
                     'oper_status': str,
                     'enabled': bool,
@@ -2616,7 +2617,7 @@ class ShowIpv6InterfaceSchema(MetaParser):
                     Optional('addresses_config_method'): str,
                     Optional('joined_group_addresses'): list,
                 },
-            }
+            })
 
 
 class ShowIpv6Interface(ShowIpv6InterfaceSchema):
@@ -3012,7 +3013,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
 
 class ShowInterfacesTrunkSchema(MetaParser):
     """Schema for show interfaces trunk"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             Any(): {
                 'name': str,
@@ -3025,7 +3026,7 @@ class ShowInterfacesTrunkSchema(MetaParser):
                 'vlans_in_stp_forwarding_not_pruned': str
             }
         }
-    }
+    })
 
 
 class ShowInterfacesTrunk(ShowInterfacesTrunkSchema):
@@ -3094,7 +3095,7 @@ class ShowInterfacesTrunk(ShowInterfacesTrunkSchema):
 
 class ShowInterfacesCountersSchema(MetaParser):
     """Schema for show interfaces <WORD> counters"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             Any(): {
                 Any(): {  # in or out
@@ -3106,7 +3107,7 @@ class ShowInterfacesCountersSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 
 class ShowInterfacesCounters(ShowInterfacesCountersSchema):
@@ -3155,7 +3156,7 @@ class ShowInterfacesCounters(ShowInterfacesCountersSchema):
 
 class ShowInterfacesAccountingSchema(MetaParser):
     """Schema for show interfaces accounting"""
-    schema = {
+    schema = LazySchema(lambda: {
                 Any(): {
                     Optional('description'): str,
                     'accounting': {
@@ -3167,7 +3168,7 @@ class ShowInterfacesAccountingSchema(MetaParser):
                         }
                     }
                 }
-            }
+            })
 
 
 class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
@@ -3250,7 +3251,7 @@ class ShowInterfacesStatsSchema(MetaParser):
         show interfaces <interface> stats
         show interfaces stats"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'switching_path': {
                 Any(): {
@@ -3261,7 +3262,7 @@ class ShowInterfacesStatsSchema(MetaParser):
                 },
             }
         },
-    }
+    })
 
 
 # ====================================================
@@ -3323,7 +3324,7 @@ class ShowInterfacesDescriptionSchema(MetaParser):
     """schema for show interfaces description
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'status': str,
@@ -3331,7 +3332,7 @@ class ShowInterfacesDescriptionSchema(MetaParser):
                 Optional('description'): str
             }
         }
-    }
+    })
 
 
 class ShowInterfacesDescription(ShowInterfacesDescriptionSchema):
@@ -3387,7 +3388,7 @@ class ShowInterfacesStatusSchema(MetaParser):
     """Schema for:
         show interfaces status"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 Optional('name'): str,
@@ -3398,7 +3399,7 @@ class ShowInterfacesStatusSchema(MetaParser):
                 Optional('type'): str,
             }
         }
-    }
+    })
 
 
 # ====================================================
@@ -3467,7 +3468,7 @@ class ShowInterfaceTransceiverDetailSchema(MetaParser):
     """Schema for:
         show interface {interface} transceiver detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {# interface name
                 Optional('cisco_extended_id_number'): str,
@@ -3486,7 +3487,7 @@ class ShowInterfaceTransceiverDetailSchema(MetaParser):
                 Any(): str,
             }
         }
-    }
+    })
 
 
 class ShowInterfaceTransceiverDetail(ShowInterfaceTransceiverDetailSchema):
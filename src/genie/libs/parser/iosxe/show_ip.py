@@ -12,6 +12,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # parser utils
@@ -26,7 +27,7 @@ class ShowIPAliasSchema(MetaParser):
 	show ip aliases
 	show ip aliases vrf {vrf}
 	'''
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'index': {
@@ -38,7 +39,7 @@ class ShowIPAliasSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ==============================
 # Parser for 'show ip aliases', 'show ip aliases vrf {vrf}'
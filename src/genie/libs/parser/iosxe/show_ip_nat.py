@@ -11,6 +11,7 @@ import random
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import (Schema,
                                                 Any,
                                                 Optional,
@@ -31,7 +32,7 @@ class ShowIpNatTranslationsSchema(MetaParser):
             * show ip nat translations vrf {vrf} verbose
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {  # name of vrf
                 'index': {  
@@ -58,7 +59,7 @@ class ShowIpNatTranslationsSchema(MetaParser):
             },
             Optional('number_of_translations'): int
         }
-    }
+    })
 
 
 class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
@@ -314,7 +315,7 @@ class ShowIpNatStatisticsSchema(MetaParser):
             * show ip nat statistics
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'active_translations': {
             'total': int,
             'static': int,
@@ -379,7 +380,7 @@ class ShowIpNatStatisticsSchema(MetaParser):
         Optional('total_doors'): int,
         Optional('appl_doors'): int,
         Optional('normal_doors'): int,
-    }
+    })
     
 
 class ShowIpNatStatistics(ShowIpNatStatisticsSchema):
@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -25,13 +26,13 @@ class ShowIpVrfSchema(MetaParser):
         * 'show ip vrf'
         * 'show ip vrf <vrf>'"""
 
-    schema = {'vrf':
+    schema = LazySchema(lambda: {'vrf':
                 {Any():
                     {Optional('route_distinguisher'): str,
                      'interfaces': list,
                     }
                 },
-            }
+            })
 
 
 class ShowIpVrf(ShowIpVrfSchema):
@@ -15,6 +15,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 from genie.libs.parser.utils.common import Common
@@ -33,7 +34,7 @@ class ShowIpv6NeighborsSchema(MetaParser):
                   'show ipv6 neighbors vrf <vrf>'
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             Any(): {
                 'interface': str,
@@ -48,7 +49,7 @@ class ShowIpv6NeighborsSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIpv6Neighbors(ShowIpv6NeighborsSchema):
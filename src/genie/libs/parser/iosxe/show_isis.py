@@ -14,13 +14,14 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.utils.common import Common
 
 
 class ShowIsisNeighborsSchema(MetaParser):
     """Schema for show isis neighbors"""
-    schema = {
+    schema = LazySchema(lambda: {
         'isis': {
             Any(): {
                 Optional('neighbors'): {
@@ -41,7 +42,7 @@ class ShowIsisNeighborsSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 class ShowIsisNeighbors(ShowIsisNeighborsSchema):
     """Parser for show isis neighbors"""
@@ -100,7 +101,7 @@ class ShowIsisNeighbors(ShowIsisNeighborsSchema):
 class ShowIsisHostnameSchema(MetaParser):
     """Schema for show isis hostname"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'tag': {
             Any(): {
                 Optional('hostname_db'): {
@@ -114,7 +115,7 @@ class ShowIsisHostnameSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 class ShowIsisHostname(ShowIsisHostnameSchema):
     """Parser for show isis hostname"""
@@ -171,7 +172,7 @@ class ShowIsisHostname(ShowIsisHostnameSchema):
 class ShowIsisLspLogSchema(MetaParser):
     """Schema for show isis lsp-log"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'tag': {
             Any(): {
                 'lsp_log': {
@@ -190,7 +191,7 @@ class ShowIsisLspLogSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 class ShowIsisLspLog(ShowIsisLspLogSchema):
     """Parser for show isis lsp-log"""
@@ -263,7 +264,7 @@ class ShowIsisLspLog(ShowIsisLspLogSchema):
 class ShowIsisDatabaseDetailSchema(MetaParser):
     """Schema for show isis database detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'tag': {
             Any(): {
                 'level': {
@@ -339,7 +340,7 @@ class ShowIsisDatabaseDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
     """Parser for show isis database detail"""
@@ -536,7 +537,7 @@ class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
 class ShowRunSectionIsisSchema(MetaParser):
     """Schema for show run | sec isis"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance':{
             Any(): {
                 'vrf': {
@@ -544,7 +545,7 @@ class ShowRunSectionIsisSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowRunSectionIsis(ShowRunSectionIsisSchema):
     """Parser for show run | sec isis"""
@@ -19,6 +19,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -38,7 +39,7 @@ class ShowBridgeDomainSchema(MetaParser):
                   show bridge-domain <BD_ID>
                   show bridge-domain | count <WORD>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('lines_match_regexp'): int,
         Optional('bridge_domain'): {
             Any(): {
@@ -70,7 +71,7 @@ class ShowBridgeDomainSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowBridgeDomain(ShowBridgeDomainSchema):
@@ -238,7 +239,7 @@ class ShowEthernetServiceInstanceDetailSchema(MetaParser):
                   show ethernet service instance interface <interface> detail
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'service_instance': {
             Any(): {
                 'interfaces': {
@@ -274,7 +275,7 @@ class ShowEthernetServiceInstanceDetailSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 class ShowEthernetServiceInstanceDetail(ShowEthernetServiceInstanceDetailSchema):
     """Parser for show ethernet service instance detail
@@ -585,7 +586,7 @@ class ShowEthernetServiceInstanceStatsSchema(MetaParser):
                   show ethernet service instance interface <interface> stats
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('max_num_of_service_instances'): int,
         Optional('service_instance'): {
             Any(): {
@@ -607,7 +608,7 @@ class ShowEthernetServiceInstanceStatsSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowEthernetServiceInstanceStats(ShowEthernetServiceInstanceStatsSchema):
@@ -704,7 +705,7 @@ class ShowEthernetServiceInstanceSummarySchema(MetaParser):
     """Schema for show ethernet service instance summary
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             Any(): {
                 'total': int,
@@ -717,7 +718,7 @@ class ShowEthernetServiceInstanceSummarySchema(MetaParser):
                 'bd_adm_do': int,
             },
         },
-    }
+    })
 
 
 class ShowEthernetServiceInstanceSummary(ShowEthernetServiceInstanceSummarySchema):
@@ -787,7 +788,7 @@ class ShowL2vpnVfiSchema(MetaParser):
     """Schema for show l2vpn vfi
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vfi': {
             Any(): {
                 'bd_vfi_name': str,
@@ -828,7 +829,7 @@ class ShowL2vpnVfiSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowL2vpnVfi(ShowL2vpnVfiSchema):
@@ -1027,7 +1028,7 @@ class ShowL2vpnServiceAllSchema(MetaParser):
     """Schema for show l2vpn service all
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vpls_name': {
             Any(): {
                 'state': str,
@@ -1042,7 +1043,7 @@ class ShowL2vpnServiceAllSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowL2vpnServiceAll(ShowL2vpnServiceAllSchema):
@@ -23,6 +23,7 @@ import random
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -42,10 +43,10 @@ class ShowLacpSysIdSchema(MetaParser):
     """Schema for:
         show lacp sys-id"""
 
-    schema = {
+    schema = LazySchema(lambda: {
             'system_id_mac': str,
             'system_priority': int,
-            }
+            })
 
 class ShowLacpSysId(ShowLacpSysIdSchema):
     """Parser for :
@@ -87,7 +88,7 @@ class ShowLacpCountersSchema(MetaParser):
     """Schema for:
         show lacp counters"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'name': str,
@@ -109,7 +110,7 @@ class ShowLacpCountersSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 # ====================================================
 #  parser for show lacp counters
@@ -196,7 +197,7 @@ class ShowLacpInternalSchema(MetaParser):
     """Schema for:
         show lacp internal"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'name': str,
@@ -218,7 +219,7 @@ class ShowLacpInternalSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 # ====================================================
 #  parser for show lacp internal
@@ -306,7 +307,7 @@ class ShowLacpNeighborSchema(MetaParser):
     """Schema for:
         show lacp neighbor"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'name': str,
@@ -327,7 +328,7 @@ class ShowLacpNeighborSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 # ====================================================
 #  parser for show lacp neighbor
@@ -410,7 +411,7 @@ class ShowPagpCountersSchema(MetaParser):
     """Schema for:
         show pagp counters"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'name': str,
@@ -429,7 +430,7 @@ class ShowPagpCountersSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 # ====================================================
 #  parser for show pagp counters
@@ -498,7 +499,7 @@ class ShowPagpNeighborSchema(MetaParser):
     """Schema for:
         show pagp neighbor"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'name': str,
@@ -517,7 +518,7 @@ class ShowPagpNeighborSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 # ====================================================
 #  parser for show pagp neighbor
@@ -592,7 +593,7 @@ class ShowPagpInternalSchema(MetaParser):
     """Schema for:
         show pagp internal"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'name': str,
@@ -612,7 +613,7 @@ class ShowPagpInternalSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 # ====================================================
 #  parser for show pagp internal
@@ -694,7 +695,7 @@ class ShowEtherchannelSummarySchema(MetaParser):
     """Schema for:
         show etherchannel summary"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('number_of_lag_in_use'): int,
         Optional('number_of_aggregators'): int,
         Optional('interfaces'): {
@@ -722,7 +723,7 @@ class ShowEtherchannelSummarySchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 # ====================================================
 #  parser for show etherchannel summary
@@ -890,7 +891,7 @@ class ShowEtherChannelLoadBalancingSchema(MetaParser):
     """Schema for:
         show etherchannel load-balancing"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'global_lb_method': str,
         Optional('lb_algo_type'): str,
         Optional('port_channel'): {
@@ -898,7 +899,7 @@ class ShowEtherChannelLoadBalancingSchema(MetaParser):
                 'lb_method': str,
             },
         },
-    }
+    })
 
 
 # ====================================================
@@ -960,7 +961,7 @@ class ShowLacpNeighborDetailSchema(MetaParser):
     """Schema for:
         show lacp neighbor detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'name': str,
@@ -987,7 +988,7 @@ class ShowLacpNeighborDetailSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 
 # ====================================================
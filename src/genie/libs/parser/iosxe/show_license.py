@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # parser utils
@@ -24,7 +25,7 @@ from genie.libs.parser.utils.common import Common
 class ShowLicenseSchema(MetaParser):
     """Schema for show license."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'licenses': {
             int: {
                 'feature': str,
@@ -40,7 +41,7 @@ class ShowLicenseSchema(MetaParser):
 
             }
         }
-    }
+    })
 
 
 
@@ -126,12 +127,12 @@ class ShowLicense(ShowLicenseSchema):
 # ----------------------
 class ShowLicenseUdiSchema(MetaParser):
     """Schema for show license udi"""
-    schema = {
+    schema = LazySchema(lambda: {
             'slotid': str,
             'pid': str,
             'sn': str,
             'udi': str
-            }
+            })
 
 class ShowLicenseUdi(ShowLicenseUdiSchema):
     """Parser for show license udi"""
@@ -42,6 +42,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -53,7 +54,7 @@ class ShowLispSessionSchema(MetaParser):
 
     ''' Schema for "show lisp session" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'sessions':
@@ -71,7 +72,7 @@ class ShowLispSessionSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==============================
@@ -141,7 +142,7 @@ class ShowLispPlatformSchema(MetaParser):
 
     ''' Schema for "show lisp platform" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'parallel_lisp_instance_limit': int,
         'rloc_forwarding_support':
             {'local':
@@ -157,7 +158,7 @@ class ShowLispPlatformSchema(MetaParser):
             },
         'latest_supported_config_style': str,
         'current_config_style': str,
-        }
+        })
 
 
 # ==============================
@@ -259,7 +260,7 @@ class ShowLispExtranetSchema(MetaParser):
 
     ''' Schema for "show lisp all extranet <extranet> instance-id <instance_id>"'''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {Optional('service'):
@@ -294,7 +295,7 @@ class ShowLispExtranetSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ========================================================================
@@ -404,7 +405,7 @@ class ShowLispDynamicEidDetailSchema(MetaParser):
 
     ''' Schema for "show lisp all instance-id <instance_id> dynamic-eid detail" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {Optional('service'):
@@ -458,7 +459,7 @@ class ShowLispDynamicEidDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =======================================================================
@@ -662,7 +663,7 @@ class ShowLispServiceSchema(MetaParser):
 
     '''Schema for "show lisp all instance-id <instance_id> <service>" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {'lisp_router_instance_id': int,
@@ -781,7 +782,7 @@ class ShowLispServiceSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==============================================================
@@ -1454,7 +1455,7 @@ class ShowLispServiceMapCacheSchema(MetaParser):
 
     '''Schema for "show lisp all instance-id <instance_id> <service> map-cache" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {'lisp_router_instance_id': int,
@@ -1530,7 +1531,7 @@ class ShowLispServiceMapCacheSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ========================================================================
@@ -1718,7 +1719,7 @@ class ShowLispServiceRlocMembersSchema(MetaParser):
 
     '''Schema for "show lisp all instance-id <instance_id> <service> rloc members" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {'lisp_router_instance_id': int,
@@ -1743,7 +1744,7 @@ class ShowLispServiceRlocMembersSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===========================================================================
@@ -1845,7 +1846,7 @@ class ShowLispServiceSmrSchema(MetaParser):
 
     '''Schema for "show lisp all instance-id <instance_id> <service> smr" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {'lisp_router_instance_id': int,
@@ -1868,7 +1869,7 @@ class ShowLispServiceSmrSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==================================================================
@@ -1967,7 +1968,7 @@ class ShowLispServiceSummarySchema(MetaParser):
 
     '''Schema for "show lisp all <service> summary" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {'lisp_router_instance_id': int,
@@ -2006,7 +2007,7 @@ class ShowLispServiceSummarySchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ====================================================
@@ -2199,7 +2200,7 @@ class ShowLispServiceDatabaseSchema(MetaParser):
 
     '''Schema for "show lisp all instance-id <instance_id> <service> dabatase" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {'lisp_router_instance_id': int,
@@ -2255,7 +2256,7 @@ class ShowLispServiceDatabaseSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =======================================================================
@@ -2404,7 +2405,7 @@ class ShowLispServiceServerSummarySchema(MetaParser):
 
     '''Schema for "show lisp all instance-id <instance_id> <service> server summary" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {'lisp_router_instance_id': int,
@@ -2442,7 +2443,7 @@ class ShowLispServiceServerSummarySchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =============================================================================
@@ -2605,7 +2606,7 @@ class ShowLispServiceServerDetailInternalSchema(MetaParser):
 
     '''Schema for "show lisp all instance-id <instance_id> <service> server detail internal" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {Optional('service'):
@@ -2705,7 +2706,7 @@ class ShowLispServiceServerDetailInternalSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =====================================================================================
@@ -3053,7 +3054,7 @@ class ShowLispServiceStatisticsSchema(MetaParser):
 
     '''Schema for "show lisp all instance-id <instance_id> <service> statistics" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'lisp_router_instances':
             {Any():
                 {'service':
@@ -3078,7 +3079,7 @@ class ShowLispServiceStatisticsSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =========================================================================
@@ -3276,7 +3277,7 @@ class ShowLispServiceStatistics(ShowLispServiceStatisticsSchema):
 class ShowLispSiteSchema(MetaParser):
     """Schema for show lisp site."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "site_names": {
             str: {
                 int: {
@@ -3288,7 +3289,7 @@ class ShowLispSiteSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ===================
@@ -3418,7 +3419,7 @@ class ShowLispSite(ShowLispSiteSchema):
 class ShowLispEidTableVrfIpv4DatabaseSchema(MetaParser):
     """Schema for show lisp eid-table vrf {vrf} ipv4 database."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             "User": {
                 "iid": int,
@@ -3441,7 +3442,7 @@ class ShowLispEidTableVrfIpv4DatabaseSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
     
 # ==========================================
@@ -3541,7 +3542,7 @@ class ShowLispEidTableVrfIpv4Database(ShowLispEidTableVrfIpv4DatabaseSchema):
 class ShowLispEidTableVrfUserIpv4MapCacheSchema(MetaParser):
     """Schema for show lisp eid-table vrf {vrf} ipv4 map-cache."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             str: {
                 "iid": int,
@@ -3565,7 +3566,7 @@ class ShowLispEidTableVrfUserIpv4MapCacheSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ================================================
@@ -3706,7 +3707,7 @@ class ShowLispEidTableVrfUserIpv4MapCache(ShowLispEidTableVrfUserIpv4MapCacheSch
 class ShowLispInstanceIdEthernetServerSchema(MetaParser):
     """Schema for show lisp instance-id {instance_id} ethernet server."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "instance_id": {
             int: {
                 "lisp": int,
@@ -3722,7 +3723,7 @@ class ShowLispInstanceIdEthernetServerSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
     
 # ==========================================
@@ -11,6 +11,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -25,13 +26,13 @@ from genie.libs.parser.utils.common import Common
 
 class ShowLldpSchema(MetaParser):
     """Schema for show lldp"""
-    schema = {
+    schema = LazySchema(lambda: {
         'status': str,
         'enabled': bool,
         'hello_timer': int,
         'hold_timer': int,
         'reinit_timer': int
-    }
+    })
 
 
 class ShowLldp(ShowLldpSchema):
@@ -83,7 +84,7 @@ class ShowLldp(ShowLldpSchema):
 
 class ShowLldpEntrySchema(MetaParser):
     """Schema for show lldp entry [<WORD>|*]"""
-    schema = {
+    schema = LazySchema(lambda: {
         'total_entries': int,
         Optional('interfaces'): {
             Any(): {
@@ -139,7 +140,7 @@ class ShowLldpEntrySchema(MetaParser):
             Optional('wattage'): float,
             'location': str,
         }
-    }
+    })
 
 
 class ShowLldpEntry(ShowLldpEntrySchema):
@@ -522,7 +523,7 @@ class ShowLldpNeighborsDetail(ShowLldpEntry):
 
 class ShowLldpTrafficSchema(MetaParser):
     """Schema for show lldp traffic"""
-    schema = {
+    schema = LazySchema(lambda: {
         "frame_in": int,
         "frame_out": int,
         "frame_error_in": int,
@@ -530,7 +531,7 @@ class ShowLldpTrafficSchema(MetaParser):
         "tlv_discard": int,
         'tlv_unknown': int,
         'entries_aged_out': int
-    }
+    })
 
 
 class ShowLldpTraffic(ShowLldpTrafficSchema):
@@ -587,7 +588,7 @@ class ShowLldpTraffic(ShowLldpTrafficSchema):
 
 class ShowLldpInterfaceSchema(MetaParser):
     """Schema for show lldp interface [<WORD>]"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'tx': str,
@@ -596,7 +597,7 @@ class ShowLldpInterfaceSchema(MetaParser):
                 'rx_state': str,
             },
         }
-    }
+    })
 
 
 class ShowLldpInterface(ShowLldpInterfaceSchema):
@@ -648,7 +649,7 @@ class ShowLldpNeighborsSchema(MetaParser):
     """
     Schema for show lldp neighbors
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'total_entries': int,
         'interfaces': {
             Any(): {
@@ -664,7 +665,7 @@ class ShowLldpNeighborsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowLldpNeighbors(ShowLldpNeighborsSchema):
@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional, Or
 
 
@@ -20,7 +21,7 @@ class ShowLoggingSchema(MetaParser):
         * 'show logging | exclude {exclude}'
     '''
 
-    schema={
+    schema=LazySchema(lambda: {
         Optional('logs'): list,
         Optional('syslog_logging'): {
             Any(): { # enabled
@@ -146,7 +147,7 @@ class ShowLoggingSchema(MetaParser):
             }
         },
         Optional('log_buffer_bytes'): int, # 32000
-        }
+        })
 
 
 class ShowLogging(ShowLoggingSchema):
@@ -160,6 +161,10 @@ class ShowLogging(ShowLoggingSchema):
                    'show logging | include {include}',
                    'show logging']
 
+    # cli() only loops over output.splitlines(), a MappedOutput is parsed
+    # without loading the whole output
+    mapped_output = True
+
     def cli(self, exclude='', include='', output=None):
 
         if output is None:
@@ -20,6 +20,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -37,7 +38,7 @@ class ShowIpMrouteSchema(MetaParser):
         show ipv6 mroute
         show ipv6 mroute vrf <vrf>"""
 
-    schema = {'vrf':         
+    schema = LazySchema(lambda: {'vrf':         
                 {Any():
                     {'address_family':
                         {Any(): 
@@ -76,7 +77,7 @@ class ShowIpMrouteSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 class ShowIpMroute(ShowIpMrouteSchema):
     """Parser for:
@@ -328,7 +329,7 @@ class ShowIpMrouteStaticSchema(MetaParser):
         show ip mroute static
         show ip mroute vrf <vrf> static
     """
-    schema = {'vrf': 
+    schema = LazySchema(lambda: {'vrf': 
                 {Any():
                     {'mroute':
                         {Any():
@@ -342,7 +343,7 @@ class ShowIpMrouteStaticSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 class ShowIpMrouteStatic(ShowIpMrouteStaticSchema):
     """Parser for:
@@ -421,7 +422,7 @@ class ShowIpMulticastSchema(MetaParser):
         show ip multicast
         show ip multicast vrf <vrf>
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'enable': bool,
@@ -432,7 +433,7 @@ class ShowIpMulticastSchema(MetaParser):
                 Optional('mo_frr'): bool,
             },
         },
-    }
+    })
 
 class ShowIpMulticast(ShowIpMulticastSchema):
     """Parser for:
@@ -6,6 +6,7 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -17,7 +18,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 class ShowMemoryStatisticsSchema(MetaParser):
     """Schema for show memory statistics"""
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('tracekey'): str,
         'name': {
             Any(): {
@@ -29,7 +30,7 @@ class ShowMemoryStatisticsSchema(MetaParser):
                 'largest': int,
             }
         }
-    }
+    })
 
 
 class ShowMemoryStatistics(ShowMemoryStatisticsSchema):
@@ -80,7 +81,7 @@ class ShowMemoryDebugLeaksSchema(MetaParser):
         * show memory debug leaks
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'tracekey': str,
         'memory': {
             str: {
@@ -93,7 +94,7 @@ class ShowMemoryDebugLeaksSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowMemoryDebugLeaks(ShowMemoryDebugLeaksSchema):
     '''parser for
@@ -15,6 +15,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -27,7 +28,7 @@ class ShowIpv6MldInterfaceSchema(MetaParser):
     """Schema for:
         show ipv6 mld interface
         show ipv6 mld vrf <vrf> interface"""
-    schema = {'vrf':
+    schema = LazySchema(lambda: {'vrf':
                 {Any(): {
                     Optional('max_groups'): int,
                     Optional('active_groups'): int,
@@ -55,7 +56,7 @@ class ShowIpv6MldInterfaceSchema(MetaParser):
                     }
                 }
             },
-        }
+        })
 
 class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
     """Parser for:
@@ -233,7 +234,7 @@ class ShowIpv6MldGroupsDetailSchema(MetaParser):
         show ipv6 mld groups detail
         show ipv6 mld vrf <vrf> groups detail"""
 
-    schema = {'vrf':
+    schema = LazySchema(lambda: {'vrf':
                 {Any(): {
                     'interface': {
                         Any(): {
@@ -270,7 +271,7 @@ class ShowIpv6MldGroupsDetailSchema(MetaParser):
                     }
                 },
             }
-        }
+        })
 
 class ShowIpv6MldGroupsDetail(ShowIpv6MldGroupsDetailSchema):
     """Parser for:
@@ -438,7 +439,7 @@ class ShowIpv6MldSsmMapSchema(MetaParser):
         show ipv6 mld ssm-map <group_address>
         show ipv6 mld vrf <vrf> ssm-map <group_address>"""
 
-    schema = {'vrf':
+    schema = LazySchema(lambda: {'vrf':
                 {Any(): {
                     'ssm_map': {
                         Any(): {
@@ -450,7 +451,7 @@ class ShowIpv6MldSsmMapSchema(MetaParser):
                     }
                 },
             }
-        }
+        })
 
 class ShowIpv6MldSsmMap(ShowIpv6MldSsmMapSchema):
     """Parser for:
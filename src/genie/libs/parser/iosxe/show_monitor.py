@@ -16,6 +16,7 @@ from netaddr import IPAddress, IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, Default, Use
 
 # import parser utils
@@ -29,7 +30,7 @@ class ShowMonitorSchema(MetaParser):
 
     ''' Schema for "show monitor" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'session':
             {Any():
                  {'type':str,
@@ -55,7 +56,7 @@ class ShowMonitorSchema(MetaParser):
                   Optional('mtu'): int,
                   },
             },
-        }
+        })
 
 
 # =========================================
@@ -282,7 +283,7 @@ class ShowMonitorCaptureSchema(MetaParser):
 
     ''' Schema for "show monitor capture" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'status_information':
             {Any():
                 {'target_type':
@@ -316,7 +317,7 @@ class ShowMonitorCaptureSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
     # =========================================
 # Parser for 'show monitor capture'
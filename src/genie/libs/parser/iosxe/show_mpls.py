@@ -37,6 +37,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                                Any, \
                                                Optional
@@ -45,7 +46,7 @@ from genie.libs.parser.utils.common import Common
 class ShowMplsLdpParametersSchema(MetaParser):
     """Schema for show mpls ldp Parameters"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('ldp_featureset_manager'): {
             Any(): {
                 'ldp_features': list,
@@ -70,7 +71,7 @@ class ShowMplsLdpParametersSchema(MetaParser):
             'interval': int,
         },
         Optional('downstream_on_demand_max_hop_count'): int,
-    }
+    })
 
 class ShowMplsLdpParameters(ShowMplsLdpParametersSchema):
     """Parser for show mpls ldp parameters"""
@@ -224,7 +225,7 @@ class ShowMplsLdpParameters(ShowMplsLdpParametersSchema):
 
 class ShowMplsLdpNsrStatisticsSchema(MetaParser):
     """Schema for show mpls ldp nsr statistics"""
-    schema = {
+    schema = LazySchema(lambda: {
         'statistics': {
             Optional('peer'): {
                 Any(): {
@@ -293,7 +294,7 @@ class ShowMplsLdpNsrStatisticsSchema(MetaParser):
                 Any(): int,
             }
         }
-    }
+    })
 
 class ShowMplsLdpNsrStatistics(ShowMplsLdpNsrStatisticsSchema):
     """Parser for show mpls ldp nsr statistics"""
@@ -516,7 +517,7 @@ class ShowMplsLdpNsrStatistics(ShowMplsLdpNsrStatisticsSchema):
 
 class ShowMplsLdpNeighborSchema(MetaParser):
     """Schema for show mpls ldp neighbor"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'peers': {
@@ -580,7 +581,7 @@ class ShowMplsLdpNeighborSchema(MetaParser):
                 }
             }
         },
-    }
+    })
 
 
 class ShowMplsLdpNeighbor(ShowMplsLdpNeighborSchema):
@@ -866,7 +867,7 @@ class ShowMplsLdpBindingsSchema(MetaParser):
                show mpls ldp bindings all
                show mpls ldp bindings all detail
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
            Any():{
                 'lib_entry':{
@@ -901,7 +902,7 @@ class ShowMplsLdpBindingsSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 class ShowMplsLdpBindings(ShowMplsLdpBindingsSchema):
     """
@@ -1034,7 +1035,7 @@ class ShowMplsLdpCapabilitiesSchema(MetaParser):
     Schema for show mpls ldp capabilities
                show mpls ldp capabilities all
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'ldp_capabilities': {
             Optional('iccp_type'): str,
             Optional('maj_version'): int,
@@ -1044,7 +1045,7 @@ class ShowMplsLdpCapabilitiesSchema(MetaParser):
             Optional('mldp_multipoint_to_multipoint'): str,
             Optional('typed_wildcard'): str,
         }
-    }
+    })
 
 class ShowMplsLdpCapabilities(ShowMplsLdpCapabilitiesSchema):
     """
@@ -1142,7 +1143,7 @@ class ShowMplsLdpDiscoverySchema(MetaParser):
                show mpls ldp discovery vrf <vrf>
                show mpls ldp discovery vrf <vrf> detail
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('local_ldp_identifier'): {
@@ -1188,7 +1189,7 @@ class ShowMplsLdpDiscoverySchema(MetaParser):
             },
         },
 
-    }
+    })
 
 class ShowMplsLdpDiscovery(ShowMplsLdpDiscoverySchema):
     """
@@ -1427,7 +1428,7 @@ class ShowMplsLdpIgpSyncSchema(MetaParser):
                show mpls ldp igp sync interface <interface>
                show mpls ldp igp sync vrf <vrf>
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'interface': {
@@ -1454,7 +1455,7 @@ class ShowMplsLdpIgpSyncSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 class ShowMplsLdpIgpSync(ShowMplsLdpIgpSyncSchema):
     """
@@ -1609,7 +1610,7 @@ class ShowMplsForwardingTableSchema(MetaParser):
         show mpls forwarding-table detail
         show mpls forwarding-table vrf <vrf> detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any(): {
                 'local_label': {
@@ -1648,7 +1649,7 @@ class ShowMplsForwardingTableSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowMplsForwardingTable(ShowMplsForwardingTableSchema):
     """Parser for
@@ -1931,7 +1932,7 @@ class ShowMplsInterfaceSchema(MetaParser):
         show mpls interfaces <interface> detail
         show mpls interfaces detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'interfaces': {
@@ -1958,7 +1959,7 @@ class ShowMplsInterfaceSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowMplsInterface(ShowMplsInterfaceSchema):
@@ -2155,7 +2156,7 @@ class ShowMplsL2TransportSchema(MetaParser):
                show mpls l2transport vc detail
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             Any(): {
                 Optional('status'): str,
@@ -2246,7 +2247,7 @@ class ShowMplsL2TransportSchema(MetaParser):
                 Optional('label_state_machine'): str,
             },
         }
-    }
+    })
 
 
 class ShowMplsL2TransportDetail(ShowMplsL2TransportSchema):
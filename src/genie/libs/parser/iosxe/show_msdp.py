@@ -12,6 +12,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -21,7 +22,7 @@ class ShowIpMsdpPeerSchema(MetaParser):
         * 'show ip msdp vrf <vrf> peer'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'peer': {
@@ -76,7 +77,7 @@ class ShowIpMsdpPeerSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIpMsdpPeer(ShowIpMsdpPeerSchema):
@@ -389,7 +390,7 @@ class ShowIpMsdpSaCacheSchema(MetaParser):
         * 'show ip msdp sa-cache'
         * 'show ip msdp vrf <vrf> sa-cache'
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'num_of_sa_cache': int,
@@ -418,7 +419,7 @@ class ShowIpMsdpSaCacheSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIpMsdpSaCache(ShowIpMsdpSaCacheSchema):
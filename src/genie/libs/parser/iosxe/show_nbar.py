@@ -1,5 +1,6 @@
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 import re
 
@@ -8,7 +9,7 @@ import re
 # ======================================================
 
 class ShowIpNbarDiscoverySchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             Any(): {
                 'protocol': {
@@ -25,7 +26,7 @@ class ShowIpNbarDiscoverySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowIpNbarDiscovery(ShowIpNbarDiscoverySchema):
     """Parser for show ip nbar protocol-discovery protocol on IOS-XE
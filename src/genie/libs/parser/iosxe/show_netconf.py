@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Optional, Any, Use, Schema
 
 # pyATS
@@ -21,10 +22,10 @@ class ShowNetconfSessionSchema(MetaParser):
         * 'show netconf session'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'open': int,
         'maximum': int,
-    }
+    })
 
 class ShowNetconfSession(ShowNetconfSessionSchema):
     '''Parser for:
@@ -63,7 +64,7 @@ class ShowNetconfYangSessionsSchema(MetaParser):
         * show netconf-yang sessions
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'session_count': int,
         'session_id': {
             int: {
@@ -78,7 +79,7 @@ class ShowNetconfYangSessionsSchema(MetaParser):
                 Optional('out_notifications'): str,
             }
         }
-    }
+    })
 
 class ShowNetconfYangSessions(ShowNetconfYangSessionsSchema):
     '''parser for:
@@ -13,6 +13,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
 
@@ -22,7 +23,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 class ShowNtpAssociationsSchema(MetaParser):
     """Schema for show ntp associations"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'peer': {
             Any():{
                 'local_mode': {
@@ -54,7 +55,7 @@ class ShowNtpAssociationsSchema(MetaParser):
                 Optional('associations_local_mode'): str,
             }
         }
-    }
+    })
 
 # ==============================================
 #  Parser for show ntp associations
@@ -158,7 +159,7 @@ class ShowNtpAssociations(ShowNtpAssociationsSchema):
 class ShowNtpStatusSchema(MetaParser):
     """Schema for: show ntp status"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'clock_state': {
             'system_status': {
                 Optional('status'): str,
@@ -182,7 +183,7 @@ class ShowNtpStatusSchema(MetaParser):
                 Optional('leapsecond'): bool,
             }
         }
-    }
+    })
 
 
 class ShowNtpStatus(ShowNtpStatusSchema):
@@ -326,7 +327,7 @@ class ShowNtpStatus(ShowNtpStatusSchema):
 class ShowNtpConfigSchema(MetaParser):
     """Schema for: show ntp config"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address': {
@@ -351,7 +352,7 @@ class ShowNtpConfigSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowNtpConfig(ShowNtpConfigSchema):
     """Parser for: show ntp config"""
@@ -419,7 +420,7 @@ class ShowNtpConfig(ShowNtpConfigSchema):
 class ShowNtpAssociationsDetailSchema(MetaParser):
     """Schema for show ntp associations detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'associations': {
@@ -494,7 +495,7 @@ class ShowNtpAssociationsDetailSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 # ==============================================
 #  Parser for show ntp associations detail
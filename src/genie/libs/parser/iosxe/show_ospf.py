@@ -38,6 +38,7 @@ from netaddr import IPAddress, IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -51,7 +52,7 @@ class ShowIpOspfSegmentRoutingLocalBlockSchema(MetaParser):
         * 'show ip ospf {process_id} segment-routing local-block'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'router_id': str,
@@ -68,7 +69,7 @@ class ShowIpOspfSegmentRoutingLocalBlockSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ===========================================================
@@ -162,7 +163,7 @@ class ShowIpOspfSchema(MetaParser):
         * 'show ip ospf'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -323,7 +324,7 @@ class ShowIpOspfSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==================
@@ -1363,7 +1364,7 @@ class ShowIpOspfInterfaceBriefSchema(MetaParser):
     ''' Schema for:
         * 'show ip ospf interface brief'
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'areas': {
@@ -1381,7 +1382,7 @@ class ShowIpOspfInterfaceBriefSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 class ShowIpOspfInterfaceBrief(ShowIpOspfInterfaceBriefSchema):
     ''' Parser for:
@@ -1446,7 +1447,7 @@ class ShowIpOspfInterfaceSchema(MetaParser):
         * 'show ip ospf interface {interface}'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any(): 
                 {'address_family': 
@@ -1741,7 +1742,7 @@ class ShowIpOspfInterfaceSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ===========================================
@@ -2550,7 +2551,7 @@ class ShowIpOspfInterface2Schema(MetaParser):
     ''' Schema for:
         * 'show ip ospf interface__'
     '''
-    schema ={
+    schema =LazySchema(lambda: {
                 'address_family': 
                     {Any(): 
                         {'instance': 
@@ -2841,7 +2842,7 @@ class ShowIpOspfInterface2Schema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 # ===========================================
 # Parser for:
@@ -3927,7 +3928,7 @@ class ShowIpOspfShamLinksSchema(MetaParser):
         * 'show ip ospf sham-links'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'address_family':
@@ -3985,7 +3986,7 @@ class ShowIpOspfShamLinksSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 
 # =============================
@@ -4015,7 +4016,7 @@ class ShowIpOspfVirtualLinksSchema(MetaParser):
         * 'show ip ospf virtual-links'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'address_family':
@@ -4073,7 +4074,7 @@ class ShowIpOspfVirtualLinksSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 
 # ================================
@@ -4103,7 +4104,7 @@ class ShowIpOspfNeighborDetailSchema(MetaParser):
         * 'show ip ospf neighbor detail'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any():
                 {'address_family':
@@ -4218,7 +4219,7 @@ class ShowIpOspfNeighborDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ================================
@@ -4619,7 +4620,7 @@ class ShowIpOspfNeighborDetail2Schema(MetaParser):
         * 'show ip ospf neighbor detail'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
                 'address-family':{
                     'ipv4':{
                         'areas':{
@@ -4663,7 +4664,7 @@ class ShowIpOspfNeighborDetail2Schema(MetaParser):
                         }
                     }
                 }
-            }
+            })
 
 # ================================
 # Parser for:
@@ -4878,7 +4879,7 @@ class ShowIpOspfDatabaseSchema(MetaParser):
         * 'show ip ospf database'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'address_family':
@@ -4918,7 +4919,7 @@ class ShowIpOspfDatabaseSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==========================
@@ -6292,7 +6293,7 @@ class ShowIpOspfDatabaseRouterSchema(MetaParser):
         * show ip ospf database router'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -6360,7 +6361,7 @@ class ShowIpOspfDatabaseRouterSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==================================
@@ -6394,7 +6395,7 @@ class ShowIpOspfDatabaseExternalSchema(MetaParser):
         * 'show ip ospf database external'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -6451,7 +6452,7 @@ class ShowIpOspfDatabaseExternalSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ====================================
@@ -6483,7 +6484,7 @@ class ShowIpOspfDatabaseNetworkSchema(MetaParser):
         * 'show ip ospf database network'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -6535,7 +6536,7 @@ class ShowIpOspfDatabaseNetworkSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===================================
@@ -6568,7 +6569,7 @@ class ShowIpOspfDatabaseSummarySchema(MetaParser):
         * 'show ip ospf database summary'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -6622,7 +6623,7 @@ class ShowIpOspfDatabaseSummarySchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===================================
@@ -6657,7 +6658,7 @@ class ShowIpOspfDatabaseOpaqueAreaSchema(MetaParser):
         * 'show ip ospf database opaque-area self-originate'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -6864,7 +6865,7 @@ class ShowIpOspfDatabaseOpaqueAreaSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 
@@ -6897,7 +6898,7 @@ class ShowIpOspfMplsLdpInterfaceSchema(MetaParser):
         * "show ip ospf mpls ldp interface" 
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -6934,7 +6935,7 @@ class ShowIpOspfMplsLdpInterfaceSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =====================================
@@ -7142,7 +7143,7 @@ class ShowIpOspfMplsTrafficEngLinkSchema(MetaParser):
         * 'show ip ospf mpls traffic-eng link'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -7194,7 +7195,7 @@ class ShowIpOspfMplsTrafficEngLinkSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ========================================
@@ -7500,7 +7501,7 @@ class ShowIpOspfMplsTrafficEngLink2Schema(MetaParser):
         * 'show ip ospf mpls traffic-eng link__'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
             'address_family': 
                 {Any(): 
                     {'instance': 
@@ -7548,7 +7549,7 @@ class ShowIpOspfMplsTrafficEngLink2Schema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 # ========================================
 # Parser for:
@@ -7767,7 +7768,7 @@ class ShowIpOspfMaxMetricSchema(MetaParser):
         * 'show ip ospf max-metric'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'address_family':
@@ -7798,7 +7799,7 @@ class ShowIpOspfMaxMetricSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =============================
@@ -7962,7 +7963,7 @@ class ShowIpOspfTrafficSchema(MetaParser):
         * 'show ip ospf traffic'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('ospf_statistics'):
             {'last_clear_traffic_counters': str,
             'rcvd':
@@ -8171,7 +8172,7 @@ class ShowIpOspfTrafficSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==========================
@@ -8680,7 +8681,7 @@ class ShowIpOspfNeighborSchema(MetaParser):
         * 'show ip ospf neighbor {interface}'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces':
             {Any():
                 {'neighbors':
@@ -8693,7 +8694,7 @@ class ShowIpOspfNeighborSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===========================
@@ -8783,7 +8784,7 @@ class ShowIpOspfSegmentRoutingAdjacencySidSchema(MetaParser):
     ''' Schema for commands:
             * show ip ospf {process_id} segment-routing adjacency-sid
     '''
-    schema = {        
+    schema = LazySchema(lambda: {        
         'process_id': {
             Any(): {
                 'router_id': str,
@@ -8799,7 +8800,7 @@ class ShowIpOspfSegmentRoutingAdjacencySidSchema(MetaParser):
                 }
             }
         }
-    }
+    })
         
 
 class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidSchema):
@@ -8893,7 +8894,7 @@ class ShowIpOspfFastRerouteTiLfaSchema(MetaParser):
     """Schema for show ip ospf fast-reroute ti-lfa
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'process_id': {
             Any(): {
                 'router_id': str,
@@ -8907,7 +8908,7 @@ class ShowIpOspfFastRerouteTiLfaSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # =================================================
 # Parser for:
@@ -8990,7 +8991,7 @@ class ShowIpOspfSegmentRoutingProtectedAdjacenciesSchema(MetaParser):
     ''' Schema for show ip ospf segment-routing protected-adjacencies
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'process_id': {
             Any(): {
                 'router_id': str,
@@ -9012,7 +9013,7 @@ class ShowIpOspfSegmentRoutingProtectedAdjacenciesSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ========================================================
 # Parser for:
@@ -9100,7 +9101,7 @@ class ShowIpOspfSegmentRoutingSidDatabaseSchema(MetaParser):
     ''' Schema for commands:
             * show ip ospf segment-routing sid-database
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'process_id': {
             Any(): {
                 'router_id': str,
@@ -9121,7 +9122,7 @@ class ShowIpOspfSegmentRoutingSidDatabaseSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIpOspfSegmentRoutingSidDatabase(ShowIpOspfSegmentRoutingSidDatabaseSchema):
@@ -9211,7 +9212,7 @@ class ShowIpOspfSegmentRoutingGlobalBlockSchema(MetaParser):
     """ Schema for commands:
             * show ip ospf {pid} segment-routing global-block
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'process_id': {
             Any(): {
                 'router_id': str,
@@ -9228,7 +9229,7 @@ class ShowIpOspfSegmentRoutingGlobalBlockSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # =====================================================
 # Parser for:
@@ -9325,7 +9326,7 @@ class ShowIpOspfSegmentRoutingSchema(MetaParser):
     ''' Schema for show ip ospf segment-routing
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'process_id': {
             Any(): {
                 'router_id': str,
@@ -9393,7 +9394,7 @@ class ShowIpOspfSegmentRoutingSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
     ''' Parser for show ip ospf segment-routing
@@ -10070,7 +10071,7 @@ class ShowIpOspfShamLinks2Schema(MetaParser):
         * 'show ip ospf sham-links __'
     '''
 
-    schema =   {'address_family':
+    schema =   LazySchema(lambda: {'address_family':
                     {Any():
                         {'areas':
                             {Any():
@@ -10119,7 +10120,7 @@ class ShowIpOspfShamLinks2Schema(MetaParser):
                                 },
                             },
                         },
-                    }
+                    })
 
 
 # =============================
@@ -10149,7 +10150,7 @@ class ShowIpOspfVirtualLinks2Schema(MetaParser):
         * 'show ip ospf virtual-links __'
     '''
 
-    schema = {  
+    schema = LazySchema(lambda: {  
                 'address_family':
                     {Any():
                         {'areas':
@@ -10199,7 +10200,7 @@ class ShowIpOspfVirtualLinks2Schema(MetaParser):
                                 },
                             },
                         },
-                    }
+                    })
 
 # ================================
 # Parser for:
@@ -30,6 +30,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
@@ -46,7 +47,7 @@ class ShowIpv6PimInterfaceSchema(MetaParser):
         show ipv6 pim interface
         show ipv6 pim vrf <vrf> interface"""
 
-    schema = {'vrf': {
+    schema = LazySchema(lambda: {'vrf': {
                 Any(): {
                     'interface': {
                         Any() :{
@@ -60,7 +61,7 @@ class ShowIpv6PimInterfaceSchema(MetaParser):
                     }
                 },
             }
-        }
+        })
 
 
 class ShowIpv6PimInterface(ShowIpv6PimInterfaceSchema):
@@ -150,7 +151,7 @@ class ShowIpv6PimBsrElectionSchema(MetaParser):
     """Schema for
         show ipv6 pim bsr election
         show ipv6 pim vrf <vrf> bsr election"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -179,7 +180,7 @@ class ShowIpv6PimBsrElectionSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 # ========================================================
 #  parser for  'show ipv6 pim bsr election'
 #  parser for  'show ipv6 pim vrf <vrf> bsr election'
@@ -324,7 +325,7 @@ class ShowIpv6PimBsrCandidateRpSchema(MetaParser):
     """schema for:
         show ipv6 pim bsr candidate-rp
         show ipv6 pim vrf <vrf> bsr candidate-rp"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -346,7 +347,7 @@ class ShowIpv6PimBsrCandidateRpSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 # ==============================================
 #  parser for show ipv6 pim bsr candidate-rp
@@ -478,7 +479,7 @@ class ShowIpPimInterfaceSchema(MetaParser):
     """Schema for:
         show ip pim interface
         show ip pim vrf <vrf> interface"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'interfaces': {
@@ -498,7 +499,7 @@ class ShowIpPimInterfaceSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 # ==========================================================
 # parser for  : show ip pim interface
@@ -600,7 +601,7 @@ class ShowIpPimBsrRouterSchema(MetaParser):
     """Schema for:
         show ip pim bsr-router
         show ip pim vrf <vrf> bsr-router"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -635,7 +636,7 @@ class ShowIpPimBsrRouterSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 # ============================================
 # Parser for 'show ip pim bsr-router'
 # Parser for 'show ip pim vrf xxx bsr-router'
@@ -877,7 +878,7 @@ class ShowIpPimBsrRouter(ShowIpPimBsrRouterSchema):
 # ====================================================
 class ShowIpPimRpMappingSchema(MetaParser):
     # Schema for 'show ip pim rp mapping'
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any(): {
                 'address_family': {
@@ -929,7 +930,7 @@ class ShowIpPimRpMappingSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ===================================================
@@ -1296,7 +1297,7 @@ class ShowIpPimRpMapping(ShowIpPimRpMappingSchema):
 # schema for : show ip pim vrf <vrf_name> interface detail
 # =============================================================
 class ShowIpPimInterfaceDetailSchema(MetaParser):
-     schema = {
+     schema = LazySchema(lambda: {
          'vrf':{
              Any():{
                  'interfaces':{
@@ -1345,7 +1346,7 @@ class ShowIpPimInterfaceDetailSchema(MetaParser):
              },
          },
 
-     }
+     })
 # =============================================================
 # parser for : show ip pim interface detail
 # parser for : show ip pim vrf <vrf_name> interface detail
@@ -1686,7 +1687,7 @@ class ShowPimNeighborSchema(MetaParser):
 
     '''Schema for show ip/ipv6 pim [vrf <WORD>] neighbor'''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'interfaces':{
@@ -1716,7 +1717,7 @@ class ShowPimNeighborSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ==========================================================
@@ -1910,7 +1911,7 @@ class ShowIpPimInterfaceDfSchema(MetaParser):
 
     '''Schema for show ip pim [vrf <WORD>] interface df'''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -1933,7 +1934,7 @@ class ShowIpPimInterfaceDfSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ==========================================================
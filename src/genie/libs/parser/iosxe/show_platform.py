@@ -32,13 +32,10 @@ from xml.dom import minidom
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 from genie.libs.parser.utils.common import Common
-# genie.parsergen
-try:
-    import genie.parsergen
-except (ImportError, OSError):
-    pass
+from genie.libs.parser.utils.table import Table
 
 # pyATS
 from pyats.utils.exceptions import SchemaTypeError
@@ -48,7 +45,7 @@ log = logging.getLogger(__name__)
 class ShowBootvarSchema(MetaParser):
     """Schema for show bootvar"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('current_boot_variable'): str,
         Optional('next_reload_boot_variable'): str,
         Optional('config_file'): str,
@@ -63,7 +60,7 @@ class ShowBootvarSchema(MetaParser):
             Optional("next_reload_configuration_register"): str,
             Optional('boot_variable'): str,
         },
-    }
+    })
 
 
 class ShowBootvar(ShowBootvarSchema):
@@ -166,7 +163,7 @@ class ShowBootvar(ShowBootvarSchema):
 
 class ShowVersionSchema(MetaParser):
     """Schema for show version"""
-    schema = {
+    schema = LazySchema(lambda: {
         'version': {
             'version_short': str,
             'platform': str,
@@ -287,7 +284,7 @@ class ShowVersionSchema(MetaParser):
                 Any(): int,
             }
         }
-    }
+    })
 
 
 class ShowVersion(ShowVersionSchema):
@@ -304,6 +301,48 @@ class ShowVersion(ShowVersionSchema):
     cli_command = 'show version'
     exclude = ['system_restarted_at', 'uptime_this_cp', 'uptime']
 
+    # table2 for C3850
+    switch_table = Table(right_justified=True,
+                         header_fields=["Switch",
+                                        "Ports",
+                                        "Model             ",
+                                        'SW Version       ',
+                                        "SW Image              ",
+                                        "Mode   "],
+                         label_fields=["switch_num",
+                                       "ports",
+                                       "model",
+                                       "sw_ver",
+                                       'sw_image',
+                                       'mode'],
+                         index=[0, ],
+                         table_terminal_pattern=r"(^\n|^\s*$)")
+
+    # table2 for IOS
+    ios_switch_table = Table(right_justified=True,
+                             header_fields=["Switch",
+                                            "Ports",
+                                            "Model             ",
+                                            'SW Version       ',
+                                            "SW Image              "],
+                             label_fields=["switch_num",
+                                           "ports",
+                                           "model",
+                                           "sw_ver",
+                                           'sw_image'],
+                             index=[0, ],
+                             table_terminal_pattern=r"(^\n|^\s*$)")
+
+    # license table for Cat3850
+    license_table = Table(right_justified=True,
+                          header_fields=["Current            ",
+                                         "Type            ",
+                                         "Next reboot  "],
+                          label_fields=["license_level",
+                                        "license_type",
+                                        "next_reload_license_level"],
+                          table_terminal_pattern=r"(^\n|^\s*$)")
+
     def cli(self, output=None):
         """parsing mechanism: cli
 
@@ -1210,63 +1249,22 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
         # table2 for C3850
-        tmp2 = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                 header_fields=["Switch",
-                                                                "Ports",
-                                                                "Model             ",
-                                                                'SW Version       ',
-                                                                "SW Image              ",
-                                                                "Mode   "],
-                                                 label_fields=["switch_num",
-                                                               "ports",
-                                                               "model",
-                                                               "sw_ver",
-                                                               'sw_image',
-                                                               'mode'],
-                                                 index=[0, ],
-                                                 table_terminal_pattern=r"(^\n|^\s*$)",
-                                                 device_output=out,
-                                                 device_os='iosxe')
-
-        if not tmp2.entries:
+        tmp2 = self.switch_table.entries(out)
+
+        if not tmp2:
             # table2 for IOS
-            tmp2 = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                     header_fields=["Switch",
-                                                                    "Ports",
-                                                                    "Model             ",
-                                                                    'SW Version       ',
-                                                                    "SW Image              "],
-                                                     label_fields=["switch_num",
-                                                                   "ports",
-                                                                   "model",
-                                                                   "sw_ver",
-                                                                   'sw_image'],
-                                                     index=[0, ],
-                                                     table_terminal_pattern=r"(^\n|^\s*$)",
-                                                     device_output=out,
-                                                     device_os='ios')
+            tmp2 = self.ios_switch_table.entries(out)
         # switch_number
         # license table for Cat3850
-        tmp = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                header_fields=["Current            ",
-                                                               "Type            ",
-                                                               "Next reboot  "],
-                                                label_fields=["license_level",
-                                                              "license_type",
-                                                              "next_reload_license_level"],
-                                                table_terminal_pattern=r"(^\n|^\s*$)",
-                                                device_output=out,
-                                                device_os='iosxe')
-
-        if tmp.entries:
-            res = tmp
-            for key in res.entries.keys():
-                for k, v in res.entries[key].items():
+        tmp = self.license_table.entries(out)
+
+        if tmp:
+            for key in tmp.keys():
+                for k, v in tmp[key].items():
                     version_dict['version'][k] = v
 
-        if tmp2.entries:
-            res2 = tmp2
-            for key in res2.entries.keys():
+        if tmp2:
+            for key in tmp2.keys():
                 if 'switch_num' not in version_dict['version']:
                     version_dict['version']['switch_num'] = {}
                 if '*' in key:
@@ -1276,7 +1274,7 @@ class ShowVersion(ShowVersionSchema):
                     if m:
                         if switch_no not in version_dict['version']['switch_num']:
                             version_dict['version']['switch_num'][switch_no] = {}
-                        for k, v in res2.entries[key].items():
+                        for k, v in tmp2[key].items():
                             if 'switch_num' != k:
                                 version_dict['version']['switch_num'][switch_no][k] = v
 
@@ -1287,7 +1285,7 @@ class ShowVersion(ShowVersionSchema):
                         version_dict['version']['switch_num'][switch_no].\
                             update(active_dict) if active_dict else None
                 else:
-                    for k, v in res2.entries[key].items():
+                    for k, v in tmp2[key].items():
                         if key not in version_dict['version']['switch_num']:
                             version_dict['version']['switch_num'][key] = {}
                         if 'switch_num' != k:
@@ -1299,7 +1297,7 @@ class ShowVersion(ShowVersionSchema):
 
 class DirSchema(MetaParser):
     """Schema for dir"""
-    schema = {
+    schema = LazySchema(lambda: {
         'dir': {
             'dir': str,
             Any(): {
@@ -1315,7 +1313,7 @@ class DirSchema(MetaParser):
                 Optional('bytes_free'): str
             }
         }
-    }
+    })
 
 
 class Dir(DirSchema):
@@ -1393,7 +1391,7 @@ class Dir(DirSchema):
 
 class ShowRedundancySchema(MetaParser):
     """Schema for show redundancy """
-    schema = {
+    schema = LazySchema(lambda: {
         'red_sys_info': {
             'available_system_uptime': str,
             'switchovers_system_experienced': str,
@@ -1417,7 +1415,7 @@ class ShowRedundancySchema(MetaParser):
                 Optional('config_register'): str,
             }
         }
-    }
+    })
 
 
 class ShowRedundancy(ShowRedundancySchema):
@@ -1611,7 +1609,7 @@ class ShowRedundancy(ShowRedundancySchema):
 
 class ShowRedundancyStatesSchema(MetaParser):
     """Schema for show redundancy states """
-    schema = {
+    schema = LazySchema(lambda: {
         'my_state': str,
         'peer_state': str,
         'mode': str,
@@ -1628,7 +1626,7 @@ class ShowRedundancyStatesSchema(MetaParser):
         'client_count': int,
         'client_notification_tmr_msec': int,
         'rf_debug_mask': str,
-    }
+    })
 
 
 class ShowRedundancyStates(ShowRedundancyStatesSchema):
@@ -1807,7 +1805,7 @@ class ShowInventorySchema(MetaParser):
         * 'show inventory'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('main'):
             {Optional('swstack'): bool,
              Optional(Any()):
@@ -1890,7 +1888,7 @@ class ShowInventorySchema(MetaParser):
                      },
                  },
              },
-    }
+    })
 
 
 # ====================
@@ -2144,7 +2142,7 @@ class ShowInventory(ShowInventorySchema):
 
 class ShowPlatformSchema(MetaParser):
     """Schema for show platform"""
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('main'): {
             Optional('switch_mac_address'): str,
             Optional('mac_persistency_wait_time'): str,
@@ -2215,7 +2213,7 @@ class ShowPlatformSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowPlatform(ShowPlatformSchema):
@@ -2478,7 +2476,7 @@ class ShowPlatform(ShowPlatformSchema):
 class ShowBootSchema(MetaParser):
     """Schema for show boot"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('current_boot_variable'): str,
         Optional('next_reload_boot_variable'): str,
         Optional('manual_boot'): bool,
@@ -2525,7 +2523,7 @@ class ShowBootSchema(MetaParser):
                 Optional('allow_dev_key'): bool,
             },
         },
-    }
+    })
 
 
 class ShowBoot(ShowBootSchema):
@@ -2754,7 +2752,7 @@ class ShowBoot(ShowBootSchema):
 
 class ShowSwitchDetailSchema(MetaParser):
     """Schema for show switch detail"""
-    schema = {
+    schema = LazySchema(lambda: {
         'switch': {
             'mac_address': str,
             Optional('mac_persistency_wait_time'): str,
@@ -2774,7 +2772,7 @@ class ShowSwitchDetailSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 class ShowSwitchDetail(ShowSwitchDetailSchema):
@@ -2897,7 +2895,7 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
 
 class ShowSwitchSchema(MetaParser):
     """Schema for show switch"""
-    schema = {
+    schema = LazySchema(lambda: {
         'switch': {
             'mac_address': str,
             Optional('mac_persistency_wait_time'): str,
@@ -2911,7 +2909,7 @@ class ShowSwitchSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 class ShowSwitch(ShowSwitchSchema, ShowSwitchDetail):
@@ -2922,7 +2920,7 @@ class ShowSwitch(ShowSwitchSchema, ShowSwitchDetail):
 # c3850
 class ShowEnvironmentAllSchema(MetaParser):
     """Schema for show environment all"""
-    schema = {
+    schema = LazySchema(lambda: {
         'switch': {
             Any(): {
                 'fan': {
@@ -2969,7 +2967,7 @@ class ShowEnvironmentAllSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowEnvironmentAll(ShowEnvironmentAllSchema):
@@ -3110,7 +3108,7 @@ class ShowEnvironmentAll(ShowEnvironmentAllSchema):
 
 class ShowModuleSchema(MetaParser):
     """Schema for show module"""
-    schema = {
+    schema = LazySchema(lambda: {
         'switch': {
             Any(): {
                 'port': str,
@@ -3121,7 +3119,7 @@ class ShowModuleSchema(MetaParser):
                 'sw_ver': str
             },
         }
-    }
+    })
 
 
 class ShowModule(ShowModuleSchema):
@@ -3165,7 +3163,7 @@ class ShowModule(ShowModuleSchema):
 
 class ShowPlatformSoftwareSlotActiveMonitorMemSchema(MetaParser):
     """Schema for show platform software process slot switch active R0 monitor | inc Mem :|Swap:"""
-    schema = {
+    schema = LazySchema(lambda: {
         'memory': {
             'total': int,
             'free': int,
@@ -3178,7 +3176,7 @@ class ShowPlatformSoftwareSlotActiveMonitorMemSchema(MetaParser):
             'used': int,
             'available_memory': int
         }
-    }
+    })
 
 
 class ShowPlatformSoftwareSlotActiveMonitorMem(ShowPlatformSoftwareSlotActiveMonitorMemSchema):
@@ -3227,7 +3225,7 @@ class ShowPlatformSoftwareSlotActiveMonitorMem(ShowPlatformSoftwareSlotActiveMon
 
 class ShowPlatformSoftwareStatusControlSchema(MetaParser):
     """Schema for show platform software status control-processor brief"""
-    schema = {
+    schema = LazySchema(lambda: {
         'slot': {
             Any(): {
                 'load_average': {
@@ -3259,7 +3257,7 @@ class ShowPlatformSoftwareStatusControlSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowPlatformSoftwareStatusControl(ShowPlatformSoftwareStatusControlSchema):
@@ -3343,7 +3341,7 @@ class ShowProcessesCpuSortedSchema(MetaParser):
                   show processes cpu sorted <1min|5min|5sec>
                   show processes cpu sorted | include <WORD>
                   show processes cpu sorted <1min|5min|5sec> | include <WORD>"""
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('five_sec_cpu_interrupts'): int,
         Optional('five_sec_cpu_total'): int,
         Optional('one_min_cpu'): int,
@@ -3363,7 +3361,7 @@ class ShowProcessesCpuSortedSchema(MetaParser):
                 'process': str
             }
         }
-    }
+    })
 
 
 class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
@@ -3444,7 +3442,7 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
 
 class ShowProcessesCpuPlatformSchema(MetaParser):
     """Schema for show processes cpu platform"""
-    schema = {
+    schema = LazySchema(lambda: {
         'cpu_utilization': {
             'cpu_util_five_secs': str,
             'cpu_util_one_min': str,
@@ -3468,7 +3466,7 @@ class ShowProcessesCpuPlatformSchema(MetaParser):
                 'name': str,
             },
         }
-    }
+    })
 
 
 class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
@@ -3550,7 +3548,7 @@ class ShowEnvironmentSchema(MetaParser):
     """Schema for show environment
                   show environment | include {include} """
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('critical_larams'): int,
         Optional('major_alarms'): int,
         Optional('minor_alarms'): int,
@@ -3564,7 +3562,7 @@ class ShowEnvironmentSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowEnvironment(ShowEnvironmentSchema):
@@ -3653,7 +3651,7 @@ class ShowVersionRpSchema(MetaParser):
     """Schema for show version RP active [running|provisioned|installed]
                   show version RP standby [running|provisioned|installed]"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'rp': {
             Optional('active'): {
                 'slot': {
@@ -3688,7 +3686,7 @@ class ShowVersionRpSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowVersionRp(ShowVersionRpSchema):
@@ -3798,7 +3796,7 @@ class ShowPlatformHardwareSchema(MetaParser):
     """Schema for show platform hardware qfp active infrastructure bqs queue output default all
         show platform hardware qfp active infrastructure bqs queue output default interface {interface}"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'if_h': int,
             Optional('index'): {
@@ -3842,7 +3840,7 @@ class ShowPlatformHardwareSchema(MetaParser):
                 },
             }
         },
-    }
+    })
 
 
 class ShowPlatformHardware(ShowPlatformHardwareSchema):
@@ -4096,7 +4094,7 @@ class ShowPlatformHardwarePlimSchema(MetaParser):
                   show platform hardware slot <x> plim statistics internal
                   show platform hardware subslot <x/x> plim statistics"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('port'): {
             Any(): {
                 'received': {
@@ -4174,7 +4172,7 @@ class ShowPlatformHardwarePlimSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowPlatformHardwarePlim(ShowPlatformHardwarePlimSchema):
@@ -4514,7 +4512,7 @@ class ShowPlatformHardwareQfpBqsMappingSchema(MetaParser):
                   show platform hardware qfp active bqs <x> opm mapping
                   show platform hardware qfp standby bqs <x> opm mapping"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'channel': {
             Any(): {
                 Optional('interface'): str,
@@ -4525,7 +4523,7 @@ class ShowPlatformHardwareQfpBqsMappingSchema(MetaParser):
                 Optional('cfifo'): int,
             },
         }
-    }
+    })
 
 
 class ShowPlatformHardwareQfpBqsOpmMapping(ShowPlatformHardwareQfpBqsMappingSchema):
@@ -4655,7 +4653,7 @@ class ShowPlatformHardwareSerdesSchema(MetaParser):
     """Schema for show platform hardware slot <x> serdes statistics
                   show platform hardware slot <x> serdes statistics internal"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'link': {
             Any(): {
                 Optional('from'): {
@@ -4722,7 +4720,7 @@ class ShowPlatformHardwareSerdesSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowPlatformHardwareSerdes(ShowPlatformHardwareSerdesSchema):
@@ -4989,7 +4987,7 @@ class ShowPlatformHardwareSerdesInternal(ShowPlatformHardwareSerdesSchema):
 
 class ShowPlatformPowerSchema(MetaParser):
     """Schema for show platform power"""
-    schema = {
+    schema = LazySchema(lambda: {
         'chassis': str,
         'total_load': int,
         'total_capacity': int,
@@ -5011,7 +5009,7 @@ class ShowPlatformPowerSchema(MetaParser):
                 Optional('load'): int,
             },
         }
-    }
+    })
 
 
 class ShowPlatformPower(ShowPlatformPowerSchema):
@@ -5159,7 +5157,7 @@ class ShowPlatformHardwareQfpBqsStatisticsChannelAllSchema(MetaParser):
                   show platform hardware qfp active bqs <x> opm statistics channel all
                   show platform hardware qfp standby bqs <x> opm statistics channel all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'channel': {
             Any(): {
                 'goodpkts': str,
@@ -5169,7 +5167,7 @@ class ShowPlatformHardwareQfpBqsStatisticsChannelAllSchema(MetaParser):
                 Optional('comment'): str,
             },
         }
-    }
+    })
 
 
 class ShowPlatformHardwareQfpBqsStatisticsChannelAll(ShowPlatformHardwareQfpBqsStatisticsChannelAllSchema):
@@ -5235,7 +5233,7 @@ class ShowPlatformHardwareQfpBqsMappingSchema(MetaParser):
                   show platform hardware qfp active bqs <x> opm mapping
                   show platform hardware qfp standby bqs <x> opm mapping"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'channel': {
             Any(): {
                 Optional('interface'): str,
@@ -5246,7 +5244,7 @@ class ShowPlatformHardwareQfpBqsMappingSchema(MetaParser):
                 Optional('cfifo'): int,
             },
         }
-    }
+    })
 
 
 class ShowPlatformHardwareQfpBqsOpmMapping(ShowPlatformHardwareQfpBqsMappingSchema):
@@ -5375,7 +5373,7 @@ class ShowPlatformHardwareQfpInterfaceIfnameStatisticsSchema(MetaParser):
     """Schema for show platform hardware qfp active interface if-name <interface> statistics
                   show platform hardware qfp standby interface if-name <interface> statistics"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'qfp': {
             'active': {
                 'interface': {
@@ -5409,7 +5407,7 @@ class ShowPlatformHardwareQfpInterfaceIfnameStatisticsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowPlatformHardwareQfpInterfaceIfnameStatistics(ShowPlatformHardwareQfpInterfaceIfnameStatisticsSchema):
@@ -5493,14 +5491,14 @@ class ShowPlatformHardwareQfpStatisticsDropSchema(MetaParser):
     """Schema for show platform hardware qfp active statistics drop
                   show platform hardware qfp standby statistics drop"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'global_drop_stats': {
             Any(): {
                 'packets': int,
                 'octets': int,
             },
         }
-    }
+    })
 
 
 class ShowPlatformHardwareQfpStatisticsDrop(ShowPlatformHardwareQfpStatisticsDropSchema):
@@ -5542,7 +5540,7 @@ class ShowPlatformHardwareQfpStatisticsDrop(ShowPlatformHardwareQfpStatisticsDro
 class ShowProcessesCpuHistorySchema(MetaParser):
     """Schema for show processes cpu history"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         '60s': {
             Any(): {
                 'maximum': int,
@@ -5561,7 +5559,7 @@ class ShowProcessesCpuHistorySchema(MetaParser):
                 Optional('average'): int,
             },
         },
-    }
+    })
 
 
 class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
@@ -5669,7 +5667,7 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
 
 
 class ShowProcessesMemorySchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'processor_pool': {
             'total': int,
             'used': int,
@@ -5701,7 +5699,7 @@ class ShowProcessesMemorySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowProcessesMemory(ShowProcessesMemorySchema):
@@ -5789,7 +5787,7 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
 
 class ShowPlatformSoftwareMemoryCallsiteSchema(MetaParser):
     """ Schema for show platform software memory <process> switch active <R0> alloc callsite brief """
-    schema = {
+    schema = LazySchema(lambda: {
         'tracekey': str,
         'callsites': {
             Any(): {
@@ -5798,7 +5796,7 @@ class ShowPlatformSoftwareMemoryCallsiteSchema(MetaParser):
                 'diff_call': int
             }
         }
-    }
+    })
 
 
 class ShowPlatformSoftwareMemoryCallsite(ShowPlatformSoftwareMemoryCallsiteSchema):
@@ -5854,7 +5852,7 @@ class ShowPlatformSoftwareMemoryCallsite(ShowPlatformSoftwareMemoryCallsiteSchem
 
 class ShowPlatformSoftwareMemoryBacktraceSchema(MetaParser):
     """ Schema for show platform software memory <process> switch active <R0> alloc backtrace """
-    schema = {
+    schema = LazySchema(lambda: {
         'backtraces': {
             Any():
                 {'allocs': int,
@@ -5864,7 +5862,7 @@ class ShowPlatformSoftwareMemoryBacktraceSchema(MetaParser):
                  'thread_id': int}
         }
 
-    }
+    })
 
 class ShowPlatformSoftwareMemoryBacktrace(ShowPlatformSoftwareMemoryBacktraceSchema):
     """ Parser for show platform software memory <process> switch active <R0> alloc backtrace """
@@ -5937,7 +5935,7 @@ class ShowPlatformSoftwareMemoryBacktrace(ShowPlatformSoftwareMemoryBacktraceSch
 #         return super().cli(process=process, slot=slot, output=out)
 
 class ShowProcessesMemorySortedSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'processor_pool': {
             'total': int,
             'used': int,
@@ -5964,7 +5962,7 @@ class ShowProcessesMemorySortedSchema(MetaParser):
                 'retbufs': int,
             }
         }
-    }
+    })
 
 
 class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
@@ -6046,7 +6044,7 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
         return ret_dict
 
 class ShowPlatformIntegritySchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'platform': str,
         'boot': {
             Any(): {
@@ -6064,7 +6062,7 @@ class ShowPlatformIntegritySchema(MetaParser):
         },
         Optional('signature_version'): int,
         Optional('signature'): str,
-    }
+    })
 
 class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
     # cli_command = 'show platform integrity'
@@ -6288,7 +6286,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
 # =======================================================================
 # =======================================================================
 class ShowPlatformHardwareQfpActiveFeatureAppqoeSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'feature': {
             Any(): {
                 'global': {
@@ -6354,7 +6352,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoeSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFeatureAppqoeSchema):
 
@@ -6573,7 +6571,7 @@ class ShowPlatformHardwareQfpActiveFeatureAppqoe(ShowPlatformHardwareQfpActiveFe
 
 class ShowPlatformTcamUtilizationSchema(MetaParser):
     """Schema for show platform hardware fed sw active fwd-asic resource tcam utilization """
-    schema = {
+    schema = LazySchema(lambda: {
         'asic': {
             Any(): {
                 'table': {
@@ -6597,7 +6595,7 @@ class ShowPlatformTcamUtilizationSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
@@ -6665,7 +6663,7 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
 
 class ShowPlatformHardwareQfpActiveDatapathUtilSumSchema(MetaParser):
 
-    schema = {
+    schema = LazySchema(lambda: {
         'cpp': {
             Any(): {
                 Any(): {
@@ -6692,7 +6690,7 @@ class ShowPlatformHardwareQfpActiveDatapathUtilSumSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowPlatformHardwareQfpActiveDatapathUtilSum(ShowPlatformHardwareQfpActiveDatapathUtilSumSchema):
@@ -6759,7 +6757,7 @@ class ShowPlatformHardwareQfpActiveDatapathUtilSum(ShowPlatformHardwareQfpActive
 # Schema for 'show platform hardware qfp active tcam resource-manager usage'
 # =======================================================================
 class ShowPlatformHardwareQfpActiveTcamResourceManagerUsageSchema(MetaParser):
-     schema = {
+     schema = LazySchema(lambda: {
                 'qfp_tcam_usage_information': {
                     Any(): {
                         'name': str,
@@ -6778,7 +6776,7 @@ class ShowPlatformHardwareQfpActiveTcamResourceManagerUsageSchema(MetaParser):
                         'threshold_status': str
                         }
                     }
-                }
+                })
 
 # =======================================================================
 # Parser for 'show platform hardware qfp active tcam resource-manager usage'
@@ -6855,7 +6853,7 @@ class ShowPlatformHardwareQfpActiveTcamResourceManagerUsage(ShowPlatformHardware
 # Schema for 'show platform resources'
 # =======================================================================
 class ShowPlatformResourcesSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'rp': {
             Any():  {
 
@@ -6984,7 +6982,7 @@ class ShowPlatformResourcesSchema(MetaParser):
                 }
             }
         }
-    }    
+    })    
 
 # =======================================================================
 # Parser for 'show platform resources'
@@ -7116,9 +7114,9 @@ class ShowPlatformSoftwareYangManagementProcessSchema(MetaParser):
         * show platform software yang-management process
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         str: str
-    }
+    })
 
 class ShowPlatformSoftwareYangManagementProcess(ShowPlatformSoftwareYangManagementProcessSchema):
     '''parser for
@@ -7159,7 +7157,7 @@ class ShowPlatformSoftwareYangManagementProcessMonitorSchema(MetaParser):
         * show platform software yang-management process monitor
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'pid': {
             int: {
                 'command': str,
@@ -7171,7 +7169,7 @@ class ShowPlatformSoftwareYangManagementProcessMonitorSchema(MetaParser):
                 'elapsed': str,
             }
         }
-    }
+    })
 
 class ShowPlatformSoftwareYangManagementProcessMonitor(ShowPlatformSoftwareYangManagementProcessMonitorSchema):
     '''parser for
@@ -7222,7 +7220,7 @@ class ShowPlatformSoftwareYangManagementProcessStateSchema(MetaParser):
         * show platform software yang-management process state
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'confd-status': str,
         'processes': {
             str: {
@@ -7230,7 +7228,7 @@ class ShowPlatformSoftwareYangManagementProcessStateSchema(MetaParser):
                 'state': str,
                 },
             }
-        }
+        })
 
 class ShowPlatformSoftwareYangManagementProcessState(ShowPlatformSoftwareYangManagementProcessStateSchema):
     '''parser for
@@ -7284,7 +7282,7 @@ class ShowPlatformSoftwareMemoryRpActiveSchema(MetaParser):
     """ Schema for 
         * show platform software memory mdt-pubd RP active
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'module': {
             Any(): {
                 'allocated': int,
@@ -7295,7 +7293,7 @@ class ShowPlatformSoftwareMemoryRpActiveSchema(MetaParser):
                 Optional('frees'): int,
             }
         }
-    }
+    })
 
 class ShowPlatformSoftwareMemoryRpActive(ShowPlatformSoftwareMemoryRpActiveSchema):
     """ Parser for 
@@ -7392,7 +7390,7 @@ class ShowPlatformSoftwareMemoryRpActiveBriefSchema(MetaParser):
     """ Schema for 
         * show platform software memory mdt-pubd RP active brief
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'module': {
             Any(): {
                 'allocated': int,
@@ -7401,7 +7399,7 @@ class ShowPlatformSoftwareMemoryRpActiveBriefSchema(MetaParser):
                 'frees': int,
             }
         }
-    }
+    })
 
 class ShowPlatformSoftwareMemoryRpActiveBrief(ShowPlatformSoftwareMemoryRpActiveBriefSchema):
     """ Parser for 
@@ -7478,7 +7476,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsiteSchema(MetaParser):
     """ Schema for 
         * show platform software memory mdt-pubd RP active alloc callsite
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'callsite': {
             Any(): {
                 'thread_id': int,
@@ -7490,7 +7488,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsiteSchema(MetaParser):
                 'byte_diff': int
             }
         }
-    }
+    })
 
 class ShowPlatformSoftwareMemoryRpActiveAllocCallsite(ShowPlatformSoftwareMemoryRpActiveAllocCallsiteSchema):
     """ Parser for 
@@ -7561,7 +7559,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsiteBriefSchema(MetaParser):
     """ Schema for 
         * show platform software memory mdt-pubd RP active alloc callsite
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'tracekey': str,
         'callsite': {
             Any(): {
@@ -7570,7 +7568,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocCallsiteBriefSchema(MetaParser):
                 'diff_call': int,
             }
         }
-    }
+    })
 
 class ShowPlatformSoftwareMemoryRpActiveAllocCallsiteBrief(ShowPlatformSoftwareMemoryRpActiveAllocCallsiteBriefSchema):
     """ Parser for 
@@ -7621,7 +7619,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocTypeSchema(MetaParser):
     """ Schema for 
         * show platform software memory mdt-pubd RP active alloc type component
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('module'): {
             Any(): {
                 'allocated': int,
@@ -7642,7 +7640,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocTypeSchema(MetaParser):
                 'frees': int,
             }
         },
-    }
+    })
 
 class ShowPlatformSoftwareMemoryRpActiveAllocType(ShowPlatformSoftwareMemoryRpActiveAllocTypeSchema):
     """ Parser for 
@@ -7737,7 +7735,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocTypeBriefSchema(MetaParser):
     """ Schema for 
         * show platform software memory mdt-pubd RP active alloc type component brief
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'type': {
             Any(): {
                 'allocated': int,
@@ -7746,7 +7744,7 @@ class ShowPlatformSoftwareMemoryRpActiveAllocTypeBriefSchema(MetaParser):
                 'frees': int,
             }
         }
-    }
+    })
 
 class ShowPlatformSoftwareMemoryRpActiveAllocTypeBrief(ShowPlatformSoftwareMemoryRpActiveAllocTypeBriefSchema):
     """ Parser for 
@@ -20,6 +20,7 @@ from netaddr import IPAddress, IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, Default, Use
 
 # import parser utils
@@ -51,7 +52,7 @@ class ShowPolicyMapTypeSchema(MetaParser):
         * 'show policy-map interface',
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             Optional('service_group'): int,
             Optional('service_policy'): {
@@ -352,7 +353,7 @@ class ShowPolicyMapTypeSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
     BOOL_ACTION_LIST = ['drop', 'transmit', 'set_clp_transmit']
 
@@ -1439,7 +1440,7 @@ class ShowPolicyMapTargetClass(ShowPolicyMapTypeSuperParser, ShowPolicyMapTypeSc
 # ===================================
 class ShowPolicyMapSchema(MetaParser):
 
-    schema = {
+    schema = LazySchema(lambda: {
         'policy_map': {
             Any(): {
                 Optional('class'): {
@@ -1520,7 +1521,7 @@ class ShowPolicyMapSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 
@@ -4,6 +4,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -18,7 +19,7 @@ from genie.libs.parser.utils.common import Common
 
 class ShowStackPowerSchema(MetaParser):
     """Schema for show stack-power"""
-    schema = {
+    schema = LazySchema(lambda: {
         'power_stack': {
             Any(): {
                 'mode': str,
@@ -31,7 +32,7 @@ class ShowStackPowerSchema(MetaParser):
                 'power_supply_num': int
             },
         }
-    }
+    })
 
 
 class ShowStackPower(ShowStackPowerSchema):
@@ -82,7 +83,7 @@ class ShowStackPower(ShowStackPowerSchema):
 
 class ShowPowerInlineSchema(MetaParser):
     """Schema for show power inline """
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             Any(): {
                 'admin_state': str,
@@ -101,7 +102,7 @@ class ShowPowerInlineSchema(MetaParser):
                 'remaining': float
             }
         }
-    }
+    })
 
 
 class ShowPowerInline(ShowPowerInlineSchema):
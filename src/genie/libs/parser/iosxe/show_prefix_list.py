@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -24,7 +25,7 @@ class ShowIpPrefixListDetailSchema(MetaParser):
         show ip prefix-list detail
         show ipv6 prefix-list detail"""
 
-    schema = {'prefix_set_name':         
+    schema = LazySchema(lambda: {'prefix_set_name':         
                 {Any(): {
                     'prefix_set_name': str,
                     Optional('protocol'): str,
@@ -44,7 +45,7 @@ class ShowIpPrefixListDetailSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 class ShowIpPrefixListDetail(ShowIpPrefixListDetailSchema):
     """Parser for:
@@ -7,6 +7,7 @@ IOSXE parser for the following show command:
 import re
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 
 
@@ -17,7 +18,7 @@ class ShowProcessesMemoryPlatformSortedSchema(MetaParser):
 
 	''' Schema for "show processes memory platform sorted" '''
 
-	schema = {
+	schema = LazySchema(lambda: {
 		'system_memory':
 			{Optional('total'): str,
 			Optional('used'): str,
@@ -34,7 +35,7 @@ class ShowProcessesMemoryPlatformSortedSchema(MetaParser):
 					},
 				},
 			},
-		}
+		})
 
 
 # ==================================================
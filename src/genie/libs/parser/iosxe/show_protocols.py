@@ -11,6 +11,7 @@ from netaddr import IPAddress
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -22,7 +23,7 @@ class ShowIpProtocolsSchema(MetaParser):
 
     ''' Schema for "show ip protocols" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'protocols': {
             Optional('rip'): {
                 'vrf': {
@@ -271,7 +272,7 @@ class ShowIpProtocolsSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 # ==============================
 # Parser for 'show ip protocols'
@@ -1190,7 +1191,7 @@ class ShowIpv6ProtocolsSectionRipSchema(MetaParser):
     """Schema for
             show ipv6 protocols | sec rip
             show ipv6 protocols vrf {vrf} | sec rip"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -1212,7 +1213,7 @@ class ShowIpv6ProtocolsSectionRipSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 
 # ======================================================
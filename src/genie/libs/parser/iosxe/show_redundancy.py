@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -11,7 +12,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowRedundancySwitchoverHistorySchema(MetaParser):
     """Schema for show redundancy switchover history."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional("index"): {
             Any(): {
                 "current_active": int,
@@ -20,7 +21,7 @@ class ShowRedundancySwitchoverHistorySchema(MetaParser):
                 "switchover_time": str,
             },
         }
-    }
+    })
 
 
 # =======================================
@@ -5,6 +5,7 @@ show_rip.py
 '''
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
@@ -16,7 +17,7 @@ class ShowIpRipDatabaseSchema(MetaParser):
     """Schema for
             show ip rip database
             show ip rip database vrf {vrf}"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -45,7 +46,7 @@ class ShowIpRipDatabaseSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 # ======================================================
 #  parser for show ip rip database
@@ -183,7 +184,7 @@ class ShowIpv6RipSchema(MetaParser):
     """Schema for
             show ipv6 rip
             show ipv6 rip vrf {vrf}"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -230,7 +231,7 @@ class ShowIpv6RipSchema(MetaParser):
                 },
             }
         },
-    }
+    })
 
 
 # ======================================================
@@ -447,7 +448,7 @@ class ShowIpv6RipDatabaseSchema(MetaParser):
     """Schema for
             show ipv6 rip database
             show ipv6 rip database vrf {vrf}"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -470,7 +471,7 @@ class ShowIpv6RipDatabaseSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 # ======================================================
 #  parser for show ipv6 rip database
@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -11,7 +12,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowRomvarSchema(MetaParser):
     """Schema for show romvar."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "rommon_variables" : {
             "ps1": str,
             "switch_number": int,
@@ -36,7 +37,7 @@ class ShowRomvarSchema(MetaParser):
             Optional("bootldr"): str,
             Optional("crash"): str  
         }  
-    }
+    })
 
 
 # ================
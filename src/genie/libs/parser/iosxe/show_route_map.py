@@ -1,11 +1,12 @@
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
 class ShowRouteMapAllSchema(MetaParser):
     """Schema for show route-map all"""
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             Optional('description'): str,
             'statements': {
@@ -61,7 +62,7 @@ class ShowRouteMapAllSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowRouteMapAll(ShowRouteMapAllSchema):
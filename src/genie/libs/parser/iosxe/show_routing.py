@@ -4,6 +4,9 @@ show_route.py
 '''
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+                                                    CompiledMetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
@@ -110,9 +113,9 @@ class ShowIpv6RouteDistributor(MetaParser):
 # ====================================================
 #  schema for show ip route
 # ====================================================
-class ShowIpRouteSchema(MetaParser):
+class ShowIpRouteSchema(CompiledMetaParser):
     """Schema for show ip route"""
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         'vrf': {
             Any(): {
                 Optional('address_family'): {
@@ -170,7 +173,7 @@ class ShowIpRouteSchema(MetaParser):
                 },
             },
         },
-    }
+    }))
 
 
 # ====================================================
@@ -653,9 +656,9 @@ class ShowIpv6Route(ShowIpRoute):
 # ====================================================
 #  schema for show ipv6 route updated
 # ====================================================
-class ShowIpv6RouteUpdatedSchema(MetaParser):
+class ShowIpv6RouteUpdatedSchema(CompiledMetaParser):
     """Schema for show ipv6 route updated"""
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         'ipv6_unicast_routing_enabled': bool,
         'vrf': {
             Any(): {
@@ -691,7 +694,7 @@ class ShowIpv6RouteUpdatedSchema(MetaParser):
                 },
             },
         },
-    }
+    }))
 
 
 # ====================================================
@@ -1009,7 +1012,7 @@ class ShowIpv6RouteUpdated(ShowIpv6RouteUpdatedSchema):
 # ====================================================
 class ShowIpRouteWordSchema(MetaParser):
     """Schema for show ip route <WORD>"""
-    schema = {
+    schema = LazySchema(lambda: {
         'entry': {
             Any(): {
                 'ip': str,
@@ -1053,7 +1056,7 @@ class ShowIpRouteWordSchema(MetaParser):
             }
         },
         'total_prefixes': int,
-    }
+    })
 
 
 # ====================================================
@@ -1381,7 +1384,7 @@ class ShowIpRouteWord(ShowIpRouteWordSchema):
 # ====================================================
 class ShowIpv6RouteWordSchema(MetaParser):
     """Schema for show ipv6 route <WORD>"""
-    schema = {
+    schema = LazySchema(lambda: {
         'entry': {
             Any(): {
                 'ip': str,                
@@ -1403,7 +1406,7 @@ class ShowIpv6RouteWordSchema(MetaParser):
             }
         },
         'total_prefixes': int,
-    }
+    })
 
 
 # ====================================================
@@ -1450,7 +1453,7 @@ class ShowIpCefSchema(MetaParser):
                   show ip cef <prefix>
                   show ip cef <prefix> detail
                   show ip cef vrf <vrf> <prefix>"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -1482,7 +1485,7 @@ class ShowIpCefSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ====================================================
 #  parser  for show ip cef <ip>
@@ -1785,7 +1788,7 @@ class ShowIpRouteSummarySchema(MetaParser):
     """Schema for show ip route summary
                   show ip route vrf <vrf> summary
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
         Any():{
             'vrf_id': str,
@@ -1841,7 +1844,7 @@ class ShowIpRouteSummarySchema(MetaParser):
 
         }
     }
-    }
+    })
 
 # ====================================================
 #  parser for show ip route summary
@@ -1961,7 +1964,7 @@ class ShowIpRouteSummary(ShowIpRouteSummarySchema):
 class ShowIpCefInternalSchema(MetaParser):
     """Schema for show ip cef internal
                   show ip cef <ip> internal"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -2187,7 +2190,7 @@ class ShowIpCefInternalSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIpCefInternal(ShowIpCefInternalSchema):
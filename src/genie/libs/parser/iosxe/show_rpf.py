@@ -12,6 +12,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -27,7 +28,7 @@ class ShowIpRpfSchema(MetaParser):
         show ipv6 rpf <mroute address>
         show ipv6 rpf vrf <vrf> <mroute address>"""
 
-    schema = {'vrf':         
+    schema = LazySchema(lambda: {'vrf':         
                 {Any(): {
                     'source_address': str,
                     Optional('source_host'): str,
@@ -52,7 +53,7 @@ class ShowIpRpfSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 class ShowIpRpf(ShowIpRpfSchema):
     """Parser for:
@@ -13,6 +13,7 @@ from netaddr import IPAddress, IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, And, Default, Use
 
 # import parser utils
@@ -24,7 +25,7 @@ from genie.libs.parser.utils.common import Common
 # ==================================================
 class ShowRunPolicyMapSchema(MetaParser):
 
-	schema = {
+	schema = LazySchema(lambda: {
 		'policy_map': {
 			Any(): {
 				'class': {
@@ -51,7 +52,7 @@ class ShowRunPolicyMapSchema(MetaParser):
 				}
 			},
 		}
-	}
+	})
 
 
 # ===================================
@@ -200,7 +201,7 @@ class ShowRunPolicyMap(ShowRunPolicyMapSchema):
 # ==================================================
 class ShowRunInterfaceSchema(MetaParser):
 
-	schema = {
+	schema = LazySchema(lambda: {
 		'interfaces': {
 			Any(): {
 				Optional('authentication_control_direction'): str,
@@ -258,7 +259,7 @@ class ShowRunInterfaceSchema(MetaParser):
 				Optional('vrf'): str,
 			}
 		}
-	}
+	})
 
 
 # ==================================================
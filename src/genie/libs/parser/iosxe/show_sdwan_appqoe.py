@@ -3,17 +3,18 @@ import re
 
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema
 
 
 class ShowSdwanAppqoeTcpoptStatusSchema(MetaParser):
     ''' Schema for show sdwan appqoe tcpopt status'''
-    schema = {
+    schema = LazySchema(lambda: {
         'status': {
             'tcp_opt_operational_state': str,
             'tcp_proxy_operational_state': str
             }
-        }
+        })
 
 
 class ShowSdwanAppqoeTcpoptStatus(ShowSdwanAppqoeTcpoptStatusSchema):
@@ -62,7 +63,7 @@ class ShowSdwanAppqoeTcpoptStatus(ShowSdwanAppqoeTcpoptStatusSchema):
 
 class ShowSdwanAppqoeNatStatisticsSchema(MetaParser):
     ''' Schema for show sdwan appqoe nat-statistics'''
-    schema = {
+    schema = LazySchema(lambda: {
         'nat_statistics': {
             'insert_success': int,
             'delete_success': int,
@@ -73,7 +74,7 @@ class ShowSdwanAppqoeNatStatisticsSchema(MetaParser):
             'port_free_success': int,
             'port_free_failures': int
         }
-    }
+    })
 
 
 class ShowSdwanAppqoeNatStatistics(ShowSdwanAppqoeNatStatisticsSchema):
@@ -137,7 +138,7 @@ class ShowSdwanAppqoeNatStatistics(ShowSdwanAppqoeNatStatisticsSchema):
 
 class ShowSdwanAppqoeRmResourcesSchema(MetaParser):
     ''' Schema for show sdwan appqoe rm-resources'''
-    schema = {
+    schema = LazySchema(lambda: {
         'rm_resources': {
             'rm_global_resources': {
                 'max_services_memory_kb': int,
@@ -161,7 +162,7 @@ class ShowSdwanAppqoeRmResourcesSchema(MetaParser):
                     }
                 }
             }
-        }
+        })
 
 
 class ShowSdwanAppqoeRmResources(ShowSdwanAppqoeRmResourcesSchema):
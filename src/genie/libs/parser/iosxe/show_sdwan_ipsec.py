@@ -1,4 +1,5 @@
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any
 import re
 from collections import OrderedDict
@@ -11,7 +12,7 @@ from collections import OrderedDict
 class ShowSdwanIpsecInboundConnectionsSchema(MetaParser):
     """ Schema for "show sdwan ipsec inbound-connections" command """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "source_ip": {
             Any(): {
                 'destination_ip': {
@@ -28,7 +29,7 @@ class ShowSdwanIpsecInboundConnectionsSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # =================================================
@@ -39,7 +40,7 @@ class ShowSdwanIpsecInboundConnectionsSchema(MetaParser):
 class ShowSdwanIpsecOutboundConnectionsSchema(MetaParser):
     """ Schema for "show sdwan ipsec outbound-connections" command """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "source_ip": {
             Any(): {
                 'destination_ip': {
@@ -58,7 +59,7 @@ class ShowSdwanIpsecOutboundConnectionsSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # =================================================
@@ -67,7 +68,7 @@ class ShowSdwanIpsecOutboundConnectionsSchema(MetaParser):
 class ShowSdwanIpsecLocalsaSchema(MetaParser):
     """ Schema for "show sdwan ipsec local-sa <WORD>" command """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "local_sa": {
             'inbound': {
                 'spi': int,
@@ -86,7 +87,7 @@ class ShowSdwanIpsecLocalsaSchema(MetaParser):
                 'key_hash': str,
             },
         },
-    }
+    })
 
 
 # =================================================
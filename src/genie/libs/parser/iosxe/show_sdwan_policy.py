@@ -9,12 +9,13 @@
 import re
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 
 class ShowSdwanPolicyIpv6AccessListAssociationsSchema(MetaParser):
     ''' Schema for show sdwan policy ipv6 access list associations'''
-    schema = {
+    schema = LazySchema(lambda: {
         'name': {
             Any(): {
                 'interface_direction': {
@@ -24,7 +25,7 @@ class ShowSdwanPolicyIpv6AccessListAssociationsSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowSdwanPolicyIpv6AccessListAssociations(ShowSdwanPolicyIpv6AccessListAssociationsSchema):
@@ -123,7 +124,7 @@ class ShowSdwanPolicyAccessListAssociations(ShowSdwanPolicyIpv6AccessListAssocia
 
 class ShowSdwanPolicyAccessListCountersSchema(MetaParser):
     ''' Schema for show sdwan policy access-list-counters'''
-    schema = {
+    schema = LazySchema(lambda: {
         'name': {
             Any(): {
                 'counter_name': {
@@ -134,7 +135,7 @@ class ShowSdwanPolicyAccessListCountersSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 class ShowSdwanPolicyAccessListCounters(ShowSdwanPolicyAccessListCountersSchema):
 
@@ -7,11 +7,12 @@ import re
 
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 
 class ShowSdwanZonebfwdpSessionsSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'session_db': {
             Any(): {
                 'session_id': int,
@@ -34,7 +35,7 @@ class ShowSdwanZonebfwdpSessionsSchema(MetaParser):
                 Optional('application_type'): str
                 }
          }
-    }
+    })
 
 class ShowSdwanZonebfwdpSessions(ShowSdwanZonebfwdpSessionsSchema):
     """Parser for show sdwan zonebfwdp sessions
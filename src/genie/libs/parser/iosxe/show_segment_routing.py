@@ -24,6 +24,7 @@ import re
 
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # =============================================================
@@ -41,7 +42,7 @@ class ShowSegmentRoutingMplsConnectedPrefixSidMapSchema(MetaParser):
         * 'show segment-routing mpls connected-prefix-sid-map local ipv6'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'segment_routing':
             {'bindings':
                 {Optional('connected_prefix_sid_map'):
@@ -116,7 +117,7 @@ class ShowSegmentRoutingMplsConnectedPrefixSidMapSchema(MetaParser):
                     }
                 },
             },
-        }
+        })
 
 # ====================================================================
 # Parser for:
@@ -257,12 +258,12 @@ class ShowSegmentRoutingMplsGbSchema(MetaParser):
         * 'show segment-routing mpls gb'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'label_min': int,
         'label_max': int,
         'state': str,
         'default': str,
-        }
+        })
 
 
 # ==================================
@@ -317,12 +318,12 @@ class ShowSegmentRoutingMplsLBSchema(MetaParser):
     """Schema for show segment-routing mpls lb
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'label_min': int,
         'label_max': int,
         'state': str,
         'default': str
-    }
+    })
 
 class ShowSegmentRoutingMplsLB(ShowSegmentRoutingMplsLBSchema):
     """ Parser for show segment-routing mpls lb"""
@@ -370,9 +371,9 @@ class ShowSegmentRoutingMplsStateSchema(MetaParser):
     """Schema for show segment-routing mpls state
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'sr_mpls_state': str
-    }
+    })
 
 class ShowSegmentRoutingMplsState(ShowSegmentRoutingMplsStateSchema):
     """ Parser for show segment-routing mpls state"""
@@ -411,10 +412,10 @@ class ShowSegmentRoutingMplsLbLockSchema(MetaParser):
     """Schema for show segment-routing mpls lb lock
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'label_min': int,
         'label_max': int
-    }
+    })
 
 class ShowSegmentRoutingMplsLbLock(ShowSegmentRoutingMplsLbLockSchema):
     """ Parser for show segment-routing mpls lb lock"""
@@ -513,7 +514,7 @@ class ShowSegmentRoutingTrafficEngTopologySchema(MetaParser):
     """ Schema for 
         'show segment-routing traffic-eng topology ipv4'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         "nodes": {
             Any(): {
                 "ospf_router_id": str,
@@ -556,7 +557,7 @@ class ShowSegmentRoutingTrafficEngTopologySchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 class ShowSegmentRoutingTrafficEngTopology(ShowSegmentRoutingTrafficEngTopologySchema):
     """ Parser for 
@@ -744,7 +745,7 @@ class ShowSegmentRoutingTrafficEngPolicySchema(MetaParser):
         'show segment-routing traffic-eng policy name {name} detail'
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             "name": str,
             "color": int,
@@ -824,7 +825,7 @@ class ShowSegmentRoutingTrafficEngPolicySchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowSegmentRoutingTrafficEngPolicy(ShowSegmentRoutingTrafficEngPolicySchema):
@@ -1154,7 +1155,7 @@ class ShowSegmentRoutingMplsMappingServerSchema(MetaParser):
         * 'show segment-routing mpls mapping-server ipv6'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'segment_routing': {
                 'bindings': {
                     'mapping_server': {
@@ -1233,7 +1234,7 @@ class ShowSegmentRoutingMplsMappingServerSchema(MetaParser):
                     }
                 }
             }
-        }
+        })
         
 # ====================================================
 # Parser for:
@@ -1377,7 +1378,7 @@ class ShowSegmentRoutingMplsLbAssignedSidsSchema(MetaParser):
     """ Schema for:
             * show segment-routing mpls lb assigned-sids
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'segment_routing': {
             'sid': {
                 Any(): {
@@ -1392,7 +1393,7 @@ class ShowSegmentRoutingMplsLbAssignedSidsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowSegmentRoutingMplsLbAssignedSids(ShowSegmentRoutingMplsLbAssignedSidsSchema):
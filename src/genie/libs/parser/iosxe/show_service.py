@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
             Any, Optional
 
@@ -24,7 +25,7 @@ class ShowServiceGroupStateSchema(MetaParser):
 	Schema for show service-group state
 	"""
 
-    schema = {'group': {Any(): {'state': str}}}
+    schema = LazySchema(lambda: {'group': {Any(): {'state': str}}})
 
 
 class ShowServiceGroupState(ShowServiceGroupStateSchema):
@@ -68,7 +69,7 @@ class ShowServiceGroupStatsSchema(MetaParser):
 	Schema for show service-group stats
 	"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'service_group_statistics': {
             'global': {
                 'num_of_groups': int,
@@ -85,7 +86,7 @@ class ShowServiceGroupStatsSchema(MetaParser):
                 'members_left': int
             }
         }
-    }
+    })
 
 
 class ShowServiceGroupStats(ShowServiceGroupStatsSchema):
@@ -237,7 +238,7 @@ class ShowServiceGroupTrafficStatsSchema(MetaParser):
 		show service-group traffic-stats
 		show service-group traffic-stats <group> """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'group': {
             Any(): {
                 'pkts_in': int,
@@ -246,7 +247,7 @@ class ShowServiceGroupTrafficStatsSchema(MetaParser):
                 'bytes_out': int,
             },
         }
-    }
+    })
 
 
 class ShowServiceGroupTrafficStats(ShowServiceGroupTrafficStatsSchema):
@@ -298,7 +299,7 @@ class ShowServiceGroupTrafficStats(ShowServiceGroupTrafficStatsSchema):
 # ========================================================================
 class ShowServiceInsertionTypeAppqoeServiceNodeGroupSchema(MetaParser):
     """ Schema for show service-insertion type appqoe service-node-group """
-    schema = {
+    schema = LazySchema(lambda: {
         'service_node_group_name': {
             str: {
                 'service_context': str,
@@ -317,7 +318,7 @@ class ShowServiceInsertionTypeAppqoeServiceNodeGroupSchema(MetaParser):
         'cluster_protocol_last_sent_sequence_number': int,
         'cluster_protocol_last_received_sequence_number': int,
         'cluster_protocol_last_received_ack_number': int
-    }
+    })
 
 
 # ========================================================================
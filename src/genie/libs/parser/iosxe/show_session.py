@@ -2,17 +2,18 @@
 
 """
 import re
-import genie.parsergen as pg
+from genie.libs.parser.utils.table import Table
 # import parser utils
 from genie.libs.parser.utils.common import Common
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
 class ShowLineSchema(MetaParser):
     """Schema for show line"""
-    schema = {
+    schema = LazySchema(lambda: {
         'tty': {
             Any(): {
                 'active': bool,
@@ -30,7 +31,7 @@ class ShowLineSchema(MetaParser):
                 'int': str,
             },
         }
-    }
+    })
 
 
 class ShowLine(ShowLineSchema):
@@ -95,7 +96,7 @@ class ShowLine(ShowLineSchema):
 
 class ShowUsersSchema(MetaParser):
     """Schema for show users"""
-    schema = {
+    schema = LazySchema(lambda: {
         'line': {
             Any(): {
                 'active': bool,
@@ -116,7 +117,7 @@ class ShowUsersSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowUsers(ShowUsersSchema):
@@ -124,6 +125,14 @@ class ShowUsers(ShowUsersSchema):
 
     cli_command = 'show users'
 
+    line_table = Table(index=[1],
+                       header_fields=[' ', ' Line', 'User', 'Host\(s\)', 'Idle', '  Location'],
+                       label_fields=['busy', 'line', 'user', 'host', 'idle', 'location'],
+                       table_terminal_pattern='Interface\s+User\s+Mode\s+Idle\s+Peer\s+Address')
+
+    interface_table = Table(index=[0,1],
+                            header_fields=['Interface', 'User', 'Mode', 'Idle', 'Peer Address'])
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -133,14 +142,8 @@ class ShowUsers(ShowUsersSchema):
         # initial return dictionary
         ret_dict = {}
 
-        pg_result = pg.oper_fill_tabular(device_output=out, device_os='iosxe',
-                                         index=[1],
-                                         header_fields=[' ', ' Line', 'User', 'Host\(s\)', 'Idle', '  Location'],
-                                         label_fields=['busy', 'line', 'user', 'host', 'idle', 'location'],
-                                         table_terminal_pattern='Interface\s+User\s+Mode\s+Idle\s+Peer\s+Address')
-
         # returns a dictionary
-        pg_entries = pg_result.entries
+        pg_entries = self.line_table.entries(out)
         line_dict = {}
 
         # ============= iosxe pg_entries ================
@@ -218,12 +221,7 @@ class ShowUsers(ShowUsersSchema):
         # unknown      NETCONF(ONEP)      com.cisco.ne 00:00:49
         # unknown      a(ONEP)            com.cisco.sy 00:00:49
 
-        interface_result = pg.oper_fill_tabular(device_output=out,
-                                                device_os='iosxe',
-                                                index=[0,1],
-                                                header_fields=['Interface', 'User', 'Mode', 'Idle', 'Peer Address'])
-
-        interface_entries = interface_result.entries
+        interface_entries = self.interface_table.entries(out)
 
         # ========= interface_entries =====================
         # {'unknown': {'NETCONF(ONEP)': {'Idle': '00:00:49',
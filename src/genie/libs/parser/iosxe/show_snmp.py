@@ -10,23 +10,26 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+                                                    CompiledMetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 
 # ==========================
 # Schema for 'show snmp mib'
 # ==========================
-class ShowSnmpMibSchema(MetaParser):
+class ShowSnmpMibSchema(CompiledMetaParser):
 
     ''' Schema for "show snmp mib" '''
 
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         Any(): 
             {Optional(Any()): 
                 {Optional(Any()): str,
                 },
             },
-        }
+        }))
 
 
 # ==========================
@@ -89,7 +92,7 @@ class ShowSnmpSchema(MetaParser):
 
     ''' Schema for "show snmp" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         "chassis": str,
         "contact": str,
         Optional("location"): Optional(str),
@@ -131,7 +134,7 @@ class ShowSnmpSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ==========================
 # Parser for 'show snmp'
@@ -420,7 +423,7 @@ class ShowSnmp(ShowSnmpSchema):
 class ShowSnmpUserSchema(MetaParser):
     """Schema for show snmp user."""
 
-    schema = { 
+    schema = LazySchema(lambda: { 
         "user_name" : {
              Any(): {
                 Optional("access_list"): str,
@@ -431,7 +434,7 @@ class ShowSnmpUserSchema(MetaParser):
                 "storage_type": str
             }
         }
-    }
+    })
     
 
 # ===================
@@ -537,7 +540,7 @@ class ShowSnmpUser(ShowSnmpUserSchema):
 class ShowSnmpGroupSchema(MetaParser):
     """Schema for show snmp group."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional(int): {
             "groupname": str,
             "sec_model": str,
@@ -552,7 +555,7 @@ class ShowSnmpGroupSchema(MetaParser):
             }
         }
         
-    }
+    })
 
 
 # ====================
@@ -694,7 +697,7 @@ class ShowSnmpGroup(ShowSnmpGroupSchema):
 class ShowSnmpUserSchema(MetaParser):
     """Schema for show snmp user."""
 
-    schema = { 
+    schema = LazySchema(lambda: { 
         "user_name" : {
              Any(): {
                 Optional("access_list"): str,
@@ -705,7 +708,7 @@ class ShowSnmpUserSchema(MetaParser):
                 "storage_type": str
             }
         }
-    }
+    })
 
 
 # ===================
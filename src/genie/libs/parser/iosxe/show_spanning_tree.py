@@ -13,6 +13,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -27,7 +28,7 @@ from genie.libs.parser.utils.common import Common
 
 class ShowSpanningTreeSummarySchema(MetaParser):
     """Schema for show spanning-tree summary"""
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('etherchannel_misconfig_guard'): bool,
         Optional('extended_system_id'): bool,
         Optional('portfast_default'): bool,
@@ -65,7 +66,7 @@ class ShowSpanningTreeSummarySchema(MetaParser):
             Optional('num_of_msts'): int,
             Optional('num_of_vlans'): int,
         }
-    }
+    })
 class ShowSpanningTreeSummary(ShowSpanningTreeSummarySchema):
     """Parser for show show spanning-tree summary"""
 
@@ -213,7 +214,7 @@ class ShowSpanningTreeSummary(ShowSpanningTreeSummarySchema):
 
 class ShowSpanningTreeDetailSchema(MetaParser):
     """Schema for show spanning-tree detail"""
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {     # mstp, pvst, rapid_pvst
             Optional('domain'): str,
             Optional('pvst_id'): str,
@@ -285,7 +286,7 @@ class ShowSpanningTreeDetailSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 
 class ShowSpanningTreeDetail(ShowSpanningTreeDetailSchema):
@@ -572,7 +573,7 @@ class ShowSpanningTreeDetail(ShowSpanningTreeDetailSchema):
 
 class ShowSpanningTreeMstDetailSchema(MetaParser):
     """Schema for show spanning-tree mst detail"""
-    schema = {
+    schema = LazySchema(lambda: {
         'mst_instances': {
             Any(): {
                 'mst_id': int,
@@ -623,7 +624,7 @@ class ShowSpanningTreeMstDetailSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowSpanningTreeMstDetail(ShowSpanningTreeMstDetailSchema):
@@ -811,7 +812,7 @@ class ShowSpanningTreeMstDetail(ShowSpanningTreeMstDetailSchema):
 
 class ShowErrdisableRecoverySchema(MetaParser):
     """Schema for show errdisable recovery"""
-    schema = {
+    schema = LazySchema(lambda: {
         'timer_status': {
             Any(): bool,
         },
@@ -823,7 +824,7 @@ class ShowErrdisableRecoverySchema(MetaParser):
                 'time_left': int,
             },
         }
-    }
+    })
 
 
 class ShowErrdisableRecovery(ShowErrdisableRecoverySchema):
@@ -882,7 +883,7 @@ class ShowErrdisableRecovery(ShowErrdisableRecoverySchema):
 
 class ShowSpanningTreeSchema(MetaParser):
     """Schema for show spanning-tree [mst|vlan <WORD>]"""
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {     # mstp, pvst, rapid_pvst
             Any(): {   # mst_instances, vlans
                 Any(): {
@@ -914,7 +915,7 @@ class ShowSpanningTreeSchema(MetaParser):
                 }
             }
         }        
-    }
+    })
 
 
 class ShowSpanningTree(ShowSpanningTreeSchema):
@@ -1062,7 +1063,7 @@ class ShowSpanningTree(ShowSpanningTreeSchema):
 
 class ShowSpanningTreeMstConfigurationSchema(MetaParser):
     """Schema for show spanning-tree mst configuration"""
-    schema = {
+    schema = LazySchema(lambda: {
         'mstp': {
             'name': str,
             'revision': int,
@@ -1073,7 +1074,7 @@ class ShowSpanningTreeMstConfigurationSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowSpanningTreeMstConfiguration(ShowSpanningTreeMstConfigurationSchema):
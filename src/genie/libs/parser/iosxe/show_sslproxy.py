@@ -3,11 +3,12 @@ import re
 
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Optional
 
 class ShowSslproxyStatusSchema(MetaParser):
     ''' Schema for show sslproxy status'''
-    schema = {
+    schema = LazySchema(lambda: {
         'configuration': {
             Optional('ca_cert_bundle'): str,
             'ca_tp_label': str,
@@ -28,7 +29,7 @@ class ShowSslproxyStatusSchema(MetaParser):
             'tcp_proxy_operational_state': str,
             'clear_mode': str,
         }
-    }
+    })
 
 
 class ShowSslproxyStatus(ShowSslproxyStatusSchema):
@@ -119,7 +120,7 @@ class ShowSslproxyStatus(ShowSslproxyStatusSchema):
 
 class ShowSslProxyStatisticsSchema(MetaParser):
     ''' Schema for show sslproxy statistics'''
-    schema = {
+    schema = LazySchema(lambda: {
         "sslproxy_statistics":{
             "connection_statistics":{
                 "total_connections": int,
@@ -379,7 +380,7 @@ class ShowSslProxyStatisticsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowSslProxyStatistics(ShowSslProxyStatisticsSchema):
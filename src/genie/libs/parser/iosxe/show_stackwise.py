@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -11,7 +12,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowStackwiseVirtualDualActiveDetectionSchema(MetaParser):
     """Schema for show_stackwise_virtual_dual_active_detection."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "dad_port": {
             "switches": {
                 int: {
@@ -21,7 +22,7 @@ class ShowStackwiseVirtualDualActiveDetectionSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =================================================
@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Optional
 
 
@@ -11,7 +12,7 @@ from genie.metaparser.util.schemaengine import Optional
 class ShowStackwiseVirtualSchema(MetaParser):
     """Schema for show stackwise-virtual."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "domain": int,
         "enabled": bool,
         Optional("switches"): {
@@ -23,7 +24,7 @@ class ShowStackwiseVirtualSchema(MetaParser):
             },
           }
         },
-    }
+    })
 
 
 # ===========================
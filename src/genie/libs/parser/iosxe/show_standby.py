@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -30,7 +31,7 @@ def regexp(expression):
 class ShowStandbyInternalSchema(MetaParser):
     """Schema for show standby internal"""
     schema = \
-        {
+        LazySchema(lambda: {
             'hsrp_common_process_state': str,
             Optional('msgQ_size'): int,
             Optional('msgQ_max_size'): int,
@@ -55,7 +56,7 @@ class ShowStandbyInternalSchema(MetaParser):
                     'group': int,
                 }
             }
-        }
+        })
 
 class ShowStandbyInternal(ShowStandbyInternalSchema):
     """Parser for show standby internal"""
@@ -206,7 +207,7 @@ class ShowStandbyInternal(ShowStandbyInternalSchema):
 class ShowStandbyAllSchema(MetaParser):
     """Schema for show standby all"""
     schema = \
-    {
+    LazySchema(lambda: {
         Any(): {
             Optional('use_bia'): bool,
             Optional('redirects_disable'): bool,
@@ -368,7 +369,7 @@ class ShowStandbyAllSchema(MetaParser):
                 }
             }
         }   
-    }
+    })
 
 class ShowStandbyAll(ShowStandbyAllSchema):
     """Parser for show standby all
@@ -967,14 +968,14 @@ class ShowStandbyAll(ShowStandbyAllSchema):
 
 class ShowStandbyDelaySchema(MetaParser):
     """Schema for show standby delay"""
-    schema = {
+    schema = LazySchema(lambda: {
                 Any(): {
                     'delay': {
                         'minimum_delay': int,
                         'reload_delay': int,
                     }
                 }
-             }
+             })
 
 class ShowStandbyDelay(ShowStandbyDelaySchema):
     """Parser for show standby delay"""
@@ -4,6 +4,7 @@ show_static_route.py
 '''
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
@@ -14,7 +15,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 # ====================================================
 class ShowIpStaticRouteSchema(MetaParser):
     """Schema for show ip static route"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('address_family'): {
@@ -46,7 +47,7 @@ class ShowIpStaticRouteSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ====================================================
@@ -190,7 +191,7 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
 # ====================================================
 class ShowIpv6StaticDetailSchema(MetaParser):
     """Schema for show ipv6 static detail"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('address_family'): {
@@ -230,7 +231,7 @@ class ShowIpv6StaticDetailSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ====================================================
@@ -4,6 +4,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                                Any, \
                                                Optional, \
@@ -15,14 +16,14 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 class ShowClockSchema(MetaParser):
     """Schema for show clock"""
-    schema = {
+    schema = LazySchema(lambda: {
         'timezone': str,
         'day': str,
         'day_of_week': str,
         'month': str,
         'year': str,
         'time': str,
-    }
+    })
 
 
 class ShowClock(ShowClockSchema):
@@ -3,11 +3,12 @@ import re
 
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Optional
 
 class ShowTcpproxyStatusSchema(MetaParser):
     ''' Schema for show tcpproxy status'''
-    schema = {
+    schema = LazySchema(lambda: {
         'configuration': {
             'vpg_name': str,
             'vpg_ip_addr': str,
@@ -18,7 +19,7 @@ class ShowTcpproxyStatusSchema(MetaParser):
         'status': {
             'operational_state': str,
         }
-    }
+    })
 
 
 class ShowTcpproxyStatus(ShowTcpproxyStatusSchema):
@@ -87,7 +88,7 @@ class ShowTcpproxyStatus(ShowTcpproxyStatusSchema):
 
 class ShowTcpProxyStatisticsSchema(MetaParser):
     ''' Schema for show tcpproxy statistics'''
-    schema = {
+    schema = LazySchema(lambda: {
         'tcpproxy_statistics':{
             'total_connections': int,
             'max_concurrent_connections': int,
@@ -238,7 +239,7 @@ class ShowTcpProxyStatisticsSchema(MetaParser):
             Optional('aoim_sync_completed'): int,
             Optional('aoim_sync_errored'): int
             }
-        }
+        })
 
 
 class ShowTcpProxyStatistics(ShowTcpProxyStatisticsSchema):
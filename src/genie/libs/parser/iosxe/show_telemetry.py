@@ -19,6 +19,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Optional, Any, Use, Schema
 
 # pyATS
@@ -31,7 +32,7 @@ class ShowTelemetryIETFSubscriptionSchema(MetaParser):
         * show telemetry ietf subscription {sub_id} detail
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'id':{
             int: {
             Optional('type'): str,
@@ -61,7 +62,7 @@ class ShowTelemetryIETFSubscriptionSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowTelemetryIETFSubscription(ShowTelemetryIETFSubscriptionSchema):
     '''parser for:
@@ -285,7 +286,7 @@ class ShowTelemetryIETFSubscriptionReceiverSchema(MetaParser):
         * show telemetry ietf subscription dynamic
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'id':{
             int: {
                 'address': str,
@@ -297,7 +298,7 @@ class ShowTelemetryIETFSubscriptionReceiverSchema(MetaParser):
                 Optional('explanation'): str,
             }
         }
-    }
+    })
 
 class ShowTelemetryIETFSubscriptionReceiver(ShowTelemetryIETFSubscriptionReceiverSchema):
     '''parser for:
@@ -418,7 +419,7 @@ class ShowTelemetryIETFSubscriptionReceiver(ShowTelemetryIETFSubscriptionReceive
 class ShowTelemetryInternalConnectionSchema(MetaParser):
     """Schema for show telemetry internal connection."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional("peer_address"): str,
         Optional("port"): int,
         Optional("profile"): str,
@@ -435,7 +436,7 @@ class ShowTelemetryInternalConnectionSchema(MetaParser):
                 "vrf": int,
             },
         },
-    }
+    })
 
 
 # =======================================
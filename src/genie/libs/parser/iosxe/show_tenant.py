@@ -10,13 +10,14 @@
 import re
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 
 
 class ShowTenantSummarySchema(MetaParser):
     ''' Schema for show tenant-summary'''
-    schema = {
+    schema = LazySchema(lambda: {
         'active_tenants_num': int,
         'max_tenants': int,
         'tenant_name': {
@@ -25,7 +26,7 @@ class ShowTenantSummarySchema(MetaParser):
                     'tenant_vpnid': int,
                     },
                 }
-            }
+            })
 
 class ShowTenantSummary(ShowTenantSummarySchema):
 
@@ -76,7 +77,7 @@ class ShowTenantOmpSummarySchema(MetaParser):
     ''' Schema for
         *'show tenant {tenant_name} omp summary'
     '''
-    schema = {'tenant_name':
+    schema = LazySchema(lambda: {'tenant_name':
                   {Any(): {
                        'admin_state': str,
                        'alert_received': int,
@@ -113,7 +114,7 @@ class ShowTenantOmpSummarySchema(MetaParser):
                        'vsmart_peers': int
                   }
              }
-       }
+       })
 
 class ShowTenantOmpSummary(ShowTenantOmpSummarySchema):
 
@@ -187,7 +188,7 @@ class ShowTenantOmpPeersSchema(MetaParser):
     ''' Schema for
         *'show tenant {tenant_name} omp peers'
     '''
-    schema = {'tenant_name':
+    schema = LazySchema(lambda: {'tenant_name':
                   {Any():
                        {'peer':
                             {Any():
@@ -204,7 +205,7 @@ class ShowTenantOmpPeersSchema(MetaParser):
                             },
                        },
                   },
-              }
+              })
 
 class ShowTenantOmpPeers(ShowTenantOmpPeersSchema):
 
@@ -259,12 +260,12 @@ class ShowTenantOmpRoutesAdvertisedSchema(MetaParser):
         *'show tenant {tenant_name} omp routes advertised'
         *'show tenant {tenant_name} omp routes vpn {vpnid} advertised'
     '''
-    schema = {'vpn':
+    schema = LazySchema(lambda: {'vpn':
                   {Any():
                        {'prefix': list
                         }
                    }
-              }
+              })
 
 class ShowTenantOmpRoutesAdvertised(ShowTenantOmpRoutesAdvertisedSchema):
     """ Parser for
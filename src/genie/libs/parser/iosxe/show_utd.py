@@ -3,11 +3,12 @@ import re
 
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 class ShowSdwanUtdEngineSchema(MetaParser):
     ''' Schema for show sdwan utd engine'''
-    schema = {
+    schema = LazySchema(lambda: {
         'version': str,
         'profile': str,
         'status': str,
@@ -21,7 +22,7 @@ class ShowSdwanUtdEngineSchema(MetaParser):
                 'reason': str
                 }
             }
-        }
+        })
 
 
 class ShowSdwanUtdEngine(ShowSdwanUtdEngineSchema):
@@ -90,7 +91,7 @@ class ShowSdwanUtdEngine(ShowSdwanUtdEngineSchema):
 
 class ShowUtdEngineStandardStatusSchema(MetaParser):
     ''' Schema for show utd engine standard status'''
-    schema = {
+    schema = LazySchema(lambda: {
         'engine_version': str,
         'profile': str,
         'system_memory': {
@@ -115,7 +116,7 @@ class ShowUtdEngineStandardStatusSchema(MetaParser):
             'next_update_scheduled_at': str,
             'current_status': str
             }
-        }
+        })
 
 
 class ShowUtdEngineStandardStatus(ShowUtdEngineStandardStatusSchema):
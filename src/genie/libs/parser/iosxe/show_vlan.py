@@ -6,6 +6,7 @@ import re
 import logging
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
@@ -32,7 +33,7 @@ def regexp(expression):
 # ====================================================
 class ShowVlanSchema(MetaParser):
     """Schema for show vlan"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vlans':{
             Any():{
                 Optional('vlan_id'): str,
@@ -66,7 +67,7 @@ class ShowVlanSchema(MetaParser):
                     }
                 },
             },
-        }
+        })
 
 # ====================================================
 #  parser for show vlan
@@ -340,14 +341,14 @@ class ShowVlan(ShowVlanSchema):
 
 class ShowVlanMtuSchema(MetaParser):
     """Schema for show vlan mtu"""
-    schema = {'vlan_id':
+    schema = LazySchema(lambda: {'vlan_id':
                 {Any():
                      {'vlan_mtu': str,
                       'vlan_min_mtu': str,
                       'vlan_max_mtu': str,
                       'mtu_mismatch': str}
                 },
-            }
+            })
 
 
 class ShowVlanMtu(ShowVlanMtuSchema):
@@ -399,7 +400,7 @@ class ShowVlanMtu(ShowVlanMtuSchema):
 
 class ShowVlanAccessMapSchema(MetaParser):
     """Schema for show vlan access map"""
-    schema = {'access_map_id':
+    schema = LazySchema(lambda: {'access_map_id':
                 {Any():
                     {'access_map_sequence':
                         {Any():
@@ -409,7 +410,7 @@ class ShowVlanAccessMapSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 class ShowVlanAccessMap(ShowVlanAccessMapSchema):
     """Parser for show vlan access-map"""
@@ -471,11 +472,11 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
 
 class ShowVlanRemoteSpanSchema(MetaParser):
     """Schema for show vlan remote-span"""
-    schema = {'vlan_id':
+    schema = LazySchema(lambda: {'vlan_id':
                 {Any():
                     {'vlan_is_remote_span':bool}
                 },
-            }
+            })
 
 class ShowVlanRemoteSpan(ShowVlanRemoteSpanSchema):
     """Parser for show vlan remote-span"""
@@ -518,11 +519,11 @@ class ShowVlanRemoteSpan(ShowVlanRemoteSpanSchema):
 
 class ShowVlanFilterSchema(MetaParser):
     """Schema for show vlan filter"""
-    schema = {'vlan_id':
+    schema = LazySchema(lambda: {'vlan_id':
                 {Any():
                     {'access_map_tag':str}
                 },
-            }
+            })
 
 class ShowVlanFilter(ShowVlanFilterSchema):
     """Parser for show vlan filter"""
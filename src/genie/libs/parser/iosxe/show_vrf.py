@@ -13,6 +13,7 @@ import xmltodict
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -25,7 +26,7 @@ class ShowVrfSchema(MetaParser):
             show vrf
             show vrf {vrf}
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('route_distinguisher'): str,
@@ -33,7 +34,7 @@ class ShowVrfSchema(MetaParser):
                 Optional('interfaces'): list
             }
         }
-    }
+    })
 
 
 class ShowVrf(ShowVrfSchema):
@@ -121,7 +122,7 @@ class ShowVrfDetailSchema(MetaParser):
         * 'show ip vrf detail'
         * 'show ip vrf detail <vrf>'"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             Optional('vrf_id'):  int,
             Optional('description'):  str,
@@ -172,7 +173,7 @@ class ShowVrfDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowVrfDetailSuperParser(ShowVrfDetailSchema):
     """Super Paser for:
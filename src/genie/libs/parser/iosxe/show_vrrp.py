@@ -1,4 +1,5 @@
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 import re
 
@@ -8,7 +9,7 @@ import re
 
 class ShowVrrpSchema(MetaParser):
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             Any(): {
                 'group': {
@@ -44,7 +45,7 @@ class ShowVrrpSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowVrrp(ShowVrrpSchema):
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # =============================================
@@ -18,11 +19,11 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 class ShowVtpPasswordSchema(MetaParser):
     """Schema for show vtp password"""
 
-    schema = {'vtp': {
+    schema = LazySchema(lambda: {'vtp': {
                 'configured': bool,
                 Optional('password'): str,
         }
-    }
+    })
 
 
 class ShowVtpPassword(ShowVtpPasswordSchema):
@@ -73,7 +74,7 @@ class ShowVtpPassword(ShowVtpPasswordSchema):
 class ShowVtpStatusSchema(MetaParser):
     """Schema for show vtp status"""
 
-    schema = {'vtp': {
+    schema = LazySchema(lambda: {'vtp': {
                 Optional('version_capable'): list,
                 'version': str,
                 Optional('domain_name'): str,
@@ -118,7 +119,7 @@ class ShowVtpStatusSchema(MetaParser):
                     }
                 },
             }
-        }
+        })
 
 class ShowVtpStatus(ShowVtpStatusSchema):
     """Parser for show vtp status """
@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -12,7 +13,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowWirelessProfilePolicyDetailedSchema(MetaParser):
     """Schema for show wireless profile policy detailed {policy_name}."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "policy_profile_name" : str,
         "description": str,
         "status": str,
@@ -134,7 +135,7 @@ class ShowWirelessProfilePolicyDetailedSchema(MetaParser):
             "2.4ghz_atf_policy": str,
             "5ghz_atf_policy": str
         }
-    }
+    })
 
 
 # ==========================================
@@ -1045,7 +1046,7 @@ class ShowWirelessProfilePolicyDetailed(ShowWirelessProfilePolicyDetailedSchema)
 class ShowWirelessCtsSummarySchema(MetaParser):
     """Schema for show wireless cts summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "local_mode_cts_configuration": {
             "policy_profile_name": {
                 Optional(Any()): {
@@ -1063,7 +1064,7 @@ class ShowWirelessCtsSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ==============================
@@ -1174,7 +1175,7 @@ class ShowWirelessCtsSummary(ShowWirelessCtsSummarySchema):
 class ShowWirelessFabricClientSummarySchema(MetaParser):
     """Schema for show wireless fabric client summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "number_of_fabric_clients" : int,
         Optional("mac_address") : {
             Optional(str) : {
@@ -1185,7 +1186,7 @@ class ShowWirelessFabricClientSummarySchema(MetaParser):
                 Optional("method") : str,
             }
         }
-    }
+    })
 
 # ========================================
 # Parser for:
@@ -1277,7 +1278,7 @@ class ShowWirelessFabricClientSummary(ShowWirelessFabricClientSummarySchema):
 class ShowWirelessFabricSummarySchema(MetaParser):
     """Schema for show wireless fabric summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "fabric_status": str,
         Optional("control_plane"): {
             Optional("ip_address"): {
@@ -1299,13 +1300,13 @@ class ShowWirelessFabricSummarySchema(MetaParser):
                 }
             }
         }
-    }                    
+    })                    
 #  * 'show wireless client summary'
 # =================================
 class ShowWirelessClientSummarySchema(MetaParser):
     """Schema for show wireless client summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "wireless_client_summary": {
             "wireless_client_count": int,
             Optional("included_clients"): {
@@ -1334,7 +1335,7 @@ class ShowWirelessClientSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =================================
@@ -1471,7 +1472,7 @@ class ShowWirelessFabricSummary(ShowWirelessFabricSummarySchema):
 class ShowWirelessClientSummarySchema(MetaParser):
     """Schema for show wireless client summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "wireless_client_summary": {
             "wireless_client_count": int,
             Optional("included_clients"): {
@@ -1500,7 +1501,7 @@ class ShowWirelessClientSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # =================================
 # Parser for:
@@ -1693,7 +1694,7 @@ class ShowWirelessClientSummary(ShowWirelessClientSummarySchema):
 class ShowWirelessMobilityApListSchema(MetaParser):
     """Schema for show wireless mobility ap-list."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "ap_name": {
             Any(): {
                 "ap_radio_mac": str,
@@ -1701,7 +1702,7 @@ class ShowWirelessMobilityApListSchema(MetaParser):
                 "learnt_from": str,
             }
         }
-    }
+    })
 
 
 # ===================================
@@ -1775,7 +1776,7 @@ class ShowWirelessMobilityApList(ShowWirelessMobilityApListSchema):
 class ShowWirelessFabricClientSummarySchema(MetaParser):
     """Schema for show wireless fabric client summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "number_of_fabric_clients" : int,
         Optional("mac_address") : {
             Optional(str) : {
@@ -1786,7 +1787,7 @@ class ShowWirelessFabricClientSummarySchema(MetaParser):
                 Optional("method") : str,
             }
         }
-    }
+    })
 
 # ========================================
 # Parser for:
@@ -1878,7 +1879,7 @@ class ShowWirelessFabricClientSummary(ShowWirelessFabricClientSummarySchema):
 class ShowWirelessMobilitySummarySchema(MetaParser):
     """Schema for show wireless mobility summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "controller_config": {
             "group_name": str,
             "ipv4": str,
@@ -1901,7 +1902,7 @@ class ShowWirelessMobilitySummarySchema(MetaParser):
             "multi_ipv4": str,
             "multi_ipv6": str,
         },
-    }
+    })
 
 
 # ===================================
@@ -2008,7 +2009,7 @@ class ShowWirelessMobilitySummary(ShowWirelessMobilitySummarySchema):
 class ShowWirelessProfilePolicySummarySchema(MetaParser):
     """Schema for show wireless profile policy summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "policy_count": int,
         "policy_name": {
             Any(): {
@@ -2016,7 +2017,7 @@ class ShowWirelessProfilePolicySummarySchema(MetaParser):
               "status": str
             },
         }
-    }
+    })
 
 # =========================================
 # Parser for:
@@ -2101,7 +2102,7 @@ class ShowWirelessProfilePolicySummary(ShowWirelessProfilePolicySummarySchema):
 class ShowWirelessStatsApJoinSummarySchema(MetaParser):
     """Schema for show wireless stats ap join summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "ap_count": int,
         "base_mac": {
             Any(): {
@@ -2113,7 +2114,7 @@ class ShowWirelessStatsApJoinSummarySchema(MetaParser):
                 "visitors_mac": str,
             }
         },
-    }
+    })
 
 # ========================================
 # Parser for:
@@ -2198,7 +2199,7 @@ class ShowWirelessStatsApJoinSummary(ShowWirelessStatsApJoinSummarySchema):
 class ShowWirelessClientMacDetailSchema(MetaParser):
     """Schema for show wireless client mac {mac_address} detail."""
 
-    schema = {
+    schema = LazySchema(lambda: {
           "client_mac_address": str,
           "client_mac_type": str,
           "client_ipv4_address": str,
@@ -2370,7 +2371,7 @@ class ShowWirelessClientMacDetailSchema(MetaParser):
           },
           "max_client_protocol_capability": str,
           "cellular_capability": str
-          }
+          })
 
 
 # ====================================
@@ -3007,7 +3008,7 @@ class ShowWirelessClientMacDetail(ShowWirelessClientMacDetailSchema):
 class ShowWirelessFabricVnidMappingSchema(MetaParser):
     """Schema for show wireless fabric vnid mapping."""
 
-    schema = {
+    schema = LazySchema(lambda: {
       "fabric_vnid_mapping" : {
         "name": {
           str : {
@@ -3019,7 +3020,7 @@ class ShowWirelessFabricVnidMappingSchema(MetaParser):
           }
         }
       }
-    }
+    })
     
     
 # ======================================    
@@ -3099,7 +3100,7 @@ class ShowWirelessFabricVnidMapping(ShowWirelessFabricVnidMappingSchema):
 class ShowWirelessStatsClientDeleteReasonsSchema(MetaParser):
     """Schema for show wireless stats client delete reasons."""
 
-    schema = {
+    schema = LazySchema(lambda: {
             "total_client_delete_reasons": {
                 "controller_deletes": {
                     "no_operation": int,
@@ -3316,7 +3317,7 @@ class ShowWirelessStatsClientDeleteReasonsSchema(MetaParser):
                     "ap_initiated_delete_for_sending_deauth_pak_to_client": int
                 }
             }
-        }
+        })
 
 
 
@@ -3420,7 +3421,7 @@ class ShowWirelessStatsClientDeleteReasons(ShowWirelessStatsClientDeleteReasonsS
 class ShowWirelessStatsClientDetailSchema(MetaParser):
     """Schema for show wireless stats client detail."""
 
-    schema = {
+    schema = LazySchema(lambda: {
     "total_clients": int,
     "protocol_statistics_client_count": {
         "802_11b": int,
@@ -3920,7 +3921,7 @@ class ShowWirelessStatsClientDetailSchema(MetaParser):
             "ap_initiated_delete_for_sending_deauth_pak_to_client": int
         }
     }
-}
+})
 
 
 # ======================================
@@ -4356,7 +4357,7 @@ class ShowWirelessStatsClientDetail(ShowWirelessStatsClientDetailSchema):
 class ShowWirelessStatsMobilitySchema(MetaParser):
     """Schema for show wireless stats mobility."""
 
-    schema = {
+    schema = LazySchema(lambda: {
       "mobility_event_statistics": {
           "joined_as": {
               "local": int,
@@ -4456,7 +4457,7 @@ class ShowWirelessStatsMobilitySchema(MetaParser):
               "unknown_failure": int,
           },
       },
-    }
+    })
 
 
 # =================================
@@ -1,6 +1,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -11,7 +12,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowWlanSummarySchema(MetaParser):
     """Schema for show wlan summary."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "wlan_summary": {
             "wlan_count": int,
             "wlan_id": {
@@ -23,7 +24,7 @@ class ShowWlanSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ======================
@@ -112,7 +113,7 @@ class ShowWlanSummary(ShowWlanSummarySchema):
 class ShowWlanAllSchema(MetaParser):
     """Schema for show wlan all."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "wlan_names" : {
             Optional(str): {
                 "identifier": int,
@@ -246,7 +247,7 @@ class ShowWlanAllSchema(MetaParser):
                 Optional("wifi_to_cellular_steering"): str
             }
         }
-    }
+    })
 
 
 # ==================
@@ -1354,7 +1355,7 @@ class ShowWlanAll(ShowWlanAllSchema):
 class ShowWlanIdClientStatsSchema(MetaParser):
     """Schema for show wlan id client stats."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "wlan_id": {
             int: {
                 "profile_name": str,
@@ -1556,7 +1557,7 @@ class ShowWlanIdClientStatsSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 
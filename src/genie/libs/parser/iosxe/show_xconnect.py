@@ -4,6 +4,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                                Any, \
                                                Optional, \
@@ -15,7 +16,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 class ShowXconnectAllSchema(MetaParser):
     """Schema for show xconnect all"""
-    schema = {
+    schema = LazySchema(lambda: {
         'segment_1': {
             Any(): {
                 's1': str,
@@ -28,7 +29,7 @@ class ShowXconnectAllSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowXconnectAll(ShowXconnectAllSchema):
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
@@ -21,7 +22,7 @@ class ShowAclAfiAllSchema(MetaParser):
     """Schema for:
         'show access-lists afi-all'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Any():{
             'name': str,
             'type': str,
@@ -94,7 +95,7 @@ class ShowAclAfiAllSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =======================================
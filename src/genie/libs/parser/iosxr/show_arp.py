@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
@@ -26,7 +27,7 @@ class ShowArpDetailSchema(MetaParser):
             show arp vrf <WORD> detail
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'ipv4': {
@@ -42,7 +43,7 @@ class ShowArpDetailSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 # =======================================
 # Parser for 'show arp detail'
@@ -107,7 +108,7 @@ class ShowArpDetail(ShowArpDetailSchema):
 class ShowArpTrafficDetailSchema(MetaParser):
     """ Schema for show arp traffic detail """
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {'statistics':
                 {'in_requests_pkts': int,
@@ -140,7 +141,7 @@ class ShowArpTrafficDetailSchema(MetaParser):
                  'total_arp_idb': int,
                 }
             }
-        }
+        })
 
 
 # =======================================
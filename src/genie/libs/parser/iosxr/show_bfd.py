@@ -7,6 +7,7 @@
 import re
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
@@ -18,7 +19,7 @@ from genie.libs.parser.utils.common import Common
 
 
 class ShowBfdSessionSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             Any(): {
                 'dest_ip_address': {
@@ -37,7 +38,7 @@ class ShowBfdSessionSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 
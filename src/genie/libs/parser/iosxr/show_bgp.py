@@ -53,6 +53,9 @@ from ipaddress import ip_address, ip_network
 # Metaparser
 from genie.libs.parser.base import *
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+                                                    CompiledMetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -70,7 +73,7 @@ logger.setLevel(logging.INFO)
 class ShowBgpEgressEngineeringSchema(MetaParser):
     
     ''' Schema for show bgp egress-engineering '''
-    schema = {
+    schema = LazySchema(lambda: {
         'peer_set':{
             Any():{
                 'peer_set_id': str,
@@ -92,7 +95,7 @@ class ShowBgpEgressEngineeringSchema(MetaParser):
                 Optional('id'): int
             },
         },
-    }
+    })
 
 class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
 
@@ -187,7 +190,7 @@ class ShowBgpInstancesSchema(MetaParser):
 
     """Schema for show bgp instances"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance':{
             Any(): {
                 'bgp_id': Or(int, str),
@@ -198,7 +201,7 @@ class ShowBgpInstancesSchema(MetaParser):
             }
         },
         Optional('number_of_bgp_instances'): int,
-    }
+    })
 
 class ShowBgpInstances(ShowBgpInstancesSchema):
 
@@ -301,7 +304,7 @@ class ShowPlacementProgramAllSchema(MetaParser):
 
     """Schema for show placement program all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'program':
             {Any():
                 {'instance':
@@ -316,7 +319,7 @@ class ShowPlacementProgramAllSchema(MetaParser):
                     },
                 }
             },
-        }
+        })
 
 class ShowPlacementProgramAll(ShowPlacementProgramAllSchema):
 
@@ -388,7 +391,7 @@ class ShowBgpInstanceAfGroupConfigurationSchema(MetaParser):
     
     """Schema for show bgp instance af-group configuration"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance':
             {Any():
                 {'pp_name':
@@ -427,7 +430,7 @@ class ShowBgpInstanceAfGroupConfigurationSchema(MetaParser):
                     },
                 }
             },
-        }
+        })
 
 class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSchema):
     """Parser for show bgp instance af-group configuration"""
@@ -705,7 +708,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
 class ShowBgpInstanceSessionGroupConfigurationSchema(MetaParser):
     """ Schema for show bgp instance session-group configuration"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance':
             {Any():
                 {'peer_session':
@@ -744,7 +747,7 @@ class ShowBgpInstanceSessionGroupConfigurationSchema(MetaParser):
                     }
                 }
             }
-        }
+        })
 
 class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfigurationSchema):
 
@@ -1009,7 +1012,7 @@ class ShowBgpInstanceProcessDetailSchema(MetaParser):
         show bgp instance all vrf all ipv6 unicast process detail
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance':
             {Any():
                 {Optional('vrf'):
@@ -1146,7 +1149,7 @@ class ShowBgpInstanceProcessDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
@@ -2259,7 +2262,7 @@ class ShowBgpInstanceNeighborsDetailSchema(MetaParser):
         show bgp instance all vrf all ipv6 unicast neighbors detail
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance':
             {Any():
                 {Optional('vrf'):
@@ -2430,7 +2433,7 @@ class ShowBgpInstanceNeighborsDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
@@ -3476,7 +3479,7 @@ class ShowBgpInstanceNeighborsReceivedRoutesSchema(MetaParser):
         show bgp instance <instance> vrf <vrf> <address_family> neighbors <neighbor> received routes
     """
 
-    schema = {'instance':
+    schema = LazySchema(lambda: {'instance':
                 {Any():
                     {Optional('vrf'):
                         {Any():
@@ -3522,7 +3525,7 @@ class ShowBgpInstanceNeighborsReceivedRoutesSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRoutesSchema):
 
@@ -4069,7 +4072,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutesSchema(MetaParser):
 
     """
 
-    schema = {'instance':
+    schema = LazySchema(lambda: {'instance':
                 {Any():
                     {Optional('vrf'):
                         {Any():
@@ -4102,7 +4105,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutesSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertisedRoutesSchema):
 
@@ -4317,7 +4320,7 @@ class ShowBgpInstanceNeighborsRoutesSchema(MetaParser):
         show bgp instance all vrf all ipv6 unicast neighbors <neighbor> routes
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance':
             {Any():
                 {Optional('vrf'):
@@ -4363,7 +4366,7 @@ class ShowBgpInstanceNeighborsRoutesSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowBgpInstanceNeighborsRoutes(ShowBgpInstanceNeighborsRoutesSchema, ShowBgpInstanceNeighborsReceivedRoutes):
     
@@ -4401,7 +4404,7 @@ class ShowBgpInstanceSummarySchema(MetaParser):
         show bgp instance all vrf all ipv6 unicast summary
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance':
             {Any():
                 {Optional('vrf'):
@@ -4456,7 +4459,7 @@ class ShowBgpInstanceSummarySchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
@@ -4848,7 +4851,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 # 'show bgp instance all vrf all ipv6 unicast'
 # ============================================
 
-class ShowBgpInstanceAllAllSchema(MetaParser):
+class ShowBgpInstanceAllAllSchema(CompiledMetaParser):
 
     """ Schema for:
         show bgp instance all all all
@@ -4857,7 +4860,7 @@ class ShowBgpInstanceAllAllSchema(MetaParser):
         show bgp instance all vrf all ipv6 unicast
     """
 
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         'instance':
             {Any():
                 {Optional('vrf'):
@@ -4906,7 +4909,7 @@ class ShowBgpInstanceAllAllSchema(MetaParser):
                 },
             },
         },
-    }
+    }))
 
 # ============================================================
 # Parser for:
@@ -5337,7 +5340,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
 """Schema for 'show bgp sessions'"""
 class ShowBgpSessionsSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'vrf': {
@@ -5356,7 +5359,7 @@ class ShowBgpSessionsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ==============================
 # Parser for 'show bgp sessions'
@@ -5498,7 +5501,7 @@ class ShowBgpVrfDbVrfAllSchema(MetaParser):
         * 'show bgp vrf-db vrf all'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any():
                 {'id': str,
@@ -5507,7 +5510,7 @@ class ShowBgpVrfDbVrfAllSchema(MetaParser):
                 'afs': list,
                 },
             },
-        }
+        })
 
 # ====================================
 # Parser for 'show bgp vrf-db vrf all'
@@ -5592,7 +5595,7 @@ class ShowBgpL2vpnEvpnSchema(MetaParser):
         show bgp l2vpn evnpn
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -5642,7 +5645,7 @@ class ShowBgpL2vpnEvpnSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
         
 
 # ================================
@@ -6350,7 +6353,7 @@ class ShowBgpL2vpnEvpnAdvertisedSchema(MetaParser):
         * 'show bgp l2vpn evpn advertised'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'neighbor': 
             {Any():
                 {'address_family':
@@ -6389,7 +6392,7 @@ class ShowBgpL2vpnEvpnAdvertisedSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===========================================
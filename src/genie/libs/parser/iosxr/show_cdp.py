@@ -13,6 +13,7 @@ import re
 # Metaparser
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -21,7 +22,7 @@ class ShowCdpNeighborsSchema(MetaParser):
             * 'show cdp neighbors'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'cdp':
             {Optional('index'):
              {Any():
@@ -31,7 +32,7 @@ class ShowCdpNeighborsSchema(MetaParser):
                Optional('capability'): str,
                Optional('platform'): str,
                'port_id': str, }, }, },
-    }
+    })
 
 
 # ================================
@@ -166,7 +167,7 @@ class ShowCdpNeighborsDetailSchema(MetaParser):
         * 'show cdp neighbors detail'
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'total_entries_displayed': int,
         Optional('index'): {
             Any():
@@ -185,7 +186,7 @@ class ShowCdpNeighborsDetailSchema(MetaParser):
                  Optional('advertisement_ver'): int,
                  Optional('native_vlan'): str},
         },
-    }
+    })
 
 
 # =======================================
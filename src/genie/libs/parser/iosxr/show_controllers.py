@@ -14,6 +14,7 @@ from genie.libs.parser.utils.common import Common
 
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -25,7 +26,7 @@ class ShowControllersFiaDiagshellL2showLocationSchema(MetaParser):
         * show controller fia diagshell {diagshell_unit} 'l2 show' location {location}
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'nodes':
             {Any():
                 {'vlan':
@@ -42,7 +43,7 @@ class ShowControllersFiaDiagshellL2showLocationSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==========================================================================================
@@ -121,7 +122,7 @@ class ShowControllersCoherentDSPSchema(MetaParser):
         * show controllers coherentDSP {port}
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'port': str,
             'controller_state': str,
@@ -156,7 +157,7 @@ class ShowControllersCoherentDSPSchema(MetaParser):
             'otu_tti': str,
             'fec_mode': str,
         },
-    }
+    })
 
 
 # ================================================
@@ -388,7 +389,7 @@ class ShowControllersOpticsSchema(MetaParser):
         * show controllers optics {port}
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'name': str,
             'controller_state': str,
@@ -469,7 +470,7 @@ class ShowControllersOpticsSchema(MetaParser):
                 Optional('date_code'): str,
             },
         },
-    }
+    })
 
 
 # ===========================================
@@ -1006,7 +1007,7 @@ class ShowControllersOptics(ShowControllersOpticsSchema):
 # Schema for 'show controllers fia diagshell 0 "diag egr_calendars" location all'
 # ===============================================================================
 class ShowControllersFiaDiagshellDiagEgrCalendarsLocationSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'node_id': {
             Any(): {
                 'port': {
@@ -1024,7 +1025,7 @@ class ShowControllersFiaDiagshellDiagEgrCalendarsLocationSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ===============================================================================
 # Parser for 'show controllers fia diagshell 0 "diag egr_calendars" location all'
@@ -1089,7 +1090,7 @@ class ShowControllersFiaDiagshellDiagEgrCalendarsLocation(ShowControllersFiaDiag
 # Schema for 'show controllers npu {npu} interface {interface} instance {instance} location {location}'
 # =====================================================================================================
 class ShowControllersNpuInterfaceInstanceLocationSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'node_id': {
             Any(): {
                 'interface': {
@@ -1107,7 +1108,7 @@ class ShowControllersNpuInterfaceInstanceLocationSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =====================================================================================================
@@ -1182,7 +1183,7 @@ class ShowControllersNpuInterfaceInstanceLocation(ShowControllersNpuInterfaceIns
 # Schema for 'show controllers fia diagshell 0 "diag cosq qpair egq map" location all'
 # =====================================================================================
 class ShowControllersFiaDiagshellDiagCosqQpairEgpMapSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'node_id': {
             Any(): {
                 'mapping': {
@@ -1200,7 +1201,7 @@ class ShowControllersFiaDiagshellDiagCosqQpairEgpMapSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # =====================================================================================
 # Parser for 'show controllers fia diagshell 0 "diag cosq qpair egq map" location all'
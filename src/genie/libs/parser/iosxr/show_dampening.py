@@ -8,6 +8,7 @@
 import re
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
@@ -19,7 +20,7 @@ from genie.libs.parser.utils.common import Common
 
 
 class ShowImDampeningSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             Any(): {
                 'index': {
@@ -32,7 +33,7 @@ class ShowImDampeningSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowImDampening(ShowImDampeningSchema):
@@ -93,7 +94,7 @@ class ShowImDampening(ShowImDampeningSchema):
 
 
 class ShowImDampeningIntfSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             Any(): {
                 'dampening_status': str,
@@ -118,7 +119,7 @@ class ShowImDampeningIntfSchema(MetaParser):
                  },
             }
         }
-    }
+    })
 
 
 class ShowImDampeningIntf(ShowImDampeningIntfSchema):
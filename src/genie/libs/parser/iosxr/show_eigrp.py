@@ -19,6 +19,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any
 
 # Libs
@@ -34,7 +35,7 @@ class ShowEigrpNeighborsSchema(MetaParser):
         * 'show eigrp ipv6 vrf {vrf} neighbors'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'eigrp_instance': {
             Any(): {
                 'vrf': {
@@ -62,7 +63,7 @@ class ShowEigrpNeighborsSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 
 # =======================================
@@ -289,7 +290,7 @@ class ShowEigrpNeighborsDetailSchema(MetaParser):
         * 'show eigrp ipv6 vrf {vrf} neighbors detail'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'eigrp_instance': {
             Any(): {
                 'vrf': {
@@ -326,7 +327,7 @@ class ShowEigrpNeighborsDetailSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 
 # ================================================
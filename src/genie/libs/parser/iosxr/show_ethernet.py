@@ -9,6 +9,7 @@
 import logging
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util import merge_dict, keynames_convert
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
@@ -24,7 +25,7 @@ from genie.metaparser.util.schemaengine import Any
 from genie.libs.parser.utils.common import Common
 
 class ShowEthernetCfmMepsSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'domain': {
             Any(): {
                 'level': int,
@@ -55,7 +56,7 @@ class ShowEthernetCfmMepsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowEthernetCfmMeps(ShowEthernetCfmMepsSchema):
     """Parser for show ethernet cfm peer meps"""
@@ -176,11 +177,11 @@ class ShowEthernetCfmMeps(ShowEthernetCfmMepsSchema):
 #Incomplete parser - to be completed 
 class ShowEthernetTrunkDetailSchema(MetaParser):
     """Schema for show ethernet trunk detail"""
-    schema = {'interface':
+    schema = LazySchema(lambda: {'interface':
                 {Any():
                     {Optional('dot1q_tunneling_ethertype'): str}
                 },
-            }
+            })
 
 
 class ShowEthernetTrunkDetail(ShowEthernetTrunkDetailSchema):
@@ -234,7 +235,7 @@ class ShowEthernetTrunkDetail(ShowEthernetTrunkDetailSchema):
 
 class ShowEthernetTagsSchema(MetaParser):
     """Schema for show ethernet tags"""
-    schema = {'interface':
+    schema = LazySchema(lambda: {'interface':
                 {Any():
                     {'sub_interface':
                         {Any():
@@ -251,7 +252,7 @@ class ShowEthernetTagsSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 
 class ShowEthernetTags(ShowEthernetTagsSchema):
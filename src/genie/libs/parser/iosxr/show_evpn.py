@@ -8,11 +8,12 @@ from ipaddress import ip_address
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 from genie.libs.parser.utils.common import Common
 
 class ShowEvpnEviSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'evi': {
             Any(): {
                 'bridge_domain': str,
@@ -25,7 +26,7 @@ class ShowEvpnEviSchema(MetaParser):
                 Optional(Any()): str,
             }
         }
-    }
+    })
 
 class ShowEvpnEvi(ShowEvpnEviSchema):
     """Parser class for 'show evpn evi'"""
@@ -130,7 +131,7 @@ class ShowEvpnInternalLabelDetailSchema(MetaParser):
         * show evpn internal-label detail
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('evi'):
             {Any():
                 {'evi': int,
@@ -222,7 +223,7 @@ class ShowEvpnInternalLabelDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # =========================================================
 # Parser for:
@@ -399,7 +400,7 @@ class ShowEvpnEviMacSchema(MetaParser):
         * 'show evpn evi vpn-id {vpn_id} mac'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vpn_id': {
             Any(): {
                 'mac_address': {
@@ -460,7 +461,7 @@ class ShowEvpnEviMacSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # =====================================================
 # Parser for:
@@ -904,7 +905,7 @@ class ShowEvpnEviMacPrivate(ShowEvpnEviMac):
         return super().cli(output=out)
 
 class ShowEvpnEthernetSegmentSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'segment_id': {
             Any(): {
                 'interface': {
@@ -1017,7 +1018,7 @@ class ShowEvpnEthernetSegmentSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowEvpnEthernetSegment(ShowEvpnEthernetSegmentSchema):
     """Parser class for 'show evpn ethernet-segment' CLI."""
@@ -1796,7 +1797,7 @@ class ShowEvpnEthernetSegmentEsiDetail(ShowEvpnEthernetSegment):
 # =====================================================
 
 class ShowEvpnInternalLabelSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'evi':{
             Any(): {
                 'ethernet_segment_id': {
@@ -1822,7 +1823,7 @@ class ShowEvpnInternalLabelSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 # =====================================================
 # Parser for:
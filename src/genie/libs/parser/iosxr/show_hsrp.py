@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -32,7 +33,7 @@ def regexp(expression):
 class ShowHsrpSummarySchema(MetaParser):
     """Schema for show hsrp summary"""
     schema = \
-                {'address_family': {
+                LazySchema(lambda: {'address_family': {
                     Any(): {
                         'state': {
                             Any(): {
@@ -56,7 +57,7 @@ class ShowHsrpSummarySchema(MetaParser):
                     'bfd_sessions_up': int,
                     'bfd_sessions_down': int,
                     'bfd_sessions_inactive': int,
-                }
+                })
              
 
 class ShowHsrpSummary(ShowHsrpSummarySchema):
@@ -218,7 +219,7 @@ class ShowHsrpSummary(ShowHsrpSummarySchema):
 
 class ShowHsrpDetailSchema(MetaParser):
     """Schema for show hsrp detail"""
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'interface': str,
             Optional('bfd'): {
@@ -380,7 +381,7 @@ class ShowHsrpDetailSchema(MetaParser):
                 }
             }
         }        
-    }
+    })
 
 
 class ShowHsrpDetail(ShowHsrpDetailSchema):
@@ -15,6 +15,7 @@ import re
 import logging
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -34,7 +35,7 @@ logger = logging.getLogger(__name__)
 
 class ShowIgmpInterfaceSchema(MetaParser):
     """Schema for show igmp interface"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'interfaces': {
@@ -62,7 +63,7 @@ class ShowIgmpInterfaceSchema(MetaParser):
                     }
                 }
             }
-        }
+        })
 
 
 class ShowIgmpInterface(ShowIgmpInterfaceSchema):
@@ -261,7 +262,7 @@ class ShowIgmpInterface(ShowIgmpInterfaceSchema):
 
 class ShowIgmpSummarySchema(MetaParser):
     """Schema for show igmp groups detail"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'robustness_value': int,
@@ -280,7 +281,7 @@ class ShowIgmpSummarySchema(MetaParser):
                 }, 
             }
         }
-    }
+    })
     
 class ShowIgmpSummary(ShowIgmpSummarySchema):
     """Parser for show igmp summary"""
@@ -442,7 +443,7 @@ class ShowIgmpSummary(ShowIgmpSummarySchema):
 
 class ShowIgmpGroupsDetailSchema(MetaParser):
     """Schema for show igmp groups detail"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'interfaces': {
@@ -469,7 +470,7 @@ class ShowIgmpGroupsDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowIgmpGroupsDetail(ShowIgmpGroupsDetailSchema):
     """Parser for show igmp groups detail"""
@@ -614,7 +615,7 @@ class ShowIgmpGroupsDetail(ShowIgmpGroupsDetailSchema):
 class ShowIgmpGroupsSummarySchema(MetaParser):
     """ Schema for show igmp [vrf <vrf>] groups summary. """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'no_g_routes': int,
@@ -622,7 +623,7 @@ class ShowIgmpGroupsSummarySchema(MetaParser):
                  'no_group_x_intfs': int
                  },
              },
-        }
+        })
 
 
 # ==========================================================================
@@ -23,6 +23,7 @@ import re
 import logging
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -39,14 +40,14 @@ logger = logging.getLogger(__name__)
 
 class ShowIpInterfaceBriefSchema(MetaParser):
     """Schema for show ip interface brief"""
-    schema = {'interface':
+    schema = LazySchema(lambda: {'interface':
                 {Any():
                     {Optional('ip_address'): str,
                     Optional('interface_status'): str,
                     Optional('protocol_status'): str,
                     Optional('vrf_name'): str}
                 },
-            }
+            })
 
 
 class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
@@ -142,7 +143,7 @@ class ShowIpInterfaceBriefPipeVlan(ShowIpInterfaceBrief):
 
 class ShowInterfaceBriefSchema(MetaParser):
     """Schema for show interface brief"""
-    schema = {'interface':
+    schema = LazySchema(lambda: {'interface':
                 {Optional('ethernet'):
                     {Any():
                         {Optional('vlan'): str,
@@ -188,7 +189,7 @@ class ShowInterfaceBriefSchema(MetaParser):
                          Optional('description'): str}
                     },
                 }
-            }
+            })
 
 
 class ShowInterfaceBrief(ShowInterfaceBriefSchema):
@@ -384,7 +385,7 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
 class ShowInterfacesDetailSchema(MetaParser):
     """Schema for show interfaces detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {Optional('description'): str,
              Optional('types'): str,
@@ -465,7 +466,7 @@ class ShowInterfacesDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 class ShowInterfacesDetail(ShowInterfacesDetailSchema):
@@ -1093,7 +1094,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
 class ShowVlanInterfaceSchema(MetaParser):
     """Schema for show vlan interface"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {Optional('encapsulation'): str,
             Optional('outer_vlan'): int,
@@ -1102,7 +1103,7 @@ class ShowVlanInterfaceSchema(MetaParser):
             Optional('mtu'): int,
             Optional('linep_state'): str
             },
-        }
+        })
 
 class ShowVlanInterface(ShowVlanInterfaceSchema):
     """Parser for show vlan interface"""
@@ -1181,7 +1182,7 @@ class ShowVlanInterface(ShowVlanInterfaceSchema):
 class ShowIpv4VrfAllInterfaceSchema(MetaParser):
     """Schema for show ipv4 vrf all interface"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {'oper_status': str,
              'int_status': str,
@@ -1213,7 +1214,7 @@ class ShowIpv4VrfAllInterfaceSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
     """Parser for show ipv4 vrf all interface
@@ -1522,7 +1523,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
 class ShowIpv6VrfAllInterfaceSchema(MetaParser):
     """Schema for show ipv6 vrf all interface"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {'oper_status': str,
              'int_status': str,
@@ -1567,7 +1568,7 @@ class ShowIpv6VrfAllInterfaceSchema(MetaParser):
                 Optional('dropped_glean_req'): str
                 },
             },
-        }
+        })
 
 class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
     """Parser for show ipv6 vrf all interface"""
@@ -2093,7 +2094,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 class ShowEthernetTagsSchema(MetaParser):
     """Schema for show ethernet tags"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {Optional('status'): str,
             Optional('outer_vlan'): str,
@@ -2104,7 +2105,7 @@ class ShowEthernetTagsSchema(MetaParser):
             Optional('rewrite_num_of_tags_pop'): int,
             Optional('rewrite_num_of_tags_push'): int
             },
-        }
+        })
 
 class ShowEthernetTags(ShowEthernetTagsSchema):
     """Parser for show ethernet tags
@@ -2190,7 +2191,7 @@ class ShowEthernetTags(ShowEthernetTagsSchema):
 
 class ShowInterfacesAccountingSchema(MetaParser):
     """Schema for show interface accounting"""
-    schema = {
+    schema = LazySchema(lambda: {
                 Any(): {
                     'accounting': {
                         Any(): {
@@ -2201,7 +2202,7 @@ class ShowInterfacesAccountingSchema(MetaParser):
                         }
                     }
                 }
-            }
+            })
 
 
 class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
@@ -2261,7 +2262,7 @@ class ShowInterfacesSchema(MetaParser):
     """schema for show interfaces
                   show interfaces <interface>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'oper_status': str,
             Optional('line_protocol'): str,
@@ -2365,7 +2366,7 @@ class ShowInterfacesSchema(MetaParser):
                 Optional('carrier_transitions'): int,
             },
         },
-    }
+    })
 
 
 class ShowInterfaces(ShowInterfacesSchema):
@@ -2954,7 +2955,7 @@ class ShowInterfacesDescriptionSchema(MetaParser):
     """schema for show interfaces description
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'status': str,
@@ -2962,7 +2963,7 @@ class ShowInterfacesDescriptionSchema(MetaParser):
                 Optional('description'): str
             }
         }
-    }
+    })
 
 
 class ShowInterfacesDescription(ShowInterfacesDescriptionSchema):
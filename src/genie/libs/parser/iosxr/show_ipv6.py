@@ -15,6 +15,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -28,7 +29,7 @@ from genie.libs.parser.utils.common import Common
 class ShowIpv6NeighborsDetailSchema(MetaParser):
     """Schema for show ipv6 neighbors detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'interface': str,
@@ -48,7 +49,7 @@ class ShowIpv6NeighborsDetailSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 class ShowIpv6NeighborsDetail(ShowIpv6NeighborsDetailSchema):
     """Parser for show ipv6 neighbors detail"""
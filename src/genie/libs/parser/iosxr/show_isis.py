@@ -24,6 +24,7 @@ from netaddr import IPAddress, IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -34,7 +35,7 @@ from genie.libs.parser.utils.common import Common
 class ShowIsisFastRerouteSummarySchema(MetaParser):
     ''' 'Schema for 'show isis fast-reroute summary' '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance':{
             Any():{
                 'topology':{
@@ -61,7 +62,7 @@ class ShowIsisFastRerouteSummarySchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 #============================================
 # Parser for 'show isis fast-reroute summary'
@@ -152,7 +153,7 @@ class ShowIsisFastRerouteSummary(ShowIsisFastRerouteSummarySchema):
 class ShowIsisAdjacencySchema(MetaParser):
     """Schema for show run isis adjacency"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'isis': {
             Any(): {
                 'vrf': {
@@ -183,7 +184,7 @@ class ShowIsisAdjacencySchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIsisAdjacency(ShowIsisAdjacencySchema):
@@ -293,7 +294,7 @@ class ShowIsisAdjacency(ShowIsisAdjacencySchema):
 class ShowIsisNeighborsSchema(MetaParser):
     """Schema for show run isis neighbors"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'isis': {
             Any(): {
                 'vrf': {
@@ -316,7 +317,7 @@ class ShowIsisNeighborsSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 class ShowIsisNeighbors(ShowIsisNeighborsSchema):
@@ -392,7 +393,7 @@ class ShowIsisNeighbors(ShowIsisNeighborsSchema):
 class ShowIsisSegmentRoutingLabelTableSchema(MetaParser):
     """Schema for show isis segment-routing label table"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'label': {
@@ -402,7 +403,7 @@ class ShowIsisSegmentRoutingLabelTableSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIsisSegmentRoutingLabelTable(ShowIsisSegmentRoutingLabelTableSchema):
@@ -459,7 +460,7 @@ class ShowIsisSchema(MetaParser):
         * show isis
         * show isis protocol
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'process_id': str,
@@ -511,7 +512,7 @@ class ShowIsisSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIsis(ShowIsisSchema):
@@ -924,7 +925,7 @@ class ShowIsisHostnameSchema(MetaParser):
         * 'show isis instance {instance} hostname'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'isis': {
             Any(): {
                 'vrf': {
@@ -943,7 +944,7 @@ class ShowIsisHostnameSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIsisHostname(ShowIsisHostnameSchema):
@@ -1025,7 +1026,7 @@ class ShowIsisStatisticsSchema(MetaParser):
     ''' Schema for commands:
         * show isis statistics
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'isis': {
             Any(): {
                 'psnp_cache': {
@@ -1141,7 +1142,7 @@ class ShowIsisStatisticsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIsisStatistics(ShowIsisStatisticsSchema):
@@ -1673,7 +1674,7 @@ class ShowIsisSpfLogSchema(MetaParser):
     ''' Schema for command
         * show isis spf-log
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any():{
                 'address_family': {
@@ -1694,7 +1695,7 @@ class ShowIsisSpfLogSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIsisSpfLog(ShowIsisSpfLogSchema):
@@ -1791,7 +1792,7 @@ class ShowIsisSpfLogDetailSchema(MetaParser):
     ''' Schema for command
         * show isis spf-log detail
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'address_family': {
@@ -1903,7 +1904,7 @@ class ShowIsisSpfLogDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIsisSpfLogDetail(ShowIsisSpfLogDetailSchema):
@@ -2267,7 +2268,7 @@ class ShowIsisLspLogSchema(MetaParser):
         * show isis lsp-log
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'lsp_log': {
@@ -2281,7 +2282,7 @@ class ShowIsisLspLogSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIsisLspLog(ShowIsisLspLogSchema):
@@ -2381,7 +2382,7 @@ class ShowIsisInterfaceSchema(MetaParser):
         * show isis interface
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'interface': {
@@ -2492,7 +2493,7 @@ class ShowIsisInterfaceSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 class ShowIsisInterface(ShowIsisInterfaceSchema):
@@ -3432,7 +3433,7 @@ class ShowIsisDatabaseDetailSchema(MetaParser):
         * show isis database detail
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'level': {
@@ -3546,7 +3547,7 @@ class ShowIsisDatabaseDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
@@ -4082,7 +4083,7 @@ class ShowIsisPrivateAllSchema(MetaParser):
     ''' Schema for commands:
        * show isis private all
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'cfg_refcount': int,
@@ -4710,7 +4711,7 @@ class ShowIsisPrivateAllSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIsisPrivateAll(ShowIsisPrivateAllSchema):
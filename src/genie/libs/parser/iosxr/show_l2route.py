@@ -9,6 +9,7 @@ show l2route evpn mac-ip all
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -22,7 +23,7 @@ class ShowL2routeTopologySchema(MetaParser):
     """Schema for:
         * 'show l2route topology'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'topo_id': {
             Any(): {
                 'topo_name': {
@@ -32,7 +33,7 @@ class ShowL2routeTopologySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowL2routeTopology(ShowL2routeTopologySchema):
@@ -85,7 +86,7 @@ class ShowL2routeEvpnMacAllSchema(MetaParser):
     """Schema for:
         * 'show l2route evpn mac all'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'topo_id': {
             Any(): {
                 'mac_address': {
@@ -96,7 +97,7 @@ class ShowL2routeEvpnMacAllSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowL2routeEvpnMacAll(ShowL2routeEvpnMacAllSchema):
@@ -156,7 +157,7 @@ class ShowL2routeEvpnMacIpAllSchema(MetaParser):
     """Schema for:
         * 'show l2route evpn mac-ip all'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'topo_id': {
             Any(): {
                 'mac_address': {
@@ -171,7 +172,7 @@ class ShowL2routeEvpnMacIpAllSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowL2routeEvpnMacIpAll(ShowL2routeEvpnMacIpAllSchema):
@@ -12,6 +12,7 @@ from ipaddress import ip_address
 
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -23,7 +24,7 @@ class ShowL2vpnMacLearningSchema(MetaParser):
     """Schema for:
         * 'show l2vpn mac-learning {mac_type} all location {location}'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'topo_id': {
             Any(): {
                 'producer': {
@@ -41,7 +42,7 @@ class ShowL2vpnMacLearningSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowL2vpnMacLearning(ShowL2vpnMacLearningSchema):
@@ -112,7 +113,7 @@ class ShowL2vpnForwardingBridgeDomainMacAddressSchema(MetaParser):
         show l2vpn forwarding bridge-domain {bridge_domain} mac-address location {location}
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'mac_table': {
             Any(): {
                 'mac_address': {
@@ -126,7 +127,7 @@ class ShowL2vpnForwardingBridgeDomainMacAddressSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowL2vpnForwardingBridgeDomainMacAddress(
@@ -271,7 +272,7 @@ class ShowL2vpnForwardingProtectionMainInterfaceSchema(MetaParser):
         show l2vpn forwarding protection main-interface location {location}
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'main_interface_id': {
             Any(): {
                 'instance': {
@@ -281,7 +282,7 @@ class ShowL2vpnForwardingProtectionMainInterfaceSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowL2vpnForwardingProtectionMainInterface(
@@ -358,7 +359,7 @@ class ShowL2vpnForwardingProtectionMainInterface(
 class ShowL2vpnBridgeDomainSchema(MetaParser):
     """Schema for show l2vpn bridge-domain
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'bridge_group': {
             Any(): {
                 'bridge_domain': {
@@ -422,7 +423,7 @@ class ShowL2vpnBridgeDomainSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowL2vpnBridgeDomain(ShowL2vpnBridgeDomainSchema):
     """Parser for show l2vpn bridge-domain"""
@@ -687,7 +688,7 @@ class ShowL2vpnBridgeDomainBrief(ShowL2vpnBridgeDomain):
 class ShowL2vpnBridgeDomainSummarySchema(MetaParser):
     """Schema for show l2vpn bridge-domain summary
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'number_of_groups': int,
         'bridge_domains': {
             'total': int,
@@ -704,7 +705,7 @@ class ShowL2vpnBridgeDomainSummarySchema(MetaParser):
             'up': int,
             'down': int,
         }
-    }
+    })
 
 class ShowL2vpnBridgeDomainSummary(ShowL2vpnBridgeDomainSummarySchema):
     """Parser for show l2vpn bridge-domain summary"""
@@ -784,7 +785,7 @@ class ShowL2vpnBridgeDomainSummary(ShowL2vpnBridgeDomainSummarySchema):
 class ShowL2vpnBridgeDomainDetailSchema(MetaParser):
     """Schema for show l2vpn bridge-domain detail
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('legend'): str,
         'bridge_group': {
             Any(): {
@@ -1099,7 +1100,7 @@ class ShowL2vpnBridgeDomainDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowL2vpnBridgeDomainDetail(ShowL2vpnBridgeDomainDetailSchema):
     """Parser for show l2vpn bridge-domain detail"""
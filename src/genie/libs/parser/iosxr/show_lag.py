@@ -13,6 +13,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
@@ -22,10 +23,10 @@ from genie.libs.parser.utils.common import Common
 class ShowLacpSystemIdSchema(MetaParser):
     """Schema for show lacp system-id"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'system_id_mac': str,
         'system_priority': int,
-    }
+    })
 
 
 class ShowLacpSystemId(ShowLacpSystemIdSchema):
@@ -64,7 +65,7 @@ class ShowLacpSystemId(ShowLacpSystemIdSchema):
 class ShowBundleSchema(MetaParser):
     """Schema for show bundle"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'name': str,
@@ -140,7 +141,7 @@ class ShowBundleSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 
 class ShowBundle(ShowBundleSchema):
@@ -599,7 +600,7 @@ class ShowBundleReasons(ShowBundle):
 class ShowLacpSchema(MetaParser):
     """Schema for show lacp"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'name': str,
@@ -639,7 +640,7 @@ class ShowLacpSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 
 class ShowLacp(ShowLacpSchema):
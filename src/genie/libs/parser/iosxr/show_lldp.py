@@ -9,6 +9,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
@@ -19,13 +20,13 @@ from genie.libs.parser.utils.common import Common
 
 class ShowLldpSchema(MetaParser):
     """Schema for show lldp"""
-    schema = {
+    schema = LazySchema(lambda: {
         'status': str,
         'enabled': bool,
         'hello_timer': int,
         'hold_timer': int,
         'reinit_delay': int
-    }
+    })
 
 
 class ShowLldp(ShowLldpSchema):
@@ -75,7 +76,7 @@ class ShowLldp(ShowLldpSchema):
 
 class ShowLldpEntrySchema(MetaParser):
     """Schema for show lldp entry *"""
-    schema = {
+    schema = LazySchema(lambda: {
         'total_entries': int,
         Optional('interfaces'): {
             Any(): {
@@ -104,7 +105,7 @@ class ShowLldpEntrySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowLldpEntry(ShowLldpEntrySchema):
@@ -346,7 +347,7 @@ class ShowLldpNeighborsDetail(ShowLldpEntry):
 
 class ShowLldpTrafficSchema(MetaParser):
     """Schema for show lldp traffic"""
-    schema = {
+    schema = LazySchema(lambda: {
         "counters": {
             "frame_in": int,
             "frame_out": int,
@@ -356,7 +357,7 @@ class ShowLldpTrafficSchema(MetaParser):
             'tlv_unknown': int,
             'entries_aged_out': int
         }
-    }
+    })
 
 class ShowLldpTraffic(ShowLldpTrafficSchema):
     """Parser for show lldp traffic"""
@@ -421,7 +422,7 @@ class ShowLldpTraffic(ShowLldpTrafficSchema):
 
 class ShowLldpInterfaceSchema(MetaParser):
     """Schema for show lldp interface"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'tx': str,
@@ -430,7 +431,7 @@ class ShowLldpInterfaceSchema(MetaParser):
                 'rx_state': str,
             },
         }
-    }
+    })
 
 
 class ShowLldpInterface(ShowLldpInterfaceSchema):
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
 
@@ -23,7 +24,7 @@ class ShowLoggingSchema(MetaParser):
         * 'show logging | include {include}'
     '''
 
-    schema={
+    schema=LazySchema(lambda: {
         Optional('syslog_logging'): {
             Any(): { # enabled
                 'counters': {
@@ -150,7 +151,7 @@ class ShowLoggingSchema(MetaParser):
         },
         Optional('log_buffer_bytes'): int, # 32000
         Optional('logs'): list
-        }
+        })
 
 
 # ==============================================
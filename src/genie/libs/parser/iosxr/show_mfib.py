@@ -13,6 +13,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -23,7 +24,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 class ShowMfibRouteSummarySchema(MetaParser):
     """ Schema for show mfib [vrf <vrf>] route summary. """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                  {'no_g_routes': int,
@@ -31,7 +32,7 @@ class ShowMfibRouteSummarySchema(MetaParser):
                   Optional('num_vrfs'): int
                   },
              },
-    }
+    })
 
 
 # ==========================================================================
@@ -133,7 +134,7 @@ class ShowMfibRouteSummary(ShowMfibRouteSummarySchema):
 class ShowMfibPlatformEvpnBucketLocationSchema(MetaParser):
     """ Schema for show mfib platform evpn bucket location {location}. """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'bucket_id':
             {Any():
                  {'esi_interface': str,
@@ -142,7 +143,7 @@ class ShowMfibPlatformEvpnBucketLocationSchema(MetaParser):
                   'state': str
                   },
              },
-    }
+    })
 
 
 # ==========================================================================
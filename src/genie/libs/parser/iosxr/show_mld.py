@@ -18,6 +18,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # parser utils
@@ -36,7 +37,7 @@ class ShowMldSummaryInternalSchema(MetaParser):
     show mld vrf {vrf} summary internal
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('robustness_value'): int,
@@ -60,7 +61,7 @@ class ShowMldSummaryInternalSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 
@@ -241,7 +242,7 @@ class ShowMldInterfaceSchema(MetaParser):
     show mld interface
     show mld vrf {vrf} interface
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('max_groups'): int,
@@ -271,7 +272,7 @@ class ShowMldInterfaceSchema(MetaParser):
                 }
             }
         },
-    }
+    })
 
 # ==============================================================================
 # Parser for 
@@ -474,7 +475,7 @@ class ShowMldGroupsDetailSchema(MetaParser):
     show mld groups {group} detail
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'interface': {
@@ -513,7 +514,7 @@ class ShowMldGroupsDetailSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 # ==============================================================================
 # Parser for 
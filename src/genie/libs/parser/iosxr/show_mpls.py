@@ -20,6 +20,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 # import parser utils
@@ -32,12 +33,12 @@ class ShowMplsLabelRangeSchema(MetaParser):
 
     """Schema for show mpls label range"""
 
-    schema =  {
+    schema =  LazySchema(lambda: {
         'range_for_dynamic_labels':
 			{'min_range': int,
 			'max_range': int 	 
 			},	 
-	    }
+	    })
 
 class ShowMplsLabelRange(ShowMplsLabelRangeSchema):
 
@@ -83,7 +84,7 @@ class ShowMplsLdpNeighborSchema(MetaParser):
      show mpls ldp neighbor {interface} detail
      """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{ 
                 'peers':{
@@ -163,7 +164,7 @@ class ShowMplsLdpNeighborSchema(MetaParser):
     	        },
             }
         }
-    }
+    })
 
 class ShowMplsLdpNeighbor(ShowMplsLdpNeighborSchema):
 
@@ -618,7 +619,7 @@ class ShowMplsLdpNeighborBriefSchema(MetaParser):
     
     """Schema for show mpls ldp neighbor brief"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'peer': { 
             Any(): { 
                 'gr': str,
@@ -640,7 +641,7 @@ class ShowMplsLdpNeighborBriefSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowMplsLdpNeighborBrief(ShowMplsLdpNeighborBriefSchema):
@@ -777,7 +778,7 @@ class ShowMplsLabelTableDetailSchema(MetaParser):
     show mpls label table private
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'table': {
             Any(): {
                 'label': {
@@ -806,7 +807,7 @@ class ShowMplsLabelTableDetailSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 # ======================================================
 # Parser for 'show mpls label table detail'
@@ -944,7 +945,7 @@ class ShowMplsLabelTablePrivate(ShowMplsLabelTableDetail):
 # Schema for 'show mpls interfaces'
 # ======================================================
 class ShowMplsInterfacesSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'ldp': str,
@@ -953,7 +954,7 @@ class ShowMplsInterfacesSchema(MetaParser):
                 'enabled': str,
             }
         },
-    }
+    })
 
 
 # ======================================================
@@ -1009,7 +1010,7 @@ class ShowMplsInterfaces(ShowMplsInterfacesSchema):
 #   * 'show mpls forwarding vrf {vrf}'
 # ======================================================
 class ShowMplsForwardingVrfSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'local_label': {
@@ -1032,7 +1033,7 @@ class ShowMplsForwardingVrfSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ======================================================
@@ -1165,7 +1166,7 @@ class ShowMplsForwardingVrf(ShowMplsForwardingVrfSchema):
 #   * 'show mpls forwarding'
 # ======================================================
 class ShowMplsForwardingSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'local_label': {
             Any(): {
                 'outgoing_label': {
@@ -1184,7 +1185,7 @@ class ShowMplsForwardingSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ======================================================
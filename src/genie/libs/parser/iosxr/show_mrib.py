@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -21,7 +22,7 @@ class ShowMribVrfRouteSchema(MetaParser):
 
     """Schema for show mrib vrf <vrf> <address-family> route"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'address_family':
@@ -60,7 +61,7 @@ class ShowMribVrfRouteSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowMribVrfRoute(ShowMribVrfRouteSchema):
     """
@@ -255,7 +256,7 @@ class ShowMribVrfRouteSummarySchema(MetaParser):
 
     """Schema for show mrib vrf <vrf> <address-family> route summary"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -269,7 +270,7 @@ class ShowMribVrfRouteSummarySchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 class ShowMribVrfRouteSummary(ShowMribVrfRouteSummarySchema):
     """
@@ -360,7 +361,7 @@ class ShowMribVrfRouteSummary(ShowMribVrfRouteSummarySchema):
 class ShowMribEvpnBucketDbSchema(MetaParser):
     """ Schema for show mrib evpn bucket-db. """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'bucket_id':
             {int:
                 {'if_handle': str,
@@ -370,7 +371,7 @@ class ShowMribEvpnBucketDbSchema(MetaParser):
                  'uptime': str
                  },
              },
-    }
+    })
 
 
 # ==========================================================================
@@ -23,6 +23,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -30,7 +31,7 @@ class ShowMsdpPeerSchema(MetaParser):
     """Schema for:
         * 'show msdp peer'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'peer': {
@@ -88,7 +89,7 @@ class ShowMsdpPeerSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowMsdpPeer(ShowMsdpPeerSchema):
@@ -410,7 +411,7 @@ class ShowMsdpContextSchema(MetaParser):
     """Schema for:
     * 'show msdp context'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'context_info': {
@@ -476,7 +477,7 @@ class ShowMsdpContextSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowMsdpContext(ShowMsdpContextSchema):
@@ -846,7 +847,7 @@ class ShowMsdpSummarySchema(MetaParser):
     """Schema for:
         * 'show msdp summary'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'maximum_external_sa_global': int,
@@ -868,7 +869,7 @@ class ShowMsdpSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowMsdpSummary(ShowMsdpSummarySchema):
@@ -967,7 +968,7 @@ class ShowMsdpSaCacheSchema(MetaParser):
         * 'show msdp sa-cache'
         * 'show msdp vrf {vrf} sa-cache {group}'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'sa_cache': {
@@ -998,7 +999,7 @@ class ShowMsdpSaCacheSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowMsdpSaCache(ShowMsdpSaCacheSchema):
 
@@ -1115,7 +1116,7 @@ class ShowMsdpStatisticsPeerSchema(MetaParser):
         * 'show msdp statistics peer'
         * 'show msdp vrf <vrf> statistics peer'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'peer': {
@@ -1148,7 +1149,7 @@ class ShowMsdpStatisticsPeerSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowMsdpStatisticsPeer(ShowMsdpStatisticsPeerSchema):
 
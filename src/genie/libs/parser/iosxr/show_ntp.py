@@ -12,6 +12,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 
 
@@ -21,7 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
 class ShowNtpAssociationsSchema(MetaParser):
     """Schema for show ntp associations"""
     
-    schema = {
+    schema = LazySchema(lambda: {
         'peer': {
             Any():{
                 'local_mode': {
@@ -75,7 +76,7 @@ class ShowNtpAssociationsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ==============================================
@@ -304,7 +305,7 @@ class ShowNtpAssociations(ShowNtpAssociationsSchema):
 class ShowNtpStatusSchema(MetaParser):
     """Schema for: show ntp status"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'clock_state': {
             'system_status': {
                 'status': str,
@@ -326,7 +327,7 @@ class ShowNtpStatusSchema(MetaParser):
                 Optional('last_update'): str,
             }
         }
-    }
+    })
 
 
 class ShowNtpStatus(ShowNtpStatusSchema):
@@ -490,7 +491,7 @@ class ShowNtpStatus(ShowNtpStatusSchema):
 class ShowRunningConfigNtpSchema(MetaParser):
     """Schema for: show running-config ntp"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('source'): str,
@@ -501,7 +502,7 @@ class ShowRunningConfigNtpSchema(MetaParser):
                     }
                 },
             }
-        }
+        })
 
 
 class ShowRunningConfigNtp(ShowRunningConfigNtpSchema):
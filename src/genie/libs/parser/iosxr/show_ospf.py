@@ -20,6 +20,7 @@ from netaddr import IPAddress, IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 
@@ -29,7 +30,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 class ShowOspfVrfAllInclusiveInterfaceSchema(MetaParser):
     """Schema for show ospf vrf all-inclusive interface"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -247,7 +248,7 @@ class ShowOspfVrfAllInclusiveInterfaceSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ==================================================
@@ -855,7 +856,7 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
 class ShowOspfVrfAllInclusiveNeighborDetailSchema(MetaParser):
     """Schema for show ospf vrf all-inclusive neighbor detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -987,7 +988,7 @@ class ShowOspfVrfAllInclusiveNeighborDetailSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ========================================================
@@ -1402,7 +1403,7 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
 class ShowOspfVrfAllInclusiveSchema(MetaParser):
     """Schema for show ospf vrf all-inclusive"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -1589,7 +1590,7 @@ class ShowOspfVrfAllInclusiveSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ========================================
@@ -3004,7 +3005,7 @@ class ShowOspfVrfAllInclusiveLinksParser(MetaParser):
 class ShowOspfVrfAllInclusiveShamLinksSchema(MetaParser):
     """Schema for show ospf vrf all-inclusive sham-links"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -3054,7 +3055,7 @@ class ShowOspfVrfAllInclusiveShamLinksSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ===================================================
@@ -3085,7 +3086,7 @@ class ShowOspfVrfAllInclusiveShamLinks(
 class ShowOspfVrfAllInclusiveVirtualLinksSchema(MetaParser):
     """Schema for show ospf vrf all-inclusive virtual-links"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -3134,7 +3135,7 @@ class ShowOspfVrfAllInclusiveVirtualLinksSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ======================================================
@@ -3165,7 +3166,7 @@ class ShowOspfVrfAllInclusiveVirtualLinks(
 class ShowOspfMplsTrafficEngLinkSchema(MetaParser):
     """Schema for show ospf mpls traffic-eng link"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -3214,7 +3215,7 @@ class ShowOspfMplsTrafficEngLinkSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ============================================
@@ -4567,7 +4568,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
 class ShowOspfVrfAllInclusiveDatabaseRouterSchema(MetaParser):
     """Schema for show ospf vrf all-inclusive database router"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -4646,7 +4647,7 @@ class ShowOspfVrfAllInclusiveDatabaseRouterSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ========================================================
@@ -4682,7 +4683,7 @@ class ShowOspfVrfAllInclusiveDatabaseRouter(
 class ShowOspfVrfAllInclusiveDatabaseExternalSchema(MetaParser):
     """Schema for show ospf vrf all-inclusive database external"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -4745,7 +4746,7 @@ class ShowOspfVrfAllInclusiveDatabaseExternalSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ==========================================================
@@ -4781,7 +4782,7 @@ class ShowOspfVrfAllInclusiveDatabaseExternal(
 class ShowOspfVrfAllInclusiveDatabaseNetworkSchema(MetaParser):
     """Schema for show ospf vrf all-inclusive database network"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -4835,7 +4836,7 @@ class ShowOspfVrfAllInclusiveDatabaseNetworkSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ==========================================================
@@ -4871,7 +4872,7 @@ class ShowOspfVrfAllInclusiveDatabaseNetwork(
 class ShowOspfVrfAllInclusiveDatabaseSummarySchema(MetaParser):
     """Schema for show ospf vrf all-inclusive database summary"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -4929,7 +4930,7 @@ class ShowOspfVrfAllInclusiveDatabaseSummarySchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # =========================================================
@@ -4965,7 +4966,7 @@ class ShowOspfVrfAllInclusiveDatabaseSummary(
 class ShowOspfVrfAllInclusiveDatabaseOpaqueAreaSchema(MetaParser):
     """Schema for show ospf vrf all-inclusive database opaque-area"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "vrf": {
             Any(): {
                 "address_family": {
@@ -5266,7 +5267,7 @@ class ShowOspfVrfAllInclusiveDatabaseOpaqueAreaSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # =============================================================
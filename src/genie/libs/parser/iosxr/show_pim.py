@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -21,7 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 class ShowPimVrfMstaticSchema(MetaParser):
     """Schema for show pim vrf <vrf> <address_family> mstatic"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'address_family':
@@ -41,7 +42,7 @@ class ShowPimVrfMstaticSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowPimVrfMstatic(ShowPimVrfMstaticSchema):
     """Parser for show pim vrf <vrf> <address_family> mstatic
@@ -123,7 +124,7 @@ class ShowPimVrfMstatic(ShowPimVrfMstaticSchema):
 class ShowPimVrfInterfaceDetailSchema(MetaParser):
     """Schema for show pim vrf <vrf> <address_family> interface detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'interfaces':
@@ -154,7 +155,7 @@ class ShowPimVrfInterfaceDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
     """
@@ -339,7 +340,7 @@ class ShowPimVrfInterfaceDetail(ShowPimVrfInterfaceDetailSchema):
 class ShowPimVrfRpfSummarySchema(MetaParser):
     """Schema for show pim vrf <vrf> <address_family> rpf summary"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'address_family':
@@ -363,7 +364,7 @@ class ShowPimVrfRpfSummarySchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowPimVrfRpfSummary(ShowPimVrfRpfSummarySchema):
     """
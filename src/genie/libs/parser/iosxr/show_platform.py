@@ -23,6 +23,7 @@ import xmltodict
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -42,7 +43,7 @@ def regexp(expression):
 
 class ShowVersionSchema(MetaParser):
     """Schema for show version"""
-    schema = {'operating_system': str,
+    schema = LazySchema(lambda: {'operating_system': str,
               'software_version': str,
               'uptime': str,
               Optional('image'): str,
@@ -53,7 +54,7 @@ class ShowVersionSchema(MetaParser):
               Optional('config_register'): str,
               Optional('rp_config_register'): str,
               Optional('main_mem'): str,
-             }
+             })
 
 class ShowVersion(ShowVersionSchema):
     """Parser for show version"""
@@ -163,7 +164,7 @@ class ShowVersion(ShowVersionSchema):
 
 class ShowSdrDetailSchema(MetaParser):
     """Schema for show sdr detail"""
-    schema = {
+    schema = LazySchema(lambda: {
         'sdr_id':
             {Any():
                 {'sdr_name': str,
@@ -182,7 +183,7 @@ class ShowSdrDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowSdrDetail(ShowSdrDetailSchema):
     """Parser for show sdr detail"""
@@ -306,7 +307,7 @@ class ShowSdrDetail(ShowSdrDetailSchema):
 
 class ShowPlatformSchema(MetaParser):
     """Schema for show platform"""
-    schema = {
+    schema = LazySchema(lambda: {
         'slot':
             {Any():
                 {Any():
@@ -327,7 +328,7 @@ class ShowPlatformSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowPlatform(ShowPlatformSchema):
     """Parser for show platform"""
@@ -446,7 +447,7 @@ class ShowPlatform(ShowPlatformSchema):
 
 class ShowPlatformVmSchema(MetaParser):
     """Schema for show platform vm"""
-    schema = {
+    schema = LazySchema(lambda: {
         'node':
             {Any():
                 {'type': str,
@@ -455,7 +456,7 @@ class ShowPlatformVmSchema(MetaParser):
                  'ip_address': str,
                 },
             },
-        }
+        })
 
 class ShowPlatformVm(ShowPlatformVmSchema):
     """Parser for show platform vm"""
@@ -507,11 +508,11 @@ class ShowPlatformVm(ShowPlatformVmSchema):
 # ========================================
 class ShowInstallActiveSummarySchema(MetaParser):
     """Schema for show install active summary"""
-    schema = {
+    schema = LazySchema(lambda: {
         'active_packages': Any(),
         Optional('num_active_packages'): int,
         Optional('sdr'): str,
-        }
+        })
 
 class ShowInstallActiveSummary(ShowInstallActiveSummarySchema):
     """Parser for show install active summary"""
@@ -571,11 +572,11 @@ class ShowInstallActiveSummary(ShowInstallActiveSummarySchema):
 # ========================================
 class ShowInstallInactiveSummarySchema(MetaParser):
     """Schema for show install inactive summary"""
-    schema = {
+    schema = LazySchema(lambda: {
         'inactive_packages': Any(),
         Optional('num_inactive_packages'): int,
         Optional('sdr'): list,
-        }
+        })
 
 class ShowInstallInactiveSummary(ShowInstallInactiveSummarySchema):
     """Parser for show install inactive summary"""
@@ -635,12 +636,12 @@ class ShowInstallInactiveSummary(ShowInstallInactiveSummarySchema):
 # ========================================
 class ShowInstallCommitSummarySchema(MetaParser):
     """Schema for show install commit summary"""
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('committed_packages'): Any(),
         Optional('active_packages'): Any(),
         Optional('num_committed_packages'): int,
         Optional('sdr'): list,
-        }
+        })
 
 class ShowInstallCommitSummary(ShowInstallCommitSummarySchema):
     """Parser for show install commit summary"""
@@ -722,7 +723,7 @@ class ShowInstallCommitSummary(ShowInstallCommitSummarySchema):
 
 class ShowInventorySchema(MetaParser):
     """Schema for show inventory"""
-    schema = {
+    schema = LazySchema(lambda: {
         'module_name':
             {Any():
                 {'descr': str,
@@ -731,7 +732,7 @@ class ShowInventorySchema(MetaParser):
                  Optional('sn'): str,
                 },
             },
-        }
+        })
 
 class ShowInventory(ShowInventorySchema):
     """Parser for show inventory"""
@@ -799,7 +800,7 @@ class ShowInventory(ShowInventorySchema):
 
 class AdminShowDiagChassisSchema(MetaParser):
     """Schema for admin show diag chassis"""
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('device_family'): str,
         Optional('device_series'): str,
         Optional('num_line_cards'): int,
@@ -833,7 +834,7 @@ class AdminShowDiagChassisSchema(MetaParser):
             Optional('hw_version'): str,
             Optional('mfg_bits'): str,
         }
-    }
+    })
 
 class AdminShowDiagChassis(AdminShowDiagChassisSchema):
     """Parser for admin show diag chassis"""
@@ -1121,7 +1122,7 @@ class AdminShowDiagChassis(AdminShowDiagChassisSchema):
 
 class ShowRedundancySummarySchema(MetaParser):
     """Schema for show redundancy summary"""
-    schema = {
+    schema = LazySchema(lambda: {
         'node':
             {Any():
                 {'type': str,
@@ -1131,7 +1132,7 @@ class ShowRedundancySummarySchema(MetaParser):
                 },
             },
         Optional('redundancy_communication'): bool,
-        }
+        })
 
 class ShowRedundancySummary(ShowRedundancySummarySchema):
     """Parser for show redundancy summary"""
@@ -1233,7 +1234,7 @@ class ShowRedundancySummary(ShowRedundancySummarySchema):
 
 class ShowRedundancySchema(MetaParser):
     """Schema for show redundancy"""
-    schema = {
+    schema = LazySchema(lambda: {
         'node':
             {Any():
                 {'role': str,
@@ -1266,7 +1267,7 @@ class ShowRedundancySchema(MetaParser):
                  Optional('reload_cause'): str
                 },
             },
-        }
+        })
 
 class ShowRedundancy(ShowRedundancySchema):
     """Parser for show redundancy"""
@@ -1499,7 +1500,7 @@ class ShowRedundancy(ShowRedundancySchema):
 # ================
 class DirSchema(MetaParser):
     """Schema for dir"""
-    schema = {
+    schema = LazySchema(lambda: {
         'dir': {
             'dir_name': str,
             'total_bytes': str,
@@ -1514,7 +1515,7 @@ class DirSchema(MetaParser):
                      Optional('date'): str}
                 },
             },
-        }
+        })
 
 class Dir(DirSchema):
     """Parser for dir"""
@@ -1605,7 +1606,7 @@ class ShowProcessesMemorySchema(MetaParser):
                   show processes memory | include <WORD>
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'jid': {
             Any(): {
                 'index':{
@@ -1620,7 +1621,7 @@ class ShowProcessesMemorySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowProcessesMemory(ShowProcessesMemorySchema):
@@ -1680,7 +1681,7 @@ class ShowProcessesMemoryDetailSchema(MetaParser):
                   show processes memory detail | include <WORD>
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'jid': {
             int: {
                 'index': {
@@ -1698,7 +1699,7 @@ class ShowProcessesMemoryDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowProcessesMemoryDetail(ShowProcessesMemoryDetailSchema):
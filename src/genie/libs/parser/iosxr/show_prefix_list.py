@@ -11,6 +11,7 @@ import re
 
 # MetaParser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -19,7 +20,7 @@ class ShowRplPrefixSetSchema(MetaParser):
         show rpl prefix-set
         show rpl prefix-set <name>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "prefix_set_name": {
             Any(): {
                 "prefix_set_name": str,
@@ -31,7 +32,7 @@ class ShowRplPrefixSetSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 # =======================================
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 class ShowProcessesSchema(MetaParser):
@@ -16,7 +17,7 @@ class ShowProcessesSchema(MetaParser):
         * show processes 
         * show processes {process}
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'job_id': {
             Any(): {
                 Optional('pid'): int,
@@ -54,7 +55,7 @@ class ShowProcessesSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowProcesses(ShowProcessesSchema):
     ''' Parser for:
@@ -389,7 +390,7 @@ class ShowProcessesCpuSchema(MetaParser):
     """
     Schema for show processes cpu
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'location': {
             Any(): {
                 Optional('one_min_cpu'): int,
@@ -406,7 +407,7 @@ class ShowProcessesCpuSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowProcessesCpu(ShowProcessesCpuSchema):
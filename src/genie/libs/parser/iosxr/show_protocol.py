@@ -11,6 +11,7 @@ from netaddr import IPAddress
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -20,7 +21,7 @@ from genie.libs.parser.utils.common import Common
 # =======================================
 class ShowProtocolsAfiAllAllSchema(MetaParser):
     """Schema for show protocols afi-all all"""
-    schema = {
+    schema = LazySchema(lambda: {
         'protocols': 
             {Optional('ospf'): 
                 {'vrf': 
@@ -150,7 +151,7 @@ class ShowProtocolsAfiAllAllSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =======================================
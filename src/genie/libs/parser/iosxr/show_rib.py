@@ -8,6 +8,7 @@
 import re
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
@@ -18,7 +19,7 @@ from genie.libs.parser.utils.common import Common
 # =============================================
 
 class ShowRibTablesSchema(MetaParser):
-    schema = {'table_id':{
+    schema = LazySchema(lambda: {'table_id':{
                     Any(): {
                         'prefix_count': int,
                         'prefix_limit': int,
@@ -33,7 +34,7 @@ class ShowRibTablesSchema(MetaParser):
                         'forward_referenced' : str,
                         }
                     }
-                }
+                })
      
 
 class ShowRibTables(ShowRibTablesSchema):
@@ -115,7 +116,7 @@ class ShowRibTables(ShowRibTablesSchema):
 
 class ShowRibTablesSummarySchema(MetaParser):
     
-    schema = {'rib_table':{
+    schema = LazySchema(lambda: {'rib_table':{
                        Any(): {
                             'num_unicast_tables': int,
                             'total_unicast_prefixes': int,
@@ -123,7 +124,7 @@ class ShowRibTablesSummarySchema(MetaParser):
                             'total_multicast_prefixes': int,
                         }
                     }
-             }
+             })
                  
 
 
@@ -16,6 +16,7 @@ import re
 
 # MetaParser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -29,7 +30,7 @@ class ShowRipSchema(MetaParser):
         * show rip
         * show rip vrf {vrf}"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -59,7 +60,7 @@ class ShowRipSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ===========================
@@ -263,7 +264,7 @@ class ShowRipStatisticsSchema(MetaParser):
         show rip statistics
         show rip vrf {vrf} statistics"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -291,7 +292,7 @@ class ShowRipStatisticsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ======================================
@@ -477,7 +478,7 @@ class ShowRipDatabaseSchema(MetaParser):
         show rip database
         show rip vrf {vrf} database"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -507,7 +508,7 @@ class ShowRipDatabaseSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ======================================
@@ -641,7 +642,7 @@ class ShowRipInterfaceSchema(MetaParser):
         show rip interface
         show rip vrf {vrf} interface"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -693,7 +694,7 @@ class ShowRipInterfaceSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ======================================
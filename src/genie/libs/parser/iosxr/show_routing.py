@@ -4,6 +4,9 @@ show_route.py
 '''
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+                                                    CompiledMetaParser
 from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional
@@ -12,9 +15,9 @@ from genie.metaparser.util.schemaengine import Schema, \
 # ====================================================
 #  schema for show route ipv4
 # ====================================================
-class ShowRouteIpv4Schema(MetaParser):
+class ShowRouteIpv4Schema(CompiledMetaParser):
     """Schema for show route ipv4"""
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         'vrf': {
             Any(): {
                 'address_family': {
@@ -76,7 +79,7 @@ class ShowRouteIpv4Schema(MetaParser):
                 },
             },
         }
-    }
+    }))
 
 
 # ====================================================
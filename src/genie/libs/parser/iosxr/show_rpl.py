@@ -4,12 +4,13 @@
 
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
 class ShowRplRoutePolicySchema(MetaParser):
     """Schema for show rpl route-policy"""
-    schema = {
+    schema = LazySchema(lambda: {
             Any():
                {Optional('description'): str,
                 'statements':
@@ -67,7 +68,7 @@ class ShowRplRoutePolicySchema(MetaParser):
                         }
                     },
                 },
-            }
+            })
 
 
 class ShowRplRoutePolicy(ShowRplRoutePolicySchema):
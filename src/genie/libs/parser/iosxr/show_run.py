@@ -13,6 +13,7 @@ from collections import OrderedDict
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 
@@ -22,7 +23,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 class ShowRunKeyChainSchema(MetaParser):
     """Schema for show run key chain"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'key_chain': {
             Optional(Any()): {
                 Optional('keys'): {
@@ -36,7 +37,7 @@ class ShowRunKeyChainSchema(MetaParser):
                 Optional('accept_tolerance'): str
             },
         },
-    }
+    })
 
 
 class ShowRunKeyChain(ShowRunKeyChainSchema):
@@ -131,7 +132,7 @@ class ShowRunKeyChain(ShowRunKeyChainSchema):
 class ShowRunRouterIsisSchema(MetaParser):
     """Schema for show run router isis"""
     
-    schema = {
+    schema = LazySchema(lambda: {
         'isis': {
             Any(): {
                 Optional('segment_routing'): OrderedDict({
@@ -183,7 +184,7 @@ class ShowRunRouterIsisSchema(MetaParser):
                 Optional(Any()): Any(),
             },
         },
-    }
+    })
 
 
 class ShowRunRouterIsis(ShowRunRouterIsisSchema):
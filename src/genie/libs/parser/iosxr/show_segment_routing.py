@@ -22,6 +22,7 @@ import re
 
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -30,7 +31,7 @@ class ShowIsisSegmentRoutingPrefixSidMapSchema(MetaParser):
           *  show isis segment-routing prefix-sid-map active-policy
           *  show isis segment-routing prefix-sid-map backup-policy
         '''
-    schema = {
+    schema = LazySchema(lambda: {
         'process_id': {
             Any(): {
                 'policy': {
@@ -47,7 +48,7 @@ class ShowIsisSegmentRoutingPrefixSidMapSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowIsisSegmentRoutingPrefixSidMap(ShowIsisSegmentRoutingPrefixSidMapSchema):
@@ -117,7 +118,7 @@ class ShowOspfSegmentRoutingPrefixSidMapSchema(MetaParser):
           *  show ospf segment-routing prefix-sid-map active-policy
           *  show ospf segment-routing prefix-sid-map backup-policy
         '''
-    schema = {
+    schema = LazySchema(lambda: {
         'process_id': {
             Any(): {
                 'policy': {
@@ -134,7 +135,7 @@ class ShowOspfSegmentRoutingPrefixSidMapSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowOspfSegmentRoutingPrefixSidMap(ShowOspfSegmentRoutingPrefixSidMapSchema):
@@ -201,7 +202,7 @@ class ShowPceIPV4PeerSchema(MetaParser):
     ''' Schema for:
         * show pce ipv4 peer
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'pce_peer_database': {
             Any(): {
                 'state': str,
@@ -212,7 +213,7 @@ class ShowPceIPV4PeerSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowPceIPV4Peer(ShowPceIPV4PeerSchema):
@@ -272,7 +273,7 @@ class ShowPceIPV4PeerDetailSchema(MetaParser):
     ''' Schema for:
         * show pce ipv4 peer detail
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'pce_peer_database': {
             Any(): {
                 'state': str,
@@ -315,7 +316,7 @@ class ShowPceIPV4PeerDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowPceIPV4PeerDetail(ShowPceIPV4PeerDetailSchema):
@@ -499,7 +500,7 @@ class ShowPceIPV4PeerprefixSchema(MetaParser):
     ''' Schema for:
         * show pce ipv4 prefix
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'nodes': {
             Any(): {
                 'te_router_id': str,
@@ -510,7 +511,7 @@ class ShowPceIPV4PeerprefixSchema(MetaParser):
                 'advertised_prefixes': list,
             },
         }
-    }
+    })
 
 
 class ShowPceIPV4PeerPrefix(ShowPceIPV4PeerprefixSchema):
@@ -584,7 +585,7 @@ class ShowPceIpv4TopologySummarySchema(MetaParser):
     ''' Schema for:
         * show pce ipv4 topology summary
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'pce_topology_database_summary': {
             'topology_nodes': int,
             'prefixes': int,
@@ -622,7 +623,7 @@ class ShowPceIpv4TopologySummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowPceIpv4TopologySummary(ShowPceIpv4TopologySummarySchema):
@@ -821,7 +822,7 @@ class ShowPceLspSchema(MetaParser):
     ''' Schema for:
             show pce lsp
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'pcc': {
             Any(): {
                 'tunnel_name': {
@@ -843,7 +844,7 @@ class ShowPceLspSchema(MetaParser):
             },
         }
 
-    }
+    })
 
 
 class ShowPceLsp(ShowPceLspSchema):
@@ -932,7 +933,7 @@ class ShowPceLspDetailSchema(MetaParser):
     ''' Schema for:
        * show pce lsp detail
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'pcc': {
             Any(): {
                 'tunnel_name': str,
@@ -995,7 +996,7 @@ class ShowPceLspDetailSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 
 class ShowPceLspDetail(ShowPceLspDetailSchema):
@@ -1183,12 +1184,12 @@ class ShowSegmentRoutingLocalBlockInconsistenciesSchema(MetaParser):
         * show segment-routing local-block inconsistencies
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'srlb_inconsistencies_range': {
             'start': int,
             'end': int,
         }
-    }
+    })
 
 
 class ShowSegmentRoutingLocalBlockInconsistencies(ShowSegmentRoutingLocalBlockInconsistenciesSchema):
@@ -1228,7 +1229,7 @@ class ShowSegmentRoutingMappingServerPrefixSidMapIPV4Schema(MetaParser):
         * show segment-routing mapping-server prefix-sid-map ipv4
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'ipv4': {
             'number_of_mapping_entries': int,
             'prefix': {
@@ -1239,7 +1240,7 @@ class ShowSegmentRoutingMappingServerPrefixSidMapIPV4Schema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 class ShowSegmentRoutingMappingServerPrefixSidMapIPV4(ShowSegmentRoutingMappingServerPrefixSidMapIPV4Schema):
@@ -1293,7 +1294,7 @@ class ShowSegmentRoutingMappingServerPrefixSidMapIPV4DetailSchema(MetaParser):
         * show segment-routing mapping-server prefix-sid-map ipv4 detail
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'ipv4': {
             'prefix': {
                 Any(): {
@@ -1305,7 +1306,7 @@ class ShowSegmentRoutingMappingServerPrefixSidMapIPV4DetailSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 class ShowSegmentRoutingMappingServerPrefixSidMapIPV4Detail(
@@ -11,6 +11,7 @@ IOSXR parser for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
 										 Any, \
 										 Optional, \
@@ -24,7 +25,7 @@ from genie.libs.parser.utils.common import Common
 
 """Schema for 'show spanning-tree mst {mst_id}'"""
 class ShowSpanningTreeMstSchema(MetaParser):
-	schema = {
+	schema = LazySchema(lambda: {
 		'mstp': {
 			Any(): {
 				'mst_instances': {
@@ -66,7 +67,7 @@ class ShowSpanningTreeMstSchema(MetaParser):
 				}
 			}
 		}
-	}
+	})
 
 # ======================================
 # Parser for:
@@ -243,7 +244,7 @@ class ShowSpanningTreeMst(ShowSpanningTreeMstSchema):
 
 """Schema for 'show spanning-tree mstag <mag_domain>'"""
 class ShowSpanningTreeMstagSchema(MetaParser):
-	schema = {
+	schema = LazySchema(lambda: {
 		'mstag': {
 			Any(): {
 				'domain': str,
@@ -282,7 +283,7 @@ class ShowSpanningTreeMstagSchema(MetaParser):
 				}
 			}
 		}
-	}
+	})
 
 class ShowSpanningTreeMstag(ShowSpanningTreeMstagSchema):
 	"""Parser for 'show spanning-tree mstag <mag_domain>'"""
@@ -515,7 +516,7 @@ class ShowSpanningTreeMstag(ShowSpanningTreeMstagSchema):
 
 """Schema for 'show spanning-tree pvrst <pvst_id>'"""
 class ShowSpanningTreePvrstSchema(MetaParser):
-	schema = {
+	schema = LazySchema(lambda: {
 		'pvst': {
 			Any(): {
 				'pvst_id': str,
@@ -550,7 +551,7 @@ class ShowSpanningTreePvrstSchema(MetaParser):
 				}
 			}
 		}
-	}
+	})
 
 class ShowSpanningTreePvrst(ShowSpanningTreePvrstSchema):
 	"""Parser for 'show spanning-tree pvrst <pvst_id>'"""
@@ -672,7 +673,7 @@ class ShowSpanningTreePvrst(ShowSpanningTreePvrstSchema):
 
 """Schema for 'show spanning-tree pvrstag <pvrstag_domain>'"""
 class ShowSpanningTreePvrsTagSchema(MetaParser):
-	schema = {
+	schema = LazySchema(lambda: {
 		'pvrstag': {
 			Any(): {
 				'domain': str,
@@ -705,7 +706,7 @@ class ShowSpanningTreePvrsTagSchema(MetaParser):
 				}
 			}
 		},
-	}
+	})
 
 class ShowSpanningTreePvrsTag(ShowSpanningTreePvrsTagSchema):
 	"""Parser for 'show spanning-tree pvrstag <pvrstag_domain>'"""
@@ -884,7 +885,7 @@ class ShowSpanningTreePvrsTag(ShowSpanningTreePvrsTagSchema):
 
 """Schema for 'show spanning-tree pvstag <pvstag_domain>'"""
 class ShowSpanningTreePvsTagSchema(MetaParser):
-	schema = {
+	schema = LazySchema(lambda: {
 		'pvstag': {
 			Any(): {
 				'domain': str,
@@ -916,7 +917,7 @@ class ShowSpanningTreePvsTagSchema(MetaParser):
 				}
 			}
 		},
-	}
+	})
 
 class ShowSpanningTreePvsTag(ShowSpanningTreePvsTagSchema):
 	"""Parser for 'show spanning-tree pvstag <pvstag_domain>'"""
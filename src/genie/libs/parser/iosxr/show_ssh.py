@@ -12,6 +12,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 # parser utils
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
@@ -23,7 +24,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 class ShowSshSchema(MetaParser):
     ''' Schema for "show ssh session details" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'session': {
             'version': str,
             Optional('incoming'): {
@@ -49,7 +50,7 @@ class ShowSshSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
             
 # =====================================
@@ -126,7 +127,7 @@ class ShowSsh(ShowSshSchema):
 # =====================================
 class ShowSshHistorySchema(MetaParser):
     #Schema for show SSH history
-    schema = {
+    schema = LazySchema(lambda: {
         'session':{
             'incoming':{
                 Any():
@@ -141,7 +142,7 @@ class ShowSshHistorySchema(MetaParser):
                      }
             }
         }
-    }      
+    })      
 
 # =====================================
 # Parser for 'show ssh session history'
@@ -4,6 +4,7 @@ show_static_route.py
 """
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.libs.parser.utils.common import Common
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
@@ -21,7 +22,7 @@ class ShowStaticTopologyDetailSchema(MetaParser):
         show static vrf <vrf> ipv6 topology detail
         show static ipv4 topology detail
         show static ipv6 topology detail"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('address_family'): {
@@ -71,7 +72,7 @@ class ShowStaticTopologyDetailSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 # ====================================================
 #  parser for show static topology detail
 # ====================================================
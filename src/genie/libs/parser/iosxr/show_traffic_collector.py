@@ -13,6 +13,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 # import parser utils
@@ -27,13 +28,13 @@ class ShowTrafficCollecterExternalInterfaceSchema(MetaParser):
 
         """Schema for show traffic-collector external-interface"""
 
-        schema = {
+        schema = LazySchema(lambda: {
             'interface':{
                 Any():{
                     'status': str
                 },
             },
-        }
+        })
 
 class ShowTrafficCollecterExternalInterface(ShowTrafficCollecterExternalInterfaceSchema):
 
@@ -79,7 +80,7 @@ class ShowTrafficCollecterIpv4CountersPrefixDetailSchema(MetaParser):
 
     '''Schema show traffic-controller ipv4 counters prefix <prefix> detail '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'ipv4_counters':{
             'prefix': {
                 Any():{
@@ -103,7 +104,7 @@ class ShowTrafficCollecterIpv4CountersPrefixDetailSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 class ShowTrafficCollecterIpv4CountersPrefixDetail(ShowTrafficCollecterIpv4CountersPrefixDetailSchema):
 
@@ -10,6 +10,7 @@ import xmltodict
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -17,7 +18,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 class ShowVrfAllDetailSchema(MetaParser):
     """Schema for show vrf all detail"""
 
-    schema = {Any():
+    schema = LazySchema(lambda: {Any():
                 {
                  Optional('route_distinguisher'): str,
                  Optional('vpn_id'): str,
@@ -39,7 +40,7 @@ class ShowVrfAllDetailSchema(MetaParser):
                     },
                 }
             },
-        }
+        })
 
 
 class ShowVrfAllDetail(ShowVrfAllDetailSchema):
@@ -11,6 +11,7 @@ show xsconnect parser class
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                                Any, \
                                                Optional, \
@@ -91,7 +92,7 @@ class ShowL2VpnXconnectBriefSchema(MetaParser):
         * show l2vpn xconnect brief
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('total'):
             {'up': int,
             'down': int,
@@ -125,7 +126,7 @@ class ShowL2VpnXconnectBriefSchema(MetaParser):
                 'unr': int,
                 },
             },
-        }
+        })
 
 
 # ======================================
@@ -232,7 +233,7 @@ class ShowL2VpnXconnectBrief(ShowL2VpnXconnectBriefSchema):
 # ===========================================================
 
 class ShowL2vpnXconnectDetailSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'group': {
             Any(): {
                 Optional('mp2mp'): {
@@ -425,7 +426,7 @@ class ShowL2vpnXconnectDetailSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ===========================================================
 # Parser for:
@@ -1173,7 +1174,7 @@ class ShowL2vpnXconnectMp2mpDetail(ShowL2vpnXconnectDetail):
 
 class ShowL2vpnXconnectSchema(MetaParser):
     """Schema for show l2vpn xconnect"""
-    schema = {
+    schema = LazySchema(lambda: {
         'groups': {
             Any(): {
                 'name': {
@@ -1193,7 +1194,7 @@ class ShowL2vpnXconnectSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowL2vpnXconnect(ShowL2vpnXconnectSchema):
@@ -1425,7 +1426,7 @@ class ShowL2vpnXconnect(ShowL2vpnXconnectSchema):
 
 """Schema for 'show l2vpn xconnect summary'"""
 class ShowL2vpnXconnectSummarySchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'number_of_groups': {
             'total': int,
         },
@@ -1472,7 +1473,7 @@ class ShowL2vpnXconnectSummarySchema(MetaParser):
             'unresolved': int,
             'standby': int,
         }
-    }
+    })
 
 class ShowL2vpnXconnectSummary(ShowL2vpnXconnectSummarySchema):
     """Parser for show l2vpn xconnect summary"""
@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 
@@ -24,7 +25,7 @@ class TracerouteSchema(MetaParser):
         * 'traceroute'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'traceroute':
             {Any():
                  {'hops':
@@ -59,7 +60,7 @@ class TracerouteSchema(MetaParser):
                   Optional('mask'): str,
                   },
              },
-    }
+    })
 
 
 # ================
@@ -9,13 +9,14 @@ import time
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import (Any, 
         Optional, Use, SchemaTypeError, Schema)
 """ Schema for:
             * monitor interface traffic
 """
 class MonitorInterfaceTrafficSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         "monitor-time": {
             Any(): {
                 "hostname": str,
@@ -31,7 +32,7 @@ class MonitorInterfaceTrafficSchema(MetaParser):
                 }
             }
         } 
-    }
+    })
 
 """ Parser for:
             * monitor interface traffic
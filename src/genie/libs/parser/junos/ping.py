@@ -13,6 +13,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import (Any, 
         Optional, Use, SchemaTypeError, Schema)
 
@@ -227,13 +228,13 @@ class Ping(PingSchema):
         return ret_dict
 
 class PingMplsRsvpSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'lsping-statistics': {
             'send': int,
             'received': int,
             'loss-rate': int,
         }
-    }
+    })
 
 class PingMplsRsvp(PingMplsRsvpSchema):
 
@@ -8,6 +8,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
 
@@ -86,7 +87,7 @@ class ShowBFDSessionDetailSchema(MetaParser):
         * show bfd session address {ipaddress} detail
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "bfd-session-information": {
             "bfd-session": {
                 "bfd-client": {
@@ -112,7 +113,7 @@ class ShowBFDSessionDetailSchema(MetaParser):
             "cumulative-transmission-rate": str,
             "sessions": str
         }
-    }
+    })
 
 
 class ShowBFDSessionDetail(ShowBFDSessionDetailSchema):
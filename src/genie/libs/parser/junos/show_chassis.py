@@ -24,13 +24,14 @@ Parser for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema, Or)
 
 class ShowChassisFpcDetailSchema(MetaParser):
 
-    schema = {
+    schema = LazySchema(lambda: {
     Optional("@xmlns:junos"): str,
     "fpc-information": {
         Optional("@junos:style"): str,
@@ -57,7 +58,7 @@ class ShowChassisFpcDetailSchema(MetaParser):
             }
         }
     }
-}
+})
 
 
 class ShowChassisFpcDetail(ShowChassisFpcDetailSchema):
@@ -191,7 +192,7 @@ class ShowChassisFpcDetail(ShowChassisFpcDetailSchema):
 
 class ShowChassisEnvironmentRoutingEngineSchema(MetaParser):
 
-    schema = {
+    schema = LazySchema(lambda: {
     Optional("@xmlns:junos"): str,
     "environment-component-information": {
         Optional("@xmlns"): str,
@@ -200,7 +201,7 @@ class ShowChassisEnvironmentRoutingEngineSchema(MetaParser):
             "state": str
         }
     }
-}
+})
 
 
 class ShowChassisEnvironmentRoutingEngine(ShowChassisEnvironmentRoutingEngineSchema):
@@ -1932,7 +1933,7 @@ class ShowChassisFpc(ShowChassisFpcSchema):
 
 class ShowChassisRoutingEngineSchema(MetaParser):
 
-    schema = {
+    schema = LazySchema(lambda: {
     Optional("@xmlns:junos"): str,
     "route-engine-information": {
         Optional("@xmlns"): str,
@@ -1980,7 +1981,7 @@ class ShowChassisRoutingEngineSchema(MetaParser):
             }],
         Optional("re-state"): str
         }
-    }
+    })
 
 
     def validate_chassis_routing_list(value):
@@ -2649,7 +2650,7 @@ class ShowChassisEnvironmentFpc(ShowChassisEnvironmentFpcSchema):
 
 class ShowChassisAlarmsSchema(MetaParser):
     """ Schema for show chassis alarms"""
-    schema = {
+    schema = LazySchema(lambda: {
         "alarm-information": {
             "alarm-detail": {
                 "alarm-class": str,
@@ -2664,7 +2665,7 @@ class ShowChassisAlarmsSchema(MetaParser):
                 "active-alarm-count": str
             }
         },
-    }
+    })
 
 class ShowChassisAlarms(ShowChassisAlarmsSchema):
     """Parser for show chassis alarms"""
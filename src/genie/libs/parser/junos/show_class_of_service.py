@@ -8,6 +8,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use, Schema)
 
@@ -16,7 +17,7 @@ class ShowClassOfServiceSchema(MetaParser):
     """ Schema for:
             * show class-of-service interface {interface}
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Optional("@xmlns:junos"): str,
         "cos-interface-information": {
             Optional("@xmlns"): str,
@@ -45,7 +46,7 @@ class ShowClassOfServiceSchema(MetaParser):
                 "scheduler-map-name": str
             }
         }
-    }
+    })
 
 
 class ShowClassOfService(ShowClassOfServiceSchema):
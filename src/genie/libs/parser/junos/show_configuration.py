@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
 
@@ -19,7 +20,7 @@ class ShowConfigurationProtocolsMplsLabelSwitchedPathSchema(MetaParser):
         * show configuration protocols mpls label-switched-path {path}
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
             "configuration": {
                 "protocols": {
                     "mpls": {
@@ -38,7 +39,7 @@ class ShowConfigurationProtocolsMplsLabelSwitchedPathSchema(MetaParser):
                     }
                 }
             }
-        }
+        })
 
 class ShowConfigurationProtocolsMplsLabelSwitchedPath(ShowConfigurationProtocolsMplsLabelSwitchedPathSchema):
     """ Parser for:
@@ -193,7 +194,7 @@ class ShowConfigurationFamilyBridgeVlanIdSchema(MetaParser):
         show configuration interfaces {interface} unit {unit} family bridge vlan-id
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional("@xmlns:junos"): str,
         "configuration": {
             Optional("@junos:commit-localtime"): str,
@@ -213,7 +214,7 @@ class ShowConfigurationFamilyBridgeVlanIdSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowConfigurationFamilyBridgeVlanId(ShowConfigurationFamilyBridgeVlanIdSchema):
     cli_command = ['show configuration interfaces {interface} unit {unit} family bridge vlan-id']
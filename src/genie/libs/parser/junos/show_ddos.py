@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
 
@@ -18,7 +19,7 @@ class ShowDdosProtectionStatisticsSchema(MetaParser):
         * show ddos-protection statistics
     """
     
-    schema = {
+    schema = LazySchema(lambda: {
             "ddos-statistics-information": {
                 "aggr-level-control-mode": str,
                 "aggr-level-detection-mode": str,
@@ -35,7 +36,7 @@ class ShowDdosProtectionStatisticsSchema(MetaParser):
                 "total-violations": str,
                 "violation-report-rate": str
             }
-        }
+        })
 
 class ShowDdosProtectionStatistics(ShowDdosProtectionStatisticsSchema):
     """ Parser for:
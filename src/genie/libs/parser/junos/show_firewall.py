@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, 
         Optional, Use, Schema, Or)
@@ -156,7 +157,7 @@ class ShowFirewallCounterFilterSchema(MetaParser):
             * show firewall counter filter {filter} {counter-name}
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
     Optional("@xmlns:junos"): str,
     "firewall-information": {
         Optional("@xmlns"): str,
@@ -169,7 +170,7 @@ class ShowFirewallCounterFilterSchema(MetaParser):
             "filter-name": str
             }
         }
-    }
+    })
 
 
 class ShowFirewallCounterFilter(ShowFirewallCounterFilterSchema):
@@ -16,11 +16,14 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema, JSON_CONTEXT_LIST
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, Or
 
 # import parser utils
-from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.common import Common, select_command
+from genie.libs.parser.utils.junos_xml import parse_xml, parse_json, \
+                                              XML_PIPE, JSON_PIPE
 
 
 # =======================================================
@@ -29,7 +32,7 @@ from genie.libs.parser.utils.common import Common
 class ShowInterfacesTerseSchema(MetaParser):
     """Schema for show interfaces terse [| match <interface>]"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'oper_status': str,
             Optional('link_state'): str,
@@ -45,7 +48,7 @@ class ShowInterfacesTerseSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 # =======================================================
 # Parser for 'show interfaces terse [| match <interface>]
@@ -2074,6 +2077,347 @@ class ShowInterfaces(ShowInterfacesSchema):
 class ShowInterfacesExtensive(ShowInterfaces):
     cli_command = ['show interfaces extensive',
         'show interfaces {interface} extensive']
+
+    CONTEXT_LIST = JSON_CONTEXT_LIST
+
+    # Elements of the <interface-information> reply kept by xml() and json()
+    xml_shape = {
+        'interface-information': {
+            '@junos:style': str,
+            'physical-interface': [{
+                'down-hold-time': str,
+                'up-hold-time': str,
+                'statistics-cleared': str,
+                'active-alarms': {
+                    'interface-alarms': {
+                        'alarm-not-present': bool,
+                        'ethernet-alarm-link-down': bool,
+                    },
+                },
+                'active-defects': {
+                    'interface-alarms': {
+                        'alarm-not-present': bool,
+                        'ethernet-alarm-link-down': bool,
+                    },
+                },
+                'admin-status': {'#text': str, '@junos:format': str},
+                'bpdu-error': str,
+                'clocking': str,
+                'current-physical-address': str,
+                'description': str,
+                'eth-switch-error': str,
+                'ethernet-fec-mode': {
+                    '@junos:style': str,
+                    'enabled_fec_mode': str,
+                },
+                'ethernet-fec-statistics': {
+                    '@junos:style': str,
+                    'fec_ccw_count': str,
+                    'fec_ccw_error_rate': str,
+                    'fec_nccw_count': str,
+                    'fec_nccw_error_rate': str,
+                },
+                'ethernet-pcs-statistics': {
+                    '@junos:style': str,
+                    'bit-error-seconds': str,
+                    'errored-blocks-seconds': str,
+                },
+                'hardware-physical-address': str,
+                'if-config-flags': {
+                    'internal-flags': str,
+                    'iff-snmp-traps': bool,
+                    'iff-hardware-down': bool,
+                },
+                'if-auto-negotiation': str,
+                'if-device-flags': {
+                    'ifdf-present': bool,
+                    'ifdf-running': bool,
+                    'ifdf-loopback': bool,
+                    'ifdf-down': bool,
+                },
+                'if-flow-control': str,
+                'if-media-flags': {
+                    'ifmf-none': bool,
+                },
+                'if-remote-fault': str,
+                'if-type': str,
+                'ifd-specific-config-flags': {
+                    'internal-flags': str,
+                },
+                'interface-flapped': {'#text': str, '@junos:seconds': str},
+                'interface-transmit-statistics': str,
+                'l2pt-error': str,
+                'ld-pdu-error': str,
+                'link-level-type': str,
+                'link-type': str,
+                'link-mode': str,
+                'local-index': str,
+                'logical-interface': [{
+                    'address-family': [{
+                        'address-family-flags': {
+                            'ifff-is-primary': bool,
+                            'ifff-no-redirects': bool,
+                            'ifff-none': bool,
+                            'ifff-sendbcast-pkt-to-re': bool,
+                            'internal-flags': bool,
+                            'ifff-primary': bool,
+                            'ifff-receive-ttl-exceeded': bool,
+                            'ifff-receive-options': bool,
+                            'ifff-encapsulation': str,
+                        },
+                        'address-family-name': str,
+                        'interface-address': {
+                            'ifa-broadcast': str,
+                            'ifa-destination': str,
+                            'generation': str,
+                            'ifa-flags': {
+                                'ifaf-current-preferred': bool,
+                                'ifaf-current-primary': bool,
+                                'ifaf-is-primary': bool,
+                                'ifaf-is-preferred': bool,
+                                'ifaf-kernel': bool,
+                                'ifaf-preferred': bool,
+                                'ifaf-primary': bool,
+                                'ifaf-is-default': bool,
+                                'ifaf-none': bool,
+                                'ifaf-dest-route-down': bool,
+                            },
+                            'ifa-local': str,
+                        },
+                        'intf-curr-cnt': str,
+                        'intf-dropcnt': str,
+                        'intf-unresolved-cnt': str,
+                        'generation': str,
+                        'route-table': str,
+                        'max-local-cache': str,
+                        'maximum-labels': str,
+                        'mtu': str,
+                        'new-hold-limit': str,
+                        'policer-information': {
+                            'policer-input': str,
+                            'policer-output': str,
+                        },
+                    }],
+                    'encapsulation': str,
+                    'filter-information': str,
+                    'if-config-flags': {
+                        'iff-snmp-traps': bool,
+                        'iff-up': bool,
+                        'internal-flags': str,
+                    },
+                    'local-index': str,
+                    'logical-interface-bandwidth': str,
+                    'name': str,
+                    'description': str,
+                    'policer-overhead': str,
+                    'snmp-index': str,
+                    'traffic-statistics': {
+                        '@junos:style': str,
+                        'input-packets': str,
+                        'input-bytes': str,
+                        'output-packets': str,
+                        'output-bytes': str,
+                        'ipv6-transit-statistics': {
+                            'input-bps': str,
+                            'input-bytes': str,
+                            'input-packets': str,
+                            'input-pps': str,
+                            'output-bps': str,
+                            'output-bytes': str,
+                            'output-packets': str,
+                            'output-pps': str,
+                        },
+                    },
+                    'transit-traffic-statistics': {
+                        'input-bps': str,
+                        'input-bytes': str,
+                        'input-packets': str,
+                        'input-pps': str,
+                        'ipv6-transit-statistics': {
+                            'input-bps': str,
+                            'input-bytes': str,
+                            'input-packets': str,
+                            'input-pps': str,
+                            'output-bps': str,
+                            'output-bytes': str,
+                            'output-packets': str,
+                            'output-pps': str,
+                        },
+                        'output-bps': str,
+                        'output-bytes': str,
+                        'output-packets': str,
+                        'output-pps': str,
+                    },
+                }],
+                'loopback': str,
+                'lsi-traffic-statistics': {
+                    '@junos:style': str,
+                    'input-bps': str,
+                    'input-bytes': str,
+                    'input-packets': str,
+                    'input-pps': str,
+                },
+                'mru': str,
+                'mtu': str,
+                'name': str,
+                'oper-status': str,
+                'pad-to-minimum-frame-size': str,
+                'physical-interface-cos-information': {
+                    'physical-interface-cos-hw-max-queues': str,
+                    'physical-interface-cos-use-max-queues': str,
+                },
+                'snmp-index': str,
+                'sonet-mode': str,
+                'source-filtering': str,
+                'speed': str,
+                'stp-traffic-statistics': {
+                    '@junos:style': str,
+                    'stp-input-bytes-dropped': str,
+                    'stp-input-packets-dropped': str,
+                    'stp-output-bytes-dropped': str,
+                    'stp-output-packets-dropped': str,
+                },
+                'traffic-statistics': {
+                    '@junos:style': str,
+                    'input-bps': str,
+                    'output-bytes': str,
+                    'input-bytes': str,
+                    'input-packets': str,
+                    'input-pps': str,
+                    'output-bps': str,
+                    'output-packets': str,
+                    'output-pps': str,
+                    'ipv6-transit-statistics': {
+                        'input-bps': str,
+                        'input-bytes': str,
+                        'input-packets': str,
+                        'input-pps': str,
+                        'output-bps': str,
+                        'output-bytes': str,
+                        'output-packets': str,
+                        'output-pps': str,
+                    },
+                },
+                'output-error-list': {
+                    'aged-packets': str,
+                    'carrier-transitions': str,
+                    'hs-link-crc-errors': str,
+                    'mtu-errors': str,
+                    'output-collisions': str,
+                    'output-drops': str,
+                    'output-errors': str,
+                    'output-fifo-errors': str,
+                    'output-resource-errors': str,
+                },
+                'ethernet-mac-statistics': {
+                    '@junos:style': str,
+                    'input-broadcasts': str,
+                    'input-bytes': str,
+                    'input-code-violations': str,
+                    'input-crc-errors': str,
+                    'input-fifo-errors': str,
+                    'input-fragment-frames': str,
+                    'input-jabber-frames': str,
+                    'input-mac-control-frames': str,
+                    'input-mac-pause-frames': str,
+                    'input-multicasts': str,
+                    'input-oversized-frames': str,
+                    'input-packets': str,
+                    'input-total-errors': str,
+                    'input-unicasts': str,
+                    'input-vlan-tagged-frames': str,
+                    'output-broadcasts': str,
+                    'output-bytes': str,
+                    'output-crc-errors': str,
+                    'output-fifo-errors': str,
+                    'output-mac-control-frames': str,
+                    'output-mac-pause-frames': str,
+                    'output-multicasts': str,
+                    'output-packets': str,
+                    'output-total-errors': str,
+                    'output-unicasts': str,
+                },
+                'ethernet-filter-statistics': {
+                    'input-packets': str,
+                    'input-reject-count': str,
+                    'input-reject-destination-address-count': str,
+                    'input-reject-source-address-count': str,
+                    'output-packet-error-count': str,
+                    'output-packet-pad-count': str,
+                    'output-packets': str,
+                    'cam-destination-filter-count': str,
+                    'cam-source-filter-count': str,
+                },
+                'cos-information': {
+                    'cos-stream-information': {
+                        'cos-direction': str,
+                        'cos-queue-configuration': [{
+                            'cos-queue-bandwidth': str,
+                            'cos-queue-bandwidth-bps': str,
+                            'cos-queue-buffer': str,
+                            'cos-queue-buffer-bytes': str,
+                            'cos-queue-forwarding-class': str,
+                            'cos-queue-limit': str,
+                            'cos-queue-number': str,
+                            'cos-queue-priority': str,
+                        }],
+                    },
+                },
+                'input-error-list': {
+                    'framing-errors': str,
+                    'input-discards': str,
+                    'input-drops': str,
+                    'input-errors': str,
+                    'input-fifo-errors': str,
+                    'input-giants': str,
+                    'input-l2-channel-errors': str,
+                    'input-l2-mismatch-timeouts': str,
+                    'input-l3-incompletes': str,
+                    'input-resource-errors': str,
+                    'input-runts': str,
+                },
+                'transit-traffic-statistics': {
+                    'input-bps': str,
+                    'input-bytes': str,
+                    'input-packets': str,
+                    'input-pps': str,
+                    'ipv6-transit-statistics': {
+                        'input-bps': str,
+                        'input-bytes': str,
+                        'input-packets': str,
+                        'input-pps': str,
+                        'output-bps': str,
+                        'output-bytes': str,
+                        'output-packets': str,
+                        'output-pps': str,
+                    },
+                    'output-bps': str,
+                    'output-bytes': str,
+                    'output-packets': str,
+                    'output-pps': str,
+                },
+                'pfe-information': {
+                    'destination-mask': str,
+                    'destination-slot': str,
+                },
+                'queue-counters': {
+                    '@junos:style': str,
+                    'interface-cos-short-summary': {
+                        'intf-cos-num-queues-in-use': str,
+                        'intf-cos-num-queues-supported': str,
+                    },
+                    'queue': [{
+                        'forwarding-class-name': str,
+                        'queue-counters-queued-packets': str,
+                        'queue-counters-total-drop-packets': str,
+                        'queue-counters-trans-packets': str,
+                        'queue-number': str,
+                    }],
+                },
+            }],
+        },
+    }
+
     def cli(self, interface=None, output=None):
 
         if not output:
@@ -2088,6 +2432,24 @@ class ShowInterfacesExtensive(ShowInterfaces):
         
         return super().cli(output=out)
 
+    def xml(self, output=None, **kwargs):
+        if not output:
+            out = self.device.execute(
+                select_command(self.cli_command, **kwargs) + XML_PIPE)
+        else:
+            out = output
+
+        return parse_xml(out, self.xml_shape)
+
+    def json(self, output=None, **kwargs):
+        if not output:
+            out = self.device.execute(
+                select_command(self.cli_command, **kwargs) + JSON_PIPE)
+        else:
+            out = output
+
+        return parse_json(out, self.xml_shape)
+
 class ShowInterfacesExtensiveNoForwarding(ShowInterfacesExtensive):
     cli_command = ['show interfaces extensive no-forwarding']
     def cli(self, output=None):
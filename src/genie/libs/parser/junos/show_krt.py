@@ -8,13 +8,14 @@ JunOs parsers for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
 
 class ShowKrtStateSchema(MetaParser):
 
-    schema = {
+    schema = LazySchema(lambda: {
     "krt-state-information": {
         "krt-queue-state": {
             "krtq-async-count": str,
@@ -43,7 +44,7 @@ class ShowKrtStateSchema(MetaParser):
         },
         "rtsock-time-until-next-scan": str
     }
-}
+})
 
 
 class ShowKrtState(ShowKrtStateSchema):
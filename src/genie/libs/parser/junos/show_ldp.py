@@ -13,6 +13,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
 
@@ -310,7 +311,7 @@ class ShowLDPOverviewSchema(MetaParser):
     """ Schema for
         * show ldp overview
     """
-    schema = {
+    schema = LazySchema(lambda: {
         "ldp-overview-information": {
             "ldp-overview": {
                 "ldp-instance-name": str,
@@ -421,7 +422,7 @@ class ShowLDPOverviewSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 class ShowLDPOverview(ShowLDPOverviewSchema):
@@ -819,7 +820,7 @@ class ShowLDPInterfaceSchema(MetaParser):
     """ Schema for:
             * show ldp interface {interface}
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Optional("@xmlns:junos"): str,
         "ldp-interface-information": {
             Optional("@xmlns"): str,
@@ -834,7 +835,7 @@ class ShowLDPInterfaceSchema(MetaParser):
                 Optional("ldp-transport-address"): str,
             }
         }
-    }
+    })
 
 
 class ShowLDPInterface(ShowLDPInterfaceSchema):
@@ -916,7 +917,7 @@ class ShowLdpSessionIpaddressDetailSchema(MetaParser):
             * show ldp session ipaddress detail
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
     "ldp-session-information": {
         "ldp-session": {
             "ldp-connection-state": str,
@@ -967,7 +968,7 @@ class ShowLdpSessionIpaddressDetailSchema(MetaParser):
             Optional("ldp-up-time"): str
         }
     }
-}
+})
 
 
 class ShowLdpSessionIpaddressDetail(ShowLdpSessionIpaddressDetailSchema):
@@ -11,6 +11,7 @@ import re
 # Schema for 'show lldp'
 # ==============================
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Optional
 
 
@@ -20,7 +21,7 @@ class ShowLldpSchema(MetaParser):
     """
 
     # These are the key-value pairs to add to the parsed dictionary
-    schema = {
+    schema = LazySchema(lambda: {
         'lldp-global-status': str,
         'lldp-advertisement-interval': str,
         'lldp-transmit-delay-interval': str,
@@ -31,7 +32,7 @@ class ShowLldpSchema(MetaParser):
         'lldp-med-global-status': str,
         'lldp-port-id-subtype': str,
         Optional('lldp-port-description-type'): str,
-    }
+    })
 
 
 # ==============================
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
 
@@ -18,9 +19,9 @@ class ShowLogFilenameSchema(MetaParser):
             * show log {filename}
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "file-content": list
-    }
+    })
 
 class ShowLogFilename(ShowLogFilenameSchema):
     """ Parser for:
@@ -13,6 +13,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use
 
 # pyats
@@ -25,7 +26,7 @@ from pyats.utils.exceptions import SchemaError
 class ShowNtpAssociationsSchema(MetaParser):
     """Schema for show ntp associations"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'peer': {
             Any():{
                 'local_mode': {
@@ -56,7 +57,7 @@ class ShowNtpAssociationsSchema(MetaParser):
                 Optional('associations_local_mode'): str,
             }
         }
-    }
+    })
 
 # ==============================================
 #  Parser for show ntp associations
@@ -161,7 +162,7 @@ class ShowNtpAssociations(ShowNtpAssociationsSchema):
 class ShowNtpStatusSchema(MetaParser):
     """Schema for: show ntp status"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'clock_state': {
             'system_status': {
                 Optional('ass_id'): int,
@@ -190,7 +191,7 @@ class ShowNtpStatusSchema(MetaParser):
                 Optional('leap'): str,
             }
         }
-    }
+    })
 
 class ShowNtpStatus(ShowNtpStatusSchema):
     """Parser for: show ntp status"""
@@ -304,7 +305,7 @@ class ShowNtpStatus(ShowNtpStatusSchema):
 class ShowConfigurationSystemNtpSetSchema(MetaParser):
     """Schema for: show configuration system ntp | display set """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address': {
@@ -327,7 +328,7 @@ class ShowConfigurationSystemNtpSetSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowConfigurationSystemNtpSet(ShowConfigurationSystemNtpSetSchema):
     """Parser for: show configuration system ntp | display set """
@@ -37,10 +37,16 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema, JSON_CONTEXT_LIST
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema, Or)
 
+# Parser utils
+from genie.libs.parser.utils.common import select_command
+from genie.libs.parser.utils.junos_xml import (parse_xml, parse_json,
+                                               XML_PIPE, JSON_PIPE)
+
 
 class ShowOspfInterfaceBriefSchema(MetaParser):
     """ Schema for:
@@ -52,7 +58,7 @@ class ShowOspfInterfaceBriefSchema(MetaParser):
             * show ospf interface {interface}
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'areas': {
@@ -69,7 +75,7 @@ class ShowOspfInterfaceBriefSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowOspfInterfaceBrief(ShowOspfInterfaceBriefSchema):
@@ -167,7 +173,7 @@ class ShowOspfInterfaceDetailSchema(MetaParser):
            * show ospf interface {interface} detail instance {instance}
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'areas': {
@@ -212,7 +218,7 @@ class ShowOspfInterfaceDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowOspfInterfaceDetail(ShowOspfInterfaceDetailSchema):
@@ -1197,7 +1203,7 @@ class ShowOspfDatabaseExternalExtensive(ShowOspfDatabaseExternalExtensiveSchema
 
 class ShowOspfOverviewSchema(MetaParser):
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional("@xmlns:junos"): str,
         "ospf-overview-information": {
             Optional("@xmlns"): str,
@@ -1254,7 +1260,7 @@ class ShowOspfOverviewSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 '''
@@ -2508,6 +2514,127 @@ class ShowOspfDatabaseExtensive(ShowOspfDatabaseExtensiveSchema):
         'show ospf database {data_type} extensive'
         ]
 
+    CONTEXT_LIST = JSON_CONTEXT_LIST
+
+    # Elements of the <ospf-database-information> reply kept by xml() and
+    # json()
+    xml_shape = {
+        'ospf-database-information': {
+            'ospf-area-header': {
+                'ospf-area': str,
+            },
+            'ospf-database': [{
+                'advertising-router': str,
+                'age': str,
+                'checksum': str,
+                'lsa-id': str,
+                'our-entry': bool,
+                'lsa-length': str,
+                'lsa-type': str,
+                'options': str,
+                'ospf-network-lsa': {
+                    'address-mask': str,
+                    'attached-router': [str],
+                    'ospf-lsa-topology': {
+                        'ospf-lsa-topology-link': [{
+                            'link-type-name': str,
+                            'ospf-lsa-topology-link-metric': str,
+                            'ospf-lsa-topology-link-node-id': str,
+                            'ospf-lsa-topology-link-state': str,
+                        }],
+                        'ospf-topology-id': str,
+                        'ospf-topology-name': str,
+                    },
+                },
+                'ospf-database-extensive': {
+                    'aging-timer': {'#text': str},
+                    'expiration-time': {'#text': str},
+                    'installation-time': {'#text': str},
+                    'generation-timer': {'#text': str},
+                    'lsa-change-count': str,
+                    'lsa-changed-time': {'#text': str},
+                    'send-time': {'#text': str},
+                    'database-entry-state': str,
+                },
+                'ospf-router-lsa': {
+                    'bits': str,
+                    'link-count': str,
+                    'ospf-link': [{
+                        'link-data': str,
+                        'link-id': str,
+                        'link-type-name': str,
+                        'link-type-value': str,
+                        'metric': str,
+                        'ospf-topology-count': str,
+                    }],
+                    'ospf-lsa-topology': {
+                        'ospf-lsa-topology-link': [{
+                            'link-type-name': str,
+                            'ospf-lsa-topology-link-metric': str,
+                            'ospf-lsa-topology-link-node-id': str,
+                            'ospf-lsa-topology-link-state': str,
+                        }],
+                        'ospf-topology-id': str,
+                        'ospf-topology-name': str,
+                    },
+                },
+                'ospf-opaque-area-lsa': {
+                    'tlv-block': {
+                        'formatted-tlv-data': str,
+                        'tlv-length': str,
+                        'tlv-type-name': str,
+                        'tlv-type-value': str,
+                    },
+                    'te-subtlv': [{
+                        'formatted-tlv-data': [str],
+                        'tlv-length': [str],
+                        'tlv-type-name': [str],
+                        'tlv-type-value': [str],
+                    }],
+                },
+                'ospf-external-lsa': {
+                    'address-mask': str,
+                    'ospf-external-lsa-topology': {
+                        'forward-address': str,
+                        'ospf-topology-id': str,
+                        'ospf-topology-metric': str,
+                        'ospf-topology-name': str,
+                        'tag': str,
+                        'type-value': str,
+                    },
+                },
+                'ospf-summary-lsa': {
+                    'address-mask': str,
+                    'ospf-summary-lsa-topology': {
+                        'ospf-topology-name': str,
+                        'ospf-topology-id': str,
+                        'ospf-topology-metric': str,
+                    },
+                },
+                'sequence-number': str,
+            }],
+        },
+    }
+
+    @staticmethod
+    def _merge(parsed):
+        """Fold the reply onto the cli layout: the header of the last area
+        is kept, and the sub-TLVs of an LSA are merged into lists"""
+        info = parsed.get('ospf-database-information', {})
+        if isinstance(info.get('ospf-area-header'), list):
+            info['ospf-area-header'] = info['ospf-area-header'][-1]
+
+        for entry in info.get('ospf-database', []):
+            opaque = entry.get('ospf-opaque-area-lsa', {})
+            if 'te-subtlv' not in opaque:
+                continue
+            merged = {}
+            for subtlv in opaque['te-subtlv']:
+                for key, values in subtlv.items():
+                    merged.setdefault(key, []).extend(values)
+            opaque['te-subtlv'] = merged
+        return parsed
+
     def cli(self, data_type=None, output=None):
         if not output:
             if data_type:
@@ -3394,6 +3521,24 @@ class ShowOspfDatabaseExtensive(ShowOspfDatabaseExtensiveSchema):
 
         return ret_dict
 
+    def xml(self, output=None, **kwargs):
+        if not output:
+            out = self.device.execute(
+                select_command(self.cli_command, **kwargs) + XML_PIPE)
+        else:
+            out = output
+
+        return self._merge(parse_xml(out, self.xml_shape))
+
+    def json(self, output=None, **kwargs):
+        if not output:
+            out = self.device.execute(
+                select_command(self.cli_command, **kwargs) + JSON_PIPE)
+        else:
+            out = output
+
+        return self._merge(parse_json(out, self.xml_shape))
+
 class ShowOspfDatabaseAdvertisingRouterExtensive(ShowOspfDatabaseExtensive):
     """ Parser for:
             * show ospf database advertising-router {ipaddress} extensive
@@ -4563,7 +4708,7 @@ class ShowOspfDatabaseOpaqueArea(ShowOspfDatabaseOpaqueAreaSchema):
 
 
 class ShowOspfRoutePrefixSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         "ospf-route-information": {
             "ospf-topology-route-table": {
                 "ospf-route": {
@@ -4586,7 +4731,7 @@ class ShowOspfRoutePrefixSchema(MetaParser):
                 "ospf-topology-name": str
             }
         }
-    }
+    })
 
     
 
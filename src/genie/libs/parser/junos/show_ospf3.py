@@ -19,6 +19,7 @@ Parser for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema)
@@ -1066,7 +1067,7 @@ class ShowOspf3DatabaseExternalExtensive(
 
 
 class ShowOspf3OverviewSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         "ospf3-overview-information": {
             "ospf-overview": {
                 "instance-name": str,
@@ -1098,7 +1099,7 @@ class ShowOspf3OverviewSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ==============================================
@@ -2796,7 +2797,7 @@ class ShowOspf3NeighborInstanceAll(ShowOspf3NeighborInstanceAllSchema):
 
 class ShowOspf3RouteRouteSchema(MetaParser):
 
-    schema = {
+    schema = LazySchema(lambda: {
       "ospf3-route-information": {
             "ospf-topology-route-table": {
                 "ospf3-route": {
@@ -2818,7 +2819,7 @@ class ShowOspf3RouteRouteSchema(MetaParser):
                     }
                 }
             }
-        }
+        })
 
 '''
 Parser for:
@@ -11,17 +11,21 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema)
 
+# parser utils
+from genie.libs.parser.utils.pattern_dispatch import PatternDispatcher
+
 
 class ShowPfeStatisticsTrafficSchema(MetaParser):
     """ Schema for:
             * show pfe statistics traffic
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "pfe-statistics": {
             "pfe-chip-statistics": {
                 "input-checksum": str,
@@ -78,7 +82,7 @@ class ShowPfeStatisticsTrafficSchema(MetaParser):
                 "pfe-output-packets": str
             }
         }
-    }
+    })
 
 
 class ShowPfeStatisticsTraffic(ShowPfeStatisticsTrafficSchema):
@@ -234,443 +238,75 @@ class ShowPfeStatisticsTraffic(ShowPfeStatisticsTrafficSchema):
         # Output MTU                 :                    0
         p40 = re.compile(r'^Output +MTU +: +(?P<output_mtu>\d+)$')
 
+        # Section of the counters matched by each pattern
+        sections = {
+            'p1': 'pfe-traffic-statistics',
+            'p2': 'pfe-traffic-statistics',
+            'p3': 'pfe-traffic-statistics',
+            'p4': 'pfe-traffic-statistics',
+            'p5': 'pfe-local-traffic-statistics',
+            'p6': 'pfe-local-traffic-statistics',
+            'p7': 'pfe-local-traffic-statistics',
+            'p8': 'pfe-local-traffic-statistics',
+            'p9': 'pfe-local-traffic-statistics',
+            'p10': 'pfe-local-traffic-statistics',
+            'p11': 'pfe-local-traffic-statistics',
+            'p12': 'pfe-local-traffic-statistics',
+            'p13': 'pfe-local-protocol-statistics',
+            'p14': 'pfe-local-protocol-statistics',
+            'p15': 'pfe-local-protocol-statistics',
+            'p16': 'pfe-local-protocol-statistics',
+            'p17': 'pfe-local-protocol-statistics',
+            'p18': 'pfe-local-protocol-statistics',
+            'p19': 'pfe-local-protocol-statistics',
+            'p20': 'pfe-local-protocol-statistics',
+            'p21': 'pfe-local-protocol-statistics',
+            'p22': 'pfe-local-protocol-statistics',
+            'p23': 'pfe-local-protocol-statistics',
+            'p24': 'pfe-local-protocol-statistics',
+            'p25': 'pfe-local-protocol-statistics',
+            'p26': 'pfe-local-protocol-statistics',
+            'p27': 'pfe-hardware-discard-statistics',
+            'p28': 'pfe-hardware-discard-statistics',
+            'p29': 'pfe-hardware-discard-statistics',
+            'p30': 'pfe-hardware-discard-statistics',
+            'p31': 'pfe-hardware-discard-statistics',
+            'p32': 'pfe-hardware-discard-statistics',
+            'p33': 'pfe-hardware-discard-statistics',
+            'p34': 'pfe-hardware-discard-statistics',
+            'p35': 'pfe-hardware-discard-statistics',
+            'p36': 'pfe-hardware-discard-statistics',
+            'p37': 'pfe-hardware-discard-statistics',
+            'p38': 'pfe-hardware-discard-statistics',
+            'p39': 'pfe-chip-statistics',
+            'p40': 'pfe-chip-statistics',
+        }
+
+        # One counter per line, the patterns are exclusive and may be
+        # tried by hits (see utils/pattern_dispatch.py)
+        dispatcher = PatternDispatcher(self, [
+            ('p1', p1), ('p2', p2), ('p3', p3), ('p4', p4), ('p5', p5),
+            ('p6', p6), ('p7', p7), ('p8', p8), ('p9', p9), ('p10', p10),
+            ('p11', p11), ('p12', p12), ('p13', p13), ('p14', p14),
+            ('p15', p15), ('p16', p16), ('p17', p17), ('p18', p18),
+            ('p19', p19), ('p20', p20), ('p21', p21), ('p22', p22),
+            ('p23', p23), ('p24', p24), ('p25', p25), ('p26', p26),
+            ('p27', p27), ('p28', p28), ('p29', p29), ('p30', p30),
+            ('p31', p31), ('p32', p32), ('p33', p33), ('p34', p34),
+            ('p35', p35), ('p36', p36), ('p37', p37), ('p38', p38),
+            ('p39', p39), ('p40', p40),
+        ], exclusive=True)
+
         for line in out.splitlines():
             line = line.strip()
 
             # Input  packets:            763584752                   14 pps
-            m = p1.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Output packets:            728623201                   16 pps
-            m = p2.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            #    Fabric Input  :                    0                    0 pps
-            m = p3.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            #    Fabric Output :                    0                    0 pps
-            m = p4.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
             # Local packets input                 :            184259247
-            m = p5.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Local packets output                :            370506284
-            m = p6.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Software input control plane drops  :                    0
-            m = p7.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Software input high drops           :                    0
-            m = p8.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Software input medium drops         :                    0
-            m = p9.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Software input low drops            :                    0
-            m = p10.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Software output drops               :                    0
-            m = p11.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Hardware input drops                :                    0
-            m = p12.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-traffic-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # HDLC keepalives            :                    0
-            m = p13.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # ATM OAM                    :                    0
-            m = p14.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Frame Relay LMI            :                    0
-            m = p15.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # PPP LCP/NCP                :                    0
-            m = p16.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # OSPF hello                 :              5732336
-            m = p17.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # OSPF3 hello                :              4146329
-            m = p18.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # RSVP hello                 :              7040269
-            m = p19.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # LDP hello                  :              3462026
-            m = p20.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # BFD                        :             82347033
-            m = p21.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # IS-IS IIH                  :                    0
-            m = p22.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # LACP                       :                    0
-            m = p23.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # ARP                        :                56818
-            m = p24.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # ETHER OAM                  :                    0
-            m = p25.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Unknown                    :                    0
-            m = p26.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-local-protocol-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Timeout                    :                    0
-            m = p27.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Truncated key              :                    0
-            m = p28.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Bits to test               :                    0
-            m = p29.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Data error                 :                    0
-            m = p30.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # TCP header length error    :                    0
-            m = p31.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Stack underflow            :                    0
-            m = p32.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Stack overflow             :                    0
-            m = p33.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
             # Normal discard             :               962415
-            m = p34.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Extended discard           :                    0
-            m = p35.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Invalid interface          :                    0
-            m = p36.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Info cell drops            :                    0
-            m = p37.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Fabric drops               :                    0
-            m = p38.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-hardware-discard-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Input Checksum             :                    0
-            m = p39.match(line)
+            name, m = dispatcher.match(line)
             if m:
                 entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-chip-statistics', {})
-                group = m.groupdict()
-                for group_key, group_value in group.items():
-                    entry_key = group_key.replace('_', '-')
-                    entry[entry_key] = group_value
-                continue
-
-            # Output MTU                 :                    0
-            m = p40.match(line)
-            if m:
-                entry = ret_dict.setdefault('pfe-statistics', {})\
-                    .setdefault('pfe-chip-statistics', {})
+                    .setdefault(sections[name], {})
                 group = m.groupdict()
                 for group_key, group_value in group.items():
                     entry_key = group_key.replace('_', '-')
@@ -685,7 +321,7 @@ class ShowPfeStatisticsIpIcmpSchema(MetaParser):
             * show pfe statistics ip icmp
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "pfe-statistics": {
             "icmp-statistics": {
                 "requests": str,
@@ -714,7 +350,7 @@ class ShowPfeStatisticsIpIcmpSchema(MetaParser):
                 "icmp-errors": str,
             },
         }
-    }
+    })
 
 
 class ShowPfeStatisticsIpIcmp(ShowPfeStatisticsIpIcmpSchema):
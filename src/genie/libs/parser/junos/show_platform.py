@@ -11,6 +11,7 @@ import re
 
 # Genie
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, \
                     Optional, Use
 
@@ -26,7 +27,7 @@ class FileListSchema(MetaParser):
         * 'file list {filename}'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'dir': 
             {Any(): 
                 {Optional('files'): 
@@ -36,7 +37,7 @@ class FileListSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===========================
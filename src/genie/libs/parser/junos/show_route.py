@@ -27,8 +27,14 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema, JSON_CONTEXT_LIST
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+
+# import parser utils
+from genie.libs.parser.utils.common import select_command
+from genie.libs.parser.utils.junos_xml import parse_xml, parse_json, \
+                                              XML_PIPE, JSON_PIPE
 '''
 Schema for:
     * show route table {table}
@@ -38,7 +44,7 @@ Schema for:
 '''
 class ShowRouteTableSchema(MetaParser):
 
-    schema = {        
+    schema = LazySchema(lambda: {        
         'table_name': {
             Any(): {
                 'destination_count': int,
@@ -69,7 +75,7 @@ class ShowRouteTableSchema(MetaParser):
                     }
                 }
             }
-        }
+        })
        
 '''
 Parser for:
@@ -344,6 +350,73 @@ class ShowRoute(ShowRouteSchema):
                     'show route protocol {protocol} {ip_address}',
                     'show route protocol {protocol} table {table}']
 
+    CONTEXT_LIST = JSON_CONTEXT_LIST
+
+    # Elements of the <route-information> reply kept by xml() and json()
+    xml_shape = {
+        'route-information': {
+            'route-table': [{
+                'active-route-count': str,
+                'destination-count': str,
+                'hidden-route-count': str,
+                'holddown-route-count': str,
+                'rt': [{
+                    'rt-destination': str,
+                    'rt-entry': {
+                        'active-tag': str,
+                        'age': {'#text': str, '@junos:seconds': str},
+                        'as-path': str,
+                        'current-active': str,
+                        'last-active': str,
+                        'learned-from': str,
+                        'local-preference': str,
+                        'peer-id': str,
+                        'med': str,
+                        'metric': str,
+                        'metric2': str,
+                        'nh': [{
+                            'mpls-label': str,
+                            'selected-next-hop': str,
+                            'nh-local-interface': str,
+                            'nh-table': str,
+                            'to': str,
+                            'via': str,
+                        }],
+                        'nh-type': str,
+                        'preference': str,
+                        'preference2': str,
+                        'protocol-name': str,
+                        'rt-tag': str,
+                        'validation-state': str,
+                    },
+                }],
+                'table-name': str,
+                'total-route-count': str,
+            }],
+        },
+    }
+
+    @staticmethod
+    def _split_entries(parsed):
+        """The cli output has one rt per route entry, the destination is
+        only set on the first one"""
+        tables = parsed.get('route-information', {}).get('route-table', [])
+        for table in tables:
+            rt_list = []
+            for rt in table.get('rt', []):
+                entries = rt.get('rt-entry')
+                if not isinstance(entries, list):
+                    rt_list.append(rt)
+                    continue
+                for index, entry in enumerate(entries):
+                    rt_dict = {'rt-entry': entry}
+                    if not index and 'rt-destination' in rt:
+                        rt_dict['rt-destination'] = rt['rt-destination']
+                    rt_list.append(rt_dict)
+            if rt_list:
+                table['rt'] = rt_list
+        return parsed
+
     def cli(self, protocol=None, ip_address=None, table=None, output=None):
         if not output:
             if protocol and table:
@@ -542,6 +615,24 @@ class ShowRoute(ShowRouteSchema):
                 continue
         return ret_dict
 
+    def xml(self, output=None, **kwargs):
+        if not output:
+            out = self.device.execute(
+                select_command(self.cli_command, **kwargs) + XML_PIPE)
+        else:
+            out = output
+
+        return self._split_entries(parse_xml(out, self.xml_shape))
+
+    def json(self, output=None, **kwargs):
+        if not output:
+            out = self.device.execute(
+                select_command(self.cli_command, **kwargs) + JSON_PIPE)
+        else:
+            out = output
+
+        return self._split_entries(parse_json(out, self.xml_shape))
+
 class ShowRouteLogicalSystem(ShowRoute):
     """ Parser for:
             * show route logical-system {logical_name}
@@ -871,6 +962,118 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                     'show route extensive',
                     'show route extensive {destination}',
                     'show route protocol {protocol} {destination} extensive']
+
+    # cli() only loops over output.splitlines() and xml() reads the output
+    # as a file, a MappedOutput is parsed without loading the whole output
+    mapped_output = True
+
+    CONTEXT_LIST = JSON_CONTEXT_LIST
+
+    # Elements of the <route-information> reply kept by xml() and json()
+    xml_shape = {
+        'route-information': {
+            'route-table': [{
+                'active-route-count': str,
+                'destination-count': str,
+                'hidden-route-count': str,
+                'holddown-route-count': str,
+                'rt': [{
+                    'rt-announced-count': str,
+                    'rt-destination': str,
+                    'rt-entry': {
+                        'accepted': str,
+                        'active-tag': str,
+                        'age': {'#text': str, '@junos:seconds': str},
+                        'announce-bits': str,
+                        'announce-tasks': str,
+                        'as-path': str,
+                        'cluster-list': str,
+                        'bgp-rt-flag': str,
+                        'bgp-path-attributes': {
+                            'attr-as-path-effective': {
+                                'aspath-effective-string': str,
+                                'attr-value': str,
+                            },
+                        },
+                        'current-active': str,
+                        'inactive-reason': str,
+                        'last-active': str,
+                        'local-as': str,
+                        'local-preference': str,
+                        'peer-as': str,
+                        'metric': str,
+                        'metric2': str,
+                        'nh': [{
+                            'label-element': str,
+                            'label-element-childcount': str,
+                            'label-element-lspid': str,
+                            'label-element-parent': str,
+                            'label-element-refcount': str,
+                            'label-ttl-action': str,
+                            'load-balance-label': str,
+                            'mpls-label': str,
+                            'nh-string': str,
+                            'selected-next-hop': str,
+                            'session': str,
+                            'to': str,
+                            'via': str,
+                            'weight': str,
+                        }],
+                        'nh-address': str,
+                        'nh-index': str,
+                        'nh-kernel-id': str,
+                        'nh-reference-count': str,
+                        'gateway': str,
+                        'nh-type': str,
+                        'preference': str,
+                        'preference2': str,
+                        'protocol-name': str,
+                        'protocol-nh': {
+                            'forwarding-nh-count': str,
+                            'indirect-nh': str,
+                            'label-ttl-action': str,
+                            'load-balance-label': str,
+                            'metric': str,
+                            'mpls-label': str,
+                            'nh': {
+                                'label-element': str,
+                                'label-element-childcount': str,
+                                'label-element-lspid': str,
+                                'label-element-parent': str,
+                                'label-element-refcount': str,
+                                'label-ttl-action': str,
+                                'load-balance-label': str,
+                                'mpls-label': str,
+                                'nh-string': str,
+                                'selected-next-hop': str,
+                                'session': str,
+                                'to': str,
+                                'via': str,
+                                'weight': str,
+                            },
+                            'nh-index': str,
+                            'nh-type': str,
+                            'output': str,
+                            'to': str,
+                        },
+                        'rt-entry-state': str,
+                        'rt-ospf-area': str,
+                        'rt-tag': str,
+                        'peer-id': str,
+                        'task-name': str,
+                        'validation-state': str,
+                    },
+                    'rt-entry-count': {'#text': str, '@junos:format': str},
+                    'rt-prefix-length': str,
+                    'rt-state': str,
+                    'tsi': {'#text': str, '@junos:indent': str},
+                }],
+                'table-name': str,
+                'total-route-count': str,
+            }],
+        },
+    }
+
     def cli(self, protocol=None, table=None, 
             destination=None, route=None, 
             output=None):
@@ -1528,7 +1731,25 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
         return ret_dict
-    
+
+    def xml(self, output=None, **kwargs):
+        if not output:
+            out = self.device.execute(
+                select_command(self.cli_command, **kwargs) + XML_PIPE)
+        else:
+            out = output
+
+        return parse_xml(out, self.xml_shape)
+
+    def json(self, output=None, **kwargs):
+        if not output:
+            out = self.device.execute(
+                select_command(self.cli_command, **kwargs) + JSON_PIPE)
+        else:
+            out = output
+
+        return parse_json(out, self.xml_shape)
+
 class ShowRouteForwardingTableSummarySchema(MetaParser):
     """ Schema for:
             * show route forwarding-table summary
@@ -2892,7 +3113,7 @@ class ShowRouteProtocolProtocolExtensiveIpaddressSchema(MetaParser):
     """ Schema for:
             * show route protocol {protocol} extensive {ipaddress}
     """
-    schema = {
+    schema = LazySchema(lambda: {
         "route-information": {
             "route-table": {
                 "active-route-count": str,
@@ -2952,7 +3173,7 @@ class ShowRouteProtocolProtocolExtensiveIpaddressSchema(MetaParser):
                 "total-route-count": str
             }
         }
-    }
+    })
 
 
 class ShowRouteProtocolProtocolExtensiveIpaddress(ShowRouteProtocolProtocolExtensiveIpaddressSchema):
@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
@@ -483,7 +484,7 @@ class ShowSnmpStatisticsSchema(MetaParser):
             snmp_categories_or_targets_schema.validate(item)
         return value
 
-    schema = {
+    schema = LazySchema(lambda: {
         "snmp-statistics": {
             "snmp-input-statistics": {
                 "packets": str,
@@ -544,7 +545,7 @@ class ShowSnmpStatisticsSchema(MetaParser):
                 "fifteen-minute-response-throughput": str
             }
         }
-    }
+    })
 
 
 class ShowSnmpStatistics(ShowSnmpStatisticsSchema):
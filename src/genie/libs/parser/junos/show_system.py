@@ -21,6 +21,7 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use
 
@@ -30,7 +31,7 @@ class ShowSystemBuffersSchema(MetaParser):
             - 'show system buffers'
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "memory-statistics": {
             "cached-bytes": str,
             "cached-jumbo-clusters-16k": str,
@@ -66,7 +67,7 @@ class ShowSystemBuffersSchema(MetaParser):
             "total-mbuf-clusters": str,
             "total-mbufs": str,
         }
-    }
+    })
 
 
 class ShowSystemBuffers(ShowSystemBuffersSchema):
@@ -982,7 +983,7 @@ class ShowSystemUptimeSchema(MetaParser):
     """ Schema for:
             * show system users
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Optional("@xmlns:junos"): str,
         "system-uptime-information": {
             Optional("@xmlns"): str,
@@ -1042,7 +1043,7 @@ class ShowSystemUptimeSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowSystemUptime(ShowSystemUptimeSchema):
@@ -4914,7 +4915,7 @@ class ShowSystemInformationSchema(MetaParser):
     """ Schema for:
             * show system information
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Optional("@xmlns:junos"): str,
         "system-information": {
             "hardware-model": str,
@@ -4923,7 +4924,7 @@ class ShowSystemInformationSchema(MetaParser):
             "os-version": str,
             Optional("serial-number"): str
         }
-    }
+    })
 
 
 class ShowSystemInformation(ShowSystemInformationSchema):
@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import (Any,
         Optional, Use, Schema)
 
@@ -19,12 +20,12 @@ class ShowTaskReplicationSchema(MetaParser):
             * show task replication
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
     "task-replication-state": {
         "task-gres-state": str,
         "task-re-mode": str
     }
-}
+})
 
 class ShowTaskReplication(ShowTaskReplicationSchema):
     """ Parser for:
@@ -73,7 +74,7 @@ class ShowTaskMemorySchema(MetaParser):
             * show task memory
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
     "task-memory-information": {
         "task-memory-free-size": str,
         "task-memory-in-use-avail": str,
@@ -85,7 +86,7 @@ class ShowTaskMemorySchema(MetaParser):
         "task-memory-free-size-status": str,
         "task-memory-free-size-avail": str
     }
-}
+})
 
 class ShowTaskMemory(ShowTaskMemorySchema):
     """ Parser for:
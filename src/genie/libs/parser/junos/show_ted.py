@@ -11,6 +11,7 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use
 
@@ -21,7 +22,7 @@ class ShowTedDatabaseExtensiveSchema(MetaParser):
             - 'show ted database extensive {node_id}'
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'isis_nodes': int,
         'inet_nodes': int,
         'node': {
@@ -98,7 +99,7 @@ class ShowTedDatabaseExtensiveSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowTedDatabaseExtensive(ShowTedDatabaseExtensiveSchema):
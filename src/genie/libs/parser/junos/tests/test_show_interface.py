@@ -0,0 +1,340 @@
+# Python
+import unittest
+from unittest.mock import Mock
+
+# pyATS
+from pyats.topology import Device
+
+# Metaparser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# junos show_interface
+from genie.libs.parser.junos.show_interface import ShowInterfacesExtensive
+
+
+class TestShowInterfacesExtensiveDisplayXml(unittest.TestCase):
+    """ Unit tests for:
+            * show interfaces {interface} extensive | display xml
+            * show interfaces {interface} extensive | display json
+    """
+
+    device = Device(name='aDevice')
+    maxDiff = None
+    empty_output = {'execute.return_value': ''}
+
+    golden_output_xml = {'execute.return_value': '''
+        show interfaces ge-0/0/0 extensive | display xml
+        <rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R2/junos">
+            <interface-information xmlns="http://xml.juniper.net/junos/18.2R2/junos-interface" junos:style="normal">
+                <physical-interface>
+                    <name>ge-0/0/0</name>
+                    <admin-status junos:format="Enabled">up</admin-status>
+                    <oper-status>up</oper-status>
+                    <local-index>148</local-index>
+                    <snmp-index>526</snmp-index>
+                    <description>none/100G/in/hktGCS002_ge-0/0/0</description>
+                    <link-level-type>Ethernet</link-level-type>
+                    <mtu>1514</mtu>
+                    <sonet-mode>LAN-PHY</sonet-mode>
+                    <speed>1000mbps</speed>
+                    <if-device-flags>
+                        <ifdf-present/>
+                        <ifdf-running/>
+                    </if-device-flags>
+                    <if-config-flags>
+                        <iff-snmp-traps/>
+                        <internal-flags>0x4000</internal-flags>
+                    </if-config-flags>
+                    <current-physical-address>00:50:56:ff:56:b6</current-physical-address>
+                    <hardware-physical-address>00:50:56:ff:56:b6</hardware-physical-address>
+                    <interface-flapped junos:seconds="2795328">2019-08-29 09:09:19 UTC (4w4d 08:28:48 ago)</interface-flapped>
+                    <traffic-statistics junos:style="brief">
+                        <input-bytes>19732539397</input-bytes>
+                        <input-bps>3152</input-bps>
+                        <output-bytes>16367814635</output-bytes>
+                        <output-bps>3160</output-bps>
+                        <input-packets>133726363</input-packets>
+                        <input-pps>5</input-pps>
+                        <output-packets>129183361</output-packets>
+                        <output-pps>4</output-pps>
+                    </traffic-statistics>
+                    <input-error-list>
+                        <input-errors>0</input-errors>
+                        <input-drops>0</input-drops>
+                        <framing-errors>0</framing-errors>
+                        <input-runts>0</input-runts>
+                    </input-error-list>
+                    <logical-interface>
+                        <name>ge-0/0/0.0</name>
+                        <local-index>333</local-index>
+                        <snmp-index>606</snmp-index>
+                        <generation>149</generation>
+                        <if-config-flags>
+                            <iff-up/>
+                            <iff-snmp-traps/>
+                            <internal-flags>0x4004000</internal-flags>
+                        </if-config-flags>
+                        <encapsulation>ENET2</encapsulation>
+                        <traffic-statistics junos:style="brief">
+                            <input-packets>133657033</input-packets>
+                            <output-packets>129243982</output-packets>
+                        </traffic-statistics>
+                        <address-family>
+                            <address-family-name>inet</address-family-name>
+                            <mtu>1500</mtu>
+                            <address-family-flags>
+                                <ifff-sendbcast-pkt-to-re/>
+                            </address-family-flags>
+                            <interface-address>
+                                <ifa-flags>
+                                    <ifaf-current-preferred/>
+                                    <ifaf-current-primary/>
+                                </ifa-flags>
+                                <ifa-destination>10.189.5.92/30</ifa-destination>
+                                <ifa-local>10.189.5.93</ifa-local>
+                                <ifa-broadcast>10.189.5.95</ifa-broadcast>
+                            </interface-address>
+                        </address-family>
+                        <address-family>
+                            <address-family-name>multiservice</address-family-name>
+                            <mtu>Unlimited</mtu>
+                        </address-family>
+                    </logical-interface>
+                </physical-interface>
+            </interface-information>
+            <cli>
+                <banner></banner>
+            </cli>
+        </rpc-reply>
+    '''}
+
+    golden_output_json = {'execute.return_value': '''
+        show interfaces ge-0/0/0 extensive | display json
+        {
+            "interface-information" : [
+            {
+                "attributes" : {"xmlns" : "http://xml.juniper.net/junos/18.2R2/junos-interface",
+                                "junos:style" : "normal"
+                               },
+                "physical-interface" : [
+                {
+                    "name" : [{"data" : "ge-0/0/0"}],
+                    "admin-status" : [{"data" : "up", "attributes" : {"junos:format" : "Enabled"}}],
+                    "oper-status" : [{"data" : "up"}],
+                    "local-index" : [{"data" : "148"}],
+                    "snmp-index" : [{"data" : "526"}],
+                    "description" : [{"data" : "none/100G/in/hktGCS002_ge-0/0/0"}],
+                    "link-level-type" : [{"data" : "Ethernet"}],
+                    "mtu" : [{"data" : "1514"}],
+                    "sonet-mode" : [{"data" : "LAN-PHY"}],
+                    "speed" : [{"data" : "1000mbps"}],
+                    "if-device-flags" : [
+                    {
+                        "ifdf-present" : [{"data" : [null]}],
+                        "ifdf-running" : [{"data" : [null]}]
+                    }
+                    ],
+                    "if-config-flags" : [
+                    {
+                        "iff-snmp-traps" : [{"data" : [null]}],
+                        "internal-flags" : [{"data" : "0x4000"}]
+                    }
+                    ],
+                    "current-physical-address" : [{"data" : "00:50:56:ff:56:b6"}],
+                    "hardware-physical-address" : [{"data" : "00:50:56:ff:56:b6"}],
+                    "interface-flapped" : [{"data" : "2019-08-29 09:09:19 UTC (4w4d 08:28:48 ago)", "attributes" : {"junos:seconds" : "2795328"}}],
+                    "traffic-statistics" : [
+                    {
+                        "attributes" : {"junos:style" : "brief"},
+                        "input-bytes" : [{"data" : "19732539397"}],
+                        "input-bps" : [{"data" : "3152"}],
+                        "output-bytes" : [{"data" : "16367814635"}],
+                        "output-bps" : [{"data" : "3160"}],
+                        "input-packets" : [{"data" : "133726363"}],
+                        "input-pps" : [{"data" : "5"}],
+                        "output-packets" : [{"data" : "129183361"}],
+                        "output-pps" : [{"data" : "4"}]
+                    }
+                    ],
+                    "input-error-list" : [
+                    {
+                        "input-errors" : [{"data" : "0"}],
+                        "input-drops" : [{"data" : "0"}],
+                        "framing-errors" : [{"data" : "0"}],
+                        "input-runts" : [{"data" : "0"}]
+                    }
+                    ],
+                    "logical-interface" : [
+                    {
+                        "name" : [{"data" : "ge-0/0/0.0"}],
+                        "local-index" : [{"data" : "333"}],
+                        "snmp-index" : [{"data" : "606"}],
+                        "generation" : [{"data" : "149"}],
+                        "if-config-flags" : [
+                        {
+                            "iff-up" : [{"data" : [null]}],
+                            "iff-snmp-traps" : [{"data" : [null]}],
+                            "internal-flags" : [{"data" : "0x4004000"}]
+                        }
+                        ],
+                        "encapsulation" : [{"data" : "ENET2"}],
+                        "traffic-statistics" : [
+                        {
+                            "attributes" : {"junos:style" : "brief"},
+                            "input-packets" : [{"data" : "133657033"}],
+                            "output-packets" : [{"data" : "129243982"}]
+                        }
+                        ],
+                        "address-family" : [
+                        {
+                            "address-family-name" : [{"data" : "inet"}],
+                            "mtu" : [{"data" : "1500"}],
+                            "address-family-flags" : [
+                            {
+                                "ifff-sendbcast-pkt-to-re" : [{"data" : [null]}]
+                            }
+                            ],
+                            "interface-address" : [
+                            {
+                                "ifa-flags" : [
+                                {
+                                    "ifaf-current-preferred" : [{"data" : [null]}],
+                                    "ifaf-current-primary" : [{"data" : [null]}]
+                                }
+                                ],
+                                "ifa-destination" : [{"data" : "10.189.5.92/30"}],
+                                "ifa-local" : [{"data" : "10.189.5.93"}],
+                                "ifa-broadcast" : [{"data" : "10.189.5.95"}]
+                            }
+                            ]
+                        },
+                        {
+                            "address-family-name" : [{"data" : "multiservice"}],
+                            "mtu" : [{"data" : "Unlimited"}]
+                        }
+                        ]
+                    }
+                    ]
+                }
+                ]
+            }
+            ]
+        }
+    '''}
+
+    golden_parsed_output = {
+        "interface-information": {
+            "@junos:style": "normal",
+            "physical-interface": [
+                {
+                    "admin-status": {"#text": "up", "@junos:format": "Enabled"},
+                    "current-physical-address": "00:50:56:ff:56:b6",
+                    "description": "none/100G/in/hktGCS002_ge-0/0/0",
+                    "hardware-physical-address": "00:50:56:ff:56:b6",
+                    "if-config-flags": {
+                        "iff-snmp-traps": True,
+                        "internal-flags": "0x4000"
+                    },
+                    "if-device-flags": {
+                        "ifdf-present": True,
+                        "ifdf-running": True
+                    },
+                    "input-error-list": {
+                        "framing-errors": "0",
+                        "input-drops": "0",
+                        "input-errors": "0",
+                        "input-runts": "0",
+                    },
+                    "interface-flapped": {
+                        "#text": "2019-08-29 09:09:19 UTC (4w4d 08:28:48 ago)",
+                        "@junos:seconds": "2795328",
+                    },
+                    "link-level-type": "Ethernet",
+                    "local-index": "148",
+                    "logical-interface": [
+                        {
+                            "address-family": [
+                                {
+                                    "address-family-flags": {
+                                        "ifff-sendbcast-pkt-to-re": True
+                                    },
+                                    "address-family-name": "inet",
+                                    "interface-address": {
+                                        "ifa-broadcast": "10.189.5.95",
+                                        "ifa-destination": "10.189.5.92/30",
+                                        "ifa-flags": {
+                                            "ifaf-current-preferred": True,
+                                            "ifaf-current-primary": True,
+                                        },
+                                        "ifa-local": "10.189.5.93",
+                                    },
+                                    "mtu": "1500",
+                                },
+                                {
+                                    "address-family-name": "multiservice",
+                                    "mtu": "Unlimited"
+                                },
+                            ],
+                            "encapsulation": "ENET2",
+                            "if-config-flags": {
+                                "iff-snmp-traps": True,
+                                "iff-up": True,
+                                "internal-flags": "0x4004000",
+                            },
+                            "local-index": "333",
+                            "name": "ge-0/0/0.0",
+                            "snmp-index": "606",
+                            "traffic-statistics": {
+                                "@junos:style": "brief",
+                                "input-packets": "133657033",
+                                "output-packets": "129243982",
+                            },
+                        }
+                    ],
+                    "mtu": "1514",
+                    "name": "ge-0/0/0",
+                    "oper-status": "up",
+                    "snmp-index": "526",
+                    "sonet-mode": "LAN-PHY",
+                    "speed": "1000mbps",
+                    "traffic-statistics": {
+                        "@junos:style": "brief",
+                        "input-bps": "3152",
+                        "input-bytes": "19732539397",
+                        "input-packets": "133726363",
+                        "input-pps": "5",
+                        "output-bps": "3160",
+                        "output-bytes": "16367814635",
+                        "output-packets": "129183361",
+                        "output-pps": "4",
+                    },
+                }
+            ],
+        }
+    }
+
+    def test_empty(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowInterfacesExtensive(device=self.device, context='xml')
+        with self.assertRaises(SchemaEmptyParserError):
+            obj.parse()
+
+    def test_golden_xml(self):
+        self.device = Mock(**self.golden_output_xml)
+        obj = ShowInterfacesExtensive(device=self.device, context='xml')
+        parsed_output = obj.parse(interface='ge-0/0/0')
+        self.device.execute.assert_called_once_with(
+            'show interfaces ge-0/0/0 extensive | display xml')
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+
+    def test_golden_json(self):
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowInterfacesExtensive(device=self.device, context='json')
+        parsed_output = obj.parse(interface='ge-0/0/0')
+        self.device.execute.assert_called_once_with(
+            'show interfaces ge-0/0/0 extensive | display json')
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,353 @@
+# Python
+import unittest
+from unittest.mock import Mock
+
+# pyATS
+from pyats.topology import Device
+
+# Metaparser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# junos show_ospf
+from genie.libs.parser.junos.show_ospf import ShowOspfDatabaseExtensive
+
+
+class TestShowOspfDatabaseExtensiveDisplayXml(unittest.TestCase):
+    """ Unit tests for:
+            * show ospf database extensive | display xml
+            * show ospf database {data_type} extensive | display json
+    """
+
+    device = Device(name='aDevice')
+    maxDiff = None
+    empty_output = {'execute.return_value': ''}
+
+    golden_output_xml = {'execute.return_value': '''
+        show ospf database extensive | display xml
+        <rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R2/junos">
+            <ospf-database-information xmlns="http://xml.juniper.net/junos/18.2R2/junos-routing">
+                <ospf-area-header>
+                    <ospf-area>0.0.0.0</ospf-area>
+                </ospf-area-header>
+                <ospf-area-header>
+                    <ospf-area>0.0.0.8</ospf-area>
+                </ospf-area-header>
+                <ospf-database heading="Type       ID               Adv Rtr           Seq      Age  Opt  Cksum  Len">
+                    <lsa-type>Router</lsa-type>
+                    <lsa-id>10.189.5.252</lsa-id>
+                    <advertising-router>10.189.5.252</advertising-router>
+                    <sequence-number>0x80001b9e</sequence-number>
+                    <age>1801</age>
+                    <options>0x22</options>
+                    <checksum>0x1e2</checksum>
+                    <lsa-length>120</lsa-length>
+                    <our-entry/>
+                    <ospf-router-lsa>
+                        <bits>0x0</bits>
+                        <link-count>2</link-count>
+                        <ospf-link>
+                            <link-id>10.189.5.253</link-id>
+                            <link-data>10.189.5.93</link-data>
+                            <link-type-name>PointToPoint</link-type-name>
+                            <link-type-value>1</link-type-value>
+                            <ospf-topology-count>0</ospf-topology-count>
+                            <metric>5</metric>
+                        </ospf-link>
+                        <ospf-link>
+                            <link-id>10.189.5.92</link-id>
+                            <link-data>255.255.255.252</link-data>
+                            <link-type-name>Stub</link-type-name>
+                            <link-type-value>3</link-type-value>
+                            <ospf-topology-count>0</ospf-topology-count>
+                            <metric>5</metric>
+                        </ospf-link>
+                        <ospf-lsa-topology>
+                            <ospf-topology-id>default</ospf-topology-id>
+                            <ospf-topology-name>default</ospf-topology-name>
+                            <ospf-lsa-topology-link>
+                                <link-type-name>PointToPoint</link-type-name>
+                                <ospf-lsa-topology-link-node-id>10.189.5.253</ospf-lsa-topology-link-node-id>
+                                <ospf-lsa-topology-link-metric>5</ospf-lsa-topology-link-metric>
+                                <ospf-lsa-topology-link-state>Bidirectional</ospf-lsa-topology-link-state>
+                            </ospf-lsa-topology-link>
+                        </ospf-lsa-topology>
+                    </ospf-router-lsa>
+                    <ospf-database-extensive>
+                        <generation-timer junos:seconds="1998">00:33:18</generation-timer>
+                        <aging-timer junos:seconds="1799">00:29:59</aging-timer>
+                        <installation-time junos:seconds="1801">00:30:01</installation-time>
+                        <expiration-time junos:seconds="1799">00:29:59</expiration-time>
+                        <send-time junos:seconds="1801">00:30:01</send-time>
+                        <lsa-changed-time junos:seconds="2894069">4w5d 11:54:29</lsa-changed-time>
+                        <lsa-change-count>1</lsa-change-count>
+                    </ospf-database-extensive>
+                </ospf-database>
+                <ospf-database>
+                    <lsa-type>OpaqArea</lsa-type>
+                    <lsa-id>1.0.0.1</lsa-id>
+                    <advertising-router>10.169.14.240</advertising-router>
+                    <sequence-number>0x80000002</sequence-number>
+                    <age>1436</age>
+                    <options>0x22</options>
+                    <checksum>0x546d</checksum>
+                    <lsa-length>28</lsa-length>
+                    <ospf-opaque-area-lsa>
+                        <tlv-block>
+                            <tlv-type-name>Link</tlv-type-name>
+                            <tlv-type-value>2</tlv-type-value>
+                            <tlv-length>112</tlv-length>
+                            <formatted-tlv-data>1</formatted-tlv-data>
+                        </tlv-block>
+                        <te-subtlv>
+                            <tlv-type-name>Linktype</tlv-type-name>
+                            <tlv-type-value>1</tlv-type-value>
+                            <tlv-length>1</tlv-length>
+                            <formatted-tlv-data>1</formatted-tlv-data>
+                            <tlv-type-name>LinkID</tlv-type-name>
+                            <tlv-type-value>2</tlv-type-value>
+                            <tlv-length>4</tlv-length>
+                            <formatted-tlv-data>10.169.14.240</formatted-tlv-data>
+                        </te-subtlv>
+                        <te-subtlv>
+                            <tlv-type-name>TEMetric</tlv-type-name>
+                            <tlv-type-value>5</tlv-type-value>
+                            <tlv-length>4</tlv-length>
+                            <formatted-tlv-data>100</formatted-tlv-data>
+                        </te-subtlv>
+                    </ospf-opaque-area-lsa>
+                    <ospf-database-extensive>
+                        <aging-timer junos:seconds="2163">00:36:03</aging-timer>
+                        <installation-time junos:seconds="1436">00:23:56</installation-time>
+                        <expiration-time junos:seconds="2164">00:36:04</expiration-time>
+                        <send-time junos:seconds="1434">00:23:54</send-time>
+                        <lsa-changed-time junos:seconds="2914196">4w5d 17:30:15</lsa-changed-time>
+                        <lsa-change-count>1</lsa-change-count>
+                    </ospf-database-extensive>
+                </ospf-database>
+            </ospf-database-information>
+            <cli>
+                <banner></banner>
+            </cli>
+        </rpc-reply>
+    '''}
+
+    golden_output_json = {'execute.return_value': '''
+        show ospf database router extensive | display json
+        {
+            "ospf-database-information" : [
+            {
+                "attributes" : {"xmlns" : "http://xml.juniper.net/junos/18.2R2/junos-routing"},
+                "ospf-area-header" : [
+                {
+                    "ospf-area" : [{"data" : "0.0.0.8"}]
+                }
+                ],
+                "ospf-database" : [
+                {
+                    "attributes" : {"heading" : "Type       ID               Adv Rtr           Seq      Age  Opt  Cksum  Len"},
+                    "lsa-type" : [{"data" : "Network"}],
+                    "lsa-id" : [{"data" : "10.189.5.93"}],
+                    "advertising-router" : [{"data" : "10.189.5.253"}],
+                    "sequence-number" : [{"data" : "0x80000003"}],
+                    "age" : [{"data" : "2050"}],
+                    "options" : [{"data" : "0x22"}],
+                    "checksum" : [{"data" : "0x77d6"}],
+                    "lsa-length" : [{"data" : "32"}],
+                    "ospf-network-lsa" : [
+                    {
+                        "address-mask" : [{"data" : "255.255.255.252"}],
+                        "attached-router" : [{"data" : "10.189.5.253"}, {"data" : "10.189.5.252"}],
+                        "ospf-lsa-topology" : [
+                        {
+                            "ospf-topology-id" : [{"data" : "default"}],
+                            "ospf-topology-name" : [{"data" : "default"}],
+                            "ospf-lsa-topology-link" : [
+                            {
+                                "link-type-name" : [{"data" : "Transit"}],
+                                "ospf-lsa-topology-link-node-id" : [{"data" : "10.189.5.253"}],
+                                "ospf-lsa-topology-link-metric" : [{"data" : "0"}],
+                                "ospf-lsa-topology-link-state" : [{"data" : "Bidirectional"}]
+                            }
+                            ]
+                        }
+                        ]
+                    }
+                    ],
+                    "ospf-database-extensive" : [
+                    {
+                        "aging-timer" : [{"data" : "00:25:49", "attributes" : {"junos:seconds" : "1549"}}],
+                        "installation-time" : [{"data" : "00:34:10", "attributes" : {"junos:seconds" : "2050"}}],
+                        "expiration-time" : [{"data" : "00:25:50", "attributes" : {"junos:seconds" : "1550"}}],
+                        "send-time" : [{"data" : "00:34:08", "attributes" : {"junos:seconds" : "2048"}}],
+                        "lsa-changed-time" : [{"data" : "4w5d 11:54:29", "attributes" : {"junos:seconds" : "2894069"}}],
+                        "lsa-change-count" : [{"data" : "1"}]
+                    }
+                    ]
+                }
+                ]
+            }
+            ]
+        }
+    '''}
+
+    golden_parsed_output_xml = {
+        "ospf-database-information": {
+            "ospf-area-header": {"ospf-area": "0.0.0.8"},
+            "ospf-database": [
+                {
+                    "advertising-router": "10.189.5.252",
+                    "age": "1801",
+                    "checksum": "0x1e2",
+                    "lsa-id": "10.189.5.252",
+                    "lsa-length": "120",
+                    "lsa-type": "Router",
+                    "options": "0x22",
+                    "our-entry": True,
+                    "ospf-database-extensive": {
+                        "aging-timer": {"#text": "00:29:59"},
+                        "expiration-time": {"#text": "00:29:59"},
+                        "generation-timer": {"#text": "00:33:18"},
+                        "installation-time": {"#text": "00:30:01"},
+                        "lsa-change-count": "1",
+                        "lsa-changed-time": {"#text": "4w5d 11:54:29"},
+                        "send-time": {"#text": "00:30:01"},
+                    },
+                    "ospf-router-lsa": {
+                        "bits": "0x0",
+                        "link-count": "2",
+                        "ospf-link": [
+                            {
+                                "link-data": "10.189.5.93",
+                                "link-id": "10.189.5.253",
+                                "link-type-name": "PointToPoint",
+                                "link-type-value": "1",
+                                "metric": "5",
+                                "ospf-topology-count": "0",
+                            },
+                            {
+                                "link-data": "255.255.255.252",
+                                "link-id": "10.189.5.92",
+                                "link-type-name": "Stub",
+                                "link-type-value": "3",
+                                "metric": "5",
+                                "ospf-topology-count": "0",
+                            },
+                        ],
+                        "ospf-lsa-topology": {
+                            "ospf-lsa-topology-link": [
+                                {
+                                    "link-type-name": "PointToPoint",
+                                    "ospf-lsa-topology-link-metric": "5",
+                                    "ospf-lsa-topology-link-node-id": "10.189.5.253",
+                                    "ospf-lsa-topology-link-state": "Bidirectional",
+                                }
+                            ],
+                            "ospf-topology-id": "default",
+                            "ospf-topology-name": "default",
+                        },
+                    },
+                    "sequence-number": "0x80001b9e",
+                },
+                {
+                    "advertising-router": "10.169.14.240",
+                    "age": "1436",
+                    "checksum": "0x546d",
+                    "lsa-id": "1.0.0.1",
+                    "lsa-length": "28",
+                    "lsa-type": "OpaqArea",
+                    "options": "0x22",
+                    "ospf-database-extensive": {
+                        "aging-timer": {"#text": "00:36:03"},
+                        "expiration-time": {"#text": "00:36:04"},
+                        "installation-time": {"#text": "00:23:56"},
+                        "lsa-change-count": "1",
+                        "lsa-changed-time": {"#text": "4w5d 17:30:15"},
+                        "send-time": {"#text": "00:23:54"},
+                    },
+                    "ospf-opaque-area-lsa": {
+                        "te-subtlv": {
+                            "formatted-tlv-data": ["1", "10.169.14.240", "100"],
+                            "tlv-length": ["1", "4", "4"],
+                            "tlv-type-name": ["Linktype", "LinkID", "TEMetric"],
+                            "tlv-type-value": ["1", "2", "5"],
+                        },
+                        "tlv-block": {
+                            "formatted-tlv-data": "1",
+                            "tlv-length": "112",
+                            "tlv-type-name": "Link",
+                            "tlv-type-value": "2",
+                        },
+                    },
+                    "sequence-number": "0x80000002",
+                },
+            ],
+        }
+    }
+
+    golden_parsed_output_json = {
+        "ospf-database-information": {
+            "ospf-area-header": {"ospf-area": "0.0.0.8"},
+            "ospf-database": [
+                {
+                    "advertising-router": "10.189.5.253",
+                    "age": "2050",
+                    "checksum": "0x77d6",
+                    "lsa-id": "10.189.5.93",
+                    "lsa-length": "32",
+                    "lsa-type": "Network",
+                    "options": "0x22",
+                    "ospf-database-extensive": {
+                        "aging-timer": {"#text": "00:25:49"},
+                        "expiration-time": {"#text": "00:25:50"},
+                        "installation-time": {"#text": "00:34:10"},
+                        "lsa-change-count": "1",
+                        "lsa-changed-time": {"#text": "4w5d 11:54:29"},
+                        "send-time": {"#text": "00:34:08"},
+                    },
+                    "ospf-network-lsa": {
+                        "address-mask": "255.255.255.252",
+                        "attached-router": ["10.189.5.253", "10.189.5.252"],
+                        "ospf-lsa-topology": {
+                            "ospf-lsa-topology-link": [
+                                {
+                                    "link-type-name": "Transit",
+                                    "ospf-lsa-topology-link-metric": "0",
+                                    "ospf-lsa-topology-link-node-id": "10.189.5.253",
+                                    "ospf-lsa-topology-link-state": "Bidirectional",
+                                }
+                            ],
+                            "ospf-topology-id": "default",
+                            "ospf-topology-name": "default",
+                        },
+                    },
+                    "sequence-number": "0x80000003",
+                }
+            ],
+        }
+    }
+
+    def test_empty(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowOspfDatabaseExtensive(device=self.device, context='json')
+        with self.assertRaises(SchemaEmptyParserError):
+            obj.parse()
+
+    def test_golden_xml(self):
+        self.device = Mock(**self.golden_output_xml)
+        obj = ShowOspfDatabaseExtensive(device=self.device, context='xml')
+        parsed_output = obj.parse()
+        self.device.execute.assert_called_once_with(
+            'show ospf database extensive | display xml')
+        self.assertEqual(parsed_output, self.golden_parsed_output_xml)
+
+    def test_golden_json(self):
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowOspfDatabaseExtensive(device=self.device, context='json')
+        parsed_output = obj.parse(data_type='router')
+        self.device.execute.assert_called_once_with(
+            'show ospf database router extensive | display json')
+        self.assertEqual(parsed_output, self.golden_parsed_output_json)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,478 @@
+# Python
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+# pyATS
+from pyats.topology import Device
+
+# Metaparser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# junos show_route
+from genie.libs.parser.junos.show_route import (ShowRoute,
+                                                ShowRouteProtocolExtensive)
+from genie.libs.parser.utils.mapped import MappedOutput
+
+
+class TestShowRouteDisplayXml(unittest.TestCase):
+    """ Unit tests for:
+            * show route protocol {protocol} {ip_address} | display xml
+            * show route protocol {protocol} {ip_address} | display json
+    """
+
+    device = Device(name='aDevice')
+    maxDiff = None
+    empty_output = {'execute.return_value': ''}
+
+    golden_output_xml = {'execute.return_value': '''
+        show route protocol static 10.169.14.240/32 | display xml
+        <rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R2/junos">
+            <route-information xmlns="http://xml.juniper.net/junos/18.2R2/junos-routing">
+                <!-- keepalive -->
+                <route-table>
+                    <table-name>inet.0</table-name>
+                    <destination-count>932</destination-count>
+                    <total-route-count>1618</total-route-count>
+                    <active-route-count>932</active-route-count>
+                    <holddown-route-count>0</holddown-route-count>
+                    <hidden-route-count>0</hidden-route-count>
+                    <rt junos:style="brief">
+                        <rt-destination>10.169.14.240/32</rt-destination>
+                        <rt-entry>
+                            <active-tag>*</active-tag>
+                            <current-active/>
+                            <last-active/>
+                            <protocol-name>Static</protocol-name>
+                            <preference>5</preference>
+                            <age junos:seconds="3253345">5w2d 15:42:25</age>
+                            <nh>
+                                <selected-next-hop/>
+                                <to>10.169.14.121</to>
+                                <via>ge-0/0/1.0</via>
+                            </nh>
+                        </rt-entry>
+                        <rt-entry>
+                            <active-tag> </active-tag>
+                            <protocol-name>OSPF</protocol-name>
+                            <preference>10</preference>
+                            <age junos:seconds="3253345">5w2d 15:42:25</age>
+                            <metric>2</metric>
+                            <nh>
+                                <to>10.169.14.121</to>
+                                <via>ge-0/0/1.0</via>
+                            </nh>
+                        </rt-entry>
+                    </rt>
+                </route-table>
+                <route-table>
+                    <table-name>inet.3</table-name>
+                    <destination-count>12</destination-count>
+                    <total-route-count>12</total-route-count>
+                    <active-route-count>12</active-route-count>
+                    <holddown-route-count>0</holddown-route-count>
+                    <hidden-route-count>0</hidden-route-count>
+                </route-table>
+            </route-information>
+            <cli>
+                <banner></banner>
+            </cli>
+        </rpc-reply>
+
+        {master}
+        lab@router> '''}
+
+    golden_output_json = {'execute.return_value': '''
+        show route protocol static 10.169.14.240/32 | display json
+        {
+            "route-information" : [
+            {
+                "attributes" : {"xmlns" : "http://xml.juniper.net/junos/18.2R2/junos-routing"},
+                "route-table" : [
+                {
+                    "table-name" : [{"data" : "inet.0"}],
+                    "destination-count" : [{"data" : "932"}],
+                    "total-route-count" : [{"data" : "1618"}],
+                    "active-route-count" : [{"data" : "932"}],
+                    "holddown-route-count" : [{"data" : "0"}],
+                    "hidden-route-count" : [{"data" : "0"}],
+                    "rt" : [
+                    {
+                        "attributes" : {"junos:style" : "brief"},
+                        "rt-destination" : [{"data" : "10.169.14.240/32"}],
+                        "rt-entry" : [
+                        {
+                            "active-tag" : [{"data" : "*"}],
+                            "current-active" : [{"data" : [null]}],
+                            "last-active" : [{"data" : [null]}],
+                            "protocol-name" : [{"data" : "Static"}],
+                            "preference" : [{"data" : "5"}],
+                            "age" : [{"data" : "5w2d 15:42:25", "attributes" : {"junos:seconds" : "3253345"}}],
+                            "nh" : [
+                            {
+                                "selected-next-hop" : [{"data" : [null]}],
+                                "to" : [{"data" : "10.169.14.121"}],
+                                "via" : [{"data" : "ge-0/0/1.0"}]
+                            }
+                            ]
+                        },
+                        {
+                            "active-tag" : [{"data" : " "}],
+                            "protocol-name" : [{"data" : "OSPF"}],
+                            "preference" : [{"data" : "10"}],
+                            "age" : [{"data" : "5w2d 15:42:25", "attributes" : {"junos:seconds" : "3253345"}}],
+                            "metric" : [{"data" : "2"}],
+                            "nh" : [
+                            {
+                                "to" : [{"data" : "10.169.14.121"}],
+                                "via" : [{"data" : "ge-0/0/1.0"}]
+                            }
+                            ]
+                        }
+                        ]
+                    }
+                    ]
+                },
+                {
+                    "table-name" : [{"data" : "inet.3"}],
+                    "destination-count" : [{"data" : "12"}],
+                    "total-route-count" : [{"data" : "12"}],
+                    "active-route-count" : [{"data" : "12"}],
+                    "holddown-route-count" : [{"data" : "0"}],
+                    "hidden-route-count" : [{"data" : "0"}]
+                }
+                ]
+            }
+            ]
+        }
+
+        {master}
+        lab@router> '''}
+
+    golden_parsed_output = {
+        "route-information": {
+            "route-table": [
+                {
+                    "active-route-count": "932",
+                    "destination-count": "932",
+                    "hidden-route-count": "0",
+                    "holddown-route-count": "0",
+                    "rt": [
+                        {
+                            "rt-destination": "10.169.14.240/32",
+                            "rt-entry": {
+                                "active-tag": "*",
+                                "age": {
+                                    "#text": "5w2d 15:42:25",
+                                    "@junos:seconds": "3253345"
+                                },
+                                "nh": [{"to": "10.169.14.121", "via": "ge-0/0/1.0"}],
+                                "preference": "5",
+                                "protocol-name": "Static",
+                            },
+                        },
+                        {
+                            "rt-entry": {
+                                "age": {
+                                    "#text": "5w2d 15:42:25",
+                                    "@junos:seconds": "3253345"
+                                },
+                                "metric": "2",
+                                "nh": [{"to": "10.169.14.121", "via": "ge-0/0/1.0"}],
+                                "preference": "10",
+                                "protocol-name": "OSPF",
+                            },
+                        }
+                    ],
+                    "table-name": "inet.0",
+                    "total-route-count": "1618",
+                },
+                {
+                    "active-route-count": "12",
+                    "destination-count": "12",
+                    "hidden-route-count": "0",
+                    "holddown-route-count": "0",
+                    "table-name": "inet.3",
+                    "total-route-count": "12",
+                },
+            ]
+        }
+    }
+
+    def test_empty(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowRoute(device=self.device, context='xml')
+        with self.assertRaises(SchemaEmptyParserError):
+            obj.parse()
+
+    def test_golden_xml(self):
+        self.device = Mock(**self.golden_output_xml)
+        obj = ShowRoute(device=self.device, context='xml')
+        parsed_output = obj.parse(protocol='static',
+                                  ip_address='10.169.14.240/32')
+        self.device.execute.assert_called_once_with(
+            'show route protocol static 10.169.14.240/32 | display xml')
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+
+    def test_golden_json(self):
+        self.device = Mock(**self.golden_output_json)
+        obj = ShowRoute(device=self.device, context='json')
+        parsed_output = obj.parse(protocol='static',
+                                  ip_address='10.169.14.240/32')
+        self.device.execute.assert_called_once_with(
+            'show route protocol static 10.169.14.240/32 | display json')
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+
+
+class TestShowRouteProtocolExtensiveDisplayXml(unittest.TestCase):
+    """ Unit tests for:
+            * show route protocol {protocol} extensive | display xml
+    """
+
+    device = Device(name='aDevice')
+    maxDiff = None
+
+    golden_output_xml = {'execute.return_value': '''
+        show route protocol ospf extensive | display xml
+        <rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R2/junos">
+            <route-information xmlns="http://xml.juniper.net/junos/18.2R2/junos-routing">
+                <route-table>
+                    <table-name>inet.0</table-name>
+                    <destination-count>929</destination-count>
+                    <total-route-count>1615</total-route-count>
+                    <active-route-count>929</active-route-count>
+                    <holddown-route-count>0</holddown-route-count>
+                    <hidden-route-count>0</hidden-route-count>
+                    <rt junos:style="detail">
+                        <rt-destination>0.0.0.0</rt-destination>
+                        <rt-prefix-length>0</rt-prefix-length>
+                        <rt-entry-count junos:format="1 entry">1</rt-entry-count>
+                        <rt-announced-count>1</rt-announced-count>
+                        <rt-state>FlashAll</rt-state>
+                        <tsi junos:indent="0">
+        KRT in-kernel 0.0.0.0/0 -> {10.169.14.121}</tsi>
+                        <rt-entry>
+                            <active-tag>*</active-tag>
+                            <current-active/>
+                            <last-active/>
+                            <protocol-name>OSPF</protocol-name>
+                            <preference>150</preference>
+                            <preference2>10</preference2>
+                            <nh-type>Router</nh-type>
+                            <nh-index>613</nh-index>
+                            <nh-address>0xdfa7934</nh-address>
+                            <nh-reference-count>458</nh-reference-count>
+                            <nh>
+                                <nh-string>Next hop</nh-string>
+                                <to>10.169.14.121</to>
+                                <via>ge-0/0/1.0</via>
+                                <selected-next-hop/>
+                                <session>141</session>
+                                <weight>0x1</weight>
+                            </nh>
+                            <rt-entry-state>Active Int Ext</rt-entry-state>
+                            <local-as>65171</local-as>
+                            <age junos:seconds="2000615">3w2d 4:43:35</age>
+                            <metric>101</metric>
+                            <validation-state>unverified</validation-state>
+                            <rt-tag>0</rt-tag>
+                            <task-name>OSPF</task-name>
+                            <announce-bits>3</announce-bits>
+                            <announce-tasks>0-KRT 5-LDP 7-Resolve tree 3</announce-tasks>
+                            <as-path>AS path: I
+        </as-path>
+                            <bgp-path-attributes>
+                                <attr-as-path-effective>
+                                    <aspath-effective-string>AS path:</aspath-effective-string>
+                                    <attr-value>I</attr-value>
+                                </attr-as-path-effective>
+                            </bgp-path-attributes>
+                        </rt-entry>
+                    </rt>
+                    <rt junos:style="detail">
+                        <rt-destination>10.1.0.0</rt-destination>
+                        <rt-prefix-length>24</rt-prefix-length>
+                        <rt-entry-count junos:format="2 entries">2</rt-entry-count>
+                        <rt-announced-count>1</rt-announced-count>
+                        <rt-state>FlashAll</rt-state>
+                        <rt-entry>
+                            <active-tag>*</active-tag>
+                            <protocol-name>Direct</protocol-name>
+                            <preference>0</preference>
+                            <nh-type>Interface</nh-type>
+                            <nh>
+                                <nh-string>Next hop</nh-string>
+                                <via>ge-0/0/0.0</via>
+                                <selected-next-hop/>
+                            </nh>
+                            <age junos:seconds="2000615">3w2d 4:43:35</age>
+                        </rt-entry>
+                        <rt-entry>
+                            <protocol-name>OSPF</protocol-name>
+                            <preference>150</preference>
+                            <preference2>10</preference2>
+                            <inactive-reason>Route Preference</inactive-reason>
+                            <protocol-nh junos:indent="16">
+                                <to>10.169.14.121</to>
+                                <indirect-nh>0x2</indirect-nh>
+                                <forwarding-nh-count>1</forwarding-nh-count>
+                                <nh>
+                                    <to>10.169.14.121</to>
+                                    <via>ge-0/0/1.0</via>
+                                </nh>
+                            </protocol-nh>
+                            <age junos:seconds="2000615">3w2d 4:43:35</age>
+                            <metric>20</metric>
+                        </rt-entry>
+                    </rt>
+                </route-table>
+            </route-information>
+            <cli>
+                <banner></banner>
+            </cli>
+        </rpc-reply>
+    '''}
+
+    golden_parsed_output = {
+        "route-information": {
+            "route-table": [
+                {
+                    "active-route-count": "929",
+                    "destination-count": "929",
+                    "hidden-route-count": "0",
+                    "holddown-route-count": "0",
+                    "rt": [
+                        {
+                            "rt-announced-count": "1",
+                            "rt-destination": "0.0.0.0",
+                            "rt-entry": {
+                                "active-tag": "*",
+                                "age": {
+                                    "#text": "3w2d 4:43:35",
+                                    "@junos:seconds": "2000615"
+                                },
+                                "announce-bits": "3",
+                                "announce-tasks": "0-KRT 5-LDP 7-Resolve tree 3",
+                                "as-path": "AS path: I",
+                                "bgp-path-attributes": {
+                                    "attr-as-path-effective": {
+                                        "aspath-effective-string": "AS path:",
+                                        "attr-value": "I",
+                                    }
+                                },
+                                "local-as": "65171",
+                                "metric": "101",
+                                "nh": [
+                                    {
+                                        "nh-string": "Next hop",
+                                        "session": "141",
+                                        "to": "10.169.14.121",
+                                        "via": "ge-0/0/1.0",
+                                        "weight": "0x1",
+                                    }
+                                ],
+                                "nh-address": "0xdfa7934",
+                                "nh-index": "613",
+                                "nh-reference-count": "458",
+                                "nh-type": "Router",
+                                "preference": "150",
+                                "preference2": "10",
+                                "protocol-name": "OSPF",
+                                "rt-entry-state": "Active Int Ext",
+                                "rt-tag": "0",
+                                "task-name": "OSPF",
+                                "validation-state": "unverified",
+                            },
+                            "rt-entry-count": {
+                                "#text": "1",
+                                "@junos:format": "1 entry"
+                            },
+                            "rt-prefix-length": "0",
+                            "rt-state": "FlashAll",
+                            "tsi": {
+                                "#text": "KRT in-kernel 0.0.0.0/0 -> {10.169.14.121}",
+                                "@junos:indent": "0"
+                            },
+                        },
+                        {
+                            "rt-announced-count": "1",
+                            "rt-destination": "10.1.0.0",
+                            "rt-entry": [
+                                {
+                                    "active-tag": "*",
+                                    "age": {
+                                        "#text": "3w2d 4:43:35",
+                                        "@junos:seconds": "2000615"
+                                    },
+                                    "nh": [
+                                        {
+                                            "nh-string": "Next hop",
+                                            "via": "ge-0/0/0.0",
+                                        }
+                                    ],
+                                    "nh-type": "Interface",
+                                    "preference": "0",
+                                    "protocol-name": "Direct",
+                                },
+                                {
+                                    "age": {
+                                        "#text": "3w2d 4:43:35",
+                                        "@junos:seconds": "2000615"
+                                    },
+                                    "inactive-reason": "Route Preference",
+                                    "metric": "20",
+                                    "preference": "150",
+                                    "preference2": "10",
+                                    "protocol-name": "OSPF",
+                                    "protocol-nh": {
+                                        "forwarding-nh-count": "1",
+                                        "indirect-nh": "0x2",
+                                        "nh": {
+                                            "to": "10.169.14.121",
+                                            "via": "ge-0/0/1.0"
+                                        },
+                                        "to": "10.169.14.121",
+                                    },
+                                },
+                            ],
+                            "rt-entry-count": {
+                                "#text": "2",
+                                "@junos:format": "2 entries"
+                            },
+                            "rt-prefix-length": "24",
+                            "rt-state": "FlashAll",
+                        },
+                    ],
+                    "table-name": "inet.0",
+                    "total-route-count": "1615",
+                }
+            ]
+        }
+    }
+
+    def test_golden_xml(self):
+        self.device = Mock(**self.golden_output_xml)
+        obj = ShowRouteProtocolExtensive(device=self.device, context='xml')
+        parsed_output = obj.parse(protocol='ospf')
+        self.device.execute.assert_called_once_with(
+            'show route protocol ospf extensive | display xml')
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+
+    def test_golden_xml_mapped_output(self):
+        # The output read from a file, with the prompt following it
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'output.txt')
+            with open(path, 'w') as f:
+                f.write(self.golden_output_xml['execute.return_value'] +
+                        '\n{master}\nlab@router> ')
+            self.device = Mock()
+            obj = ShowRouteProtocolExtensive(device=self.device, context='xml')
+            with MappedOutput(path) as output:
+                parsed_output = obj.parse(protocol='ospf', output=output)
+        self.device.execute.assert_not_called()
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+
+
+if __name__ == '__main__':
+    unittest.main()
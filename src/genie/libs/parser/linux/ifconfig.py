@@ -10,6 +10,7 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # =======================================================
@@ -18,7 +19,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 class IfconfigSchema(MetaParser):
     """Schema for ifconfig [<interface>]"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'interface': str,
             'flags': str,
@@ -61,7 +62,7 @@ class IfconfigSchema(MetaParser):
             Optional('device_interrupt'): int,
             Optional('device_memory'): str,
         }
-    }
+    })
 
 # =======================================================
 # Parser for 'ifconfig [<interface>]'
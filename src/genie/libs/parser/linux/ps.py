@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
@@ -21,7 +22,7 @@ from genie.libs.parser.utils.common import Common
 class PsSchema(MetaParser):
     ''' Schema for "ps -ef" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'pid': {
             Any(): {
                 'uid': str,
@@ -33,7 +34,7 @@ class PsSchema(MetaParser):
                 'cmd': str
             }
         }
-    }
+    })
  
 # ===================
 # Parser for 'ps -ef'
@@ -9,6 +9,7 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 from netaddr import IPAddress, IPNetwork
@@ -23,7 +24,7 @@ class RouteSchema(MetaParser):
     # 0.0.0.0         192.168.1.1     0.0.0.0         UG        0 0          0 wlo1
 
 
-    schema = {
+    schema = LazySchema(lambda: {
         'routes': {
             Any(): { # 'destination'
                 'mask': {
@@ -48,7 +49,7 @@ class RouteSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # =======================================================
 # Parser for 'route'
@@ -10,6 +10,7 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # =======================================================
@@ -18,7 +19,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 class VimCmdVmsvcGetAllVmsSchema(MetaParser):
     """Schema for vim-cmd vmsvc/getallvms"""
     
-    schema = {
+    schema = LazySchema(lambda: {
         'vmid': {
             Any(): {
                 'vmid': str,
@@ -29,7 +30,7 @@ class VimCmdVmsvcGetAllVmsSchema(MetaParser):
                 Optional('annotation'): str,
             }
         }
-    }
+    })
 
 
 # =======================================================
@@ -96,7 +97,7 @@ class VimCmdVmsvcGetAllVms(VimCmdVmsvcGetAllVmsSchema):
 class VimCmdVmsvcSnapshotGetVmIdSchema(MetaParser):
     """Schema for vim-cmd vmsvc/snapshot.get {vmid}"""
     
-    schema = {
+    schema = LazySchema(lambda: {
         'vmid': {
             Any(): {
                 'snapshot': {
@@ -110,7 +111,7 @@ class VimCmdVmsvcSnapshotGetVmIdSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =======================================================
@@ -1,3 +1,7 @@
 from genie import abstract
 
 abstract.declare_token(__name__)
+
+# Parser classes by name, their module is imported on first access
+from genie.libs.parser.utils.lazy_import import lazy_parsers
+__getattr__, __dir__ = lazy_parsers(__name__)
@@ -3,12 +3,13 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any
 
 class AcidiagFnvreadSchema(MetaParser):
     """ Schema for 'acidiag fnvread' """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'id': {
             Any(): {
                 'pod_id': int,
@@ -20,7 +21,7 @@ class AcidiagFnvreadSchema(MetaParser):
                 'last_upd_msg_id': int
             }
         }
-    }
+    })
 
 class AcidiagFnvread(AcidiagFnvreadSchema):
     """ Parser class for 'acidiag fnvread' """
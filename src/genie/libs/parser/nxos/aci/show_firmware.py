@@ -3,6 +3,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -13,7 +14,7 @@ class ShowFirmwareUpgradeStatusSchema(MetaParser):
         * 'show firmware upgrade status controller-group'
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'node': {
             Any(): {
                 'pod': int,
@@ -26,7 +27,7 @@ class ShowFirmwareUpgradeStatusSchema(MetaParser):
                 Optional('last_firmware_install_date'): str
             }
         }
-    }
+    })
 
 class ShowFirmwareUpgradeStatus(ShowFirmwareUpgradeStatusSchema):
     """ Parser class for:
@@ -108,7 +109,7 @@ class ShowFirmwareRepositorySchema(MetaParser):
         * 'show firmware repository'
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'name': {
             Any(): {
                 'version': {
@@ -119,7 +120,7 @@ class ShowFirmwareRepositorySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowFirmwareRepository(ShowFirmwareRepositorySchema):
@@ -4,6 +4,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -16,7 +17,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 class ShowPlatformInternalHalPolicyRedirdstSchema(MetaParser):
     """Schema for 'vsh_lc -c "show platform internal hal policy redirdst group_id {group_id} {address_family} src_ip {src_ip} dst_ip {dst_ip} protocol {protocol}'"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'group_id': {
             Any(): {
                 'src_ip': str,
@@ -29,7 +30,7 @@ class ShowPlatformInternalHalPolicyRedirdstSchema(MetaParser):
                 Optional('packets_hash'): str,
             }
         }
-    }
+    })
 
 
 class ShowPlatformInternalHalPolicyRedirdst(ShowPlatformInternalHalPolicyRedirdstSchema):
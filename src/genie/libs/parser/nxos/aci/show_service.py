@@ -4,6 +4,7 @@
 import re
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -16,7 +17,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 class ShowServiceRedirInfoGroupSchema(MetaParser):
     """Schema for show service redir info group"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'group_id': {
             Any(): {
                 'name': str,
@@ -33,7 +34,7 @@ class ShowServiceRedirInfoGroupSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowServiceRedirInfoGroup(ShowServiceRedirInfoGroupSchema):
@@ -12,6 +12,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
@@ -26,7 +27,7 @@ class ShowAccessListsSchema(MetaParser):
     """ Schema for:
         'show access-lists'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'name': str,
             'type': str,
@@ -108,7 +109,7 @@ class ShowAccessListsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =======================================
@@ -313,7 +314,7 @@ class ShowAccessListsSummarySchema(MetaParser):
     """ Schema for:
         'show access-lists summary'
     """
-    schema = {
+    schema = LazySchema(lambda: {
         'acl': {
           Any(): { # 'ipv4_acl'
               'total_aces_configured': int,
@@ -340,7 +341,7 @@ class ShowAccessListsSummarySchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 # =======================================
 # Parser for 'show access-lists summary'
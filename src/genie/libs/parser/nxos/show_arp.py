@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 										Default, Use
 from genie import parsergen
@@ -22,7 +23,7 @@ from genie.libs.parser.utils.common import Common
 class ShowIpArpSchema(MetaParser):
 	"""Schema for show ip arp"""
 
-	schema = {
+	schema = LazySchema(lambda: {
 		Optional('statistics'): {
 			Optional('entries_total'): int
 		},
@@ -43,7 +44,7 @@ class ShowIpArpSchema(MetaParser):
 				}
 			}
 		}
-	}
+	})
 
 
 # =====================================
@@ -158,7 +159,7 @@ class ShowIpArp(ShowIpArpSchema):
 class ShowIpArpDetailVrfAllSchema(MetaParser):
 	"""Schema for show ip arp detail vrf all"""
 
-	schema = {
+	schema = LazySchema(lambda: {
 		'interfaces': {
 			Any(): {
 				'ipv4': {
@@ -175,7 +176,7 @@ class ShowIpArpDetailVrfAllSchema(MetaParser):
 				}
 			},
 		}
-	}
+	})
 
 
 # =======================================
@@ -260,13 +261,13 @@ class ShowIpArpDetailVrfAll(ShowIpArpDetailVrfAllSchema):
 class ShowIpArpSummaryVrfAllSchema(MetaParser):
 	"""Schema for show ip arp summary vrf all"""
 
-	schema = {
+	schema = LazySchema(lambda: {
 		'resolved': int,
 		'incomplete': int,
 		'throttled': int,
 		'unknown': int,
 		'total': int,
-	  }
+	  })
 
 # ========================================
 # Parser for 'show ip arp summary vrf all'
@@ -338,7 +339,7 @@ class ShowIpArpSummaryVrfAll(ShowIpArpSummaryVrfAllSchema):
 class ShowIpArpstatisticsVrfAllSchema(MetaParser):
 	"""Schema for show ip arp statistics vrf all"""
 
-	schema = {
+	schema = LazySchema(lambda: {
 		'statistics': {
 			'sent':{
 				'total': int,
@@ -426,7 +427,7 @@ class ShowIpArpstatisticsVrfAllSchema(MetaParser):
 				Optional('failed_due_to_limits'): int,
 				}
 			}
-		}
+		})
 
 # ===========================================
 # Parser for 'show ip arp statistics vrf all'
@@ -51,10 +51,12 @@ NXOS parsers for the following show commands:
 # Python
 import re
 from copy import deepcopy
-import xml.etree.ElementTree as ET
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema, JSON_CONTEXT_LIST
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+                                                    CompiledMetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -63,6 +65,8 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import nxos_json
+from genie.libs.parser.utils.xml_stream import XmlStream
 
 
 # =====================================
@@ -72,7 +76,7 @@ class ShowBgpProcessVrfAllSchema(MetaParser):
     """Schema for show bgp process vrf all
                 show bgp process vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('bgp_pid'): int,
         Optional('bgp_protocol_started_reason'): str,
         Optional('bgp_performance_mode'): str,
@@ -165,7 +169,7 @@ class ShowBgpProcessVrfAllSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # =====================================
 # Parser for 'show bgp process vrf all'
@@ -806,259 +810,229 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             out = output
 
         etree_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        xml_output = ET.fromstring(out)
-
-        for item in xml_output:
-            for data in item:
-                for show in data:
-                    for bgp in show:
-                        for __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf in bgp:
-                            for process in __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf:
-                                for __XML__OPT_Cmd_show_bgp_process_cmd_vrf in process:
-                                    for __XML__OPT_Cmd_show_bgp_process_cmd___readonly__ in __XML__OPT_Cmd_show_bgp_process_cmd_vrf:
-                                        for key in __XML__OPT_Cmd_show_bgp_process_cmd___readonly__:
-                                            # Get key text
-                                            text = key.tag[key.tag.find('}')+1:]
-                                            # bgp_pid
-                                            if text == 'processid':
-                                                etree_dict['bgp_pid'] = int(key.text)
-                                            # bgp_protocol_started_reason
-                                            if text == 'protocolstartedreason':
-                                                etree_dict['bgp_protocol_started_reason'] = key.text
-                                            # bgp_tag
-                                            if text == 'protocoltag':
-                                                etree_dict['bgp_tag'] = key.text
-                                            # bgp_protocol_state
-                                            if text == 'protocolstate':
-                                                etree_dict['bgp_protocol_state'] = str(key.text).lower()
-                                            # bgp_isolate_mode
-                                            if text == 'isolatemode':
-                                                etree_dict['bgp_isolate_mode'] = key.text
-                                            # bgp_mmode
-                                            if text == 'mmode':
-                                                etree_dict['bgp_mmode'] = key.text
-                                            # bgp_memory_state
-                                            if text == 'memorystate':
-                                                etree_dict['bgp_memory_state'] = str(key.text).lower()
-                                            # bgp_performance_mode
-                                            if text == 'forwardingstatesaved':
-                                                if key.text == 'false':
-                                                    etree_dict['bgp_performance_mode'] = 'No'
-                                                else:
-                                                    etree_dict['bgp_performance_mode'] = 'Yes'
-                                            # bgp_asformat
-                                            if text == 'asformat':
-                                                etree_dict['bgp_asformat'] = key.text
-                                            if text == 'srgbmin':
-                                                srgbin = key.text
-                                            if text == 'srgbmax':
-                                                srgmax = key.text
-                                                try:
-                                                    etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
-                                                except Exception:
-                                                    pass
-                                            # num_attr_entries
-                                            if text == 'attributeentries':
-                                                etree_dict['num_attr_entries'] = int(key.text)
-                                            # hwm_attr_entries
-                                            if text == 'hwmattributeentries':
-                                                etree_dict['hwm_attr_entries'] = int(key.text)
-                                            # bytes_used
-                                            if text == 'bytesused':
-                                                etree_dict['bytes_used'] = int(key.text)
-                                            # entries_pending_delete
-                                            if text == 'entriespendingdelete':
-                                                etree_dict['entries_pending_delete'] = int(key.text)
-                                            # hwm_entries_pending_delete
-                                            if text == 'hwmentriespendingdelete':
-                                                etree_dict['hwm_entries_pending_delete'] = int(key.text)
-                                            # bgp_paths_per_hwm_attr
-                                            if text == 'pathsperattribute':
-                                                etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
-                                            # bgp_as_path_entries
-                                            if text == 'aspathentries':
-                                                etree_dict['bgp_as_path_entries'] = int(key.text)
-                                            # bytes_used_as_path_entries
-                                            if text == 'aspathbytes':
-                                                etree_dict['bytes_used_as_path_entries'] = int(key.text)
-                                            
-                                            if text == 'TABLE_vrf':
-                                                for table_vrf in key:
-                                                    for row_vrf in table_vrf:
-                                                        vrf_tag = row_vrf.tag[row_vrf.tag.find('}')+1:]
-
-                                                        # vrf
-                                                        #   vrf_name
-                                                        if vrf_tag == 'vrf-name-out':
-                                                            vrf_name = row_vrf.text
-                                                            if 'vrf' not in etree_dict:
-                                                                etree_dict['vrf'] = {}
-                                                            if vrf_name not in etree_dict['vrf']:
-                                                                etree_dict['vrf'][vrf_name] = {}
-                                                                vrf_dict = etree_dict['vrf'][vrf_name]
-                                                        # vrf_id
-                                                        if vrf_tag == 'vrf-id':
-                                                            vrf_dict['vrf_id'] = row_vrf.text
-                                                        # vrf_state
-                                                        if vrf_tag == 'vrf-state':
-                                                            vrf_dict['vrf_state'] = str(row_vrf.text).lower()
-                                                        # router_id
-                                                        if vrf_tag == 'vrf-router-id':
-                                                            vrf_dict['router_id'] = row_vrf.text
-                                                        # conf_router_id
-                                                        if vrf_tag == 'vrf-cfgd-id':
-                                                            vrf_dict['conf_router_id'] = row_vrf.text
-                                                        # confed_id
-                                                        if vrf_tag == 'vrf-confed-id':
-                                                            vrf_dict['confed_id'] = int(row_vrf.text)
-                                                        # cluster_id
-                                                        if vrf_tag == 'vrf-cluster-id':
-                                                           vrf_dict['cluster_id'] = row_vrf.text
-                                                        # num_conf_peers
-                                                        if vrf_tag == 'vrf-peers':
-                                                            vrf_dict['num_conf_peers'] = int(row_vrf.text)
-                                                        # num_pending_conf_peers
-                                                        if vrf_tag == 'vrf-pending-peers':
-                                                            vrf_dict['num_pending_conf_peers'] = int(row_vrf.text)
-                                                        # num_established_peers
-                                                        if vrf_tag == 'vrf-est-peers':
-                                                            vrf_dict['num_established_peers'] = int(row_vrf.text)
-                                                            vrf_dict['vrf_rd'] = 'not configured'
-                                                        # vrf_rd
-                                                        if vrf_tag == 'vrf-rd':
-                                                            vrf_dict['vrf_rd'] = row_vrf.text
-
-                                                        if vrf_tag == 'TABLE_af':
-                                                            for table_af in row_vrf:
-                                                                for row_af in table_af:
-                                                                    af_tag = row_af.tag[row_af.tag.find('}')+1:]
-
-                                                                    # address_family
-                                                                    #   address_family_name
-                                                                    if af_tag == 'af-name':
-                                                                        address_family_name = str(row_af.text).lower()
-                                                                        if 'address_family' not in etree_dict['vrf'][vrf_name]:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'] = {}
-                                                                        if address_family_name not in etree_dict['vrf'][vrf_name]['address_family']:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'][address_family_name] = {}
-                                                                            af_dict = etree_dict['vrf'][vrf_name]['address_family'][address_family_name]
-                                                                        # Initialize empty lists
-                                                                        export_rt_list = ''
-                                                                        import_rt_list = ''
-                                                                    # table_id
-                                                                    if af_tag == 'af-table-id':
-                                                                        table_id = str(row_af.text)
-                                                                        if '0x' in table_id:
-                                                                            af_dict['table_id'] = table_id
-                                                                        else:
-                                                                            af_dict['table_id'] = '0x' + table_id
-                                                                    # table_state
-                                                                    if af_tag == 'af-state':
-                                                                        af_dict['table_state'] = str(row_af.text).lower()
-                                                                    # peers
-                                                                    if af_tag == 'af-num-peers':
-                                                                        peers = int(row_af.text)
-                                                                        if 'peers' not in af_dict:
-                                                                            af_dict['peers'] = {}
-                                                                        if peers not in af_dict['peers']:
-                                                                            af_dict['peers'][peers] = {}
-                                                                    # active_peers
-                                                                    if af_tag == 'af-num-active-peers':
-                                                                        af_dict['peers'][peers]['active_peers'] = int(row_af.text)
-                                                                    # routes
-                                                                    if af_tag == 'af-peer-routes':
-                                                                        af_dict['peers'][peers]['routes'] = int(row_af.text)
-                                                                    # paths
-                                                                    if af_tag == 'af-peer-paths':
-                                                                        af_dict['peers'][peers]['paths'] = int(row_af.text)
-                                                                    # networks
-                                                                    if af_tag == 'af-peer-networks':
-                                                                        af_dict['peers'][peers]['networks'] = int(row_af.text)
-                                                                    # aggregates
-                                                                    if af_tag == 'af-peer-aggregates':
-                                                                        af_dict['peers'][peers]['aggregates'] = int(row_af.text)
-                                                                    # route_reflector
-                                                                    if af_tag == 'af-rr':
-                                                                        if row_af.text == 'true':
-                                                                            af_dict['route_reflector'] = True
-                                                                    # next_hop_trigger_delay
-                                                                    #   critical
-                                                                    if af_tag == 'nexthop-trigger-delay-critical':
-                                                                        if 'next_hop_trigger_delay' not in af_dict:
-                                                                            af_dict['next_hop_trigger_delay'] = {}
-                                                                        af_dict['next_hop_trigger_delay']['critical'] = int(row_af.text)
-                                                                    # next_hop_trigger_delay
-                                                                    #   non_critical
-                                                                    if af_tag == 'nexthop-trigger-delay-non-critical':
-                                                                        af_dict['next_hop_trigger_delay']['non_critical'] = int(row_af.text)
-                                                                    # aggregate_label
-                                                                    if af_tag == 'af-aggregate-label':
-                                                                        af_dict['aggregate_label'] = row_af.text
-                                                                    # label_mode
-                                                                    if af_tag == 'af-label-mode':
-                                                                        af_dict['label_mode'] = row_af.text
-                                                                    # import_default_map
-                                                                    if af_tag == 'importdefault_map':
-                                                                        af_dict['import_default_map'] = row_af.text
-                                                                    # import_default_prefix_limit
-                                                                    if af_tag == 'importdefault_prefixlimit':
-                                                                        af_dict['import_default_prefix_limit'] = int(row_af.text)
-                                                                    # import_default_prefix_count
-                                                                    if af_tag == 'importdefault_prefixcount':
-                                                                        af_dict['import_default_prefix_count'] = int(row_af.text)
-                                                                    # export_default_map
-                                                                    if af_tag == 'exportdefault_map':
-                                                                        af_dict['export_default_map'] = row_af.text
-                                                                    # export_default_prefix_limit
-                                                                    if af_tag == 'exportdefault_prefixlimit':
-                                                                        af_dict['export_default_prefix_limit'] = int(row_af.text)
-                                                                    # export_default_prefix_count
-                                                                    if af_tag == 'exportdefault_prefixcount':
-                                                                        af_dict['export_default_prefix_count'] = int(row_af.text)
-
-                                                                    # TABLE_redist
-                                                                    #   ROW_redist
-                                                                    if af_tag == 'TABLE_redist':
-                                                                        for table_redist in row_af:
-                                                                            for row_redist in table_redist:
-                                                                                row_redist_tag = row_redist.tag[row_redist.tag.find('}')+1:]
-                                                                                # protocol
-                                                                                if row_redist_tag == 'protocol':
-                                                                                    protocol = row_redist.text
-                                                                                    if 'redistribution' not in af_dict:
-                                                                                        af_dict['redistribution'] = {}
-                                                                                    if protocol not in af_dict['redistribution']:
-                                                                                        af_dict['redistribution'][protocol] = {}
-                                                                                # route_map
-                                                                                if row_redist_tag == 'route-map':
-                                                                                    af_dict['redistribution'][protocol]['route_map'] = row_redist.text
-
-                                                                    # TABLE_evpn_export_rt
-                                                                    #   ROW_evpn_export_rt
-                                                                    if af_tag == 'TABLE_evpn_export_rt':
-                                                                        for table_evpn_export in row_af:
-                                                                            for row_export in table_evpn_export:
-                                                                                row_export_tag = row_export.tag[row_export.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_export_tag == 'evpn-export-rt':
-                                                                                    export_rt_list = str(export_rt_list + ' ' + row_export.text).strip()
-                                                                                    af_dict['export_rt_list'] = export_rt_list
-                                                                    # TABLE_evpn_import_rt
-                                                                    #   ROW_evpn_import_rt
-                                                                    if af_tag == 'TABLE_evpn_import_rt':
-                                                                        for table_evpn_import in row_af:
-                                                                            for row_import in table_evpn_import:
-                                                                                row_import_tag = row_import.tag[row_import.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_import_tag == 'evpn-import-rt':
-                                                                                    import_rt_list = str(import_rt_list + ' ' + row_import.text).strip()
-                                                                                    af_dict['import_rt_list'] = import_rt_list
-
-                                                                    # parsed all tags
-                                                                    continue
-                                                                                    
+
+        # Tags are unique across the TABLE_vrf, TABLE_af and TABLE_redist
+        # levels, so the elements are read in document order
+        for key in XmlStream(out).iter():
+            # Get key text
+            text = key.tag
+            # bgp_pid
+            if text == 'processid':
+                etree_dict['bgp_pid'] = int(key.text)
+            # bgp_protocol_started_reason
+            elif text == 'protocolstartedreason':
+                etree_dict['bgp_protocol_started_reason'] = key.text
+            # bgp_tag
+            elif text == 'protocoltag':
+                etree_dict['bgp_tag'] = key.text
+            # bgp_protocol_state
+            elif text == 'protocolstate':
+                etree_dict['bgp_protocol_state'] = str(key.text).lower()
+            # bgp_isolate_mode
+            elif text == 'isolatemode':
+                etree_dict['bgp_isolate_mode'] = key.text
+            # bgp_mmode
+            elif text == 'mmode':
+                etree_dict['bgp_mmode'] = key.text
+            # bgp_memory_state
+            elif text == 'memorystate':
+                etree_dict['bgp_memory_state'] = str(key.text).lower()
+            # bgp_performance_mode
+            elif text == 'forwardingstatesaved':
+                if key.text == 'false':
+                    etree_dict['bgp_performance_mode'] = 'No'
+                else:
+                    etree_dict['bgp_performance_mode'] = 'Yes'
+            # bgp_asformat
+            elif text == 'asformat':
+                etree_dict['bgp_asformat'] = key.text
+            elif text == 'srgbmin':
+                srgbin = key.text
+            elif text == 'srgbmax':
+                srgmax = key.text
+                try:
+                    etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
+                except Exception:
+                    pass
+            # num_attr_entries
+            elif text == 'attributeentries':
+                etree_dict['num_attr_entries'] = int(key.text)
+            # hwm_attr_entries
+            elif text == 'hwmattributeentries':
+                etree_dict['hwm_attr_entries'] = int(key.text)
+            # bytes_used
+            elif text == 'bytesused':
+                etree_dict['bytes_used'] = int(key.text)
+            # entries_pending_delete
+            elif text == 'entriespendingdelete':
+                etree_dict['entries_pending_delete'] = int(key.text)
+            # hwm_entries_pending_delete
+            elif text == 'hwmentriespendingdelete':
+                etree_dict['hwm_entries_pending_delete'] = int(key.text)
+            # bgp_paths_per_hwm_attr
+            elif text == 'pathsperattribute':
+                etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
+            # bgp_as_path_entries
+            elif text == 'aspathentries':
+                etree_dict['bgp_as_path_entries'] = int(key.text)
+            # bytes_used_as_path_entries
+            elif text == 'aspathbytes':
+                etree_dict['bytes_used_as_path_entries'] = int(key.text)
+
+            # TABLE_vrf
+            #   ROW_vrf
+            # vrf
+            #   vrf_name
+            elif text == 'vrf-name-out':
+                vrf_name = key.text
+                if 'vrf' not in etree_dict:
+                    etree_dict['vrf'] = {}
+                if vrf_name not in etree_dict['vrf']:
+                    etree_dict['vrf'][vrf_name] = {}
+                    vrf_dict = etree_dict['vrf'][vrf_name]
+            # vrf_id
+            elif text == 'vrf-id':
+                vrf_dict['vrf_id'] = key.text
+            # vrf_state
+            elif text == 'vrf-state':
+                vrf_dict['vrf_state'] = str(key.text).lower()
+            # router_id
+            elif text == 'vrf-router-id':
+                vrf_dict['router_id'] = key.text
+            # conf_router_id
+            elif text == 'vrf-cfgd-id':
+                vrf_dict['conf_router_id'] = key.text
+            # confed_id
+            elif text == 'vrf-confed-id':
+                vrf_dict['confed_id'] = int(key.text)
+            # cluster_id
+            elif text == 'vrf-cluster-id':
+                vrf_dict['cluster_id'] = key.text
+            # num_conf_peers
+            elif text == 'vrf-peers':
+                vrf_dict['num_conf_peers'] = int(key.text)
+            # num_pending_conf_peers
+            elif text == 'vrf-pending-peers':
+                vrf_dict['num_pending_conf_peers'] = int(key.text)
+            # num_established_peers
+            elif text == 'vrf-est-peers':
+                vrf_dict['num_established_peers'] = int(key.text)
+                vrf_dict['vrf_rd'] = 'not configured'
+            # vrf_rd
+            elif text == 'vrf-rd':
+                vrf_dict['vrf_rd'] = key.text
+
+            # TABLE_af
+            #   ROW_af
+            # address_family
+            #   address_family_name
+            elif text == 'af-name':
+                address_family_name = str(key.text).lower()
+                if 'address_family' not in vrf_dict:
+                    vrf_dict['address_family'] = {}
+                if address_family_name not in vrf_dict['address_family']:
+                    vrf_dict['address_family'][address_family_name] = {}
+                    af_dict = vrf_dict['address_family'][address_family_name]
+                # Initialize empty lists
+                export_rt_list = ''
+                import_rt_list = ''
+            # table_id
+            elif text == 'af-table-id':
+                table_id = str(key.text)
+                if '0x' in table_id:
+                    af_dict['table_id'] = table_id
+                else:
+                    af_dict['table_id'] = '0x' + table_id
+            # table_state
+            elif text == 'af-state':
+                af_dict['table_state'] = str(key.text).lower()
+            # peers
+            elif text == 'af-num-peers':
+                peers = int(key.text)
+                if 'peers' not in af_dict:
+                    af_dict['peers'] = {}
+                if peers not in af_dict['peers']:
+                    af_dict['peers'][peers] = {}
+            # active_peers
+            elif text == 'af-num-active-peers':
+                af_dict['peers'][peers]['active_peers'] = int(key.text)
+            # routes
+            elif text == 'af-peer-routes':
+                af_dict['peers'][peers]['routes'] = int(key.text)
+            # paths
+            elif text == 'af-peer-paths':
+                af_dict['peers'][peers]['paths'] = int(key.text)
+            # networks
+            elif text == 'af-peer-networks':
+                af_dict['peers'][peers]['networks'] = int(key.text)
+            # aggregates
+            elif text == 'af-peer-aggregates':
+                af_dict['peers'][peers]['aggregates'] = int(key.text)
+            # route_reflector
+            elif text == 'af-rr':
+                if key.text == 'true':
+                    af_dict['route_reflector'] = True
+            # next_hop_trigger_delay
+            #   critical
+            elif text == 'nexthop-trigger-delay-critical':
+                if 'next_hop_trigger_delay' not in af_dict:
+                    af_dict['next_hop_trigger_delay'] = {}
+                af_dict['next_hop_trigger_delay']['critical'] = int(key.text)
+            # next_hop_trigger_delay
+            #   non_critical
+            elif text == 'nexthop-trigger-delay-non-critical':
+                af_dict['next_hop_trigger_delay']['non_critical'] = int(key.text)
+            # aggregate_label
+            elif text == 'af-aggregate-label':
+                af_dict['aggregate_label'] = key.text
+            # label_mode
+            elif text == 'af-label-mode':
+                af_dict['label_mode'] = key.text
+            # import_default_map
+            elif text == 'importdefault_map':
+                af_dict['import_default_map'] = key.text
+            # import_default_prefix_limit
+            elif text == 'importdefault_prefixlimit':
+                af_dict['import_default_prefix_limit'] = int(key.text)
+            # import_default_prefix_count
+            elif text == 'importdefault_prefixcount':
+                af_dict['import_default_prefix_count'] = int(key.text)
+            # export_default_map
+            elif text == 'exportdefault_map':
+                af_dict['export_default_map'] = key.text
+            # export_default_prefix_limit
+            elif text == 'exportdefault_prefixlimit':
+                af_dict['export_default_prefix_limit'] = int(key.text)
+            # export_default_prefix_count
+            elif text == 'exportdefault_prefixcount':
+                af_dict['export_default_prefix_count'] = int(key.text)
+
+            # TABLE_redist
+            #   ROW_redist
+            # protocol
+            elif text == 'protocol':
+                protocol = key.text
+                if 'redistribution' not in af_dict:
+                    af_dict['redistribution'] = {}
+                if protocol not in af_dict['redistribution']:
+                    af_dict['redistribution'][protocol] = {}
+            # route_map
+            elif text == 'route-map':
+                af_dict['redistribution'][protocol]['route_map'] = key.text
+
+            # TABLE_evpn_export_rt
+            #   ROW_evpn_export_rt
+            # export_rt_list
+            elif text == 'evpn-export-rt':
+                export_rt_list = str(export_rt_list + ' ' + key.text).strip()
+                af_dict['export_rt_list'] = export_rt_list
+            # TABLE_evpn_import_rt
+            #   ROW_evpn_import_rt
+            # import_rt_list
+            elif text == 'evpn-import-rt':
+                import_rt_list = str(import_rt_list + ' ' + key.text).strip()
+                af_dict['import_rt_list'] = import_rt_list
+
         return etree_dict
 
     def yang(self, vrf=''):
@@ -1106,7 +1080,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 class ShowBgpPeerSessionSchema(MetaParser):
     """Schema for show bgp peer-session <peer_session>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'peer_session': 
             {Any(): 
                 {Optional('shutdown'): bool,
@@ -1126,7 +1100,7 @@ class ShowBgpPeerSessionSchema(MetaParser):
                  Optional('inherited_vrf_default'): str,
                 },
             },
-        }
+        })
 
 # =========================================
 # Parser for 'show bgp peer-session <WORD>'
@@ -1299,7 +1273,7 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
 class ShowBgpPeerPolicySchema(MetaParser):
     """Schema for show bgp peer-policy <peer_policy>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'peer_policy': 
             {Any(): 
                 {Optional('send_community'): bool,
@@ -1318,7 +1292,7 @@ class ShowBgpPeerPolicySchema(MetaParser):
                  Optional('next_hop_self'): bool,
                 },
             },
-        }
+        })
 
 # ========================================
 # Parser for 'show bgp peer-policy <WORD>'
@@ -1490,7 +1464,7 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
 class ShowBgpPeerTemplateSchema(MetaParser):
     """Schema for show bgp peer-template <peer_template>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'peer_template':
             {Any():
                 {Optional('remote_as'): int,
@@ -1508,7 +1482,7 @@ class ShowBgpPeerTemplateSchema(MetaParser):
                 Optional('keepalive_interval'): int,
                 },
             },
-        }
+        })
 
 # ===================================================
 # Parser for 'show bgp peer-template <peer_template>'
@@ -1678,10 +1652,10 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
 # =================================
 # Schema for 'show bgp vrf all all'
 # =================================
-class ShowBgpVrfAllAllSchema(MetaParser):
+class ShowBgpVrfAllAllSchema(CompiledMetaParser):
     """Schema for show bgp vrf all all"""
 
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -1717,7 +1691,7 @@ class ShowBgpVrfAllAllSchema(MetaParser):
                     },
                 },
             },
-        }
+        }))
 
 # =================================
 # Parser for 'show bgp vrf all all'
@@ -1726,6 +1700,8 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
     """Parser for show bgp vrf <vrf>> <address_family>"""
 
     cli_command = 'show bgp vrf {vrf} {address_family}'
+    json_command = cli_command + nxos_json.JSON_PIPE
+    CONTEXT_LIST = JSON_CONTEXT_LIST
     exclude = [
       'bgp_table_version',
       'status_codes',
@@ -2180,6 +2156,101 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
 
         return parsed_dict
 
+    # ROW_path keys, and their index keys
+    JSON_PATH_FIELDS = nxos_json.RowMapper([
+        ('ipnexthop', 'next_hop', nxos_json.to_str),
+        ('ipv6nexthop', 'next_hop', nxos_json.to_str),
+        ('typecode', 'path_type', nxos_json.to_str),
+        ('metric', 'metric', int),
+        ('localpref', 'localprf', int),
+        ('weight', 'weight', int),
+        ('aspath', 'path', nxos_json.to_str),
+        ('origin', 'origin_codes', nxos_json.to_str),
+        ('origincode', 'origin_codes', nxos_json.to_str),
+    ])
+
+    def json(self, vrf='all', address_family='all', output=None):
+        if output is None:
+            output = self.device.execute(self.json_command.format(
+                vrf=vrf, address_family=address_family))
+
+        parsed_dict = {}
+        data = nxos_json.loads(output)
+
+        # {"vrf-name-out": "default", "vrf-router-id": "10.4.1.1",
+        #  "TABLE_afi": {"ROW_afi": {"afi": 1, "TABLE_safi": {...}}}}
+        for vrf_row in nxos_json.rows(data, 'vrf'):
+            vrf_name = nxos_json.to_str(vrf_row['vrf-name-out'])
+            local_router_id = nxos_json.to_str(vrf_row.get('vrf-router-id', ''))
+            vrf_dict = parsed_dict.setdefault('vrf', {}).setdefault(vrf_name, {})
+
+            for afi_row in nxos_json.rows(vrf_row, 'afi'):
+
+                # {"safi": 1, "af-name": "IPv4 Unicast", "table-version": 35,
+                #  "TABLE_rd": {...}}
+                for safi_row in nxos_json.rows(afi_row, 'safi'):
+                    original_address_family = nxos_json.to_str(
+                        safi_row['af-name']).lower()
+                    af_dict = vrf_dict.setdefault('address_family', {})\
+                        .setdefault(original_address_family, {})
+                    af_dict['bgp_table_version'] = int(
+                        safi_row.get('table-version', 0))
+                    af_dict['local_router_id'] = local_router_id
+
+                    # {"rd_val": "100:100", "rd_vrf": "VRF1",
+                    #  "TABLE_prefix": {...}}
+                    for rd_row in nxos_json.rows(safi_row, 'rd'):
+                        af_dict = vrf_dict['address_family']\
+                            [original_address_family]
+                        route_distinguisher = rd_row.get('rd_val')
+                        if route_distinguisher:
+                            route_distinguisher = nxos_json.to_str(
+                                route_distinguisher)
+                            af_dict = vrf_dict['address_family'].setdefault(
+                                original_address_family + ' RD ' +
+                                route_distinguisher, {})
+                            af_dict['bgp_table_version'] = int(
+                                safi_row.get('table-version', 0))
+                            af_dict['local_router_id'] = local_router_id
+                            af_dict['route_distinguisher'] = \
+                                route_distinguisher
+                            if rd_row.get('rd_vrf'):
+                                af_dict['default_vrf'] = nxos_json.to_str(
+                                    rd_row['rd_vrf'])
+
+                        for prefix_row in nxos_json.rows(rd_row, 'prefix'):
+                            self._json_prefix(af_dict, prefix_row)
+
+        return parsed_dict
+
+    def _json_prefix(self, af_dict, prefix_row):
+        '''Map one ROW_prefix and its paths, ordered by next hop like the
+        cli parser'''
+        prefix = nxos_json.to_str(prefix_row.get('ipprefix') or
+                                  prefix_row['ipv6prefix'])
+
+        # {"statuscode": "*", "bestcode": ">", "typecode": "i",
+        #  "ipnexthop": "10.36.3.3", "metric": 0, "localpref": 100,
+        #  "weight": 0, "aspath": "", "origin": "?"}
+        paths = []
+        for path_row in nxos_json.rows(prefix_row, 'path'):
+            index_dict = self.JSON_PATH_FIELDS.fill({}, path_row)
+            if 'next_hop' not in index_dict:
+                continue
+            status_codes = nxos_json.to_str(path_row.get('statuscode', '')) +\
+                nxos_json.to_str(path_row.get('bestcode', ''))
+            if status_codes:
+                index_dict['status_codes'] = status_codes
+            paths.append(index_dict)
+
+        if not paths:
+            return
+        paths.sort(key=lambda index_dict: index_dict['next_hop'])
+        index = af_dict.setdefault('prefixes', {}).setdefault(prefix, {})\
+            .setdefault('index', {})
+        for ind, index_dict in enumerate(paths, start=1):
+            index[ind] = index_dict
+
 
 # ==============================================
 # Schema for 'show bgp vrf <vrf> all neighbors'
@@ -2187,7 +2258,7 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
 class ShowBgpVrfAllNeighborsSchema(MetaParser):
     """Schema for show bgp vrf <vrf> all neighbors"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'neighbor':
             {Any(): 
                 {'remote_as': int,
@@ -2331,7 +2402,7 @@ class ShowBgpVrfAllNeighborsSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # ==============================================
 # Parser for 'show bgp vrf <vrf> all neighbors'
@@ -3232,7 +3303,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 class ShowBgpVrfAllAllNextHopDatabaseSchema(MetaParser):
     """Schema for show bgp vrf all all nexthop-database"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any():
                 {'address_family':
@@ -3269,7 +3340,7 @@ class ShowBgpVrfAllAllNextHopDatabaseSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 # ==================================================
 # Parser for 'show bgp vrf all all nexthop-database'
@@ -3464,7 +3535,7 @@ class ShowBgpVrfAllAllNextHopDatabase(ShowBgpVrfAllAllNextHopDatabaseSchema):
 class ShowBgpVrfAllAllSummarySchema(MetaParser):
     """Schema for show bgp vrf <WORD> all summary"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {Optional('neighbor'):
@@ -3513,7 +3584,7 @@ class ShowBgpVrfAllAllSummarySchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # =========================================
 # Parser for 'show bgp vrf <WORD> all summary'
@@ -3843,308 +3914,216 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
+        stream = XmlStream(out)
+        # compare cli command
+        stream.check_command(self.cli_command[2].format(vrf=vrf,
+                                                        address_family=address_family))
+        # xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
+        if not stream.namespace:
             return etree_dict
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[2].format(vrf=vrf,
-                                                                              address_family=address_family))
-
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
+        # The vrf and address family values precede their TABLE_neighbor,
+        # so they are read from the open ROW_vrf and ROW_saf
+        saf_root = None
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
+        # -----   loop neighbors  -----
+        for nei_root in stream.rows('neighbor'):
+            if stream.parent('ROW_saf') is not saf_root:
+                saf_root = stream.parent('ROW_saf')
+                vrf_tree = stream.parent('ROW_vrf')
+                # vrf
+                try:
+                    vrf = vrf_tree.find('vrf-name-out').text
+                except Exception:
+                    break
+                af, af_dict = self._xml_address_family(vrf_tree, saf_root)
+            if af_dict is None:
+                continue
 
-            # <vrf-router-id>10.106.0.6</vrf-router-id>
+            # neighbor
             try:
-                route_identifier = vrf_tree.find('{}vrf-router-id'.format(namespace)).text
+                nei = nei_root.find('neighborid').text
             except Exception:
-                route_identifier = None
+                continue
 
-            # <vrf-local-as>333</vrf-local-as>
-            try:
-                local_as = vrf_tree.find('{}vrf-local-as'.format(namespace)).text
-            except Exception:
-                local_as = None
+            if 'vrf' not in etree_dict:
+                etree_dict['vrf'] = {}
+            if vrf not in etree_dict['vrf']:
+                etree_dict['vrf'][vrf] = {}
 
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_af'.format(namespace))
-            if not af_tree:
-                continue
-            for af_root in af_tree.findall('{}ROW_af'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_saf'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_saf'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                        # initial af dictionary
-                        af_dict = {}
-                        if route_identifier:
-                            af_dict['route_identifier'] = route_identifier
-                        if local_as:
-                            af_dict['local_as'] = int(local_as)
-                    except Exception:
-                        continue
+            if 'neighbor' not in etree_dict['vrf'][vrf]:
+                etree_dict['vrf'][vrf]['neighbor'] = {}
+            if nei not in etree_dict['vrf'][vrf]['neighbor']:
+                etree_dict['vrf'][vrf]['neighbor'][nei] = {}
 
-                    # <tableversion>7</tableversion>
-                    try:
-                        af_dict['bgp_table_version'] = int(
-                            saf_root.find('{}tableversion'.format(namespace)).text)
-                    except Exception:
-                        # for valide entry, table version should be there
-                        continue
+            if 'address_family' not in etree_dict['vrf'][vrf]['neighbor'][nei]:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'] = {}
 
-                    # <configuredpeers>3</configuredpeers>
-                    af_dict['config_peers'] = \
-                        int(saf_root.find('{}configuredpeers'.format(namespace)).text)
-                        
-                    # <capablepeers>2</capablepeers>
-                    af_dict['capable_peers'] = \
-                        int(saf_root.find('{}capablepeers'.format(namespace)).text)
+            if af not in etree_dict['vrf'][vrf]['neighbor'][nei]['address_family']:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af] = {}
 
-                    # <totalnetworks>5</totalnetworks>
-                    try:
-                        total_prefix_entries = \
-                            int(saf_root.find('{}totalnetworks'.format(namespace)).text)
-                        if 'prefixes' not in af_dict:
-                            af_dict['prefixes'] = {}
-                        af_dict['prefixes']['total_entries'] = total_prefix_entries
-                    except Exception:
-                        pass
-                        
-                    # <totalpaths>10</totalpaths>
-                    try:
-                        total_path_entries = \
-                            int(saf_root.find('{}totalpaths'.format(namespace)).text)
-                        if 'path' not in af_dict:
-                            af_dict['path'] = {}
-                        af_dict['path']['total_entries'] = total_path_entries
-                    except Exception:
-                        pass
-                        
-                    # <memoryused>1820</memoryused>
-                    try:
-                        memory_usage = \
-                            int(saf_root.find('{}memoryused'.format(namespace)).text)
-                        af_dict['path']['memory_usage'] = memory_usage
-                        af_dict['prefixes']['memory_usage'] = memory_usage
-                    except Exception:
-                        pass
+            sub_dict = etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af]
 
-                    try:
-                        # <numberattrs>1</numberattrs>
-                        entries_1 = \
-                            saf_root.find('{}numberattrs'.format(namespace)).text
-                            
-                        # <bytesattrs>160</bytesattrs>
-                        entries_2 = \
-                            saf_root.find('{}bytesattrs'.format(namespace)).text
+            #  ---   AF attributes -------
+            update_dict = deepcopy(af_dict)
+            sub_dict.update(update_dict)
 
-                        af_dict['attribute_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberpaths>1</numberpaths>
-                        entries_1 = \
-                            saf_root.find('{}numberpaths'.format(namespace)).text
+            #  ---   Neighbors attributes -------
+            # <neighborversion>4</neighborversion>
+            sub_dict['neighbor_table_version'] = int(
+                nei_root.find('neighborversion').text)
 
-                        # <bytespaths>34</bytespaths>
-                        entries_2 = \
-                            saf_root.find('{}bytespaths'.format(namespace)).text
+            # <msgrecvd>5471</msgrecvd>
+            sub_dict['msg_rcvd'] = int(nei_root.find('msgrecvd').text)
 
-                        af_dict['as_path_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numbercommunities>0</numbercommunities>
-                        entries_1 = \
-                            saf_root.find('{}numbercommunities'.format(namespace)).text
+            # <msgsent>5459</msgsent>
+            sub_dict['msg_sent'] = int(nei_root.find('msgsent').text)
 
-                        # <bytescommunities>0</bytescommunities>
-                        entries_2 = \
-                            saf_root.find('{}bytescommunities'.format(namespace)).text
+            # <neighbortableversion>7</neighbortableversion>
+            sub_dict['tbl_ver'] = int(
+                nei_root.find('neighbortableversion').text)
 
-                        af_dict['community_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberclusterlist>0</numberclusterlist>
-                        entries_1 = \
-                            saf_root.find('{}numberclusterlist'.format(namespace)).text
+            # <inq>0</inq>
+            sub_dict['inq'] = int(nei_root.find('inq').text)
 
-                        # <bytesclusterlist>0</bytesclusterlist>
-                        entries_2 = \
-                            saf_root.find('{}bytesclusterlist'.format(namespace)).text
+            # <outq>0</outq>
+            sub_dict['outq'] = int(nei_root.find('outq').text)
 
-                        af_dict['clusterlist_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
+            # <neighboras>333</neighboras>
+            sub_dict['as'] = int(nei_root.find('neighboras').text)
 
-                    # <dampening>Enabled</dampening>
-                    dampening = saf_root.find('{}dampening'.format(namespace)).text.lower()
-                    if 'enabled' in dampening or 'true' in dampening:
-                        af_dict['dampening'] = True
+            # <time>3d18h</time>
+            sub_dict['up_down'] = nei_root.find('time').text
 
-                    # <historypaths>0</historypaths>
-                    try:
-                        af_dict['history_paths'] = int(saf_root.find('{}historypaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+            # <state>Established</state>
+            state = nei_root.find('state').text.lower()
 
-                    # <dampenedpaths>0</dampenedpaths>
-                    try:
-                        af_dict['dampened_paths'] = int(saf_root.find('{}dampenedpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+            # <prefixreceived>5</prefixreceived>
+            prefix_received = nei_root.find('prefixreceived').text
 
-                    # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
-                    try:
-                        af_dict['soft_reconfig_recvd_paths'] = int(
-                                saf_root.find('{}softreconfigrecvdpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigidenticalpaths>10</softreconfigidenticalpaths>
-                    try:
-                        af_dict['soft_reconfig_identical_paths'] = int(
-                                saf_root.find('{}softreconfigidenticalpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+            if 'established' in state:
+                sub_dict['state'] = state
+                sub_dict['prefix_received'] = prefix_received
+                sub_dict['state_pfxrcd'] = prefix_received
+            else:
+                sub_dict['state'] = state
+                sub_dict['state_pfxrcd'] = state
 
-                    # <softreconfigcombopaths>0</softreconfigcombopaths>
-                    try:
-                        af_dict['soft_reconfig_combo_paths'] = int(
-                                saf_root.find('{}softreconfigcombopaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+        return etree_dict
 
-                    # <softreconfigfilteredrecvd>0</softreconfigfilteredrecvd>
-                    try:
-                        af_dict['soft_reconfig_filtered_recvd'] = int(
-                                saf_root.find('{}softreconfigfilteredrecvd'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigbytes>0</softreconfigbytes>
-                    try:
-                        af_dict['soft_reconfig_bytes'] = int(
-                                saf_root.find('{}softreconfigbytes'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                     # Neighbor table
-                    nei_tree = saf_root.find('{}TABLE_neighbor'.format(namespace))
-                    if not nei_tree:
-                        continue
+    def _xml_address_family(self, vrf_tree, saf_root):
+        '''Return the address family of a ROW_saf and its attributes, which
+        are None when the row has no valid entry'''
+        # <vrf-router-id>10.106.0.6</vrf-router-id>
+        try:
+            route_identifier = vrf_tree.find('vrf-router-id').text
+        except Exception:
+            route_identifier = None
 
-                    # -----   loop neighbors  -----
-                    for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                        # neighbor
-                        try:
-                            nei = nei_root.find('{}neighborid'.format(namespace)).text
-                        except Exception:
-                            continue
+        # <vrf-local-as>333</vrf-local-as>
+        try:
+            local_as = vrf_tree.find('vrf-local-as').text
+        except Exception:
+            local_as = None
 
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
+        # address family
+        try:
+            af = saf_root.find('af-name').text
+            af = af.lower()
+            # initial af dictionary
+            af_dict = {}
+            if route_identifier:
+                af_dict['route_identifier'] = route_identifier
+            if local_as:
+                af_dict['local_as'] = int(local_as)
+        except Exception:
+            return None, None
 
-                        if 'neighbor' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['neighbor'] = {}
-                        if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei] = {}
+        # <tableversion>7</tableversion>
+        try:
+            af_dict['bgp_table_version'] = int(
+                saf_root.find('tableversion').text)
+        except Exception:
+            # for valide entry, table version should be there
+            return af, None
 
-                        if 'address_family' not in etree_dict['vrf'][vrf]['neighbor'][nei]:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'] = {}
+        # <configuredpeers>3</configuredpeers>
+        af_dict['config_peers'] = int(saf_root.find('configuredpeers').text)
 
-                        if af not in etree_dict['vrf'][vrf]['neighbor'][nei]['address_family']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af] = {}
-                    
-                        sub_dict = etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af]
+        # <capablepeers>2</capablepeers>
+        af_dict['capable_peers'] = int(saf_root.find('capablepeers').text)
 
-                        #  ---   AF attributes -------
-                        update_dict = deepcopy(af_dict)
-                        sub_dict.update(update_dict)
+        # <totalnetworks>5</totalnetworks>
+        try:
+            total_prefix_entries = int(saf_root.find('totalnetworks').text)
+            if 'prefixes' not in af_dict:
+                af_dict['prefixes'] = {}
+            af_dict['prefixes']['total_entries'] = total_prefix_entries
+        except Exception:
+            pass
 
-                        #  ---   Neighbors attributes -------
-                        # <neighborversion>4</neighborversion>
-                        sub_dict['neighbor_table_version'] = int(
-                            nei_root.find('{}neighborversion'.format(namespace)).text)
+        # <totalpaths>10</totalpaths>
+        try:
+            total_path_entries = int(saf_root.find('totalpaths').text)
+            if 'path' not in af_dict:
+                af_dict['path'] = {}
+            af_dict['path']['total_entries'] = total_path_entries
+        except Exception:
+            pass
 
-                        # <msgrecvd>5471</msgrecvd>
-                        sub_dict['msg_rcvd'] = int(
-                            nei_root.find('{}msgrecvd'.format(namespace)).text)
-                        
-                        # <msgsent>5459</msgsent>
-                        sub_dict['msg_sent'] = int(
-                            nei_root.find('{}msgsent'.format(namespace)).text)
-                        
-                        # <neighbortableversion>7</neighbortableversion>
-                        sub_dict['tbl_ver'] = int(
-                            nei_root.find('{}neighbortableversion'.format(namespace)).text)
-                        
-                        # <inq>0</inq>
-                        sub_dict['inq'] = int(
-                            nei_root.find('{}inq'.format(namespace)).text)
-                        
-                        # <outq>0</outq>
-                        sub_dict['outq'] = int(
-                            nei_root.find('{}outq'.format(namespace)).text)
-                        
-                        # <neighboras>333</neighboras>
-                        sub_dict['as'] = int(
-                            nei_root.find('{}neighboras'.format(namespace)).text)
-                        
-                        # <time>3d18h</time>
-                        sub_dict['up_down'] = \
-                            nei_root.find('{}time'.format(namespace)).text
-                        
-                        # <state>Established</state>
-                        state = nei_root.find('{}state'.format(namespace)).text.lower()
+        # <memoryused>1820</memoryused>
+        try:
+            memory_usage = int(saf_root.find('memoryused').text)
+            af_dict['path']['memory_usage'] = memory_usage
+            af_dict['prefixes']['memory_usage'] = memory_usage
+        except Exception:
+            pass
+
+        # <numberattrs>1</numberattrs>
+        # <bytesattrs>160</bytesattrs>
+        # <numberpaths>1</numberpaths>
+        # <bytespaths>34</bytespaths>
+        # <numbercommunities>0</numbercommunities>
+        # <bytescommunities>0</bytescommunities>
+        # <numberclusterlist>0</numberclusterlist>
+        # <bytesclusterlist>0</bytesclusterlist>
+        for key, tag in [('attribute_entries', 'attrs'),
+                         ('as_path_entries', 'paths'),
+                         ('community_entries', 'communities'),
+                         ('clusterlist_entries', 'clusterlist')]:
+            try:
+                entries_1 = saf_root.find('number' + tag).text
+                entries_2 = saf_root.find('bytes' + tag).text
+                af_dict[key] = '[{0}/{1}]'.format(entries_1, entries_2)
+            except Exception:
+                pass
 
-                        # <prefixreceived>5</prefixreceived>
-                        prefix_received = \
-                            nei_root.find('{}prefixreceived'.format(namespace)).text
+        # <dampening>Enabled</dampening>
+        dampening = saf_root.find('dampening').text.lower()
+        if 'enabled' in dampening or 'true' in dampening:
+            af_dict['dampening'] = True
+
+        # <historypaths>0</historypaths>
+        # <dampenedpaths>0</dampenedpaths>
+        # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
+        # <softreconfigidenticalpaths>10</softreconfigidenticalpaths>
+        # <softreconfigcombopaths>0</softreconfigcombopaths>
+        # <softreconfigfilteredrecvd>0</softreconfigfilteredrecvd>
+        # <softreconfigbytes>0</softreconfigbytes>
+        for key, tag in [('history_paths', 'historypaths'),
+                         ('dampened_paths', 'dampenedpaths'),
+                         ('soft_reconfig_recvd_paths', 'softreconfigrecvdpaths'),
+                         ('soft_reconfig_identical_paths', 'softreconfigidenticalpaths'),
+                         ('soft_reconfig_combo_paths', 'softreconfigcombopaths'),
+                         ('soft_reconfig_filtered_recvd', 'softreconfigfilteredrecvd'),
+                         ('soft_reconfig_bytes', 'softreconfigbytes')]:
+            try:
+                af_dict[key] = int(saf_root.find(tag).text)
+            except Exception:
+                pass
 
-                        if 'established' in state:
-                            sub_dict['state'] = state
-                            sub_dict['prefix_received'] = prefix_received
-                            sub_dict['state_pfxrcd'] = prefix_received
-                        else:
-                            sub_dict['state'] = state
-                            sub_dict['state_pfxrcd'] = state
-                
-        return etree_dict
+        return af, af_dict
 
 
 # ==================================================
@@ -4153,7 +4132,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 class ShowBgpVrfAllAllDampeningParametersSchema(MetaParser):
     """Schema for 'show bgp vrf <WROD> all dampening parameters"""
     
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'address_family':
@@ -4181,7 +4160,7 @@ class ShowBgpVrfAllAllDampeningParametersSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # ==================================================
 # Parser for 'show bgp vrf <WROD> all dampening parameters'
@@ -4324,201 +4303,105 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
         out = self.device.execute(self.xml_command.format(vrf=vrf))
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
+        stream = XmlStream(out)
         # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[1].format(vrf=vrf,
-                                                                              address_family=address_family))
-
-        root = Common.retrieve_xml_child(
-                root=root,
-                key='TABLE_vrf')
-
-        if not root:
+        stream.check_command(self.cli_command[1].format(vrf=vrf,
+                                                        address_family=address_family))
+        # xml namespace
+        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
+        if not stream.namespace:
             return etree_dict
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
+        # -----   loop rd  -----
+        for rd_root in stream.rows('rd'):
             # vrf
             try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
+                vrf = stream.parent('ROW_vrf').find('vrf-name-out').text
             except Exception:
                 break
 
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_afi'.format(namespace))
-            if not af_tree:
+            # address_family
+            try:
+                af = stream.parent('ROW_safi').find('af-name').text
+                af = af.lower()
+            except Exception:
                 continue
-            for af_root in af_tree.findall('{}ROW_afi'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_safi'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_safi'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                    except Exception:
-                        continue
-
-                     # RD table
-                    rd_tree = saf_root.find('{}TABLE_rd'.format(namespace))
-                    if not rd_tree:
-                        continue
-
-                    # -----   loop rd  -----
-                    for rd_root in rd_tree.findall('{}ROW_rd'.format(namespace)):
-
-                        # neighbor
-                        try:
-                            rd = rd_root.find('{}rd_val'.format(namespace)).text
-                        except Exception:
-                            rd = None
-
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['address_family']:
-                            etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                        # dampening
-                        etree_dict['vrf'][vrf]['address_family'][af]['dampening'] = 'True'
-
-                        if rd:
-                            if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'] = {}
-
-                            if rd not in etree_dict['vrf'][vrf]['address_family']:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd] = {}
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd]
-                        else:
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
-                                    
-
-                        # <dampconfigured>Configured</dampconfigured>
-                        # cli does not have this key
 
-                        # <rpmname>test</rpmname>
-                        try:
-                            sub_dict['dampening_route_map'] = \
-                                rd_root.find('{}rpmname'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <rd_vrf>vpn2</rd_vrf>
-                        try:
-                            sub_dict['rd_vrf'] = \
-                                rd_root.find('{}rd_vrf'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <rd_vniid>2</rd_vniid>
-                        try:
-                            sub_dict['rd_vni_id'] = \
-                                rd_root.find('{}rd_vniid'.format(namespace)).text
-                        except Exception:
-                            pass
+            # rd
+            try:
+                rd = rd_root.find('rd_val').text
+            except Exception:
+                rd = None
 
-                        # <damphalflife>1</damphalflife>
-                        try:
-                            sub_dict['dampening_half_life_time'] = \
-                                rd_root.find('{}damphalflife'.format(namespace)).text
-                        except Exception:
-                            pass
+            if 'vrf' not in etree_dict:
+                etree_dict['vrf'] = {}
+            if vrf not in etree_dict['vrf']:
+                etree_dict['vrf'][vrf] = {}
 
-                        # <dampsuppress>30</dampsuppress>
-                        try:
-                            sub_dict['dampening_suppress_time'] = \
-                                rd_root.find('{}dampsuppress'.format(namespace)).text
-                        except Exception:
-                            pass
+            if 'address_family' not in etree_dict['vrf'][vrf]:
+                etree_dict['vrf'][vrf]['address_family'] = {}
 
-                        # <dampreuse>10</dampreuse>
-                        try:
-                            sub_dict['dampening_reuse_time'] = \
-                                rd_root.find('{}dampreuse'.format(namespace)).text
-                        except Exception:
-                            pass
+            if af not in etree_dict['vrf'][vrf]['address_family']:
+                etree_dict['vrf'][vrf]['address_family'][af] = {}
 
-                        # <dampsuppresstime>2</dampsuppresstime>
-                        try:
-                            sub_dict['dampening_max_suppress_time'] = \
-                                rd_root.find('{}dampsuppresstime'.format(namespace)).text
-                        except Exception:
-                            pass
+            # dampening
+            etree_dict['vrf'][vrf]['address_family'][af]['dampening'] = 'True'
 
-                        # <dampmaxpenalty>40</dampmaxpenalty>
-                        try:
-                            sub_dict['dampening_max_suppress_penalty'] = \
-                                rd_root.find('{}dampmaxpenalty'.format(namespace)).text
-                        except Exception:
-                            pass
+            if rd:
+                if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
+                    etree_dict['vrf'][vrf]['address_family'][af]\
+                        ['route_distinguisher'] = {}
 
-                        # TABLE_rpm
-                        rpm_tree = rd_root.find('{}TABLE_rpm'.format(namespace))
-                        if not rpm_tree:
-                            continue
+                if rd not in etree_dict['vrf'][vrf]['address_family']:
+                    etree_dict['vrf'][vrf]['address_family'][af]\
+                        ['route_distinguisher'][rd] = {}
+                sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
+                        ['route_distinguisher'][rd]
+            else:
+                sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
+
+            # <dampconfigured>Configured</dampconfigured>
+            # cli does not have this key
+
+            # <rpmname>test</rpmname>
+            # <rd_vrf>vpn2</rd_vrf>
+            # <rd_vniid>2</rd_vniid>
+            # <damphalflife>1</damphalflife>
+            # <dampsuppress>30</dampsuppress>
+            # <dampreuse>10</dampreuse>
+            # <dampsuppresstime>2</dampsuppresstime>
+            # <dampmaxpenalty>40</dampmaxpenalty>
+            for key, tag in [('dampening_route_map', 'rpmname'),
+                             ('rd_vrf', 'rd_vrf'),
+                             ('rd_vni_id', 'rd_vniid'),
+                             ('dampening_half_life_time', 'damphalflife'),
+                             ('dampening_suppress_time', 'dampsuppress'),
+                             ('dampening_reuse_time', 'dampreuse'),
+                             ('dampening_max_suppress_time', 'dampsuppresstime'),
+                             ('dampening_max_suppress_penalty', 'dampmaxpenalty')]:
+                try:
+                    sub_dict[key] = rd_root.find(tag).text
+                except Exception:
+                    pass
 
-                        # ROW_rpm
-                        for rpm_root in rpm_tree.findall('{}ROW_rpm'.format(namespace)):
-
-                            # <rpmdamphalflife>1</rpmdamphalflife>
-                            try:
-                                sub_dict['dampening_half_life_time'] = \
-                                    rpm_root.find('{}rpmdamphalflife'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampsuppress>30</rpmdampsuppress>
-                            try:
-                                sub_dict['dampening_suppress_time'] = \
-                                    rpm_root.find('{}rpmdampsuppress'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampreuse>10</rpmdampreuse>
-                            try:
-                                sub_dict['dampening_reuse_time'] = \
-                                    rpm_root.find('{}rpmdampreuse'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampsuppresstime>2</rpmdampsuppresstime>
-                            try:
-                                sub_dict['dampening_max_suppress_time'] = \
-                                    rpm_root.find('{}rpmdampsuppresstime'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampmaxpenalty>40</rpmdampmaxpenalty>
-                            try:
-                                sub_dict['dampening_max_suppress_penalty'] = \
-                                    rpm_root.find('{}rpmdampmaxpenalty'.format(namespace)).text
-                            except Exception:
-                                pass
+            # TABLE_rpm
+            #   ROW_rpm
+            for rpm_root in rd_root.iterfind('TABLE_rpm/ROW_rpm'):
+
+                # <rpmdamphalflife>1</rpmdamphalflife>
+                # <rpmdampsuppress>30</rpmdampsuppress>
+                # <rpmdampreuse>10</rpmdampreuse>
+                # <rpmdampsuppresstime>2</rpmdampsuppresstime>
+                # <rpmdampmaxpenalty>40</rpmdampmaxpenalty>
+                for key, tag in [('dampening_half_life_time', 'rpmdamphalflife'),
+                                 ('dampening_suppress_time', 'rpmdampsuppress'),
+                                 ('dampening_reuse_time', 'rpmdampreuse'),
+                                 ('dampening_max_suppress_time', 'rpmdampsuppresstime'),
+                                 ('dampening_max_suppress_penalty', 'rpmdampmaxpenalty')]:
+                    try:
+                        sub_dict[key] = rpm_root.find(tag).text
+                    except Exception:
+                        pass
 
         return etree_dict
 
@@ -4529,7 +4412,7 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
 class ShowBgpVrfAllNeighborsAdvertisedRoutesSchema(MetaParser):
     """Schema for show bgp vrf <vrf> all neighbors <neighbor> advertised-routes"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'neighbor':
@@ -4564,7 +4447,7 @@ class ShowBgpVrfAllNeighborsAdvertisedRoutesSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # ==========================================================================
 # Parser for 'show bgp vrf <vrf> all neighbors <neighbor> advertised-routes'
@@ -5003,7 +4886,7 @@ class ShowBgpL2vpnEvpnNeighborsAdvertisedRoutes(ShowBgpVrfAllNeighborsAdvertised
 class ShowBgpVrfAllNeighborsRoutesSchema(MetaParser):
     """Schema for show bgp vrf <vrf> all neighbors <neighbor> routes"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'neighbor':
@@ -5036,7 +4919,7 @@ class ShowBgpVrfAllNeighborsRoutesSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # ===============================================================
 # Parser for 'show bgp vrf <vrf> all neighbors <neighbor> routes'
@@ -5453,7 +5336,7 @@ class ShowBgpVrfAllNeighborsRoutes(ShowBgpVrfAllNeighborsRoutesSchema):
 class ShowBgpVrfAllNeighborsReceivedRoutesSchema(MetaParser):
     """Schema for show bgp vrf <vrf> all neighbors <neighbor> received-routes"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':
             {Any():
                 {'neighbor':
@@ -5486,7 +5369,7 @@ class ShowBgpVrfAllNeighborsReceivedRoutesSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # =====================================================================
 # Parser for 'show bgp vrf <WORD> all neighbors <WORD> received-routes'
@@ -5897,7 +5780,7 @@ class ShowBgpVrfAllNeighborsReceivedRoutes(ShowBgpVrfAllNeighborsReceivedRoutesS
 class ShowRunningConfigBgpSchema(MetaParser):
     """Schema for show running-config bgp"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'bgp':
             {'instance':
                 {'default':
@@ -6113,7 +5996,7 @@ class ShowRunningConfigBgpSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ====================================
 # Parser for 'show running-config bgp'
@@ -7368,7 +7251,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 class ShowBgpAllDampeningFlapStatisticsSchema(MetaParser):
     """Schema for show bgp all dampening flap-statistics"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -7415,7 +7298,7 @@ class ShowBgpAllDampeningFlapStatisticsSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 # ===================================================
 # Parser for 'show bgp all dampening flap-statistics'
@@ -7582,217 +7465,171 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
 
         etree_dict = {}
         sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
 
+        stream = XmlStream(out)
         # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-        if not vrf_root:
+        stream.check_command(self.cli_command)
+        # xml namespace
+        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
+        if not stream.namespace:
             return etree_dict
 
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
+        # The rd values precede the TABLE_prefix, so a ROW_rd is read when
+        # its first ROW_prefix ends, or when it ends if it has no prefix
+        rd_root = None
 
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_afi'.format(namespace))
+        # -----   loop rd and prefix  -----
+        for row in stream.rows('rd', 'prefix'):
+            if row.tag == 'ROW_prefix':
+                prefix_root, row = row, stream.parent('ROW_rd')
+            else:
+                prefix_root = None
 
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_afi'.format(namespace)):
+            if row is not rd_root:
+                rd_root = row
+                # vrf
+                try:
+                    vrf = stream.parent('ROW_vrf').find('vrf-name-out').text
+                except Exception:
+                    break
 
                 # address_family
-                row_safi = af_root.find('{}TABLE_safi'.format(namespace))
-                row_safi = row_safi.find('{}ROW_safi'.format(namespace))
-
                 try:
-                    af = row_safi.find('{}af-name'.format(namespace)).text.lower()
+                    af = stream.parent('ROW_safi').find('af-name').text.lower()
                 except Exception:
+                    sub_dict = None
                     continue
 
-                # rd table
-                rd = row_safi.find('{}TABLE_rd'.format(namespace))
-                if not rd:
-                    continue
-                else:
-                    if 'vrf' not in etree_dict:
-                        etree_dict['vrf'] = {}
-                    if vrf not in etree_dict['vrf']:
-                        etree_dict['vrf'][vrf] = {}
+                if 'vrf' not in etree_dict:
+                    etree_dict['vrf'] = {}
+                if vrf not in etree_dict['vrf']:
+                    etree_dict['vrf'][vrf] = {}
 
-                    if 'address_family' not in etree_dict['vrf'][vrf]:
-                        etree_dict['vrf'][vrf]['address_family'] = {}
-                    if af not in etree_dict['vrf'][vrf]['address_family']:
-                        etree_dict['vrf'][vrf]['address_family'][af] = {}
+                if 'address_family' not in etree_dict['vrf'][vrf]:
+                    etree_dict['vrf'][vrf]['address_family'] = {}
+                if af not in etree_dict['vrf'][vrf]['address_family']:
+                    etree_dict['vrf'][vrf]['address_family'][af] = {}
 
-                # -----   loop rd  -----
-                for rd_root in rd.findall('{}ROW_rd'.format(namespace)):
-                    # rd
+                # rd
+                try:
+                    rd = rd_root.find('rd_val').text
+                except Exception:
+                    rd = None
+
+                # <dampeningenabled>true</dampeningenabled>
+                try:
+                    dampeningenabled = rd_root.find('dampeningenabled').text
+                except Exception:
+                    # <dampening>true</dampening>
                     try:
-                        rd = rd_root.find('{}rd_val'.format(namespace)).text
+                        dampeningenabled = rd_root.find('dampening').text
                     except Exception:
-                        rd = None
+                        pass
 
+                # <historypaths>0</historypaths>
+                historypaths = int(rd_root.find('historypaths').text)
+                # <dampenedpaths>2</dampenedpaths>
+                dampenedpaths = int(rd_root.find('dampenedpaths').text)
+
+                if rd:
+                    # set default attributes under address family
                     # <dampeningenabled>true</dampeningenabled>
-                    try:
-                        dampeningenabled = rd_root.find('{}dampeningenabled'
-                                                        .format(namespace)).text
-                    except Exception:
-                        # <dampening>true</dampening>
-                        try:
-                            dampeningenabled = rd_root.find('{}dampening'
-                                                            .format(namespace)).text
-                        except Exception:
-                            pass
-                            
+                    if dampeningenabled == 'true':
+                        etree_dict['vrf'][vrf]['address_family'][af]['dampening_enabled'] = True
+
                     # <historypaths>0</historypaths>
-                    historypaths = int(rd_root.find('{}historypaths'
-                                                    .format(namespace)).text)
+                    etree_dict['vrf'][vrf]['address_family'][af]['history_paths'] = historypaths
+
                     # <dampenedpaths>2</dampenedpaths>
-                    dampenedpaths = int(rd_root.find('{}dampenedpaths'
-                                                     .format(namespace)).text)
+                    etree_dict['vrf'][vrf]['address_family'][af]['dampened_paths'] = dampenedpaths
 
-                    if rd:
-                        # set default attributes under address family 
-                        # <dampeningenabled>true</dampeningenabled>
-                        if dampeningenabled == 'true':
-                            etree_dict['vrf'][vrf]['address_family'][af]['dampening_enabled'] = True
+                    if 'route_identifier' not in etree_dict['vrf'][vrf]\
+                        ['address_family'][af]:
+                        etree_dict['vrf'][vrf]['address_family'][af]\
+                            ['route_identifier'] = {}
 
-                        # <historypaths>0</historypaths>
-                        etree_dict['vrf'][vrf]['address_family'][af]['history_paths'] = historypaths
-                        
-                        # <dampenedpaths>2</dampenedpaths>
-                        etree_dict['vrf'][vrf]['address_family'][af]['dampened_paths'] = dampenedpaths
+                    if rd not in etree_dict['vrf'][vrf]\
+                        ['address_family'][af]['route_identifier']:
+                        etree_dict['vrf'][vrf]['address_family'][af]\
+                            ['route_identifier'][rd] = {}
 
-                        if 'route_identifier' not in etree_dict['vrf'][vrf]\
-                            ['address_family'][af]:
-                            etree_dict['vrf'][vrf]['address_family'][af]\
-                                ['route_identifier'] = {}
+                    sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
+                        ['route_identifier'][rd]
+                else:
+                    sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
 
-                        if rd not in etree_dict['vrf'][vrf]\
-                            ['address_family'][af]['route_identifier']:
-                            etree_dict['vrf'][vrf]['address_family'][af]\
-                                ['route_identifier'][rd] = {}
+                # <dampeningenabled>true</dampeningenabled>
+                if dampeningenabled == 'true':
+                    sub_dict['dampening_enabled'] = True
 
-                        sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['route_identifier'][rd]
-                    else:
-                        sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
+                # <historypaths>0</historypaths>
+                sub_dict['history_paths'] = historypaths
 
-                    # <dampeningenabled>true</dampeningenabled>
-                    if dampeningenabled == 'true':
-                        sub_dict['dampening_enabled'] = True
+                # <dampenedpaths>2</dampenedpaths>
+                sub_dict['dampened_paths'] = dampenedpaths
 
-                    # <historypaths>0</historypaths>
-                    sub_dict['history_paths'] = historypaths
-
-                    # <dampenedpaths>2</dampenedpaths>
-                    sub_dict['dampened_paths'] = dampenedpaths
+            if prefix_root is None or sub_dict is None:
+                continue
 
-                    # prefix table
-                    prefix = rd_root.find('{}TABLE_prefix'.format(namespace))
-                    if not prefix:
-                        continue
+            # <ipprefix>10.25.1.0/24</ipprefix>
+            # ipv6prefix>2001::/112</ipv6prefix>
+            # <nonipprefix>[2]:[0]:[0]:[48]:[0201.02ff.0302]:[32]:[10.81.1.1]/248</nonipprefix>
+            for tag in ['ipprefix', 'ipv6prefix', 'nonipprefix']:
+                if prefix_root.find(tag) is not None:
+                    network = prefix_root.find(tag).text
 
-                    # -----   loop prefix  -----
-                    for prefix_root in prefix.findall('{}ROW_prefix'.format(namespace)):
+            if 'network' not in sub_dict:
+                sub_dict['network'] = {}
 
-                        # <ipprefix>10.25.1.0/24</ipprefix>
-                        try:
-                            network = prefix_root.find('{}ipprefix'.format(namespace)).text
-                        except Exception:
-                            pass
+            if network not in sub_dict['network']:
+                sub_dict['network'][network] = {}
 
-                        # ipv6prefix>2001::/112</ipv6prefix>
-                        try:
-                            network = prefix_root.find('{}ipv6prefix'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <status>d</status>
+            sub_dict['network'][network]['status'] = \
+                prefix_root.find('status').text
 
-                        # <nonipprefix>[2]:[0]:[0]:[48]:[0201.02ff.0302]:[32]:[10.81.1.1]/248</nonipprefix>
-                        try:
-                            network = prefix_root.find('{}nonipprefix'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'network' not in sub_dict:
-                            sub_dict['network'] = {}
+            # <pathtype>e</pathtype>
+            sub_dict['network'][network]['pathtype'] = \
+                prefix_root.find('pathtype').text
 
-                        if network not in sub_dict['network']:
-                            sub_dict['network'][network] = {}
+            # <peer>10.106.102.3</peer>
+            # <ipv6peer>2001:db8:8d82::2002</ipv6peer>
+            for tag in ['peer', 'ipv6peer']:
+                if prefix_root.find(tag) is not None:
+                    sub_dict['network'][network]['peer'] = \
+                        prefix_root.find(tag).text
 
-                        # <status>d</status>
-                        sub_dict['network'][network]['status'] = \
-                            prefix_root.find('{}status'.format(namespace)).text
+            # <flapcount>39</flapcount>
+            sub_dict['network'][network]['flaps'] = \
+                int(prefix_root.find('flapcount').text)
 
-                        # <pathtype>e</pathtype>
-                        sub_dict['network'][network]['pathtype'] = \
-                            prefix_root.find('{}pathtype'.format(namespace)).text
+            # <duration>00:09:53</duration>
+            sub_dict['network'][network]['duration'] = \
+                prefix_root.find('duration').text
 
-                        # <peer>10.106.102.3</peer>
-                        try:
-                            sub_dict['network'][network]['peer'] = \
-                                prefix_root.find('{}peer'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <reuse>00:01:40</reuse>
+            reuse = prefix_root.find('reuse').text
+            if reuse:
+                sub_dict['network'][network]['reuse_time'] = reuse
 
-                        # <ipv6peer>2001:db8:8d82::2002</ipv6peer>
-                        try:
-                            sub_dict['network'][network]['peer'] = \
-                                prefix_root.find('{}ipv6peer'.format(namespace)).text
-                        except Exception:
-                            pass
+            # <penalty>34</penalty>
+            penalty = prefix_root.find('penalty').text
+            if penalty:
+                sub_dict['network'][network]['current_penalty'] = int(penalty)
 
-                        # <flapcount>39</flapcount>
-                        sub_dict['network'][network]['flaps'] = \
-                            int(prefix_root.find('{}flapcount'.format(namespace)).text)
-                            
-                        # <duration>00:09:53</duration>
-                        sub_dict['network'][network]['duration'] = \
-                            prefix_root.find('{}duration'.format(namespace)).text
-                            
-                        # <reuse>00:01:40</reuse>
-                        reuse = prefix_root.find('{}reuse'.format(namespace)).text
-                        if reuse:
-                            sub_dict['network'][network]['reuse_time'] = reuse
-                            
-                            
-                        # <penalty>34</penalty>
-                        penalty = prefix_root.find('{}penalty'.format(namespace)).text
-                        if penalty:
-                            sub_dict['network'][network]['current_penalty'] = int(penalty)
-                            
-                        # <suppresslimit>30</suppresslimit>
-                        sub_dict['network'][network]['suppress_limit'] = \
-                            int(prefix_root.find('{}suppresslimit'.format(namespace)).text)
+            # <suppresslimit>30</suppresslimit>
+            sub_dict['network'][network]['suppress_limit'] = \
+                int(prefix_root.find('suppresslimit').text)
 
-                       # <reuselimit>10</reuselimit>
-                        sub_dict['network'][network]['reuse_limit'] = \
-                            int(prefix_root.find('{}reuselimit'.format(namespace)).text)
+            # <reuselimit>10</reuselimit>
+            sub_dict['network'][network]['reuse_limit'] = \
+                int(prefix_root.find('reuselimit').text)
 
-                       # <best>false</best>
-                        if prefix_root.find('{}best'.format(namespace)).text == 'false':
-                            sub_dict['network'][network]['best'] = False
-                        else:
-                            sub_dict['network'][network]['best'] = True                                                                                    
+            # <best>false</best>
+            if prefix_root.find('best').text == 'false':
+                sub_dict['network'][network]['best'] = False
+            else:
+                sub_dict['network'][network]['best'] = True
         return etree_dict
 
 
@@ -7824,54 +7661,47 @@ class ShowBgpAllNexthopDatabase(ShowBgpVrfAllAllNextHopDatabase):
 
         etree_dict = {}
         sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
 
+        stream = XmlStream(out)
         # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_nhvrf')
-        if not vrf_root:
+        stream.check_command(self.cli_command)
+        # xml namespace
+        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
+        if not stream.namespace:
             return etree_dict
 
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_nhvrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}nhvrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
+        # The vrf and address family values precede their tables, so a row
+        # is read when its first nested row ends, or when it ends
+        vrf_tree = None
+        safi_root = None
+
+        # -----   loop vrf, address_family and nexthop  -----
+        for row in stream.rows('nhvrf', 'nhsafi', 'nexthop'):
+            tree = row if row.tag == 'ROW_nhvrf' else stream.parent('ROW_nhvrf')
+            if tree is not vrf_tree:
+                vrf_tree = tree
+                # vrf
+                try:
+                    vrf = vrf_tree.find('nhvrf-name-out').text
+                except Exception:
+                    break
 
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_nhafi'.format(namespace))
+                if 'vrf' not in etree_dict:
+                    etree_dict['vrf'] = {}
+                if vrf not in etree_dict['vrf']:
+                    etree_dict['vrf'][vrf] = {}
 
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_nhafi'.format(namespace)):
+            if row.tag == 'ROW_nhvrf':
+                continue
 
+            af_root = row if row.tag == 'ROW_nhsafi' else stream.parent('ROW_nhsafi')
+            if af_root is not safi_root:
+                safi_root = af_root
                 # address_family
-                row_safi = af_root.find('{}TABLE_nhsafi'.format(namespace))
-                af_root = row_safi.find('{}ROW_nhsafi'.format(namespace))
                 try:
-                    af = af_root.find('{}af-name'.format(namespace)).text.lower()
+                    af = af_root.find('af-name').text.lower()
                 except Exception:
+                    af = None
                     continue
 
                 if 'address_family' not in etree_dict['vrf'][vrf]:
@@ -7885,164 +7715,108 @@ class ShowBgpAllNexthopDatabase(ShowBgpVrfAllAllNextHopDatabase):
 
                 # <nhnoncriticaldelay>10000</nhnoncriticaldelay>
                 etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_non_critical'] = int(af_root.find('{}nhnoncriticaldelay'
-                                                             .format(namespace)).text)
+                    ['nexthop_trigger_delay_non_critical'] = int(af_root.find('nhnoncriticaldelay').text)
                 # <nhcriticaldelay>3000</nhcriticaldelay>
                 etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_critical'] = int(af_root.find('{}nhcriticaldelay'
-                                                             .format(namespace)).text)
-
-                # nexthop table
-                next_hop = af_root.find('{}TABLE_nexthop'.format(namespace))
-                if not next_hop:
-                    continue
-
-                # -----   loop nexthop  -----
-                for nexthop_root in next_hop.findall('{}ROW_nexthop'.format(namespace)):
-                    # nexthop
-                    # <ipnexthop-out>192.168.154.1</ipnexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipnexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    # <ipv6nexthop-out>2001:db8:400::3:1</ipv6nexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipv6nexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    if 'next_hop' not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'] = {}
-
-                    if nexthop not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]['next_hop']:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'][nexthop] = {}
-
-                    sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                        ['next_hop'][nexthop]
-
-                    # <refcount>1</refcount>
-                    sub_dict['refcount'] = int(nexthop_root.find(
-                                                '{}refcount'.format(namespace)).text)
-
-                    # <igpmetric>3</igpmetric>
-                    sub_dict['igp_cost'] = \
-                        int(nexthop_root.find('{}igpmetric'.format(namespace)).text)
-
-                    # <multipath>false</multipath>
-                    try:
-                        if nexthop_root.find('{}multipath'.format(namespace)).text == 'false':
-                            sub_dict['multipath'] = 'No'
-                        else:
-                            sub_dict['multipath'] = 'Yes'
-                    except Exception:
-                        pass
-
-                    # <igptype>0</igptype>
-                    sub_dict['igp_route_type'] = \
-                        int(nexthop_root.find('{}igptype'.format(namespace)).text)
-
-                    # <igppref>110</igppref>
-                    sub_dict['igp_preference'] = \
-                        int(nexthop_root.find('{}igppref'.format(namespace)).text)
-
-                    # <attached>false</attached>
-                    if nexthop_root.find('{}attached'.format(namespace)).text == 'false':
-                        sub_dict['attached'] = False
-                    else:
-                        sub_dict['attached'] = True
+                    ['nexthop_trigger_delay_critical'] = int(af_root.find('nhcriticaldelay').text)
 
+            if row.tag == 'ROW_nhsafi' or af is None:
+                continue
+            nexthop_root = row
 
-                    # <local>false</local>
-                    if nexthop_root.find('{}local'.format(namespace)).text == 'false':
-                        sub_dict['local'] = False
-                    else:
-                        sub_dict['local'] = True
+            # nexthop
+            # <ipnexthop-out>192.168.154.1</ipnexthop-out>
+            # <ipv6nexthop-out>2001:db8:400::3:1</ipv6nexthop-out>
+            for tag in ['ipnexthop-out', 'ipv6nexthop-out']:
+                if nexthop_root.find(tag) is not None:
+                    nexthop = nexthop_root.find(tag).text
 
-                    # <reachable>true</reachable>
-                    if nexthop_root.find('{}reachable'.format(namespace)).text == 'false':
-                        sub_dict['reachable'] = False
-                    else:
-                        sub_dict['reachable'] = True
+            if 'next_hop' not in etree_dict['vrf'][vrf]\
+                ['address_family'][af]:
+                etree_dict['vrf'][vrf]['address_family'][af]\
+                    ['next_hop'] = {}
 
-                    # <labeled>true</labeled>
-                    if nexthop_root.find('{}labeled'.format(namespace)).text == 'false':
-                        sub_dict['labeled'] = False
-                    else:
-                        sub_dict['labeled'] = True
+            if nexthop not in etree_dict['vrf'][vrf]\
+                ['address_family'][af]['next_hop']:
+                etree_dict['vrf'][vrf]['address_family'][af]\
+                    ['next_hop'][nexthop] = {}
 
-                    # <filtered>false</filtered>
-                    if nexthop_root.find('{}filtered'.format(namespace)).text == 'false':
-                        sub_dict['filtered'] = False
-                    else:
-                        sub_dict['filtered'] = True
+            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
+                ['next_hop'][nexthop]
 
-                    # <pendingupdate>false</pendingupdate>
-                    if nexthop_root.find('{}pendingupdate'.format(namespace)).text == 'false':
-                        sub_dict['pending_update'] = False
-                    else:
-                        sub_dict['pending_update'] = True
+            # <refcount>1</refcount>
+            sub_dict['refcount'] = int(nexthop_root.find('refcount').text)
 
-                    # <resolvetime>18:38:21</resolvetime>
-                    sub_dict['resolve_time'] = \
-                        nexthop_root.find('{}resolvetime'.format(namespace)).text
+            # <igpmetric>3</igpmetric>
+            sub_dict['igp_cost'] = int(nexthop_root.find('igpmetric').text)
 
-                    # <ribroute>192.168.154.1/32</ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ribroute'.format(namespace)).text
-                    except Exception:
-                        pass                    
+            # <multipath>false</multipath>
+            try:
+                if nexthop_root.find('multipath').text == 'false':
+                    sub_dict['multipath'] = 'No'
+                else:
+                    sub_dict['multipath'] = 'Yes'
+            except Exception:
+                pass
 
-                    # <ipv6ribroute>0::/0</ipv6ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ipv6ribroute'.format(namespace)).text
-                    except Exception:
-                        pass
+            # <igptype>0</igptype>
+            sub_dict['igp_route_type'] = int(nexthop_root.find('igptype').text)
+
+            # <igppref>110</igppref>
+            sub_dict['igp_preference'] = int(nexthop_root.find('igppref').text)
+
+            # <attached>false</attached>
+            # <local>false</local>
+            # <reachable>true</reachable>
+            # <labeled>true</labeled>
+            # <filtered>false</filtered>
+            # <pendingupdate>false</pendingupdate>
+            for key, tag in [('attached', 'attached'),
+                             ('local', 'local'),
+                             ('reachable', 'reachable'),
+                             ('labeled', 'labeled'),
+                             ('filtered', 'filtered'),
+                             ('pending_update', 'pendingupdate')]:
+                if nexthop_root.find(tag).text == 'false':
+                    sub_dict[key] = False
+                else:
+                    sub_dict[key] = True
 
-                    # <nextadvertise>Never</nextadvertise>
-                    sub_dict['metric_next_advertise'] = \
-                        nexthop_root.find('{}nextadvertise'.format(namespace)).text.lower()
+            # <resolvetime>18:38:21</resolvetime>
+            sub_dict['resolve_time'] = nexthop_root.find('resolvetime').text
 
-                    # <rnhepoch>1</rnhepoch>
-                    sub_dict['rnh_epoch'] = \
-                        int(nexthop_root.find('{}rnhepoch'.format(namespace)).text)
+            # <ribroute>192.168.154.1/32</ribroute>
+            # <ipv6ribroute>0::/0</ipv6ribroute>
+            for tag in ['ribroute', 'ipv6ribroute']:
+                if nexthop_root.find(tag) is not None:
+                    sub_dict['rib_route'] = nexthop_root.find(tag).text
 
+            # <nextadvertise>Never</nextadvertise>
+            sub_dict['metric_next_advertise'] = \
+                nexthop_root.find('nextadvertise').text.lower()
 
-                    # attachedhops table
-                    attached = nexthop_root.find('{}TABLE_attachedhops'.format(namespace))
-                    if not attached:
-                        continue
+            # <rnhepoch>1</rnhepoch>
+            sub_dict['rnh_epoch'] = int(nexthop_root.find('rnhepoch').text)
 
-                    # -----   loop attachedhops  -----
-                    for attach_root in attached.findall('{}ROW_attachedhops'.format(namespace)):
+            # -----   loop attachedhops  -----
+            for attach_root in nexthop_root.iterfind(
+                    'TABLE_attachedhops/ROW_attachedhops'):
 
-                        # <attachedhop>192.168.66.2</attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
+                # <attachedhop>192.168.66.2</attachedhop>
+                # <ipv6attachedhop>fe80::6e9c:edff:fe4d:ff41</ipv6attachedhop>
+                for tag in ['attachedhop', 'ipv6attachedhop']:
+                    if attach_root.find(tag) is not None:
+                        att_hop = attach_root.find(tag).text
 
-                        # <ipv6attachedhop>fe80::6e9c:edff:fe4d:ff41</ipv6attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}ipv6attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'attached_nexthop' not in sub_dict:
-                            sub_dict['attached_nexthop'] = {}
+                if 'attached_nexthop' not in sub_dict:
+                    sub_dict['attached_nexthop'] = {}
 
-                        if att_hop not in sub_dict['attached_nexthop']:
-                            sub_dict['attached_nexthop'][att_hop] = {}
+                if att_hop not in sub_dict['attached_nexthop']:
+                    sub_dict['attached_nexthop'][att_hop] = {}
 
-                        # <interface>port-channel2.100</interface>
-                        sub_dict['attached_nexthop'][att_hop]['attached_nexthop_interface'] = \
-                            attach_root.find('{}interface'.format(namespace)).text                                                                                                          
+                # <interface>port-channel2.100</interface>
+                sub_dict['attached_nexthop'][att_hop]['attached_nexthop_interface'] = \
+                    attach_root.find('interface').text
         return etree_dict
 
 
@@ -8052,7 +7826,7 @@ class ShowBgpAllNexthopDatabase(ShowBgpVrfAllAllNextHopDatabase):
 class ShowBgpPeerTemplateCmdSchema(MetaParser):
     """Schema for show bgp peer-template"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'template': {
             Any(): {
                 Optional('source_interface'): str,
@@ -8107,7 +7881,7 @@ class ShowBgpPeerTemplateCmdSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 # ===================================
 # Parser for 'show bgp peer-template'
@@ -8421,34 +8195,19 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
         etree_dict = {}
         sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
+        stream = XmlStream(out)
         # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_neighbor')
-        if not root:
+        stream.check_command(self.cli_command)
+        # xml namespace
+        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
+        if not stream.namespace:
             return etree_dict
 
-        # -----   loop vrf  -----
-        for peer_tree in root.findall('{}ROW_neighbor'.format(namespace)):
+        # -----   loop template  -----
+        for peer_tree in stream.rows('neighbor'):
             # vrf
             try:
-                template = peer_tree.find('{}templatepeer'.format(namespace)).text
+                template = peer_tree.find('templatepeer').text
             except Exception:
                 break
 
@@ -8460,13 +8219,13 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
             # <sourceif>loopback1</sourceif>
             try:
                 etree_dict['template'][template]['source_interface'] = \
-                    peer_tree.find('{}sourceif'.format(namespace)).text
+                    peer_tree.find('sourceif').text
             except Exception:
                 pass
 
             # <lowmemexempt>true</lowmemexempt>
             try:
-                if peer_tree.find('{}lowmemexempt'.format(namespace)).text == 'true':
+                if peer_tree.find('lowmemexempt').text == 'true':
                     etree_dict['template'][template]['low_mem_exempt'] = True
                 else:
                     etree_dict['template'][template]['low_mem_exempt'] = False
@@ -8474,25 +8233,25 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 pass
 
             # <ttlsecurity>false</ttlsecurity>
-            if peer_tree.find('{}ttlsecurity'.format(namespace)).text == 'true':
+            if peer_tree.find('ttlsecurity').text == 'true':
                 etree_dict['template'][template]['logging_neighbor_events'] = True
             else:
                 etree_dict['template'][template]['logging_neighbor_events'] = False
 
             # <passiveonly>true</passiveonly>
-            if peer_tree.find('{}passiveonly'.format(namespace)).text == 'true':
+            if peer_tree.find('passiveonly').text == 'true':
                 etree_dict['template'][template]['passive_only'] = True
             else:
                 etree_dict['template'][template]['passive_only'] = False
 
             # <localas-inactive>false</localas-inactive>
-            if peer_tree.find('{}localas-inactive'.format(namespace)).text == 'true':
+            if peer_tree.find('localas-inactive').text == 'true':
                 etree_dict['template'][template]['local_as_inactive'] = True
             else:
                 etree_dict['template'][template]['local_as_inactive'] = False
 
             # <remove-privateas>false</remove-privateas>
-            if peer_tree.find('{}remove-privateas'.format(namespace)).text == 'true':
+            if peer_tree.find('remove-privateas').text == 'true':
                 etree_dict['template'][template]['remove_private_as'] = True
             else:
                 etree_dict['template'][template]['remove_private_as'] = False
@@ -8500,34 +8259,32 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
             # <ttllimit>100</ttllimit>
             try:
                 etree_dict['template'][template]['external_bgp_peer_hops_limit'] = \
-                    int(peer_tree.find('{}ttllimit'.format(namespace)).text)
+                    int(peer_tree.find('ttllimit').text)
             except Exception:
                 pass
 
              # vrf table
-            vrf_tree = peer_tree.find('{}TABLE_vrf'.format(namespace))
+            vrf_tree = peer_tree.find('TABLE_vrf')
             if vrf_tree:
                 # -----   loop vrf  -----
-                for vrf_root in vrf_tree.findall('{}ROW_vrf'.format(namespace)):
+                for vrf_root in vrf_tree.findall('ROW_vrf'):
                     # <vrf-name>default</vrf-name>
                     try:
-                        vrf = vrf_root.find('{}vrf-name'.format(namespace)).text.lower()
+                        vrf = vrf_root.find('vrf-name').text.lower()
                     except Exception:
                         continue
 
                     # inheritingpeer table
-                    inherit_tree = vrf_root.find('{}TABLE_inheritingpeer'.format(namespace))
+                    inherit_tree = vrf_root.find('TABLE_inheritingpeer')
                     if not inherit_tree:
                         continue
 
                     # -----   loop inheritingpeer  -----
-                    for inherit_root in inherit_tree.findall('{}ROW_inheritingpeer'
-                                                             .format(namespace)):
+                    for inherit_root in inherit_tree.findall('ROW_inheritingpeer'):
 
                         # <inheritingpeer>10.186.201.1</inheritingpeer>
                         try:
-                            inherit_peer = inherit_root.find('{}inheritingpeer'
-                                                             .format(namespace)).text.lower()
+                            inherit_peer = inherit_root.find('inheritingpeer').text.lower()
                         except Exception:
                             continue
                         if 'vrf' not in etree_dict['template'][template]:
@@ -8550,16 +8307,16 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
 
             # address_family table
-            afi = peer_tree.find('{}TABLE_peraf'.format(namespace))
+            afi = peer_tree.find('TABLE_peraf')
 
             # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_peraf'.format(namespace)):
+            for af_root in afi.findall('ROW_peraf'):
 
                 try:
                     # address_family
-                    row_safi = af_root.find('{}TABLE_persaf'.format(namespace))
-                    af_root = row_safi.find('{}ROW_persaf'.format(namespace))
-                    af = af_root.find('{}per-af-name'.format(namespace)).text.lower()
+                    row_safi = af_root.find('TABLE_persaf')
+                    af_root = row_safi.find('ROW_persaf')
+                    af = af_root.find('per-af-name').text.lower()
                 except Exception:
                     continue
 
@@ -8573,27 +8330,27 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 # <conditionmap>DENY_ALL_RM</conditionmap>
                 try:
                     sub_dict['condition_map'] = \
-                        af_root.find('{}conditionmap'.format(namespace)).text
+                        af_root.find('conditionmap').text
                 except Exception:
                     pass
 
                 # <advertisemap>BLOCK-ALL</advertisemap>
                 try:
                     sub_dict['advertise_map'] = \
-                        af_root.find('{}advertisemap'.format(namespace)).text
+                        af_root.find('advertisemap').text
                 except Exception:
                     pass
 
                 # <advertisemapstatus>Advertise</advertisemapstatus>
                 try:
                     sub_dict['advertise_map_status'] = \
-                        af_root.find('{}advertisemapstatus'.format(namespace)).text.lower()
+                        af_root.find('advertisemapstatus').text.lower()
                 except Exception:
                     pass
 
                 try:
                     # <insoftreconfigallowed>false</insoftreconfigallowed>
-                    if af_root.find('{}insoftreconfigallowed'.format(namespace)).text == 'true':
+                    if af_root.find('insoftreconfigallowed').text == 'true':
                         sub_dict['in_soft_reconfig_allowed'] = True
                     else:
                         sub_dict['in_soft_reconfig_allowed'] = False
@@ -8602,7 +8359,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
                 # <sendcommunity>true</sendcommunity>
                 try:
-                    if af_root.find('{}sendcommunity'.format(namespace)).text == 'true':
+                    if af_root.find('sendcommunity').text == 'true':
                         sub_dict['send_community'] = True
                     else:
                         sub_dict['send_community'] = False
@@ -8611,7 +8368,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
                 # <sendextcommunity>true</sendextcommunity>
                 try:
-                    if af_root.find('{}sendextcommunity'.format(namespace)).text == 'true':
+                    if af_root.find('sendextcommunity').text == 'true':
                         sub_dict['send_ext_community'] = True
                     else:
                         sub_dict['send_ext_community'] = False
@@ -8620,7 +8377,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
                 # <thirdpartynexthop>false</thirdpartynexthop>
                 try:
-                    if af_root.find('{}thirdpartynexthop'.format(namespace)).text == 'true':
+                    if af_root.find('thirdpartynexthop').text == 'true':
                         sub_dict['third_party_nexthop'] = True
                     else:
                         sub_dict['third_party_nexthop'] = False
@@ -8629,7 +8386,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
                 # <asoverride>true</asoverride>
                 try:
-                    if af_root.find('{}asoverride'.format(namespace)).text == 'true':
+                    if af_root.find('asoverride').text == 'true':
                         sub_dict['as_override'] = True
                     else:
                         sub_dict['as_override'] = False
@@ -8638,7 +8395,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
                 # <peerascheckdisabled>false</peerascheckdisabled>
                 try:
-                    if af_root.find('{}peerascheckdisabled'.format(namespace)).text == 'true':
+                    if af_root.find('peerascheckdisabled').text == 'true':
                         sub_dict['peer_as_check_disabled'] = True
                     else:
                         sub_dict['peer_as_check_disabled'] = False
@@ -8647,7 +8404,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
                 # <rrconfigured>false</rrconfigured>
                 try:
-                    if af_root.find('{}rrconfigured'.format(namespace)).text == 'true':
+                    if af_root.find('rrconfigured').text == 'true':
                         sub_dict['rr_configured'] = True
                     else:
                         sub_dict['rr_configured'] = False
@@ -8657,41 +8414,41 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 # <localnexthop>0.0.0.0</localnexthop>
                 try:
                     sub_dict['local_nexthop'] = \
-                        af_root.find('{}localnexthop'.format(namespace)).text
+                        af_root.find('localnexthop').text
                 except Exception:
                     pass
 
                 # <maxpfx>888888888</maxpfx>
                 try:
                     sub_dict['max_pfx'] = \
-                        int(af_root.find('{}maxpfx'.format(namespace)).text)
+                        int(af_root.find('maxpfx').text)
                 except Exception:
                     pass
 
                 # <soo>SOO:10.4.1.1:100</soo>
                 try:
                     sub_dict['soo'] = \
-                        af_root.find('{}soo'.format(namespace)).text
+                        af_root.find('soo').text
                 except Exception:
                     pass
 
                 # <weight>9999</weight>
                 try:
                     sub_dict['weight'] = \
-                        int(af_root.find('{}weight'.format(namespace)).text)
+                        int(af_root.find('weight').text)
                 except Exception:
                     pass
 
                 # <allowasin>10</allowasin>
                 try:
                     sub_dict['allow_as_in'] = \
-                        int(af_root.find('{}allowasin'.format(namespace)).text)
+                        int(af_root.find('allowasin').text)
                 except Exception:
                     pass
 
                 # <defaultoriginate>true</defaultoriginate>
                 try:
-                    if af_root.find('{}defaultoriginate'.format(namespace)).text == 'true':
+                    if af_root.find('defaultoriginate').text == 'true':
                         sub_dict['default_originate'] = True
                     else:
                         sub_dict['default_originate'] = False
@@ -8701,26 +8458,26 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 # <defaultoriginatermap>PASS-ALL</defaultoriginatermap>
                 try:
                     sub_dict['default_originate_route_map'] = \
-                        af_root.find('{}defaultoriginatermap'.format(namespace)).text
+                        af_root.find('defaultoriginatermap').text
                 except Exception:
                     pass
 
                 # <unsuppress-map>ORIGINATE_IPV6</unsuppress-map>
                 try:
                     sub_dict['unsuppress_map'] = \
-                        af_root.find('{}unsuppress-map'.format(namespace)).text
+                        af_root.find('unsuppress-map').text
                 except Exception:
                     pass
                 
 
                 # TABLE_inpolicy table
-                policy = af_root.find('{}TABLE_inpolicy'.format(namespace))
+                policy = af_root.find('TABLE_inpolicy')
 
                 if policy:
                     # -----   loop in policy  -----
-                    for policy_root in policy.findall('{}ROW_inpolicy'.format(namespace)):
+                    for policy_root in policy.findall('ROW_inpolicy'):
                         try:
-                            policy = policy_root.find('{}inpolicyname'.format(namespace)).text
+                            policy = policy_root.find('inpolicyname').text
                         except Exception:
                             continue
 
@@ -8733,16 +8490,16 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
                         # <inpolicytype>route-map</inpolicytype>
                         sub_dict['in_policy'][policy]['type'] = \
-                            policy_root.find('{}inpolicytype'.format(namespace)).text
+                            policy_root.find('inpolicytype').text
 
                 # TABLE_outpolicy table
-                policy = af_root.find('{}TABLE_outpolicy'.format(namespace))
+                policy = af_root.find('TABLE_outpolicy')
 
                 if policy:
                     # -----   loop in policy  -----
-                    for policy_root in policy.findall('{}ROW_outpolicy'.format(namespace)):
+                    for policy_root in policy.findall('ROW_outpolicy'):
                         try:
-                            policy = policy_root.find('{}outpolicyname'.format(namespace)).text
+                            policy = policy_root.find('outpolicyname').text
                         except Exception:
                             continue
                         if 'out_policy' not in sub_dict:
@@ -8754,7 +8511,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
                         # <outpolicytype>route-map</outpolicytype>
                         sub_dict['out_policy'][policy]['type'] = \
-                            policy_root.find('{}outpolicytype'.format(namespace)).text
+                            policy_root.find('outpolicytype').text
 
                                                                                                                          
         return etree_dict
@@ -8773,7 +8530,7 @@ class ShowBgpPolicyStatisticsSchema(MetaParser):
        show bgp [vrf <vrf>] <address_family>  policy statistics neighbor <neighbor>
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('rpm_handle_count'): int,
@@ -8794,7 +8551,7 @@ class ShowBgpPolicyStatisticsSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 # ==============================================================================
 # Parser for:
@@ -8950,157 +8707,129 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
         out = self.device.execute('{cmd} | xml'.format(cmd=cmd))
 
         etree_dict = {}
-        neighbor = None
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
+
+        stream = XmlStream(out)
+        # compare cli command
+        stream.check_command(cmd)
+        # xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
+        if not stream.namespace:
             return etree_dict
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cmd)
+        # The vrf values precede the TABLE_rmap, so a ROW_vrf is read when
+        # its first ROW_rmap ends, or when it ends if it has no route map
+        vrf_tree = None
 
-        # get neighbor
-        nei = Common.retrieve_xml_child(root=root, key='__XML__PARAM__neighbor-id')
+        # -----   loop vrf and route_map  -----
+        for row in stream.rows('vrf', 'rmap'):
+            tree = row if row.tag == 'ROW_vrf' else stream.parent('ROW_vrf')
+            if tree is not vrf_tree:
+                vrf_tree = tree
+                # vrf
+                try:
+                    vrf = vrf_tree.find('vrf-name-polstats').text
+                except Exception:
+                    break
 
-        if hasattr(nei, 'tag'):
-            for item in nei.getchildren():
-                if '__XML__value' in item.tag:
-                    neighbor = item.text
-                    continue
+                if 'vrf' not in etree_dict:
+                    etree_dict['vrf'] = {}
+                if vrf not in etree_dict['vrf']:
+                    etree_dict['vrf'][vrf] = {}
 
-                # cover the senario that __readonly__ may be mssing when
-                # there are values in the output
-                if '__readonly__' in item.tag:
-                    root = item.getchildren()[0]
-                else:
-                    root = item
-        else:
-            # top table rootl
-            root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
+                # <rpm-handle-count>1</rpm-handle-count>
+                etree_dict['vrf'][vrf]['rpm_handle_count'] = \
+                    int(vrf_tree.find('rpm-handle-count').text)
 
-        if not root:
-            return etree_dict
+            if row.tag == 'ROW_vrf':
+                continue
+            rmp_root = row
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
+            # route map
             try:
-                vrf = vrf_tree.find('{}vrf-name-polstats'.format(namespace)).text
+                name = rmp_root.find('name').text
+                name = name.replace('&gt;', '>')
             except Exception:
-                break
+                continue
 
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
+            if 'route_map' not in etree_dict['vrf'][vrf]:
+                etree_dict['vrf'][vrf]['route_map'] = {}
 
-            # <rpm-handle-count>1</rpm-handle-count>
-            etree_dict['vrf'][vrf]['rpm_handle_count'] = \
-                int(vrf_tree.find('{}rpm-handle-count'.format(namespace)).text)
+            if name not in etree_dict['vrf'][vrf]['route_map']:
+                etree_dict['vrf'][vrf]['route_map'][name] = {}
+                # initial index
+                index = 1
+            else:
+                index += 1
+                
+            if index not in etree_dict['vrf'][vrf]['route_map'][name]:
+                etree_dict['vrf'][vrf]['route_map'][name][index] = {}
 
-             # route_map table
-            rpm_tree = vrf_tree.find('{}TABLE_rmap'.format(namespace))
-            if not rpm_tree:
-                continue
 
-            # -----   loop route_map  -----
-            for rmp_root in rpm_tree.findall('{}ROW_rmap'.format(namespace)):
-                # route map
-                try:
-                    name = rmp_root.find('{}name'.format(namespace)).text
-                    name = name.replace('&gt;', '>')
-                except Exception:
-                    continue
+            # <action>deny</action>
+            try:
+                etree_dict['vrf'][vrf]['route_map'][name][index]['action'] = \
+                    rmp_root.find('action').text
+            except Exception:
+                pass
 
-                if 'route_map' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['route_map'] = {}
+            # <seqnum>10</seqnum>
+            try:
+                etree_dict['vrf'][vrf]['route_map'][name][index]['seq_num'] = \
+                    int(rmp_root.find('seqnum').text)
+            except Exception:
+                pass
 
-                if name not in etree_dict['vrf'][vrf]['route_map']:
-                    etree_dict['vrf'][vrf]['route_map'][name] = {}
-                    # initial index
-                    index = 1
-                else:
-                    index += 1
-                    
-                if index not in etree_dict['vrf'][vrf]['route_map'][name]:
-                    etree_dict['vrf'][vrf]['route_map'][name][index] = {}
+            # <totalacceptcount>0</totalacceptcount>
+            try:
+                etree_dict['vrf'][vrf]['route_map'][name][index]['total_accept_count'] = \
+                    int(rmp_root.find('totalacceptcount').text)
+            except Exception:
+                pass
 
+            # <totalrejectcount>2</totalrejectcount>
+            try:
+                etree_dict['vrf'][vrf]['route_map'][name][index]['total_reject_count'] = \
+                    int(rmp_root.find('totalrejectcount').text)
+            except Exception:
+                pass
 
-                # <action>deny</action>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['action'] = \
-                        rmp_root.find('{}action'.format(namespace)).text
-                except Exception:
-                    pass
 
-                # <seqnum>10</seqnum>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['seq_num'] = \
-                        int(rmp_root.find('{}seqnum'.format(namespace)).text)
-                except Exception:
-                    pass
+            # TABLE_cmd table
+            command = rmp_root.find('TABLE_cmd')
 
-                # <totalacceptcount>0</totalacceptcount>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['total_accept_count'] = \
-                        int(rmp_root.find('{}totalacceptcount'.format(namespace)).text)
-                except Exception:
-                    pass
+            if not command:
+                continue
 
-                # <totalrejectcount>2</totalrejectcount>
+            # -----   loop command  -----
+            for command_root in command.findall('ROW_cmd'):
                 try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['total_reject_count'] = \
-                        int(rmp_root.find('{}totalrejectcount'.format(namespace)).text)
+                    cmd_str = command_root.find('command').text.strip()
+                    cmd_str = cmd_str.replace('&gt;', '>')
                 except Exception:
-                    pass
-
-
-                # TABLE_cmd table
-                command = rmp_root.find('{}TABLE_cmd'.format(namespace))
-
-                if not command:
                     continue
 
-                # -----   loop command  -----
-                for command_root in command.findall('{}ROW_cmd'.format(namespace)):
-                    try:
-                        cmd_str = command_root.find('{}command'.format(namespace)).text.strip()
-                        cmd_str = cmd_str.replace('&gt;', '>')
-                    except Exception:
-                        continue
+                if 'command' not in etree_dict['vrf'][vrf]['route_map'][name][index]:
+                    etree_dict['vrf'][vrf]['route_map'][name][index]['command'] = {}
 
-                    if 'command' not in etree_dict['vrf'][vrf]['route_map'][name][index]:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]['command'] = {}
+                # command
+                etree_dict['vrf'][vrf]['route_map'][name][index]\
+                    ['command']['command'] = cmd_str
 
-                    # command
+                # <comparecount>2</comparecount>
+                try:
                     etree_dict['vrf'][vrf]['route_map'][name][index]\
-                        ['command']['command'] = cmd_str
-
-                    # <comparecount>2</comparecount>
-                    try:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]\
-                            ['command']['compare_count'] = \
-                                int(command_root.find('{}comparecount'.format(namespace)).text)
-                    except Exception:
-                        pass
-                    
-                    # <matchcount>0</matchcount>
-                    try:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]\
-                            ['command']['match_count'] = \
-                                int(command_root.find('{}matchcount'.format(namespace)).text)
-                    except Exception:
-                        pass
+                        ['command']['compare_count'] = \
+                            int(command_root.find('comparecount').text)
+                except Exception:
+                    pass
+                
+                # <matchcount>0</matchcount>
+                try:
+                    etree_dict['vrf'][vrf]['route_map'][name][index]\
+                        ['command']['match_count'] = \
+                            int(command_root.find('matchcount').text)
+                except Exception:
+                    pass
         return etree_dict
 
 # ===============================================================================
@@ -9212,7 +8941,7 @@ class ShowBgpSessionsSchema(MetaParser):
        show bgp sessions vrf <WROD>
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'total_peers': int,
         'total_established_peers': int,
         'local_as': int,
@@ -9238,7 +8967,7 @@ class ShowBgpSessionsSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 # =========================================
 # Parser for 'show bgp sessions vrf <WORD>'
@@ -9386,184 +9115,167 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
 
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
+        stream = XmlStream(out)
+        # compare cli command
+        stream.check_command(cli_cmd)
+        # xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
+        if not stream.namespace:
             return etree_dict
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
-
-        ret = Common.retrieve_xml_child(
-                root=root,
-                key='__readonly__')
+        # The vrf values precede the TABLE_neighbor, so a ROW_vrf is read
+        # when its first ROW_neighbor ends, or when it ends if it has no
+        # neighbor. The totals are read when __readonly__ ends.
+        vrf_tree = None
 
-        if hasattr(ret, 'tag'):
-            # get total_peers                
-            try:
-                total_peers = ret.find('{}totalpeers'.format(namespace)).text
-                etree_dict['total_peers'] = int(total_peers)
-            except Exception:
-                pass
+        # -----   loop vrf and neighbors  -----
+        for row in stream.iter('__readonly__', 'ROW_vrf', 'ROW_neighbor'):
+            if row.tag == '__readonly__':
+                ret = row
+                # get total_peers
+                try:
+                    total_peers = ret.find('totalpeers').text
+                    etree_dict['total_peers'] = int(total_peers)
+                except Exception:
+                    pass
 
-            # get total_established_peers            
-            try:
-                total_established_peers = ret.find(
-                    '{}totalestablishedpeers'.format(namespace)).text
-                etree_dict['total_established_peers'] = int(total_established_peers)
-            except Exception:
-                pass
+                # get total_established_peers
+                try:
+                    total_established_peers = ret.find(
+                        'totalestablishedpeers').text
+                    etree_dict['total_established_peers'] = int(total_established_peers)
+                except Exception:
+                    pass
 
-            # get local_as               
-            try:
-                local_as = ret.find('{}localas'.format(namespace)).text
-                etree_dict['local_as'] = int(local_as)
-            except Exception:
-                pass
+                # get local_as
+                try:
+                    local_as = ret.find('localas').text
+                    etree_dict['local_as'] = int(local_as)
+                except Exception:
+                    pass
+                continue
 
-        else:
-            # output is empty
-            return etree_dict
+            tree = row if row.tag == 'ROW_vrf' else stream.parent('ROW_vrf')
+            if tree is not vrf_tree:
+                vrf_tree = tree
+                # vrf
+                try:
+                    vrf = vrf_tree.find('vrf-name-out').text
+                except Exception:
+                    break
 
-        # find Vrf root
-        root = ret.find('{}TABLE_vrf'.format(namespace))
+                if 'vrf' not in etree_dict:
+                    etree_dict['vrf'] = {}
+                if vrf not in etree_dict['vrf']:
+                    etree_dict['vrf'][vrf] = {}
 
-        if not root:
-            return etree_dict
+                # <local-as>333</local-as>
+                etree_dict['vrf'][vrf]['local_as'] = \
+                    int(vrf_tree.find('local-as').text)
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
+                # <vrfpeers>3</vrfpeers>
+                etree_dict['vrf'][vrf]['vrf_peers'] = \
+                    int(vrf_tree.find('vrfpeers').text)
 
-            # <local-as>333</local-as>
-            etree_dict['vrf'][vrf]['local_as'] = \
-                int(vrf_tree.find('{}local-as'.format(namespace)).text)
+                # <vrfestablishedpeers>2</vrfestablishedpeers>
+                etree_dict['vrf'][vrf]['vrf_established_peers'] = \
+                    int(vrf_tree.find('vrfestablishedpeers').text)
 
-            # <vrfpeers>3</vrfpeers>
-            etree_dict['vrf'][vrf]['vrf_peers'] = \
-                int(vrf_tree.find('{}vrfpeers'.format(namespace)).text)
+                # <router-id>10.106.0.6</router-id>
+                etree_dict['vrf'][vrf]['router_id'] = \
+                    vrf_tree.find('router-id').text
 
-            # <vrfestablishedpeers>2</vrfestablishedpeers>
-            etree_dict['vrf'][vrf]['vrf_established_peers'] = \
-                int(vrf_tree.find('{}vrfestablishedpeers'.format(namespace)).text)
-                
-            # <router-id>10.106.0.6</router-id>
-            etree_dict['vrf'][vrf]['router_id'] = \
-                vrf_tree.find('{}router-id'.format(namespace)).text
-                
-             # Neighbor table
-            nei_tree = vrf_tree.find('{}TABLE_neighbor'.format(namespace))
-            if not nei_tree:
+            if row.tag == 'ROW_vrf':
                 continue
+            nei_root = row
 
-            # -----   loop neighbors  -----
-            for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                # neighbor
-                try:
-                    nei = nei_root.find('{}neighbor-id'.format(namespace)).text
-                except Exception:
-                    continue
+            # neighbor
+            try:
+                nei = nei_root.find('neighbor-id').text
+            except Exception:
+                continue
 
-                if 'neighbor' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['neighbor'] = {}
+            if 'neighbor' not in etree_dict['vrf'][vrf]:
+                etree_dict['vrf'][vrf]['neighbor'] = {}
 
-                if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                    etree_dict['vrf'][vrf]['neighbor'][nei] = {}
+            if nei not in etree_dict['vrf'][vrf]['neighbor']:
+                etree_dict['vrf'][vrf]['neighbor'][nei] = {}
 
-                # <connectionsdropped>0</connectionsdropped>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['connections_dropped'] = \
-                        int(nei_root.find('{}connectionsdropped'.format(namespace)).text)
-                except Exception:
-                    pass
+            # <connectionsdropped>0</connectionsdropped>
+            try:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['connections_dropped'] = \
+                    int(nei_root.find('connectionsdropped').text)
+            except Exception:
+                pass
 
-                # <remoteas>333</remoteas>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['remote_as'] = \
-                        int(nei_root.find('{}remoteas'.format(namespace)).text)
-                except Exception:
-                    pass
+            # <remoteas>333</remoteas>
+            try:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['remote_as'] = \
+                    int(nei_root.find('remoteas').text)
+            except Exception:
+                pass
 
-                # <lastflap>PT1H4M41S</lastflap>
-                try:
-                    ret = nei_root.find('{}lastflap'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = 'never'
-                    
-                # <lastread>PT47S</lastread>
-                try:
-                    ret = nei_root.find('{}lastread'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = 'never'
-                    
-                # <lastwrite>PT15S</lastwrite>
-                try:
-                    ret = nei_root.find('{}lastwrite'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = 'never'
-                    
-                # <state>Established</state>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['state'] = \
-                        nei_root.find('{}state'.format(namespace)).text.lower()
-                except Exception:
-                    pass
-                    
-                # <localport>179</localport>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['local_port'] = \
-                        int(nei_root.find('{}localport'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <remoteport>48392</remoteport>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['remote_port'] = \
-                        int(nei_root.find('{}remoteport'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <notificationssent>0</notificationssent>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_sent'] = \
-                        int(nei_root.find('{}notificationssent'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <notificationsreceived>0</notificationsreceived>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_received'] = \
-                        int(nei_root.find('{}notificationsreceived'.format(namespace)).text)
-                except Exception:
-                    pass                    
+            # <lastflap>PT1H4M41S</lastflap>
+            try:
+                ret = nei_root.find('lastflap').text
+                ret = Common.convert_xml_time(ret)
+                etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = \
+                    'never' if 'P' in ret else ret
+            except Exception:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = 'never'
+                
+            # <lastread>PT47S</lastread>
+            try:
+                ret = nei_root.find('lastread').text
+                ret = Common.convert_xml_time(ret)
+                etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = \
+                    'never' if 'P' in ret else ret
+            except Exception:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = 'never'
+                
+            # <lastwrite>PT15S</lastwrite>
+            try:
+                ret = nei_root.find('lastwrite').text
+                ret = Common.convert_xml_time(ret)
+                etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = \
+                    'never' if 'P' in ret else ret
+            except Exception:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = 'never'
+                
+            # <state>Established</state>
+            try:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['state'] = \
+                    nei_root.find('state').text.lower()
+            except Exception:
+                pass
+                
+            # <localport>179</localport>
+            try:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['local_port'] = \
+                    int(nei_root.find('localport').text)
+            except Exception:
+                pass
+                
+            # <remoteport>48392</remoteport>
+            try:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['remote_port'] = \
+                    int(nei_root.find('remoteport').text)
+            except Exception:
+                pass
+                
+            # <notificationssent>0</notificationssent>
+            try:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_sent'] = \
+                    int(nei_root.find('notificationssent').text)
+            except Exception:
+                pass
+                
+            # <notificationsreceived>0</notificationsreceived>
+            try:
+                etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_received'] = \
+                    int(nei_root.find('notificationsreceived').text)
+            except Exception:
+                pass                    
 
         return etree_dict
 
@@ -9577,7 +9289,7 @@ class ShowBgpLabelsSchema(MetaParser):
        show bgp <address_family> labels vrf <WROD>
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -9631,7 +9343,7 @@ class ShowBgpLabelsSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 # ========================================================
 # Parser for 'show bgp <address_family> labels vrf <WORD>'
@@ -9842,221 +9554,199 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
 
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
+        stream = XmlStream(out)
+        # compare cli command
+        stream.check_command(cli_cmd)
+        # xml namespace
         # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
+        if not stream.namespace:
             return etree_dict
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
+        # The address family and rd values precede their tables, so a row is
+        # read when its first nested row ends, or when it ends
+        saf_root = None
+        rd_root = None
+
+        # -----   loop address_family, rd and prefix  -----
+        for row in stream.rows('safi', 'rd', 'prefix'):
+            tree = row if row.tag == 'ROW_safi' else stream.parent('ROW_safi')
+            if tree is not saf_root:
+                saf_root = tree
+                # vrf
+                try:
+                    vrf = stream.parent('ROW_vrf').find('vrf-name-out').text
+                except Exception:
+                    break
 
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
+                # address_family
+                try:
+                    af = saf_root.find('af-name').text
+                    af = af.lower()
+                except Exception:
+                    af = None
+                    continue
 
-        if not root:
-            return etree_dict
+                # <table-version>7</table-version>
+                try:
+                    table_version = \
+                        int(saf_root.find('table-version').text)
+                except Exception:
+                    table_version = None
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
+                # <router-id>10.106.0.6</router-id>
+                try:
+                    router_id = \
+                        saf_root.find('router-id').text
+                except Exception:
+                    router_id = None
+
+                if table_version or router_id:
+                    if 'vrf' not in etree_dict:
+                        etree_dict['vrf'] = {}
+                    if vrf not in etree_dict['vrf']:
+                        etree_dict['vrf'][vrf] = {}
+
+                    if 'address_family' not in etree_dict['vrf'][vrf]:
+                        etree_dict['vrf'][vrf]['address_family'] = {}
+
+                    if af not in etree_dict['vrf'][vrf]['address_family']:
+                        etree_dict['vrf'][vrf]['address_family'][af] = {}
+                    if table_version:
+                        etree_dict['vrf'][vrf]['address_family'][af]['table_version'] = table_version
+                    if router_id:
+                        etree_dict['vrf'][vrf]['address_family'][af]['router_id'] = router_id
+
+            if af is None or row.tag == 'ROW_safi':
+                continue
+
+            tree = row if row.tag == 'ROW_rd' else stream.parent('ROW_rd')
+            if tree is not rd_root:
+                rd_root = tree
+                # rd
+                try:
+                    rd = rd_root.find('rd_val').text
+                except Exception:
+                    rd = None
+
+                if rd:
+                    if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
+                        etree_dict['vrf'][vrf]['address_family'][af]\
+                            ['route_distinguisher'] = {}
+
+                    if rd not in etree_dict['vrf'][vrf]['address_family']:
+                        etree_dict['vrf'][vrf]['address_family'][af]\
+                            ['route_distinguisher'][rd] = {}
+                    sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
+                            ['route_distinguisher'][rd]
+                else:
+                    sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
+
+                # <rd_vrf>vrf-9100</rd_vrf>
+                try:
+                    sub_dict['rd_vrf'] = rd_root.find('rd_vrf').text
+                except Exception:
+                    pass
+
+            if row.tag == 'ROW_rd':
+                continue
+            prefix_root = row
+
+            # <ipprefix>10.1.1.1</ipprefix>
             try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
+                prefix = prefix_root.find('ipprefix').text
             except Exception:
-                break
+                # <ipv6prefix>2001:db8:4309::/112</ipv6prefix>
+                try:
+                    prefix = prefix_root.find('ipv6prefix').text
+                except Exception:
+                    continue
 
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_afi'.format(namespace))
-            if not af_tree:
+            if 'prefix' not in sub_dict:
+                sub_dict['prefix'] = {}
+
+            if prefix not in sub_dict['prefix']:
+                sub_dict['prefix'][prefix] = {}
+
+            # path table
+            index_tree = prefix_root.find('TABLE_path')
+            if not index_tree:
                 continue
-            for af_root in af_tree.findall('{}ROW_afi'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_safi'.format(namespace))
-                if not saf_tree:
+
+            # -----   loop path  -----
+            for index_root in index_tree.findall('ROW_path'):
+                # neighbor
+                try:
+                    index = int(index_root.find('pathnr').text)
+                except Exception:
                     continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_safi'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                    except Exception:
-                        continue
 
-                    # <table-version>7</table-version>
-                    try:
-                        table_version = \
-                            int(saf_root.find('{}table-version'.format(namespace)).text)
-                    except Exception:
-                        table_version = None
+                if 'index' not in sub_dict['prefix'][prefix]:
+                    sub_dict['prefix'][prefix]['index'] = {}
 
-                    # <router-id>10.106.0.6</router-id>
+                if index not in sub_dict['prefix'][prefix]['index']:
+                    sub_dict['prefix'][prefix]['index'][index] = {}
+
+                # <status>valid</status>
+                sub_dict['prefix'][prefix]['index'][index]['status'] = \
+                    index_root.find('status').text
+
+                # <best>bestpath</best>
+                sub_dict['prefix'][prefix]['index'][index]['best_path'] = \
+                    False if 'none' in index_root.find('best').text \
+                    else True
+
+                # <type>internal</type>
+                sub_dict['prefix'][prefix]['index'][index]['type'] = \
+                    index_root.find('type').text
+
+                try:
+                    # <statuscode>*</statuscode>
+                    status_code = index_root.find('statuscode').text
+                    sub_dict['prefix'][prefix]['index'][index]\
+                        .setdefault('status_code', status_code) if status_code.strip() else None
+
+                    # <bestcode>&gt;</bestcode>
+                    best_code = index_root.find('bestcode').text
+                    best_code = '>' if '&gt;' in best_code else best_code.strip()
+                    if best_code:
+                        sub_dict['prefix'][prefix]['index'][index]['best_code'] = best_code
+
+                    # <typecode>i</typecode>
+                    sub_dict['prefix'][prefix]['index'][index]['type_code'] = \
+                        index_root.find('typecode').text
+                except Exception:
+                    pass
+
+                # <ipnexthop>10.106.101.1</ipnexthop>
+                try:
+                    sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
+                        index_root.find('ipnexthop').text
+                except Exception:
+                    # <ipv6nexthop>2001:db8:1900:1::1:101</ipv6nexthop>
                     try:
-                        router_id = \
-                            saf_root.find('{}router-id'.format(namespace)).text
+                        sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
+                            index_root.find('ipv6nexthop').text
                     except Exception:
-                        router_id = None
-
-                    if table_version or router_id:
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['address_family']:
-                            etree_dict['vrf'][vrf]['address_family'][af] = {}
-                        if table_version:
-                            etree_dict['vrf'][vrf]['address_family'][af]['table_version'] = table_version
-                        if router_id:
-                            etree_dict['vrf'][vrf]['address_family'][af]['router_id'] = router_id
-
-                     # RD table
-                    rd_tree = saf_root.find('{}TABLE_rd'.format(namespace))
-                    if not rd_tree:
-                        continue
-
-                    # -----   loop rd  -----
-                    for rd_root in rd_tree.findall('{}ROW_rd'.format(namespace)):
-                        # neighbor
-                        try:
-                            rd = rd_root.find('{}rd_val'.format(namespace)).text
-                        except Exception:
-                            rd = None
-
-                        if rd:
-                            if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'] = {}
-
-                            if rd not in etree_dict['vrf'][vrf]['address_family']:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd] = {}
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd]
-                        else:
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
+                        pass
 
-                        # <rd_vrf>vrf-9100</rd_vrf>
-                        try:
-                            sub_dict['rd_vrf'] = rd_root.find('{}rd_vrf'.format(namespace)).text
-                        except Exception:
-                            pass
+                # <inlabel>nolabel</inlabel>
+                sub_dict['prefix'][prefix]['index'][index]['in_label'] = \
+                    index_root.find('inlabel').text
 
-                         # prefix table
-                        prefix_tree = rd_root.find('{}TABLE_prefix'.format(namespace))
-                        if not prefix_tree:
-                            continue
+                # <outlabel>nolabel</outlabel>
+                sub_dict['prefix'][prefix]['index'][index]['out_label'] = \
+                    index_root.find('outlabel').text
 
-                        # -----   loop prefix  -----
-                        for prefix_root in prefix_tree.findall('{}ROW_prefix'.format(namespace)):
-                            # <ipprefix>10.1.1.1</ipprefix>
-                            try:
-                                prefix = prefix_root.find('{}ipprefix'.format(namespace)).text
-                            except Exception:
-                                # <ipv6prefix>2001:db8:4309::/112</ipv6prefix>
-                                try:
-                                    prefix = prefix_root.find('{}ipv6prefix'.format(namespace)).text
-                                except Exception:
-                                    continue 
-
-                            if 'prefix' not in sub_dict:
-                                sub_dict['prefix'] = {}
-
-                            if prefix not in sub_dict['prefix']:
-                                sub_dict['prefix'][prefix] = {}
-
-                             # path table
-                            index_tree = prefix_root.find('{}TABLE_path'.format(namespace))
-                            if not index_tree:
-                                continue
+                # <vpn></vpn>
+                vpn = index_root.find('vpn').text
+                if vpn:
+                    sub_dict['prefix'][prefix]['index'][index]['vpn'] = vpn
 
-                            # -----   loop path  -----
-                            for index_root in index_tree.findall('{}ROW_path'.format(namespace)):
-                                # neighbor
-                                try:
-                                    index = int(index_root.find('{}pathnr'.format(namespace)).text)
-                                except Exception:
-                                    continue
-
-                                if 'index' not in sub_dict['prefix'][prefix]:
-                                    sub_dict['prefix'][prefix]['index'] = {}
-
-                                if index not in sub_dict['prefix'][prefix]['index']:
-                                    sub_dict['prefix'][prefix]['index'][index] = {}
-
-                                # <status>valid</status>
-                                sub_dict['prefix'][prefix]['index'][index]['status'] = \
-                                    index_root.find('{}status'.format(namespace)).text
-
-                                # <best>bestpath</best>
-                                sub_dict['prefix'][prefix]['index'][index]['best_path'] = \
-                                    False if 'none' in index_root.find('{}best'.format(namespace)).text \
-                                    else True
-
-                                # <type>internal</type>
-                                sub_dict['prefix'][prefix]['index'][index]['type'] = \
-                                    index_root.find('{}type'.format(namespace)).text
-
-                                try:
-                                    # <statuscode>*</statuscode>
-                                    status_code = index_root.find('{}statuscode'.format(namespace)).text
-                                    sub_dict['prefix'][prefix]['index'][index]\
-                                        .setdefault('status_code', status_code) if status_code.strip() else None                                        
-
-                                    # <bestcode>&gt;</bestcode>
-                                    best_code = index_root.find('{}bestcode'.format(namespace)).text
-                                    best_code = '>' if '&gt;' in best_code else best_code.strip()
-                                    if best_code:
-                                        sub_dict['prefix'][prefix]['index'][index]['best_code'] = best_code
-                                       
-                                    # <typecode>i</typecode>
-                                    sub_dict['prefix'][prefix]['index'][index]['type_code'] = \
-                                        index_root.find('{}typecode'.format(namespace)).text
-                                except Exception:
-                                    pass
-
-                                # <ipnexthop>10.106.101.1</ipnexthop>
-                                try:
-                                    sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
-                                        index_root.find('{}ipnexthop'.format(namespace)).text
-                                except Exception:
-                                    # <ipv6nexthop>2001:db8:1900:1::1:101</ipv6nexthop>
-                                    try:
-                                        sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
-                                            index_root.find('{}ipv6nexthop'.format(namespace)).text
-                                    except Exception:
-                                        pass
-
-                                # <inlabel>nolabel</inlabel>
-                                sub_dict['prefix'][prefix]['index'][index]['in_label'] = \
-                                    index_root.find('{}inlabel'.format(namespace)).text
-
-                                # <outlabel>nolabel</outlabel>
-                                sub_dict['prefix'][prefix]['index'][index]['out_label'] = \
-                                    index_root.find('{}outlabel'.format(namespace)).text
-
-                                # <vpn></vpn>
-                                vpn = index_root.find('{}vpn'.format(namespace)).text
-                                if vpn:
-                                    sub_dict['prefix'][prefix]['index'][index]['vpn'] = vpn
-                                    
 
-                                # <hold_down></hold_down>
-                                hold_down = index_root.find('{}hold_down'.format(namespace)).text
-                                if hold_down:
-                                    sub_dict['prefix'][prefix]['index'][index]['hold_down'] = hold_down
+                # <hold_down></hold_down>
+                hold_down = index_root.find('hold_down').text
+                if hold_down:
+                    sub_dict['prefix'][prefix]['index'][index]['hold_down'] = hold_down
 
         return etree_dict
 
@@ -10067,7 +9757,7 @@ class ShowBgpL2vpnEvpnSummarySchema(MetaParser):
     """Schema for:
         show bgp l2vpn evpn summary"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'vrf': {
@@ -10113,7 +9803,7 @@ class ShowBgpL2vpnEvpnSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ====================================================
 #  Parser for show bgp l2vpn evpn summary
@@ -10258,7 +9948,7 @@ class ShowBgpL2vpnEvpnRouteTypeSchema(MetaParser):
     """Schema for:
         show bgp l2vpn evpn route-type <route-type>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any():{
                 'vrf': {
@@ -10326,7 +10016,7 @@ class ShowBgpL2vpnEvpnRouteTypeSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ====================================================
@@ -10596,7 +10286,7 @@ class ShowBgpL2vpnEvpnNeighborsSchema(MetaParser):
         show bgp l2vpn evpn neighbors"""
 
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'vrf': {
@@ -10749,7 +10439,7 @@ class ShowBgpL2vpnEvpnNeighborsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ====================================================
 #  Parser for show bgp l2vpn evpn neighbors
@@ -11428,12 +11118,12 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
 class ShowBgpL2vpnEvpnWordSchema(MetaParser):
     """Schema for show bgp l2vpn evpn <WORD> | be "best path, in rib" n <WORD>"""
 
-    schema = {'mac_address':
+    schema = LazySchema(lambda: {'mac_address':
                 {Any():
                     {'next_hop': str,
                      'received_label': str}
                 },
-            }
+            })
 
 # =============================================================
 #  show bgp l2vpn evpn <WORD> | be "best path, in rib" n <WORD>
@@ -11501,7 +11191,7 @@ class ShowBgpIpMvpnRouteTypeSchema(MetaParser):
            show bgp ipv4 mvpn route-type <route_type> vrf <vrf>
            show bgp ipv4 mvpn route-type <route_type> vrf all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'vrf': {
@@ -11543,7 +11233,7 @@ class ShowBgpIpMvpnRouteTypeSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ===================================================================
@@ -11722,7 +11412,7 @@ class ShowBgpIpMvpnSaadDetailSchema(MetaParser):
     """Schema for:
         show bgp ipv4 mvpn sa-ad detail vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any():{
                 'vrf': {
@@ -11785,7 +11475,7 @@ class ShowBgpIpMvpnSaadDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ===========================================================
@@ -13,6 +13,7 @@ import re
 # Metaparser
 from genie.libs.parser.utils.common import Common
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -22,7 +23,7 @@ class ShowCdpNeighborsSchema(MetaParser):
         * 'show cdp neighbors'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'cdp':
             {Optional('index'):
                 {Any():
@@ -32,7 +33,7 @@ class ShowCdpNeighborsSchema(MetaParser):
                      Optional('capability'): str,
                      'platform': str,
                      'port_id': str, }, }, },
-    }
+    })
 
 
 # ================================
@@ -188,7 +189,7 @@ class ShowCdpNeighborsDetailSchema(MetaParser):
         * 'show cdp neighbors detail'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'total_entries_displayed': int,
         Optional('index'): {
             Any():
@@ -212,7 +213,7 @@ class ShowCdpNeighborsDetailSchema(MetaParser):
                  Optional('native_vlan'): str,
                  Optional('vtp_management_domain'): str},
         },
-    }
+    })
 
 # =======================================
 # Parser for 'show cdp neighbors details'
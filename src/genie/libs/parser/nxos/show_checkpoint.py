@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -18,14 +19,14 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 # =====================================
 class ShowCheckpointSummarySchema(MetaParser):    
     """Schema for show checkpoint summary"""
-    schema = {'checkpoint':
+    schema = LazySchema(lambda: {'checkpoint':
                 {Any():
                     {'created_by': str,
                      'created_time': str,
                      'size': int,
                      'description': str}
                 },
-            }
+            })
 
 class ShowCheckpointSummary(ShowCheckpointSummarySchema):
     """Parser for show checkpoint summary"""
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 #   ============================================    #
@@ -13,7 +14,7 @@ class ShowDot1xAllStatisticsSchema(MetaParser):
     ''' Schema for: 
             show dot1x all statistics
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'interface': str,
@@ -36,7 +37,7 @@ class ShowDot1xAllStatisticsSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 # Parser class
 class ShowDot1xAllStatistics(ShowDot1xAllStatisticsSchema):
@@ -110,7 +111,7 @@ class ShowDot1xAllSummarySchema(MetaParser):
     ''' Schema for:
             show dot1x all summary
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'interface': str,
@@ -123,7 +124,7 @@ class ShowDot1xAllSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # Parser class
 class ShowDot1xAllSummary(ShowDot1xAllSummarySchema):
@@ -175,7 +176,7 @@ class ShowDot1xAllDetailsSchema(MetaParser):
     '''Schema for:
             show dot1x all details
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('system_auth_control'): bool,
         Optional('version'): int,
         Optional ('interfaces'): {
@@ -231,7 +232,7 @@ class ShowDot1xAllDetailsSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # Parser class
 class ShowDot1xAllDetails(ShowDot1xAllDetailsSchema):
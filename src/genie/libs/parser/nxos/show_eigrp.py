@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any
 
 # Libs
@@ -23,7 +24,7 @@ class ShowEigrpNeighborsSchema(MetaParser):
         * 'show ipv6 eigrp neighbors vrf <vrf>'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'eigrp_instance': {
             Any(): {
                 'vrf': {
@@ -49,7 +50,7 @@ class ShowEigrpNeighborsSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 
 class ShowEigrpNeighborsSuperParser(ShowEigrpNeighborsSchema):
@@ -185,7 +186,7 @@ class ShowEigrpNeighborsDetailSchema(MetaParser):
         * 'show ipv6 eigrp neighbors detail vrf <vrf>'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'eigrp_instance': {
             Any(): {
                 'vrf': {
@@ -220,7 +221,7 @@ class ShowEigrpNeighborsDetailSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 
 class ShowEigrpNeighborsDetailSuperParser(ShowEigrpNeighborsDetailSchema):
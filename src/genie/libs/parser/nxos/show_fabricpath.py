@@ -1,6 +1,7 @@
 # Python (this imports the Python re module for RegEx)
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -20,7 +21,7 @@ class ShowFabricpathIsisAdjacencySchema(MetaParser):
     #         'adj-sys-name-out': str,
     #          'adj-state-out':str}
     # }
-    schema = {
+    schema = LazySchema(lambda: {
         'domain': {
             Any(): {
                 Optional('interfaces'): {
@@ -34,7 +35,7 @@ class ShowFabricpathIsisAdjacencySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 
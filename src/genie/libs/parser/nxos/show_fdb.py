@@ -20,6 +20,9 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema, JSON_CONTEXT_LIST
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+                                                    CompiledMetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -27,16 +30,17 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          And, \
                                          Default, \
                                          Use
-from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.common import Common, select_command
+from genie.libs.parser.utils import nxos_json
 
-class ShowMacAddressTableBaseSchema(MetaParser):
+class ShowMacAddressTableBaseSchema(CompiledMetaParser):
     """Schema for:
         'show mac address-table vni <WORD> | grep <WORD>'
         'show mac address-table local vni <WORD>'
         'show mac address-table'
         'show system internal l2fwder mac'"""
 
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
             'mac_table': {
                 'vlans': {
                     Any(): {
@@ -64,7 +68,7 @@ class ShowMacAddressTableBaseSchema(MetaParser):
                     },
                 },
             },
-        }
+        }))
 
 class ShowMacAddressTableBase(ShowMacAddressTableBaseSchema):
     """Base parser for:
@@ -170,6 +174,8 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema
         'show mac address-table address {address} interface {interface}',
         'show mac address-table address {address} interface {interface} vlan {vlan}'
     ]
+    json_command = [command + nxos_json.JSON_PIPE for command in cli_command]
+    CONTEXT_LIST = JSON_CONTEXT_LIST
 
     def cli(self, address=None, interface=None, vlan=None, output=None):
 
@@ -205,12 +211,59 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema
 
         return ret_dict
 
+    def json(self, address=None, interface=None, vlan=None, output=None):
+        if output is None:
+            cmd = select_command(self.json_command, address=address,
+                                 interface=interface, vlan=vlan)
+            output = self.device.execute(cmd)
+
+        ret_dict = {}
+
+        # {"disp_mac_addr": "aaaa.bbff.8888", "disp_type": "*",
+        #  "disp_vlan": "10", "disp_is_static": "enabled", "disp_age": "-",
+        #  "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+        #  "disp_port": "Ethernet1/2"}
+        for row in nxos_json.rows(nxos_json.loads(output), 'mac_address'):
+            vlan_id = nxos_json.to_str(row.get('disp_vlan', '-'))
+            mac_address = nxos_json.to_str(row['disp_mac_addr'])
+
+            vlan_dict = ret_dict.setdefault('mac_table', {})\
+                .setdefault('vlans', {}).setdefault(vlan_id, {})
+            vlan_dict.update({'vlan': vlan_id})
+            mac_dict = vlan_dict.setdefault('mac_addresses', {})\
+                .setdefault(mac_address, {})
+            mac_dict.update({'mac_address': mac_address})
+
+            entry = nxos_json.to_str(row.get('disp_type', ''))
+            if entry:
+                mac_dict.update({'entry': entry})
+            mac_dict.update({'secure': 'T' if nxos_json.to_bool(
+                row.get('disp_is_secure')) else 'F'})
+            mac_dict.update({'ntfy': 'T' if nxos_json.to_bool(
+                row.get('disp_is_ntfy')) else 'F'})
+
+            port = nxos_json.to_str(row.get('disp_port', ''))
+            if port.lower() == 'drop':
+                intf_dict = mac_dict.setdefault('drop', {})
+                intf_dict.update({'drop': True})
+            else:
+                converted_port = Common.convert_intf_name(port)
+                intf_dict = mac_dict.setdefault('interfaces', {})\
+                    .setdefault(converted_port, {})
+                intf_dict.update({'interface': converted_port})
+
+            intf_dict.update({'mac_type': 'static' if nxos_json.to_bool(
+                row.get('disp_is_static')) else 'dynamic'})
+            intf_dict.update({'age': nxos_json.to_str(row.get('disp_age', '-'))})
+
+        return ret_dict
+
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
     """Schema for show mac address-table aging-time"""
-    schema = {
+    schema = LazySchema(lambda: {
         'mac_aging_time': int
-    }
+    })
 
 
 class ShowMacAddressTableAgingTime(ShowMacAddressTableAgingTimeSchema):
@@ -248,7 +301,7 @@ class ShowMacAddressTableAgingTime(ShowMacAddressTableAgingTimeSchema):
 
 class ShowMacAddressTableLimitSchema(MetaParser):
     """Schema for show mac address-table limit"""
-    schema = {
+    schema = LazySchema(lambda: {
         'configured_system_limit': int,
         'current_system_count': int,
         'configured_system_action': str,
@@ -264,7 +317,7 @@ class ShowMacAddressTableLimitSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowMacAddressTableLimit(ShowMacAddressTableLimitSchema):
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -21,7 +22,7 @@ class ShowFeatureSchema(MetaParser):
         show feature
         show feature-set"""
 
-    schema = {'feature':
+    schema = LazySchema(lambda: {'feature':
                 {Any():
                     {'instance':
                         {Any():
@@ -30,7 +31,7 @@ class ShowFeatureSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 class ShowFeature(ShowFeatureSchema):
     """Parser for show feature"""
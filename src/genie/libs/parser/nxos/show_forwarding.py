@@ -12,6 +12,7 @@ import xmltodict
 
 #Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # import parser utils
@@ -23,7 +24,7 @@ from genie.libs.parser.utils.common import Common
 # =====================
 class ShowForwardingIpv4Schema(MetaParser):
     "schema for show forwarding ipv4"
-    schema = {
+    schema = LazySchema(lambda: {
         'slot':{
             Any():{
                 'ip_version':{
@@ -47,7 +48,7 @@ class ShowForwardingIpv4Schema(MetaParser):
                 }
             }
         }                
-    }
+    })
 
 
 
@@ -11,6 +11,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 
@@ -21,7 +22,7 @@ class ShowHsrpSummarySchema(MetaParser):
     
     ''' Schema for "'show hsrp summary" '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'nsf': str,
         Optional('nsf_time'): int,
         'global_hsrp_bfd': str,
@@ -43,7 +44,7 @@ class ShowHsrpSummarySchema(MetaParser):
             'rx_good': int},
         'pkt_unknown_groups': int,
         'total_mts_rx': int,
-        }
+        })
 
 # ==============================
 # Parser for 'show hsrp summary'
@@ -192,7 +193,7 @@ class ShowHsrpAllSchema(MetaParser):
 
     ''' Schema for 'show hsrp all' '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {'interface': str,
             'use_bia': bool,
@@ -270,7 +271,7 @@ class ShowHsrpAllSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # ===========================
 # Parser for 'show hsrp all'
@@ -661,13 +662,13 @@ class ShowHsrpDelaySchema(MetaParser):
 
     ''' Schema for show hsrp delay '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {'delay':
                 {'minimum_delay': int,
                 'reload_delay': int},
             },
-        }
+        })
 
 # ============================
 # Parser for 'show hsrp delay'
@@ -20,6 +20,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
@@ -32,7 +33,7 @@ from genie.libs.parser.utils.common import Common
 class ShowIpIgmpSnoopingSchema(MetaParser):
     """Schema for show ip igmp snooping"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('global_configuration'): {
             Optional('enabled'): str,
             Optional('v1v2_report_suppression'): str,
@@ -67,7 +68,7 @@ class ShowIpIgmpSnoopingSchema(MetaParser):
 
             },
         },
-    }
+    })
 
 # ==============================================
 #  Parser for show ip igmp snooping
@@ -383,7 +384,7 @@ class ShowIpIgmpInterfaceSchema(MetaParser):
         show ip igmp interface vrf all
         show ip igmp interface vrf <vrf>"""
 
-    schema = {'vrfs': {
+    schema = LazySchema(lambda: {'vrfs': {
                 Any(): {
                     'groups_count': int,
                     Optional('interface'): {
@@ -457,7 +458,7 @@ class ShowIpIgmpInterfaceSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowIpIgmpInterface(ShowIpIgmpInterfaceSchema):
     """Parser for:
@@ -860,7 +861,7 @@ class ShowIpIgmpGroupsSchema(MetaParser):
         show ip igmp groups vrf all
         show ip igmp groups vrf <vrf>"""
 
-    schema = {'vrfs': {
+    schema = LazySchema(lambda: {'vrfs': {
                 Any(): {
                     'total_entries': int,
                     Optional('interface'): {
@@ -885,7 +886,7 @@ class ShowIpIgmpGroupsSchema(MetaParser):
                     },
                 },
             }
-        }
+        })
 
 class ShowIpIgmpGroups(ShowIpIgmpGroupsSchema):
     """Parser for:
@@ -1007,7 +1008,7 @@ class ShowIpIgmpLocalGroupsSchema(MetaParser):
         show ip igmp local-groups vrf all
         show ip igmp local-groups vrf <vrf>"""
 
-    schema = {'vrfs': {
+    schema = LazySchema(lambda: {'vrfs': {
                 Any(): {
                     Optional('interface'): {
                         Any(): {
@@ -1039,7 +1040,7 @@ class ShowIpIgmpLocalGroupsSchema(MetaParser):
                     },
                 },
             }
-        }
+        })
 
 class ShowIpIgmpLocalGroups(ShowIpIgmpLocalGroupsSchema):
     """Parser for:
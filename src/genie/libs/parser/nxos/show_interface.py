@@ -20,10 +20,12 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema, JSON_CONTEXT_LIST
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
                                          
 # import parser utils
-from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.common import Common, select_command
+from genie.libs.parser.utils import nxos_json
 
 
 # ===========================
@@ -32,7 +34,7 @@ from genie.libs.parser.utils.common import Common
 class ShowInterfaceSchema(MetaParser):
     """Schema for show interface"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): 
             {Optional('description'): str,
             Optional('types'): str,
@@ -144,7 +146,7 @@ class ShowInterfaceSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # ===========================
 # Parser for 'show interface'
@@ -155,6 +157,8 @@ class ShowInterface(ShowInterfaceSchema):
     """Parser for show interface, show interface <interface>"""
 
     cli_command = ['show interface', 'show interface {interface}']
+    json_command = [command + nxos_json.JSON_PIPE for command in cli_command]
+    CONTEXT_LIST = JSON_CONTEXT_LIST
     exclude = [
       'in_unicast_pkts',
       'out_unicast_pkts',
@@ -1058,6 +1062,153 @@ class ShowInterface(ShowInterfaceSchema):
 
         return interface_dict
 
+    # ROW_interface keys of physical, port-channel, loopback and
+    # sub-interfaces, and of SVIs (svi_ prefix), and their schema keys
+    JSON_FIELDS = nxos_json.RowMapper([
+        ('desc', 'description', nxos_json.to_str),
+        ('svi_desc', 'description', nxos_json.to_str),
+        ('eth_hw_desc', 'types', nxos_json.to_str),
+        ('svi_hw_desc', 'types', nxos_json.to_str),
+        ('eth_hw_addr', 'mac_address', nxos_json.to_str),
+        ('svi_mac', 'mac_address', nxos_json.to_str),
+        ('eth_bia_addr', 'phys_address', nxos_json.to_str),
+        ('admin_state', 'admin_state', nxos_json.to_str),
+        ('svi_line_proto', 'line_protocol', nxos_json.to_str),
+        ('eth_mtu', 'mtu', int),
+        ('svi_mtu', 'mtu', int),
+        ('eth_bw', 'bandwidth', int),
+        ('svi_bw', 'bandwidth', int),
+        ('eth_dly', 'delay', int),
+        ('svi_delay', 'delay', int),
+        ('eth_reliability', 'reliability', lambda v: '{}/255'.format(v)),
+        ('eth_txload', 'txload', lambda v: '{}/255'.format(v)),
+        ('eth_rxload', 'rxload', lambda v: '{}/255'.format(v)),
+        ('eth_encap', 'encapsulations.encapsulation', nxos_json.to_str),
+        ('eth_vlanid', 'encapsulations.first_dot1q', nxos_json.to_str),
+        ('medium', 'medium', nxos_json.to_str),
+        ('eth_mode', 'port_mode', nxos_json.to_str),
+        ('eth_duplex', 'duplex_mode', lambda v: str(v).lower()),
+        ('eth_media', 'media_type', nxos_json.to_str),
+        ('eth_beacon', 'beacon', nxos_json.to_str),
+        ('eth_autoneg', 'auto_negotiate', nxos_json.to_bool),
+        ('eth_in_flowctrl', 'flow_control.receive', nxos_json.to_bool),
+        ('eth_out_flowctrl', 'flow_control.send', nxos_json.to_bool),
+        ('eth_mdix', 'auto_mdix', nxos_json.to_str),
+        ('eth_swt_monitor', 'switchport_monitor', nxos_json.to_str),
+        ('eth_ethertype', 'ethertype', nxos_json.to_str),
+        ('eth_eee_state', 'efficient_ethernet', nxos_json.to_str),
+        ('eth_link_flapped', 'last_link_flapped', nxos_json.to_str),
+        ('eth_reset_cntr', 'interface_reset', int),
+        ('eth_clear_counters', 'counters.last_clear', nxos_json.to_str),
+        ('eth_load_interval1_rx', 'counters.rate.load_interval', int),
+        ('eth_inrate1_bits', 'counters.rate.in_rate', int),
+        ('eth_inrate1_pkts', 'counters.rate.in_rate_pkts', int),
+        ('eth_outrate1_bits', 'counters.rate.out_rate', int),
+        ('eth_outrate1_pkts', 'counters.rate.out_rate_pkts', int),
+        ('eth_inucast', 'counters.in_unicast_pkts', int),
+        ('eth_inmcast', 'counters.in_multicast_pkts', int),
+        ('eth_inbcast', 'counters.in_broadcast_pkts', int),
+        ('eth_inpkts', 'counters.in_pkts', int),
+        ('eth_inbytes', 'counters.in_octets', int),
+        ('eth_jumbo_inpkts', 'counters.in_jumbo_packets', int),
+        ('eth_storm_supp', 'counters.in_storm_suppression_packets', int),
+        ('eth_runts', 'counters.in_runts', int),
+        ('eth_giants', 'counters.in_oversize_frame', int),
+        ('eth_crc', 'counters.in_crc_errors', int),
+        ('eth_nobuf', 'counters.in_no_buffer', int),
+        ('eth_inerr', 'counters.in_errors', int),
+        ('eth_frame', 'counters.in_short_frame', int),
+        ('eth_overrun', 'counters.in_overrun', int),
+        ('eth_underrun', 'counters.in_underrun', int),
+        ('eth_ignored', 'counters.in_ignored', int),
+        ('eth_watchdog', 'counters.in_watchdog', int),
+        ('eth_bad_eth', 'counters.in_bad_etype_drop', int),
+        ('eth_bad_proto', 'counters.in_unknown_protos', int),
+        ('eth_in_ifdown_drops', 'counters.in_if_down_drop', int),
+        ('eth_dribble', 'counters.in_with_dribble', int),
+        ('eth_indiscard', 'counters.in_discard', int),
+        ('eth_inpause', 'counters.in_mac_pause_frames', int),
+        ('eth_outucast', 'counters.out_unicast_pkts', int),
+        ('eth_outmcast', 'counters.out_multicast_pkts', int),
+        ('eth_outbcast', 'counters.out_broadcast_pkts', int),
+        ('eth_outpkts', 'counters.out_pkts', int),
+        ('eth_outbytes', 'counters.out_octets', int),
+        ('eth_jumbo_outpkts', 'counters.out_jumbo_packets', int),
+        ('eth_outerr', 'counters.out_errors', int),
+        ('eth_coll', 'counters.out_collision', int),
+        ('eth_deferred', 'counters.out_deferred', int),
+        ('eth_latecoll', 'counters.out_late_collision', int),
+        ('eth_lostcarrier', 'counters.out_lost_carrier', int),
+        ('eth_nocarrier', 'counters.out_no_carrier', int),
+        ('eth_babbles', 'counters.out_babble', int),
+        ('eth_outdiscard', 'counters.out_discard', int),
+        ('eth_outpause', 'counters.out_mac_pause_frames', int),
+    ])
+
+    def json(self, interface='', output=None):
+        if output is None:
+            cmd = select_command(self.json_command,
+                                 interface=interface)
+            output = self.device.execute(cmd)
+
+        interface_dict = {}
+
+        # {"interface": "Ethernet2/1", "state": "up", "admin_state": "up",
+        #  "share_state": "Dedicated", "eth_hw_desc": "Ethernet",
+        #  "eth_mtu": "1600", "eth_inucast": "0", ...}
+        for row in nxos_json.rows(nxos_json.loads(output), 'interface'):
+            interface = nxos_json.to_str(row['interface'])
+            intf_dict = interface_dict.setdefault(interface, {})
+            intf_dict['port_channel'] = {'port_channel_member': False}
+
+            self.JSON_FIELDS.fill(intf_dict, row)
+
+            state = nxos_json.to_str(row.get('state') or
+                                     row.get('svi_line_proto') or 'down')
+            intf_dict['oper_status'] = state
+            if row.get('state'):
+                intf_dict['link_state'] = state
+            admin_state = row.get('admin_state') or row.get('svi_admin_state')
+            intf_dict['enabled'] = nxos_json.to_str(admin_state or '') == 'up'
+            if row.get('svi_autostate') not in (None, ''):
+                intf_dict['autostate'] = nxos_json.to_bool(row['svi_autostate'])
+            if nxos_json.to_str(row.get('share_state', '')) == 'Dedicated':
+                intf_dict['dedicated_interface'] = True
+            if row.get('parent_interface'):
+                intf_dict['parent_interface'] = \
+                    nxos_json.to_str(row['parent_interface'])
+
+            # "10 Gb/s" and "1000 Mb/s" are shown as 10 and 1000
+            speed = nxos_json.to_str(row.get('eth_speed', ''))
+            if speed and not speed.startswith('auto'):
+                intf_dict['port_speed'] = speed.split()[0]
+
+            if 'counters' in intf_dict:
+                intf_dict['counters']['rx'] = True
+                intf_dict['counters']['tx'] = True
+
+            # "Po1"
+            if row.get('eth_bundle'):
+                intf_dict['port_channel']['port_channel_member'] = True
+                intf_dict['port_channel']['port_channel_int'] = \
+                    Common.convert_intf_name(nxos_json.to_str(row['eth_bundle']))
+            # "Eth1/15, Eth1/16"
+            if row.get('eth_members'):
+                intf_dict['port_channel']['port_channel_member'] = True
+                intf_dict['port_channel']['port_channel_member_intfs'] = [
+                    Common.convert_intf_name(member.strip()) for member in
+                    nxos_json.to_str(row['eth_members']).split(',')]
+
+            ip = row.get('eth_ip_addr') or row.get('svi_ip_addr')
+            prefix_length = row.get('eth_ip_mask') or row.get('svi_ip_mask')
+            if ip and prefix_length not in (None, ''):
+                ip = nxos_json.to_str(ip)
+                prefix_length = nxos_json.to_str(prefix_length)
+                intf_dict.setdefault('ipv4', {})[ip + '/' + prefix_length] = \
+                    {'ip': ip, 'prefix_length': prefix_length}
+
+        return interface_dict
+
 
 # ===================================
 # Schema for 'show interface vrf all'
@@ -1065,7 +1216,7 @@ class ShowInterface(ShowInterfaceSchema):
 class ShowIpInterfaceVrfAllSchema(MetaParser):
     """Schema for show ip interface vrf all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
     Any():
         {'vrf': str,
          'interface_status': str,
@@ -1144,7 +1295,7 @@ class ShowIpInterfaceVrfAllSchema(MetaParser):
          Optional('wccp_redirect_inbound'): str,
          Optional('wccp_redirect_exclude'): str
         },
-    }   
+    })   
 
 
 # ===================================
@@ -1831,13 +1982,13 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 # ===================================
 class ShowVrfAllInterfaceSchema(MetaParser):
     """Schema for show vrf all interface"""
-    schema = { 
+    schema = LazySchema(lambda: { 
                 Any():
                     {'vrf': str,
                      'vrf_id': int,
                      'site_of_origin': str
                     },
-                }
+                })
 
 # ===================================
 # Parser for 'show vrf all interface'
@@ -1911,7 +2062,7 @@ class ShowVrfAllInterface(ShowVrfAllInterfaceSchema):
 class ShowInterfaceSwitchportSchema(MetaParser):
     """Schema for show interface switchport"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {'switchport_status': str,
              Optional('switchport_monitor'): str,
@@ -1932,7 +2083,7 @@ class ShowInterfaceSwitchportSchema(MetaParser):
              Optional('admin_priv_vlan_trunk_private_vlans'): str,
              Optional('operational_private_vlan'): str
             },
-        }
+        })
                     
 # ======================================
 # Parser for 'show interface switchport'
@@ -2158,7 +2309,7 @@ class ShowInterfaceSwitchport(ShowInterfaceSwitchportSchema):
 class ShowIpv6InterfaceVrfAllSchema(MetaParser):
     """Schema for show ipv6 interface vrf all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {'vrf': str,
              'interface_status': str,
@@ -2204,7 +2355,7 @@ class ShowIpv6InterfaceVrfAllSchema(MetaParser):
                 'ipv6_last_reset': str
                 },
             },
-        }
+        })
 
 # ========================================
 # Parser for 'show ipv6 interface vrf all'
@@ -2596,7 +2747,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
 # ====================================
 class ShowIpInterfaceBriefSchema(MetaParser):
     """Schema for show ip interface brief"""
-    schema = {'interface':
+    schema = LazySchema(lambda: {'interface':
                 {Any():
                     {Optional('vlan_id'):
                         {Optional(Any()):
@@ -2608,7 +2759,7 @@ class ShowIpInterfaceBriefSchema(MetaParser):
                     Optional('interface_status'): str,
                     Optional('ipaddress_extension'): str}
                 },
-            }
+            })
 
 # ====================================
 # Parser for 'show ip interface brief'
@@ -2717,7 +2868,7 @@ class ShowIpInterfaceBriefPipeVlan(ShowIpInterfaceBrief):
 class ShowInterfaceBriefSchema(MetaParser):
     """Schema for show interface brief"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interface': {
             'ethernet': {
                 Any(): {
@@ -2764,7 +2915,7 @@ class ShowInterfaceBriefSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 # =================================
 # Parser for 'show interface brief'
@@ -2951,7 +3102,7 @@ class ShowInterfaceBrief(ShowInterfaceBriefSchema):
 class ShowRunningConfigInterfaceSchema(MetaParser):
     """Schema for show running-config interface <WORD>"""
 
-    schema = {'interface':
+    schema = LazySchema(lambda: {'interface':
                 {Any():
                     {Optional('shutdown'): bool,
                      Optional('switchport'): bool,
@@ -2978,7 +3129,7 @@ class ShowRunningConfigInterfaceSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 
 # =================================================
@@ -3180,7 +3331,7 @@ class ShowRunningConfigInterface(ShowRunningConfigInterfaceSchema):
 class ShowNveInterfaceSchema(MetaParser):
     """Schema for show nve interface"""
 
-    schema = {'interface':
+    schema = LazySchema(lambda: {'interface':
                 {Any():
                     {'state': str,
                     Optional('encapsulation'): str,
@@ -3197,7 +3348,7 @@ class ShowNveInterfaceSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 # ===============================
 # Parser for 'show nve interface'
@@ -3297,12 +3448,12 @@ class ShowNveInterface(ShowNveInterfaceSchema):
 # ============================================
 class ShowIpInterfaceBriefVrfAllSchema(MetaParser):
     """Schema for show ip interface brief vrf all"""
-    schema = {'interface':
+    schema = LazySchema(lambda: {'interface':
                 {Any():
                     {Optional('ip_address'): str,
                      Optional('interface_status'): str}
                 },
-            }
+            })
 
 # ============================================
 # Schema for 'show ip interface brief vrf all'
@@ -3369,7 +3520,7 @@ class ShowInterfaceDescriptionSchema(MetaParser):
     """schema for show interface description
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 Optional('type'): str,
@@ -3377,7 +3528,7 @@ class ShowInterfaceDescriptionSchema(MetaParser):
                 'description': str
             }
         }
-    }
+    })
 
 class ShowInterfaceDescription(ShowInterfaceDescriptionSchema):
     """parser for show interface description
@@ -3436,7 +3587,7 @@ class ShowInterfaceStatusSchema(MetaParser):
     """schema for show interface status
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 Optional('name'): str,
@@ -3447,7 +3598,7 @@ class ShowInterfaceStatusSchema(MetaParser):
                 Optional('type'): str,
             }
         }
-    }
+    })
 
 
 class ShowInterfaceStatus(ShowInterfaceStatusSchema):
@@ -22,6 +22,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -29,7 +30,7 @@ from genie.libs.parser.utils.common import Common
 class ShowIsisSchema(MetaParser):
     """Schema for show isis"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'isis_process': str,
@@ -96,7 +97,7 @@ class ShowIsisSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIsis(ShowIsisSchema):
@@ -515,7 +516,7 @@ class ShowIsis(ShowIsisSchema):
 class ShowIsisInterfaceSchema(MetaParser):
     """Schema for show isis interface"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): { # process_id
                 'vrf': {
@@ -588,7 +589,7 @@ class ShowIsisInterfaceSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIsisInterface(ShowIsisInterfaceSchema):
@@ -884,7 +885,7 @@ class ShowIsisInterface(ShowIsisInterfaceSchema):
 class ShowIsisSpfLogDetailSchema(MetaParser):
     """Schema for show isis spf-log detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): { # process_id
                 'vrf': {
@@ -922,7 +923,7 @@ class ShowIsisSpfLogDetailSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIsisSpfLogDetail(ShowIsisSpfLogDetailSchema):
@@ -1055,7 +1056,7 @@ class ShowIsisSpfLogDetail(ShowIsisSpfLogDetailSchema):
 class ShowIsisAdjacencySchema(MetaParser):
     """Schema for show isis adjacency"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'vrf': {
@@ -1082,7 +1083,7 @@ class ShowIsisAdjacencySchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIsisAdjacency(ShowIsisAdjacencySchema):
@@ -1157,7 +1158,7 @@ class ShowIsisAdjacency(ShowIsisAdjacencySchema):
 class ShowIsisHostnameSchema(MetaParser):
     """Schema for show isis hostname"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'vrf': {
@@ -1175,7 +1176,7 @@ class ShowIsisHostnameSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIsisHostname(ShowIsisHostnameSchema):
@@ -1251,7 +1252,7 @@ class ShowIsisHostnameDetailSchema(MetaParser):
             * show isis hostname detail
             * show isis hostname detail vrf {vrf}"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'vrf': {
@@ -1269,7 +1270,7 @@ class ShowIsisHostnameDetailSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 class ShowIsisHostnameDetail(ShowIsisHostnameDetailSchema):
     """Parser for 
@@ -1343,7 +1344,7 @@ class ShowIsisHostnameDetail(ShowIsisHostnameDetailSchema):
 class ShowIsisDatabaseDetailSchema(MetaParser):
     """Schema for show isis database detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'vrf': {
@@ -1413,7 +1414,7 @@ class ShowIsisDatabaseDetailSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
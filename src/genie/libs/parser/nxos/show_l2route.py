@@ -10,6 +10,7 @@ import re
 
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -24,7 +25,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 class ShowL2routeEvpnMacSchema(MetaParser):
     """Schema for show l2route evpn mac all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'topology':
             {Any():
                 {'mac_address':
@@ -36,7 +37,7 @@ class ShowL2routeEvpnMacSchema(MetaParser):
                     },
                 }
             },
-        }
+        })
 
 # ====================================================
 #  parser for 'show l2route evpn mac all'
@@ -103,7 +104,7 @@ class ShowL2routeEvpnMac(ShowL2routeEvpnMacSchema):
 class ShowL2routeEvpnMacEviSchema(MetaParser):
     """Schema for show l2route evpn mac evi <WORD> mac <WORD>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'topology':
             {Any():
                 {'mac_address':
@@ -115,7 +116,7 @@ class ShowL2routeEvpnMacEviSchema(MetaParser):
                     },
                 }
             },
-        }
+        })
 
 # =========================================================
 #  parser for 'show l2route evpn mac evi <WORD> mac <WORD>'
@@ -12,6 +12,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional, \
@@ -28,10 +29,10 @@ from genie.libs.parser.utils.common import Common
 # ============================
 class ShowLacpSystemIdentifierSchema(MetaParser):
     """Schema for show lacp system-identifier"""
-    schema = {
+    schema = LazySchema(lambda: {
         'system_id_mac': str,
         'system_priority': int,
-    }
+    })
 
 
 class ShowLacpSystemIdentifier(ShowLacpSystemIdentifierSchema):
@@ -71,7 +72,7 @@ class ShowLacpSystemIdentifier(ShowLacpSystemIdentifierSchema):
 # ============================
 class ShowLacpCountersSchema(MetaParser):
     """schema for: show lcap counters"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'members': {
@@ -88,7 +89,7 @@ class ShowLacpCountersSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 
 # =============================
@@ -174,7 +175,7 @@ class ShowLacpCounters(ShowLacpCountersSchema):
 # ============================
 class ShowLacpNeighborSchema(MetaParser):
     """schema for: show lacp neighbor"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'members': {
@@ -192,7 +193,7 @@ class ShowLacpNeighborSchema(MetaParser):
                 }
             },
         },
-    }
+    })
 
 
 # =============================
@@ -283,7 +284,7 @@ class ShowLacpNeighbor(ShowLacpNeighborSchema):
 # ============================
 class ShowPortChannelSummarySchema(MetaParser):
     """schema for: show show port-channel summary"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'bundle_id': int,
@@ -298,7 +299,7 @@ class ShowPortChannelSummarySchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 
 # =============================
@@ -377,7 +378,7 @@ class ShowPortChannelSummary(ShowPortChannelSummarySchema):
 # =====================================
 class ShowPortChannelDatabaseSchema(MetaParser):
     """ schema for : show post-channel database"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'last_update_success': bool,  # successful => True, else False
@@ -400,7 +401,7 @@ class ShowPortChannelDatabaseSchema(MetaParser):
             }
         }
 
-    }
+    })
 
 
 # =====================================
@@ -10,6 +10,7 @@ import re
 
 # metaparsers
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 
 # import parser utils
@@ -21,7 +22,7 @@ from genie.libs.parser.utils.common import Common
 # ==============================
 class ShowLldpAllSchema(MetaParser):
     """schema for show lldp all"""
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces':
             {Any():
                  {'enabled': bool,
@@ -30,7 +31,7 @@ class ShowLldpAllSchema(MetaParser):
                   'dcbx': bool
                   },
              },
-    }
+    })
 
 
 class ShowLldpAll(ShowLldpAllSchema):
@@ -80,14 +81,14 @@ class ShowLldpAll(ShowLldpAllSchema):
 # ==============================
 class ShowLldpTimersSchema(MetaParser):
     """Schema for show lldp timers"""
-    schema = {
+    schema = LazySchema(lambda: {
         'hold_timer': int,
         'reinit_timer': int,
         'hello_timer': int,
         Optional('transmit_delay'): int,
         Optional('hold_multiplier'): int,
         Optional('notification_interval'): int
-    }
+    })
 
 class ShowLldpTimers(ShowLldpTimersSchema):
     """parser for show lldp timers"""
@@ -145,10 +146,10 @@ class ShowLldpTimers(ShowLldpTimersSchema):
 
 class ShowLldpTlvSelectSchema(MetaParser):
     """Schema for show lldp tlv-select"""
-    schema = {'suppress_tlv_advertisement': {
+    schema = LazySchema(lambda: {'suppress_tlv_advertisement': {
         Any(): bool
     }
-    }
+    })
 
 
 class ShowLldpTlvSelect(ShowLldpTlvSelectSchema):
@@ -182,7 +183,7 @@ class ShowLldpTlvSelect(ShowLldpTlvSelectSchema):
 # =================================
 class ShowLldpNeighborsDetailSchema(MetaParser):
     """Schema for show lldp neighbors detail"""
-    schema = {
+    schema = LazySchema(lambda: {
         'total_entries': int,
         'interfaces': {
             Any(): {
@@ -213,7 +214,7 @@ class ShowLldpNeighborsDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowLldpNeighborsDetail(ShowLldpNeighborsDetailSchema):
@@ -462,7 +463,7 @@ class ShowLldpNeighborsDetail(ShowLldpNeighborsDetailSchema):
 # =================================
 class ShowLldpTrafficSchema(MetaParser):
     """Schema for show lldp traffic"""
-    schema = {
+    schema = LazySchema(lambda: {
         'counters': {
             "total_frames_received": int,  # Total frames received: 209
             "total_frames_transmitted": int,  # Total frames transmitted: 349
@@ -472,7 +473,7 @@ class ShowLldpTrafficSchema(MetaParser):
             'total_entries_aged': int,  # Total entries aged: 0
             Optional('total_flap_count'): int #  Total flap count: 1
         }
-    }
+    })
 
 
 class ShowLldpTraffic(ShowLldpTrafficSchema):
@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -25,9 +26,9 @@ class ShowLoggingLogfileSchema(MetaParser):
         * 'show logging logfile | include {include}'
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'logs': list,
-        }
+        })
 
 
 # ==============================================
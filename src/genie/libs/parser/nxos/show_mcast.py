@@ -14,9 +14,14 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema, JSON_CONTEXT_LIST
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.nxos.show_vrf import  ShowVrf
 
+# import parser utils
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils import nxos_json
+
 # ===================================
 # Parser for 'show ip mroute vrf all'
 # ===================================
@@ -24,7 +29,7 @@ from genie.libs.parser.nxos.show_vrf import  ShowVrf
 class ShowIpMrouteVrfAllSchema(MetaParser):
     """Schema for show ip mroute vrf all"""
 
-    schema = {'vrf':         
+    schema = LazySchema(lambda: {'vrf':         
                 {Any():
                     {'address_family':
                         {Any(): 
@@ -57,12 +62,14 @@ class ShowIpMrouteVrfAllSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
     """Parser for show ip mroute vrf all"""
 
     cli_command = 'show ip mroute vrf all'
+    json_command = cli_command + nxos_json.JSON_PIPE
+    CONTEXT_LIST = JSON_CONTEXT_LIST
     exclude = [
         'flags',
         'incoming_interface_list',
@@ -217,6 +224,82 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
 
         return mroute_dict
 
+    # (*, 232.0.0.0/8)
+    # (10.169.1.1/32, 10.76.1.1/32)
+    JSON_ROUTE = re.compile(r'^\((?P<source_address>[^,]+), *'
+                            r'(?P<multicast_group>[^\)]+)\)$')
+
+    def json(self, output=None):
+        if output is None:
+            output = self.device.execute(self.json_command)
+
+        mroute_dict = {}
+        data = nxos_json.loads(output)
+
+        # {"vrf-name": "default", "TABLE_one_route": {...}}
+        for vrf_row in nxos_json.rows(data, 'vrf'):
+            vrf = nxos_json.to_str(vrf_row['vrf-name'])
+            af_dict = mroute_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                .setdefault('address_family', {}).setdefault('ipv4', {})
+
+            # {"mcast-addrs": "(*,232.0.0.0/8)", "uptime": "PT9H15M11S",
+            #  "bidir": "false", "route-iif": "Ethernet1/9",
+            #  "rpf-nbr": "10.234.1.2", "internal": "true", "oif-count": "1",
+            #  "TABLE_mpib": {...}, "TABLE_oif": {...}}
+            for route_row in nxos_json.rows(vrf_row, 'one_route'):
+                m = self.JSON_ROUTE.match(nxos_json.to_str(
+                    route_row['mcast-addrs']).replace(' ', ''))
+                if not m:
+                    continue
+                source_address = m.groupdict()['source_address']
+                multicast_group = m.groupdict()['multicast_group']
+
+                source_dict = af_dict.setdefault('multicast_group', {})\
+                    .setdefault(multicast_group, {})\
+                    .setdefault('source_address', {})\
+                    .setdefault(source_address, {})
+
+                if route_row.get('uptime'):
+                    source_dict['uptime'] = Common().convert_xml_time(
+                        nxos_json.to_str(route_row['uptime']))
+                # The cli shows the route owners followed by 'ip'
+                owners = [nxos_json.to_str(mpib_row['mpib-name'])
+                          for mpib_row in nxos_json.rows(route_row, 'mpib')]
+                source_dict['flags'] = ' '.join(sorted(owners + ['ip']))
+                if nxos_json.to_bool(route_row.get('bidir')):
+                    source_dict['bidir'] = True
+                if route_row.get('oif-count') not in (None, ''):
+                    source_dict['oil_count'] = int(route_row['oif-count'])
+
+                incoming_interface = route_row.get('route-iif')
+                if incoming_interface:
+                    intf_dict = source_dict.setdefault(
+                        'incoming_interface_list', {}).setdefault(
+                            nxos_json.to_str(incoming_interface), {})
+                    rpf_nbr = route_row.get('rpf-nbr') or \
+                        route_row.get('rpf-nbr-1')
+                    if rpf_nbr:
+                        intf_dict['rpf_nbr'] = nxos_json.to_str(rpf_nbr)
+                    if nxos_json.to_bool(route_row.get('internal')):
+                        intf_dict['internal'] = True
+
+                # {"oif-name": "loopback2", "oif-uptime": "P3DT11H",
+                #  "TABLE_oif_mpib": {"ROW_oif_mpib": {"oif-mpib-name": "igmp"}}}
+                for oif_row in nxos_json.rows(route_row, 'oif'):
+                    oif_dict = source_dict.setdefault(
+                        'outgoing_interface_list', {}).setdefault(
+                            nxos_json.to_str(oif_row['oif-name']), {})
+                    if oif_row.get('oif-uptime'):
+                        oif_dict['oil_uptime'] = Common().convert_xml_time(
+                            nxos_json.to_str(oif_row['oif-uptime']))
+                    oif_owners = [
+                        nxos_json.to_str(mpib_row['oif-mpib-name'])
+                        for mpib_row in nxos_json.rows(oif_row, 'oif_mpib')]
+                    if oif_owners:
+                        oif_dict['oil_flags'] = ' '.join(sorted(oif_owners))
+
+        return mroute_dict
+
 
 # =====================================
 # Schema for 'show ipv6 mroute vrf all'
@@ -224,7 +307,7 @@ class ShowIpMrouteVrfAll(ShowIpMrouteVrfAllSchema):
 
 class ShowIpv6MrouteVrfAllSchema(MetaParser):
     """Schema for show ipv6 mroute vrf all"""
-    schema = {'vrf': 
+    schema = LazySchema(lambda: {'vrf': 
                 {Any():
                     {'address_family':
                         {Any(): 
@@ -256,7 +339,7 @@ class ShowIpv6MrouteVrfAllSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
     """Parser for show ipv6 mroute vrf all"""
@@ -440,7 +523,7 @@ class ShowIpv6MrouteVrfAll(ShowIpv6MrouteVrfAllSchema):
 class ShowIpStaticRouteMulticastSchema(MetaParser):
     """Schema for show ip static-route multicast vrf all"""
 
-    schema = {'vrf': 
+    schema = LazySchema(lambda: {'vrf': 
                 {Any():
                     {Optional('address_family'):
                         {Any():
@@ -460,7 +543,7 @@ class ShowIpStaticRouteMulticastSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 
 class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
@@ -603,7 +686,7 @@ class ShowIpStaticRouteMulticast(ShowIpStaticRouteMulticastSchema):
 class ShowIpv6StaticRouteMulticastSchema(MetaParser):
     """Schema for show ipv6 static-route multicast vrf all"""
 
-    schema = {'vrf':
+    schema = LazySchema(lambda: {'vrf':
                 {Any():
                     {'address_family':
                         {Any():
@@ -628,7 +711,7 @@ class ShowIpv6StaticRouteMulticastSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 class ShowIpv6StaticRouteMulticast(ShowIpv6StaticRouteMulticastSchema):
     """Parser for show ipv6 static-route multicast vrf all"""
@@ -779,7 +862,7 @@ class ShowForwardingDistributionMulticastRouteSchema(MetaParser):
         show forwarding distribution multicast route vrf <vrf>
         show forwarding distribution multicast route vrf all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         "distribution": {
             "multicast": {
                 "route": {
@@ -819,7 +902,7 @@ class ShowForwardingDistributionMulticastRouteSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =================================================================
@@ -19,6 +19,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
@@ -36,7 +37,7 @@ class ShowIpv6MldInterfaceSchema(MetaParser):
         show ipv6 mld interface vrf all
         show ipv6 mld interface vrf <vrf>"""
 
-    schema = {'vrfs': {
+    schema = LazySchema(lambda: {'vrfs': {
                 Any(): {
                     Optional('count'): int,
                     Optional('interface'): {
@@ -100,7 +101,7 @@ class ShowIpv6MldInterfaceSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class ShowIpv6MldInterface(ShowIpv6MldInterfaceSchema):
     """Parser for:
@@ -509,7 +510,7 @@ class ShowIpv6MldGroupsSchema(MetaParser):
         show ipv6 mld groups vrf all
         show ipv6 mld groups vrf <vrf>"""
 
-    schema = {'vrfs': {
+    schema = LazySchema(lambda: {'vrfs': {
                 Any(): {
                     'groups_count': int,
                     Optional('interface'): {
@@ -534,7 +535,7 @@ class ShowIpv6MldGroupsSchema(MetaParser):
                     },
                 },
             }
-        }
+        })
 
 class ShowIpv6MldGroups(ShowIpv6MldGroupsSchema):
     """Parser for:
@@ -706,7 +707,7 @@ class ShowIpv6MldLocalGroupsSchema(MetaParser):
         show ipv6 mld local-groups vrf all
         show ipv6 mld local-groups vrf <vrf>"""
 
-    schema = {'vrfs': {
+    schema = LazySchema(lambda: {'vrfs': {
                 Any(): {
                     Optional('interface'): {
                         Any(): {
@@ -738,7 +739,7 @@ class ShowIpv6MldLocalGroupsSchema(MetaParser):
                     },
                 },
             }
-        }
+        })
 
 class ShowIpv6MldLocalGroups(ShowIpv6MldLocalGroupsSchema):
     """Parser for:
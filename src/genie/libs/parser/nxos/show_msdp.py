@@ -15,6 +15,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # ====================================================
@@ -24,7 +25,7 @@ class ShowIpMsdpPeerVrfSchema(MetaParser):
     """Schema for:
         show show ip msdp peer vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'peer': {
@@ -93,7 +94,7 @@ class ShowIpMsdpPeerVrfSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ====================================================
@@ -412,7 +413,7 @@ class ShowIpMsdpSaCacheDetailVrfSchema(MetaParser):
     """Schema for:
         show ip msdp sa-cache detail vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'sa_cache': {
@@ -432,7 +433,7 @@ class ShowIpMsdpSaCacheDetailVrfSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ====================================================
@@ -520,7 +521,7 @@ class ShowIpMsdpPolicyStatisticsSaPolicyInOutSchema(MetaParser):
         show ip msdp policy statistics sa-policy <address> in
         show ip msdp policy statistics sa-policy <address> out"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'peer': {
@@ -551,7 +552,7 @@ class ShowIpMsdpPolicyStatisticsSaPolicyInOutSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # =====================================================================
@@ -704,7 +705,7 @@ class ShowIpMsdpSummarySchema(MetaParser):
         show ip msdp summary vrf all
         show ip msdp summary vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'local_as': int,
@@ -728,7 +729,7 @@ class ShowIpMsdpSummarySchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ============================================
@@ -839,7 +840,7 @@ class ShowRunningConfigMsdpSchema(MetaParser):
     """Schema for:
         show run msdp [| sec vrf | inc <pip_str>]"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('global'): {
@@ -861,7 +862,7 @@ class ShowRunningConfigMsdpSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =======================================================
@@ -26,6 +26,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.utils.common import Common
 # ====================================================
@@ -37,7 +38,7 @@ class ShowIpv6NeighborDetailSchema(MetaParser):
         show ipv6 neighbor detail vrf all
         show ipv6 neighbor detail vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('interfaces'): {
             Any(): {
                 'interface': str,
@@ -65,7 +66,7 @@ class ShowIpv6NeighborDetailSchema(MetaParser):
         },
         'adjacency_statistics_last_updated_before': str,
         'total_number_of_entries': int
-    }
+    })
 
 
 # ====================================================
@@ -215,7 +216,7 @@ class ShowIpv6NdInterfaceSchema(MetaParser):
         show ipv6 nd interface <interface> vrf all
         show ipv6 nd interface <interface> vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any(): {
                 'interfaces': {
@@ -266,7 +267,7 @@ class ShowIpv6NdInterfaceSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ====================================================
@@ -566,7 +567,7 @@ class ShowIpv6IcmpNeighborDetailSchema(MetaParser):
         show ipv6 icmp neighbor <interface> detail vrf all
         show ipv6 icmp neighbor <interface> detail vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'interface': str,
@@ -581,7 +582,7 @@ class ShowIpv6IcmpNeighborDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ====================================================
@@ -675,7 +676,7 @@ class ShowIpv6RoutersSchema(MetaParser):
         show ipv6 routers vrf all
         show ipv6 routers vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'interfaces': {
             Any(): {
                 'interface': str,
@@ -705,7 +706,7 @@ class ShowIpv6RoutersSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ====================================================
@@ -12,6 +12,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
@@ -24,7 +25,7 @@ from genie.libs.parser.utils.common import Common
 class ShowNtpPeerStatusSchema(MetaParser):
     """Schema for show ntp peer-status"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'total_peers': int,
         'vrf': {
             Any():{
@@ -51,7 +52,7 @@ class ShowNtpPeerStatusSchema(MetaParser):
                 Optional('root_delay'): float,
             }
         }
-    }
+    })
 
 # ==============================================
 #  Parser for show ntp peer-status
@@ -181,7 +182,7 @@ class ShowNtpPeerStatus(ShowNtpPeerStatusSchema):
 class ShowNtpPeersSchema(MetaParser):
     """Schema for: show ntp peers"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'peer': {
             Any():{
                 'isconfigured': {
@@ -193,7 +194,7 @@ class ShowNtpPeersSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowNtpPeers(ShowNtpPeersSchema):
     """Parser for: show ntp peers"""
@@ -29,6 +29,7 @@ from netaddr import IPNetwork
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -41,7 +42,7 @@ class ShowIpOspfSchema(MetaParser):
         show ip ospf
         show ip ospf vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -187,7 +188,7 @@ class ShowIpOspfSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 
 # ======================================
@@ -853,7 +854,7 @@ class ShowIpOspfMplsLdpInterfaceSchema(MetaParser):
         show ip ospf mpls ldp interface
         show ip ospf mpls ldp interface vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -930,7 +931,7 @@ class ShowIpOspfMplsLdpInterfaceSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =========================================================
@@ -1555,7 +1556,7 @@ class ShowIpOspfVirtualLinksSchema(MetaParser):
         show ip ospf virtual-links
         show ip ospf virtual-links vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -1629,7 +1630,7 @@ class ShowIpOspfVirtualLinksSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ====================================================
@@ -1664,7 +1665,7 @@ class ShowIpOspfShamLinksSchema(MetaParser):
         show ip ospf sham-links
         show ip ospf sham-links vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -1743,7 +1744,7 @@ class ShowIpOspfShamLinksSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # =================================================
@@ -1773,7 +1774,7 @@ class ShowIpOspfInterfaceSchema(MetaParser):
         show ip ospf interface
         show ip ospf interface vrf <WORD>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -1911,7 +1912,7 @@ class ShowIpOspfInterfaceSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ================================================
@@ -2360,7 +2361,7 @@ class ShowIpOspfNeighborDetailSchema(MetaParser):
         show ip ospf neighbors detail
         show ip ospf neighbors detail vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -2449,7 +2450,7 @@ class ShowIpOspfNeighborDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # =======================================================
@@ -3337,7 +3338,7 @@ class ShowIpOspfDatabaseExternalDetailSchema(MetaParser):
         show ip ospf database external detail
         show ip ospf database external detail vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -3394,7 +3395,7 @@ class ShowIpOspfDatabaseExternalDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===================================================================
@@ -3429,7 +3430,7 @@ class ShowIpOspfDatabaseNetworkDetailSchema(MetaParser):
         show ip ospf database network detail
         show ip ospf database network detail vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -3480,7 +3481,7 @@ class ShowIpOspfDatabaseNetworkDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===============================================================
@@ -3517,7 +3518,7 @@ class ShowIpOspfDatabaseSummaryDetailSchema(MetaParser):
         show ip ospf database summary detail
         show ip ospf database summary detail vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -3571,7 +3572,7 @@ class ShowIpOspfDatabaseSummaryDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ===============================================================
@@ -3608,7 +3609,7 @@ class ShowIpOspfDatabaseRouterDetailSchema(MetaParser):
         show ip ospf database router detail
         show ip ospf database router detail vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -3671,7 +3672,7 @@ class ShowIpOspfDatabaseRouterDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==============================================================
@@ -3708,7 +3709,7 @@ class ShowIpOspfDatabaseOpaqueAreaDetailSchema(MetaParser):
         show ip ospf database opaque-area detail
         show ip ospf database opaque-area detail vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': 
             {Any(): 
                 {'address_family': 
@@ -3786,7 +3787,7 @@ class ShowIpOspfDatabaseOpaqueAreaDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 
 # ==================================================================
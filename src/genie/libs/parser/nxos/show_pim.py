@@ -1,5 +1,6 @@
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -10,7 +11,7 @@ from genie.libs.parser.utils.common import Common
 class ShowIpv6PimInterfaceSchema(MetaParser):
     """Schema for show ipv6 pim interface"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'interfaces':{
@@ -83,7 +84,7 @@ class ShowIpv6PimInterfaceSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ==========================================================
 #  parser for show ipv6 pim interface vrf <word>
@@ -682,7 +683,7 @@ class ShowPimRpSchema(MetaParser):
         show ipv6 pim rp
         show ipv6 pim rp vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'address_family':{
@@ -780,7 +781,7 @@ class ShowPimRpSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ==========================================================
 #  parser for 'show ip/ipv6 pim rp [vrf <vrf>]'
@@ -1379,7 +1380,7 @@ class ShowIpv6PimDfSchema(MetaParser):
         show ipv6 pim df
         show ipv6 pim df vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -1407,7 +1408,7 @@ class ShowIpv6PimDfSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ==========================================================
@@ -1572,7 +1573,7 @@ class ShowIpPimDfSchema(MetaParser):
         show ip pim df
         show ip pim df vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -1602,7 +1603,7 @@ class ShowIpPimDfSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ==========================================================
@@ -1768,7 +1769,7 @@ class ShowIpv6PimRouteSchema(MetaParser):
     """Schema for:
         show ipv6 pim route
         show ipv6 pim route vrf <vrf>"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'address_family':{
@@ -1803,7 +1804,7 @@ class ShowIpv6PimRouteSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ==========================================================
 #  parser for show ipv6 pim route
@@ -2041,7 +2042,7 @@ class ShowIpv6PimRoute(ShowIpv6PimRouteSchema):
 # ===========================================
 class ShowIpv6PimNeighborSchema(MetaParser):
     """Schema for show ipv6 pim neighbor"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'interfaces':{
@@ -2066,7 +2067,7 @@ class ShowIpv6PimNeighborSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ==========================================================
@@ -2242,7 +2243,7 @@ class ShowIpPimRouteSchema(MetaParser):
         show ip pim route
         show ip pim route vrf <vrf>"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'address_family':{
@@ -2276,7 +2277,7 @@ class ShowIpPimRouteSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ==========================================================
 #  parser for show ip pim route
@@ -2498,7 +2499,7 @@ class ShowIpPimRoute(ShowIpPimRouteSchema):
 class ShowIpv6PimGroupRangeSchema(MetaParser):
     """Schema for show ipv6 pim group-range"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'address_family':{
@@ -2518,7 +2519,7 @@ class ShowIpv6PimGroupRangeSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ==========================================================
@@ -2620,7 +2621,7 @@ class ShowIpv6PimGroupRange(ShowIpv6PimGroupRangeSchema):
 # ==================================================
 class ShowIpPimNeighborSchema(MetaParser):
     """Schema for show ip pim neighbor"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'interfaces':{
@@ -2643,7 +2644,7 @@ class ShowIpPimNeighborSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ==========================================================
 #  parser for show ip pim neighbor vrf all
@@ -2765,7 +2766,7 @@ class ShowIpPimNeighbor(ShowIpPimNeighborSchema):
 # ==============================================
 class ShowIpPimVrfDetailSchema(MetaParser):
     """Schema for show ip pim vrf all detail"""
-    schema = {
+    schema = LazySchema(lambda: {
             'vrf':{
                 Any():{
                     'address_family':{
@@ -2805,7 +2806,7 @@ class ShowIpPimVrfDetailSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # ==========================================================
 #  parser for show ip pim vrf all detail
@@ -3098,7 +3099,7 @@ class ShowIpPimVrfDetail(ShowIpPimVrfDetailSchema):
 class ShowIpPimGroupRangeSchema(MetaParser):
     '''Schema for show ip pim group-range'''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'address_family':{
@@ -3118,7 +3119,7 @@ class ShowIpPimGroupRangeSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ==========================================================
@@ -3221,7 +3222,7 @@ class ShowIpPimGroupRange(ShowIpPimGroupRangeSchema):
 class ShowIpPimPolicyStaticticsRegisterPolicySchema(MetaParser):
     """Schema show ip pim policy statictics register_policy"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
             'address_family':{
@@ -3245,7 +3246,7 @@ class ShowIpPimPolicyStaticticsRegisterPolicySchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # =======================================================================
 #  parser for show ip pim policy statistics register-policy
@@ -3432,7 +3433,7 @@ class ShowIpPimPolicyStaticticsRegisterPolicy(ShowIpPimPolicyStaticticsRegisterP
 class ShowIpPimInterfaceSchema(MetaParser):
     """Schema for show ip pim interface"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
                 'interfaces':{
@@ -3505,7 +3506,7 @@ class ShowIpPimInterfaceSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ==========================================================
 #  parser for show ip pim interface vrf <word>
@@ -4076,7 +4077,7 @@ class ShowIpPimInterface(ShowIpPimInterfaceSchema):
 class ShowIpv6PimVrfAllDetailSchema(MetaParser):
     """Schema for show ipv6 pim vrf all detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf':{
             Any():{
             'address_family':{
@@ -4096,7 +4097,7 @@ class ShowIpv6PimVrfAllDetailSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ==========================================================
 #  parser for show ipv6 pim vrf all detail
@@ -4218,7 +4219,7 @@ class ShowIpv6PimVrfAllDetail(ShowIpv6PimVrfAllDetailSchema):
 class ShowRunningConfigPimSchema(MetaParser):
     """Schema for show running-config pim"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('feature_pim'): bool,
         Optional('feature_pim6'): bool,
         Optional('vrf'): {
@@ -4269,7 +4270,7 @@ class ShowRunningConfigPimSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ====================================
 # Parser for 'show running-config pim'
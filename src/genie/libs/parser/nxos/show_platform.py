@@ -9,6 +9,7 @@ NXOS parser class for below commands:
         show cores
 """
 import re
+from genie.libs.parser.base import LazySchema
 
 try:
     from pyats import tcl
@@ -32,7 +33,7 @@ def regexp(expression):
 class ShowVersionSchema(MetaParser):
     """Schema for show version"""
 
-    schema = {'platform':
+    schema = LazySchema(lambda: {'platform':
                   {Optional('name'): str,
                    Optional('reason'): str,
                    Optional('system_version'): str,
@@ -63,7 +64,7 @@ class ShowVersionSchema(MetaParser):
                        Optional('system_compile_time'): str,
                        Optional('system_image_file'): str}
                   }
-              }
+              })
 
 class ShowVersion(ShowVersionSchema):
     """Parser for :
@@ -374,7 +375,7 @@ class ShowVersion(ShowVersionSchema):
 
 class ShowInventorySchema(MetaParser):
     """Schema for show inventory"""
-    schema = {'name':
+    schema = LazySchema(lambda: {'name':
                 {Any():
                     {'description': str,
                      'slot': str,
@@ -382,7 +383,7 @@ class ShowInventorySchema(MetaParser):
                      Optional('vid'): str,
                      Optional('serial_number'): str}
                 },
-            }
+            })
 
 
 class ShowInventory(ShowInventorySchema):
@@ -448,14 +449,14 @@ class ShowInventory(ShowInventorySchema):
 
 class ShowInstallActiveSchema(MetaParser):
     """Schema for show install active"""
-    schema = {'boot_images':
+    schema = LazySchema(lambda: {'boot_images':
                 {Optional('kickstart_image'): str,
                  Optional('system_image'): str},
               Optional('active_packages'):
                 {Any():
                   {Optional('active_package_name'): str}
                 },
-              }
+              })
 
 
 class ShowInstallActive(ShowInstallActiveSchema):
@@ -549,7 +550,7 @@ class ShowRedundancyStatusSchema(MetaParser):
         show redundancy status
         show system redundancy status"""
 
-    schema = {'redundancy_mode':
+    schema = LazySchema(lambda: {'redundancy_mode':
                   {'administrative': str,
                    'operational': str},
               Any():
@@ -559,7 +560,7 @@ class ShowRedundancyStatusSchema(MetaParser):
               Optional('system_start_time'): str,
               Optional('system_uptime'): str,
               Optional('kernel_uptime'): str,
-              Optional('active_supervisor_time'): str}
+              Optional('active_supervisor_time'): str})
 
 
 class ShowRedundancyStatus(ShowRedundancyStatusSchema):
@@ -678,7 +679,7 @@ class ShowSystemRedundancyStatus(ShowRedundancyStatus):
 class ShowBootSchema(MetaParser):
     """Schema for show boot"""
 
-    schema = {'current_boot_variable':
+    schema = LazySchema(lambda: {'current_boot_variable':
                   {Optional('sup_number'):
                       {Any():
                           {Optional('kickstart_variable'): str,
@@ -698,7 +699,7 @@ class ShowBootSchema(MetaParser):
                   Optional('kickstart_variable'): str,
                   Optional('system_variable'): str,
                   Optional('boot_poap'):str}
-              }
+              })
 
 class ShowBoot(ShowBootSchema):
     """Parser for show boot"""
@@ -860,7 +861,7 @@ class ShowBoot(ShowBootSchema):
 
 class ShowModuleSchema(MetaParser):
     """Schema for show module"""
-    schema = {'slot':
+    schema = LazySchema(lambda: {'slot':
                   {'rp':
                     {Any():
                       {Any():
@@ -901,7 +902,7 @@ class ShowModuleSchema(MetaParser):
                        Optional('mac_address'): str,
                        Optional('serial_number'): str}
                   },
-              }
+              })
 
 class ShowModule(ShowModuleSchema):
     """Parser for show module"""
@@ -1062,7 +1063,7 @@ class ShowModule(ShowModuleSchema):
 
 class DirSchema(MetaParser):
     """Schema for dir"""
-    schema = {'disk_used_space': str,
+    schema = LazySchema(lambda: {'disk_used_space': str,
               'disk_free_space': str,
               'disk_total_space': str,
               'dir': str,
@@ -1072,7 +1073,7 @@ class DirSchema(MetaParser):
                        'date': str,
                        'time': str}
                   },
-              }
+              })
 
 class Dir(DirSchema):
     """Parser for dir"""
@@ -1140,7 +1141,7 @@ class Dir(DirSchema):
 
 class ShowVdcDetailSchema(MetaParser):
     """Schema for show vdc detail"""
-    schema = {'vdc':
+    schema = LazySchema(lambda: {'vdc':
                 {Any():
                   {'name': str,
                   'state': str,
@@ -1158,7 +1159,7 @@ class ShowVdcDetailSchema(MetaParser):
                   'type': str,
                   'supported_linecards': str}
                 },
-            }
+            })
 
 class ShowVdcDetail(ShowVdcDetailSchema):
     """Parser for show vdc detail"""
@@ -1297,12 +1298,12 @@ class ShowVdcCurrentSchema(MetaParser):
         * show vdc current-vdc
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         'current_vdc':
             {'id': str,
             'name': str,
             }
-        }
+        })
 
 class ShowVdcCurrent(ShowVdcCurrentSchema):
     '''Parser for:
@@ -1340,7 +1341,7 @@ class ShowVdcCurrent(ShowVdcCurrentSchema):
 
 class ShowVdcMembershipStatusSchema(MetaParser):
     """Schema for show vdc membership status"""
-    schema = {'virtual_device':
+    schema = LazySchema(lambda: {'virtual_device':
                 {Any():
                     {'membership':
                         {Any():
@@ -1351,7 +1352,7 @@ class ShowVdcMembershipStatusSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 class ShowVdcMembershipStatus(ShowVdcMembershipStatusSchema):
     """Parser for show vdc membership status"""
@@ -1422,7 +1423,7 @@ class ShowProcessesMemorySchema(MetaParser):
                   show processes memory | include <WORD>
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'pid': {
             Any(): {
                 'index': {
@@ -1438,7 +1439,7 @@ class ShowProcessesMemorySchema(MetaParser):
             }
         },
         Optional('all_mem_alloc'): int,
-    }
+    })
 
 
 class ShowProcessesMemory(ShowProcessesMemorySchema):
@@ -1507,7 +1508,7 @@ class ShowProcessesCpuSchema(MetaParser):
                   show processes cpu | include <WORD>
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('five_sec_cpu_interrupts'): int,
         Optional('five_sec_cpu_total'): int,
         Optional('one_min_cpu'): int,
@@ -1525,7 +1526,7 @@ class ShowProcessesCpuSchema(MetaParser):
                 'process': str,
             }
         }
-    }
+    })
 
 
 class ShowProcessesCpu(ShowProcessesCpuSchema):
@@ -1609,7 +1610,7 @@ class ShowProcessesCpu(ShowProcessesCpuSchema):
 class ShowCoresSchema(MetaParser):
     """Schema for show cores"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'date': {
             str: {
                 'pid': {
@@ -1622,7 +1623,7 @@ class ShowCoresSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowCores(ShowCoresSchema):
@@ -12,6 +12,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 
@@ -25,7 +26,7 @@ class ShowIpPrefixListSchema(MetaParser):
         show ip prefix-list
         show ipv6 prefix-list"""
 
-    schema = {'prefix_set_name':         
+    schema = LazySchema(lambda: {'prefix_set_name':         
                 {Any(): {
                     'prefix_set_name': str,
                     'protocol': str,
@@ -40,7 +41,7 @@ class ShowIpPrefixListSchema(MetaParser):
                         },
                     },
                 },
-            }
+            })
 
 class ShowIpPrefixList(ShowIpPrefixListSchema):
     """Parser for show ip prefix-list detail"""
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -18,7 +19,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 # ====================================================================
 class ShowProcessesSchema(MetaParser):    
     """Schema for show processes <process>"""
-    schema = {'process': {
+    schema = LazySchema(lambda: {'process': {
                 Any(): {
                     Optional('pid'): {
                         Any(): {
@@ -37,7 +38,7 @@ class ShowProcessesSchema(MetaParser):
                     Optional('process'): str,
                 },
             }
-        }
+        })
 
 class ShowProcesses(ShowProcessesSchema):
     """Parser for show processes <process>"""
@@ -23,6 +23,7 @@ NXOS parser class for below commands:
 """
 import xmltodict
 import re
+from genie.libs.parser.base import LazySchema
 
 try:
     from pyats import tcl
@@ -43,7 +44,7 @@ def regexp(expression):
 
 class ShowIpRipSchema(MetaParser):
     """Schema for show ip rip vrf all"""
-    schema = {'process':
+    schema = LazySchema(lambda: {'process':
                 {regexp('rip-(.*)'):
                     {'vrf':
                         {Any():
@@ -61,7 +62,7 @@ class ShowIpRipSchema(MetaParser):
                         }
                     }
                 }
-            }
+            })
 
 
 # class ShowIpRipVrfAll(ShowIpRipSchema, MetaParser):
@@ -183,7 +184,7 @@ class ShowRunRip(MetaParser):
 
 class ShowIpRipNeighborSchema(MetaParser):
     """Schema for show ip rip neighbor vrf all"""
-    schema = {'interfaces': str,
+    schema = LazySchema(lambda: {'interfaces': str,
               'process_id':
                   {regexp('rip-(.*)'):
                        {'vrf':
@@ -204,7 +205,7 @@ class ShowIpRipNeighborSchema(MetaParser):
                             }
                        }
                   }
-             }
+             })
 
 class ShowIpRipNeighborVrfAll(ShowIpRipNeighborSchema, MetaParser):
     """Parser for:
@@ -286,7 +287,7 @@ class ShowIpv6RipNeighborVrfAll(ShowIpRipNeighborSchema, MetaParser):
 
 class ShowIpRipInterfaceSchema(MetaParser):
     """Schema for show ip rip interface vrf all"""
-    schema = {regexp('rip-(.*)'):
+    schema = LazySchema(lambda: {regexp('rip-(.*)'):
                 {Any():
                      {Any():
                           {'address': str,
@@ -299,7 +300,7 @@ class ShowIpRipInterfaceSchema(MetaParser):
                            'split_horizon': str}
                      }
                 }
-            }
+            })
 
 
 class ShowIpRipInterfaceVrfAll(ShowIpRipInterfaceSchema,MetaParser):
@@ -382,7 +383,7 @@ class ShowIpv6RipInterfaceVrfAll(ShowIpRipInterfaceSchema,MetaParser):
 
 class ShowIpRipStatisticsSchema(MetaParser):
     """Schema for show ip rip statistics"""
-    schema = {'process':
+    schema = LazySchema(lambda: {'process':
                   {regexp('rip-(.*)'):
                        {'multicast_update_periodic': str,
                         'multicast_update_triggered': str,
@@ -396,7 +397,7 @@ class ShowIpRipStatisticsSchema(MetaParser):
                         'sent_uni_updates': str
                        }
                   }
-             }
+             })
 
 
 class ShowIpRipStatistics(ShowIpRipStatisticsSchema, MetaParser):
@@ -564,7 +565,7 @@ class ShowIpRipVrfAllSchema(MetaParser):
         * show ipv6 rip vrf <vrf>
         * show ipv6 rip vrf all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'isolate_mode': bool,
         'mmode': str,
         'vrf': {
@@ -600,7 +601,7 @@ class ShowIpRipVrfAllSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIpRipVrfAll(ShowIpRipVrfAllSchema):
@@ -796,7 +797,7 @@ class ShowIpRipRouteVrfAllSchema(MetaParser):
         * show ipv6 rip route vrf {vrf}
         * show ipv6 rip route vrf all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -826,7 +827,7 @@ class ShowIpRipRouteVrfAllSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIpRipRouteVrfAll(ShowIpRipRouteVrfAllSchema):
@@ -955,7 +956,7 @@ class ShowIpRipInterfaceVrfAllSchema(MetaParser):
         * show ip rip interface vrf {vrf}
         * show ip rip interface vrf all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'address_family': {
@@ -995,7 +996,7 @@ class ShowIpRipInterfaceVrfAllSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 class ShowIpRipInterfaceVrfAll(ShowIpRipInterfaceVrfAllSchema):
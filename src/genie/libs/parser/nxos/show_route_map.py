@@ -1,11 +1,12 @@
 import re   
 from genie.metaparser import MetaParser   
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional 
 
 
 class ShowRouteMapSchema(MetaParser):
     """Schema for show route-map"""
-    schema = {
+    schema = LazySchema(lambda: {
         Any():
             {Optional('description'): str,
              'statements':
@@ -58,7 +59,7 @@ class ShowRouteMapSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
     
 class ShowRouteMap(ShowRouteMapSchema):
     """Parser for show route-map"""
@@ -46,20 +46,24 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema, JSON_CONTEXT_LIST
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+                                                    CompiledMetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
                                          
 # import parser utils
-from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.common import Common, select_command
+from genie.libs.parser.utils import nxos_json
 
 # =================================
 # Parser for 'show routing vrf all'
 # =================================
 
-class ShowRoutingVrfAllSchema(MetaParser):
+class ShowRoutingVrfAllSchema(CompiledMetaParser):
     """Schema for show routing vrf all"""
 
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         'vrf': {
             Any(): {
                 Optional('address_family'): {
@@ -128,7 +132,7 @@ class ShowRoutingVrfAllSchema(MetaParser):
                 },
             },
         },
-    }
+    }))
 
 
 class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
@@ -327,7 +331,7 @@ class ShowIpRouteSummarySchema(MetaParser):
         * show ip route summary
         * show ip route summary vrf {vrf} """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 'backup_paths': {
@@ -343,7 +347,7 @@ class ShowIpRouteSummarySchema(MetaParser):
                 'total_routes': int,
               },
          },
-}
+})
 
 
 class ShowIpRouteSummary(ShowIpRouteSummarySchema):
@@ -457,7 +461,7 @@ class ShowIpRouteSummary(ShowIpRouteSummarySchema):
 #   show ip route interface {interface}
 #   show ip route interface {interface} vrf {vrf}
 # ====================================================
-class ShowIpRouteSchema(MetaParser):
+class ShowIpRouteSchema(CompiledMetaParser):
     """Schema for:
        show ip route
        show ip route vrf {vrf}
@@ -466,7 +470,7 @@ class ShowIpRouteSchema(MetaParser):
        show ip route interface {interface} vrf {vrf}
     """
 
-    schema = {
+    schema = LazySchema(lambda: CompiledSchema({
         'vrf': {
             Any(): {
                 Optional('address_family'): {
@@ -524,7 +528,7 @@ class ShowIpRouteSchema(MetaParser):
                 },
             },
         },
-    }
+    }))
 
 
 # ====================================================
@@ -585,6 +589,8 @@ class ShowIpRoute(ShowIpRouteSchema):
                     'show ip route vrf {vrf}',
                     'show ip route vrf all',
                     'show ip route']
+    json_command = [command + nxos_json.JSON_PIPE for command in cli_command]
+    CONTEXT_LIST = JSON_CONTEXT_LIST
     exclude = [
         'updated']
 
@@ -952,6 +958,154 @@ class ShowIpRoute(ShowIpRouteSchema):
                     
         return result_dict
 
+    # Flags of a ROW_path, and their next_hop_list key
+    JSON_PATH_FLAGS = (('mpls', 'mpls'), ('mpls-vpn', 'mpls_vpn'),
+                       ('evpn', 'evpn'), ('stale', 'stale'))
+
+    def json(self, route=None, protocol=None, vrf=None, interface=None,
+             output=None):
+        if output is None:
+            cmd = select_command(self.json_command, route=route,
+                                 protocol=protocol, vrf=vrf,
+                                 interface=interface)
+            output = self.device.execute(cmd)
+
+        result_dict = {}
+        data = nxos_json.loads(output)
+
+        # {"vrf-name-out": "default", "TABLE_addrf": {...}}
+        for vrf_row in nxos_json.rows(data, 'vrf'):
+            vrf_dict = result_dict.setdefault('vrf', {}).setdefault(
+                nxos_json.to_str(vrf_row['vrf-name-out']), {})
+
+            # {"addrf": "ipv4", "TABLE_prefix": {...}}
+            for af_row in nxos_json.rows(vrf_row, 'addrf'):
+                routes_dict = None
+
+                # {"ipprefix": "10.4.1.1/32", "ucast-nhops": "2",
+                #  "mcast-nhops": "0", "attached": "false", "TABLE_path": {...}}
+                for prefix_row in nxos_json.rows(af_row, 'prefix'):
+                    route = prefix_row.get('ipprefix') or \
+                        prefix_row['ipv6prefix']
+                    if routes_dict is None:
+                        af = af_row.get('addrf') or \
+                            ('ipv6' if ':' in route else 'ipv4')
+                        routes_dict = vrf_dict.setdefault('address_family', {})\
+                            .setdefault(af, {}).setdefault('routes', {})
+
+                    route_dict = routes_dict.setdefault(route, {})
+                    route_dict.update({'route': route})
+                    route_dict.update({'active': True})
+                    if prefix_row.get('ucast-nhops') not in (None, ''):
+                        route_dict.update(
+                            {'ubest': int(prefix_row['ucast-nhops'])})
+                    if prefix_row.get('mcast-nhops') not in (None, ''):
+                        route_dict.update(
+                            {'mbest': int(prefix_row['mcast-nhops'])})
+                    if nxos_json.to_bool(prefix_row.get('attached')):
+                        route_dict.update({'attached': True})
+
+                    for index, path_row in enumerate(
+                            nxos_json.rows(prefix_row, 'path'), start=1):
+                        self._json_path(route_dict, index, path_row)
+
+        return result_dict
+
+    def _json_path(self, route_dict, index, path_row):
+        '''Map one ROW_path, the "*via ..." line of the cli output'''
+
+        # {"ipnexthop": "10.1.3.1", "ifname": "Eth1/2", "uptime": "PT1H1M18S",
+        #  "pref": "110", "metric": "41", "clientname": "ospf-1",
+        #  "type": "intra", "ubest": "true", "tag": "100"}
+        next_hop = path_row.get('ipnexthop') or path_row.get('ipv6nexthop')
+        interface = path_row.get('ifname')
+        if interface:
+            interface = Common.convert_intf_name(interface)
+        updated = path_row.get('uptime')
+        if updated:
+            updated = Common().convert_xml_time(updated)
+
+        cast = None
+        if nxos_json.to_bool(path_row.get('ubest')):
+            cast = 'best_ucast_nexthop'
+        elif nxos_json.to_bool(path_row.get('mbest')):
+            cast = 'best_mcast_nexthop'
+
+        route_preference = metric = None
+        if path_row.get('pref') not in (None, ''):
+            route_preference = int(path_row['pref'])
+        if path_row.get('metric') not in (None, ''):
+            metric = int(path_row['metric'])
+        if cast:
+            if metric is not None:
+                route_dict.update({'metric': metric})
+            if route_preference is not None:
+                route_dict.update({'route_preference': route_preference})
+
+        source_protocol = nxos_json.to_str(path_row.get('clientname', ''))
+        if '-' in source_protocol:
+            source_protocol, process_id = source_protocol.split('-', 1)
+            route_dict.update({'process_id': process_id})
+        source_protocol_status = nxos_json.to_str(path_row.get('type', ''))
+
+        if path_row.get('tag') not in (None, ''):
+            route_dict.update({'tag': int(path_row['tag'])})
+        if nxos_json.to_bool(path_row.get('hidden')):
+            route_dict.update({'hidden': True})
+
+        next_hop_dict = route_dict.setdefault('next_hop', {})
+
+        if not next_hop:
+            interface_dict = next_hop_dict.setdefault('outgoing_interface', {})\
+                .setdefault(interface, {})
+            if interface:
+                interface_dict.update({'outgoing_interface': interface})
+            if updated:
+                interface_dict.update({'updated': updated})
+            return
+
+        next_hop_vrf = next_hop_af = None
+        if '%' in next_hop:
+            next_hop, next_hop_vrf = next_hop.split('%', 1)
+            if ':' in next_hop_vrf:
+                next_hop_vrf, next_hop_af = next_hop_vrf.split(':', 1)
+                next_hop_af = next_hop_af.lower()
+
+        index_dict = next_hop_dict.setdefault('next_hop_list', {})\
+            .setdefault(index, {})
+        index_dict.update({'index': index})
+        index_dict.update({'next_hop': next_hop})
+        if source_protocol:
+            route_dict.update({'source_protocol': source_protocol})
+            index_dict.update({'source_protocol': source_protocol})
+        if source_protocol_status:
+            route_dict.update({'source_protocol_status': source_protocol_status})
+            index_dict.update({'source_protocol_status': source_protocol_status})
+        if cast:
+            index_dict.update({cast: True})
+        if updated:
+            index_dict.update({'updated': updated})
+        if interface:
+            index_dict.update({'outgoing_interface': interface})
+        if next_hop_vrf:
+            index_dict.update({'next_hop_vrf': next_hop_vrf})
+        if next_hop_af:
+            index_dict.update({'next_hop_af': next_hop_af})
+        if metric is not None:
+            index_dict.update({'metric': metric})
+        if route_preference is not None:
+            index_dict.update({'route_preference': route_preference})
+
+        if path_row.get('segid') not in (None, ''):
+            index_dict.update({'segid': int(path_row['segid'])})
+        if path_row.get('tunnelid'):
+            index_dict.update({'tunnelid': nxos_json.to_str(path_row['tunnelid'])})
+        if path_row.get('encap'):
+            index_dict.update({'encap': nxos_json.to_str(path_row['encap']).lower()})
+        for key, flag in self.JSON_PATH_FLAGS:
+            if nxos_json.to_bool(path_row.get(key)):
+                index_dict.update({flag: True})
+
 
 # ====================================================
 #  parser for:
@@ -1011,6 +1165,7 @@ class ShowIpv6Route(ShowIpRoute):
                     'show ipv6 route vrf {vrf}',
                     'show ipv6 route vrf all',
                     'show ipv6 route']
+    json_command = [command + nxos_json.JSON_PIPE for command in cli_command]
 
     exclude = [
         'updated',
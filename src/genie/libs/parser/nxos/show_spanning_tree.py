@@ -10,6 +10,7 @@ NXOS parsers for the following show commands:
 # -*- coding: utf-8 -*-
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.utils.common import Common
 
@@ -22,7 +23,7 @@ class ShowSpanningTreeMstSchema(MetaParser):
             show spanning-tree mst detail
     '''
     
-    schema = {
+    schema = LazySchema(lambda: {
         'mstp' : {
             'mst_intances': {
                 Any() : { 
@@ -79,7 +80,7 @@ class ShowSpanningTreeMstSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowSpanningTreeMst(ShowSpanningTreeMstSchema):
@@ -262,7 +263,7 @@ class ShowSpanningTreeSummarySchema(MetaParser):
             show spanning-tree summary
     '''
 
-    schema = {
+    schema = LazySchema(lambda: {
         Optional('root_bridge_for'): str,
         Optional('mst_type'): str,
         'port_type_default': bool,
@@ -298,7 +299,7 @@ class ShowSpanningTreeSummarySchema(MetaParser):
             Optional('num_of_msts'): int,
             Optional('num_of_vlans'):int,
         },
-    }
+    })
 
 class ShowSpanningTreeSummary(ShowSpanningTreeSummarySchema):
     '''Parser class for:
@@ -466,7 +467,7 @@ class ShowSpanningTreeDetailSchema(MetaParser):
     '''Schema for:
             show spanning-tree detail
     '''
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {     # mstp, pvst, rapid_pvst
             Optional('domain'): str,
             Optional('pvst_id'): str,
@@ -543,7 +544,7 @@ class ShowSpanningTreeDetailSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 class ShowSpanningTreeDetail(ShowSpanningTreeDetailSchema):
     '''Parser for:
@@ -854,12 +855,12 @@ class ShowSpanningTreeDetail(ShowSpanningTreeDetailSchema):
 
 class ShowErrdisableRecoverySchema(MetaParser):
     """Schema for show errdisable recovery"""
-    schema = {
+    schema = LazySchema(lambda: {
         'errdisable_reason': {
             Any(): bool,
         },
         'timer_interval': int,
-    }
+    })
 
 
 class ShowErrdisableRecovery(ShowErrdisableRecoverySchema):
@@ -3,6 +3,7 @@
 """
 import re
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
@@ -12,7 +13,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 # ====================================================
 class ShowIpStaticRouteSchema(MetaParser):
     """Schema for show ip static-route"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('address_family'): {
@@ -45,7 +46,7 @@ class ShowIpStaticRouteSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 # ====================================================
 #  parser for show ip static-route
 # ====================================================
@@ -214,7 +215,7 @@ class ShowIpStaticRoute(ShowIpStaticRouteSchema):
 # ====================================================
 class ShowIpv6StaticRouteSchema(MetaParser):
     """chema for show ipv6 static-static"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('address_family'): {
@@ -253,7 +254,7 @@ class ShowIpv6StaticRouteSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 # ====================================================
 #  parser for show ipv6 static-route
 # ====================================================
@@ -10,6 +10,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
@@ -19,7 +20,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 # ====================================================================
 class ShowSystemInternalSysmgrServiceNameSchema(MetaParser):    
     """Schema for show system internal sysmgr service name <process>"""
-    schema = {'instance':
+    schema = LazySchema(lambda: {'instance':
                 {Any():
                     {'tag':
                         {Any():
@@ -39,7 +40,7 @@ class ShowSystemInternalSysmgrServiceNameSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 class ShowSystemInternalSysmgrServiceName(
     ShowSystemInternalSysmgrServiceNameSchema):
@@ -226,7 +227,7 @@ class ShowSystemInternalSysmgrServiceName(
 class ShowSystemInternalL2fwderMacSchema(MetaParser):    
     """Schema for show system internal l2fwder Mac"""
 
-    schema = {'vlans':
+    schema = LazySchema(lambda: {'vlans':
                 {Any():
                     {'mac_addresses':
                         {Any():
@@ -240,7 +241,7 @@ class ShowSystemInternalL2fwderMacSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 # ====================================================================
 # Parser for 'show system internal l2fwder Mac'
@@ -10,6 +10,7 @@ import xmltodict
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
@@ -23,9 +24,9 @@ from genie.libs.parser.utils.common import Common
 class ShowRunningConfigTrmSchema(MetaParser):
     """Schema for show running-config | sec '^advertise evpn multicast'"""
 
-    schema = {
+    schema = LazySchema(lambda: {
              Optional('advertise_evpn_multicast'): bool,
-    }
+    })
 
 
 # =================================================================================
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # import parser utils
@@ -20,7 +21,7 @@ class ShowVdcResourceDetailSchema(MetaParser):
         * show vdc resource {resource} detail
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "resources": {
             Any(): {
                 "total_used": int, 
@@ -39,7 +40,7 @@ class ShowVdcResourceDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowVdcResourceDetail(ShowVdcResourceDetailSchema):
     """Parser for
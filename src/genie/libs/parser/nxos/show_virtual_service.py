@@ -16,6 +16,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 
@@ -26,7 +27,7 @@ from genie.metaparser.util.schemaengine import Any, Optional
 class ShowVirtualServiceGlobalSchema(MetaParser):
     """Schema for "show virtual-service global"."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'version': str,
         'virtual_services': {
             'installed': int,
@@ -54,7 +55,7 @@ class ShowVirtualServiceGlobalSchema(MetaParser):
                 'available': int,
             },
         },
-    }
+    })
 
 
 # ========================================
@@ -179,14 +180,14 @@ class ShowVirtualServiceGlobal(ShowVirtualServiceGlobalSchema):
 class ShowVirtualServiceListSchema(MetaParser):
     """Schema for "show virtual-service list"."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'service': {
             Any(): {
                 'status': str,
                 Optional('package'): str,
             },
         },
-    }
+    })
 
 
 # ======================================
@@ -251,7 +252,7 @@ class ShowVirtualServiceCoreSchema(MetaParser):
       * show virtual-service core name <name>
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'cores': {
             Any(): {
                 'virtual_service': str,
@@ -260,7 +261,7 @@ class ShowVirtualServiceCoreSchema(MetaParser):
                 'date': str,
             }
         }
-    }
+    })
 
 
 # ====================================================
@@ -318,7 +319,7 @@ class ShowVirtualServiceDetailSchema(MetaParser):
       * show virtual-service detail name <name>
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'service': {
             Any(): {
                 'state': str,
@@ -353,7 +354,7 @@ class ShowVirtualServiceDetailSchema(MetaParser):
                 },
             }
         }
-    }
+    })
 
 
 # ============================================================================
@@ -591,7 +592,7 @@ class ShowGuestshellSchema(MetaParser):
     `["service"]["guestshell+"]` enclosing container.
     """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'state': str,
         'package_information': {
             'name': str,
@@ -622,7 +623,7 @@ class ShowGuestshellSchema(MetaParser):
                 Optional('alias'): str,
             },
         },
-    }
+    })
 
 
 # ============================================================================
@@ -648,7 +649,7 @@ class ShowGuestshell(ShowGuestshellSchema, ShowVirtualServiceDetail):
 class ShowVirtualServiceUtilizationSchema(MetaParser):
     """Schema for "show virtual-service utilization name <name>"."""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'cpu': {
             'requested_percent': int,
             'actual_percent': int,
@@ -667,7 +668,7 @@ class ShowVirtualServiceUtilizationSchema(MetaParser):
                 'used_percent': int,
             },
         },
-    }
+    })
 
 
 # =========================================================
@@ -12,6 +12,7 @@ import re
 
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional, \
@@ -26,7 +27,7 @@ from genie.libs.parser.utils.common import Common
 # ====================================================
 class ShowVlanSchema(MetaParser):
     """Schema for show vlan"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vlans':{
             Any():{
                 Optional('vlan_id'): str,
@@ -47,7 +48,7 @@ class ShowVlanSchema(MetaParser):
 
                 },
             },
-    }
+    })
 
 # ====================================================
 #  parser for show vlan
@@ -216,14 +217,14 @@ class ShowVlan(ShowVlanSchema):
 # ====================================================
 class ShowVlanIdVnSegmentSchema(MetaParser):
     """Schema for show vlan id 1-3967 vn_segment"""
-    schema = {
+    schema = LazySchema(lambda: {
         'vlans': {
             Any(): {
                 Optional('vlan_id'): str,
                 Optional('vn_segment_id'): int,
             },
         },
-    }
+    })
 
 # ====================================================
 #  parser for show vlan id 1-3967 vn-segment
@@ -269,11 +270,11 @@ class ShowVlanIdVnSegment(ShowVlanIdVnSegmentSchema):
 #Incomplete parser - to be completed 
 class ShowVlanInternalInfoSchema(MetaParser):
     """Schema for show vlan internal info"""
-    schema = {'vlan_id':
+    schema = LazySchema(lambda: {'vlan_id':
                 {Any():
                      {'vlan_configuration': bool}
                 },
-            }
+            })
 
 
 class ShowVlanInternalInfo(ShowVlanInternalInfoSchema):
@@ -325,11 +326,11 @@ class ShowVlanInternalInfo(ShowVlanInternalInfoSchema):
 
 class ShowVlanFilterSchema(MetaParser):
     """Schema show vlan filter"""
-    schema = {'vlan_id':
+    schema = LazySchema(lambda: {'vlan_id':
                 {Any():
                     {'access_map_tag':str}
                 },
-            }
+            })
 
 
 class ShowVlanFilter(ShowVlanFilterSchema):
@@ -385,7 +386,7 @@ class ShowVlanFilter(ShowVlanFilterSchema):
 
 class ShowVlanAccessMapSchema(MetaParser):
     """Schema for show vlan access-map"""
-    schema = {'access_map_id':
+    schema = LazySchema(lambda: {'access_map_id':
                 {Any():
                     {'access_map_sequence':
                         {Any():
@@ -395,7 +396,7 @@ class ShowVlanAccessMapSchema(MetaParser):
                         },
                     }
                 },
-            }
+            })
 
 
 class ShowVlanAccessMap(ShowVlanAccessMapSchema):
@@ -465,11 +466,11 @@ class ShowVlanAccessMap(ShowVlanAccessMapSchema):
 class ShowVxlanSchema(MetaParser):    
     """Schema for show vxlan"""
 
-    schema = {'vlan':
+    schema = LazySchema(lambda: {'vlan':
                 {Any():
                     {'vni': str}
                 },
-            }
+            })
 
 # ====================================================================
 # Parser for 'show vxlan'
@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 
 # import parser utils
@@ -22,7 +23,7 @@ from genie.libs.parser.utils.common import Common
 class ShowVpcSchema(MetaParser):
     """Schema for "show vpc"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vpc_domain_id': str,
         'vpc_peer_status': str,
         Optional('vpc_plus_switch_id'): str,
@@ -70,7 +71,7 @@ class ShowVpcSchema(MetaParser):
                 Optional('vpc_plus_attrib'): str
             }
         }
-    }
+    })
 
 
 # ========================================
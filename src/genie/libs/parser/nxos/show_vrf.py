@@ -11,6 +11,7 @@ import xmltodict
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
@@ -23,14 +24,14 @@ from genie.libs.parser.utils.common import Common
 class ShowVrfSchema(MetaParser):
     """Schema for show vrf"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrfs':
             {Any():
                 {'vrf_id': int,
                  'vrf_state': str,
                  'reason': str,},
             },
-        }
+        })
 
 class ShowVrf(ShowVrfSchema):
     """Parser for show vrf"""
@@ -76,14 +77,14 @@ class ShowVrf(ShowVrfSchema):
 class ShowVrfInterfaceSchema(MetaParser):
     """Schema for show vrf interface"""
 
-    schema = {
+    schema = LazySchema(lambda: {
             'vrf_interface':
                 {Any():
                     {'vrf_name': str,
                      'vrf_id': str,
                      'site_of_origin': str},
                 },
-            }
+            })
 
 class ShowVrfInterface(ShowVrfInterfaceSchema):
     """Parser for show vrf Interface"""
@@ -134,7 +135,7 @@ class ShowVrfInterface(ShowVrfInterfaceSchema):
 class ShowVrfDetailSchema(MetaParser):
     """Schema for show vrf <vrf> detail"""
 
-    schema = {Any():
+    schema = LazySchema(lambda: {Any():
                 {
                  'vrf_id':  int,
                  Optional('route_distinguisher'): str,
@@ -150,7 +151,7 @@ class ShowVrfDetailSchema(MetaParser):
                     },                        
                 }
             },
-        }
+        })
 
 class ShowVrfDetail(ShowVrfDetailSchema):
     """Parser for show vrf <vrf> detail"""
@@ -239,7 +240,7 @@ class ShowVrfDetail(ShowVrfDetailSchema):
 class ShowRunningConfigVrfSchema(MetaParser):
     """Schema for show running-config vrf <vrf> | sec '^vrf'"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vrf': {
             Any(): {
                 Optional('vrf_name'): str,
@@ -262,7 +263,7 @@ class ShowRunningConfigVrfSchema(MetaParser):
                 }
             },
         }
-    }
+    })
 
 # ========================================================================
 #  Schema for "Parser for show running-config vrf <vrf> | sec '^vrf'"
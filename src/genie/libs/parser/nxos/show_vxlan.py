@@ -24,13 +24,14 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 from genie.libs.parser.utils.common import Common
 
 
 class ShowL2routeEvpnImetAllDetailSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'vni': {
             Any(): {
                 'ip': {
@@ -50,7 +51,7 @@ class ShowL2routeEvpnImetAllDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 class ShowL2routeEvpnImetAllDetail(ShowL2routeEvpnImetAllDetailSchema):
 
@@ -113,7 +114,7 @@ class ShowNvePeersSchema(MetaParser):
     """Schema for:
         show nve peers"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         Any(): {
             'nve_name': str,
             'peer_ip': {
@@ -125,7 +126,7 @@ class ShowNvePeersSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ====================================================
@@ -188,7 +189,7 @@ class ShowNveVniSummarySchema(MetaParser):
     """Schema for:
         show nve vni summary"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'vni': {
             'summary': {
                 'cp_vni_count': int,
@@ -199,7 +200,7 @@ class ShowNveVniSummarySchema(MetaParser):
                 'dp_vni_down': int,
             },
         },
-    }
+    })
 # ====================================================
 #  parser for show nve vni summary
 # ====================================================
@@ -251,7 +252,7 @@ class ShowNveVniSchema(MetaParser):
     """Schema for:
         show nve vni"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         Any(): {
             'vni': {
                 Any(): {
@@ -264,7 +265,7 @@ class ShowNveVniSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ====================================================
 #  Parser for show nve vni
@@ -321,14 +322,14 @@ class ShowNveInterfaceSchema(MetaParser):
     """Schema for:
         show nve interface | i nve"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'nves':
             {Any():
                  {'nve_name': str,
                   'nve_state': str,
                  },
              },
-    }
+    })
 #=======================================
 #  show interface | i nve
 #=======================================
@@ -368,7 +369,7 @@ class ShowNveInterfaceDetailSchema(MetaParser):
     """Schema for:
         show nve interface <nve> detail"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         Any(): {
             'nve_name': str,
             Optional('if_state'): str,
@@ -404,7 +405,7 @@ class ShowNveInterfaceDetailSchema(MetaParser):
             Optional('multisite_bgw_if_oper_state_down_reason'): str,
             Optional('multisite_dci_advertise_pip'): bool,
         }
-    }
+    })
 
 # ====================================================
 #  schema for show nve interface <nve> detail
@@ -715,7 +716,7 @@ class ShowNveMultisiteDciLinksSchema(MetaParser):
     """Schema for:
         show nve multisite dci-links"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         'multisite': {
             Optional('dci_links'): {
                 Any():{
@@ -724,7 +725,7 @@ class ShowNveMultisiteDciLinksSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ====================================================
 #  Parser for show nve multisite dci-link
@@ -775,7 +776,7 @@ class ShowNveMultisiteFabricLinksSchema(MetaParser):
     """Schema for:
         show nve multisite fabric-links"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'multisite': {
             'fabric_links': {
                 Any(): {
@@ -784,7 +785,7 @@ class ShowNveMultisiteFabricLinksSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ====================================================
 #  Parser for show nve multisite fabric-link
@@ -836,7 +837,7 @@ class ShowNveEthernetSegmentSchema(MetaParser):
     """Schema for:
           show nve ethernet-segment"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         'nve':{
             Any():{
                 'ethernet_segment': {
@@ -867,7 +868,7 @@ class ShowNveEthernetSegmentSchema(MetaParser):
                 },
             },
         }
-    }
+    })
 
 # ==================================================
 #   Schema for show nve ethernet-segment
@@ -1087,7 +1088,7 @@ class ShowL2routeEvpnEternetSegmentAllSchema(MetaParser):
     """Schema for:
         show l2route evpn ethernet-segment all"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         'evpn': {
             'ethernet_segment': {
                 Any(): {
@@ -1099,7 +1100,7 @@ class ShowL2routeEvpnEternetSegmentAllSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 # ====================================================
 #  Parser for show l2route evpn ethernet-segment all
 # ====================================================
@@ -1153,7 +1154,7 @@ class ShowL2routeTopologyDetailSchema(MetaParser):
     """Schema for:
         show l2route topology detail"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         'topology': {
             'topo_id': {
                 Any(): {
@@ -1181,7 +1182,7 @@ class ShowL2routeTopologyDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 # ====================================================
 #  Parser for show l2route topology detail
 # ====================================================
@@ -1286,7 +1287,7 @@ class ShowL2routeMacAllDetailSchema(MetaParser):
     """Schema for:
         show l2route mac all detail"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         'topology': {
             'topo_id': {
                 Any(): {
@@ -1307,7 +1308,7 @@ class ShowL2routeMacAllDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 # ====================================================
 #  Parser for show l2route mac all detail
 # ====================================================
@@ -1406,7 +1407,7 @@ class ShowL2routeMacIpAllDetailSchema(MetaParser):
     """Schema for:
         show l2route mac-ip all detail"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         'topology': {
             'topo_id': {
                 Any(): {
@@ -1426,7 +1427,7 @@ class ShowL2routeMacIpAllDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 # ====================================================
 #  Parser for show l2route mac-ip all detail
 # ====================================================
@@ -1536,7 +1537,7 @@ class ShowL2routeSummarySchema(MetaParser):
     """Schema for:
         show l2route summary"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         'summary': {
             'total_memory': int,
             'numof_converged_tables': int,
@@ -1555,7 +1556,7 @@ class ShowL2routeSummarySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ====================================================
 #  Parser for show l2route summary
@@ -1650,7 +1651,7 @@ class ShowL2routeFlAllSchema(MetaParser):
     """Schema for:
         show l2route fl all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'topology': {
             'topo_id': {
                 Any():{
@@ -1666,7 +1667,7 @@ class ShowL2routeFlAllSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 # ====================================================
 #  Parser for show l2route fl all
@@ -1726,7 +1727,7 @@ class ShowRunningConfigNvOverlaySchema(MetaParser):
     """Schema for:
         show running-config nv overlay"""
 
-    schema = {
+    schema = LazySchema(lambda: {
             Optional('evpn_multisite_border_gateway'): int,
             Optional('multisite_convergence_time') : int,
             Optional('enabled_nv_overlay'): bool,
@@ -1762,7 +1763,7 @@ class ShowRunningConfigNvOverlaySchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 # ====================================================
 #  Parser for show running-config nv overlay
@@ -1954,7 +1955,7 @@ class ShowNveVniIngressReplicationSchema(MetaParser):
     """Schema for:
         show nve vni ingress-replication"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         Any(): {
             'vni': {
                 Any(): {
@@ -1969,7 +1970,7 @@ class ShowNveVniIngressReplicationSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ====================================================
 #  Parser for show nve vni ingress-replication
@@ -2055,7 +2056,7 @@ class ShowFabricMulticastGlobalsSchema(MetaParser):
     """Schema for:
         show fabric multicast globals"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         'multicast': {
             'globals': {
                 'pruning': str,
@@ -2069,7 +2070,7 @@ class ShowFabricMulticastGlobalsSchema(MetaParser):
                 'overlay_spt_only': bool,
                 }
             }
-        }
+        })
 
 # ====================================================
 #  Parser for show fabric multicast globals
@@ -2194,7 +2195,7 @@ class ShowFabricMulticastIpSaAdRouteSchema(MetaParser):
         show fabric multicast ipv4 sa-ad-route vrf <vrf>
         show fabric multicast ipv4 sa-ad-route vrf all"""
 
-    schema ={
+    schema =LazySchema(lambda: {
         "multicast": {
             "vrf": {
                 Any(): {
@@ -2224,7 +2225,7 @@ class ShowFabricMulticastIpSaAdRouteSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 # ===========================================================
 #  Parser for show fabric multicast ipv4 sa-ad-route vrf all
@@ -2318,7 +2319,7 @@ class ShowFabricMulticastIpL2MrouteSchema(MetaParser):
         show fabric multicast ipv4 l2-mroute vni <vni>
         show fabric multicast ipv4 l2-mroute vni all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'multicast': {
             "l2_mroute": {
                 "vni": {
@@ -2343,7 +2344,7 @@ class ShowFabricMulticastIpL2MrouteSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 # ===========================================================
@@ -7123,6 +7123,148 @@ class test_show_bgp_vrf_all_all(unittest.TestCase):
         with self.assertRaises(SchemaEmptyParserError):
             parsed_output = obj.parse()
 
+
+class test_show_bgp_vrf_all_all_json(unittest.TestCase):
+
+    '''Unit test for show bgp vrf all all | json'''
+
+    device = Device(name='aDevice')
+    empty_output = {'execute.return_value': ''}
+
+    golden_output = {'execute.return_value': '''
+        {"TABLE_vrf": {"ROW_vrf": [
+          {"vrf-name-out": "default", "vrf-router-id": "10.4.1.1",
+           "vrf-local-as": 100,
+           "TABLE_afi": {"ROW_afi": {"afi": 1,
+             "TABLE_safi": {"ROW_safi": {"safi": 1,
+               "af-name": "IPv4 Unicast", "table-version": 25,
+               "TABLE_rd": {"ROW_rd": {
+                 "TABLE_prefix": {"ROW_prefix": [
+                   {"ipprefix": "10.4.1.0/24", "prefixversion": 2,
+                    "TABLE_path": {"ROW_path":
+                      {"pathnr": 0, "statuscode": "*", "bestcode": ">",
+                       "typecode": "l", "ipnexthop": "0.0.0.0", "weight": 32768,
+                       "origin": "i", "aspath": "", "localpref": 100,
+                       "metric": ""}}},
+                   {"ipprefix": "10.21.33.33/32", "prefixversion": 5,
+                    "TABLE_path": {"ROW_path": [
+                      {"pathnr": 0, "statuscode": "*", "bestcode": ">",
+                       "typecode": "i", "ipnexthop": "10.36.3.3",
+                       "weight": 0, "origin": "?", "aspath": "",
+                       "localpref": 100, "metric": 0},
+                      {"pathnr": 1, "statuscode": "*", "bestcode": "",
+                       "typecode": "e", "ipnexthop": "10.16.2.2",
+                       "weight": 0, "origin": "i", "aspath": "200 300",
+                       "localpref": 100, "metric": 2000}
+                    ]}}
+                 ]}}}}}}}},
+          {"vrf-name-out": "VRF1", "vrf-router-id": "10.229.11.11",
+           "TABLE_afi": {"ROW_afi": {"afi": 1,
+             "TABLE_safi": {"ROW_safi": {"safi": 128,
+               "af-name": "VPNv4 Unicast", "table-version": 35,
+               "TABLE_rd": {"ROW_rd": {"rd_val": "100:100", "rd_vrf": "VRF1",
+                 "TABLE_prefix": {"ROW_prefix":
+                   {"ipprefix": "10.121.0.0/8",
+                    "TABLE_path": {"ROW_path":
+                      {"statuscode": "*", "bestcode": ">", "typecode": "a",
+                       "ipnexthop": "0.0.0.0", "weight": 32768,
+                       "origin": "i", "localpref": 100}}}}}}}}}}}
+        ]}}
+    '''}
+
+    golden_parsed_output = {
+        'vrf': {
+            'default': {
+                'address_family': {
+                    'ipv4 unicast': {
+                        'bgp_table_version': 25,
+                        'local_router_id': '10.4.1.1',
+                        'prefixes': {
+                            '10.4.1.0/24': {
+                                'index': {
+                                    1: {
+                                        'next_hop': '0.0.0.0',
+                                        'status_codes': '*>',
+                                        'path_type': 'l',
+                                        'localprf': 100,
+                                        'weight': 32768,
+                                        'origin_codes': 'i',
+                                    },
+                                },
+                            },
+                            '10.21.33.33/32': {
+                                'index': {
+                                    1: {
+                                        'next_hop': '10.16.2.2',
+                                        'status_codes': '*',
+                                        'path_type': 'e',
+                                        'metric': 2000,
+                                        'localprf': 100,
+                                        'weight': 0,
+                                        'path': '200 300',
+                                        'origin_codes': 'i',
+                                    },
+                                    2: {
+                                        'next_hop': '10.36.3.3',
+                                        'status_codes': '*>',
+                                        'path_type': 'i',
+                                        'metric': 0,
+                                        'localprf': 100,
+                                        'weight': 0,
+                                        'origin_codes': '?',
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+            'VRF1': {
+                'address_family': {
+                    'vpnv4 unicast': {
+                        'bgp_table_version': 35,
+                        'local_router_id': '10.229.11.11',
+                    },
+                    'vpnv4 unicast RD 100:100': {
+                        'bgp_table_version': 35,
+                        'local_router_id': '10.229.11.11',
+                        'route_distinguisher': '100:100',
+                        'default_vrf': 'VRF1',
+                        'prefixes': {
+                            '10.121.0.0/8': {
+                                'index': {
+                                    1: {
+                                        'next_hop': '0.0.0.0',
+                                        'status_codes': '*>',
+                                        'path_type': 'a',
+                                        'localprf': 100,
+                                        'weight': 32768,
+                                        'origin_codes': 'i',
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+    def test_show_bgp_vrf_all_all_golden_json(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output)
+        obj = ShowBgpVrfAllAll(device=self.device, context='json')
+        parsed_output = obj.parse()
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show bgp vrf all all | json')
+
+    def test_show_bgp_vrf_all_all_empty_json(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowBgpVrfAllAll(device=self.device, context='json')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse()
+
 # ==================================================
 #  Unit test for 'show bgp vrf <WORD> all neighbors'
 # ==================================================
@@ -1023,6 +1023,109 @@ class test_show_mac_address_table(unittest.TestCase):
         self.assertEqual(parsed_output, self.golden_parsed_output_2)
 
 
+class test_show_mac_address_table_json(unittest.TestCase):
+    device = Device(name='aDevice')
+    empty_output = {'execute.return_value': ''}
+
+    golden_output = {'execute.return_value': '''
+        {"TABLE_mac_address": {"ROW_mac_address": [
+          {"disp_mac_addr": "5e00.c0ff.0007", "disp_type": "G",
+           "disp_vlan": "1006", "disp_is_static": "enabled", "disp_age": "-",
+           "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+           "disp_port": "Eth1/2"},
+          {"disp_mac_addr": "aaaa.bbff.8888", "disp_type": "*",
+           "disp_vlan": "20", "disp_is_static": "enabled", "disp_age": "-",
+           "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+           "disp_port": "Drop"},
+          {"disp_mac_addr": "000f.53ff.1f1d", "disp_type": "+",
+           "disp_vlan": "390", "disp_is_static": "disabled", "disp_age": "0",
+           "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+           "disp_port": "Po125"}
+        ]}}
+    '''}
+
+    golden_parsed_output = {
+        'mac_table': {
+            'vlans': {
+                '1006': {
+                    'vlan': '1006',
+                    'mac_addresses': {
+                        '5e00.c0ff.0007': {
+                            'mac_address': '5e00.c0ff.0007',
+                            'entry': 'G',
+                            'interfaces': {
+                                'Ethernet1/2': {
+                                    'interface': 'Ethernet1/2',
+                                    'mac_type': 'static',
+                                    'age': '-',
+                                },
+                            },
+                            'secure': 'F',
+                            'ntfy': 'F',
+                        },
+                    },
+                },
+                '20': {
+                    'vlan': '20',
+                    'mac_addresses': {
+                        'aaaa.bbff.8888': {
+                            'mac_address': 'aaaa.bbff.8888',
+                            'entry': '*',
+                            'drop': {
+                                'drop': True,
+                                'mac_type': 'static',
+                                'age': '-',
+                            },
+                            'secure': 'F',
+                            'ntfy': 'F',
+                        },
+                    },
+                },
+                '390': {
+                    'vlan': '390',
+                    'mac_addresses': {
+                        '000f.53ff.1f1d': {
+                            'mac_address': '000f.53ff.1f1d',
+                            'entry': '+',
+                            'interfaces': {
+                                'Port-channel125': {
+                                    'interface': 'Port-channel125',
+                                    'mac_type': 'dynamic',
+                                    'age': '0',
+                                },
+                            },
+                            'secure': 'F',
+                            'ntfy': 'F',
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+    def test_golden(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output)
+        obj = ShowMacAddressTable(device=self.device, context='json')
+        parsed_output = obj.parse()
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show mac address-table | json')
+
+    def test_golden_vlan(self):
+        self.device = Mock(**self.golden_output)
+        obj = ShowMacAddressTable(device=self.device, context='json')
+        obj.parse(vlan='1006')
+        self.device.execute.assert_called_once_with(
+            'show mac address-table vlan 1006 | json')
+
+    def test_empty(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowMacAddressTable(device=self.device, context='json')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse()
+
+
 class test_show_mac_address_table_limit(unittest.TestCase):
     device = Device(name='aDevice')
     empty_output = {'execute.return_value': ''}
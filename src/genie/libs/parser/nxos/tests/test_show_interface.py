@@ -1385,6 +1385,164 @@ class TestShowInterface(unittest.TestCase):
         parsed_output = interface_obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output_6)
 
+
+class TestShowInterfaceJson(unittest.TestCase):
+    device = Device(name='aDevice')
+    empty_output = {'execute.return_value': ''}
+
+    golden_output = {'execute.return_value': '''
+        {"TABLE_interface": {"ROW_interface": [
+          {"interface": "Ethernet2/1", "state": "up", "admin_state": "up",
+           "share_state": "Dedicated", "eth_bundle": "Po1",
+           "eth_hw_desc": "Ethernet", "eth_hw_addr": "5254.00ff.9c38",
+           "eth_bia_addr": "5254.00ff.9c38", "desc": "desc",
+           "eth_ip_addr": "10.4.4.4", "eth_ip_mask": 24, "eth_mtu": "1600",
+           "eth_bw": 768, "eth_dly": 3330, "eth_reliability": "255",
+           "eth_txload": "1", "eth_rxload": "1", "medium": "broadcast",
+           "eth_mode": "routed", "eth_duplex": "full",
+           "eth_speed": "1000 Mb/s", "eth_media": "1G", "eth_beacon": "off",
+           "eth_autoneg": "off", "eth_in_flowctrl": "off",
+           "eth_out_flowctrl": "off", "eth_mdix": "off",
+           "eth_swt_monitor": "off", "eth_ethertype": "0x8100",
+           "eth_eee_state": "n/a", "eth_link_flapped": "00:07:28",
+           "eth_clear_counters": "never", "eth_reset_cntr": 1,
+           "eth_load_interval1_rx": 1, "eth_inrate1_bits": 0,
+           "eth_inrate1_pkts": 0, "eth_load_interval1_tx": 1,
+           "eth_outrate1_bits": 24, "eth_outrate1_pkts": 0,
+           "eth_inucast": 0, "eth_inmcast": 0, "eth_inbcast": 0,
+           "eth_inpkts": 0, "eth_inbytes": 0, "eth_outucast": 0,
+           "eth_outmcast": 0, "eth_outbcast": 0, "eth_outpkts": 0,
+           "eth_outbytes": 0, "eth_crc": 0, "eth_outdiscard": 0},
+          {"interface": "port-channel1", "state": "down",
+           "admin_state": "up", "eth_hw_desc": "Port-Channel",
+           "eth_members": "Eth2/1, Eth2/2", "eth_mtu": "1500",
+           "eth_bw": 1000000, "eth_speed": "auto-speed"},
+          {"interface": "Vlan1", "svi_admin_state": "down",
+           "svi_line_proto": "down", "svi_autostate": "enabled",
+           "svi_hw_desc": "EtherSVI", "svi_mac": "5254.00ff.6c3a",
+           "svi_mtu": 1500, "svi_bw": 1000000, "svi_delay": 10}
+        ]}}
+    '''}
+
+    golden_parsed_output = {
+        'Ethernet2/1': {
+            'oper_status': 'up',
+            'link_state': 'up',
+            'admin_state': 'up',
+            'enabled': True,
+            'dedicated_interface': True,
+            'port_channel': {
+                'port_channel_member': True,
+                'port_channel_int': 'Port-channel1',
+            },
+            'types': 'Ethernet',
+            'mac_address': '5254.00ff.9c38',
+            'phys_address': '5254.00ff.9c38',
+            'description': 'desc',
+            'ipv4': {
+                '10.4.4.4/24': {
+                    'ip': '10.4.4.4',
+                    'prefix_length': '24',
+                },
+            },
+            'mtu': 1600,
+            'bandwidth': 768,
+            'delay': 3330,
+            'reliability': '255/255',
+            'txload': '1/255',
+            'rxload': '1/255',
+            'medium': 'broadcast',
+            'port_mode': 'routed',
+            'duplex_mode': 'full',
+            'port_speed': '1000',
+            'media_type': '1G',
+            'beacon': 'off',
+            'auto_negotiate': False,
+            'flow_control': {
+                'receive': False,
+                'send': False,
+            },
+            'auto_mdix': 'off',
+            'switchport_monitor': 'off',
+            'ethertype': '0x8100',
+            'efficient_ethernet': 'n/a',
+            'last_link_flapped': '00:07:28',
+            'interface_reset': 1,
+            'counters': {
+                'rate': {
+                    'load_interval': 1,
+                    'in_rate': 0,
+                    'in_rate_pkts': 0,
+                    'out_rate': 24,
+                    'out_rate_pkts': 0,
+                },
+                'last_clear': 'never',
+                'rx': True,
+                'in_unicast_pkts': 0,
+                'in_multicast_pkts': 0,
+                'in_broadcast_pkts': 0,
+                'in_pkts': 0,
+                'in_octets': 0,
+                'in_crc_errors': 0,
+                'tx': True,
+                'out_unicast_pkts': 0,
+                'out_multicast_pkts': 0,
+                'out_broadcast_pkts': 0,
+                'out_pkts': 0,
+                'out_octets': 0,
+                'out_discard': 0,
+            },
+        },
+        'port-channel1': {
+            'oper_status': 'down',
+            'link_state': 'down',
+            'admin_state': 'up',
+            'enabled': True,
+            'types': 'Port-Channel',
+            'port_channel': {
+                'port_channel_member': True,
+                'port_channel_member_intfs': ['Ethernet2/1', 'Ethernet2/2'],
+            },
+            'mtu': 1500,
+            'bandwidth': 1000000,
+        },
+        'Vlan1': {
+            'oper_status': 'down',
+            'line_protocol': 'down',
+            'enabled': False,
+            'autostate': True,
+            'types': 'EtherSVI',
+            'mac_address': '5254.00ff.6c3a',
+            'port_channel': {
+                'port_channel_member': False,
+            },
+            'mtu': 1500,
+            'bandwidth': 1000000,
+            'delay': 10,
+        },
+    }
+
+    def test_empty(self):
+        self.device = Mock(**self.empty_output)
+        interface_obj = ShowInterface(device=self.device, context='json')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = interface_obj.parse()
+
+    def test_golden(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output)
+        interface_obj = ShowInterface(device=self.device, context='json')
+        parsed_output = interface_obj.parse()
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with('show interface | json')
+
+    def test_golden_interface(self):
+        self.device = Mock(**self.golden_output)
+        interface_obj = ShowInterface(device=self.device, context='json')
+        interface_obj.parse(interface='Ethernet2/1')
+        self.device.execute.assert_called_once_with(
+            'show interface Ethernet2/1 | json')
+
 # #############################################################################
 # # Unittest For Show Ip Interface Vrf All
 # #############################################################################
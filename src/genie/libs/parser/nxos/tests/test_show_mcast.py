@@ -396,6 +396,119 @@ class test_show_ip_mroute_vrf_all(unittest.TestCase):
         parsed_output = ip_mroute_vrf_all_obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output4)        
 
+
+class test_show_ip_mroute_vrf_all_json(unittest.TestCase):
+    device = Device(name='aDevice')
+    empty_output = {'execute.return_value': ''}
+
+    golden_output = {'execute.return_value': '''
+        {"TABLE_vrf": {"ROW_vrf": [
+          {"vrf-name": "default", "TABLE_one_route": {"ROW_one_route": [
+            {"mcast-addrs": "(*,232.0.0.0/8)", "uptime": "PT9H15M11S",
+             "bidir": "false", "route-iif": "Null", "rpf-nbr": "0.0.0.0",
+             "internal": "false", "oif-count": "0",
+             "TABLE_mpib": {"ROW_mpib": {"mpib-name": "pim"}}},
+            {"mcast-addrs": "(192.168.112.3/32, 224.192.1.10/32)",
+             "uptime": "P3DT11H", "route-iif": "Ethernet1/9",
+             "rpf-nbr": "10.234.1.2", "internal": "true", "oif-count": "1",
+             "TABLE_mpib": {"ROW_mpib": [{"mpib-name": "pim"},
+                                         {"mpib-name": "igmp"}]},
+             "TABLE_oif": {"ROW_oif": {"oif-name": "port-channel9",
+               "oif-uptime": "PT9H31M16S",
+               "TABLE_oif_mpib": {"ROW_oif_mpib": {"oif-mpib-name": "pim"}}}}}
+          ]}},
+          {"vrf-name": "VRF1", "TABLE_one_route": {"ROW_one_route":
+            {"mcast-addrs": "(*,228.0.0.0/8)", "uptime": "PT41M5S",
+             "bidir": "true", "route-iif": "loopback1",
+             "rpf-nbr": "10.1.1.1", "oif-count": "0",
+             "TABLE_mpib": {"ROW_mpib": {"mpib-name": "pim"}}}}}
+        ]}}
+    '''}
+
+    golden_parsed_output = {
+        'vrf': {
+            'default': {
+                'address_family': {
+                    'ipv4': {
+                        'multicast_group': {
+                            '232.0.0.0/8': {
+                                'source_address': {
+                                    '*': {
+                                        'uptime': '09:15:11',
+                                        'flags': 'ip pim',
+                                        'oil_count': 0,
+                                        'incoming_interface_list': {
+                                            'Null': {'rpf_nbr': '0.0.0.0'},
+                                        },
+                                    },
+                                },
+                            },
+                            '224.192.1.10/32': {
+                                'source_address': {
+                                    '192.168.112.3/32': {
+                                        'uptime': '3d11h',
+                                        'flags': 'igmp ip pim',
+                                        'oil_count': 1,
+                                        'incoming_interface_list': {
+                                            'Ethernet1/9': {
+                                                'rpf_nbr': '10.234.1.2',
+                                                'internal': True,
+                                            },
+                                        },
+                                        'outgoing_interface_list': {
+                                            'port-channel9': {
+                                                'oil_uptime': '09:31:16',
+                                                'oil_flags': 'pim',
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+            'VRF1': {
+                'address_family': {
+                    'ipv4': {
+                        'multicast_group': {
+                            '228.0.0.0/8': {
+                                'source_address': {
+                                    '*': {
+                                        'uptime': '00:41:05',
+                                        'flags': 'ip pim',
+                                        'bidir': True,
+                                        'oil_count': 0,
+                                        'incoming_interface_list': {
+                                            'loopback1': {'rpf_nbr': '10.1.1.1'},
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+    def test_empty(self):
+        self.device = Mock(**self.empty_output)
+        ip_mroute_vrf_all_obj = ShowIpMrouteVrfAll(device=self.device,
+                                                   context='json')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = ip_mroute_vrf_all_obj.parse()
+
+    def test_golden(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output)
+        ip_mroute_vrf_all_obj = ShowIpMrouteVrfAll(device=self.device,
+                                                   context='json')
+        parsed_output = ip_mroute_vrf_all_obj.parse()
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show ip mroute vrf all | json')
+
 # =========================================
 # Unit test for 'show ipv6 mroute vrf all'
 # =========================================
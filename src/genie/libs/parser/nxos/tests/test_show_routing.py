@@ -3253,6 +3253,181 @@ class test_show_ip_route(unittest.TestCase):
         self.assertEqual(parsed_output, self.golden_parsed_output_00)
 
 
+# ============================================
+# unit test for 'show ip route | json'
+# =============================================
+class test_show_ip_route_json(unittest.TestCase):
+    device = Device(name='aDevice')
+    empty_output = {'execute.return_value': ''}
+
+    golden_output = {'execute.return_value': '''
+        {"TABLE_vrf": {"ROW_vrf": [
+          {"vrf-name-out": "default",
+           "TABLE_addrf": {"ROW_addrf": {"addrf": "ipv4",
+             "TABLE_prefix": {"ROW_prefix": [
+               {"ipprefix": "10.12.120.0/24", "ucast-nhops": "2",
+                "mcast-nhops": "0", "attached": "false",
+                "TABLE_path": {"ROW_path": [
+                  {"ipnexthop": "10.13.120.1", "ifname": "Eth1/2.120",
+                   "uptime": "PT1H1M30S", "pref": "120", "metric": "2",
+                   "clientname": "rip-1", "type": "rip", "ubest": "true"},
+                  {"ipnexthop": "10.23.120.2", "ifname": "Eth1/1.120",
+                   "uptime": "PT1H1M30S", "pref": "120", "metric": "2",
+                   "clientname": "rip-1", "type": "rip", "ubest": "true"}
+                ]}},
+               {"ipprefix": "10.1.2.0/24", "ucast-nhops": "1",
+                "mcast-nhops": "0", "attached": "true",
+                "TABLE_path": {"ROW_path":
+                  {"ipnexthop": "10.1.2.1", "ifname": "Eth1/1",
+                   "uptime": "P3DT7H", "pref": "0", "metric": "0",
+                   "clientname": "direct", "ubest": "true"}}}
+             ]}}}},
+          {"vrf-name-out": "VRF1",
+           "TABLE_addrf": {"ROW_addrf": {"addrf": "ipv4",
+             "TABLE_prefix": {"ROW_prefix":
+               {"ipprefix": "10.21.33.33/32", "ucast-nhops": "1",
+                "mcast-nhops": "0", "attached": "false",
+                "TABLE_path": {"ROW_path":
+                  {"ipnexthop": "10.36.3.3%default", "uptime": "PT5M",
+                   "pref": "200", "metric": "0", "clientname": "bgp-100",
+                   "type": "internal", "tag": "100", "ubest": "true",
+                   "mpls-vpn": "true"}}}}}}}
+        ]}}
+    '''}
+
+    golden_parsed_output = {
+        'vrf': {
+            'default': {
+                'address_family': {
+                    'ipv4': {
+                        'routes': {
+                            '10.12.120.0/24': {
+                                'route': '10.12.120.0/24',
+                                'active': True,
+                                'ubest': 2,
+                                'mbest': 0,
+                                'metric': 2,
+                                'route_preference': 120,
+                                'process_id': '1',
+                                'source_protocol': 'rip',
+                                'source_protocol_status': 'rip',
+                                'next_hop': {
+                                    'next_hop_list': {
+                                        1: {
+                                            'index': 1,
+                                            'next_hop': '10.13.120.1',
+                                            'outgoing_interface': 'Ethernet1/2.120',
+                                            'best_ucast_nexthop': True,
+                                            'updated': '01:01:30',
+                                            'metric': 2,
+                                            'route_preference': 120,
+                                            'source_protocol': 'rip',
+                                            'source_protocol_status': 'rip',
+                                        },
+                                        2: {
+                                            'index': 2,
+                                            'next_hop': '10.23.120.2',
+                                            'outgoing_interface': 'Ethernet1/1.120',
+                                            'best_ucast_nexthop': True,
+                                            'updated': '01:01:30',
+                                            'metric': 2,
+                                            'route_preference': 120,
+                                            'source_protocol': 'rip',
+                                            'source_protocol_status': 'rip',
+                                        },
+                                    },
+                                },
+                            },
+                            '10.1.2.0/24': {
+                                'route': '10.1.2.0/24',
+                                'active': True,
+                                'attached': True,
+                                'ubest': 1,
+                                'mbest': 0,
+                                'metric': 0,
+                                'route_preference': 0,
+                                'source_protocol': 'direct',
+                                'next_hop': {
+                                    'next_hop_list': {
+                                        1: {
+                                            'index': 1,
+                                            'next_hop': '10.1.2.1',
+                                            'outgoing_interface': 'Ethernet1/1',
+                                            'best_ucast_nexthop': True,
+                                            'updated': '3d07h',
+                                            'metric': 0,
+                                            'route_preference': 0,
+                                            'source_protocol': 'direct',
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+            'VRF1': {
+                'address_family': {
+                    'ipv4': {
+                        'routes': {
+                            '10.21.33.33/32': {
+                                'route': '10.21.33.33/32',
+                                'active': True,
+                                'ubest': 1,
+                                'mbest': 0,
+                                'metric': 0,
+                                'route_preference': 200,
+                                'process_id': '100',
+                                'tag': 100,
+                                'source_protocol': 'bgp',
+                                'source_protocol_status': 'internal',
+                                'next_hop': {
+                                    'next_hop_list': {
+                                        1: {
+                                            'index': 1,
+                                            'next_hop': '10.36.3.3',
+                                            'next_hop_vrf': 'default',
+                                            'best_ucast_nexthop': True,
+                                            'updated': '00:05:00',
+                                            'metric': 0,
+                                            'route_preference': 200,
+                                            'source_protocol': 'bgp',
+                                            'source_protocol_status': 'internal',
+                                            'mpls_vpn': True,
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+    def test_empty(self):
+        self.device = Mock(**self.empty_output)
+        obj = ShowIpRoute(device=self.device, context='json')
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse()
+
+    def test_golden(self):
+        self.maxDiff = None
+        self.device = Mock(**self.golden_output)
+        obj = ShowIpRoute(device=self.device, context='json')
+        parsed_output = obj.parse()
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.device.execute.assert_called_once_with(
+            'show ip route vrf all | json')
+
+    def test_golden_route_vrf(self):
+        self.device = Mock(**self.golden_output)
+        obj = ShowIpRoute(device=self.device, context='json')
+        obj.parse(route='10.12.120.0/24', vrf='default')
+        self.device.execute.assert_called_once_with(
+            'show ip route 10.12.120.0/24 vrf default | json')
+
+
 # ============================================
 # unit test for 'show ipv6 route'
 # =============================================
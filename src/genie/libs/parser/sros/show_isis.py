@@ -9,6 +9,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
@@ -21,7 +22,7 @@ from genie.libs.parser.utils.common import Common
 
 class ShowRouterIsisAdjacencySchema(MetaParser):
     """Schema for show router isis adjacency"""
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'level': {
@@ -42,7 +43,7 @@ class ShowRouterIsisAdjacencySchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowRouterIsisAdjacency(ShowRouterIsisAdjacencySchema):
@@ -120,7 +121,7 @@ class ShowRouterIsisAdjacency(ShowRouterIsisAdjacencySchema):
 class ShowRouterIsisAdjacencyDetailSchema(MetaParser):
     """Schema for show router isis adjacency detail"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'instance': {
             Any(): {
                 'level': {
@@ -156,7 +157,7 @@ class ShowRouterIsisAdjacencyDetailSchema(MetaParser):
                 }
             }
         }
-    }
+    })
 
 
 class ShowRouterIsisAdjacencyDetail(ShowRouterIsisAdjacencyDetailSchema):
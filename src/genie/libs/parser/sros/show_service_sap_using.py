@@ -1,4 +1,5 @@
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any
 import re
 
@@ -8,7 +9,7 @@ import re
 
 class ShowServiceSapUsingSchema(MetaParser):
     """schema for show service sap-using"""
-    schema = {
+    schema = LazySchema(lambda: {
         'total': int,
         'sap': {
             Any(): {
@@ -21,7 +22,7 @@ class ShowServiceSapUsingSchema(MetaParser):
                 'oper_state': str,
             }
         }
-    }
+    })
 
 class ShowServiceSapUsing(ShowServiceSapUsingSchema):
     """ Parser for show service sap-using"""
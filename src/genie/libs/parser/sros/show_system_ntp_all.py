@@ -8,6 +8,7 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # =============================================
@@ -18,7 +19,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 class ShowSystemNtpAllSchema(MetaParser):
     """schema for show system ntp all"""
 
-    schema = {
+    schema = LazySchema(lambda: {
         'clock_state': {
             'system_status': {
                 'configured': str,
@@ -50,7 +51,7 @@ class ShowSystemNtpAllSchema(MetaParser):
                 }
             }
         },
-    }
+    })
 
 
 class ShowSystemNtpAll(ShowSystemNtpAllSchema):
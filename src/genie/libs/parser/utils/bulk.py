@@ -0,0 +1,458 @@
+'''Offline bulk parsing of captured outputs
+
+``genie-parser-bulk`` walks a directory or a tarball of captured show
+outputs, parses them on all cores and streams one JSON record per capture
+(NDJSON, gzip compressed when the output file ends with ``.gz``).
+
+Each capture is mapped to (os, command) either by a manifest or, by
+default, by the golden-output folder layout of the unittests::
+
+    <os>[/<platform>]/tests/<Class>/cli/equal/<name>_output.txt
+    <os>[/<platform>]/tests/<Class>/cli/equal/<name>_arguments.json
+
+In that layout the command is found back from the parser registry, using
+the arguments to fill the command placeholders.
+
+A manifest is a JSON list, or JSON lines, of objects such as::
+
+    {"path": "r1/show_version.txt", "os": "iosxe", "command": "show version",
+     "platform": "c9300", "kwargs": {}}
+
+With ``--checkpoint``, the key of every completed capture is appended to
+the checkpoint file, and an interrupted run started again with the same
+checkpoint skips them and appends to the output.
+
+Example:
+
+    $ genie-parser-bulk captures.tgz --output parsed.ndjson.gz \\
+          --manifest manifest.json --jobs 16 --checkpoint parsed.ckpt
+'''
+
+# python
+import os
+import re
+import sys
+import json
+import glob
+import gzip
+import time
+import fnmatch
+import logging
+import tarfile
+import argparse
+import functools
+import multiprocessing
+from collections import namedtuple
+
+# parser utils
+from .common import _get_parser_data
+from .mapped import MappedOutput
+from .offline import parse_output
+
+log = logging.getLogger(__name__)
+
+# One capture to parse. `path` is a file path, or a member name when the
+# captures come from a tarball
+Capture = namedtuple('Capture', ['key', 'path', 'os', 'command', 'platform',
+                                 'kwargs'])
+
+GOLDEN_OUTPUT = re.compile(r'^(?P<os>[^/]+)/(?:(?P<platform>[^/]+)/)?tests/'
+                           r'(?P<cls>[^/]+)/cli/equal/(?P<name>.+)'
+                           r'_output\.txt$')
+
+
+def _iter_parser_entries(data):
+    '''Yield every {module_name, package, class} entry of one os'''
+    if 'class' in data:
+        yield data
+        return
+    for value in data.values():
+        if isinstance(value, dict):
+            yield from _iter_parser_entries(value)
+
+
+def build_class_commands(data=None):
+    '''Reverse the parser registry
+
+    Returns:
+        dict of (os, class name) -> list of command templates
+    '''
+    if data is None:
+        data = _get_parser_data()
+    class_commands = {}
+    for command, values in data.items():
+        if command == 'tokens':
+            continue
+        for os_name, entries in values.items():
+            for entry in _iter_parser_entries(entries):
+                class_commands.setdefault((os_name, entry['class']),
+                                          []).append(command)
+    return class_commands
+
+
+def fill_command(templates, arguments):
+    '''Pick the command template best filled by arguments
+
+    Args:
+        templates (`list`): command templates, for example
+                            ['show ip route', 'show ip route vrf {vrf}']
+        arguments (`dict`): arguments of the capture
+
+    Returns:
+        (command, remaining kwargs) tuple, or None if no template can be
+        filled
+    '''
+    best = None
+    for template in templates:
+        placeholders = set(re.findall('{(.*?)}', template))
+        if not placeholders.issubset(arguments):
+            continue
+        if best is None or len(placeholders) > len(best[1]):
+            best = (template, placeholders)
+
+    if best is None:
+        return None
+
+    template, placeholders = best
+    command = template.format(**{k: arguments[k] for k in placeholders})
+    kwargs = {k: v for k, v in arguments.items() if k not in placeholders}
+    return command, kwargs
+
+
+def golden_captures(names, read_json, class_commands=None):
+    '''Map golden-layout file names to captures
+
+    Args:
+        names (`list`): relative file names, '/' separated
+        read_json (`callable`): returns the parsed content of a json file
+                                name, or None if it does not exist
+        class_commands (`dict`): result of build_class_commands()
+
+    Returns:
+        (captures, skipped names) tuple
+    '''
+    if class_commands is None:
+        class_commands = build_class_commands()
+
+    captures = []
+    skipped = []
+    for name in names:
+        m = GOLDEN_OUTPUT.match(name)
+        if not m:
+            continue
+        group = m.groupdict()
+
+        arguments = read_json(name[:-len('_output.txt')] +
+                              '_arguments.json') or {}
+        filled = fill_command(class_commands.get((group['os'],
+                                                  group['cls']), []),
+                              arguments)
+        if filled is None:
+            skipped.append(name)
+            continue
+
+        command, kwargs = filled
+        captures.append(Capture(name, name, group['os'], command,
+                                group['platform'], kwargs))
+    return captures, skipped
+
+
+def manifest_captures(manifest):
+    '''Read a manifest, a JSON list or JSON lines of capture objects'''
+    with open(manifest) as f:
+        content = f.read()
+
+    if content.lstrip().startswith('['):
+        entries = json.loads(content)
+    else:
+        entries = [json.loads(line) for line in content.splitlines()
+                   if line.strip()]
+
+    return [Capture(entry.get('key', entry['path']), entry['path'],
+                    entry['os'], entry['command'], entry.get('platform'),
+                    entry.get('kwargs') or {})
+            for entry in entries]
+
+
+class CaptureSource(object):
+    '''Captures stored in a directory'''
+
+    def __init__(self, root):
+        self.root = root
+
+    def names(self):
+        names = []
+        for path in glob.iglob(os.path.join(self.root, '**', '*'),
+                               recursive=True):
+            if os.path.isfile(path):
+                names.append(os.path.relpath(path, self.root).replace(
+                    os.sep, '/'))
+        return sorted(names)
+
+    def read_json(self, name):
+        path = os.path.join(self.root, name)
+        if not os.path.isfile(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def iter_jobs(self, captures):
+        '''Yield (capture, file, content) jobs, files are read by workers'''
+        for capture in captures:
+            yield capture, os.path.join(self.root, capture.path), None
+
+    def close(self):
+        pass
+
+
+class TarCaptureSource(CaptureSource):
+    '''Captures stored in a (compressed) tarball'''
+
+    def __init__(self, path):
+        self.tar = tarfile.open(path)
+        self.members = {m.name[2:] if m.name.startswith('./') else m.name: m
+                        for m in self.tar.getmembers() if m.isfile()}
+
+    def names(self):
+        return sorted(self.members)
+
+    def _read(self, name):
+        return self.tar.extractfile(self.members[name]).read().decode(
+            errors='replace')
+
+    def read_json(self, name):
+        if name not in self.members:
+            return None
+        return json.loads(self._read(name))
+
+    def iter_jobs(self, captures):
+        '''Yield (capture, file, content) jobs, members read in tar order'''
+        wanted = {c.path: c for c in captures}
+        for name, member in sorted(self.members.items(),
+                                   key=lambda m: m[1].offset):
+            if name in wanted:
+                yield wanted[name], None, self._read(name)
+
+    def close(self):
+        self.tar.close()
+
+
+def open_source(path):
+    '''Return the CaptureSource of a directory or a tarball'''
+    if os.path.isdir(path):
+        return CaptureSource(path)
+    return TarCaptureSource(path)
+
+
+def _parse_job(job, normalize=True):
+    '''Parse one capture, runs in a worker process'''
+    capture, path, content = job
+    record = {'key': capture.key,
+              'os': capture.os,
+              'platform': capture.platform,
+              'command': capture.command}
+
+    start = time.perf_counter()
+    try:
+        if content is None:
+            # Files are memory-mapped, and not loaded by the parsers which
+            # read their output line by line
+            with MappedOutput(path, normalize=normalize) as output:
+                record['bytes'] = len(output)
+                record['lines'] = output.line_count()
+                record['result'] = parse_output(capture.os, capture.command,
+                                                output,
+                                                platform=capture.platform,
+                                                **capture.kwargs)
+        else:
+            record['bytes'] = len(content)
+            record['lines'] = content.count('\n')
+            record['result'] = parse_output(capture.os, capture.command,
+                                            content,
+                                            platform=capture.platform,
+                                            normalize=normalize,
+                                            **capture.kwargs)
+        record['ok'] = True
+    except Exception as e:
+        record['ok'] = False
+        record['error'] = '{t}: {e}'.format(t=type(e).__name__, e=e)
+    record['seconds'] = time.perf_counter() - start
+    return record
+
+
+def read_checkpoint(path):
+    '''Return the keys already completed in a checkpoint file'''
+    if not path or not os.path.isfile(path):
+        return set()
+    with open(path) as f:
+        return set(line.rstrip('\n') for line in f if line.strip())
+
+
+def open_output(path, append=False):
+    '''Open the NDJSON output, gzip compressed if path ends with .gz'''
+    mode = 'at' if append else 'wt'
+    if path == '-':
+        return sys.stdout
+    if path.endswith('.gz'):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+class BulkReport(object):
+    '''Throughput, failures and slowest captures of a run'''
+
+    def __init__(self, slowest=10):
+        self.slowest_count = slowest
+        self.start = time.perf_counter()
+        self.parsed = 0
+        self.failed = []
+        self.skipped = 0
+        self.bytes = 0
+        self.lines = 0
+        self.slowest = []
+
+    def add(self, record):
+        if record['ok']:
+            self.parsed += 1
+        else:
+            self.failed.append((record['key'], record['error']))
+        self.bytes += record.get('bytes', 0)
+        self.lines += record.get('lines', 0)
+
+        self.slowest.append((record['seconds'], record['key']))
+        if len(self.slowest) > self.slowest_count * 10:
+            self.slowest = sorted(self.slowest,
+                                  reverse=True)[:self.slowest_count]
+
+    def format(self):
+        elapsed = time.perf_counter() - self.start
+        total = self.parsed + len(self.failed)
+        rate = total / elapsed if elapsed else 0
+        lines = [
+            'Parsed {p} captures, {f} failed, {s} skipped in {t:.2f}s'.format(
+                p=self.parsed, f=len(self.failed), s=self.skipped,
+                t=elapsed),
+            'Throughput: {r:.1f} captures/s, {m:.2f} MB/s, {l:.0f} '
+            'lines/s'.format(r=rate,
+                             m=self.bytes / elapsed / 1e6 if elapsed else 0,
+                             l=self.lines / elapsed if elapsed else 0)]
+
+        if self.slowest:
+            lines.append('Slowest captures:')
+            for seconds, key in sorted(self.slowest,
+                                       reverse=True)[:self.slowest_count]:
+                lines.append('  {t:8.3f}s  {k}'.format(t=seconds, k=key))
+
+        if self.failed:
+            lines.append('Failures:')
+            for key, error in self.failed:
+                lines.append('  {k}: {e}'.format(k=key, e=error))
+        return '\n'.join(lines)
+
+
+def run(source, captures, output='-', jobs=None, checkpoint=None,
+        report=None, chunksize=4, normalize=True):
+    '''Parse captures of a source in parallel and stream the records
+
+    Args:
+        source (`CaptureSource`): where the captures are read from
+        captures (`list`): list of `Capture`
+        output (`str`): NDJSON output file, '-' for stdout
+        jobs (`int`): number of worker processes, defaults to all cores
+        checkpoint (`str`): checkpoint file to resume from and update
+        report (`BulkReport`): report to fill in
+        normalize (`bool`): remove the terminal artifacts of the captures
+                            before parsing them. Defaults to True
+
+    Returns:
+        `BulkReport`
+    '''
+    report = report or BulkReport()
+    done = read_checkpoint(checkpoint)
+    todo = [c for c in captures if c.key not in done]
+    report.skipped += len(captures) - len(todo)
+
+    parse_job = functools.partial(_parse_job, normalize=normalize)
+    out = open_output(output, append=bool(done))
+    ckpt = open(checkpoint, 'a') if checkpoint else None
+    try:
+        with multiprocessing.Pool(processes=jobs) as pool:
+            for record in pool.imap_unordered(parse_job,
+                                              source.iter_jobs(todo),
+                                              chunksize=chunksize):
+                out.write(json.dumps(record, default=str) + '\n')
+                report.add(record)
+                if ckpt:
+                    # The record must be written before the checkpoint says
+                    # it is done
+                    out.flush()
+                    ckpt.write(record['key'] + '\n')
+                    ckpt.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if ckpt:
+            ckpt.close()
+
+    return report
+
+
+def main(argv=None):
+    '''Entry point of genie-parser-bulk'''
+    parser = argparse.ArgumentParser(
+        description='Parse a directory or tarball of captured outputs')
+    parser.add_argument('source',
+                        help='Directory or tarball of captured outputs')
+    parser.add_argument('--manifest', default=None,
+                        help='JSON manifest mapping files to os and command '
+                             '(default: golden-output folder layout)')
+    parser.add_argument('--output', default='-',
+                        help='NDJSON output, gzip compressed if it ends '
+                             'with .gz (default: stdout)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of worker processes (default: all '
+                             'cores)')
+    parser.add_argument('--checkpoint', default=None,
+                        help='Checkpoint file to resume an interrupted run')
+    parser.add_argument('--include', default=None,
+                        help='Only parse files matching this glob pattern')
+    parser.add_argument('--slowest', type=int, default=10,
+                        help='Number of slowest captures to report')
+    parser.add_argument('--no-normalize', action='store_true',
+                        help='Parse the captures as they are, without '
+                             'removing their terminal artifacts')
+    args = parser.parse_args(argv)
+
+    source = open_source(args.source)
+    report = BulkReport(slowest=args.slowest)
+    try:
+        if args.manifest:
+            captures = manifest_captures(args.manifest)
+        else:
+            captures, skipped = golden_captures(source.names(),
+                                                source.read_json)
+            for name in skipped:
+                log.warning('No command found for {n}'.format(n=name))
+            report.skipped += len(skipped)
+
+        if args.include:
+            captures = [c for c in captures
+                        if fnmatch.fnmatch(c.path, args.include)]
+
+        run(source, captures, output=args.output, jobs=args.jobs,
+            checkpoint=args.checkpoint, report=report,
+            normalize=not args.no_normalize)
+    except KeyboardInterrupt:
+        log.warning('Interrupted, run again with the same --checkpoint to '
+                    'resume')
+        return 1
+    finally:
+        source.close()
+        sys.stderr.write(report.format() + '\n')
+
+    return 1 if report.failed else 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
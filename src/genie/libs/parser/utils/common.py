@@ -9,12 +9,16 @@ import warnings
 import logging
 import importlib
 import math
+import threading
 
 from genie.libs import parser
 from genie.abstract import Lookup
 
 log = logging.getLogger(__name__)
 
+# Placeholders of cli_command templates, for example {vrf}
+_PLACEHOLDER = re.compile(r'{(\w+)}')
+
 def _load_parser_json():
     '''get all parser data in json file'''
     try:
@@ -33,14 +37,39 @@ def _load_parser_json():
             parser_data = json.load(f)
     return parser_data
 
-# Parser within Genie
-parser_data = _load_parser_json()
+# Held while the parser data is loaded. Reentrant, adding the parsers of the
+# external packages gets the parser data
+_parser_data_lock = threading.RLock()
+_parser_data_loaded = threading.Event()
+
+def _get_parser_data():
+    '''Return the parser data, loaded on first use with the parsers of the
+    external packages'''
+    global parser_data
+    if not _parser_data_loaded.is_set():
+        with _parser_data_lock:
+            if 'parser_data' not in globals():
+                parser_data = _load_parser_json()
+                from .entry_points import load_entry_points
+                load_entry_points()
+                _parser_data_loaded.set()
+    return parser_data
+
+def __getattr__(name):
+    '''Parser within Genie, parser_data, is loaded on first access (PEP 562)
+    rather than by every parser module importing Common'''
+    if name == 'parser_data':
+        return _get_parser_data()
+    raise AttributeError("module '{m}' has no attribute '{n}'".format(
+        m=__name__, n=name))
 
-def get_parser_commands(device, data=parser_data):
+def get_parser_commands(device, data=None):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
        Remove the ones that arent related to this os'''
 
+    if data is None:
+        data = _get_parser_data()
     commands = []
     for command, values in data.items():
         if '{' in command or command == 'tokens' or device.os not in values:
@@ -124,6 +153,8 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
             list: the result of the search
     """
 
+    parser_data = _get_parser_data()
+
     # Perfect match should return 
     if search in parser_data:
         return [(search, parser_data[search], {})]
@@ -468,6 +499,40 @@ def _find_parser_cls(device, data):
     return getattr(getattr(lookup.parser, data['module_name']), data['class'])
 
 
+def select_command(templates, **kwargs):
+    '''Build the command of the template which takes exactly the given
+    arguments
+
+    Arguments which are None or empty are ignored, so the parser keyword
+    arguments can be passed as is.
+
+    Args:
+        templates (`list`): command templates, in order of preference,
+                           usually the cli_command of the parser
+        kwargs: values of the template placeholders
+
+    Returns:
+        command (`str`)
+
+    Example:
+
+        >>> select_command(['show ip route vrf {vrf}', 'show ip route'],
+        ...                vrf=None)
+        'show ip route'
+    '''
+    if isinstance(templates, str):
+        templates = [templates]
+    provided = {key: value for key, value in kwargs.items()
+                if value is not None and value != ''}
+
+    for template in templates:
+        if set(_PLACEHOLDER.findall(template)) == set(provided):
+            return template.format(**provided)
+
+    raise Exception("None of the commands {t} takes the arguments "
+                    "{a}".format(t=templates, a=sorted(provided)))
+
+
 class Common():
     '''Common functions to be used in parsers.'''
 
@@ -787,3 +852,8 @@ class Common():
                                         final_seconds)
 
         return normal_time
+
+
+# Python 3.6 has no module __getattr__, parser_data is loaded at import
+if sys.version_info < (3, 7):
+    _get_parser_data()
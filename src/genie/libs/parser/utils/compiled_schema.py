@@ -0,0 +1,313 @@
+'''Schemas validated by compiled validator functions
+
+MetaParser validates a parsed result by walking the schema with
+schemaengine, which dispatches on the kind of every schema node for every
+value. On a table of 500k prefixes or MAC addresses, the validation costs
+nearly as much as the parsing. A parser can instead declare its schema as a
+CompiledSchema, in a schema class based on CompiledMetaParser:
+
+    class ShowMacAddressTableSchema(CompiledMetaParser):
+        schema = LazySchema(lambda: CompiledSchema({
+            'mac_table': {
+                Any(): {...},
+            },
+        }))
+
+The schema is compiled, on its first use, to nested validator functions
+specialized for each node: a type check, a dict of the literal keys, the
+validator of the values of the Any() keys, and so on.
+
+CompiledMetaParser.parse() runs MetaParser.parse without its validation, and
+validates the result with the compiled validator. The compiled validator
+only accepts the results it can tell are valid. Otherwise, MetaParser.parse
+validates the same result with schemaengine, which returns it or raises its
+errors as before, without executing the command again. A schema with nodes
+which transform the values, such as Use() or Default(), is always validated
+by schemaengine. The validate() of a CompiledSchema validates the same way:
+
+    ShowMacAddressTable.schema.validate(result)
+
+The GENIE_SCHEMA_VALIDATION environment variable, or `configure()`, selects
+the validation:
+
+* strict, the default: every value of the result is validated. Keep it for
+  the tests
+* sampled: the structure of the result is still checked, but of the values
+  of the Any() keys of a dict, only the first SAMPLE_FIRST and
+  SAMPLE_RANDOM others picked at random are validated, the others only have
+  to be dicts where the schema has a dict. For production, on huge results
+* reference: the compiled validators are not used, schemaengine validates
+
+    $ GENIE_SCHEMA_VALIDATION=sampled python collect.py
+'''
+
+# python
+import os
+import types
+import random
+import threading
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import (Schema, Any, Optional, Or,
+                                                And, Default)
+
+# Environment variable selecting the validation: strict, sampled or reference
+SCHEMA_VALIDATION_ENV = 'GENIE_SCHEMA_VALIDATION'
+
+MODES = ('strict', 'sampled', 'reference')
+
+# Values of the Any() keys of a dict always validated in sampled mode, and
+# validated among the others, at random
+SAMPLE_FIRST = 100
+SAMPLE_RANDOM = 100
+
+_lock = threading.Lock()
+_settings = {'mode': 'strict', 'sampled': False, 'first': SAMPLE_FIRST,
+             'sample': SAMPLE_RANDOM}
+_random = random.Random()
+
+
+class NotCompilable(Exception):
+    '''The schema has nodes the compiler does not handle'''
+
+
+class CompiledSchema(dict):
+    '''Schema of a MetaParser class, validated by a compiled validator
+
+        schema = LazySchema(lambda: CompiledSchema({
+            'version': str,
+            Optional('uptime'): str,
+        }))
+    '''
+
+    _validator = None
+
+    def accepts(self, data):
+        '''Return True if the compiled validator accepts data, False if
+        schemaengine has to validate it'''
+        if _settings['mode'] == 'reference':
+            return False
+        if self._validator is None:
+            try:
+                self._validator = compile_schema(dict(self))
+            except NotCompilable:
+                self._validator = False
+        # schemaengine raises SchemaEmptyParserError for an empty result
+        return bool(data and self._validator and self._validator(data))
+
+    def validate(self, data, *args, **kwargs):
+        '''Validate data, the arguments of Schema.validate() of
+        schemaengine, such as top, are passed on to it'''
+        if self.accepts(data):
+            return data
+        # Rejected, empty, or not compiled: the errors are raised by
+        # schemaengine
+        return _reference(dict(self), data, *args, **kwargs)
+
+
+class CompiledMetaParser(MetaParser):
+    '''MetaParser validating a CompiledSchema with its compiled validator'''
+
+    def parse(self, **kwargs):
+        schema = self.schema
+        # genie.metaparser keeps the context as a list. Several contexts
+        # merge their results, MetaParser validates them
+        context = self.context
+        if isinstance(context, (list, tuple)):
+            context = context[0] if len(context) == 1 else None
+        if not isinstance(schema, CompiledSchema) or not context:
+            return super().parse(**kwargs)
+
+        # MetaParser does not validate an empty schema
+        self.schema = {}
+        try:
+            output = super().parse(**kwargs)
+        finally:
+            del self.schema
+        if schema.accepts(output):
+            return output
+
+        # MetaParser validates the output with schemaengine, its context
+        # method returning the same output
+        setattr(self, context, lambda *args, **kwargs: output)
+        try:
+            return super().parse(**kwargs)
+        finally:
+            delattr(self, context)
+
+
+def _reference(schema, data, *args, **kwargs):
+    '''Validate data with schemaengine'''
+    return Schema(schema).validate(data, *args, **kwargs)
+
+
+def _reference_ok(schema, data):
+    try:
+        _reference(schema, data)
+    except Exception:
+        return False
+    return True
+
+
+def _inner(node, names):
+    '''Return the schema wrapped by an Optional, or the arguments of an Or'''
+    for name in names:
+        if hasattr(node, name):
+            return getattr(node, name)
+    raise NotCompilable('Unknown schemaengine node {!r}'.format(node))
+
+
+def _args(node):
+    # schemas in schemaengine, args in the schema library it derives from
+    return _inner(node, ('schemas', '_args', 'args'))
+
+
+def compile_schema(schema):
+    '''Return a function of a value, True if the value is valid against the
+    schema. False if it is not, or if schemaengine has to tell, for a dict
+    subclass for instance. Raise NotCompilable if the schema cannot be
+    compiled'''
+    if isinstance(schema, CompiledSchema):
+        schema = dict(schema)
+    if type(schema) is dict:
+        return _compile_dict(schema)
+    if type(schema) is list:
+        return _compile_list(schema)
+    if isinstance(schema, type):
+        return _compile_type(schema)
+    if isinstance(schema, Any):
+        return lambda value: True
+    # Exact types, And and Or may subclass one another
+    if type(schema) is Or:
+        alternatives = [compile_schema(node) for node in _args(schema)]
+        return lambda value: any(check(value) for check in alternatives)
+    if type(schema) is And:
+        conditions = [compile_schema(node) for node in _args(schema)]
+        return lambda value: all(check(value) for check in conditions)
+    if isinstance(schema, (str, int, float, bool, type(None))):
+        return lambda value: value == schema
+    if isinstance(schema, (types.FunctionType, types.MethodType)):
+        # Such as the regexp of Common, which return the value unchanged
+        return lambda value: _reference_ok(schema, value)
+    # Use(), Default() and the like, which may transform the values
+    raise NotCompilable('Unknown schemaengine node {!r}'.format(schema))
+
+
+def _compile_type(schema):
+    # A subclass, bool for int, is left to schemaengine
+    return lambda value: type(value) is schema
+
+
+def _compile_list(schema):
+    alternatives = [compile_schema(node) for node in schema]
+
+    def validate(value):
+        if type(value) is not list:
+            return False
+        return all(any(check(item) for check in alternatives)
+                   for item in value)
+    return validate
+
+
+def _compile_dict(schema):
+    # data key -> validator of its value
+    literal = {}
+    required = set()
+    pattern = None
+    for key, node in schema.items():
+        if isinstance(key, Default):
+            # Sets the default of a missing key, an Optional of schemaengine
+            raise NotCompilable('Default key {!r} in {!r}'.format(key, schema))
+        optional = isinstance(key, Optional) and not isinstance(key, Any)
+        if optional:
+            key = _inner(key, ('_schema', 'schema'))
+        check = compile_schema(node)
+        if isinstance(key, Any):
+            if pattern:
+                # Which Any() key a value is validated with is left to
+                # schemaengine
+                raise NotCompilable('Several Any() keys in {!r}'.format(schema))
+            # The shallow check of the values which are not sampled
+            shallow = (lambda value: type(value) is dict) \
+                if type(node) is dict else check
+            pattern = (check, shallow, not optional)
+        elif isinstance(key, str):
+            literal[key] = check
+            if not optional:
+                required.add(key)
+        else:
+            raise NotCompilable('Unknown key {!r} in {!r}'.format(key, schema))
+    pattern_check, pattern_shallow, pattern_required = \
+        pattern or (None, None, False)
+
+    def validate(value):
+        if type(value) is not dict:
+            return False
+        sampled = _settings['sampled']
+        rest = []
+        found = 0
+        patterns = 0
+        for key, item in value.items():
+            check = literal.get(key)
+            if check is None:
+                if pattern_check is None:
+                    return False
+                patterns += 1
+                if sampled:
+                    rest.append(item)
+                    continue
+                check = pattern_check
+            elif key in required:
+                found += 1
+            if not check(item):
+                return False
+        if found != len(required):
+            return False
+        if pattern_required and not patterns:
+            # Whether an Any() key needs a value is left to schemaengine
+            return False
+        return not rest or _check_sample(rest, pattern_check, pattern_shallow)
+    return validate
+
+
+def _check_sample(values, check, shallow):
+    '''Validate the first and a random sample of the values, and only the
+    shallow check of the others'''
+    first = _settings['first']
+    count = _settings['sample']
+    if len(values) <= first + count:
+        return all(check(value) for value in values)
+    picked = set(_random.sample(range(first, len(values)), count))
+    for index, value in enumerate(values):
+        if index < first or index in picked:
+            if not check(value):
+                return False
+        elif not shallow(value):
+            return False
+    return True
+
+
+def configure(mode='strict', first=SAMPLE_FIRST, sample=SAMPLE_RANDOM,
+              seed=None):
+    '''Select the validation of the compiled schemas: strict, sampled or
+    reference. Without arguments, restore the strict validation'''
+    if mode not in MODES:
+        raise ValueError('{m} is not one of {modes}'.format(
+            m=mode, modes=', '.join(MODES)))
+    with _lock:
+        _settings['mode'] = mode
+        _settings['sampled'] = mode == 'sampled'
+        _settings['first'] = first
+        _settings['sample'] = sample
+        if seed is not None:
+            _random.seed(seed)
+
+
+def configure_from_env():
+    '''Configure the validation from GENIE_SCHEMA_VALIDATION'''
+    value = os.environ.get(SCHEMA_VALIDATION_ENV)
+    if value:
+        configure(value)
+
+
+configure_from_env()
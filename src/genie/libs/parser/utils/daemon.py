@@ -0,0 +1,281 @@
+'''Long-lived local parse server
+
+Starting a Python interpreter and importing the parser registry costs more
+than parsing a typical output. ``genie-parser-daemon`` pays that cost once:
+it preloads the registry and the selected OS packages, then answers parse
+requests over a Unix domain socket, or over stdin/stdout.
+
+Requests and responses are JSON documents, one per line::
+
+    {"id": 1, "os": "iosxe", "command": "show version", "output": "...",
+     "kwargs": {}}
+
+    {"id": 1, "ok": true, "result": {...},
+     "timing": {"lookup_ms": 0.02, "parse_ms": 1.93}}
+
+    {"id": 2, "ok": false, "error": "...", "error_type": "Exception",
+     "timing": {...}}
+
+``platform`` is optional, and ``{"op": "ping"}`` can be sent to check the
+daemon is alive. Outputs are normalized before parsing, see
+`genie.libs.parser.utils.normalize`, unless the request holds
+``"normalize": false`` or the daemon runs with ``--no-normalize``. Clients
+can use `genie.libs.parser.utils.daemon_client`, which only depends on the
+standard library.
+
+Example:
+
+    $ genie-parser-daemon --socket /tmp/genie-parser.sock --preload iosxe nxos
+    $ genie-parser-daemon --stdio --preload iosxe --preload-modules
+'''
+
+# python
+import os
+import sys
+import json
+import stat
+import time
+import socket
+import pkgutil
+import logging
+import argparse
+import importlib
+import socketserver
+
+# parser utils
+from .common import _get_parser_data
+from .offline import get_offline_parser, get_offline_device
+from .normalize import normalize as normalize_output
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SOCKET = '/tmp/genie-parser.sock'
+
+
+def preload(os_names, modules=False):
+    '''Load the parser data, import OS packages, and optionally all their
+    parser modules
+
+    Args:
+        os_names (`list`): OS packages to import, for example ['iosxe']
+        modules (`bool`): import every parser module of these packages
+
+    Returns:
+        number of imported modules
+    '''
+    # Loaded on first use otherwise, by the first request
+    _get_parser_data()
+    count = 0
+    for os_name in os_names:
+        package = importlib.import_module('genie.libs.parser.' + os_name)
+        count += 1
+        if modules:
+            count += _import_submodules(package)
+    return count
+
+
+def _import_submodules(package):
+    '''Import parser modules and token packages, skipping the unittests'''
+    count = 0
+    for info in pkgutil.iter_modules(package.__path__):
+        if info.name == 'tests':
+            continue
+        name = '{p}.{m}'.format(p=package.__name__, m=info.name)
+        try:
+            module = importlib.import_module(name)
+        except Exception as e:
+            log.warning('Could not preload {n}: {e}'.format(n=name, e=e))
+            continue
+        count += 1
+        if info.ispkg:
+            count += _import_submodules(module)
+    return count
+
+
+class ParseServer(object):
+    '''Answer parse requests, independently of the transport
+
+    Args:
+        normalize (`bool`): normalize the outputs of the requests which do
+                            not say otherwise. Defaults to True
+    '''
+
+    def __init__(self, normalize=True):
+        self.normalize = normalize
+
+    def handle(self, request):
+        '''Parse one request
+
+        Args:
+            request (`dict`): os, command, output and optionally platform,
+                              kwargs, normalize and id
+
+        Returns:
+            response (`dict`)
+        '''
+        if not isinstance(request, dict):
+            return {'id': None, 'ok': False,
+                    'error': 'Invalid request, expected a JSON object: '
+                             '{r!r}'.format(r=request),
+                    'error_type': 'TypeError'}
+
+        response = {'id': request.get('id')}
+
+        if request.get('op') == 'ping':
+            response['ok'] = True
+            return response
+
+        timing = response['timing'] = {}
+        start = time.perf_counter()
+        try:
+            os_name = request['os']
+            command = request['command']
+            platform = request.get('platform')
+
+            parser_cls, found_kwargs = get_offline_parser(
+                os_name, command, platform=platform)
+            lookup_done = time.perf_counter()
+            timing['lookup_ms'] = (lookup_done - start) * 1000
+
+            kwargs = dict(found_kwargs)
+            kwargs.update(request.get('kwargs') or {})
+            output = request['output']
+            if request.get('normalize', self.normalize):
+                output = normalize_output(output)
+            device = get_offline_device(os_name, platform)
+            response['result'] = parser_cls(device=device).parse(
+                output=output, **kwargs)
+            timing['parse_ms'] = (time.perf_counter() - lookup_done) * 1000
+        except Exception as e:
+            response['ok'] = False
+            response['error'] = str(e)
+            response['error_type'] = type(e).__name__
+            timing.setdefault('lookup_ms', (time.perf_counter() - start) * 1000)
+            return response
+
+        response['ok'] = True
+        return response
+
+    def handle_line(self, line):
+        '''Parse one JSON line, returning the JSON line of the response'''
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {'id': None, 'ok': False,
+                        'error': 'Invalid JSON request: {e}'.format(e=e),
+                        'error_type': type(e).__name__}
+        else:
+            response = self.handle(request)
+
+        return json.dumps(response, default=str) + '\n'
+
+    def serve_stream(self, rfile, wfile):
+        '''Answer every JSON line of rfile on wfile'''
+        for line in rfile:
+            if not line.strip():
+                continue
+            wfile.write(self.handle_line(line))
+            wfile.flush()
+
+
+class _StreamHandler(socketserver.StreamRequestHandler):
+    '''One client connection, any number of requests'''
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            # Invalid UTF-8 of an output is replaced, not fatal to the client
+            response = self.server.parse_server.handle_line(
+                line.decode(errors='replace'))
+            self.wfile.write(response.encode())
+            self.wfile.flush()
+
+
+class UnixParseServer(socketserver.ThreadingMixIn,
+                      socketserver.UnixStreamServer):
+    '''Parse server listening on a Unix domain socket'''
+
+    daemon_threads = True
+
+    def __init__(self, path, parse_server=None):
+        _remove_stale_socket(path)
+        self.parse_server = parse_server or ParseServer()
+        super().__init__(path, _StreamHandler)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def _remove_stale_socket(path):
+    '''Remove the socket file left behind by a daemon no longer running,
+    which prevents binding. Raise FileExistsError if path is not a socket,
+    or if a daemon still answers on it'''
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError('{p} exists and is not a socket'.format(p=path))
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+    raise FileExistsError('A daemon is already listening on {p}'.format(
+        p=path))
+
+
+def main(argv=None):
+    '''Entry point of genie-parser-daemon'''
+    parser = argparse.ArgumentParser(
+        description='Long-lived local parse server')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET,
+                        help='Unix domain socket to listen on '
+                             '(default: %(default)s)')
+    parser.add_argument('--stdio', action='store_true',
+                        help='Answer JSON lines on stdin/stdout instead of '
+                             'listening on a socket')
+    parser.add_argument('--preload', nargs='*', default=[], metavar='OS',
+                        help='OS packages to import at start-up')
+    parser.add_argument('--preload-modules', action='store_true',
+                        help='Also import every parser module of the '
+                             'preloaded OS packages')
+    parser.add_argument('--no-normalize', action='store_true',
+                        help='Do not normalize the outputs by default, when '
+                             'the clients send clean outputs')
+    parser.add_argument('--log-level', default='INFO',
+                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='Level of the messages logged on stderr '
+                             '(default: %(default)s)')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level)
+
+    start = time.perf_counter()
+    count = preload(args.preload, modules=args.preload_modules)
+    log.info('Preloaded {c} modules in {t:.2f}s'.format(
+        c=count, t=time.perf_counter() - start))
+
+    parse_server = ParseServer(normalize=not args.no_normalize)
+    if args.stdio:
+        parse_server.serve_stream(sys.stdin, sys.stdout)
+        return
+
+    try:
+        server = UnixParseServer(args.socket, parse_server=parse_server)
+    except FileExistsError as e:
+        parser.error(str(e))
+    log.info('Listening on {s}'.format(s=args.socket))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
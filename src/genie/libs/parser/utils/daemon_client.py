@@ -0,0 +1,127 @@
+'''Client of the genie-parser-daemon parse server
+
+This module only depends on the Python standard library, so it can be
+copied next to any script which needs parsing without importing genie.
+
+Example:
+
+    >>> from daemon_client import ParseClient
+    >>> with ParseClient('/tmp/genie-parser.sock') as client:
+    ...     parsed = client.parse('iosxe', 'show version', output)
+
+    $ python daemon_client.py --os iosxe --command 'show version' < out.txt
+'''
+
+import sys
+import json
+import socket
+import argparse
+import itertools
+
+DEFAULT_SOCKET = '/tmp/genie-parser.sock'
+
+
+class ParseError(Exception):
+    '''Parse request failed on the daemon'''
+
+    def __init__(self, response):
+        super().__init__('{t}: {e}'.format(t=response.get('error_type'),
+                                           e=response.get('error')))
+        self.response = response
+
+
+class ParseClient(object):
+    '''Persistent connection to genie-parser-daemon
+
+    Args:
+        path (`str`): Unix domain socket of the daemon
+        timeout (`float`): socket timeout in seconds
+    '''
+
+    def __init__(self, path=DEFAULT_SOCKET, timeout=None):
+        self.path = path
+        self.timeout = timeout
+        self._socket = None
+        self._file = None
+        self._ids = itertools.count(1)
+
+    def connect(self):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(self.timeout)
+        self._socket.connect(self.path)
+        self._file = self._socket.makefile('rwb')
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._socket:
+            self._socket.close()
+            self._socket = None
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def request(self, request):
+        '''Send one request and return the raw response'''
+        if not self._socket:
+            self.connect()
+        request.setdefault('id', next(self._ids))
+        self._file.write((json.dumps(request) + '\n').encode())
+        self._file.flush()
+
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError('genie-parser-daemon closed the connection')
+        return json.loads(line.decode())
+
+    def parse(self, os, command, output, platform=None, timing=False,
+              **kwargs):
+        '''Parse an output on the daemon
+
+        Returns:
+            parsed output, or (parsed output, timing) tuple if timing is True
+
+        Raises:
+            ParseError: the daemon failed to parse the output
+        '''
+        response = self.request({'os': os,
+                                 'platform': platform,
+                                 'command': command,
+                                 'output': output,
+                                 'kwargs': kwargs})
+        if not response.get('ok'):
+            raise ParseError(response)
+        if timing:
+            return response['result'], response['timing']
+        return response['result']
+
+    def ping(self):
+        return self.request({'op': 'ping'}).get('ok', False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Parse stdin with genie-parser-daemon')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET)
+    parser.add_argument('--os', required=True)
+    parser.add_argument('--platform', default=None)
+    parser.add_argument('--command', required=True)
+    args = parser.parse_args(argv)
+
+    with ParseClient(args.socket) as client:
+        response = client.request({'os': args.os,
+                                   'platform': args.platform,
+                                   'command': args.command,
+                                   'output': sys.stdin.read()})
+    json.dump(response, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    return 0 if response.get('ok') else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
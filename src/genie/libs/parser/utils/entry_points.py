@@ -37,7 +37,7 @@ import sys
 import pkg_resources
 import logging
 
-from .common import parser_data
+from .common import _get_parser_data
 
 log = logging.getLogger(__name__)
 
@@ -65,6 +65,7 @@ def add_parser(parser, os_name):
     mod = sys.modules[parser.__module__]
     package = mod.__package__
 
+    parser_data = _get_parser_data()
     cli_commands = parser.cli_command
     if isinstance(cli_commands, str):
         cli_commands = [cli_commands]
@@ -93,5 +94,3 @@ def load_entry_points():
             for parser in parser_list:
                 add_parser(parser=parser, os_name=os_name)
 
-
-load_entry_points()
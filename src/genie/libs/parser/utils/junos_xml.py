@@ -0,0 +1,263 @@
+'''Mapping of Junos ``| display xml`` / ``| display json`` outputs onto
+parser schemas
+
+The cli output of most Junos show commands is a rendering of the XML RPC
+reply of the command, and the schemas of the junos parsers follow the
+xmltodict conversion of that reply: element names are the keys, attributes
+are ``@<name>`` keys and the text of an element holding attributes is the
+``#text`` key.
+
+A shape tells which part of the reply a parser keeps, with the notation of
+the schemas:
+
+* ``str``: text of the element, stripped, skipped when empty
+* ``bool``: True when the element is present, for flags such as
+  ``<iff-up/>``
+* ``[str]``: texts of the repeated element, always a list. Empty texts
+  are kept, so that the lists of sibling elements stay aligned
+* ``{...}``: element holding the given children, attributes or '#text'. A
+  list when the element is repeated, like xmltodict does
+* ``[{...}]``: repeated element, always a list
+
+Elements which are not in the shape, and their children, are skipped.
+`parse_xml` reads the reply incrementally and does not build the elements,
+so replies of several hundred MB are read with a constant amount of memory
+besides the parsed dictionary.
+
+Example:
+
+    >>> shape = {'route-information': {
+    ...     'route-table': [{'table-name': str,
+    ...                      'rt': [{'rt-destination': str,
+    ...                              'rt-entry': {'active-tag': str,
+    ...                                           'age': {'#text': str,
+    ...                                                   '@junos:seconds': str}
+    ...                                           }}]}]}}
+    >>> parse_xml(output, shape)
+    {'route-information': {'route-table': [{'table-name': 'inet.0', ...
+'''
+
+# python
+import re
+import json
+import xml.etree.ElementTree as ET
+
+# parser utils
+from genie.libs.parser.utils.xml_stream import chunks, local_name
+
+XML_PIPE = ' | display xml'
+JSON_PIPE = ' | display json'
+
+# Last tag of the document, the prompt follows it
+_END_TAG = '</rpc-reply>'
+
+# Start of the json document, unlike the {master} line of the prompt
+_JSON_START = re.compile(r'{\s*"')
+
+
+def _attach(node, key, value, listed):
+    '''Add value under key of node, turning repeated keys into a list'''
+    if listed:
+        node.setdefault(key, []).append(value)
+    elif key not in node:
+        node[key] = value
+    elif isinstance(node[key], list):
+        node[key].append(value)
+    else:
+        node[key] = [node[key], value]
+
+
+def _prefixed(shape, name):
+    '''Return the <prefix>:<name> attribute of the shape, or name'''
+    for key in shape:
+        if key.startswith('@') and key.endswith(':' + name):
+            return key[1:]
+    return name
+
+
+def _text(value):
+    '''Return the stripped text of a value, or None when it is empty'''
+    if value is None:
+        return None
+    value = value.strip()
+    return value or None
+
+
+class _ShapeBuilder(object):
+    '''Target of the xml parser, building the parsed dictionary from the
+    parser callbacks, without creating the elements of the document'''
+
+    def __init__(self, shape):
+        self.parsed = {}
+        # prefix of each namespace, for the @junos:<name> attributes
+        self._prefixes = {}
+        # (key, shape, dictionary, listed) of the open elements, key is None
+        # for the elements which are skipped or do not add a key, like
+        # <rpc-reply>
+        self._frames = [(None, shape, self.parsed, False)]
+        # text of the open element, None when it is not kept
+        self._text = None
+
+    def start_ns(self, prefix, uri):
+        self._prefixes.setdefault(uri, prefix)
+
+    def start(self, tag, attrib):
+        frames = self._frames
+        _, spec, node, _ = frames[-1]
+        name = local_name(tag)
+        self._text = None
+
+        if isinstance(spec, dict) and name in spec:
+            spec = spec[name]
+            listed = isinstance(spec, list)
+            inner = spec[0] if listed else spec
+            child = None
+            if inner is str:
+                self._text = []
+            elif isinstance(inner, dict):
+                child = {}
+                for attr, value in attrib.items():
+                    if attr.startswith('{'):
+                        uri, attr = attr[1:].split('}', 1)
+                        if self._prefixes.get(uri):
+                            attr = self._prefixes[uri] + ':' + attr
+                        else:
+                            # start_ns is only called from Python 3.8, the
+                            # prefix is then the one of the shape
+                            attr = _prefixed(inner, attr)
+                    if '@' + attr in inner:
+                        child['@' + attr] = value
+                if '#text' in inner:
+                    self._text = []
+            frames.append((name, inner, child, listed))
+        elif len(frames) == 1:
+            # Document element wrapping the reply
+            frames.append((None, spec, node, False))
+        else:
+            frames.append((None, None, None, False))
+
+    def data(self, data):
+        if self._text is not None:
+            self._text.append(data)
+
+    def end(self, tag):
+        key, inner, child, listed = self._frames.pop()
+        text, self._text = self._text, None
+        if key is None:
+            return
+
+        text = _text(''.join(text)) if text else None
+        if inner is bool:
+            value = True
+        elif inner is str:
+            value = '' if text is None and listed else text
+        else:
+            if text is not None:
+                child['#text'] = text
+            value = child or None
+        if value is not None:
+            _attach(self._frames[-1][2], key, value, listed)
+
+    def close(self):
+        return self.parsed
+
+
+def parse_xml(output, shape, chunk_size=65536):
+    '''Parse a ``| display xml`` output
+
+    The elements are not built: the dictionary is filled from the callbacks
+    of the parser, so only the keys of the shape are ever kept in memory.
+
+    Args:
+        output (`str`): device output, or a file object opened in text mode,
+                        such as a MappedOutput. The document ends at
+                        </rpc-reply>, the prompt following it is not read
+        shape (`dict`): elements to keep, below <rpc-reply>
+        chunk_size (`int`): number of characters fed to the parser at a time
+
+    Returns:
+        parsed dictionary, empty if the output is empty
+    '''
+    builder = _ShapeBuilder(shape)
+    parser = ET.XMLParser(target=builder)
+    empty = True
+    for chunk in chunks(output, chunk_size, _END_TAG):
+        empty = empty and not chunk.strip()
+        parser.feed(chunk)
+    if not empty:
+        parser.close()
+
+    return builder.parsed
+
+
+def _json_value(entry, spec, listed):
+    '''Convert one entry of a ``| display json`` element'''
+    if spec is bool:
+        return True
+    if spec is str:
+        data = entry.get('data') if isinstance(entry, dict) else entry
+        text = _text(data) if isinstance(data, str) else None
+        return '' if text is None and listed else text
+    if not isinstance(entry, dict):
+        return None
+    return _json_element(entry, spec)
+
+
+def _json_element(element, spec):
+    '''Convert an object of a ``| display json`` output
+
+        {"age": [{"data": "3w2d 4:43:35",
+                  "attributes": {"junos:seconds": "2000615"}}]}
+    '''
+    node = {}
+    attributes = element.get('attributes') or {}
+    for key, sub in spec.items():
+        if key == '#text':
+            data = element.get('data')
+            if isinstance(data, str) and _text(data) is not None:
+                node[key] = _text(data)
+            continue
+        if key.startswith('@'):
+            if key[1:] in attributes:
+                node[key] = attributes[key[1:]]
+            continue
+
+        entries = element.get(key)
+        if entries is None:
+            continue
+        if not isinstance(entries, list):
+            entries = [entries]
+        listed = isinstance(sub, list)
+        inner = sub[0] if listed else sub
+        values = [value for value in (_json_value(entry, inner, listed)
+                                      for entry in entries)
+                  if value is not None]
+        if values:
+            node[key] = values[0] if len(values) == 1 and not listed \
+                        else values
+    return node or None
+
+
+def parse_json(output, shape):
+    '''Parse a ``| display json`` output
+
+    Junos renders each element as a list of objects, the text of an element
+    as "data" and its attributes as "attributes". An empty element is
+    rendered as ``[{"data": [null]}]``.
+
+    Args:
+        output (`str`): device output, or an already loaded document
+        shape (`dict`): elements to keep
+
+    Returns:
+        parsed dictionary, empty if the output is empty
+    '''
+    if not isinstance(output, dict):
+        if not output or not output.strip():
+            return {}
+        start = _JSON_START.search(output)
+        if not start:
+            raise Exception("Output is not a JSON document: '{o}'".format(
+                o=output[:80]))
+        output, _ = json.JSONDecoder().raw_decode(output, start.start())
+    return _json_element(output, shape) or {}
@@ -0,0 +1,82 @@
+'''Parser classes of an OS package, imported on first access
+
+An OS package resolves its parser classes by name through a module
+__getattr__ (PEP 562), from the modules and classes of parsers.json:
+
+    # genie/libs/parser/iosxe/__init__.py
+    from genie.libs.parser.utils.lazy_import import lazy_parsers
+    __getattr__, __dir__ = lazy_parsers(__name__)
+
+genie.libs.parser.iosxe.ShowVersion then only imports
+genie.libs.parser.iosxe.show_platform, and not the other modules of the
+package. The class is then set on the package, later accesses do not go
+through __getattr__.
+
+Python 3.6 has no module __getattr__, the classes are only found in their
+modules there, as before.
+'''
+
+# python
+import sys
+import importlib
+
+# parser utils
+from .common import _get_parser_data
+
+PACKAGE = 'genie.libs.parser'
+
+
+def parser_modules(package, data=None):
+    '''Return {class name: module name} of the parsers of a package of
+    genie.libs.parser, an OS package or one of its token packages
+
+    Args:
+        package (`str`): name of the package, genie.libs.parser.iosxe
+        data (`dict`): parser data, of parsers.json by default
+    '''
+    if data is None:
+        data = _get_parser_data()
+    tokens = package[len(PACKAGE) + 1:].split('.')
+    modules = {}
+    for command, values in data.items():
+        if command == 'tokens':
+            continue
+        entry = values
+        for token in tokens:
+            entry = entry.get(token)
+            if not isinstance(entry, dict):
+                break
+        else:
+            # The parsers added by external packages are in their package
+            if 'class' in entry and entry.get('package') == PACKAGE:
+                modules.setdefault(entry['class'],
+                                   package + '.' + entry['module_name'])
+    return modules
+
+
+def lazy_parsers(package):
+    '''Return the __getattr__ and __dir__ of a package, which resolve its
+    parser classes by importing their module on first access'''
+    index = []
+
+    def modules():
+        if not index:
+            index.append(parser_modules(package))
+        return index[0]
+
+    def __getattr__(name):
+        '''Parser classes by name'''
+        # Dunder and private names are looked up by the import machinery
+        # and genie.abstract, never load parsers.json for them
+        module = None if name.startswith('_') else modules().get(name)
+        if module:
+            cls = getattr(importlib.import_module(module), name)
+            setattr(sys.modules[package], name, cls)
+            return cls
+        raise AttributeError("module '{m}' has no attribute '{n}'".format(
+            m=package, n=name))
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(modules()))
+
+    return __getattr__, __dir__
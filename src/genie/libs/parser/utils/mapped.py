@@ -0,0 +1,194 @@
+'''Memory-mapped outputs of captured files
+
+Reading a capture of several GB (``show logging``, ``show ip bgp``,
+``show route extensive``) into a `str` costs its size in memory, several
+times over for the non-ASCII characters, and ``splitlines()`` doubles it
+before the parser reads the first line.
+
+`MappedOutput` memory-maps the file instead. The pages of the file are
+read by the OS as the parser goes, and the lines are decoded a block at a
+time:
+
+* ``splitlines()`` and iteration yield the lines lazily, decoding and
+  splitting blocks of about 1 MB of whole lines, so parsers which only loop
+  over ``output.splitlines()`` parse the file with a constant amount of
+  memory besides their result
+* ``grep()`` scans the file with a ``bytes`` pattern and only decodes the
+  lines it matches
+* ``read()`` makes it a text file object, for `junos_xml.parse_xml` and
+  `xml_stream.XmlStream`
+* ``text()`` returns the whole decoded output, for the other parsers
+
+Parsers which accept a `MappedOutput` as output say so with the
+``mapped_output = True`` class attribute. `offline.parse_output` gives the
+decoded text to the others.
+
+Example:
+
+    >>> with MappedOutput('r1/show_logging.txt') as output:
+    ...     for line in output.grep(rb'%BGP-5-ADJCHANGE'):
+    ...         print(line)
+
+    >>> from genie.libs.parser.utils.offline import parse_file
+    >>> parsed = parse_file('iosxe', 'show logging', 'r1/show_logging.txt')
+'''
+
+# python
+import re
+import mmap
+import codecs
+
+# parser utils
+from .normalize import normalize as normalize_output
+
+# Lines which need to be normalized: control characters or pager prompts
+_DIRTY = re.compile(rb'[\x00-\x08\x0b-\x1f\x7f]|--More--|---\(more|'
+                    rb'<--- More --->')
+
+# Size of the pieces of the file counted or decoded at once
+_BLOCK = 1 << 20
+
+
+class MappedOutput(object):
+    '''Output saved in a file, memory-mapped
+
+    Args:
+        path (`str`): file holding the output
+        encoding (`str`): encoding of the file. Defaults to 'utf-8'
+        errors (`str`): handling of the bytes which cannot be decoded.
+                        Defaults to 'replace'
+        normalize (`bool`): remove the terminal artifacts of the lines, see
+                            `normalize.normalize`. Defaults to True
+    '''
+
+    def __init__(self, path, encoding='utf-8', errors='replace',
+                 normalize=True):
+        self.path = path
+        self.encoding = encoding
+        self.errors = errors
+        self.normalize = normalize
+
+        self._file = open(path, 'rb')
+        try:
+            # An empty file cannot be mapped
+            self._map = mmap.mmap(self._file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        except ValueError:
+            self._map = b''
+        self._decoder = None
+        self._position = 0
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        '''Size of the output, in bytes'''
+        return len(self._map)
+
+    def __bool__(self):
+        return len(self._map) > 0
+
+    def __repr__(self):
+        return '<{c} {p!r}, {s} bytes>'.format(c=type(self).__name__,
+                                               p=self.path, s=len(self))
+
+    def line_count(self):
+        '''Return the number of new lines of the output'''
+        data = self._map
+        return sum(data[start:start + _BLOCK].count(b'\n')
+                   for start in range(0, len(data), _BLOCK))
+
+    def _decode(self, line):
+        '''Decode one line, without its line end'''
+        if line.endswith(b'\r'):
+            line = line[:-1]
+        if self.normalize and _DIRTY.search(line):
+            return normalize_output(line.decode(self.encoding, self.errors))
+        return line.decode(self.encoding, self.errors)
+
+    def _blocks(self):
+        '''Yield the output by blocks of whole lines'''
+        data = self._map
+        size = len(data)
+        start = 0
+        while start < size:
+            end = data.rfind(b'\n', start, start + _BLOCK) + 1
+            if end <= start:
+                # Line longer than a block
+                end = data.find(b'\n', start + _BLOCK) + 1 or size
+            yield data[start:end]
+            start = end
+
+    def splitlines(self):
+        '''Yield the lines of the output, decoded as they are reached
+
+        Unlike str.splitlines(), the lines are only split on new lines.
+        '''
+        for block in self._blocks():
+            text = block.decode(self.encoding, self.errors)
+            if self.normalize and _DIRTY.search(block):
+                text = normalize_output(text)
+            elif '\r' in text:
+                text = text.replace('\r\n', '\n')
+
+            lines = text.split('\n')
+            if not lines[-1]:
+                lines.pop()
+            yield from lines
+
+    __iter__ = splitlines
+
+    def grep(self, pattern):
+        '''Yield the lines holding a match of pattern, only these lines are
+        decoded
+
+        Args:
+            pattern: `bytes` regular expression, compiled or not. A `str`
+                     pattern is encoded with the encoding of the output
+        '''
+        if isinstance(pattern, str):
+            pattern = pattern.encode(self.encoding)
+        if not hasattr(pattern, 'finditer'):
+            pattern = re.compile(pattern, re.MULTILINE)
+
+        data = self._map
+        next_line = 0
+        for match in pattern.finditer(data):
+            if match.start() < next_line:
+                # Another match of a line already returned
+                continue
+            start = data.rfind(b'\n', 0, match.start()) + 1
+            end = data.find(b'\n', match.end())
+            if end < 0:
+                end = len(data)
+            next_line = end + 1
+            yield self._decode(data[start:end])
+
+    def read(self, size=-1):
+        '''Read the decoded output like a text file, size is in bytes'''
+        if self._decoder is None:
+            self._decoder = codecs.getincrementaldecoder(self.encoding)(
+                errors=self.errors)
+        data = self._map
+        end = len(data) if size is None or size < 0 else \
+            min(self._position + size, len(data))
+        chunk = self._decoder.decode(data[self._position:end],
+                                     final=end == len(data))
+        self._position = end
+        return chunk
+
+    def text(self):
+        '''Return the whole decoded output'''
+        data = self._map
+        if isinstance(data, mmap.mmap):
+            data = data[:]
+        text = data.decode(self.encoding, self.errors)
+        return normalize_output(text) if self.normalize else text
@@ -0,0 +1,130 @@
+'''Clean-up of raw cli outputs before parsing
+
+Outputs captured from an interactive session, a console server or a log
+carry terminal artifacts that no parser expects: ``\\r\\n`` line ends,
+ANSI escape sequences, pager prompts such as ``--More--`` and the
+backspaces or carriage returns erasing them. Left in the output, a pager
+prompt ends up in front of the next line, which then fails every pattern of
+the parser.
+
+`normalize` removes these artifacts once per output, before the parser
+runs:
+
+* ``\\r\\n`` becomes ``\\n``
+* a carriage return or a backspace inside a line moves back the cursor,
+  like on a terminal: what follows overwrites the line
+* ANSI escape sequences are removed, and erase-line sequences clear the
+  end of the line
+* pager prompts left at the start of a line are removed: ``--More--``,
+  ``---(more)---``, ``---(more 45%)---`` and ``<--- More --->``. A line
+  holding only the prompt is removed
+* other control characters, except tabs and form feeds, are removed
+
+The outputs parsed by this package are normalized, unless the caller opts
+out: offline.parse_output, ParserPipeline, ReplayDevice, genie-parser-bulk
+and genie-parser-daemon. device.parse() and MetaParser.parse belong to
+genie.conf and genie.metaparser, they parse the output of the connection as
+it is. The parsers still strip their lines, for the indentation of the
+outputs.
+
+An output without any of these artifacts is returned as is, after one scan
+per kind of artifact. Trailing spaces are kept by default, as the column
+parsers find the width of the last column from the trailing spaces of its
+header. ``trailing_spaces=True`` removes them as well.
+
+Example:
+
+    >>> from genie.libs.parser.utils.normalize import normalize
+    >>> normalize('Gi1  up\\r\\n --More-- \\b\\b\\b\\b\\b\\b\\b\\b\\b\\b'
+    ...           '          \\b\\b\\b\\b\\b\\b\\b\\b\\b\\bGi2  down\\r\\n')
+    'Gi1  up\\nGi2  down\\n'
+'''
+
+# python
+import re
+
+# Erase-line sequences (ESC [ K, ESC [ 0 K), replaced by ERASE until the
+# lines are rebuilt
+ERASE = '\ue000'
+_ERASE_LINE = re.compile(r'\x1b\[0?K')
+
+# Other escape sequences: CSI sequences, charset selection and two
+# character sequences
+_ANSI = re.compile(r'\x1b(?:\[[0-?]*[ -/]*[@-~]|[()][0-9A-Za-z]|[@-Z\\-_])')
+
+# Pager prompts at the start of a line, with the line end when nothing
+# follows them
+_PAGER = re.compile(r'^[ \t]*(?:--More--|---\(more(?: \d+%)?\)---|'
+                    r'<--- More --->)[ \t]*\n?', re.MULTILINE)
+
+# Lines ending with spaces or tabs
+_TRAILING = re.compile(r'[ \t]+$', re.MULTILINE)
+
+# Control characters removed by str.translate, tabs, new lines and form
+# feeds are kept
+_CONTROLS = dict.fromkeys(c for c in range(32) if chr(c) not in '\t\n\f')
+_CONTROLS[0x7f] = None
+_CONTROL_CHARS = [chr(c) for c in _CONTROLS]
+
+
+def _render(line):
+    '''Return a line as a terminal displays it, applying the carriage
+    returns, backspaces and erase-line markers'''
+    screen = []
+    cursor = 0
+    for char in line:
+        if char == '\r':
+            cursor = 0
+        elif char == '\b':
+            cursor = max(cursor - 1, 0)
+        elif char == ERASE:
+            del screen[cursor:]
+        else:
+            if cursor < len(screen):
+                screen[cursor] = char
+            else:
+                screen.append(char)
+            cursor += 1
+    # The cells erased with spaces are blank
+    return ''.join(screen).rstrip(' ')
+
+
+def normalize(output, trailing_spaces=False):
+    '''Return output without its terminal artifacts
+
+    Args:
+        output (`str`): device output
+        trailing_spaces (`bool`): also remove the spaces at the end of the
+                                  lines
+
+    Returns:
+        normalized output, output itself when there is nothing to clean
+    '''
+    if not output or not isinstance(output, str):
+        return output
+
+    if '\r' in output:
+        output = output.replace('\r\n', '\n')
+
+    if '\x1b' in output:
+        output = _ERASE_LINE.sub(ERASE, output)
+        output = _ANSI.sub('', output)
+
+    # Substring tests are much faster than a regex character class on
+    # large outputs
+    if '\r' in output or '\b' in output or ERASE in output:
+        output = '\n'.join(_render(line)
+                           if '\r' in line or '\b' in line or ERASE in line
+                           else line
+                           for line in output.split('\n'))
+
+    if 'More' in output or '(more' in output:
+        output = _PAGER.sub('', output)
+
+    if any(char in output for char in _CONTROL_CHARS):
+        output = output.translate(_CONTROLS)
+
+    if trailing_spaces:
+        output = _TRAILING.sub('', output)
+
+    return output
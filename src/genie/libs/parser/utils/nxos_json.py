@@ -0,0 +1,147 @@
+'''Mapping of NX-OS ``| json`` outputs onto parser schemas
+
+NX-OS renders most show commands as JSON when piped to ``| json``. Lists are
+nested as ``TABLE_<name>`` / ``ROW_<name>`` pairs, and a single row or a
+single table is rendered as an object instead of a one element list::
+
+    {"TABLE_vrf": {"ROW_vrf": [{"vrf-name-out": "default", ...},
+                               {"vrf-name-out": "VRF1", ...}]}}
+
+    {"TABLE_vrf": {"ROW_vrf": {"vrf-name-out": "default", ...}}}
+
+`rows` hides these differences, and `RowMapper` copies the leaf values of a
+row onto a schema dictionary, so the ``json()`` method of a parser only has
+to walk the tables and build the schema keys.
+
+Example:
+
+    >>> data = loads(output)
+    >>> for vrf in rows(data, 'vrf'):
+    ...     for prefix in rows(vrf, 'prefix'):
+    ...         route_dict = {}
+    ...         ROUTE_FIELDS.fill(route_dict, prefix)
+'''
+
+# python
+import json
+
+JSON_PIPE = ' | json'
+
+
+def loads(output):
+    '''Load a ``| json`` output
+
+    The command echo or a banner printed before the document, and the prompt
+    after it, are ignored.
+
+    Args:
+        output (`str`): device output, or an already loaded document
+
+    Returns:
+        loaded document, empty dict if the output is empty
+    '''
+    if isinstance(output, dict):
+        return output
+    if not output or not output.strip():
+        return {}
+
+    start = output.find('{')
+    end = output.rfind('}')
+    if start < 0 or end < start:
+        raise Exception("Output is not a JSON document: '{o}'".format(
+            o=output[:80]))
+    return json.loads(output[start:end + 1])
+
+
+def rows(data, name):
+    '''Iterate over the ROW_<name> entries of the TABLE_<name> of data
+
+    Args:
+        data (`dict`): document or row holding the table
+        name (`str`): table name, without the TABLE_ prefix
+
+    Yields:
+        rows (`dict`), in the order of the output
+    '''
+    if not data:
+        return
+    tables = data.get('TABLE_' + name)
+    if not tables:
+        return
+    if isinstance(tables, dict):
+        tables = [tables]
+
+    row_key = 'ROW_' + name
+    for table in tables:
+        found = table.get(row_key)
+        if not found:
+            continue
+        if isinstance(found, dict):
+            yield found
+        else:
+            yield from found
+
+
+def first_row(data, name):
+    '''Return the first ROW_<name> of data, or an empty dict'''
+    return next(rows(data, name), {})
+
+
+def to_bool(value):
+    '''Convert the 'true'/'false', 'enabled'/'disabled' and 'on'/'off'
+    values of NX-OS to a boolean'''
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('true', 'enabled', 'on', 'yes', '1')
+
+
+def to_str(value):
+    '''Convert a value to str, as rendered in the cli output'''
+    return str(value).strip()
+
+
+class RowMapper(object):
+    '''Copy the values of a ROW_ onto a schema dictionary
+
+    Args:
+        fields (`list`): (json key, schema path, converter) tuples. The schema
+                         path is dotted for nested keys, for example
+                         'counters.rate.in_rate'. The converter is a callable,
+                         or None to keep the value as is.
+
+    Missing and empty values, and values the converter rejects with
+    ValueError or TypeError, are skipped like an unmatched line of the cli
+    output would be.
+
+    Example:
+
+        >>> mapper = RowMapper([('eth_mtu', 'mtu', int),
+        ...                     ('eth_inrate1_bits', 'counters.rate.in_rate',
+        ...                      int)])
+        >>> mapper.fill({}, {'eth_mtu': '1500', 'eth_inrate1_bits': '0'})
+        {'mtu': 1500, 'counters': {'rate': {'in_rate': 0}}}
+    '''
+
+    def __init__(self, fields):
+        self.fields = []
+        for key, path, converter in fields:
+            *parents, leaf = path.split('.')
+            self.fields.append((key, tuple(parents), leaf, converter))
+
+    def fill(self, target, row):
+        '''Copy the values of row onto target, and return target'''
+        for key, parents, leaf, converter in self.fields:
+            value = row.get(key)
+            if value is None or value == '':
+                continue
+            if converter is not None:
+                try:
+                    value = converter(value)
+                except (TypeError, ValueError):
+                    continue
+
+            node = target
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[leaf] = value
+        return target
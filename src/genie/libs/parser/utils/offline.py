@@ -0,0 +1,137 @@
+'''Parsing of already collected outputs, without any device
+
+Tools parsing outputs stored on disk or received from other services only
+know the os and the command. `OfflineDevice` carries what the parser lookup
+needs (``os``, ``platform`` and ``custom``), and `parse_output` resolves the
+parser class once per (os, platform, command) and parses the given output.
+`parse_file` parses an output saved in a file, memory-mapped, see
+`genie.libs.parser.utils.mapped`.
+
+Example:
+
+    >>> from genie.libs.parser.utils.offline import parse_output, parse_file
+    >>> parsed = parse_output('iosxe', 'show version', output)
+    >>> parsed = parse_file('iosxe', 'show logging', 'r1/show_logging.txt')
+'''
+
+# python
+import threading
+
+# parser utils
+from .common import get_parser
+from .normalize import normalize as normalize_output
+from .mapped import MappedOutput
+
+
+class OfflineDevice(object):
+    '''Device stand-in for parser lookups
+
+    Args:
+        os (`str`): device os, for example 'iosxe'
+        platform (`str`): device platform, for example 'c9300'. Optional
+        name (`str`): device name. Defaults to 'offline'
+    '''
+
+    def __init__(self, os, platform=None, name='offline'):
+        self.name = name
+        self.os = os
+        self.platform = platform
+
+        order = ['os', 'platform'] if platform else ['os']
+        self.custom = {'abstraction': {'order': order}}
+
+    def execute(self, command, **kwargs):
+        raise Exception("Cannot execute '{c}' on offline device {d}, the "
+                        "output must be provided".format(c=command,
+                                                         d=self.name))
+
+
+# (os, platform) -> OfflineDevice
+_devices = {}
+# (os, platform, command) -> (parser class, kwargs found in the command)
+_parsers = {}
+_lock = threading.Lock()
+
+
+def get_offline_device(os, platform=None):
+    '''Return the shared OfflineDevice of an os and platform'''
+    key = (os, platform)
+    with _lock:
+        if key not in _devices:
+            _devices[key] = OfflineDevice(os, platform=platform)
+        return _devices[key]
+
+
+def get_offline_parser(os, command, platform=None):
+    '''Resolve the parser class of a command once
+
+    Returns:
+        (parser class, kwargs found in the command) tuple
+
+    Raises:
+        Exception: no parser found for the command
+    '''
+    key = (os, platform, command)
+    if key not in _parsers:
+        device = get_offline_device(os, platform)
+        _parsers[key] = get_parser(command, device)
+    return _parsers[key]
+
+
+def parse_output(os, command, output, platform=None, normalize=True,
+                 **kwargs):
+    '''Parse an already collected output
+
+    Args:
+        os (`str`): os of the device the output was collected on
+        command (`str`): command which produced the output
+        output (`str`): device output, or a `MappedOutput`. A `MappedOutput`
+                        is normalized according to its own normalize
+                        argument, and decoded as a whole for the parsers
+                        without ``mapped_output = True``
+        platform (`str`): platform of the device. Optional
+        normalize (`bool`): remove the terminal artifacts of the output
+                            before parsing, see `normalize.normalize`.
+                            Defaults to True
+        kwargs: extra arguments given to the parser
+
+    Returns:
+        parsed output
+    '''
+    parser_cls, found_kwargs = get_offline_parser(os, command,
+                                                  platform=platform)
+    parse_kwargs = dict(found_kwargs)
+    parse_kwargs.update(kwargs)
+
+    if isinstance(output, MappedOutput):
+        if not getattr(parser_cls, 'mapped_output', False):
+            output = output.text()
+    elif normalize:
+        output = normalize_output(output)
+
+    device = get_offline_device(os, platform)
+    return parser_cls(device=device).parse(output=output, **parse_kwargs)
+
+
+def parse_file(os, command, path, platform=None, normalize=True, **kwargs):
+    '''Parse an output saved in a file
+
+    The file is memory-mapped: the parsers with ``mapped_output = True``
+    read it line by line without loading it, the others get its decoded
+    content.
+
+    Args:
+        os (`str`): os of the device the output was collected on
+        command (`str`): command which produced the output
+        path (`str`): file holding the output
+        platform (`str`): platform of the device. Optional
+        normalize (`bool`): remove the terminal artifacts of the output
+                            before parsing. Defaults to True
+        kwargs: extra arguments given to the parser
+
+    Returns:
+        parsed output
+    '''
+    with MappedOutput(path, normalize=normalize) as output:
+        return parse_output(os, command, output, platform=platform,
+                            **kwargs)
@@ -0,0 +1,221 @@
+'''Line patterns tried in the order of their hits
+
+A parser tries its patterns one after the other on every line, in source
+order. On counter-heavy outputs, the pattern which matches a line is often
+the 30th one tried. A parser can instead hand its patterns to a
+`PatternDispatcher`, which returns the first one matching a line:
+
+    dispatcher = PatternDispatcher(self, [('p1', p1), ('p2', p2), ...],
+                                   exclusive=True)
+    for line in out.splitlines():
+        name, m = dispatcher.match(line)
+        if name == 'p1':
+            ...
+
+By default the patterns are tried in the given order, so the parser behaves
+as before. Only the patterns declared mutually exclusive, no line matching
+two of them, may be tried in another order, and only within runs of
+consecutive exclusive patterns: a pattern which is not exclusive stays in
+place and is never passed.
+
+The GENIE_PATTERN_ORDER environment variable, or `configure()`, selects how
+the exclusive patterns are ordered:
+
+* a JSON file of `pattern_stats` statistics: the patterns of each parser are
+  tried by decreasing number of matches in the statistics
+* adaptive: the patterns are reordered every REORDER_EVERY matches after the
+  matches counted so far in the process, starting from the profile if any
+* verify: the patterns are tried in source order, and a line matching two
+  exclusive patterns raises an exception. Run the golden outputs in this
+  mode to check the exclusive declarations of the parsers
+
+    $ GENIE_PATTERN_STATS=stats.json python parse_all.py
+    $ GENIE_PATTERN_ORDER=stats.json python parse_all.py
+    $ GENIE_PATTERN_ORDER=verify python ci_folder_parsing.py -o junos
+'''
+
+# python
+import os
+import json
+import threading
+
+# parser utils
+from genie.libs.parser.utils.pattern_stats import (InstrumentedPattern,
+                                                   _parser_name)
+
+# Environment variable selecting the order: a profile path, adaptive or verify
+PATTERN_ORDER_ENV = 'GENIE_PATTERN_ORDER'
+
+# Matches of a parser between two reorders in adaptive mode
+REORDER_EVERY = 1000
+
+_lock = threading.Lock()
+_settings = {'profile': {}, 'adaptive': False, 'verify': False}
+# parser -> _Order
+_orders = {}
+
+
+class _Order(object):
+    '''Order of the patterns of a parser, shared by its dispatchers'''
+
+    def __init__(self, names, exclusive, counts):
+        self.names = names
+        self.exclusive = exclusive
+        # pattern name -> matches
+        self.counts = counts
+        self.pending = 0
+        self.version = 0
+        self.order = ordered(names, exclusive, counts)
+
+    def reorder(self):
+        with _lock:
+            self.pending = 0
+            order = ordered(self.names, self.exclusive, self.counts)
+            if order != self.order:
+                self.order = order
+                self.version += 1
+
+
+class PatternDispatcher(object):
+    '''First pattern of a parser matching a line
+
+    Args:
+        parser: the parser instance, or a name of the parser
+        patterns: list of (name, compiled pattern) in source order
+        exclusive: names of the mutually exclusive patterns, True for all
+    '''
+
+    def __init__(self, parser, patterns, exclusive=()):
+        if not isinstance(parser, str):
+            parser = _parser_name(type(parser))
+        self.parser = parser
+        self.patterns = dict(patterns)
+        names = [name for name, _ in patterns]
+        if exclusive is True:
+            exclusive = names
+        exclusive = frozenset(exclusive)
+
+        for name, pattern in patterns:
+            # Name the instrumented patterns as the parser does
+            if isinstance(pattern, InstrumentedPattern) and pattern.name is None:
+                pattern.name = name
+
+        self._order = None
+        self._verify = None
+        if _settings['verify']:
+            self._verify = exclusive
+        elif exclusive and (_settings['adaptive'] or
+                            parser in _settings['profile']):
+            key = (parser, tuple(names))
+            self._order = _orders.get(key)
+            if self._order is None:
+                counts = dict(_settings['profile'].get(parser, {}))
+                with _lock:
+                    self._order = _orders.setdefault(
+                        key, _Order(names, exclusive, counts))
+        self._track = self._verify is not None or (
+            self._order is not None and _settings['adaptive'])
+        self._load()
+
+    def _load(self):
+        if self._order is None:
+            names = list(self.patterns)
+        else:
+            names = self._order.order
+            self._version = self._order.version
+        # Bound methods, the loop of match() runs for every line
+        self._matchers = [(name, self.patterns[name].match) for name in names]
+
+    @property
+    def order(self):
+        '''Names of the patterns in the order they are tried'''
+        return [name for name, _ in self._matchers]
+
+    def match(self, line):
+        '''Return (name, match) of the first pattern matching the line, or
+        (None, None)'''
+        for name, match in self._matchers:
+            m = match(line)
+            if m:
+                if self._track:
+                    self._matched(line, name)
+                return name, m
+        return None, None
+
+    def _matched(self, line, name):
+        if self._verify is not None:
+            self._check(line, name)
+            return
+        order = self._order
+        order.counts[name] = order.counts.get(name, 0) + 1
+        order.pending += 1
+        if order.pending >= REORDER_EVERY:
+            order.reorder()
+        if order.version != self._version:
+            self._load()
+
+    def _check(self, line, name):
+        if name not in self._verify:
+            return
+        both = [other for other in self._verify
+                if other != name and self.patterns[other].match(line)]
+        if both:
+            raise Exception(
+                'Patterns {p} of {parser} are declared exclusive but all '
+                'match {line!r}'.format(p=', '.join(sorted([name] + both)),
+                                        parser=self.parser, line=line))
+
+
+def ordered(names, exclusive, counts):
+    '''Order names by decreasing counts within the runs of consecutive
+    exclusive names, the other names keep their position'''
+    order = []
+    run = []
+    for name in names:
+        if name in exclusive:
+            run.append(name)
+            continue
+        # sorted is stable, ties keep the source order
+        order.extend(sorted(run, key=lambda n: -counts.get(n, 0)))
+        run = []
+        order.append(name)
+    order.extend(sorted(run, key=lambda n: -counts.get(n, 0)))
+    return order
+
+
+def load_profile(profile):
+    '''Return the matches of the patterns per parser of pattern_stats
+    statistics, a report dict or the path of its JSON file'''
+    if isinstance(profile, str):
+        with open(profile) as f:
+            profile = json.load(f)
+    return {parser: {name: pattern['matches']
+                     for name, pattern in entry['patterns'].items()}
+            for parser, entry in profile.items()}
+
+
+def configure(profile=None, adaptive=False, verify=False):
+    '''Order the exclusive patterns of the dispatchers created from now on.
+    Without arguments, restore the source order'''
+    with _lock:
+        _settings['profile'] = load_profile(profile) if profile else {}
+        _settings['adaptive'] = adaptive
+        _settings['verify'] = verify
+        _orders.clear()
+
+
+def configure_from_env():
+    '''Configure the order from GENIE_PATTERN_ORDER: adaptive, verify or the
+    path of a profile'''
+    value = os.environ.get(PATTERN_ORDER_ENV)
+    if not value:
+        return
+    if value == 'adaptive':
+        configure(adaptive=True)
+    elif value == 'verify':
+        configure(verify=True)
+    else:
+        configure(profile=value)
+
+
+configure_from_env()
@@ -0,0 +1,262 @@
+'''Hit and miss statistics of the patterns of the parsers
+
+Parsers compile their patterns in ``cli()`` and try them one after the
+other on every line. On a large output, the pattern which matches is often
+the 20th one tried, and some lines are tried against every pattern without
+matching any. `PatternStats` measures this, per parser class and per
+pattern:
+
+* attempts: calls of ``match()``, ``search()`` or ``fullmatch()``
+* matches: calls which returned a match
+* seconds: cumulative time of the calls
+
+and per parser class, the lines tried against its patterns and the lines
+which matched none of them, with a few samples of these.
+
+Instrumentation is opt-in: while enabled, ``re.compile`` called from a
+parser method (a method of a class with a ``cli`` method) returns an
+`InstrumentedPattern`, which records its calls and otherwise behaves like
+the compiled pattern. Patterns are named after the local variable holding
+them (p1, p2_2, ...), or after their regex. Patterns compiled at import, as
+module or class attributes, are not instrumented.
+
+Enable it with a context manager:
+
+    >>> from genie.libs.parser.utils.pattern_stats import instrument
+    >>> with instrument() as stats:
+    ...     device.parse('show interfaces')
+    >>> stats.to_json('show_interfaces_stats.json')
+
+or for a whole process with the GENIE_PATTERN_STATS environment variable,
+naming the file written at exit. A file ending with ``.folded`` is written
+in the folded stacks format of flame graphs, weighted by microseconds:
+
+    $ GENIE_PATTERN_STATS=stats.json python parse_all.py
+    $ GENIE_PATTERN_STATS=stats.folded python parse_all.py
+    $ flamegraph.pl stats.folded > stats.svg
+'''
+
+# python
+import os
+import re
+import sys
+import json
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+
+# Environment variable enabling the statistics, naming the file written at exit
+PATTERN_STATS_ENV = 'GENIE_PATTERN_STATS'
+
+# Lines which matched no pattern kept per parser class
+UNMATCHED_SAMPLES = 20
+
+_re_compile = re.compile
+
+
+class InstrumentedPattern(object):
+    '''Compiled pattern recording its calls in a `PatternStats`'''
+
+    __slots__ = ('pattern_object', 'parser', 'name', '_stats')
+
+    def __init__(self, pattern_object, parser, stats):
+        self.pattern_object = pattern_object
+        self.parser = parser
+        self.name = None
+        self._stats = stats
+
+    def _call(self, method, string, args, kwargs):
+        if self.name is None:
+            self.name = self._stats._pattern_name(self, sys._getframe(2))
+        start = time.perf_counter()
+        result = method(string, *args, **kwargs)
+        self._stats._record(self, string, result is not None,
+                            time.perf_counter() - start)
+        return result
+
+    def match(self, string, *args, **kwargs):
+        return self._call(self.pattern_object.match, string, args, kwargs)
+
+    def search(self, string, *args, **kwargs):
+        return self._call(self.pattern_object.search, string, args, kwargs)
+
+    def fullmatch(self, string, *args, **kwargs):
+        return self._call(self.pattern_object.fullmatch, string, args, kwargs)
+
+    def __getattr__(self, attr):
+        # pattern, groupindex, findall, sub, ...
+        return getattr(self.pattern_object, attr)
+
+    def __repr__(self):
+        return '<InstrumentedPattern {n} {p!r}>'.format(
+            n=self.name, p=self.pattern_object.pattern)
+
+
+class PatternStats(object):
+    '''Statistics of the patterns compiled by the parsers while enabled'''
+
+    def __init__(self):
+        # parser -> {pattern name -> [regex, attempts, matches, seconds]}
+        self.patterns = {}
+        # parser -> [lines, unmatched lines, unmatched samples]
+        self.lines = {}
+        # (parser, compiled pattern) -> InstrumentedPattern
+        self._instrumented = {}
+        # (thread, parser) -> [last line, matched]
+        self._current = {}
+        self._lock = threading.Lock()
+        self.enabled = False
+
+    def enable(self):
+        '''Instrument the patterns compiled from now on by the parsers'''
+        if re.compile is not _re_compile:
+            raise Exception('Pattern statistics are already enabled')
+        re.compile = self._compile
+        self.enabled = True
+
+    def disable(self):
+        if re.compile == self._compile:
+            re.compile = _re_compile
+        self.enabled = False
+        self._flush()
+
+    def _compile(self, pattern, flags=0):
+        if isinstance(pattern, InstrumentedPattern):
+            pattern = pattern.pattern_object
+        compiled = _re_compile(pattern, flags)
+
+        owner = sys._getframe(1).f_locals.get('self')
+        if owner is None or not hasattr(type(owner), 'cli'):
+            return compiled
+
+        parser = _parser_name(type(owner))
+        key = (parser, compiled)
+        try:
+            return self._instrumented[key]
+        except KeyError:
+            with self._lock:
+                return self._instrumented.setdefault(
+                    key, InstrumentedPattern(compiled, parser, self))
+
+    def _pattern_name(self, instrumented, frame):
+        '''Name a pattern after the local variable holding it in the frame
+        calling it'''
+        for name, value in frame.f_locals.items():
+            if value is instrumented:
+                return name
+        return instrumented.pattern_object.pattern
+
+    def _record(self, instrumented, string, matched, seconds):
+        parser = instrumented.parser
+        key = (threading.get_ident(), parser)
+        with self._lock:
+            patterns = self.patterns.setdefault(parser, {})
+            entry = patterns.get(instrumented.name)
+            if entry is None:
+                entry = patterns[instrumented.name] = [
+                    instrumented.pattern_object.pattern, 0, 0, 0.0]
+            entry[1] += 1
+            entry[2] += matched
+            entry[3] += seconds
+
+            # A new line starts when the patterns are tried on another string
+            current = self._current.get(key)
+            if current is None or current[0] is not string:
+                if current is not None:
+                    self._end_line(parser, current)
+                current = self._current[key] = [string, False]
+            current[1] = current[1] or matched
+
+    def _end_line(self, parser, current):
+        lines = self.lines.setdefault(parser, [0, 0, []])
+        lines[0] += 1
+        if not current[1]:
+            lines[1] += 1
+            if len(lines[2]) < UNMATCHED_SAMPLES:
+                lines[2].append(current[0])
+
+    def _flush(self):
+        '''Count the last line of every parser'''
+        with self._lock:
+            for (_, parser), current in self._current.items():
+                self._end_line(parser, current)
+            self._current.clear()
+
+    def report(self):
+        '''Return the statistics as a dict, the patterns of a parser are in
+        the order of their first use'''
+        self._flush()
+        report = {}
+        for parser, patterns in self.patterns.items():
+            lines, unmatched, samples = self.lines.get(parser, [0, 0, []])
+            report[parser] = {
+                'lines': lines,
+                'unmatched_lines': unmatched,
+                'unmatched_samples': list(samples),
+                'patterns': {
+                    name: {'pattern': regex,
+                           'attempts': attempts,
+                           'matches': matches,
+                           'seconds': round(seconds, 6)}
+                    for name, (regex, attempts, matches, seconds)
+                    in patterns.items()},
+            }
+        return report
+
+    def folded(self):
+        '''Return the statistics as folded stacks for flame graphs:
+        "<parser>;<pattern> <microseconds>" lines'''
+        lines = []
+        for parser, entry in self.report().items():
+            for name, pattern in entry['patterns'].items():
+                # Frames are separated by semicolons
+                name = name.replace(';', ':').replace(' ', '_')
+                lines.append('{p};{n} {us}'.format(
+                    p=parser, n=name, us=int(pattern['seconds'] * 1e6)))
+        return '\n'.join(lines) + '\n' if lines else ''
+
+    def to_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=4)
+
+    def save(self, path):
+        '''Write the statistics to path, folded stacks for a .folded file,
+        JSON otherwise'''
+        if path.endswith('.folded'):
+            with open(path, 'w') as f:
+                f.write(self.folded())
+        else:
+            self.to_json(path)
+
+
+def _parser_name(cls):
+    '''Return "<os>.<module>.<class>" for the parser classes of this package'''
+    module = cls.__module__
+    if module.startswith('genie.libs.parser.'):
+        module = module[len('genie.libs.parser.'):]
+    return '{m}.{c}'.format(m=module, c=cls.__qualname__)
+
+
+@contextmanager
+def instrument(stats=None):
+    '''Collect the statistics of the patterns compiled by the parsers in the
+    block, into stats or a new `PatternStats`'''
+    stats = stats or PatternStats()
+    stats.enable()
+    try:
+        yield stats
+    finally:
+        stats.disable()
+
+
+def enable_from_env():
+    '''Enable the statistics for the whole process when GENIE_PATTERN_STATS
+    is set, they are written to the file it names at exit'''
+    path = os.environ.get(PATTERN_STATS_ENV)
+    if not path or re.compile is not _re_compile:
+        return None
+    stats = PatternStats()
+    stats.enable()
+    atexit.register(lambda: stats.disable() or stats.save(path))
+    return stats
@@ -0,0 +1,166 @@
+'''Pipelined execution and parsing of show commands on a single device
+
+When a script collects many show commands from the same device, running
+``device.parse()`` for each of them leaves the device session idle while the
+output is being parsed, and leaves the CPU idle while waiting for the device.
+`ParserPipeline` overlaps both phases: the next command is executed on the
+device while the output of the previous one is parsed on a worker.
+
+Example:
+
+    >>> from genie.libs.parser.utils.pipeline import ParserPipeline
+    >>> pipeline = ParserPipeline(device)
+    >>> commands = [('show version', {}),
+    ...             ('show ip route vrf VRF1', {'vrf': 'VRF1'})]
+    >>> for result in pipeline.iter_parse(commands):
+    ...     print(result.command, result.parse_time, result.parsed)
+
+Notes:
+    Commands are always executed sequentially on the calling thread, as device
+    connections are not thread safe. Only the parsing phase is handed to the
+    worker pool, and results are delivered in the order of the commands.
+
+    Parsers are called with the collected ``output``, so parsers which need to
+    execute more than one command on the device to build their result are not
+    supported.
+'''
+
+# python
+import time
+import logging
+from collections import deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+
+# parser utils
+from .common import get_parser
+from .normalize import normalize as normalize_output
+
+log = logging.getLogger(__name__)
+
+# Result of one pipelined command
+PipelineResult = namedtuple('PipelineResult', ['command',
+                                               'kwargs',
+                                               'parsed',
+                                               'exception',
+                                               'execute_time',
+                                               'parse_time'])
+
+
+def _parse_output(parser_cls, device, command, kwargs, output, execute_time,
+                  normalize=True):
+    '''Parse one collected output, runs on a pipeline worker'''
+
+    start = time.perf_counter()
+    try:
+        if normalize:
+            output = normalize_output(output)
+        parsed = parser_cls(device=device).parse(output=output, **kwargs)
+    except Exception as e:
+        return PipelineResult(command, kwargs, None, e, execute_time,
+                              time.perf_counter() - start)
+
+    return PipelineResult(command, kwargs, parsed, None, execute_time,
+                          time.perf_counter() - start)
+
+
+class ParserPipeline(object):
+    '''Execute the next command while the previous output is being parsed
+
+    Args:
+        device (`Device`): device to execute the commands on
+        max_workers (`int`): number of parse workers. Defaults to 1
+        executor (`str`): 'thread' or 'process'. With 'process', parsers are
+                          run in child processes without access to the device
+                          object. Defaults to 'thread'
+        normalize (`bool`): remove the terminal artifacts of the outputs on
+                            the workers, see `normalize.normalize`. Defaults
+                            to True, False when the connection already
+                            returns clean outputs
+
+    Examples:
+        >>> pipeline = ParserPipeline(device, max_workers=2)
+        >>> results = pipeline.parse([('show version', {}),
+        ...                           ('show interfaces', {})])
+    '''
+
+    EXECUTORS = {'thread': ThreadPoolExecutor,
+                 'process': ProcessPoolExecutor}
+
+    def __init__(self, device, max_workers=1, executor='thread',
+                 normalize=True):
+        if executor not in self.EXECUTORS:
+            raise ValueError("executor must be one of {e}, got '{v}'".format(
+                e=sorted(self.EXECUTORS), v=executor))
+
+        self.device = device
+        self.max_workers = max_workers
+        self.executor = executor
+        self.normalize = normalize
+
+        # command -> (parser class, kwargs found in the command)
+        self._parsers = {}
+
+    def _get_parser(self, command):
+        '''Resolve the parser class of a command once per pipeline'''
+        if command not in self._parsers:
+            self._parsers[command] = get_parser(command, self.device)
+        return self._parsers[command]
+
+    def _submit(self, pool, command, kwargs):
+        '''Execute one command on this thread and hand its output to the pool'''
+
+        start = time.perf_counter()
+        try:
+            parser_cls, found_kwargs = self._get_parser(command)
+            output = self.device.execute(command)
+        except Exception as e:
+            log.debug("Failed to collect '{c}': {e}".format(c=command, e=e))
+            future = Future()
+            future.set_result(PipelineResult(command, kwargs, None, e,
+                                             time.perf_counter() - start, 0))
+            return future
+
+        execute_time = time.perf_counter() - start
+        parse_kwargs = dict(found_kwargs)
+        parse_kwargs.update(kwargs)
+
+        # The device object cannot be sent to a child process
+        device = self.device if self.executor == 'thread' else None
+
+        return pool.submit(_parse_output, parser_cls, device, command,
+                           parse_kwargs, output, execute_time, self.normalize)
+
+    def iter_parse(self, commands):
+        '''Execute and parse commands, yielding results in command order
+
+        Args:
+            commands (`list`): list of (command, kwargs) tuples
+
+        Returns:
+            generator of `PipelineResult`
+        '''
+        pending = deque()
+        with self.EXECUTORS[self.executor](
+                max_workers=self.max_workers) as pool:
+
+            for command, kwargs in commands:
+                pending.append(self._submit(pool, command, kwargs or {}))
+
+                # Hand back every result which is already available, while
+                # preserving the order of the commands
+                while pending and pending[0].done():
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+
+    def parse(self, commands):
+        '''Execute and parse commands, returning results in command order
+
+        Args:
+            commands (`list`): list of (command, kwargs) tuples
+
+        Returns:
+            list of `PipelineResult`
+        '''
+        return list(self.iter_parse(commands))
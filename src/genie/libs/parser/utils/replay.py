@@ -0,0 +1,217 @@
+'''Replay device serving golden outputs, for benchmarks without hardware
+
+`ReplayDevice` behaves like a connected device for the purpose of parsing:
+it exposes ``os``, ``platform`` and ``custom`` so that `get_parser` and
+``genie.abstract`` lookups work, and its ``execute()`` answers show commands
+with the golden outputs of the unittest folders::
+
+    <os>/tests/<Class>/cli/equal/<name>_output.txt
+    <os>/tests/<Class>/cli/equal/<name>_arguments.json
+
+The golden output is found by resolving the command to its parser class
+through the parser registry. When several golden outputs exist, the one
+whose arguments match the arguments found in the command is preferred.
+
+A latency model and failure injection make it usable to benchmark
+concurrency work (pipelining, polling, ...).
+
+Example:
+
+    >>> from genie.libs.parser.utils.replay import ReplayDevice
+    >>> device = ReplayDevice(os='iosxe', latency=(0.05, 0.2),
+    ...                       latencies={'show tech': 5}, failure_rate=0.01)
+    >>> output = device.execute('show version')
+    >>> parsed = device.parse('show ip route vrf VRF1')
+'''
+
+# python
+import os
+import re
+import sys
+import glob
+import json
+import time
+import random
+import logging
+import threading
+
+# parser utils
+from .common import get_parser
+from .offline import OfflineDevice
+from .normalize import normalize as normalize_output
+
+log = logging.getLogger(__name__)
+
+
+def _natural_key(text):
+    '''Sort golden_output_2 before golden_output_10'''
+    return [int(c) if c.isdigit() else c for c in re.split('([0-9]+)', text)]
+
+
+def find_golden_outputs(parser_cls):
+    '''Return the golden outputs of a parser class
+
+    Args:
+        parser_cls (`class`): parser class
+
+    Returns:
+        list of (output file, arguments dict) tuples, naturally sorted
+    '''
+    module = sys.modules[parser_cls.__module__]
+    folder = os.path.join(os.path.dirname(module.__file__), 'tests',
+                          parser_cls.__name__, 'cli', 'equal')
+
+    goldens = []
+    for output_file in sorted(glob.glob(os.path.join(folder, '*_output.txt')),
+                              key=_natural_key):
+        arguments_file = output_file[:-len('_output.txt')] + '_arguments.json'
+        arguments = {}
+        if os.path.isfile(arguments_file):
+            with open(arguments_file) as f:
+                arguments = json.load(f)
+        goldens.append((output_file, arguments))
+    return goldens
+
+
+class ReplayFailure(Exception):
+    '''Raised by ReplayDevice when a failure is injected'''
+    pass
+
+
+class ReplayDevice(OfflineDevice):
+    '''Device stand-in answering commands with golden outputs
+
+    Args:
+        os (`str`): device os, for example 'iosxe'
+        platform (`str`): device platform, for example 'c9300'. Optional
+        name (`str`): device name. Defaults to 'replay'
+        outputs (`dict`): command -> output. Commands found here are
+                          answered without looking up the golden folders
+        latency: default latency of a command, in seconds. Either a number,
+                 a (low, high) tuple for a uniform distribution or a
+                 callable taking the command and returning a number
+        latencies (`dict`): command -> latency, same format as `latency`
+        failure_rate (`float`): probability for a command to fail
+        failures (`dict`): command -> failure probability
+        seed (`int`): seed of the random generator, for reproducible runs
+        normalize (`bool`): remove the terminal artifacts of the outputs
+                            parsed by parse(), see `normalize.normalize`.
+                            execute() returns the raw outputs, which
+                            consumers such as ParserPipeline normalize
+                            themselves. Defaults to True
+
+    Raises:
+        ReplayFailure: from execute() when a failure is injected
+    '''
+
+    def __init__(self, os, platform=None, name='replay', outputs=None,
+                 latency=0, latencies=None, failure_rate=0, failures=None,
+                 seed=None, normalize=True):
+        super().__init__(os, platform=platform, name=name)
+
+        self.outputs = dict(outputs or {})
+        self.latency = latency
+        self.latencies = dict(latencies or {})
+        self.failure_rate = failure_rate
+        self.failures = dict(failures or {})
+        self.normalize = normalize
+
+        self.connected = False
+        self.executed = []
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def connect(self, *args, **kwargs):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def is_connected(self):
+        return self.connected
+
+    def _sample(self, spec, command):
+        '''Draw one value from a latency specification'''
+        if callable(spec):
+            return spec(command)
+        if isinstance(spec, (tuple, list)):
+            low, high = spec
+            with self._lock:
+                return self._random.uniform(low, high)
+        return spec or 0
+
+    def latency_of(self, command):
+        '''Return the latency to apply to one execution of command'''
+        return self._sample(self.latencies.get(command, self.latency), command)
+
+    def lookup_output(self, command):
+        '''Return the golden output answering command
+
+        Raises:
+            Exception: no parser or no golden output found for the command
+        '''
+        if command in self.outputs:
+            return self.outputs[command]
+
+        parser_cls, kwargs = get_parser(command, self)
+        goldens = find_golden_outputs(parser_cls)
+        if not goldens:
+            raise Exception("No golden output found for '{c}' under "
+                            "{cls}".format(c=command, cls=parser_cls.__name__))
+
+        # Prefer the golden output collected with the same arguments,
+        # then the one collected without any
+        wanted = {k: str(v) for k, v in kwargs.items()}
+        for output_file, arguments in goldens:
+            if {k: str(v) for k, v in arguments.items()} == wanted:
+                break
+        else:
+            output_file = next((o for o, a in goldens if not a),
+                               goldens[0][0])
+
+        log.debug("Replaying '{c}' from {f}".format(c=command, f=output_file))
+        with open(output_file) as f:
+            output = f.read()
+
+        self.outputs[command] = output
+        return output
+
+    def execute(self, command, **kwargs):
+        '''Return the golden output of command after the modeled latency
+
+        Raises:
+            ReplayFailure: when a failure is injected for this command
+        '''
+        output = self.lookup_output(command)
+
+        delay = self.latency_of(command)
+        if delay:
+            time.sleep(delay)
+
+        rate = self.failures.get(command, self.failure_rate)
+        if rate:
+            with self._lock:
+                failed = self._random.random() < rate
+            if failed:
+                raise ReplayFailure("Injected failure for '{c}' on {d}".format(
+                    c=command, d=self.name))
+
+        with self._lock:
+            self.executed.append(command)
+        return output
+
+    def parse(self, command, output=None, **kwargs):
+        '''Parse command like Device.parse, executing on this replay device
+
+        The command is executed here unless output is given, and its output
+        is normalized once before being handed to the parser.
+        '''
+        parser_cls, found_kwargs = get_parser(command, self)
+        parse_kwargs = dict(found_kwargs)
+        parse_kwargs.update(kwargs)
+        if output is None:
+            output = self.execute(command)
+        if self.normalize:
+            output = normalize_output(output)
+        return parser_cls(device=self).parse(output=output, **parse_kwargs)
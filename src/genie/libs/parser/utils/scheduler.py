@@ -0,0 +1,280 @@
+'''Polling scheduler running parse jobs on many devices
+
+`PollingScheduler` runs periodic parse jobs against a set of devices with a
+global concurrency cap and a per-device concurrency cap. Jobs which are due
+are started by priority, and a job waiting for a busy device never holds
+back jobs of other devices: a slow ``show tech`` on one device does not
+delay the counter polls of the others.
+
+Parser classes are resolved once per (device, command) and reused for every
+run of the job. Results are handed to a callback and/or put on a queue.
+
+Example:
+
+    >>> from queue import Queue
+    >>> from genie.libs.parser.utils.scheduler import PollingScheduler
+    >>> results = Queue()
+    >>> scheduler = PollingScheduler(max_workers=20, max_per_device=2,
+    ...                              queue=results)
+    >>> scheduler.add_job(device, 'show interfaces', interval=30,
+    ...                   priority=0, jitter=2)
+    >>> scheduler.add_job(device, 'show inventory', interval=3600,
+    ...                   priority=10)
+    >>> scheduler.start()
+    >>> result = results.get()
+    >>> scheduler.stop()
+'''
+
+# python
+import time
+import heapq
+import random
+import logging
+import threading
+import itertools
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# parser utils
+from .common import get_parser
+
+log = logging.getLogger(__name__)
+
+# Result of one run of a job
+PollResult = namedtuple('PollResult', ['job',
+                                       'parsed',
+                                       'exception',
+                                       'start',
+                                       'duration'])
+
+
+class PollJob(object):
+    '''One periodic parse job of a device
+
+    Args:
+        device (`Device`): device to poll
+        command (`str`): show command to parse
+        interval (`float`): seconds between two runs of the job
+        priority (`int`): lower values run first when several jobs are due
+        kwargs (`dict`): extra arguments given to the parser
+        jitter (`float`): up to this many seconds are randomly added to
+                          every run time, which does not move the
+                          following ones
+    '''
+
+    def __init__(self, device, command, interval, priority=0, kwargs=None,
+                 jitter=0):
+        self.device = device
+        self.command = command
+        self.interval = interval
+        self.priority = priority
+        self.kwargs = dict(kwargs or {})
+        self.jitter = jitter
+
+        # Time of the next run, and the same without jitter, from which the
+        # following runs are scheduled
+        self.next_run = None
+        self.base = None
+        self.runs = 0
+        self.cancelled = False
+
+    def __repr__(self):
+        return "<PollJob {d} '{c}' every {i}s>".format(
+            d=getattr(self.device, 'name', self.device), c=self.command,
+            i=self.interval)
+
+
+class PollingScheduler(object):
+    '''Run periodic parse jobs with global and per-device concurrency caps
+
+    Args:
+        max_workers (`int`): maximum number of jobs running at once
+        max_per_device (`int`): maximum number of jobs running at once on
+                                one device
+        device_limits (`dict`): device name -> maximum number of jobs
+                                running at once on each device of that
+                                name, overrides max_per_device
+        callback (`callable`): called with every `PollResult`
+        queue (`queue.Queue`): every `PollResult` is put on this queue
+        seed (`int`): seed of the jitter random generator
+    '''
+
+    def __init__(self, max_workers=10, max_per_device=1, device_limits=None,
+                 callback=None, queue=None, seed=None):
+        self.max_workers = max_workers
+        self.max_per_device = max_per_device
+        self.device_limits = dict(device_limits or {})
+        self.callback = callback
+        self.queue = queue
+
+        self._random = random.Random(seed)
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+
+        # (next_run, seq, job) of jobs waiting for their next run
+        self._waiting = []
+        # (priority, next_run, seq, job) of jobs which are due
+        self._ready = []
+
+        # Running jobs, in total and per id of device
+        self._running = 0
+        self._running_per_device = {}
+        self._parsers = {}
+
+        self._stopped = True
+        self._dispatcher = None
+        self._pool = None
+
+    def add_job(self, device, command, interval, priority=0, kwargs=None,
+                jitter=0, delay=0):
+        '''Schedule a new job, first run after `delay` seconds
+
+        Returns:
+            `PollJob`
+        '''
+        job = PollJob(device, command, interval, priority=priority,
+                      kwargs=kwargs, jitter=jitter)
+        with self._condition:
+            self._schedule(job, time.monotonic() + delay)
+            self._condition.notify()
+        return job
+
+    def remove_job(self, job):
+        '''Cancel a job, a run in progress is not interrupted'''
+        with self._condition:
+            job.cancelled = True
+
+    def _schedule(self, job, base):
+        job.base = base
+        when = base
+        if job.jitter:
+            when += self._random.uniform(0, job.jitter)
+        job.next_run = when
+        heapq.heappush(self._waiting, (when, next(self._counter), job))
+
+    def _device_limit(self, device):
+        return self.device_limits.get(getattr(device, 'name', None),
+                                      self.max_per_device)
+
+    def _get_parser(self, job):
+        '''Resolve the parser class of a job once'''
+        # Devices are told apart by object, as several of them can share a
+        # name. The cache holds the device, so its id is not reused.
+        key = (id(job.device), job.command)
+        if key not in self._parsers:
+            self._parsers[key] = (job.device,
+                                  get_parser(job.command, job.device))
+        return self._parsers[key][1]
+
+    def start(self):
+        '''Start dispatching jobs in a background thread'''
+        with self._condition:
+            if not self._stopped:
+                return
+            self._stopped = False
+
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._dispatcher = threading.Thread(target=self._dispatch,
+                                            name='PollingScheduler',
+                                            daemon=True)
+        self._dispatcher.start()
+
+    def stop(self, wait=True):
+        '''Stop dispatching jobs, optionally waiting for running ones'''
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+        if self._dispatcher:
+            self._dispatcher.join()
+            self._dispatcher = None
+        if self._pool:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    def run(self, duration):
+        '''Run the scheduler for `duration` seconds, then stop it'''
+        self.start()
+        try:
+            time.sleep(duration)
+        finally:
+            self.stop()
+
+    def _dispatch(self):
+        '''Start due jobs by priority, as long as caps allow it'''
+        with self._condition:
+            while not self._stopped:
+                now = time.monotonic()
+
+                # Move every due job to the ready heap
+                while self._waiting and self._waiting[0][0] <= now:
+                    when, seq, job = heapq.heappop(self._waiting)
+                    if not job.cancelled:
+                        heapq.heappush(self._ready,
+                                       (job.priority, when, seq, job))
+
+                # Start ready jobs whose device is not saturated, and keep the
+                # others ready without blocking jobs of other devices
+                skipped = []
+                while self._ready and self._running < self.max_workers:
+                    entry = heapq.heappop(self._ready)
+                    job = entry[3]
+                    if job.cancelled:
+                        continue
+
+                    key = id(job.device)
+                    if self._running_per_device.get(key, 0) >= \
+                            self._device_limit(job.device):
+                        skipped.append(entry)
+                        continue
+
+                    self._running += 1
+                    self._running_per_device[key] = \
+                        self._running_per_device.get(key, 0) + 1
+                    self._pool.submit(self._run, job)
+
+                for entry in skipped:
+                    heapq.heappush(self._ready, entry)
+
+                # Sleep until the next job is due or a running job completes
+                timeout = None
+                if self._waiting:
+                    timeout = max(self._waiting[0][0] - now, 0)
+                self._condition.wait(timeout)
+
+    def _run(self, job):
+        '''Run one job on a worker and reschedule it'''
+        start = time.monotonic()
+        parsed = exception = None
+        try:
+            parser_cls, found_kwargs = self._get_parser(job)
+            kwargs = dict(found_kwargs)
+            kwargs.update(job.kwargs)
+            parsed = parser_cls(device=job.device).parse(**kwargs)
+        except Exception as e:
+            log.debug("Job {j} failed: {e}".format(j=job, e=e))
+            exception = e
+        duration = time.monotonic() - start
+
+        with self._condition:
+            job.runs += 1
+            key = id(job.device)
+            self._running -= 1
+            self._running_per_device[key] -= 1
+            if not self._running_per_device[key]:
+                del self._running_per_device[key]
+
+            if not job.cancelled:
+                # Keep the original cadence unless the job fell behind
+                self._schedule(job, max(job.base + job.interval,
+                                        time.monotonic()))
+            self._condition.notify()
+
+        result = PollResult(job, parsed, exception, start, duration)
+        if self.callback:
+            try:
+                self.callback(result)
+            except Exception:
+                log.exception('Polling scheduler callback failed')
+        if self.queue is not None:
+            self.queue.put(result)
@@ -0,0 +1,218 @@
+'''Fixed-width tables of show command outputs
+
+`Table` reads the column tables printed by most show commands:
+
+    Switch Ports Model              SW Version        SW Image
+    ------ ----- -----              ----------        ----------
+    *    1 32    WS-C3850-24P       16.4.2            CAT3K_CAA-UNIVERSALK9
+         2 32    WS-C3850-24P       16.4.2            CAT3K_CAA-UNIVERSALK9
+
+The column boundaries are found once per output, from the position of the
+header fields and of the dash rule under the header. Every row is then cut
+at these offsets, without matching a regular expression per row.
+
+* columns are left-justified by default: a column spans from the start of
+  its header to the start of the next header. With ``right_justified``, a
+  column ends with its header and starts after the previous header
+* a word across the boundary of two left-justified columns goes to the
+  column holding most of it: a value overflowing its column is kept whole,
+  and a value printed a little left of its header stays in its column
+* with ``wrapped``, a row whose index columns are empty continues the
+  previous row: its values are appended to the values of the previous row,
+  for cells wrapped on several lines
+* entries are keyed by the values of the ``index`` columns, nested when
+  there are several index columns, like ``parsergen.oper_fill_tabular``
+
+A `Table` is built once, usually as a class attribute of the parser, and
+used for every output:
+
+    >>> switches = Table(header_fields=['Switch', 'Ports', 'Model',
+    ...                                 'SW Version', 'SW Image'],
+    ...                  label_fields=['switch_num', 'ports', 'model',
+    ...                                'sw_ver', 'sw_image'],
+    ...                  table_terminal_pattern=r'^\\s*$')
+    >>> switches.entries(output)
+    {'*    1': {'switch_num': '*    1', 'ports': '32', ...
+    >>> for row in switches.rows(output):
+    ...     row['model']
+'''
+
+# python
+import re
+import itertools
+from operator import itemgetter
+
+# Characters of the rule printed under a header
+_RULE_CHARS = ' -=+'
+
+# Word across the boundary of two cells, joined by NUL
+_ACROSS = re.compile(r'\0(?=[^ ])(?<=[^ ]\0)')
+
+
+class Table(object):
+    '''Fixed-width table of a show command output
+
+    Args:
+        header_fields (`list`): regular expressions of the column headers,
+                                in order. Spaces around a header are part
+                                of its width
+        label_fields (`list`): name of each column in the entries, by
+                               default the header fields
+        index (`list`): position of the columns keying the entries
+        right_justified (`bool`): columns end with their header
+        table_terminal_pattern (`str`): regular expression of the first line
+                                        after the table, by default the
+                                        table runs to the end of the output
+        skip_line (`str`): regular expression of the lines to ignore
+        wrapped (`bool`): rows whose index columns are empty continue the
+                          previous row
+        wrap_separator (`str`): inserted between the parts of a wrapped
+                                value
+    '''
+
+    def __init__(self, header_fields, label_fields=None, index=(0,),
+                 right_justified=False, table_terminal_pattern=None,
+                 skip_line=None, wrapped=False, wrap_separator=' '):
+        if label_fields and len(label_fields) != len(header_fields):
+            raise Exception('{l} label fields for {h} header fields'.format(
+                l=len(label_fields), h=len(header_fields)))
+
+        self.header_fields = list(header_fields)
+        self.label_fields = list(label_fields or header_fields)
+        self.index = list(index)
+        self.right_justified = right_justified
+        self.wrapped = wrapped
+        self.wrap_separator = wrap_separator
+
+        self._headers = [re.compile(field) for field in self.header_fields]
+        self._terminal = re.compile(table_terminal_pattern) \
+            if table_terminal_pattern else None
+        self._skip = re.compile(skip_line) if skip_line else None
+
+    def columns(self, line, rule=None):
+        '''Return the (start, end) offsets of the columns if line is the
+        header of the table, else None. The end of the last column is None.
+
+        Args:
+            line (`str`): line of the output
+            rule (`str`): line following it, used when it is a dash rule to
+                          widen the columns to the dashes
+        '''
+        spans = []
+        pos = 0
+        for header in self._headers:
+            m = header.search(line, pos)
+            if not m:
+                return None
+            spans.append(m.span())
+            pos = m.end()
+
+        if rule and rule.strip() and not rule.strip(_RULE_CHARS):
+            runs = [m.span() for m in re.finditer(r'[-=]+', rule)]
+            if len(runs) == len(spans):
+                spans = [(min(start, rule_start), max(end, rule_end))
+                         for (start, end), (rule_start, rule_end)
+                         in zip(spans, runs)]
+
+        if self.right_justified:
+            ends = [end for _, end in spans]
+            starts = [0] + ends[:-1]
+        else:
+            starts = [0] + [start for start, _ in spans[1:]]
+            ends = starts[1:] + [None]
+        ends[-1] = None
+        return list(zip(starts, ends))
+
+    def _cut(self, line, columns):
+        '''Return the values of the row line, moving the boundaries which
+        are across a word'''
+        values = []
+        length = len(line)
+        start = 0
+        for _, end in columns:
+            if end is not None and 0 < end < length and \
+                    line[end - 1] != ' ' and line[end] != ' ':
+                # A word across the boundary goes to the column holding
+                # most of it: a value overflowing its column is kept whole,
+                # a value printed a little left of its header is moved to
+                # its column
+                left = line.rfind(' ', start, end) + 1 or start
+                right = line.find(' ', end)
+                right = length if right < 0 else right
+                end = left if end - left <= right - end else right
+            values.append(line[start:end].strip())
+            start = end
+        return values
+
+    def rows(self, output):
+        '''Yield the rows of the table, as {label: value} dictionaries
+
+        Args:
+            output (`str`): device output
+        '''
+        lines = output.splitlines()
+        for number, header in enumerate(lines):
+            rule = lines[number + 1] if number + 1 < len(lines) else ''
+            columns = self.columns(header, rule)
+            if columns:
+                break
+        else:
+            return
+
+        # Slices of the cells, taken at once
+        slices = [slice(start, end) for start, end in columns]
+        if len(slices) == 1:
+            cut = lambda line, cell=slices[0]: (line[cell],)
+        else:
+            cut = itemgetter(*slices)
+
+        labels = self.label_fields
+        first, others = self.index[0], self.index[1:]
+        terminal = self._terminal.search if self._terminal else None
+        skip = self._skip.search if self._skip else None
+        across = None if self.right_justified else _ACROSS.search
+        row = None
+
+        for line in itertools.islice(lines, number + 1, None):
+            if terminal and terminal(line):
+                break
+            if not line.strip(_RULE_CHARS) or line == header or \
+                    (skip and skip(line)):
+                continue
+
+            cells = cut(line)
+            if across and across('\0'.join(cells)):
+                values = self._cut(line, columns)
+            else:
+                values = list(map(str.strip, cells))
+
+            if not values[first] and not any(values[i] for i in others):
+                if self.wrapped and row is not None:
+                    for label, value in zip(labels, values):
+                        if value:
+                            row[label] = self.wrap_separator.join(
+                                filter(None, (row[label], value)))
+                continue
+
+            if row is not None:
+                yield row
+            row = dict(zip(labels, values))
+
+        if row is not None:
+            yield row
+
+    def entries(self, output):
+        '''Return the rows of the table keyed by their index columns, empty
+        if the table is not in output
+
+        Args:
+            output (`str`): device output
+        '''
+        entries = {}
+        keys = [self.label_fields[i] for i in self.index]
+        for row in self.rows(output):
+            node = entries
+            for key in keys[:-1]:
+                node = node.setdefault(row[key], {})
+            node[row[keys[-1]]] = row
+        return entries
@@ -0,0 +1,147 @@
+import os
+import gzip
+import json
+import shutil
+import tarfile
+import tempfile
+import unittest
+import importlib
+
+from genie.libs.parser.utils.bulk import build_class_commands, fill_command, \
+                                        golden_captures, open_source, \
+                                        manifest_captures, run, BulkReport
+
+GOLDEN = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))), 'iosxe', 'tests', 'ShowIpv6RipDatabase',
+    'cli', 'equal')
+
+CLASS_COMMANDS = {('iosxe', 'ShowIpv6RipDatabase'): [
+    'show ipv6 rip database', 'show ipv6 rip vrf {vrf} database']}
+
+
+def load_expected(name):
+    return importlib.machinery.SourceFileLoader(
+        'expected', os.path.join(GOLDEN, name + '_expected.py')
+    ).load_module().expected_output
+
+
+class TestGoldenLayout(unittest.TestCase):
+
+    def test_build_class_commands(self):
+        data = {'tokens': ['iosxe', 'c9300'],
+                'show version': {'iosxe': {'module_name': 'show_platform',
+                                           'package': 'genie.libs.parser',
+                                           'class': 'ShowVersion'}},
+                'show inventory': {'iosxe': {
+                    'c9300': {'module_name': 'show_platform',
+                              'package': 'genie.libs.parser',
+                              'class': 'ShowInventory'}}}}
+        self.assertEqual(build_class_commands(data),
+                         {('iosxe', 'ShowVersion'): ['show version'],
+                          ('iosxe', 'ShowInventory'): ['show inventory']})
+
+    def test_fill_command(self):
+        templates = CLASS_COMMANDS[('iosxe', 'ShowIpv6RipDatabase')]
+        self.assertEqual(fill_command(templates, {}),
+                         ('show ipv6 rip database', {}))
+        self.assertEqual(fill_command(templates, {'vrf': 'VRF1', 'x': 1}),
+                         ('show ipv6 rip vrf VRF1 database', {'x': 1}))
+        self.assertIsNone(fill_command(['show ip route vrf {vrf}'], {}))
+
+    def test_golden_captures(self):
+        names = ['iosxe/tests/ShowIpv6RipDatabase/cli/equal/'
+                 'golden_output_2_output.txt',
+                 'iosxe/c9300/tests/ShowIpv6RipDatabase/cli/equal/'
+                 'golden_output_output.txt',
+                 'iosxe/tests/ShowUnknown/cli/equal/golden_output_output.txt',
+                 'iosxe/tests/ShowIpv6RipDatabase/cli/equal/'
+                 'golden_output_2_expected.py']
+        arguments = {'iosxe/tests/ShowIpv6RipDatabase/cli/equal/'
+                     'golden_output_2_arguments.json': {'vrf': 'VRF1'}}
+
+        captures, skipped = golden_captures(names, arguments.get,
+                                            CLASS_COMMANDS)
+
+        self.assertEqual([c.command for c in captures],
+                         ['show ipv6 rip vrf VRF1 database',
+                          'show ipv6 rip database'])
+        self.assertEqual([c.platform for c in captures], [None, 'c9300'])
+        self.assertEqual(skipped, [names[2]])
+
+
+class TestBulkRun(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+
+        self.root = os.path.join(self.folder, 'captures')
+        equal = os.path.join(self.root, 'iosxe', 'tests',
+                             'ShowIpv6RipDatabase', 'cli', 'equal')
+        shutil.copytree(GOLDEN, equal)
+
+    def records(self, path):
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt') as f:
+            return {r['key']: r for r in map(json.loads, f)}
+
+    def test_directory(self):
+        source = open_source(self.root)
+        captures, _ = golden_captures(source.names(), source.read_json,
+                                      CLASS_COMMANDS)
+        output = os.path.join(self.folder, 'parsed.ndjson.gz')
+
+        report = run(source, captures, output=output, jobs=2)
+
+        records = self.records(output)
+        self.assertEqual(report.parsed, 2)
+        self.assertFalse(report.failed)
+        self.assertEqual(
+            records['iosxe/tests/ShowIpv6RipDatabase/cli/equal/'
+                    'golden_output_2_output.txt']['result'],
+            json.loads(json.dumps(load_expected('golden_output_2'))))
+        self.assertIn('Slowest captures', report.format())
+
+    def test_tarball_manifest_and_checkpoint(self):
+        tarball = os.path.join(self.folder, 'captures.tgz')
+        with tarfile.open(tarball, 'w:gz') as tar:
+            tar.add(self.root, arcname='.')
+
+        manifest = os.path.join(self.folder, 'manifest.json')
+        with open(manifest, 'w') as f:
+            for name, command in (('golden_output_output.txt',
+                                   'show ipv6 rip database'),
+                                  ('golden_output_2_output.txt',
+                                   'show ipv6 rip vrf VRF1 database'),
+                                  ('golden_output_2_expected.py',
+                                   'show ipv6 rip database')):
+                f.write(json.dumps({
+                    'path': 'iosxe/tests/ShowIpv6RipDatabase/cli/equal/' +
+                            name,
+                    'os': 'iosxe',
+                    'command': command}) + '\n')
+
+        output = os.path.join(self.folder, 'parsed.ndjson')
+        checkpoint = os.path.join(self.folder, 'parsed.ckpt')
+        captures = manifest_captures(manifest)
+
+        # First run is interrupted after the first capture
+        source = open_source(tarball)
+        run(source, captures[:1], output=output, jobs=1, checkpoint=checkpoint)
+        source.close()
+
+        source = open_source(tarball)
+        report = run(source, captures, output=output, jobs=1,
+                     checkpoint=checkpoint, report=BulkReport())
+        source.close()
+
+        self.assertEqual(report.skipped, 1)
+        self.assertEqual(report.parsed, 1)
+        self.assertEqual(len(report.failed), 1)
+        self.assertEqual(len(self.records(output)), 3)
+        with open(checkpoint) as f:
+            self.assertEqual(len(f.read().splitlines()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
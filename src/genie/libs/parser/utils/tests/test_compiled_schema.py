@@ -0,0 +1,227 @@
+import os
+import glob
+import json
+import unittest
+from unittest import mock
+
+from genie.metaparser.util.schemaengine import (Any, Optional, Or, Use,
+                                                Default)
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils import compiled_schema
+from genie.libs.parser.utils.compiled_schema import (CompiledSchema,
+                                                     CompiledMetaParser,
+                                                     compile_schema,
+                                                     configure)
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAll, ShowBgpAllDetail
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.iosxe.show_snmp import ShowSnmpMib
+
+PARSER_FOLDER = os.path.join(os.path.dirname(__file__), '..', '..')
+
+# Parsers of the largest results, with golden outputs
+PARSERS = (ShowBgpAll, ShowBgpAllDetail, ShowIpRoute, ShowMacAddressTable,
+           ShowSnmpMib)
+
+SCHEMA = {
+    'vlans': {
+        Any(): {
+            'vlan': Or(int, str),
+            Optional('ports'): list,
+            Optional('macs'): [str],
+        },
+    },
+    Optional('total'): int,
+}
+
+DATA = {
+    'vlans': {
+        '1': {'vlan': 1, 'ports': ['Gi1'], 'macs': ['aaaa.bbbb.cccc']},
+        '2': {'vlan': 'default'},
+    },
+    'total': 2,
+}
+
+
+def invalid(schema, data):
+    raise Exception('invalid')
+
+
+class TestCompiledSchema(unittest.TestCase):
+
+    def setUp(self):
+        # Only the compiled validator accepts, schemaengine rejects all
+        patcher = mock.patch.object(compiled_schema, '_reference',
+                                    side_effect=invalid)
+        self.reference = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        configure()
+
+    def test_valid(self):
+        self.assertTrue(compile_schema(SCHEMA)(DATA))
+        self.assertIs(CompiledSchema(SCHEMA).validate(DATA), DATA)
+        self.reference.assert_not_called()
+
+    def test_invalid(self):
+        check = compile_schema(SCHEMA)
+        self.assertFalse(check({'vlans': {'1': {'vlan': 1.5}}}))
+        self.assertFalse(check({'vlans': {'1': {'vlan': 1, 'port': []}}}))
+        self.assertFalse(check({'vlans': {'1': {'vlan': 1}}, 'total': '1'}))
+        self.assertFalse(check({'vlans': {'1': {'vlan': 1, 'macs': [1]}}}))
+        self.assertFalse(check({'total': 1}))
+
+    def test_errors_of_schemaengine(self):
+        data = {'vlans': {'1': {}}}
+        with self.assertRaisesRegex(Exception, 'invalid'):
+            CompiledSchema(SCHEMA).validate(data)
+        self.reference.assert_called_once_with(SCHEMA, data)
+
+    def test_empty(self):
+        # Left to schemaengine, even if all the keys are optional
+        with self.assertRaisesRegex(Exception, 'invalid'):
+            CompiledSchema({Optional('total'): int}).validate({})
+
+    def test_not_compilable(self):
+        # Use() may transform the values, schemaengine validates
+        schema = CompiledSchema({'vlan': Use(int)})
+        with self.assertRaises(Exception):
+            schema.validate({'vlan': '1'})
+        self.reference.assert_called_once()
+
+    def test_default_key(self):
+        # Default() sets the value of a missing key, schemaengine validates
+        schema = CompiledSchema({'vlan': int, Default('total', 0): int})
+        with self.assertRaises(Exception):
+            schema.validate({'vlan': 1})
+        self.reference.assert_called_once()
+
+    def test_reference(self):
+        configure('reference')
+        with self.assertRaises(Exception):
+            CompiledSchema(SCHEMA).validate(DATA)
+
+    def test_sampled(self):
+        vlans = {str(i): {'vlan': i} for i in range(1000)}
+        vlans['900'] = {'vlan': 1.5}
+        data = {'vlans': vlans}
+        self.assertFalse(compile_schema(SCHEMA)(data))
+        configure('sampled', first=10, sample=0)
+        self.assertTrue(compile_schema(SCHEMA)(data))
+        # The structure is still checked
+        vlans['900'] = 'default'
+        self.assertFalse(compile_schema(SCHEMA)(data))
+        with self.assertRaises(ValueError):
+            configure('fast')
+
+    def test_errors_forwarded(self):
+        data = {'vlans': {'1': {}}}
+        with self.assertRaisesRegex(Exception, 'invalid'):
+            CompiledSchema(SCHEMA).validate(data, top=False)
+        self.reference.assert_called_once_with(SCHEMA, data, top=False)
+
+    def test_golden(self):
+        # The golden outputs are valid for the compiled validators
+        for cls in PARSERS:
+            schema = CompiledSchema(cls.schema)
+            for path in golden_files(cls, 'equal', '*_expected.py'):
+                with open(path) as f:
+                    expected = {}
+                    exec(f.read(), expected)
+                schema.validate(expected['expected_output'])
+        self.reference.assert_not_called()
+
+
+def golden_files(cls, folder, pattern):
+    paths = glob.glob(os.path.join(PARSER_FOLDER, 'iosxe', 'tests',
+                                   cls.__name__, 'cli', folder, pattern))
+    assert paths, cls.__name__
+    return sorted(paths)
+
+
+def parse(cls, output, arguments, schema=None):
+    '''Parse output with the class, its schema replaced if given, return
+    the result or the type and message of the exception raised'''
+    device = mock.Mock(**{'execute.return_value': output})
+    with mock.patch.object(cls, 'schema', schema or cls.schema):
+        try:
+            return cls(device=device).parse(**arguments)
+        except Exception as e:
+            return type(e), str(e)
+
+
+class TestParse(unittest.TestCase):
+    '''The parsers validate their CompiledSchema with the compiled
+    validator, with the results and errors of their schema dict'''
+
+    def tearDown(self):
+        configure()
+
+    def golden(self, cls, folder):
+        for path in golden_files(cls, folder, '*_output.txt'):
+            with open(path) as f:
+                output = f.read()
+            arguments = {}
+            name = path[:-len('_output.txt')]
+            if os.path.exists(name + '_arguments.json'):
+                with open(name + '_arguments.json') as f:
+                    arguments = json.load(f)
+            yield name, output, arguments
+
+    def test_compiled(self):
+        for cls in PARSERS:
+            self.assertTrue(issubclass(cls, CompiledMetaParser))
+            self.assertIsInstance(cls.schema, CompiledSchema)
+
+    def test_golden(self):
+        for cls in PARSERS:
+            for name, output, arguments in self.golden(cls, 'equal'):
+                expected = {}
+                with open(name + '_expected.py') as f:
+                    exec(f.read(), expected)
+                with self.subTest(name), \
+                        mock.patch.object(CompiledSchema, 'accepts',
+                                          autospec=True,
+                                          side_effect=CompiledSchema.accepts) \
+                        as accepts:
+                    self.assertEqual(parse(cls, output, arguments),
+                                     expected['expected_output'])
+                    # Accepted by the compiled validator
+                    self.assertTrue(accepts.call_count)
+                    self.assertTrue(cls.schema.accepts(
+                        expected['expected_output']))
+
+    def test_empty(self):
+        for cls in PARSERS:
+            for name, output, arguments in self.golden(cls, 'empty'):
+                with self.subTest(name):
+                    result = parse(cls, output, arguments)
+                    self.assertIs(result[0], SchemaEmptyParserError)
+                    self.assertEqual(result, parse(cls, output, arguments,
+                                                   dict(cls.schema)))
+
+    def test_errors(self):
+        # The errors of schemaengine, the same as with the schema dict
+        schema = dict(ShowMacAddressTable.schema)
+        results = ({},
+                   {'mac_table': {}},
+                   {'mac_table': {'vlans': {'1': {'vlan': 1.5,
+                                                  'mac_addresses': {}}}}},
+                   {'mac_table': {'vlans': {}}, 'total': 1})
+        for mode in ('strict', 'sampled', 'reference'):
+            configure(mode)
+            for result in results:
+                with self.subTest(mode=mode, result=result), \
+                        mock.patch.object(ShowMacAddressTable, 'cli',
+                                          return_value=result) as cli:
+                    self.assertEqual(
+                        parse(ShowMacAddressTable, '', {}),
+                        parse(ShowMacAddressTable, '', {}, schema))
+                    # Not parsed again to be validated by schemaengine
+                    self.assertEqual(cli.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+import io
+import os
+import sys
+import json
+import shutil
+import socket
+import subprocess
+import tempfile
+import unittest
+import threading
+import importlib
+from unittest.mock import patch
+
+from genie.libs.parser.iosxe.show_rip import ShowIpv6RipDatabase
+from genie.libs.parser.utils.daemon import ParseServer, UnixParseServer, main
+from genie.libs.parser.utils.daemon_client import ParseClient, ParseError
+
+GOLDEN = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))), 'iosxe', 'tests', 'ShowIpv6RipDatabase',
+    'cli', 'equal')
+
+
+class EchoParser(object):
+
+    def __init__(self, device):
+        self.device = device
+
+    def parse(self, output=None, **kwargs):
+        if not output:
+            raise ValueError('empty output')
+        return {'output': output, 'kwargs': kwargs, 'os': self.device.os}
+
+
+class TestParseServer(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch('genie.libs.parser.utils.daemon.get_offline_parser',
+                        return_value=(EchoParser, {'vrf': 'VRF1'}))
+        self.get_offline_parser = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_handle(self):
+        response = ParseServer().handle({'id': 7,
+                                         'os': 'iosxe',
+                                         'command': 'show ip route vrf VRF1',
+                                         'output': 'out',
+                                         'kwargs': {'route': '10.1.1.1'}})
+        self.assertTrue(response['ok'])
+        self.assertEqual(response['id'], 7)
+        self.assertEqual(response['result'],
+                         {'output': 'out', 'os': 'iosxe',
+                          'kwargs': {'vrf': 'VRF1', 'route': '10.1.1.1'}})
+        self.assertIn('parse_ms', response['timing'])
+        self.assertIn('lookup_ms', response['timing'])
+
+    def test_handle_normalize(self):
+        request = {'os': 'iosxe',
+                   'command': 'show version',
+                   'output': 'a\r\n --More-- \nb\r\n'}
+        response = ParseServer().handle(request)
+        self.assertEqual(response['result']['output'], 'a\nb\n')
+
+        response = ParseServer().handle(dict(request, normalize=False))
+        self.assertEqual(response['result']['output'], request['output'])
+
+        response = ParseServer(normalize=False).handle(request)
+        self.assertEqual(response['result']['output'], request['output'])
+
+    def test_handle_error(self):
+        response = ParseServer().handle({'os': 'iosxe',
+                                         'command': 'show version',
+                                         'output': ''})
+        self.assertFalse(response['ok'])
+        self.assertEqual(response['error_type'], 'ValueError')
+
+    def test_handle_missing_key(self):
+        response = ParseServer().handle({'os': 'iosxe'})
+        self.assertFalse(response['ok'])
+        self.assertEqual(response['error_type'], 'KeyError')
+
+    def test_ping(self):
+        self.assertTrue(ParseServer().handle({'op': 'ping'})['ok'])
+
+    def test_handle_not_object(self):
+        for request in ([1], 'x', 3, None):
+            response = ParseServer().handle(request)
+            self.assertFalse(response['ok'])
+            self.assertEqual(response['error_type'], 'TypeError')
+
+    def test_serve_stream(self):
+        rfile = io.StringIO('{"id": 1, "os": "nxos", "command": "show '
+                            'version", "output": "a"}\n\nnot json\n')
+        wfile = io.StringIO()
+        ParseServer().serve_stream(rfile, wfile)
+
+        first, second = [json.loads(l) for l in wfile.getvalue().splitlines()]
+        self.assertEqual(first['result']['os'], 'nxos')
+        self.assertFalse(second['ok'])
+
+    def test_serve_stream_not_object(self):
+        rfile = io.StringIO('[1]\n"x"\n{"op": "ping"}\n')
+        wfile = io.StringIO()
+        ParseServer().serve_stream(rfile, wfile)
+
+        responses = [json.loads(l) for l in wfile.getvalue().splitlines()]
+        self.assertEqual([r['ok'] for r in responses], [False, False, True])
+
+
+class TestPreload(unittest.TestCase):
+
+    def test_parser_data(self):
+        # In a fresh interpreter, the parser data is not loaded yet
+        process = subprocess.run(
+            [sys.executable, '-c',
+             'import genie.libs.parser.utils.common as common\n'
+             'from genie.libs.parser.utils.daemon import preload\n'
+             'loaded = "parser_data" in vars(common)\n'
+             'preload(["iosxe"])\n'
+             'print(loaded, "parser_data" in vars(common))'],
+            stdout=subprocess.PIPE, universal_newlines=True, check=True)
+        self.assertEqual(process.stdout.split()[-2:], ['False', 'True'])
+
+
+class TestUnixParseServer(unittest.TestCase):
+
+    def setUp(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        self.path = os.path.join(folder, 'parser.sock')
+
+        self.server = UnixParseServer(self.path)
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def test_parse(self):
+        with open(os.path.join(GOLDEN, 'golden_output_2_output.txt')) as f:
+            output = f.read()
+        expected = importlib.machinery.SourceFileLoader(
+            'expected', os.path.join(GOLDEN, 'golden_output_2_expected.py')
+        ).load_module().expected_output
+
+        with patch('genie.libs.parser.utils.daemon.get_offline_parser',
+                   return_value=(ShowIpv6RipDatabase, {'vrf': 'VRF1'})):
+            with ParseClient(self.path, timeout=10) as client:
+                self.assertTrue(client.ping())
+                parsed, timing = client.parse(
+                    'iosxe', 'show ipv6 rip vrf VRF1 database', output,
+                    timing=True)
+                with self.assertRaises(ParseError):
+                    client.parse('iosxe', 'show ipv6 rip vrf VRF1 database',
+                                 '')
+
+        self.assertEqual(parsed, json.loads(json.dumps(expected)))
+        self.assertGreater(timing['parse_ms'], 0)
+
+    def test_invalid_utf8(self):
+        with patch('genie.libs.parser.utils.daemon.get_offline_parser',
+                   return_value=(EchoParser, {})):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(10)
+                sock.connect(self.path)
+                with sock.makefile('rwb') as f:
+                    f.write(b'{"os": "nxos", "command": "show version", '
+                            b'"output": "a\xff"}\n{"op": "ping"}\n')
+                    f.flush()
+                    first = json.loads(f.readline())
+                    second = json.loads(f.readline())
+        self.assertEqual(first['result']['output'], 'a\ufffd')
+        self.assertTrue(second['ok'])
+
+    def test_running_daemon(self):
+        # The socket of a running daemon is not removed
+        with self.assertRaises(FileExistsError):
+            UnixParseServer(self.path)
+        with ParseClient(self.path, timeout=10) as client:
+            self.assertTrue(client.ping())
+
+
+class TestStaleSocket(unittest.TestCase):
+
+    def setUp(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        self.path = os.path.join(folder, 'parser.sock')
+
+    def test_stale_socket(self):
+        # Left behind by a daemon no longer running
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(self.path)
+        sock.close()
+        server = UnixParseServer(self.path)
+        server.server_close()
+
+    def test_not_socket(self):
+        with open(self.path, 'w') as f:
+            f.write('data')
+        with self.assertRaises(FileExistsError):
+            UnixParseServer(self.path)
+        with open(self.path) as f:
+            self.assertEqual(f.read(), 'data')
+
+
+
+class TestMain(unittest.TestCase):
+
+    def run_main(self, *argv):
+        stdout = io.StringIO()
+        with patch('logging.basicConfig') as basic_config, \
+                patch('sys.stdin', io.StringIO('{"id": 1, "op": "ping"}\n')), \
+                patch('sys.stdout', stdout):
+            main(['--stdio'] + list(argv))
+        self.assertEqual(json.loads(stdout.getvalue())['id'], 1)
+        return basic_config
+
+    def test_log_level(self):
+        # The console script calls main(), logging is configured there
+        self.run_main().assert_called_once_with(level='INFO')
+        self.run_main('--log-level', 'DEBUG').assert_called_once_with(
+            level='DEBUG')
+
+    def test_invalid_log_level(self):
+        with patch('sys.stderr', io.StringIO()), \
+                self.assertRaises(SystemExit):
+            main(['--stdio', '--log-level', 'VERBOSE'])
+
+
+if __name__ == '__main__':
+    unittest.main()
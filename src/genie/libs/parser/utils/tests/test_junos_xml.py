@@ -0,0 +1,207 @@
+import io
+import json
+import unittest
+from unittest import mock
+
+from genie.libs.parser.utils import junos_xml
+from genie.libs.parser.utils.junos_xml import parse_xml, parse_json
+
+SHAPE = {
+    'route-information': {
+        'route-table': [{
+            'table-name': str,
+            'rt': [{
+                '@junos:style': str,
+                'rt-destination': str,
+                'rt-entry': {
+                    'current-active': bool,
+                    'age': {'#text': str, '@junos:seconds': str},
+                    'as-path': str,
+                    'communities': [str],
+                },
+            }],
+        }],
+    },
+}
+
+OUTPUT = '''\
+lab@router> show route extensive | display xml
+<rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R2/junos">
+    <route-information xmlns="http://xml.juniper.net/junos/18.2R2/junos-routing">
+        <!-- keepalive -->
+        <route-table>
+            <table-name>inet.0</table-name>
+            <destination-count>2</destination-count>
+            <rt junos:style="detail">
+                <rt-destination>10.1.0.0/24</rt-destination>
+                <rt-entry>
+                    <current-active/>
+                    <age junos:seconds="2000615">3w2d 4:43:35</age>
+                    <as-path>AS path: I
+</as-path>
+                    <communities>65000:1</communities>
+                    <communities>65000:2</communities>
+                    <nh>
+                        <to>10.169.14.121</to>
+                    </nh>
+                </rt-entry>
+                <rt-entry>
+                    <age junos:seconds="3">00:00:03</age>
+                    <as-path></as-path>
+                    <communities>65000:3</communities>
+                    <communities/>
+                </rt-entry>
+            </rt>
+            <rt junos:style="detail">
+                <rt-destination>10.36.3.3/32</rt-destination>
+                <rt-entry>
+                    <age>6d 17:15:31</age>
+                </rt-entry>
+            </rt>
+        </route-table>
+    </route-information>
+    <cli>
+        <banner></banner>
+    </cli>
+</rpc-reply>
+
+{master}
+lab@router> '''
+
+JSON_OUTPUT = '''\
+lab@router> show route extensive | display json
+{
+    "route-information" : [
+    {
+        "attributes" : {"xmlns" : "http://xml.juniper.net/junos/18.2R2/junos-routing"},
+        "route-table" : [
+        {
+            "table-name" : [{"data" : "inet.0"}],
+            "destination-count" : [{"data" : "2"}],
+            "rt" : [
+            {
+                "attributes" : {"junos:style" : "detail"},
+                "rt-destination" : [{"data" : "10.1.0.0/24"}],
+                "rt-entry" : [
+                {
+                    "current-active" : [{"data" : [null]}],
+                    "age" : [{"data" : "3w2d 4:43:35", "attributes" : {"junos:seconds" : "2000615"}}],
+                    "as-path" : [{"data" : "AS path: I\\n"}],
+                    "communities" : [{"data" : "65000:1"}, {"data" : "65000:2"}],
+                    "nh" : [{"to" : [{"data" : "10.169.14.121"}]}]
+                },
+                {
+                    "age" : [{"data" : "00:00:03", "attributes" : {"junos:seconds" : "3"}}],
+                    "as-path" : [{"data" : ""}],
+                    "communities" : [{"data" : "65000:3"}, {"data" : [null]}]
+                }
+                ]
+            },
+            {
+                "attributes" : {"junos:style" : "detail"},
+                "rt-destination" : [{"data" : "10.36.3.3/32"}],
+                "rt-entry" : [
+                {
+                    "age" : [{"data" : "6d 17:15:31"}]
+                }
+                ]
+            }
+            ]
+        }
+        ]
+    }
+    ]
+}
+
+{master}
+lab@router> '''
+
+EXPECTED = {
+    'route-information': {
+        'route-table': [{
+            'table-name': 'inet.0',
+            'rt': [{
+                '@junos:style': 'detail',
+                'rt-destination': '10.1.0.0/24',
+                'rt-entry': [{
+                    'current-active': True,
+                    'age': {'#text': '3w2d 4:43:35',
+                            '@junos:seconds': '2000615'},
+                    'as-path': 'AS path: I',
+                    'communities': ['65000:1', '65000:2']
+                }, {
+                    'age': {'#text': '00:00:03', '@junos:seconds': '3'},
+                    'communities': ['65000:3', '']
+                }]
+            }, {
+                '@junos:style': 'detail',
+                'rt-destination': '10.36.3.3/32',
+                'rt-entry': {'age': {'#text': '6d 17:15:31'}}
+            }]
+        }]
+    }
+}
+
+
+class TestParseXml(unittest.TestCase):
+
+    maxDiff = None
+
+    def test_parse(self):
+        self.assertEqual(parse_xml(OUTPUT, SHAPE), EXPECTED)
+
+    def test_chunks(self):
+        for chunk_size in (1, 7, 64):
+            self.assertEqual(parse_xml(OUTPUT, SHAPE, chunk_size=chunk_size),
+                             EXPECTED)
+
+    def test_file(self):
+        document = OUTPUT[OUTPUT.find('<'):OUTPUT.rfind('</rpc-reply>') + 12]
+        with io.StringIO(document) as f:
+            self.assertEqual(parse_xml(f, SHAPE, chunk_size=100), EXPECTED)
+
+    def test_file_prompt(self):
+        # The command and the prompt around the document are not read
+        for chunk_size in (1, 7, 100):
+            with io.StringIO(OUTPUT) as f:
+                self.assertEqual(parse_xml(f, SHAPE, chunk_size=chunk_size),
+                                 EXPECTED)
+
+    def test_no_start_ns(self):
+        # Python 3.7 and older do not call start_ns of the parser target
+        with mock.patch.object(junos_xml._ShapeBuilder, 'start_ns',
+                               lambda self, prefix, uri: None):
+            self.assertEqual(parse_xml(OUTPUT, SHAPE), EXPECTED)
+
+    def test_no_rpc_reply(self):
+        output = ('<route-information><route-table>'
+                  '<table-name>inet.3</table-name>'
+                  '</route-table></route-information>')
+        self.assertEqual(parse_xml(output, SHAPE), {'route-information': {
+            'route-table': [{'table-name': 'inet.3'}]}})
+
+    def test_empty(self):
+        self.assertEqual(parse_xml('', SHAPE), {})
+        self.assertEqual(parse_xml('<rpc-reply>\n</rpc-reply>', SHAPE), {})
+
+
+class TestParseJson(unittest.TestCase):
+
+    maxDiff = None
+
+    def test_parse(self):
+        self.assertEqual(parse_json(JSON_OUTPUT, SHAPE), EXPECTED)
+
+    def test_loaded(self):
+        document = json.loads(JSON_OUTPUT[JSON_OUTPUT.find('{'):
+                                          JSON_OUTPUT.rfind('{master}')])
+        self.assertEqual(parse_json(document, SHAPE), EXPECTED)
+
+    def test_empty(self):
+        self.assertEqual(parse_json('', SHAPE), {})
+        with self.assertRaises(Exception):
+            parse_json('error: syntax error', SHAPE)
+
+
+if __name__ == '__main__':
+    unittest.main()
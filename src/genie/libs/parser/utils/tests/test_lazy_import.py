@@ -0,0 +1,153 @@
+import sys
+import json
+import time
+import unittest
+import threading
+import subprocess
+from unittest import mock
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.lazy_import import parser_modules
+
+DATA = {
+    'tokens': ['iosxe', 'asr1k'],
+    'show version': {
+        'iosxe': {'module_name': 'show_platform',
+                  'package': 'genie.libs.parser',
+                  'class': 'ShowVersion'},
+        'ios': {'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowVersion'},
+    },
+    'show platform': {
+        'iosxe': {
+            'asr1k': {'module_name': 'show_platform',
+                      'package': 'genie.libs.parser',
+                      'class': 'ShowPlatform'},
+        },
+    },
+    'show my parser': {
+        'iosxe': {'module_name': 'show_mine',
+                  'package': 'external.parsers',
+                  'class': 'ShowMine'},
+    },
+}
+
+# Parser modules imported by the statements, in a fresh interpreter
+NEW_MODULES = '''
+import sys
+import genie.libs.parser.iosxe, genie.libs.parser.ios
+before = set(sys.modules)
+{statements}
+import genie.libs.parser.utils.common as common
+print(json.dumps({{
+    'modules': sorted(m for m in set(sys.modules) - before
+                      if m.startswith('genie.libs.parser.')),
+    'parser_data': 'parser_data' in vars(common),
+}}))
+'''
+
+
+def new_modules(statements):
+    process = subprocess.run(
+        [sys.executable, '-c', 'import json' + NEW_MODULES.format(
+            statements=statements)],
+        stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+class TestParserModules(unittest.TestCase):
+
+    def test_os_package(self):
+        self.assertEqual(parser_modules('genie.libs.parser.iosxe', DATA),
+                         {'ShowVersion':
+                          'genie.libs.parser.iosxe.show_platform'})
+
+    def test_token_package(self):
+        self.assertEqual(parser_modules('genie.libs.parser.iosxe.asr1k', DATA),
+                         {'ShowPlatform':
+                          'genie.libs.parser.iosxe.asr1k.show_platform'})
+
+    def test_unknown_package(self):
+        self.assertEqual(parser_modules('genie.libs.parser.nxos', DATA), {})
+
+
+class TestParserData(unittest.TestCase):
+
+    def setUp(self):
+        # parser_data as not loaded yet, restored after the test
+        if 'parser_data' in vars(common):
+            self.addCleanup(setattr, common, 'parser_data', common.parser_data)
+            del common.parser_data
+        else:
+            self.addCleanup(vars(common).pop, 'parser_data', None)
+        patcher = mock.patch.object(common, '_parser_data_loaded',
+                                    threading.Event())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch('genie.libs.parser.utils.entry_points.'
+                             'load_entry_points')
+        self.load_entry_points = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_first_calls(self):
+        def load():
+            time.sleep(0.05)
+            return DATA
+
+        results = []
+        with mock.patch.object(common, '_load_parser_json',
+                               side_effect=load) as load_json:
+            threads = [threading.Thread(
+                target=lambda: results.append(common._get_parser_data()))
+                for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        load_json.assert_called_once_with()
+        self.load_entry_points.assert_called_once_with()
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result is DATA for result in results))
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'no module __getattr__')
+@unittest.skipUnless(parser_modules('genie.libs.parser.iosxe').get('ShowVersion'),
+                     'parsers.json is missing')
+class TestLazyParsers(unittest.TestCase):
+
+    def test_parser_import_count(self):
+        result = new_modules('genie.libs.parser.iosxe.ShowVersion')
+        self.assertEqual([m for m in result['modules']
+                          if m.startswith('genie.libs.parser.iosxe.')],
+                         ['genie.libs.parser.iosxe.show_platform'])
+
+    def test_cross_os_import_count(self):
+        # The ios parser subclasses the iosxe one, of the same module
+        result = new_modules('genie.libs.parser.ios.ShowVrf')
+        self.assertEqual([m for m in result['modules']
+                          if m.startswith(('genie.libs.parser.ios.',
+                                           'genie.libs.parser.iosxe.'))],
+                         ['genie.libs.parser.ios.show_vrf',
+                          'genie.libs.parser.iosxe.show_vrf'])
+
+    def test_parser_data_not_loaded(self):
+        result = new_modules('import genie.libs.parser.iosxe.show_platform')
+        self.assertFalse(result['parser_data'])
+
+    def test_same_class(self):
+        import genie.libs.parser.iosxe
+        from genie.libs.parser.iosxe.show_platform import ShowVersion
+        self.assertIs(genie.libs.parser.iosxe.ShowVersion, ShowVersion)
+        self.assertIn('ShowVersion', dir(genie.libs.parser.iosxe))
+
+    def test_unknown_class(self):
+        import genie.libs.parser.iosxe
+        with self.assertRaises(AttributeError):
+            genie.libs.parser.iosxe.ShowNothing
+        with self.assertRaises(AttributeError):
+            genie.libs.parser.iosxe.__wrapped__
+
+
+if __name__ == '__main__':
+    unittest.main()
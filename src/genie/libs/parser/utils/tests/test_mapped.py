@@ -0,0 +1,123 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from genie.libs.parser.utils import mapped
+from genie.libs.parser.utils.mapped import MappedOutput
+from genie.libs.parser.utils.offline import parse_output
+
+LOGGING = (b'*Dec 22 10:00:01: %LINK-3-UPDOWN: Interface Gi1, changed state '
+           b'to up\r\n'
+           b'*Dec 22 10:00:02: %BGP-5-ADJCHANGE: neighbor 10.1.1.1 Up\r\n'
+           b' --More-- \r\n'
+           b'*Dec 22 10:00:03: %BGP-5-ADJCHANGE: neighbor 10.1.1.1 Down '
+           b'\xc3\xa9t\xc3\xa9\r\n')
+
+
+class TestMappedOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write(self, content, name='output.txt'):
+        path = os.path.join(self.folder, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def test_splitlines(self):
+        with MappedOutput(self.write(LOGGING)) as output:
+            self.assertEqual(len(output), len(LOGGING))
+            self.assertEqual(output.line_count(), 4)
+            lines = list(output.splitlines())
+            self.assertEqual(lines, list(output))
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].endswith('changed state to up'))
+        self.assertTrue(lines[2].endswith('Down été'))
+
+    def test_blocks(self):
+        # Lines split over blocks, and a line longer than a block
+        content = b'a' * 25 + b'\n' + b'b\n' * 10 + b'c' * 7
+        with mock.patch.object(mapped, '_BLOCK', 8):
+            with MappedOutput(self.write(content)) as output:
+                self.assertEqual(list(output.splitlines()),
+                                 ['a' * 25] + ['b'] * 10 + ['c' * 7])
+
+    def test_not_normalized(self):
+        with MappedOutput(self.write(LOGGING), normalize=False) as output:
+            lines = list(output.splitlines())
+            self.assertEqual(len(lines), 4)
+            self.assertEqual(lines[2], ' --More-- ')
+            self.assertFalse(lines[0].endswith('\r'))
+            self.assertIn('\r\n', output.text())
+
+    def test_grep(self):
+        with MappedOutput(self.write(LOGGING)) as output:
+            self.assertEqual(
+                list(output.grep(rb'%BGP-5-ADJCHANGE: neighbor (\S+)')),
+                ['*Dec 22 10:00:02: %BGP-5-ADJCHANGE: neighbor 10.1.1.1 Up',
+                 '*Dec 22 10:00:03: %BGP-5-ADJCHANGE: neighbor 10.1.1.1 Down'
+                 ' été'])
+            # One line per matching line, str patterns are encoded
+            self.assertEqual(len(list(output.grep('10'))), 3)
+            self.assertEqual(list(output.grep(rb'^\*Dec 23')), [])
+
+    def test_read(self):
+        with MappedOutput(self.write(LOGGING), normalize=False) as output:
+            # The é is split over the two reads
+            chunks = [output.read(len(LOGGING) - 4), output.read()]
+            self.assertEqual(''.join(chunks), LOGGING.decode())
+            self.assertEqual(output.read(), '')
+
+    def test_text(self):
+        with MappedOutput(self.write(LOGGING)) as output:
+            text = output.text()
+        self.assertNotIn('\r', text)
+        self.assertNotIn('--More--', text)
+        self.assertEqual(text.count('\n'), 3)
+
+    def test_empty(self):
+        with MappedOutput(self.write(b'')) as output:
+            self.assertFalse(output)
+            self.assertEqual(list(output.splitlines()), [])
+            self.assertEqual(list(output.grep(rb'.')), [])
+            self.assertEqual(output.line_count(), 0)
+            self.assertEqual(output.text(), '')
+
+
+class TestParseOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'output.txt')
+        with open(self.path, 'wb') as f:
+            f.write(LOGGING)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def parse(self, mapped_output):
+        parser_cls = mock.Mock(mapped_output=mapped_output)
+        with mock.patch('genie.libs.parser.utils.offline.get_offline_parser',
+                        return_value=(parser_cls, {})), \
+                MappedOutput(self.path) as output:
+            parse_output('iosxe', 'show logging', output)
+            return (output, output.text(),
+                    parser_cls.return_value.parse.call_args[1])
+
+    def test_mapped_parser(self):
+        output, _, kwargs = self.parse(mapped_output=True)
+        self.assertIs(kwargs['output'], output)
+
+    def test_other_parser(self):
+        _, text, kwargs = self.parse(mapped_output=False)
+        self.assertEqual(kwargs['output'], text)
+
+
+if __name__ == '__main__':
+    unittest.main()
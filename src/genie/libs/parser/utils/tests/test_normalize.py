@@ -0,0 +1,74 @@
+import unittest
+
+from genie.libs.parser.utils.normalize import normalize
+
+CLEAN = '''\
+Interface              IP-Address      OK? Method Status                Protocol
+GigabitEthernet1       10.1.1.1        YES manual up                    up
+GigabitEthernet2       unassigned      YES unset  administratively down down
+Loopback0              10.2.2.2        YES NVRAM  up                    up      
+'''
+
+
+class TestNormalize(unittest.TestCase):
+
+    def test_clean(self):
+        # Returned as is, trailing spaces included
+        self.assertIs(normalize(CLEAN), CLEAN)
+        self.assertEqual(normalize(''), '')
+        self.assertIsNone(normalize(None))
+
+    def test_line_ends(self):
+        self.assertEqual(normalize(CLEAN.replace('\n', '\r\n')), CLEAN)
+
+    def test_pager_erased(self):
+        # IOS erases the prompt with backspaces and spaces
+        output = ('GigabitEthernet1  up\r\n'
+                  ' --More-- ' + '\b' * 10 + ' ' * 10 + '\b' * 10 +
+                  'GigabitEthernet2  down\r\n')
+        self.assertEqual(normalize(output),
+                         'GigabitEthernet1  up\nGigabitEthernet2  down\n')
+
+        # NX-OS highlights the prompt and erases the line
+        output = ('Eth1/1  up\n'
+                  '\x1b[7m--More--\x1b[m\r\x1b[KEth1/2  up\n')
+        self.assertEqual(normalize(output), 'Eth1/1  up\nEth1/2  up\n')
+
+    def test_pager_left(self):
+        output = ('ge-0/0/0  up\n'
+                  '---(more 45%)---\n'
+                  'ge-0/0/1  up\n'
+                  ' --More-- ge-0/0/2  up\n'
+                  '<--- More --->\n'
+                  'ge-0/0/3  up\n')
+        self.assertEqual(normalize(output),
+                         'ge-0/0/0  up\nge-0/0/1  up\nge-0/0/2  up\n'
+                         'ge-0/0/3  up\n')
+
+        # Not a prompt when it does not start the line
+        self.assertEqual(normalize('Description: see --More-- below\n'),
+                         'Description: see --More-- below\n')
+
+    def test_ansi(self):
+        self.assertEqual(normalize('\x1b[1mRouter#\x1b[0m show clock\n'),
+                         'Router# show clock\n')
+
+    def test_carriage_return(self):
+        self.assertEqual(normalize('Building configuration...\r'
+                                   'Current configuration : 1234 bytes\n'),
+                         'Current configuration : 1234 bytes\n')
+        # Like on a terminal, a shorter line leaves the end of the line
+        self.assertEqual(normalize('50%\r100\n'), '100\n')
+        self.assertEqual(normalize('100%\r50\n'), '500%\n')
+
+    def test_controls(self):
+        self.assertEqual(normalize('up\x07\x00\tdown\x7f\n'), 'up\tdown\n')
+
+    def test_trailing_spaces(self):
+        self.assertEqual(normalize(CLEAN, trailing_spaces=True),
+                         '\n'.join(line.rstrip()
+                                   for line in CLEAN.split('\n')))
+
+
+if __name__ == '__main__':
+    unittest.main()
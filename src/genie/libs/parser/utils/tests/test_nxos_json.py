@@ -0,0 +1,64 @@
+import unittest
+
+from genie.libs.parser.utils.nxos_json import loads, rows, first_row, \
+                                             to_bool, RowMapper
+
+
+class TestNxosJson(unittest.TestCase):
+
+    def test_loads(self):
+        output = ('show ip route vrf all | json\n'
+                  '{"TABLE_vrf": {"ROW_vrf": {"vrf-name-out": "default"}}}\n'
+                  'N9K-1#')
+        self.assertEqual(loads(output),
+                         {'TABLE_vrf': {'ROW_vrf': {'vrf-name-out': 'default'}}})
+        self.assertEqual(loads(''), {})
+        self.assertEqual(loads({'a': 1}), {'a': 1})
+        with self.assertRaises(Exception):
+            loads('% Invalid command')
+
+    def test_rows(self):
+        single = {'TABLE_vrf': {'ROW_vrf': {'vrf-name-out': 'default'}}}
+        listed = {'TABLE_vrf': {'ROW_vrf': [{'vrf-name-out': 'default'},
+                                            {'vrf-name-out': 'VRF1'}]}}
+        tables = {'TABLE_vrf': [{'ROW_vrf': {'vrf-name-out': 'default'}},
+                                {'ROW_vrf': [{'vrf-name-out': 'VRF1'}]}]}
+
+        names = lambda data: [row['vrf-name-out'] for row in rows(data, 'vrf')]
+        self.assertEqual(names(single), ['default'])
+        self.assertEqual(names(listed), ['default', 'VRF1'])
+        self.assertEqual(names(tables), ['default', 'VRF1'])
+        self.assertEqual(names({}), [])
+        self.assertEqual(names({'TABLE_vrf': {}}), [])
+        self.assertEqual(first_row(listed, 'vrf'), {'vrf-name-out': 'default'})
+        self.assertEqual(first_row({}, 'vrf'), {})
+
+    def test_to_bool(self):
+        self.assertTrue(to_bool('true'))
+        self.assertTrue(to_bool('enabled'))
+        self.assertTrue(to_bool(True))
+        self.assertFalse(to_bool('false'))
+        self.assertFalse(to_bool(None))
+
+    def test_row_mapper(self):
+        mapper = RowMapper([('eth_mtu', 'mtu', int),
+                            ('eth_inrate1_bits', 'counters.rate.in_rate', int),
+                            ('eth_inucast', 'counters.in_unicast_pkts', int),
+                            ('desc', 'description', None),
+                            ('eth_autoneg', 'auto_negotiate', to_bool)])
+        target = {'counters': {'rx': True}}
+
+        mapper.fill(target, {'eth_mtu': '1500',
+                             'eth_inrate1_bits': 24,
+                             'eth_inucast': 'n/a',
+                             'desc': '',
+                             'eth_autoneg': 'off'})
+
+        self.assertEqual(target, {'mtu': 1500,
+                                  'auto_negotiate': False,
+                                  'counters': {'rx': True,
+                                               'rate': {'in_rate': 24}}})
+
+
+if __name__ == '__main__':
+    unittest.main()
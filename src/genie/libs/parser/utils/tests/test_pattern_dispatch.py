@@ -0,0 +1,138 @@
+import os
+import re
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from genie.libs.parser.utils import pattern_dispatch
+from genie.libs.parser.utils.pattern_dispatch import (PatternDispatcher,
+                                                      configure, ordered)
+from genie.libs.parser.utils.pattern_stats import instrument
+from genie.libs.parser.junos.show_pfe import ShowPfeStatisticsTraffic
+
+GOLDEN = os.path.join(os.path.dirname(__file__), '..', '..', 'junos', 'tests',
+                      'ShowPfeStatisticsTraffic', 'cli', 'equal',
+                      'golden_output_1')
+
+COUNTERS = [('p1', re.compile(r'^Input +packets: +(?P<input>\d+)$')),
+            ('p2', re.compile(r'^Output +packets: +(?P<output>\d+)$')),
+            ('p3', re.compile(r'^(?P<name>\S+) +drops: +(?P<drops>\d+)$')),
+            ('p4', re.compile(r'^Fabric +drops: +(?P<fabric>\d+)$'))]
+
+
+class TestPatternDispatcher(unittest.TestCase):
+
+    def tearDown(self):
+        configure()
+
+    def test_ordered(self):
+        counts = {'p1': 1, 'p2': 5, 'p4': 9, 'p5': 3}
+        # p3 is not exclusive, p4 and p5 are never tried before it
+        self.assertEqual(ordered(['p1', 'p2', 'p3', 'p4', 'p5'],
+                                 {'p1', 'p2', 'p4', 'p5'}, counts),
+                         ['p2', 'p1', 'p3', 'p4', 'p5'])
+        self.assertEqual(ordered(['p1', 'p2', 'p3'], {'p1', 'p2', 'p3'}, {}),
+                         ['p1', 'p2', 'p3'])
+
+    def test_source_order(self):
+        dispatcher = PatternDispatcher('ShowFake', COUNTERS, exclusive=True)
+        self.assertEqual(dispatcher.order, ['p1', 'p2', 'p3', 'p4'])
+        name, m = dispatcher.match('Fabric drops: 3')
+        self.assertEqual((name, m.groupdict()),
+                         ('p3', {'name': 'Fabric', 'drops': '3'}))
+        self.assertEqual(dispatcher.match('Output bytes: 3'), (None, None))
+
+    def test_adaptive(self):
+        configure(adaptive=True)
+        exclusive = ['p1', 'p2', 'p4']
+        with mock.patch.object(pattern_dispatch, 'REORDER_EVERY', 4):
+            dispatcher = PatternDispatcher('ShowFake', COUNTERS, exclusive)
+            for _ in range(4):
+                dispatcher.match('Output packets: 1')
+            self.assertEqual(dispatcher.order, ['p2', 'p1', 'p3', 'p4'])
+            # The order is shared with the next dispatchers of the parser
+            self.assertEqual(
+                PatternDispatcher('ShowFake', COUNTERS, exclusive).order,
+                ['p2', 'p1', 'p3', 'p4'])
+            # p3 still matches the fabric drops first
+            for _ in range(8):
+                name, _ = dispatcher.match('Fabric drops: 1')
+            self.assertEqual(name, 'p3')
+            self.assertEqual(dispatcher.order, ['p2', 'p1', 'p3', 'p4'])
+
+    def test_profile(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        path = os.path.join(folder, 'stats.json')
+        with open(path, 'w') as f:
+            json.dump({'ShowFake': {'patterns': {
+                'p1': {'matches': 1}, 'p2': {'matches': 5}}}}, f)
+        configure(profile=path)
+        self.assertEqual(
+            PatternDispatcher('ShowFake', COUNTERS, exclusive=True).order,
+            ['p2', 'p1', 'p3', 'p4'])
+        # Parsers out of the profile keep their order
+        self.assertEqual(
+            PatternDispatcher('ShowOther', COUNTERS, exclusive=True).order,
+            ['p1', 'p2', 'p3', 'p4'])
+
+    def test_verify(self):
+        configure(verify=True)
+        dispatcher = PatternDispatcher('ShowFake', COUNTERS, exclusive=True)
+        dispatcher.match('Input packets: 1')
+        with self.assertRaisesRegex(Exception, 'p3, p4 of ShowFake'):
+            dispatcher.match('Fabric drops: 1')
+        # Not declared exclusive
+        dispatcher = PatternDispatcher('ShowFake', COUNTERS, ['p1', 'p2'])
+        self.assertEqual(dispatcher.match('Fabric drops: 1')[0], 'p3')
+
+
+class TestGoldenOutput(unittest.TestCase):
+    '''The exclusive patterns of ShowPfeStatisticsTraffic over its golden
+    output, in every order'''
+
+    def setUp(self):
+        with open(GOLDEN + '_output.txt') as f:
+            self.output = f.read()
+        expected = {}
+        with open(GOLDEN + '_expected.py') as f:
+            exec(f.read(), expected)
+        self.expected = expected['expected_output']
+
+    def tearDown(self):
+        configure()
+
+    def parse(self):
+        return ShowPfeStatisticsTraffic(device=mock.Mock()).parse(
+            output=self.output)
+
+    def test_verify(self):
+        configure(verify=True)
+        self.assertEqual(self.parse(), self.expected)
+
+    def test_profile(self):
+        with instrument() as stats:
+            self.parse()
+        report = stats.report()
+        patterns = report['junos.show_pfe.ShowPfeStatisticsTraffic']['patterns']
+        self.assertEqual(patterns['p1']['matches'], 1)
+        configure(profile=report)
+        self.assertEqual(self.parse(), self.expected)
+
+        # Reversed source order
+        configure(profile={parser: {'patterns': {
+            'p{}'.format(i): {'matches': i} for i in range(1, 41)}}
+            for parser in report})
+        self.assertEqual(self.parse(), self.expected)
+
+    def test_adaptive(self):
+        configure(adaptive=True)
+        with mock.patch.object(pattern_dispatch, 'REORDER_EVERY', 5):
+            for _ in range(3):
+                self.assertEqual(self.parse(), self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import re
+import json
+import shutil
+import tempfile
+import unittest
+
+from genie.libs.parser.utils.pattern_stats import (InstrumentedPattern,
+                                                   PatternStats, instrument)
+
+OUTPUT = '''\
+GigabitEthernet1 is up
+  MTU 1500 bytes
+  unknown line
+GigabitEthernet2 is down
+'''
+
+
+class ShowFake(object):
+    '''Parser-like class, patterns compiled in cli()'''
+
+    def cli(self, output):
+        ret_dict = {}
+        for line in output.splitlines():
+            line = line.strip()
+
+            # GigabitEthernet1 is up
+            p1 = re.compile(r'^(?P<intf>\S+) is (?P<status>\S+)$')
+            # MTU 1500 bytes
+            p2 = re.compile(r'^MTU (?P<mtu>\d+) bytes$')
+
+            m = p1.match(line)
+            if m:
+                intf = ret_dict.setdefault(m.groupdict()['intf'], {})
+                intf['status'] = m.groupdict()['status']
+                continue
+
+            m = p2.match(line)
+            if m:
+                intf['mtu'] = int(m.groupdict()['mtu'])
+                continue
+        return ret_dict
+
+
+class TestPatternStats(unittest.TestCase):
+
+    def test_instrument(self):
+        expected = ShowFake().cli(OUTPUT)
+        with instrument() as stats:
+            self.assertEqual(ShowFake().cli(OUTPUT), expected)
+            # Only the patterns of parsers are instrumented
+            self.assertNotIsInstance(re.compile('a'), InstrumentedPattern)
+        self.assertIs(re.compile('a').__class__, re.Pattern)
+
+        report = stats.report()
+        name = '{m}.ShowFake'.format(m=__name__.replace('genie.libs.parser.', ''))
+        self.assertEqual(list(report), [name])
+        self.assertEqual(report[name]['lines'], 4)
+        self.assertEqual(report[name]['unmatched_lines'], 1)
+        self.assertEqual(report[name]['unmatched_samples'], ['unknown line'])
+
+        patterns = report[name]['patterns']
+        self.assertEqual(list(patterns), ['p1', 'p2'])
+        self.assertEqual(patterns['p1']['attempts'], 4)
+        self.assertEqual(patterns['p1']['matches'], 2)
+        self.assertEqual(patterns['p2']['attempts'], 2)
+        self.assertEqual(patterns['p2']['matches'], 1)
+        self.assertEqual(patterns['p2']['pattern'], r'^MTU (?P<mtu>\d+) bytes$')
+
+    def test_accumulate(self):
+        stats = PatternStats()
+        for _ in range(3):
+            with instrument(stats):
+                ShowFake().cli(OUTPUT)
+        report = stats.report()
+        entry = next(iter(report.values()))
+        self.assertEqual(entry['lines'], 12)
+        self.assertEqual(entry['patterns']['p1']['attempts'], 12)
+
+    def test_enabled_once(self):
+        with instrument():
+            with self.assertRaises(Exception):
+                PatternStats().enable()
+
+    def test_save(self):
+        folder = tempfile.mkdtemp()
+        try:
+            with instrument() as stats:
+                ShowFake().cli(OUTPUT)
+
+            stats.save(os.path.join(folder, 'stats.json'))
+            with open(os.path.join(folder, 'stats.json')) as f:
+                self.assertEqual(json.load(f), stats.report())
+
+            stats.save(os.path.join(folder, 'stats.folded'))
+            with open(os.path.join(folder, 'stats.folded')) as f:
+                lines = f.read().splitlines()
+            self.assertEqual(len(lines), 2)
+            self.assertTrue(lines[0].endswith('.ShowFake;p1 ' +
+                                              lines[0].split()[-1]))
+        finally:
+            shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    unittest.main()
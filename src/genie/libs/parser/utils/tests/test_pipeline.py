@@ -0,0 +1,129 @@
+import os
+import time
+import unittest
+import importlib
+from unittest.mock import patch
+
+from genie.libs.parser.iosxe.show_platform import ShowVersion, ShowInventory
+from genie.libs.parser.utils.normalize import normalize as normalize_output
+from genie.libs.parser.utils.pipeline import ParserPipeline
+from genie.libs.parser.utils.replay import ReplayDevice, ReplayFailure
+
+IOSXE_TESTS = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))), 'iosxe', 'tests')
+
+
+def read_expected(cls, name):
+    path = os.path.join(IOSXE_TESTS, cls.__name__, 'cli', 'equal',
+                        name + '_expected.py')
+    expected = importlib.machinery.SourceFileLoader('expected',
+                                                    path).load_module()
+    return expected.expected_output
+
+
+class SlowParser(object):
+    '''Parser taking a fixed amount of time, without holding the GIL'''
+
+    parse_time = 0
+
+    def __init__(self, device):
+        self.device = device
+
+    def parse(self, output=None, **kwargs):
+        time.sleep(self.parse_time)
+        return {'output': output, 'kwargs': kwargs}
+
+
+class TestParserPipeline(unittest.TestCase):
+
+    parsers = {'show version': (ShowVersion, {}),
+               'show inventory': (ShowInventory, {})}
+
+    def get_parser(self, command, device):
+        return self.parsers[command]
+
+    def test_results_in_order(self):
+        version_expected = read_expected(ShowVersion, 'golden_output_1')
+        inventory_expected = read_expected(ShowInventory, 'golden_output_1')
+        device = ReplayDevice(os='iosxe', latency=0.01)
+
+        commands = [('show version', {}), ('show inventory', {})] * 3
+        with patch('genie.libs.parser.utils.pipeline.get_parser',
+                   side_effect=self.get_parser), \
+             patch('genie.libs.parser.utils.replay.get_parser',
+                   side_effect=self.get_parser):
+            results = ParserPipeline(device, max_workers=2).parse(commands)
+
+        self.assertEqual([r.command for r in results],
+                         [c for c, _ in commands])
+        self.assertEqual(device.executed, [c for c, _ in commands])
+        for result in results:
+            self.assertIsNone(result.exception)
+            if result.command == 'show version':
+                self.assertEqual(result.parsed, version_expected)
+            else:
+                self.assertEqual(result.parsed, inventory_expected)
+
+    def test_kwargs_merged(self):
+        device = ReplayDevice(os='iosxe',
+                              outputs={'show ip route vrf VRF1': 'output'})
+
+        with patch('genie.libs.parser.utils.pipeline.get_parser',
+                   return_value=(SlowParser, {'vrf': 'VRF1'})):
+            result, = ParserPipeline(device).parse(
+                [('show ip route vrf VRF1', {'route': '10.4.1.1'})])
+
+        self.assertEqual(result.parsed,
+                         {'output': 'output',
+                          'kwargs': {'vrf': 'VRF1', 'route': '10.4.1.1'}})
+
+    def test_normalize_once(self):
+        device = ReplayDevice(os='iosxe', outputs={'show version': 'a\r\n'})
+
+        with patch('genie.libs.parser.utils.pipeline.get_parser',
+                   return_value=(SlowParser, {})), \
+             patch('genie.libs.parser.utils.pipeline.normalize_output',
+                   wraps=normalize_output) as normalize:
+            result, = ParserPipeline(device).parse([('show version', {})])
+
+        # The replay device hands the raw output, the pipeline normalizes it
+        normalize.assert_called_once_with('a\r\n')
+        self.assertEqual(result.parsed['output'], 'a\n')
+
+    def test_execute_failure(self):
+        device = ReplayDevice(os='iosxe',
+                              outputs={'show version': 'output',
+                                       'show inventory': 'output'},
+                              failures={'show inventory': 1})
+
+        with patch('genie.libs.parser.utils.pipeline.get_parser',
+                   return_value=(SlowParser, {})):
+            failed, found = ParserPipeline(device).parse(
+                [('show inventory', {}), ('show version', {})])
+
+        self.assertIsInstance(failed.exception, ReplayFailure)
+        self.assertIsNone(failed.parsed)
+        self.assertIsNone(found.exception)
+
+    def test_wall_clock(self):
+        latency, parse_time, count = 0.05, 0.05, 6
+        SlowParser.parse_time = parse_time
+        device = ReplayDevice(os='iosxe', outputs={'show version': 'output'},
+                              latency=latency)
+
+        with patch('genie.libs.parser.utils.pipeline.get_parser',
+                   return_value=(SlowParser, {})):
+            start = time.perf_counter()
+            results = ParserPipeline(device).parse(
+                [('show version', {})] * count)
+            elapsed = time.perf_counter() - start
+
+        SlowParser.parse_time = 0
+        self.assertEqual(len(results), count)
+        # Serial execution takes count * (latency + parse_time), the pipeline
+        # only pays for a single parse on top of the device latency
+        self.assertLess(elapsed, count * (latency + parse_time) * 0.75)
+
+
+if __name__ == '__main__':
+    unittest.main()
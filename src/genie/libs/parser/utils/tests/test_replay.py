@@ -0,0 +1,142 @@
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.iosxe.show_rip import ShowIpv6RipDatabase
+from genie.libs.parser.iosxe.show_platform import ShowVersion
+from genie.libs.parser.utils.lazy_import import parser_modules
+from genie.libs.parser.utils.normalize import normalize as normalize_output
+from genie.libs.parser.utils.replay import ReplayDevice, ReplayFailure, \
+                                           find_golden_outputs
+
+
+def expected_output(output_file):
+    expected = {}
+    with open(output_file[:-len('_output.txt')] + '_expected.py') as f:
+        exec(f.read(), expected)
+    return expected['expected_output']
+
+
+class OutputParser(object):
+
+    def __init__(self, device):
+        self.device = device
+
+    def parse(self, output=None, **kwargs):
+        return output
+
+
+class TestReplayDevice(unittest.TestCase):
+
+    def test_device_attributes(self):
+        device = ReplayDevice(os='iosxe', platform='c9300')
+        self.assertEqual(device.os, 'iosxe')
+        self.assertEqual(device.platform, 'c9300')
+        self.assertEqual(device.custom['abstraction']['order'],
+                         ['os', 'platform'])
+
+    def test_find_golden_outputs(self):
+        goldens = find_golden_outputs(ShowVersion)
+        names = [os.path.basename(f) for f, _ in goldens]
+        self.assertEqual(names[:2], ['golden_output_1_output.txt',
+                                     'golden_output_2_output.txt'])
+
+    def test_execute_golden_output(self):
+        device = ReplayDevice(os='iosxe')
+        with patch('genie.libs.parser.utils.replay.get_parser',
+                   return_value=(ShowVersion, {})):
+            output = device.execute('show version')
+
+        with open(find_golden_outputs(ShowVersion)[0][0]) as f:
+            self.assertEqual(output, f.read())
+        self.assertEqual(device.executed, ['show version'])
+
+    def test_execute_matching_arguments(self):
+        device = ReplayDevice(os='iosxe')
+        goldens = dict((os.path.basename(f), f)
+                       for f, _ in find_golden_outputs(ShowIpv6RipDatabase))
+
+        with patch('genie.libs.parser.utils.replay.get_parser',
+                   return_value=(ShowIpv6RipDatabase, {'vrf': 'VRF1'})):
+            output = device.execute('show ipv6 rip vrf VRF1 database')
+        with open(goldens['golden_output_2_output.txt']) as f:
+            self.assertEqual(output, f.read())
+
+        with patch('genie.libs.parser.utils.replay.get_parser',
+                   return_value=(ShowIpv6RipDatabase, {})):
+            output = device.execute('show ipv6 rip database')
+        with open(goldens['golden_output_output.txt']) as f:
+            self.assertEqual(output, f.read())
+
+    def test_latency(self):
+        device = ReplayDevice(os='iosxe', outputs={'show clock': 'clock',
+                                                   'show tech': 'tech'},
+                              latency=(0.01, 0.02),
+                              latencies={'show tech': 0.1})
+        self.assertTrue(0.01 <= device.latency_of('show clock') <= 0.02)
+        self.assertEqual(device.latency_of('show tech'), 0.1)
+
+        start = time.perf_counter()
+        device.execute('show tech')
+        self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+
+    def test_failure_injection(self):
+        device = ReplayDevice(os='iosxe', outputs={'show clock': 'clock'},
+                              failure_rate=0.5, seed=1)
+        failures = 0
+        for _ in range(200):
+            try:
+                device.execute('show clock')
+            except ReplayFailure:
+                failures += 1
+        self.assertTrue(50 < failures < 150)
+        self.assertEqual(len(device.executed), 200 - failures)
+
+    def test_parse(self):
+        device = ReplayDevice(os='iosxe')
+        with patch('genie.libs.parser.utils.replay.get_parser',
+                   return_value=(ShowVersion, {})):
+            parsed = device.parse('show version')
+        self.assertIn('version', parsed)
+
+    def test_normalize(self):
+        device = ReplayDevice(os='iosxe', outputs={'show clock': 'clock\r\n'})
+        # Consumers of execute() normalize the raw output themselves
+        self.assertEqual(device.execute('show clock'), 'clock\r\n')
+
+        with patch('genie.libs.parser.utils.replay.get_parser',
+                   return_value=(OutputParser, {})), \
+             patch('genie.libs.parser.utils.replay.normalize_output',
+                   wraps=normalize_output) as normalize:
+            self.assertEqual(device.parse('show clock'), 'clock\n')
+            self.assertEqual(device.parse('show clock', output='time\r\n'),
+                             'time\n')
+            self.assertEqual(normalize.call_count, 2)
+
+            device.normalize = False
+            self.assertEqual(device.parse('show clock'), 'clock\r\n')
+
+
+@unittest.skipUnless(parser_modules('genie.libs.parser.iosxe').get('ShowVersion'),
+                     'parsers.json is missing')
+class TestReplayParsers(unittest.TestCase):
+    '''Commands resolved to their parser through parsers.json'''
+
+    def test_parse_golden_output(self):
+        device = ReplayDevice(os='iosxe')
+        goldens = dict((os.path.basename(f), f)
+                       for f, _ in find_golden_outputs(ShowIpv6RipDatabase))
+
+        self.assertEqual(
+            device.parse('show ipv6 rip vrf VRF1 database'),
+            expected_output(goldens['golden_output_2_output.txt']))
+        self.assertEqual(
+            device.parse('show ipv6 rip database'),
+            expected_output(goldens['golden_output_output.txt']))
+        self.assertEqual(device.executed, ['show ipv6 rip vrf VRF1 database',
+                                           'show ipv6 rip database'])
+
+
+if __name__ == '__main__':
+    unittest.main()
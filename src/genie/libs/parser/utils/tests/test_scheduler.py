@@ -0,0 +1,183 @@
+import time
+import unittest
+import threading
+from queue import Queue
+from unittest.mock import patch
+
+from genie.libs.parser.utils.replay import ReplayDevice
+from genie.libs.parser.utils.scheduler import PollingScheduler
+
+
+class ExecuteParser(object):
+    '''Parser executing its command on the device and tracking concurrency'''
+
+    lock = threading.Lock()
+    running = {}
+    peak = {}
+
+    def __init__(self, device):
+        self.device = device
+
+    def parse(self, command=None, **kwargs):
+        with self.lock:
+            name = self.device.name
+            self.running[name] = self.running.get(name, 0) + 1
+            self.peak[name] = max(self.peak.get(name, 0), self.running[name])
+        try:
+            return {'output': self.device.execute(command)}
+        finally:
+            with self.lock:
+                self.running[name] -= 1
+
+
+def get_parser(command, device):
+    return ExecuteParser, {'command': command}
+
+
+class TestPollingScheduler(unittest.TestCase):
+
+    def setUp(self):
+        ExecuteParser.running = {}
+        ExecuteParser.peak = {}
+        patcher = patch('genie.libs.parser.utils.scheduler.get_parser',
+                        side_effect=get_parser)
+        self.get_parser = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def device(self, name, **kwargs):
+        return ReplayDevice(os='iosxe', name=name,
+                            outputs={'show tech': 'tech',
+                                     'show interfaces': 'interfaces',
+                                     'show inventory': 'inventory'},
+                            **kwargs)
+
+    def test_no_head_of_line_blocking(self):
+        slow = self.device('slow', latencies={'show tech': 0.5})
+        fast = self.device('fast', latency=0.01)
+        results = Queue()
+
+        scheduler = PollingScheduler(max_workers=4, queue=results)
+        tech = scheduler.add_job(slow, 'show tech', interval=10)
+        counters = scheduler.add_job(fast, 'show interfaces', interval=0.05)
+        scheduler.start()
+        time.sleep(0.4)
+        tech_runs, counters_runs = tech.runs, counters.runs
+        scheduler.stop()
+
+        # The fast device kept being polled while show tech was running
+        self.assertEqual(tech_runs, 0)
+        self.assertGreaterEqual(counters_runs, 4)
+        while not results.empty():
+            result = results.get()
+            self.assertIsNone(result.exception)
+            self.assertEqual(result.parsed,
+                             {'output': result.job.command.split()[-1]})
+
+    def test_per_device_limit(self):
+        device = self.device('dev', latency=0.05)
+
+        scheduler = PollingScheduler(max_workers=8, max_per_device=2)
+        for _ in range(6):
+            scheduler.add_job(device, 'show interfaces', interval=0.01)
+        scheduler.run(0.3)
+
+        self.assertEqual(ExecuteParser.peak['dev'], 2)
+
+    def test_device_limits(self):
+        device = self.device('dev', latency=0.05)
+
+        scheduler = PollingScheduler(max_workers=8, max_per_device=1,
+                                     device_limits={'dev': 3})
+        for _ in range(6):
+            scheduler.add_job(device, 'show interfaces', interval=0.01)
+        scheduler.run(0.3)
+
+        self.assertEqual(ExecuteParser.peak['dev'], 3)
+
+    def test_same_name(self):
+        # Devices sharing a name each get their own cap, the default name of
+        # every ReplayDevice is 'replay'
+        first = self.device('replay', latency=0.05)
+        second = self.device('replay', latency=0.05)
+
+        scheduler = PollingScheduler(max_workers=8, max_per_device=1)
+        for device in (first, second):
+            for _ in range(3):
+                scheduler.add_job(device, 'show interfaces', interval=0.01)
+        scheduler.run(0.3)
+
+        self.assertEqual(ExecuteParser.peak['replay'], 2)
+        self.assertEqual(scheduler._running_per_device, {})
+        self.assertEqual(self.get_parser.call_count, 2)
+
+    def test_priority(self):
+        device = self.device('dev')
+        order = []
+
+        scheduler = PollingScheduler(max_workers=1,
+                                     callback=lambda r: order.append(
+                                         r.job.command))
+        scheduler.add_job(device, 'show inventory', interval=10, priority=10)
+        scheduler.add_job(device, 'show interfaces', interval=10, priority=0)
+        scheduler.run(0.2)
+
+        self.assertEqual(order, ['show interfaces', 'show inventory'])
+
+    def test_parser_resolved_once(self):
+        device = self.device('dev')
+
+        scheduler = PollingScheduler()
+        job = scheduler.add_job(device, 'show interfaces', interval=0.02)
+        scheduler.run(0.2)
+
+        self.assertGreater(job.runs, 1)
+        self.assertEqual(self.get_parser.call_count, 1)
+
+    def test_failures_reported(self):
+        device = self.device('dev', failures={'show tech': 1})
+        results = Queue()
+
+        scheduler = PollingScheduler(queue=results)
+        scheduler.add_job(device, 'show tech', interval=10)
+        scheduler.run(0.1)
+
+        result = results.get(timeout=1)
+        self.assertIsNone(result.parsed)
+        self.assertIsNotNone(result.exception)
+
+    def test_remove_job(self):
+        device = self.device('dev')
+
+        scheduler = PollingScheduler()
+        job = scheduler.add_job(device, 'show interfaces', interval=0.01,
+                                delay=0.1)
+        scheduler.remove_job(job)
+        scheduler.run(0.2)
+
+        self.assertEqual(job.runs, 0)
+
+    def test_jitter_no_drift(self):
+        device = self.device('dev')
+        scheduler = PollingScheduler(seed=1)
+        with patch('genie.libs.parser.utils.scheduler.time.monotonic',
+                   return_value=0):
+            job = scheduler.add_job(device, 'show interfaces', interval=10,
+                                    jitter=2)
+            # The first run is jittered too
+            self.assertGreater(job.next_run, 0)
+            self.assertLessEqual(job.next_run, 2)
+
+            key = id(device)
+            for _ in range(100):
+                scheduler._running = 1
+                scheduler._running_per_device[key] = 1
+                scheduler._run(job)
+
+        self.assertEqual(job.runs, 100)
+        self.assertEqual(job.base, 1000)
+        self.assertGreaterEqual(job.next_run, 1000)
+        self.assertLessEqual(job.next_run, 1002)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from genie.libs.parser.utils.common import select_command
+
+
+class TestSelectCommand(unittest.TestCase):
+
+    def test_select_command(self):
+        templates = ['show ip route {route} vrf {vrf}',
+                     'show ip route vrf {vrf}',
+                     'show ip route vrf all',
+                     'show ip route']
+        self.assertEqual(select_command(templates, route=None, vrf=None),
+                         'show ip route vrf all')
+        self.assertEqual(select_command(templates, route='', vrf='VRF1'),
+                         'show ip route vrf VRF1')
+        self.assertEqual(select_command(templates, route='10.4.1.1',
+                                        vrf='VRF1'),
+                         'show ip route 10.4.1.1 vrf VRF1')
+        self.assertEqual(select_command('show bgp vrf {vrf}', vrf='all'),
+                         'show bgp vrf all')
+        with self.assertRaises(Exception):
+            select_command(templates, route='10.4.1.1')
+
+
+if __name__ == '__main__':
+    unittest.main()
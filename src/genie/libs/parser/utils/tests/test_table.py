@@ -0,0 +1,137 @@
+import unittest
+
+from genie.libs.parser.utils.table import Table
+
+SWITCHES = '''\
+Switch Ports Model              SW Version        SW Image              Mode   
+------ ----- -----              ----------        ----------            ----   
+*    1 32    WS-C3850-24P       16.4.2            CAT3K_CAA-UNIVERSALK9 BUNDLE
+     2 32    WS-C3850-24P       16.4.2            CAT3K_CAA-UNIVERSALK9 BUNDLE
+
+Configuration register is 0x102
+'''
+
+ARP = '''\
+PE1#show arp
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
+Internet  10.169.197.94          -   fa16.3eff.aae1  ARPA   GigabitEthernet2
+Internet  10.169.197.97         18   fa16.3eff.45a8  ARPA   GigabitEthernet4.100-sub-interface
+'''
+
+USERS = '''\
+Interface    User               Mode         Idle     Peer Address
+unknown      NETCONF(ONEP)      com.cisco.ne 00:00:49
+unknown      a(ONEP)            com.cisco.sy 00:00:49
+Gi0/0        admin              exec         00:01:02 10.1.1.1
+'''
+
+INTERFACES = '''\
+Port      Name               Status       Vlan       Duplex  Speed Type
+--------- ------------------ ------------ ---------- ------ ------ ----
+Gi1/0/1   uplink to core     connected    trunk        full   1000 10/100/1000BaseTX
+          switch, rack 4
+Gi1/0/2                      notconnect   1            auto   auto 10/100/1000BaseTX
+Port      Name               Status       Vlan       Duplex  Speed Type
+--------- ------------------ ------------ ---------- ------ ------ ----
+Gi1/0/3   printer            connected    10           full    100 10/100/1000BaseTX
+'''
+
+
+class TestTable(unittest.TestCase):
+
+    def test_right_justified(self):
+        table = Table(right_justified=True,
+                      header_fields=['Switch', 'Ports', 'Model             ',
+                                     'SW Version       ',
+                                     'SW Image              ', 'Mode   '],
+                      label_fields=['switch_num', 'ports', 'model', 'sw_ver',
+                                    'sw_image', 'mode'],
+                      table_terminal_pattern=r'^\s*$')
+        self.assertEqual(table.columns(SWITCHES.splitlines()[0]),
+                         [(0, 6), (6, 12), (12, 31), (31, 49), (49, 72),
+                          (72, None)])
+        entries = table.entries(SWITCHES)
+        self.assertEqual(list(entries), ['*    1', '2'])
+        self.assertEqual(entries['2'], {'switch_num': '2',
+                                        'ports': '32',
+                                        'model': 'WS-C3850-24P',
+                                        'sw_ver': '16.4.2',
+                                        'sw_image': 'CAT3K_CAA-UNIVERSALK9',
+                                        'mode': 'BUNDLE'})
+
+    def test_left_justified(self):
+        table = Table(header_fields=['Protocol', 'Address', r'Age \(min\)',
+                                     'Hardware Addr', 'Type', 'Interface'],
+                      label_fields=['protocol', 'address', 'age', 'mac',
+                                    'type', 'interface'],
+                      index=[1])
+        rows = list(table.rows(ARP))
+        self.assertEqual(len(rows), 3)
+        # Values printed one character left of their header
+        self.assertEqual(rows[0], {'protocol': 'Internet',
+                                   'address': '10.169.197.93',
+                                   'age': '-',
+                                   'mac': 'fa16.3eff.b7ad',
+                                   'type': 'ARPA',
+                                   'interface': ''})
+        self.assertEqual(rows[2]['age'], '18')
+        self.assertEqual(rows[2]['interface'],
+                         'GigabitEthernet4.100-sub-interface')
+
+    def test_overflow(self):
+        table = Table(header_fields=['Interface', 'User', 'Mode', 'Idle',
+                                     'Peer Address'],
+                      index=[0, 1])
+        output = USERS + \
+            'Tunnel100    a-very-long-user-name exec     00:01:02 10.2.2.2\n'
+        entries = table.entries(output)
+        self.assertEqual(sorted(entries), ['Gi0/0', 'Tunnel100', 'unknown'])
+        self.assertEqual(sorted(entries['unknown']),
+                         ['NETCONF(ONEP)', 'a(ONEP)'])
+        self.assertEqual(entries['unknown']['a(ONEP)'],
+                         {'Interface': 'unknown',
+                          'User': 'a(ONEP)',
+                          'Mode': 'com.cisco.sy',
+                          'Idle': '00:00:49',
+                          'Peer Address': ''})
+        row = entries['Tunnel100']['a-very-long-user-name']
+        self.assertEqual(row['Mode'], 'exec')
+        self.assertEqual(row['Peer Address'], '10.2.2.2')
+
+    def test_wrapped(self):
+        table = Table(header_fields=['Port', 'Name', 'Status', 'Vlan',
+                                     'Duplex', 'Speed', 'Type'],
+                      label_fields=['port', 'name', 'status', 'vlan',
+                                    'duplex', 'speed', 'type'],
+                      wrapped=True)
+        entries = table.entries(INTERFACES)
+        self.assertEqual(list(entries), ['Gi1/0/1', 'Gi1/0/2', 'Gi1/0/3'])
+        self.assertEqual(entries['Gi1/0/1']['name'],
+                         'uplink to core switch, rack 4')
+        self.assertEqual(entries['Gi1/0/2']['name'], '')
+        self.assertEqual(entries['Gi1/0/3']['speed'], '100')
+
+        # Without wrapped, the continuation line is dropped
+        table.wrapped = False
+        self.assertEqual(table.entries(INTERFACES)['Gi1/0/1']['name'],
+                         'uplink to core')
+
+    def test_terminal_and_skip(self):
+        table = Table(header_fields=['Port', 'Name', 'Status'],
+                      table_terminal_pattern=r'printer', skip_line=r'^Gi1/0/2')
+        self.assertEqual(list(table.entries(INTERFACES)), ['Gi1/0/1'])
+
+    def test_no_table(self):
+        table = Table(header_fields=['App id', 'State'])
+        self.assertEqual(table.entries(''), {})
+        self.assertEqual(table.entries(USERS), {})
+        self.assertEqual(table.entries('App id    State\n'), {})
+
+    def test_labels(self):
+        with self.assertRaises(Exception):
+            Table(header_fields=['App id', 'State'], label_fields=['app_id'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import io
+import unittest
+
+from genie.libs.parser.utils.xml_stream import XmlStream, chunks, local_name
+
+OUTPUT = '''\
+<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0" xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp">
+ <nf:data>
+  <show>
+   <bgp>
+    <vrf>
+     <__XML__PARAM__vrf-name>
+      <__XML__value>all</__XML__value>
+      <all>
+       <summary>
+        <__readonly__>
+         <TABLE_vrf>
+          <ROW_vrf>
+           <vrf-name-out>default</vrf-name-out>
+           <TABLE_saf>
+            <ROW_saf>
+             <af-name>IPv4 Unicast</af-name>
+             <TABLE_neighbor>
+              <ROW_neighbor>
+               <neighborid>10.51.1.101</neighborid>
+              </ROW_neighbor>
+              <ROW_neighbor>
+               <neighborid>192.168.4.1</neighborid>
+              </ROW_neighbor>
+             </TABLE_neighbor>
+            </ROW_saf>
+           </TABLE_saf>
+          </ROW_vrf>
+          <ROW_vrf>
+           <vrf-name-out>VRF1</vrf-name-out>
+          </ROW_vrf>
+         </TABLE_vrf>
+        </__readonly__>
+       </summary>
+      </all>
+     </__XML__PARAM__vrf-name>
+    </vrf>
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>
+N95_1#'''
+
+
+class TestXmlStream(unittest.TestCase):
+
+    def test_local_name(self):
+        self.assertEqual(local_name('{http://www.cisco.com/nxos:bgp}vrf'),
+                         'vrf')
+        self.assertEqual(local_name('vrf'), 'vrf')
+
+    def test_command(self):
+        stream = XmlStream(OUTPUT)
+        self.assertEqual(stream.command, 'show bgp vrf all all summary')
+        self.assertEqual(stream.namespace,
+                         '{http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}')
+        stream.check_command('show bgp vrf all all summary')
+        with self.assertRaises(AssertionError):
+            stream.check_command('show bgp vrf default all summary')
+
+    def test_rows(self):
+        stream = XmlStream(OUTPUT, chunk_size=64)
+        stream.check_command('show bgp vrf all all summary')
+
+        rows = []
+        for row in stream.rows('neighbor', 'vrf'):
+            if row.tag == 'ROW_neighbor':
+                rows.append((stream.parent('ROW_vrf').findtext('vrf-name-out'),
+                             stream.parent('ROW_saf').findtext('af-name'),
+                             row.findtext('neighborid')))
+            else:
+                # Neighbors are cleared once read
+                self.assertEqual(row.findall('.//ROW_neighbor'), [])
+                rows.append(row.findtext('vrf-name-out'))
+
+        self.assertEqual(rows, [('default', 'IPv4 Unicast', '10.51.1.101'),
+                                ('default', 'IPv4 Unicast', '192.168.4.1'),
+                                'default', 'VRF1'])
+
+    def test_iter(self):
+        with io.StringIO(OUTPUT) as f:
+            tags = [(elem.tag, elem.text) for elem in XmlStream(f).iter()
+                    if not len(elem) and elem.text.strip()]
+
+        self.assertEqual(tags, [('__XML__value', 'all'),
+                                ('vrf-name-out', 'default'),
+                                ('af-name', 'IPv4 Unicast'),
+                                ('neighborid', '10.51.1.101'),
+                                ('neighborid', '192.168.4.1'),
+                                ('vrf-name-out', 'VRF1')])
+
+    def test_chunks_file(self):
+        output = 'N95_1# show bgp vrf all all summary | xml\n' + OUTPUT
+        document = ''.join(chunks(output))
+        self.assertTrue(document.startswith('<?xml'))
+        self.assertTrue(document.endswith('</nf:rpc-reply>'))
+        # The same document, the marker split across the reads or not
+        for chunk_size in (1, 2, 5, 7, 64, 100000):
+            with io.StringIO(output) as f:
+                self.assertEqual(''.join(chunks(f, chunk_size)), document)
+        with io.StringIO('<a><b>1</b></a>]]>]]>') as f:
+            self.assertEqual(''.join(chunks(f, chunk_size=18)),
+                             '<a><b>1</b></a>')
+
+    def test_chunks_end_tag(self):
+        output = '<rpc-reply><a>1</a></rpc-reply>\n\nuser@r1> '
+        self.assertEqual(''.join(chunks(output, end_tag='</rpc-reply>')),
+                         output[:output.find('\n')])
+        for chunk_size in (1, 3, 11, 100):
+            with io.StringIO(output) as f:
+                self.assertEqual(''.join(chunks(f, chunk_size,
+                                                end_tag='</rpc-reply>')),
+                                 output[:output.find('\n')])
+
+    def test_no_command(self):
+        reply = ('<rpc-reply><data><bgp><neighbors>'
+                 '<neighbor><address>10.1.1.1</address></neighbor>'
+                 '<neighbor><address>10.1.1.2</address></neighbor>'
+                 '</neighbors></bgp></data></rpc-reply>')
+        stream = XmlStream(reply, read_command=False)
+        self.assertEqual([elem.findtext('address')
+                          for elem in stream.iter('neighbor')],
+                         ['10.1.1.1', '10.1.1.2'])
+        self.assertEqual(stream.command, '')
+        # The tags are not kept to compose a command
+        self.assertEqual(stream._words, [])
+
+    def test_empty(self):
+        stream = XmlStream('')
+        self.assertEqual(stream.command, '')
+        self.assertEqual(stream.namespace, '')
+        self.assertEqual(list(stream.rows('vrf')), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,277 @@
+'''Streaming reader of NX-OS ``| xml`` outputs
+
+``ET.fromstring`` builds the whole tree of an output before the parser reads
+the first value, and the parser then strips the namespace of every tag it
+visits. `XmlStream` feeds the output to an incremental parser instead:
+
+* tags are replaced by their namespace-free name when the element starts,
+  and the name of each distinct tag is only computed once
+* elements are handed to the parser when they end, then cleared and
+  detached from their parent, so only the open branch of the tree is kept
+* ``TABLE_<name>`` / ``ROW_<name>`` pairs are read with `XmlStream.rows`
+
+Example:
+
+    >>> stream = XmlStream(output)
+    >>> stream.check_command('show bgp vrf all all summary')
+    >>> for row in stream.rows('saf'):
+    ...     vrf = stream.parent('ROW_vrf').findtext('vrf-name-out')
+    ...     af = row.findtext('af-name')
+
+    >>> # every element, in document order
+    >>> for elem in XmlStream(output).iter():
+    ...     if elem.tag == 'processid':
+    ...         pid = int(elem.text)
+'''
+
+# python
+import warnings
+import xml.etree.ElementTree as ET
+
+# Namespace-free name of the tags seen so far, shared by all streams
+_LOCAL_NAMES = {}
+
+
+def local_name(tag):
+    '''Return the tag without its namespace
+
+    Args:
+        tag (`str`): tag, for example '{http://www.cisco.com/nxos:bgp}vrf'
+
+    Returns:
+        tag without namespace, for example 'vrf'
+    '''
+    try:
+        return _LOCAL_NAMES[tag]
+    except KeyError:
+        name = _LOCAL_NAMES[tag] = tag[tag.find('}') + 1:]
+        return name
+
+
+# Marker following the document in an NX-OS output
+_MARKER = ']]>]]>'
+
+
+def chunks(output, chunk_size=65536, end_tag=None):
+    '''Split an xml output in the pieces fed to an incremental parser
+
+    The junk characters returned by the device before the document, and the
+    prompt following it, are skipped. A str output is not copied.
+
+    Args:
+        output (`str`): device output, or a file object opened in text mode
+        chunk_size (`int`): number of characters of each piece
+        end_tag (`str`): closing tag of the document, such as '</rpc-reply>'.
+                         By default, or when it is missing, the document ends
+                         at the last '>' before the ']]>]]>' marker of NX-OS
+
+    Yields:
+        pieces of the document (`str`)
+    '''
+    if not isinstance(output, str):
+        yield from _file_chunks(output, chunk_size, end_tag)
+        return
+
+    end = output.rfind(end_tag) if end_tag else -1
+    if end >= 0:
+        end += len(end_tag)
+    else:
+        end = output.find(_MARKER)
+        end = output.rfind('>', 0, len(output) if end < 0 else end) + 1
+    for start in range(max(output.find('<'), 0), end, chunk_size):
+        yield output[start:min(start + chunk_size, end)]
+
+
+def _file_chunks(output, chunk_size, end_tag):
+    '''chunks() of a file object, read chunk_size characters at a time
+
+    The characters following the last '>' read, and the ones which may start
+    the end tag or the marker, are kept until the next read.
+    '''
+    stops = [end_tag, _MARKER] if end_tag else [_MARKER]
+    keep = max(len(stop) for stop in stops) - 1
+    buffer = ''
+    started = False
+    for chunk in iter(lambda: output.read(chunk_size), ''):
+        buffer += chunk
+        if not started:
+            start = buffer.find('<')
+            if start < 0:
+                buffer = ''
+                continue
+            buffer = buffer[start:]
+            started = True
+
+        if end_tag and end_tag in buffer:
+            yield buffer[:buffer.find(end_tag) + len(end_tag)]
+            return
+        if _MARKER in buffer:
+            yield buffer[:buffer.rfind('>', 0, buffer.find(_MARKER)) + 1]
+            return
+
+        cut = buffer.rfind('>', 0, len(buffer) - keep) + 1
+        if cut > 0:
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+
+    # No end tag nor marker: the document ends at the last '>'
+    yield buffer[:buffer.rfind('>') + 1]
+
+
+class XmlStream(object):
+    '''Incremental reader of an NX-OS ``| xml`` output
+
+    Args:
+        output (`str`): device output, or a file object opened in text mode
+        chunk_size (`int`): number of characters fed to the parser at a time
+        read_command (`bool`): compose the command from the tags preceding
+                               __readonly__. Disable it for the xml outputs
+                               which are not NX-OS command outputs, such as
+                               the rpc-reply of a netconf get
+
+    Attributes:
+        namespace (`str`): namespace of the command, for example
+                           '{http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}',
+                           empty until the command is read
+    '''
+
+    def __init__(self, output, chunk_size=65536, read_command=True):
+        self.namespace = ''
+        self.chunk_size = chunk_size
+        self._output = output
+        self._stack = []
+        self._words = []
+        self._command = None if read_command else ''
+        self._names = None
+        self._open = 0
+        self._events = self._read()
+
+    def _read(self):
+        '''Yield the elements as they end, keeping track of the open branch
+        and of the command
+
+        None is yielded once, when the command is known.
+        '''
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        stack = self._stack
+        empty = True
+
+        for chunk in chunks(self._output, self.chunk_size):
+            empty = empty and not chunk.strip()
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if event == 'start':
+                    stack.append(elem)
+                    if len(stack) == 3 and elem.tag.startswith('{'):
+                        # namespace of the command, below <nf:data>
+                        self.namespace = elem.tag[:elem.tag.find('}') + 1]
+                    tag = elem.tag = local_name(elem.tag)
+                    if self._names is not None and tag in self._names:
+                        self._open += 1
+                    if self._command is None:
+                        self._compose(tag)
+                        if self._command is not None:
+                            yield None
+                    continue
+
+                stack.pop()
+                if self._command is None and elem.tag == '__XML__value':
+                    self._words.append(elem.text or '')
+
+                names = self._names
+                if names is None:
+                    yield elem
+                elif elem.tag in names:
+                    self._open -= 1
+                    yield elem
+                elif self._open or not len(elem):
+                    # Part of a row which is still open, or a value of its
+                    # parent which may still be looked up with parent()
+                    continue
+
+                # Nothing refers to elem anymore
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+        if not empty:
+            parser.close()
+
+        if self._command is None:
+            self._command = ' '.join(self._words)
+
+    def _compose(self, tag):
+        '''Build the command from the tags preceding __readonly__
+
+            <nf:rpc-reply>
+             <nf:data>
+              <show>
+               <bgp>
+                <vrf>
+                 <__XML__PARAM__vrf-name>
+                  <__XML__value>VRF1</__XML__value>
+                 ...
+                   <__readonly__>
+        '''
+        if tag == '__readonly__':
+            self._command = ' '.join(self._words)
+        elif tag.startswith('TABLE_'):
+            # if there is no __readonly__ but the command has outputs
+            warnings.warn('Tag "__readonly__" should exsist in output when '
+                          'there are actual values in output')
+            self._command = ' '.join(self._words)
+        elif len(self._stack) > 2 and not tag.startswith('__XML__'):
+            self._words.append(tag)
+
+    @property
+    def command(self):
+        '''Command composed from the xml tags, for example
+        'show bgp vrf all all summary'. Reads the output up to the
+        __readonly__ tag'''
+        if self._command is None:
+            for elem in self._events:
+                if elem is None:
+                    break
+        return self._command
+
+    def check_command(self, expect_command):
+        '''Compare the command of the output with the expected command
+
+        Raises:
+            AssertionError: xml tag cli and command is not matched
+        '''
+        cli = self.command
+        assert cli == expect_command, \
+            'Cli created from XML tags does not match the actual cli:\n'\
+            'XML Tags cli: {c}\nCli command: {e}'.format(c=cli,
+                                                         e=expect_command)
+
+    def parent(self, name):
+        '''Return the innermost open element named name, or None
+
+        The children of the element which precede the current element are
+        already read, which is where NX-OS puts the keys of a row.
+        '''
+        for elem in reversed(self._stack):
+            if elem.tag == name:
+                return elem
+        return None
+
+    def iter(self, *names):
+        '''Yield the elements named names, or every element, as they end
+
+        An element is cleared once the next one is requested, so it must be
+        fully processed inside the loop. When names are given, the children
+        of the elements are kept until the elements are yielded, and the
+        values of the open elements can be looked up with `parent`.
+        '''
+        self._names = set(names) if names else None
+        self._open = sum(1 for elem in self._stack
+                         if self._names and elem.tag in self._names)
+        for elem in self._events:
+            if elem is not None:
+                yield elem
+
+    def rows(self, *names):
+        '''Yield the ROW_<name> elements of the TABLE_<name> tables, with
+        their children, as they end'''
+        return self.iter(*['ROW_' + name for name in names])
@@ -1,4 +1,5 @@
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any
 import re
 
@@ -11,7 +12,7 @@ class ShowBfdSessionsSchema(MetaParser):
 
     """ Schema for "show bfd sessions" command """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "system_ip": {
             Any(): {
                 'source_tloc_color': {
@@ -31,7 +32,7 @@ class ShowBfdSessionsSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # =====================================
@@ -1,4 +1,5 @@
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any
 from pprint import pprint
 import re
@@ -12,13 +13,13 @@ class ShowBfdSummarySchema(MetaParser):
 
     """ Schema for "show bfd summary" command """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "sessions_total": int,
         "sessions_up": int,
         "sessions_max": int,
         "sessions_flap": int,
         "poll_interval": int,
-    }
+    })
 
 # ===============================================
 # Parser for 'show bfd summary'
@@ -1,4 +1,5 @@
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 import re
 
@@ -7,7 +8,7 @@ import re
 # =======================================
 
 class ShowBootPartitionSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
             'partition': {
                 Any(): {
                     'active': str,
@@ -15,7 +16,7 @@ class ShowBootPartitionSchema(MetaParser):
                     'timestamp': str,
                 }
             }
-        }
+        })
 
 class ShowBootPartition(ShowBootPartitionSchema):
     """Parser for 'show boot-partition' on Viptela vEdge
@@ -1,4 +1,5 @@
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any
 import re
 
@@ -8,7 +9,7 @@ import re
 class ShowCloudexpressApplicationSchema(MetaParser):
     """ schema for 'show cloudexpress applications' """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "index": {
             Any(): {
                 "vpn": int,
@@ -22,7 +23,7 @@ class ShowCloudexpressApplicationSchema(MetaParser):
                 "remote_color": str,
             }
         }
-    }
+    })
 
 
 class ShowCloudexpressApplication(ShowCloudexpressApplicationSchema):
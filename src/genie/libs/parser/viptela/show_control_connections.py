@@ -1,5 +1,6 @@
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 from genie import parsergen
 
@@ -14,7 +15,7 @@ class ShowControlConnectionsSchema(MetaParser):
 
     """ Schema for "show control connections" """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "local_color": {
             Any(): {
                 "peer_system_ip": {
@@ -35,7 +36,7 @@ class ShowControlConnectionsSchema(MetaParser):
                 },
             },
         },
-    }
+    })
 
 
 # ===========================================
@@ -1,4 +1,5 @@
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 import re
 
@@ -10,7 +11,7 @@ class ShowControlLocalPropertiesSchema(MetaParser):
 
     """ Schema for "show control local-properties" command """
 
-    schema = {
+    schema = LazySchema(lambda: {
         "personality": str,
         Optional("sp_organization_name"): str,
         "organization_name": str,
@@ -66,7 +67,7 @@ class ShowControlLocalPropertiesSchema(MetaParser):
                 "vm_con_prf": str,
             },
         },
-    }
+    })
 
 
 # ===============================================
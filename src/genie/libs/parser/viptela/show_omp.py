@@ -1,4 +1,5 @@
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Optional
 import re
 import genie.parsergen as pg
@@ -8,7 +9,7 @@ class ShowOmpSummarySchema(MetaParser):
 # =====================================
 # Parser for 'show omp summary'
 # =====================================
- schema = {
+ schema = LazySchema(lambda: {
         'admin_state': str,
         'alert_received': int,
         'alert_sent': int,
@@ -38,7 +39,7 @@ class ShowOmpSummarySchema(MetaParser):
         'update_received': int,
         'update_sent': int,
         'vsmart_peers': int,
- }
+ })
 
 class ShowOmpSummary(ShowOmpSummarySchema):
 
@@ -84,7 +85,7 @@ class ShowOmpSummary(ShowOmpSummarySchema):
 # Schema for 'show omp tloc path'
 # =====================================
 class ShowOmpTlocPathSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'tloc_path': {
             Any(): {
                 'tloc': {
@@ -94,7 +95,7 @@ class ShowOmpTlocPathSchema(MetaParser):
                 }
             }
         }
-    }     
+    })     
 
 # =====================================
 # Parser for 'show omp tloc path'
@@ -136,7 +137,7 @@ class ShowOmpTlocPath(ShowOmpTlocPathSchema):
 # Schema for 'show omp peers'
 # =====================================
 class ShowOmpPeersSchema(MetaParser):
- schema = {
+ schema = LazySchema(lambda: {
     'peer': {
         Any(): {
             'type': str,
@@ -152,7 +153,7 @@ class ShowOmpPeersSchema(MetaParser):
             }
             }
     }     
-}           
+})           
 
 # =====================================
 # Parser for 'show omp peers'
@@ -203,7 +204,7 @@ class ShowOmpPeers(ShowOmpPeersSchema):
 # =====================================
 class ShowOmpTlocsSchema(MetaParser):
 
-    schema = {
+    schema = LazySchema(lambda: {
         'tloc_data':    {
                 Any(): {
                     'tloc': {
@@ -250,7 +251,7 @@ class ShowOmpTlocsSchema(MetaParser):
                     } 
                 }
             }
-    }
+    })
 
 # =====================================
 # Parser for 'show omp tlocs'
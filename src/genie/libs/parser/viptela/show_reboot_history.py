@@ -3,6 +3,7 @@
 '''
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 import genie.parsergen as pg
 import re
@@ -16,13 +17,13 @@ import re
 class ShowRebootHistorySchema(MetaParser):
     """ Schema for "show reboot history" """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'reboot_date_time': {
             str: {
                 'reboot_reason': str,
             }
         }
-    }
+    })
 # ===========================================
 # Parser for 'show reboot history'
 # ===========================================
@@ -3,6 +3,7 @@
 '''
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 import genie.parsergen as pg
 import re
@@ -15,7 +16,7 @@ import re
 class ShowSoftwaretabSchema(MetaParser):
     """ Schema for "show software | tab" """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'version':{
             str: {
                 'active': str,
@@ -25,7 +26,7 @@ class ShowSoftwaretabSchema(MetaParser):
                 'timestamp': str,
             }
         }
-    }
+    })
 # ===========================================
 # Parser for 'show software | tab'
 # ===========================================
@@ -3,6 +3,7 @@
 '''
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 import genie.parsergen as pg
 import re
@@ -16,7 +17,7 @@ import re
 class ShowSystemStatusSchema(MetaParser):
     """ Schema for "show system status" """
 
-    schema = {
+    schema = LazySchema(lambda: {
                 'boot_loader_version': str,
                 'build': str,
                 'chassis_serial_number': str,
@@ -71,7 +72,7 @@ class ShowSystemStatusSchema(MetaParser):
                 'testbed_mode': str,
                 'version': str,
                 'vmanaged': str
-            }
+            })
 
 # ===========================================
 # Parser for 'show system status'
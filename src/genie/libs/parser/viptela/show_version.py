@@ -3,6 +3,7 @@
 '''
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 import genie.parsergen as pg
 import re
@@ -16,9 +17,9 @@ import re
 class ShowVersionSchema(MetaParser):
     """ Schema for "show version" """
 
-    schema = {
+    schema = LazySchema(lambda: {
         'version': str
-    }
+    })
 # ===========================================
 # Parser for 'show version'
 # ===========================================
@@ -10,16 +10,20 @@ import xml.etree.ElementTree as ET
 
 # Metaparser
 from genie.metaparser import MetaParser
+from genie.libs.parser.base import LazySchema
 from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          Default, Use
 
+# Parser utils
+from genie.libs.parser.utils.xml_stream import XmlStream, local_name
+
 
 # =========================================
 # Parser for BGP Openconfig YANG 'GET' OPER
 # =========================================
 
 class BgpOpenconfigYangSchema(MetaParser):
-    schema = {
+    schema = LazySchema(lambda: {
         'bgp_pid': int,
         Optional('total_paths'): int,
         Optional('total_prefixes'): int,
@@ -104,572 +108,487 @@ class BgpOpenconfigYangSchema(MetaParser):
                     },
                 },
             },
-        }
+        })
 
 class BgpOpenconfigYang(BgpOpenconfigYangSchema):
+    ''' Parser for the openconfig BGP 'GET' reply
+
+    The reply is read one record at a time: the <global> container, then
+    each <neighbor> of <neighbors>. When the reply is given as output, it is
+    read incrementally and every element is cleared once read, so the
+    memory used does not depend on the number of neighbors or on the size
+    of the RIB state of the reply.
+
+    Args:
+        output (`str`): rpc-reply, or a file object opened in text mode
+                        holding it. By default the reply is requested from
+                        the device
+        projection (`list`): parts of the reply to parse besides the global
+                             state, out of PROJECTIONS. All by default
+    '''
+
+    # Optional parts of the reply
+    PROJECTIONS = ('address_family', 'neighbor', 'neighbor_address_family')
+
+    # Records of the reply, and the name of their parent
+    RECORDS = {'global': 'bgp', 'neighbor': 'neighbors'}
+
+    def yang(self, output=None, projection=None, **kwargs):
 
-    def yang(self, **kwargs):
-        
         parsed_dict = {}
         cmd = '''
             <bgp xmlns="http://openconfig.net/yang/bgp">
             </bgp>
         '''
-
-        # Execute RPC and get response
-        reply = self.device.get(('subtree', cmd))
-
-        # Get ETree rpc-reply
-        output = reply.data_ele
-        
-        # Get string rpc-reply
-        #string_output = reply.data_xml
-
+        projection = set(self.PROJECTIONS if projection is None
+                         else projection)
+        names = {'global', 'neighbor'} if 'neighbor' in projection \
+                else {'global'}
+
+        if output is None:
+            # Execute RPC and get response
+            reply = self.device.get(('subtree', cmd))
+
+            # ETree rpc-reply, already built by the client
+            records = self._tree_records(reply.data_ele, names)
+        else:
+            records = self._stream_records(output, names)
+
+        for name, record in records:
+            if name == 'global':
+                self._parse_global(record, parsed_dict, projection)
+            else:
+                self._parse_neighbor(record, parsed_dict, projection)
+
+        return parsed_dict
+
+    @staticmethod
+    def _tree_records(output, names):
+        '''Yield the (name, element) records of an rpc-reply tree'''
         for bgp in output:
             for top_level_key in bgp:
-                top_level_key_name = top_level_key.tag[top_level_key.tag.find('}')+1:]
-                
-                # global
-                if top_level_key_name == 'global':
-                    for global_key in top_level_key:
-                        global_key_name = global_key.tag[global_key.tag.find('}')+1:]
-                    
-                        # 'state'
-                        if global_key_name == 'state':
-                            for state_key in global_key:
-                                state_key_name = state_key.tag[state_key.tag.find('}')+1:]
-                                # as
-                                if state_key_name == 'as':
-                                    parsed_dict['bgp_pid'] = int(state_key.text)
-                                # router-id
-                                if state_key_name == 'router-id':
-                                    if 'vrf' not in parsed_dict:
-                                        parsed_dict['vrf'] = {}
-                                    if 'default' not in parsed_dict['vrf']:
-                                        parsed_dict['vrf']['default'] = {}
-                                    parsed_dict['vrf']['default']['router_id'] = state_key.text
-                                # total-paths
-                                if state_key_name == 'total-paths':
-                                    parsed_dict['total_paths'] = int(state_key.text)
-                                # total-prefixes
-                                if state_key_name == 'total-prefixes':
-                                    parsed_dict['total_prefixes'] = int(state_key.text)
-                        
-                        # 'graceful-restart'
-                        if global_key_name == 'graceful-restart':
-                            for gr_key in global_key:
-                                gr_key_name = gr_key.tag[gr_key.tag.find('}')+1:]
-                                if gr_key_name == 'state':
-                                    if 'vrf' not in parsed_dict:
-                                        parsed_dict['vrf'] = {}
-                                    if 'default' not in parsed_dict['vrf']:
-                                        parsed_dict['vrf']['default'] = {}
-                                    for gr_state_key in gr_key:
-                                        gr_state_key_name = gr_state_key.tag[gr_state_key.tag.find('}')+1:]
-                                        # enabled
-                                        if gr_state_key_name == 'enabled':
-                                            if gr_state_key.text == 'false':
-                                                parsed_dict['vrf']['default']['graceful_restart'] = False
-                                            elif gr_state_key.text == 'true':
-                                                parsed_dict['vrf']['default']['graceful_restart'] = True
-                                        # helper-only
-                                        if gr_state_key_name == 'helper-only':
-                                            if gr_state_key.text == 'false':
-                                                parsed_dict['vrf']['default']['graceful_restart_helper_only'] = False
-                                            elif gr_state_key.text == 'true':
-                                                parsed_dict['vrf']['default']['graceful_restart_helper_only'] = True
-                                        # restart-time
-                                        if gr_state_key_name == 'restart-time':
-                                            parsed_dict['vrf']['default']['graceful_restart_restart_time'] = int(gr_state_key.text)
-                                        # stale-routes-time
-                                        if gr_state_key_name == 'stale-routes-time':
-                                            parsed_dict['vrf']['default']['graceful_restart_stalepath_time'] = int(gr_state_key.text)
-
-                        # 'use-multiple-paths'
-                        if global_key_name == 'use-multiple-paths':
-                            for multiple_path_key in global_key:
-                                multiple_path_key_name = multiple_path_key.tag[multiple_path_key.tag.find('}')+1:]
-                                if 'use_multiple_paths' not in parsed_dict:
-                                    parsed_dict['use_multiple_paths'] = {}
-                                if multiple_path_key_name == 'ebgp':
-                                    for ebgp_key in multiple_path_key:
-                                        ebgp_key_name = ebgp_key.tag[ebgp_key.tag.find('}')+1:]
-                                        if ebgp_key_name == 'state':
-                                            for ebgp_state_key in ebgp_key:
-                                                ebgp_state_key_name = ebgp_state_key.tag[ebgp_state_key.tag.find('}')+1:]
-                                                if ebgp_state_key_name == 'maximum-paths':
-                                                    parsed_dict['use_multiple_paths']['ebgp_max_paths'] = int(ebgp_state_key.text)
-                                if multiple_path_key_name == 'ibgp':
-                                    for ibgp_key in multiple_path_key:
-                                        ibgp_key_name = ibgp_key.tag[ibgp_key.tag.find('}')+1:]
-                                        if ibgp_key_name == 'state':
-                                            for ibgp_state_key in ibgp_key:
-                                                ibgp_state_key_name = ibgp_state_key.tag[ibgp_state_key.tag.find('}')+1:]
-                                                if ibgp_state_key_name == 'maximum-paths':
-                                                    parsed_dict['use_multiple_paths']['ibgp_max_paths'] = int(ibgp_state_key.text)
-
-                        # 'afi-safis'
-                        if global_key_name == 'afi-safis':
-                            if 'vrf' not in parsed_dict:
-                                parsed_dict['vrf'] = {}
-                            if 'default' not in  parsed_dict['vrf']:
-                                parsed_dict['vrf']['default'] = {}
-                            if 'address_family' not in parsed_dict['vrf']['default']:
-                                parsed_dict['vrf']['default']['address_family'] = {}
-                            for safis_key in global_key:
-                                safis_key_name = safis_key.tag[safis_key.tag.find('}')+1:]
-                                if safis_key_name == 'afi-safi':
-                                    for safi_key in safis_key:
-                                        safi_key_name = safi_key.tag[safi_key.tag.find('}')+1:]
-                                        
-                                        # afi-safi-name
-                                        if safi_key_name == 'afi-safi-name':
-                                            address_family = str(safi_key.text).lower()
-                                            address_family = address_family.replace("_", " ")
-                                            address_family = address_family.replace("labeled", "label")
-                                            if address_family not in parsed_dict['vrf']['default']['address_family'] and\
-                                               address_family != 'none':
-                                                parsed_dict['vrf']['default']['address_family'][address_family] = {}
-                                        
-                                        # state
-                                        if safi_key_name == 'state' and address_family != 'none':
-                                            for state_key in safi_key:
-                                                state_key_name = state_key.tag[state_key.tag.find('}')+1:]
-                                                # enabled
-                                                if state_key_name == 'enabled':
-                                                    if state_key.text == 'true':
-                                                        parsed_dict['vrf']['default']['address_family'][address_family]['enabled'] = True
-                                                    else:
-                                                        parsed_dict['vrf']['default']['address_family'][address_family]['enabled'] = False
-                                                # total-paths
-                                                if state_key_name == 'total-paths':
-                                                    parsed_dict['vrf']['default']['address_family'][address_family]['total_paths'] = int(state_key.text)
-                                                # total-prefixes
-                                                if state_key_name == 'total-prefixes':
-                                                    parsed_dict['vrf']['default']['address_family'][address_family]['total_prefixes'] = int(state_key.text)
-                                        
-                                        # graceful_restart
-                                        if safi_key_name == 'graceful-restart' and address_family != 'none':
-                                            for gr_key in safi_key:
-                                                gr_key_name = gr_key.tag[gr_key.tag.find('}')+1:]
-                                                if gr_key_name == 'state':
-                                                    for gr_state_key in gr_key:
-                                                        gr_state_key_name = gr_state_key.tag[gr_state_key.tag.find('}')+1:]
-                                                        if gr_state_key_name == 'enabled':
-                                                            if gr_state_key.text == 'true':
-                                                                parsed_dict['vrf']['default']['address_family'][address_family]['graceful_restart'] = True
-                                                            else:
-                                                                parsed_dict['vrf']['default']['address_family'][address_family]['graceful_restart'] = False
-
-                                        # route-selection-options
-                                        if safi_key_name == 'route-selection-options' and address_family != 'none':
-                                            for rso_key in safi_key:
-                                                rso_key_name = rso_key.tag[rso_key.tag.find('}')+1:]
-                                                if rso_key_name == 'state':
-                                                    for rso_key_state_key in rso_key:
-                                                        rso_state_key_name = rso_key_state_key.tag[rso_key_state_key.tag.find('}')+1:]
-                                                        if rso_state_key_name == 'advertise-inactive-routes':
-                                                            if rso_key_state_key.text == 'true':
-                                                                parsed_dict['vrf']['default']['address_family'][address_family]['advertise_inactive_routes'] = True
-                                                            else:
-                                                                parsed_dict['vrf']['default']['address_family'][address_family]['advertise_inactive_routes'] = False
-
-                                        # use-multiple-paths
-                                        if safi_key_name == 'use-multiple-paths' and address_family != 'none':
-                                            for ump_key in safi_key:
-                                                ump_key_name = ump_key.tag[ump_key.tag.find('}')+1:]
-                                                if ump_key_name == 'ebgp':
-                                                    for ebgp_key in ump_key:
-                                                        ebgp_key_name = ebgp_key.tag[ebgp_key.tag.find('}')+1:]
-                                                        if ebgp_key_name == 'state':
-                                                            for ebgp_state_key in ebgp_key:
-                                                                ebgp_state_key_name = ebgp_state_key.tag[ebgp_state_key.tag.find('}')+1:]
-                                                                if ebgp_state_key_name == 'maximum-paths':
-                                                                    parsed_dict['vrf']['default']['address_family'][address_family]['ebgp_max_paths'] = int(ebgp_state_key.text)
-                                                if ump_key_name == 'ibgp':
-                                                    for ibgp_key in ump_key:
-                                                        ibgp_key_name = ibgp_key.tag[ibgp_key.tag.find('}')+1:]
-                                                        if ibgp_key_name == 'state':
-                                                            for ibgp_state_key in ibgp_key:
-                                                                ibgp_state_key_name = ibgp_state_key.tag[ibgp_state_key.tag.find('}')+1:]
-                                                                if ibgp_state_key_name == 'maximum-paths':
-                                                                    parsed_dict['vrf']['default']['address_family'][address_family]['ibgp_max_paths'] = int(ibgp_state_key.text)
-
-                # neighbors
-                if top_level_key_name == 'neighbors':
+                top_level_key_name = local_name(top_level_key.tag)
+                if top_level_key_name == 'global' and 'global' in names:
+                    yield 'global', top_level_key
+                elif top_level_key_name == 'neighbors' and \
+                        'neighbor' in names:
                     for neighbor in top_level_key:
-                        neighbor_name  = neighbor.tag[neighbor.tag.find('}')+1:]
-                        if neighbor_name == 'neighbor':
-                            # Initialize values for this neighbor
-                            neighbor_name = None
-                            nbr_state_dict = {}
-                            nbr_transport_dict = {}
-                            nbr_timers_dict = {}
-                            nbr_gr_dict = {}
-                            nbr_ebgp_dict = {}
-                            nbr_as_path_dict = {}
-                            nbr_rr_dict = {}
-                            nbr_safis_dict = {}
-                            for neighbor_key in neighbor:
-                                # Get key name
-                                neighbor_key_name = neighbor_key.tag[neighbor_key.tag.find('}')+1:]
-                                
-                                # Tag: neighbor-address
-                                if neighbor_key_name == 'neighbor-address':
-                                    neighbor_name = neighbor_key.text
-                                    # Create neighbor key
-                                    if 'neighbor' not in parsed_dict['vrf']['default']:
-                                        parsed_dict['vrf']['default']['neighbor'] = {}
-                                    if neighbor_name not in parsed_dict['vrf']['default']['neighbor']:
-                                        parsed_dict['vrf']['default']['neighbor'][neighbor_name] = {}
-
-                                # Tag: state
-                                if neighbor_key_name == 'state':
-                                    for state_key in neighbor_key:
-                                        state_key_name = state_key.tag[state_key.tag.find('}')+1:]
-                                        # description
-                                        if state_key_name == 'description':
-                                            nbr_state_dict['description'] = str(state_key.text)
-                                        # peer-as
-                                        if state_key_name == 'peer-as':
-                                            if state_key.text is not None and state_key.text != 'none':
-                                                nbr_state_dict['remote_as'] = int(state_key.text)
-                                        # peer-group
-                                        if state_key_name == 'peer-group':
-                                            nbr_state_dict['peer_group'] = str(state_key.text)
-                                        # remove-private-as
-                                        if state_key_name == 'remove-private-as':
-                                            if state_key.text == 'true':
-                                                nbr_state_dict['remove_private_as'] = True
-                                            else:
-                                                nbr_state_dict['remove_private_as'] = False
-                                        # send-community
-                                        if state_key_name == 'send-community':
-                                            nbr_state_dict['send_community'] = str(state_key.text)
-                                        # queues
-                                        if state_key_name == 'queues':
-                                            for queue_key in state_key:
-                                                queue_key_name = queue_key.tag[queue_key.tag.find('}')+1:]
-                                                # input
-                                                if queue_key_name == 'input':
-                                                    nbr_state_dict['input_queue'] = int(queue_key.text)
-                                                # output
-                                                if queue_key_name == 'output':
-                                                    nbr_state_dict['output_queue'] = int(queue_key.text)
-                                        # session-state
-                                        if state_key_name == 'session-state':
-                                            nbr_state_dict['session_state'] = str(state_key.text).lower()
-                                        # messages
-                                        if state_key_name == 'messages':
-                                            if 'bgp_neighbor_counters' not in nbr_state_dict:
-                                                nbr_state_dict['bgp_neighbor_counters'] = {}
-                                            if 'messages' not in nbr_state_dict['bgp_neighbor_counters']:
-                                                nbr_state_dict['bgp_neighbor_counters']['messages'] = {}
-                                            for messages_key in state_key:
-                                                messages_key_name = messages_key.tag[messages_key.tag.find('}')+1:]
-                                                # sent
-                                                if messages_key_name == 'sent':
-                                                    for sent_key in messages_key:
-                                                        sent_key_name = sent_key.tag[sent_key.tag.find('}')+1:]
-                                                        # NOTIFICATION
-                                                        if sent_key_name == 'NOTIFICATION':
-                                                            if 'sent' not in nbr_state_dict['bgp_neighbor_counters']['messages']:
-                                                                nbr_state_dict['bgp_neighbor_counters']['messages']['sent'] = {}
-                                                            if sent_key.text is not None:
-                                                                nbr_state_dict['bgp_neighbor_counters']['messages']['sent']['notifications'] = int(sent_key.text)
-                                                        # UPDATES
-                                                        if sent_key_name == 'UPDATE':
-                                                            if 'sent' not in nbr_state_dict['bgp_neighbor_counters']['messages']:
-                                                                nbr_state_dict['bgp_neighbor_counters']['messages']['sent'] = {}
-                                                            if sent_key.text is not None:
-                                                                nbr_state_dict['bgp_neighbor_counters']['messages']['sent']['updates'] = int(sent_key.text)
-                                                # received
-                                                if messages_key_name == 'received':
-                                                    for received_key in messages_key:
-                                                        received_key_name = received_key.tag[received_key.tag.find('}')+1:]
-                                                        # NOTIFICATION
-                                                        if received_key_name == 'NOTIFICATION':
-                                                            if 'received' not in nbr_state_dict['bgp_neighbor_counters']['messages']:
-                                                                nbr_state_dict['bgp_neighbor_counters']['messages']['received'] = {}
-                                                            if received_key.text is not None:
-                                                                nbr_state_dict['bgp_neighbor_counters']['messages']['received']['notifications'] = int(received_key.text)
-                                                        # UPDATES
-                                                        if received_key_name == 'UPDATE':
-                                                            if 'received' not in nbr_state_dict['bgp_neighbor_counters']['messages']:
-                                                                nbr_state_dict['bgp_neighbor_counters']['messages']['received'] = {}
-                                                            if received_key.text is not None:
-                                                                nbr_state_dict['bgp_neighbor_counters']['messages']['received']['updates'] = int(received_key.text)
-
-                                # Tag: transport
-                                if neighbor_key_name == 'transport':
-                                    for transport_key in neighbor_key:
-                                        transport_key_name = transport_key.tag[transport_key.tag.find('}')+1:]
-                                        if transport_key_name == 'state':
-                                            for transport_state_key in transport_key:
-                                                transport_state_key_name = transport_state_key.tag[transport_state_key.tag.find('}')+1:]
-                                                # local-address
-                                                if transport_state_key_name == 'local-address':
-                                                    nbr_transport_dict['local_host'] = transport_state_key.text
-                                                # passive-mode
-                                                if transport_state_key_name == 'passive-mode':
-                                                    nbr_transport_dict['passive_mode'] = transport_state_key.text
-                                                # local-port
-                                                if transport_state_key_name == 'local-port':
-                                                    nbr_transport_dict['local_port'] = transport_state_key.text
-                                                # remote-address
-                                                if transport_state_key_name == 'remote-address':
-                                                    nbr_transport_dict['foreign_port'] = transport_state_key.text
-                                                # remote-port
-                                                if transport_state_key_name == 'remote-port':
-                                                    nbr_transport_dict['foreign_host'] = transport_state_key.text
-
-                                # Tag: timers
-                                if neighbor_key_name == 'timers':
-                                    for timers_key in neighbor_key:
-                                        timers_key_name = timers_key.tag[timers_key.tag.find('}')+1:]
-                                        if timers_key_name == 'state':
-                                            
-                                            for timers_state_key in timers_key:
-                                                timers_state_key_name = timers_state_key.tag[timers_state_key.tag.find('}')+1:]
-                                                # hold-time
-                                                if timers_state_key_name == 'hold-time':
-                                                    nbr_timers_dict['holdtime'] = int(timers_state_key.text)
-                                                # keepalive-interval
-                                                if timers_state_key_name == 'keepalive-interval':
-                                                    nbr_timers_dict['keepalive_interval'] = int(timers_state_key.text)
-                                                # minimum-advertisement-interval
-                                                if timers_state_key_name == 'minimum-advertisement-interval':
-                                                    nbr_timers_dict['minimum_advertisement_interval'] = int(timers_state_key.text)
-                                                # negotiated-hold-time
-                                                if timers_state_key_name == 'negotiated-hold-time':
-                                                    nbr_timers_dict['holdtime'] = int(timers_state_key.text)
-
-                                # Tag: 'graceful-restart'
-                                if neighbor_key_name == 'graceful-restart':
-                                    for gr_key in neighbor_key:
-                                        gr_key_name = gr_key.tag[gr_key.tag.find('}')+1:]
-                                        if gr_key_name == 'state':
-                                            for gr_state_key in gr_key:
-                                                gr_state_key_name = gr_state_key.tag[gr_state_key.tag.find('}')+1:]
-                                                # enabled
-                                                if gr_state_key_name == 'enabled':
-                                                    if gr_state_key.text == 'false':
-                                                        nbr_gr_dict['graceful_restart'] = False
-                                                    elif gr_state_key.text == 'true':
-                                                        nbr_gr_dict['graceful_restart'] = True
-                                                # helper-only
-                                                if gr_state_key_name == 'helper-only':
-                                                    if gr_state_key.text == 'false':
-                                                        nbr_gr_dict['graceful_restart_helper_only'] = False
-                                                    elif gr_state_key.text == 'true':
-                                                        nbr_gr_dict['graceful_restart_helper_only'] = True
-                                                # restart-time
-                                                if gr_state_key_name == 'restart-time':
-                                                    nbr_gr_dict['graceful_restart_restart_time'] = int(gr_state_key.text)
-                                                # stale-routes-time
-                                                if gr_state_key_name == 'stale-routes-time':
-                                                    nbr_gr_dict['graceful_restart_stalepath_time'] = int(gr_state_key.text)
-                                                # peer-restart-time
-                                                if gr_state_key_name == 'peer-restart-time':
-                                                    nbr_gr_dict['graceful_restart_restart_time'] = int(gr_state_key.text)
-
-                                # Tag: ebgp-multihop
-                                if neighbor_key_name == 'ebgp-multihop':
-                                    for ebgp_key in neighbor_key:
-                                        ebgp_key_name = ebgp_key.tag[ebgp_key.tag.find('}')+1:]
-                                        if ebgp_key_name == 'state':
-                                            for ebgp_state_key in ebgp_key:
-                                                ebgp_state_key_name = ebgp_state_key.tag[ebgp_state_key.tag.find('}')+1:]
-                                                if ebgp_state_key_name == 'enabled':
-                                                    if ebgp_state_key.text == 'true':
-                                                        nbr_ebgp_dict['nbr_ebgp_multihop'] = True
-                                                    else:
-                                                        nbr_ebgp_dict['nbr_ebgp_multihop'] = False
-                                                if ebgp_state_key_name == 'multihop-ttl':
-                                                    nbr_ebgp_dict['nbr_ebgp_multihop_max_hop'] = int(ebgp_state_key.text)
-
-                                # Tag: as-path-options
-                                if neighbor_key_name == 'as-path-options':
-                                    for as_path_key in neighbor_key:
-                                        as_path_key_name = as_path_key.tag[as_path_key.tag.find('}')+1:]
-                                        if as_path_key_name == 'state':
-                                            for as_path_state_key in as_path_key:
-                                                as_path_state_key_name = as_path_state_key.tag[as_path_state_key.tag.find('}')+1:]
-                                                if as_path_state_key_name == 'allow-own-as':
-                                                    nbr_as_path_dict['allow_own_as'] = int(as_path_state_key.text)
-
-                                # Tag: route-reflector
-                                if neighbor_key_name == 'route-reflector':
-                                    for rr_key in neighbor_key:
-                                        rr_key_name = rr_key.tag[rr_key.tag.find('}')+1:]
-                                        if rr_key_name == 'state':
-                                            for rr_state_key in rr_key:
-                                                rr_state_key_name = rr_state_key.tag[rr_state_key.tag.find('}')+1:]
-                                                if rr_state_key_name == 'route-reflector-client':
-                                                    if rr_state_key.text == 'true':
-                                                        nbr_rr_dict['route_reflector_client'] = True
-                                                    elif rr_state_key.text == 'false':
-                                                        nbr_rr_dict['route_reflector_client'] = False
-                                                if rr_state_key_name == 'route-reflector-cluster-id':
-                                                    nbr_rr_dict['route_reflector_cluster_id'] = int(rr_state_key.text)
-
-                                # Tag: logging
-                                if neighbor_key_name == 'logging-options':
-                                    for logging_key in neighbor_key:
-                                        logging_key_name = logging_key.tag[logging_key.tag.find('}')+1:]
-                                        if logging_key_name == 'state':
-                                            logging_dict = {}
-                                            for logging_state_key in logging_key:
-                                                logging_state_key_name = logging_state_key.tag[logging_state_key.tag.find('}')+1:]
-                                                if logging_state_key_name == 'log-neighbor-state-changes':
-                                                    if logging_state_key.text == 'true':
-                                                        logging_dict['log_neighbor_changes'] = True
-                                                    else:
-                                                        logging_dict['log_neighbor_changes'] = False
-                                    # Add to main vrf dict
-                                    if 'vrf' not in parsed_dict:
-                                        parsed_dict['vrf'] = {}
-                                    if 'default' not in parsed_dict['vrf']:
-                                        parsed_dict['vrf']['default'] = {}
-                                    parsed_dict['vrf']['default']['log_neighbor_changes'] = logging_dict['log_neighbor_changes']
-
-                                # Tag: afi-safis
-                                if neighbor_key_name == 'afi-safis':
-                                    for safis_key in neighbor_key:
-                                        safis_key_name = safis_key.tag[safis_key.tag.find('}')+1:]
-                                        if safis_key_name == 'afi-safi':
-                                            for safi_key in safis_key:
-                                                safi_key_name = safi_key.tag[safi_key.tag.find('}')+1:]
-                                                
-                                                # afi-safi-name
-                                                if safi_key_name == 'afi-safi-name':
-                                                    address_family = str(safi_key.text).lower()
-                                                    address_family = address_family.replace("_", " ")
-                                                    if 'address_family' not in nbr_safis_dict:
-                                                        nbr_safis_dict['address_family'] = {}
-                                                    if address_family not in nbr_safis_dict['address_family'] and\
-                                                       address_family != 'none':
-                                                        nbr_safis_dict['address_family'][address_family] = {}
-                                                
-                                                # state
-                                                if safi_key_name == 'state' and address_family != 'none':
-                                                    for state_key in safi_key:
-                                                        state_key_name = state_key.tag[state_key.tag.find('}')+1:]
-                                                        # enabled
-                                                        if state_key_name == 'enabled':
-                                                            if state_key.text == 'true':
-                                                                nbr_safis_dict['address_family'][address_family]['enabled'] = True
-                                                            else:
-                                                                nbr_safis_dict['address_family'][address_family]['enabled'] = False
-                                                        # active
-                                                        if state_key_name == 'active':
-                                                            if state_key.text == 'true':
-                                                                nbr_safis_dict['address_family'][address_family]['active'] = True
-                                                            else:
-                                                                nbr_safis_dict['address_family'][address_family]['active'] = False
-                                                        # prefixes
-                                                        if state_key_name == 'prefixes':
-                                                            for prefix_key in state_key:
-                                                                prefix_key_name = prefix_key.tag[prefix_key.tag.find('}')+1:]
-                                                                # received
-                                                                if prefix_key_name == 'received':
-                                                                    nbr_safis_dict['address_family'][address_family]['prefixes_received'] = int(prefix_key.text)
-                                                                # sent
-                                                                if prefix_key_name == 'sent':
-                                                                    nbr_safis_dict['address_family'][address_family]['prefixes_sent'] = int(prefix_key.text)
-                                                
-                                                # graceful_restart
-                                                if safi_key_name == 'graceful-restart' and address_family != 'none':
-                                                    for gr_key in safi_key:
-                                                        gr_key_name = gr_key.tag[gr_key.tag.find('}')+1:]
-                                                        # state
-                                                        if gr_key_name == 'state':
-                                                            for gr_state_key in gr_key:
-                                                                gr_state_key_name = gr_state_key.tag[gr_state_key.tag.find('}')+1:]
-                                                                # enabled
-                                                                if gr_state_key_name == 'enabled':
-                                                                    if gr_state_key.text == 'true':
-                                                                        nbr_safis_dict['address_family'][address_family]['graceful_restart'] = True
-                                                                    else:
-                                                                        nbr_safis_dict['address_family'][address_family]['graceful_restart'] = False
-
-                                                # ipv6-unicast
-                                                if safi_key_name == 'ipv6-unicast' and address_family != 'none':
-                                                    for ipv6_key in safi_key:
-                                                        ipv6_key_name = ipv6_key.tag[ipv6_key.tag.find('}')+1:]
-                                                        # state
-                                                        if ipv6_key_name == 'state':
-                                                            for ipv6_state_key in ipv6_key:
-                                                                ipv6_state_key_name = ipv6_state_key.tag[ipv6_state_key.tag.find('}')+1:]
-                                                                # send-default-route
-                                                                if ipv6_state_key_name == 'send-default-route':
-                                                                    if ipv6_state_key.text == 'true':
-                                                                        nbr_safis_dict['address_family'][address_family]['ipv6_unicast_send_default_route'] = True
-                                                                    else:
-                                                                        nbr_safis_dict['address_family'][address_family]['ipv6_unicast_send_default_route'] = False
-
-                                                # ipv4-unicast
-                                                if safi_key_name == 'ipv4-unicast' and address_family != 'none':
-                                                    for ipv4_key in safi_key:
-                                                        ipv4_key_name = ipv4_key.tag[ipv4_key.tag.find('}')+1:]
-                                                        # state
-                                                        if ipv4_key_name == 'state':
-                                                            for ipv4_state_key in ipv4_key:
-                                                                ipv4_state_key_name = ipv4_state_key.tag[ipv4_state_key.tag.find('}')+1:]
-                                                                # send-default-route
-                                                                if ipv4_state_key_name == 'send-default-route':
-                                                                    if ipv4_state_key.text == 'true':
-                                                                        nbr_safis_dict['address_family'][address_family]['ipv4_unicast_send_default_route'] = True
-                                                                    else:
-                                                                        nbr_safis_dict['address_family'][address_family]['ipv4_unicast_send_default_route'] = False
-                                                                        continue
-
-                                # Set all tag values to main dictionary
-                                if neighbor_name is not None:
-                                    
-                                    # Set state tag values
-                                    if nbr_state_dict:
-                                        for key in nbr_state_dict:
-                                            parsed_dict['vrf']['default']['neighbor'][neighbor_name][key] = nbr_state_dict[key]
-
-                                    # Set timers tag values
-                                    if nbr_timers_dict:
-                                        for key in nbr_timers_dict:
-                                            parsed_dict['vrf']['default']['neighbor'][neighbor_name][key] = nbr_timers_dict[key]
-
-                                    # Set graceful-restart tag values
-                                    if nbr_gr_dict:
-                                        for key in nbr_gr_dict:
-                                            parsed_dict['vrf']['default']['neighbor'][neighbor_name][key] = nbr_gr_dict[key]
-
-                                    # Set ebgp-multihop tag values
-                                    if nbr_ebgp_dict:
-                                        for key in nbr_ebgp_dict:
-                                            parsed_dict['vrf']['default']['neighbor'][neighbor_name][key] = nbr_ebgp_dict[key]
-
-                                    # Set as-path-options tag values
-                                    if nbr_as_path_dict:
-                                        for key in nbr_as_path_dict:
-                                            parsed_dict['vrf']['default']['neighbor'][neighbor_name][key] = nbr_as_path_dict[key]
-
-                                    # Set route-reflector tag values
-                                    if nbr_rr_dict:
-                                        for key in nbr_rr_dict:
-                                            parsed_dict['vrf']['default']['neighbor'][neighbor_name][key] = nbr_rr_dict[key]
-
-                                    # Set transport tag values
-                                    if nbr_transport_dict:
-                                        if 'bgp_session_transport' not in parsed_dict['vrf']['default']['neighbor'][neighbor_name]:
-                                            parsed_dict['vrf']['default']['neighbor'][neighbor_name]['bgp_session_transport'] = {}
-                                        if 'transport' not in parsed_dict['vrf']['default']['neighbor'][neighbor_name]['bgp_session_transport']:
-                                            parsed_dict['vrf']['default']['neighbor'][neighbor_name]['bgp_session_transport']['transport'] = {}
-                                        parsed_dict['vrf']['default']['neighbor'][neighbor_name]['bgp_session_transport']['transport'] = nbr_transport_dict
-
-                                    # Set address-family (safi-afi) tag values
-                                    if nbr_safis_dict:
-                                        if 'address_family' in nbr_safis_dict:
-                                            if 'address_family' not in parsed_dict['vrf']['default']['neighbor'][neighbor_name]:
-                                                parsed_dict['vrf']['default']['neighbor'][neighbor_name]['address_family'] = {}
-                                                parsed_dict['vrf']['default']['neighbor'][neighbor_name]['address_family'] = nbr_safis_dict['address_family']
-
-        return parsed_dict
\ No newline at end of file
+                        if local_name(neighbor.tag) == 'neighbor':
+                            yield 'neighbor', neighbor
+
+    def _stream_records(self, output, names, chunk_size=65536):
+        '''Yield the (name, element) records of an rpc-reply read
+        incrementally. Elements are cleared and detached once read, a record
+        must be processed before the next one is requested.'''
+        stream = XmlStream(output, chunk_size=chunk_size, read_command=False)
+        for elem in stream.iter(*names):
+            if stream.parent(self.RECORDS[elem.tag]) is not None:
+                yield elem.tag, elem
+
+    @staticmethod
+    def _default_vrf(parsed_dict):
+        '''Return the dict of the default vrf, added if missing'''
+        if 'vrf' not in parsed_dict:
+            parsed_dict['vrf'] = {}
+        if 'default' not in parsed_dict['vrf']:
+            parsed_dict['vrf']['default'] = {}
+        return parsed_dict['vrf']['default']
+
+    def _parse_global(self, global_elem, parsed_dict, projection):
+        '''Parse the <global> container'''
+        for global_key in global_elem:
+            global_key_name = local_name(global_key.tag)
+
+            # 'state'
+            if global_key_name == 'state':
+                for state_key in global_key:
+                    state_key_name = local_name(state_key.tag)
+                    # as
+                    if state_key_name == 'as':
+                        parsed_dict['bgp_pid'] = int(state_key.text)
+                    # router-id
+                    elif state_key_name == 'router-id':
+                        self._default_vrf(parsed_dict)['router_id'] = \
+                            state_key.text
+                    # total-paths
+                    elif state_key_name == 'total-paths':
+                        parsed_dict['total_paths'] = int(state_key.text)
+                    # total-prefixes
+                    elif state_key_name == 'total-prefixes':
+                        parsed_dict['total_prefixes'] = int(state_key.text)
+
+            # 'graceful-restart'
+            elif global_key_name == 'graceful-restart':
+                for gr_key in global_key:
+                    if local_name(gr_key.tag) == 'state':
+                        self._parse_gr_state(
+                            gr_key, self._default_vrf(parsed_dict))
+
+            # 'use-multiple-paths'
+            elif global_key_name == 'use-multiple-paths':
+                if len(global_key):
+                    self._parse_multiple_paths(
+                        global_key,
+                        parsed_dict.setdefault('use_multiple_paths', {}))
+
+            # 'afi-safis'
+            elif global_key_name == 'afi-safis' and \
+                    'address_family' in projection:
+                af_dict = self._default_vrf(parsed_dict).setdefault(
+                    'address_family', {})
+                for safis_key in global_key:
+                    if local_name(safis_key.tag) == 'afi-safi':
+                        self._parse_global_afi_safi(safis_key, af_dict)
+
+    @staticmethod
+    def _parse_gr_state(gr_state, gr_dict):
+        '''Parse the state of a graceful-restart container'''
+        for gr_state_key in gr_state:
+            gr_state_key_name = local_name(gr_state_key.tag)
+            # enabled
+            if gr_state_key_name == 'enabled':
+                if gr_state_key.text == 'false':
+                    gr_dict['graceful_restart'] = False
+                elif gr_state_key.text == 'true':
+                    gr_dict['graceful_restart'] = True
+            # helper-only
+            elif gr_state_key_name == 'helper-only':
+                if gr_state_key.text == 'false':
+                    gr_dict['graceful_restart_helper_only'] = False
+                elif gr_state_key.text == 'true':
+                    gr_dict['graceful_restart_helper_only'] = True
+            # restart-time, peer-restart-time
+            elif gr_state_key_name in ('restart-time', 'peer-restart-time'):
+                gr_dict['graceful_restart_restart_time'] = \
+                    int(gr_state_key.text)
+            # stale-routes-time
+            elif gr_state_key_name == 'stale-routes-time':
+                gr_dict['graceful_restart_stalepath_time'] = \
+                    int(gr_state_key.text)
+
+    @staticmethod
+    def _parse_multiple_paths(ump_elem, ump_dict):
+        '''Parse the ebgp/ibgp maximum-paths of use-multiple-paths'''
+        for ump_key in ump_elem:
+            ump_key_name = local_name(ump_key.tag)
+            if ump_key_name not in ('ebgp', 'ibgp'):
+                continue
+            for ump_state in ump_key:
+                if local_name(ump_state.tag) != 'state':
+                    continue
+                for ump_state_key in ump_state:
+                    if local_name(ump_state_key.tag) == 'maximum-paths':
+                        ump_dict[ump_key_name + '_max_paths'] = \
+                            int(ump_state_key.text)
+
+    def _parse_global_afi_safi(self, safis_key, af_dict):
+        '''Parse one <afi-safi> of the global container'''
+        address_family = 'none'
+        for safi_key in safis_key:
+            safi_key_name = local_name(safi_key.tag)
+
+            # afi-safi-name
+            if safi_key_name == 'afi-safi-name':
+                address_family = str(safi_key.text).lower()
+                address_family = address_family.replace("_", " ")
+                address_family = address_family.replace("labeled", "label")
+                if address_family not in af_dict and \
+                   address_family != 'none':
+                    af_dict[address_family] = {}
+                continue
+
+            if address_family == 'none':
+                continue
+
+            # state
+            if safi_key_name == 'state':
+                for state_key in safi_key:
+                    state_key_name = local_name(state_key.tag)
+                    # enabled
+                    if state_key_name == 'enabled':
+                        af_dict[address_family]['enabled'] = \
+                            state_key.text == 'true'
+                    # total-paths
+                    elif state_key_name == 'total-paths':
+                        af_dict[address_family]['total_paths'] = \
+                            int(state_key.text)
+                    # total-prefixes
+                    elif state_key_name == 'total-prefixes':
+                        af_dict[address_family]['total_prefixes'] = \
+                            int(state_key.text)
+
+            # graceful_restart
+            elif safi_key_name == 'graceful-restart':
+                for gr_key in safi_key:
+                    if local_name(gr_key.tag) != 'state':
+                        continue
+                    for gr_state_key in gr_key:
+                        if local_name(gr_state_key.tag) == 'enabled':
+                            af_dict[address_family]['graceful_restart'] = \
+                                gr_state_key.text == 'true'
+
+            # route-selection-options
+            elif safi_key_name == 'route-selection-options':
+                for rso_key in safi_key:
+                    if local_name(rso_key.tag) != 'state':
+                        continue
+                    for rso_state_key in rso_key:
+                        if local_name(rso_state_key.tag) == \
+                                'advertise-inactive-routes':
+                            af_dict[address_family]\
+                                ['advertise_inactive_routes'] = \
+                                rso_state_key.text == 'true'
+
+            # use-multiple-paths
+            elif safi_key_name == 'use-multiple-paths':
+                self._parse_multiple_paths(safi_key,
+                                           af_dict[address_family])
+
+    def _parse_neighbor(self, neighbor, parsed_dict, projection):
+        '''Parse one <neighbor> of the neighbors container'''
+        # Initialize values for this neighbor
+        neighbor_name = None
+        nbr_dict = {}
+        nbr_transport_dict = {}
+        nbr_safis_dict = {}
+
+        for neighbor_key in neighbor:
+            # Get key name
+            neighbor_key_name = local_name(neighbor_key.tag)
+
+            # Tag: neighbor-address
+            if neighbor_key_name == 'neighbor-address':
+                neighbor_name = neighbor_key.text
+
+            # Tag: state
+            elif neighbor_key_name == 'state':
+                self._parse_neighbor_state(neighbor_key, nbr_dict)
+
+            # Tag: transport
+            elif neighbor_key_name == 'transport':
+                for transport_key in neighbor_key:
+                    if local_name(transport_key.tag) != 'state':
+                        continue
+                    for transport_state_key in transport_key:
+                        key = self.TRANSPORT_KEYS.get(
+                            local_name(transport_state_key.tag))
+                        if key:
+                            nbr_transport_dict[key] = \
+                                transport_state_key.text
+
+            # Tag: timers
+            elif neighbor_key_name == 'timers':
+                for timers_key in neighbor_key:
+                    if local_name(timers_key.tag) != 'state':
+                        continue
+                    for timers_state_key in timers_key:
+                        key = self.TIMERS_KEYS.get(
+                            local_name(timers_state_key.tag))
+                        if key:
+                            nbr_dict[key] = int(timers_state_key.text)
+
+            # Tag: 'graceful-restart'
+            elif neighbor_key_name == 'graceful-restart':
+                for gr_key in neighbor_key:
+                    if local_name(gr_key.tag) == 'state':
+                        self._parse_gr_state(gr_key, nbr_dict)
+
+            # Tag: ebgp-multihop
+            elif neighbor_key_name == 'ebgp-multihop':
+                for ebgp_key in neighbor_key:
+                    if local_name(ebgp_key.tag) != 'state':
+                        continue
+                    for ebgp_state_key in ebgp_key:
+                        ebgp_state_key_name = local_name(ebgp_state_key.tag)
+                        if ebgp_state_key_name == 'enabled':
+                            nbr_dict['nbr_ebgp_multihop'] = \
+                                ebgp_state_key.text == 'true'
+                        elif ebgp_state_key_name == 'multihop-ttl':
+                            nbr_dict['nbr_ebgp_multihop_max_hop'] = \
+                                int(ebgp_state_key.text)
+
+            # Tag: as-path-options
+            elif neighbor_key_name == 'as-path-options':
+                for as_path_key in neighbor_key:
+                    if local_name(as_path_key.tag) != 'state':
+                        continue
+                    for as_path_state_key in as_path_key:
+                        if local_name(as_path_state_key.tag) == \
+                                'allow-own-as':
+                            nbr_dict['allow_own_as'] = \
+                                int(as_path_state_key.text)
+
+            # Tag: route-reflector
+            elif neighbor_key_name == 'route-reflector':
+                for rr_key in neighbor_key:
+                    if local_name(rr_key.tag) != 'state':
+                        continue
+                    for rr_state_key in rr_key:
+                        rr_state_key_name = local_name(rr_state_key.tag)
+                        if rr_state_key_name == 'route-reflector-client':
+                            if rr_state_key.text == 'true':
+                                nbr_dict['route_reflector_client'] = True
+                            elif rr_state_key.text == 'false':
+                                nbr_dict['route_reflector_client'] = False
+                        elif rr_state_key_name == \
+                                'route-reflector-cluster-id':
+                            nbr_dict['route_reflector_cluster_id'] = \
+                                int(rr_state_key.text)
+
+            # Tag: logging
+            elif neighbor_key_name == 'logging-options':
+                for logging_key in neighbor_key:
+                    if local_name(logging_key.tag) != 'state':
+                        continue
+                    for logging_state_key in logging_key:
+                        if local_name(logging_state_key.tag) == \
+                                'log-neighbor-state-changes':
+                            # Add to main vrf dict
+                            self._default_vrf(parsed_dict)\
+                                ['log_neighbor_changes'] = \
+                                logging_state_key.text == 'true'
+
+            # Tag: afi-safis
+            elif neighbor_key_name == 'afi-safis' and \
+                    'neighbor_address_family' in projection:
+                for safis_key in neighbor_key:
+                    if local_name(safis_key.tag) == 'afi-safi':
+                        self._parse_neighbor_afi_safi(safis_key,
+                                                      nbr_safis_dict)
+
+        # Set all tag values to main dictionary
+        if neighbor_name is None:
+            return
+        nbr = self._default_vrf(parsed_dict).setdefault(
+            'neighbor', {}).setdefault(neighbor_name, {})
+        nbr.update(nbr_dict)
+
+        # Set transport tag values
+        if nbr_transport_dict:
+            nbr['bgp_session_transport'] = {'transport': nbr_transport_dict}
+
+        # Set address-family (safi-afi) tag values
+        if 'address_family' in nbr_safis_dict and 'address_family' not in nbr:
+            nbr['address_family'] = nbr_safis_dict['address_family']
+
+    # <transport><state> keys
+    TRANSPORT_KEYS = {'local-address': 'local_host',
+                      'passive-mode': 'passive_mode',
+                      'local-port': 'local_port',
+                      'remote-address': 'foreign_port',
+                      'remote-port': 'foreign_host'}
+
+    # <timers><state> keys
+    TIMERS_KEYS = {'hold-time': 'holdtime',
+                   'keepalive-interval': 'keepalive_interval',
+                   'minimum-advertisement-interval':
+                       'minimum_advertisement_interval',
+                   'negotiated-hold-time': 'holdtime'}
+
+    @staticmethod
+    def _parse_neighbor_state(state, nbr_dict):
+        '''Parse the <state> of a neighbor'''
+        for state_key in state:
+            state_key_name = local_name(state_key.tag)
+            # description
+            if state_key_name == 'description':
+                nbr_dict['description'] = str(state_key.text)
+            # peer-as
+            elif state_key_name == 'peer-as':
+                if state_key.text is not None and state_key.text != 'none':
+                    nbr_dict['remote_as'] = int(state_key.text)
+            # peer-group
+            elif state_key_name == 'peer-group':
+                nbr_dict['peer_group'] = str(state_key.text)
+            # remove-private-as
+            elif state_key_name == 'remove-private-as':
+                nbr_dict['remove_private_as'] = state_key.text == 'true'
+            # send-community
+            elif state_key_name == 'send-community':
+                nbr_dict['send_community'] = str(state_key.text)
+            # queues
+            elif state_key_name == 'queues':
+                for queue_key in state_key:
+                    queue_key_name = local_name(queue_key.tag)
+                    if queue_key_name in ('input', 'output'):
+                        nbr_dict[queue_key_name + '_queue'] = \
+                            int(queue_key.text)
+            # session-state
+            elif state_key_name == 'session-state':
+                nbr_dict['session_state'] = str(state_key.text).lower()
+            # messages
+            elif state_key_name == 'messages':
+                messages_dict = nbr_dict.setdefault(
+                    'bgp_neighbor_counters', {}).setdefault('messages', {})
+                for messages_key in state_key:
+                    # sent, received
+                    direction = local_name(messages_key.tag)
+                    if direction not in ('sent', 'received'):
+                        continue
+                    for count_key in messages_key:
+                        count = {'NOTIFICATION': 'notifications',
+                                 'UPDATE': 'updates'}.get(
+                                    local_name(count_key.tag))
+                        if count:
+                            counts = messages_dict.setdefault(direction, {})
+                            if count_key.text is not None:
+                                counts[count] = int(count_key.text)
+
+    @staticmethod
+    def _parse_neighbor_afi_safi(safis_key, nbr_safis_dict):
+        '''Parse one <afi-safi> of a neighbor'''
+        address_family = 'none'
+        for safi_key in safis_key:
+            safi_key_name = local_name(safi_key.tag)
+
+            # afi-safi-name
+            if safi_key_name == 'afi-safi-name':
+                address_family = str(safi_key.text).lower()
+                address_family = address_family.replace("_", " ")
+                af_dict = nbr_safis_dict.setdefault('address_family', {})
+                if address_family not in af_dict and \
+                   address_family != 'none':
+                    af_dict[address_family] = {}
+                continue
+
+            if address_family == 'none':
+                continue
+            af = nbr_safis_dict['address_family'][address_family]
+
+            # state
+            if safi_key_name == 'state':
+                for state_key in safi_key:
+                    state_key_name = local_name(state_key.tag)
+                    # enabled, active
+                    if state_key_name in ('enabled', 'active'):
+                        af[state_key_name] = state_key.text == 'true'
+                    # prefixes
+                    elif state_key_name == 'prefixes':
+                        for prefix_key in state_key:
+                            prefix_key_name = local_name(prefix_key.tag)
+                            # received, sent
+                            if prefix_key_name in ('received', 'sent'):
+                                af['prefixes_' + prefix_key_name] = \
+                                    int(prefix_key.text)
+
+            # graceful_restart
+            elif safi_key_name == 'graceful-restart':
+                for gr_key in safi_key:
+                    if local_name(gr_key.tag) != 'state':
+                        continue
+                    for gr_state_key in gr_key:
+                        if local_name(gr_state_key.tag) == 'enabled':
+                            af['graceful_restart'] = \
+                                gr_state_key.text == 'true'
+
+            # ipv4-unicast, ipv6-unicast
+            elif safi_key_name in ('ipv4-unicast', 'ipv6-unicast'):
+                for ip_key in safi_key:
+                    if local_name(ip_key.tag) != 'state':
+                        continue
+                    for ip_state_key in ip_key:
+                        if local_name(ip_state_key.tag) == \
+                                'send-default-route':
+                            af[safi_key_name.replace('-', '_') +
+                               '_send_default_route'] = \
+                                ip_state_key.text == 'true'
@@ -331,6 +331,45 @@ class test_yang_bgp_iosxr(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_bgp_openconfig_yang_iosxr_output(self):
+        self.maxDiff = None
+        self.device = Mock()
+        output = '<rpc-reply>{}</rpc-reply>\n]]>]]>'.format(
+            ET.tostring(self.yang_output.data_ele, encoding='unicode'))
+        obj = BgpOpenconfigYang(device=self.device, context='yang')
+        parsed_output = obj.parse(output=output)
+        self.assertEqual(parsed_output,self.golden_parsed_output)
+        self.assertFalse(self.device.get.called)
+
+        # Reply read by chunks of 64 characters
+        records = obj._stream_records(output, {'global', 'neighbor'},
+                                      chunk_size=64)
+        self.assertEqual([name for name, record in records],
+                         ['global', 'neighbor', 'neighbor'])
+
+    def test_bgp_openconfig_yang_iosxr_projection(self):
+        self.maxDiff = None
+        self.device = Mock()
+        self.device.get = Mock()
+        self.device.get.side_effect = [self.yang_output]
+        obj = BgpOpenconfigYang(device=self.device, context='yang')
+        parsed_output = obj.parse(projection=['neighbor'])
+
+        expected_output = {
+            'bgp_pid': 100,
+            'total_paths': 0,
+            'total_prefixes': 0,
+            'vrf': {'default': {
+                'router_id': self.golden_parsed_output['vrf']['default']
+                                                      ['router_id'],
+                'neighbor': {}}}}
+        for neighbor, neighbor_dict in self.golden_parsed_output['vrf']\
+                ['default']['neighbor'].items():
+            expected_output['vrf']['default']['neighbor'][neighbor] = \
+                {k: v for k, v in neighbor_dict.items()
+                 if k != 'address_family'}
+        self.assertEqual(parsed_output, expected_output)
+
 
 # ======================================
 #  Unit test for 'GET' operation on NXOS
@@ -0,0 +1,370 @@
+"""Throughput benchmark of the parsers over the folder based golden outputs.
+
+Every parser tested by ci_folder_parsing.py parses each of its golden outputs
+(``<os>/<Class>/cli/equal/*_output.txt``, with its ``*_arguments.json``), a
+few times to warm up and then ``--iterations`` times. For each golden output
+the benchmark reports:
+
+* us_per_parse: mean time of a parse, in microseconds
+* p50_us, p99_us: median and 99th percentile of the parse times
+* lines_per_s: lines of output parsed per second, from the mean
+* peak_bytes: peak of the memory allocated by one parse, with tracemalloc
+
+With ``--scale``, the parsers of the scale_outputs.py templates parse
+synthetic outputs of the given numbers of entities instead. The parsed
+output must hold all the entities, and the growth of the parse time between
+two sizes is reported as an exponent: 1 for a linear parser, 2 for a
+quadratic one. Exponents above ``--max-exponent`` are flagged as super-linear.
+
+The results are written as JSON with ``--output``, and compared with a
+previous run with ``--baseline``: a golden output whose median time, or
+peak memory, grew by more than ``--threshold`` is a regression, and the
+command then exits with 1.
+
+Examples:
+
+    $ python benchmark_folder_parsing.py -o iosxe --output iosxe.json
+    $ python benchmark_folder_parsing.py -o iosxe -c ShowVersion -i 500
+    $ python benchmark_folder_parsing.py -o iosxe --baseline iosxe.json
+    $ python benchmark_folder_parsing.py -o iosxe --scale 1000,10000,100000
+"""
+
+# Python
+import os
+import sys
+import gc
+import json
+import math
+import time
+import platform
+import argparse
+import tracemalloc
+from unittest.mock import Mock
+
+from folder_discovery import (PARSER_FOLDER, TESTS_FOLDER, get_class_folder,
+                              get_golden_outputs, get_operating_systems,
+                              get_parser_classes, read_golden)
+from scale_outputs import TEMPLATES, build, count_entities
+
+
+def percentile(sorted_values, percent):
+    """Return the nearest-rank percentile of already sorted values."""
+    index = max(int(round(percent / 100.0 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def benchmark_parse(local_class, output, arguments, iterations=100, warmup=5):
+    """Time the parse of one output by a parser class.
+
+    Returns:
+        dict of the measurements of the parse
+    """
+    device = Mock(**{"execute.return_value": output})
+
+    def parse():
+        return local_class(device=device).parse(output=output, **arguments)
+
+    # Warm-up, also fills the caches of the parser and of re
+    for _ in range(warmup):
+        parse()
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            parse()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    # Measured apart, tracemalloc slows down the parse
+    tracemalloc.start()
+    try:
+        parse()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    mean = sum(timings) / len(timings)
+    lines = len(output.splitlines())
+    return {
+        "lines": lines,
+        "iterations": iterations,
+        "us_per_parse": round(mean * 1e6, 2),
+        "p50_us": round(percentile(timings, 50) * 1e6, 2),
+        "p99_us": round(percentile(timings, 99) * 1e6, 2),
+        "lines_per_s": round(lines / mean) if mean else 0,
+        "peak_bytes": peak,
+    }
+
+
+def run_benchmark(operating_systems, _class=None, _token=None, number=None,
+                  iterations=100, warmup=5, log=print):
+    """Benchmark the folder tested parsers of the given OS's.
+
+    Returns:
+        dict with the environment of the run, the results per golden output,
+        keyed by "<os>[/<token>]/<Class>/<golden output>", and the errors of
+        the golden outputs which could not be parsed and of the modules which
+        could not be loaded
+    """
+    results = {}
+    errors = {}
+
+    def module_error(parse_file, e):
+        key = os.path.relpath(parse_file, PARSER_FOLDER)
+        errors[key] = f"{type(e).__name__}: {e}"
+        log(f"{key}: {errors[key]}")
+
+    for operating_system in operating_systems:
+        for token, name, local_class in get_parser_classes(
+            operating_system, _class=_class, _token=_token, on_error=module_error
+        ):
+            folder_root = os.path.join(
+                get_class_folder(operating_system, name, token, TESTS_FOLDER), "equal"
+            )
+            for output_file in get_golden_outputs(folder_root, number):
+                user_test = os.path.basename(output_file[: -len("_output.txt")])
+                key = "/".join(filter(None, [operating_system, token, name, user_test]))
+                output, arguments, _ = read_golden(folder_root, user_test, expected=False)
+                try:
+                    results[key] = benchmark_parse(
+                        local_class, output, arguments, iterations=iterations, warmup=warmup
+                    )
+                except Exception as e:
+                    errors[key] = f"{type(e).__name__}: {e}"
+                    log(f"{key}: {errors[key]}")
+                    continue
+                log(
+                    "{key}: {us_per_parse} us/parse, p99 {p99_us} us, {lines_per_s} "
+                    "lines/s, peak {peak_bytes} B".format(key=key, **results[key])
+                )
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "warmup": warmup,
+        "results": results,
+        "errors": errors,
+    }
+
+
+def run_scale_benchmark(templates, sizes, iterations=3, warmup=1,
+                        max_exponent=1.2, log=print):
+    """Benchmark the parsers of templates over synthetic outputs of each size.
+
+    Returns:
+        dict like run_benchmark, the results are keyed by
+        "<template>/scale_<size>", and the keys of the results growing faster
+        than n ** max_exponent are listed in "super_linear"
+    """
+    results = {}
+    errors = {}
+    super_linear = []
+    for template in templates:
+        try:
+            local_class = next(
+                local_class for _, _, local_class in get_parser_classes(
+                    template.os, _class=template.parser, _token=template.token,
+                    on_error=lambda *args: None
+                )
+            )
+        except StopIteration:
+            errors[template.name] = "Parser class not found"
+            log(f"{template.name}: {errors[template.name]}")
+            continue
+
+        previous = None
+        for size in sorted(sizes):
+            key = f"{template.name}/scale_{size}"
+            output, metadata = build(template, size)
+            try:
+                result = benchmark_parse(
+                    local_class, output, metadata["arguments"],
+                    iterations=iterations, warmup=warmup
+                )
+                parsed = local_class(device=Mock()).parse(
+                    output=output, **metadata["arguments"]
+                )
+            except Exception as e:
+                errors[key] = f"{type(e).__name__}: {e}"
+                log(f"{key}: {errors[key]}")
+                continue
+
+            result["entities"] = size
+            if template.count_path:
+                result["parsed_entities"] = count_entities(parsed, template.count_path)
+            else:
+                result["parsed_entities"] = len(parsed)
+            if result["parsed_entities"] != size:
+                errors[key] = f"{result['parsed_entities']} entities parsed out of {size}"
+                log(f"{key}: {errors[key]}")
+            if previous and previous["p50_us"]:
+                result["exponent"] = round(
+                    math.log(result["p50_us"] / previous["p50_us"])
+                    / math.log(size / previous["entities"]), 2
+                )
+                if result["exponent"] > max_exponent:
+                    super_linear.append(key)
+            results[key] = previous = result
+            log(
+                "{key}: {us_per_parse} us/parse, {lines_per_s} lines/s, peak {peak_bytes} B"
+                "{growth}".format(
+                    key=key,
+                    growth=f", exponent {result['exponent']}" if "exponent" in result else "",
+                    **result
+                )
+            )
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "warmup": warmup,
+        "results": results,
+        "errors": errors,
+        "super_linear": super_linear,
+    }
+
+
+def compare(current, baseline, threshold=0.2, min_us=0):
+    """Compare the results of a run with a baseline run.
+
+    The median time is compared, being the least sensitive to the noise of the
+    machine, along with the peak memory.
+
+    Args:
+        current: results of run_benchmark
+        baseline: results of a previous run_benchmark, loaded from its JSON
+        threshold: growth ratio above which a measure is a regression
+        min_us: ignore the golden outputs parsed in less than min_us in both runs
+
+    Returns:
+        list of (key, measure, baseline value, current value) tuples, one per
+        regression
+    """
+    regressions = []
+    for key, result in sorted(current["results"].items()):
+        base = baseline["results"].get(key)
+        if not base:
+            continue
+        if max(result["p50_us"], base["p50_us"]) >= min_us and \
+                result["p50_us"] > base["p50_us"] * (1 + threshold):
+            regressions.append((key, "p50_us", base["p50_us"], result["p50_us"]))
+        if result["peak_bytes"] > base["peak_bytes"] * (1 + threshold):
+            regressions.append((key, "peak_bytes", base["peak_bytes"], result["peak_bytes"]))
+    return regressions
+
+
+if __name__ == "__main__":
+
+    # Create the parser
+    my_parser = argparse.ArgumentParser(
+        description="Benchmark the parsers over the folder based golden outputs"
+    )
+
+    my_parser.add_argument('-o', "--operating_system",
+                        type=str,
+                        help='The OS you wish to filter on',
+                        default=None)
+    my_parser.add_argument('-c', "--class_name",
+                        type=str,
+                        help="The Class you wish to filter on, (not the Test File)",
+                        default=None)
+    my_parser.add_argument('-t', "--token",
+                        type=str,
+                        help="The Token associated with the class, such as 'asr1k'",
+                        default=None)
+    my_parser.add_argument('-n', "--number",
+                        type=int,
+                        help="The specific golden output to run, such as '25'",
+                        default=None)
+    my_parser.add_argument('-i', "--iterations",
+                        type=int,
+                        help="Timed parses per output, 100 by default, 3 with --scale",
+                        default=None)
+    my_parser.add_argument('-w', "--warmup",
+                        type=int,
+                        help="Parses per output before timing, 5 by default, 1 with --scale",
+                        default=None)
+    my_parser.add_argument("--scale",
+                        type=str,
+                        help="Numbers of entities of the synthetic outputs, such as 1000,10000",
+                        default=None)
+    my_parser.add_argument("--max-exponent",
+                        type=float,
+                        help="Growth exponent flagged as super-linear with --scale",
+                        default=1.2)
+    my_parser.add_argument("--output",
+                        type=str,
+                        help="JSON file to write the results to",
+                        default=None)
+    my_parser.add_argument("--baseline",
+                        type=str,
+                        help="JSON results of a previous run to compare with",
+                        default=None)
+    my_parser.add_argument("--threshold",
+                        type=float,
+                        help="Growth ratio flagged as a regression, 0.2 for 20%%",
+                        default=0.2)
+    my_parser.add_argument("--min-us",
+                        type=float,
+                        help="Ignore the regressions of parses faster than this",
+                        default=50)
+    my_parser.add_argument('-q', "--quiet",
+                        help="Only display the regressions",
+                        action='store_true')
+    args = my_parser.parse_args()
+
+    log = (lambda msg: None) if args.quiet else print
+    if args.scale:
+        templates = [
+            template for template in TEMPLATES.values()
+            if (not args.operating_system or template.os == args.operating_system)
+            and (not args.class_name or template.parser == args.class_name)
+            and (not args.token or template.token == args.token)
+        ]
+        report = run_scale_benchmark(
+            templates,
+            [int(size) for size in args.scale.split(",")],
+            iterations=args.iterations or 3,
+            warmup=1 if args.warmup is None else args.warmup,
+            max_exponent=args.max_exponent,
+            log=log,
+        )
+    else:
+        report = run_benchmark(
+            get_operating_systems(args.operating_system),
+            _class=args.class_name,
+            _token=args.token,
+            number=args.number,
+            iterations=args.iterations or 100,
+            warmup=5 if args.warmup is None else args.warmup,
+            log=log,
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4, sort_keys=True)
+
+    print(f"{len(report['results'])} outputs benchmarked, "
+          f"{len(report['errors'])} errors")
+    for key in report.get("super_linear", []):
+        print(f"SUPER-LINEAR {key}: exponent {report['results'][key]['exponent']}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, threshold=args.threshold,
+                              min_us=args.min_us)
+        for key, measure, before, after in regressions:
+            print(f"REGRESSION {key}: {measure} {before} -> {after} "
+                  f"(+{(after / before - 1) * 100 if before else float('inf'):.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print("No regression against the baseline")
@@ -0,0 +1,338 @@
+"""Import time and memory footprint of the parser modules, per OS package.
+
+Every parser module is imported in a fresh interpreter, after
+``genie.libs.parser`` itself, and the benchmark reports per module:
+
+* import_ms: wall time of the import of the module, with the modules it
+  imports which were not imported yet
+* self_ms: time of the import of the module itself, without the modules it
+  imports, from ``python -X importtime`` (Python 3.7 and later)
+* rss_bytes: growth of the resident memory of the process during the import
+* bytecode_bytes: size of the marshalled code of the module
+* lines: lines of source of the module
+* new_modules: modules imported along with it
+
+The first import of a module also writes its bytecode cache, even with
+PYTHONDONTWRITEBYTECODE set, as a deployment would have it. Each module is
+imported ``--repeat`` times and the minimum of the measures is kept.
+``genie.libs.parser`` alone is measured the same way, as "package".
+
+The results are aggregated per OS package, the sums of the measures of its
+modules, and the ``--top`` slowest and largest modules are listed. They are
+written as JSON with ``--output``, and compared with a previous run with
+``--baseline``: a module or OS whose import time or memory grew by more than
+``--threshold`` is a regression, and the command then exits with 1.
+
+Examples:
+
+    $ python benchmark_imports.py --output imports.json
+    $ python benchmark_imports.py -o iosxe --top 20
+    $ python benchmark_imports.py --baseline imports.json
+"""
+
+# Python
+import os
+import sys
+import json
+import time
+import marshal
+import platform
+import argparse
+import subprocess
+import concurrent.futures
+
+from folder_discovery import PARSER_FOLDER
+
+# Imported in each interpreter before the measured module
+PACKAGE = "genie.libs.parser"
+
+# Packages of PARSER_FOLDER which are not OS packages
+NOT_OS = ("utils", "template")
+
+# Growth of the memory below which it is not compared with the baseline
+MIN_RSS_BYTES = 1 << 20
+
+
+def _rss():
+    """Return the resident memory of this process, in bytes."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Peak instead of current memory, kilobytes on Linux, bytes on macOS
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+
+
+def measure_import(module_name, path=None):
+    """Import a module in this interpreter, after the parser package.
+
+    Returns:
+        dict of the measures of the import
+    """
+    # __import__ rather than importlib.import_module, which is not reported
+    # by python -X importtime
+    if module_name != PACKAGE:
+        __import__(PACKAGE)
+
+    modules = len(sys.modules)
+    rss = _rss()
+    start = time.perf_counter()
+    __import__(module_name)
+    import_s = time.perf_counter() - start
+    result = {
+        "import_ms": round(import_s * 1e3, 3),
+        "rss_bytes": max(_rss() - rss, 0),
+        "new_modules": len(sys.modules) - modules,
+    }
+    if path:
+        with open(path) as f:
+            source = f.read()
+        result["bytecode_bytes"] = len(marshal.dumps(compile(source, path, "exec")))
+        result["lines"] = source.count("\n")
+    return result
+
+
+def get_os_packages(_os=None):
+    """Return the OS packages of the parsers."""
+    if _os:
+        return [_os]
+    return sorted(
+        name for name in os.listdir(PARSER_FOLDER)
+        if name not in NOT_OS
+        and os.path.isfile(os.path.join(PARSER_FOLDER, name, "__init__.py"))
+    )
+
+
+def get_modules(operating_system):
+    """Return (module name, path) of the modules of an OS package, the tests
+    excluded."""
+    modules = []
+    os_folder = os.path.join(PARSER_FOLDER, operating_system)
+    for root, dirs, files in os.walk(os_folder):
+        dirs[:] = sorted(d for d in dirs if d not in ("tests", "__pycache__"))
+        for name in sorted(files):
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(root, name)
+            parts = os.path.relpath(path, PARSER_FOLDER)[: -len(".py")].split(os.sep)
+            if parts[-1] == "__init__":
+                parts.pop()
+            modules.append((".".join([PACKAGE] + parts), path))
+    return modules
+
+
+def run_import(module_name, path=None, repeat=3, timeout=300):
+    """Measure the import of a module in fresh interpreters.
+
+    Returns:
+        dict of the minimum of each measure over the runs
+    """
+    command = [sys.executable, os.path.abspath(__file__), "--child", module_name]
+    if sys.version_info >= (3, 7):
+        command[1:1] = ["-X", "importtime"]
+    if path:
+        command.append(path)
+    # Without bytecode caches, the compile of the sources would be measured
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    runs = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True, timeout=timeout, env=env,
+        )
+        if process.returncode:
+            error = process.stderr.strip().splitlines() or ["exit code {}".format(process.returncode)]
+            raise Exception(error[-1])
+        # Modules may print at import, the measures are on the last line
+        run = json.loads(process.stdout.strip().splitlines()[-1])
+        # import time: <self us> | <cumulative us> | <module>
+        for line in process.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module_name:
+                run["self_ms"] = int(fields[0].split(":")[-1]) / 1e3
+        runs.append(run)
+    return {key: min(run[key] for run in runs) for key in runs[0]}
+
+
+def run_benchmark(operating_systems, repeat=3, jobs=None, log=print):
+    """Benchmark the import of the modules of the given OS packages.
+
+    Returns:
+        dict with the environment of the run, the results per module, the
+        sums per OS, and the errors of the modules which could not be imported
+    """
+    tasks = [(PACKAGE, None, None)]
+    for operating_system in operating_systems:
+        tasks.extend((name, path, operating_system)
+                     for name, path in get_modules(operating_system))
+
+    results = {}
+    errors = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(run_import, name, path, repeat): (name, operating_system)
+            for name, path, operating_system in tasks
+        }
+        for future in concurrent.futures.as_completed(futures):
+            name, operating_system = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                errors[name] = f"{type(e).__name__}: {e}"
+                log(f"{name}: {errors[name]}")
+                continue
+            result["os"] = operating_system
+            results[name] = result
+            log("{name}: {import_ms} ms, {rss_bytes} B".format(name=name, **result))
+
+    package = results.pop(PACKAGE, None)
+    operating_systems_totals = {}
+    for result in results.values():
+        total = operating_systems_totals.setdefault(result["os"], {
+            "modules": 0, "import_ms": 0, "self_ms": 0, "rss_bytes": 0,
+            "bytecode_bytes": 0, "lines": 0,
+        })
+        total["modules"] += 1
+        for key in ("import_ms", "self_ms", "rss_bytes", "bytecode_bytes", "lines"):
+            total[key] += result.get(key, 0)
+    for total in operating_systems_totals.values():
+        total["import_ms"] = round(total["import_ms"], 3)
+        total["self_ms"] = round(total["self_ms"], 3)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "package": package,
+        "results": results,
+        "operating_systems": operating_systems_totals,
+        "errors": errors,
+    }
+
+
+def top_offenders(report, measure, top=10):
+    """Return the (module, value) of the top modules for a measure."""
+    return sorted(((name, result[measure]) for name, result in report["results"].items()),
+                  key=lambda item: -item[1])[:top]
+
+
+def compare(current, baseline, threshold=0.2, min_ms=5):
+    """Compare the results of a run with a baseline run.
+
+    Args:
+        current: results of run_benchmark
+        baseline: results of a previous run_benchmark, loaded from its JSON
+        threshold: growth ratio above which a measure is a regression
+        min_ms: ignore the modules imported in less than min_ms in both runs
+
+    Returns:
+        list of (module or OS, measure, baseline value, current value) tuples,
+        one per regression
+    """
+    regressions = []
+    entries = [(name, result, baseline["results"].get(name))
+               for name, result in sorted(current["results"].items())]
+    entries.extend((name, total, baseline["operating_systems"].get(name))
+                   for name, total in sorted(current["operating_systems"].items()))
+    for name, result, base in entries:
+        if not base:
+            continue
+        if max(result["import_ms"], base["import_ms"]) >= min_ms and \
+                result["import_ms"] > base["import_ms"] * (1 + threshold):
+            regressions.append((name, "import_ms", base["import_ms"], result["import_ms"]))
+        if max(result["rss_bytes"], base["rss_bytes"]) >= MIN_RSS_BYTES and \
+                result["rss_bytes"] > base["rss_bytes"] * (1 + threshold):
+            regressions.append((name, "rss_bytes", base["rss_bytes"], result["rss_bytes"]))
+    return regressions
+
+
+if __name__ == "__main__":
+
+    # Measure of one import, in the interpreter started by run_import
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        print(json.dumps(measure_import(*sys.argv[2:4])))
+        sys.exit(0)
+
+    # Create the parser
+    my_parser = argparse.ArgumentParser(
+        description="Benchmark the import of the parser modules"
+    )
+
+    my_parser.add_argument('-o', "--operating_system",
+                        type=str,
+                        help='The OS you wish to filter on',
+                        default=None)
+    my_parser.add_argument('-r', "--repeat",
+                        type=int,
+                        help="Imports per module, the minimum is kept",
+                        default=3)
+    my_parser.add_argument('-j', "--jobs",
+                        type=int,
+                        help="Interpreters run at once, the number of CPUs by default",
+                        default=None)
+    my_parser.add_argument("--top",
+                        type=int,
+                        help="Number of slowest and largest modules to display",
+                        default=10)
+    my_parser.add_argument("--output",
+                        type=str,
+                        help="JSON file to write the results to",
+                        default=None)
+    my_parser.add_argument("--baseline",
+                        type=str,
+                        help="JSON results of a previous run to compare with",
+                        default=None)
+    my_parser.add_argument("--threshold",
+                        type=float,
+                        help="Growth ratio flagged as a regression, 0.2 for 20%%",
+                        default=0.2)
+    my_parser.add_argument("--min-ms",
+                        type=float,
+                        help="Ignore the regressions of imports faster than this",
+                        default=5)
+    my_parser.add_argument('-q', "--quiet",
+                        help="Only display the summary and the regressions",
+                        action='store_true')
+    args = my_parser.parse_args()
+
+    log = (lambda msg: None) if args.quiet else print
+    report = run_benchmark(
+        get_os_packages(args.operating_system),
+        repeat=args.repeat,
+        jobs=args.jobs,
+        log=log,
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4, sort_keys=True)
+
+    if report["package"]:
+        print("{package}: {import_ms} ms, {rss_bytes} B".format(
+            package=PACKAGE, **report["package"]))
+    for name, total in sorted(report["operating_systems"].items()):
+        print("{name}: {modules} modules, {import_ms} ms ({self_ms} ms self), {rss_bytes} B, "
+              "{bytecode_bytes} B of bytecode, {lines} lines".format(name=name, **total))
+    for measure in ("import_ms", "self_ms", "rss_bytes"):
+        if not all(measure in result for result in report["results"].values()):
+            continue
+        print(f"Top {measure}:")
+        for name, value in top_offenders(report, measure, args.top):
+            print(f"    {name}: {value}")
+    print(f"{len(report['results'])} modules benchmarked, "
+          f"{len(report['errors'])} errors")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, threshold=args.threshold,
+                              min_ms=args.min_ms)
+        for name, measure, before, after in regressions:
+            print(f"REGRESSION {name}: {measure} {before} -> {after} "
+                  f"(+{(after / before - 1) * 100 if before else float('inf'):.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print("No regression against the baseline")
@@ -0,0 +1,240 @@
+"""Benchmark of the Table based parsers against their parsergen versions.
+
+ShowVersion, ShowUsers and ShowApphostingList of iosxe read their column
+tables with ``genie.libs.parser.utils.table.Table``, they used
+``genie.parsergen.oper_fill_tabular`` before. For the parsergen version, the
+Table class attributes of the parser are replaced by the same tables read
+with ``oper_fill_tabular``, with the header fields, labels, index and
+terminal pattern of the Table, as the parsers called it.
+
+Both versions parse every golden output of the parsers, a few times to warm
+up and then ``--iterations`` times. The median time of a parse of each
+version is reported, with the speedup of the Table version, and the parsed
+outputs of both versions must be equal. With ``--rows``, the rows of the
+first table found in each golden output are repeated up to the given numbers
+of rows, the index of the entries stays the same so the parsed outputs are
+unchanged.
+
+genie.parsergen must be installed.
+
+Examples:
+
+    $ python benchmark_table.py
+    $ python benchmark_table.py -c ShowUsers -i 500
+    $ python benchmark_table.py --rows 100,1000,10000 --output table.json
+"""
+
+# Python
+import os
+import gc
+import json
+import time
+import platform
+import argparse
+from unittest.mock import Mock, patch
+
+import genie.parsergen as pg
+
+from genie.libs.parser.iosxe.show_platform import ShowVersion
+from genie.libs.parser.iosxe.show_session import ShowUsers
+from genie.libs.parser.iosxe.show_app_hosting import ShowApphostingList
+
+from folder_discovery import TESTS_FOLDER, get_class_folder, get_golden_outputs, read_golden
+
+# Table class attributes of each parser, with the device_os the parser gave
+# to oper_fill_tabular
+PARSERS = {
+    "ShowVersion": (ShowVersion, {"switch_table": "iosxe",
+                                  "ios_switch_table": "ios",
+                                  "license_table": "iosxe"}),
+    "ShowUsers": (ShowUsers, {"line_table": "iosxe",
+                              "interface_table": "iosxe"}),
+    "ShowApphostingList": (ShowApphostingList, {"app_table": None}),
+}
+
+
+class ParsergenTable(object):
+    """A Table read with parsergen.oper_fill_tabular instead."""
+
+    def __init__(self, table, device_os=None):
+        self.kwargs = {
+            "header_fields": table.header_fields,
+            "label_fields": table.label_fields,
+            "index": table.index,
+            "right_justified": table.right_justified,
+        }
+        if table._terminal:
+            self.kwargs["table_terminal_pattern"] = table._terminal.pattern
+        if table._skip:
+            self.kwargs["skip_line"] = table._skip.pattern
+        if device_os:
+            self.kwargs["device_os"] = device_os
+
+    def entries(self, output):
+        return pg.oper_fill_tabular(device_output=output, **self.kwargs).entries
+
+
+def parsergen_version(local_class, tables):
+    """Return the patchers replacing the tables of a parser class with their
+    parsergen version."""
+    return [
+        patch.object(local_class, name, ParsergenTable(getattr(local_class, name), device_os))
+        for name, device_os in tables.items()
+    ]
+
+
+def scale_output(output, tables, rows):
+    """Return output with the rows of its first table repeated up to rows."""
+    lines = output.splitlines()
+    for table in tables:
+        for i, line in enumerate(lines):
+            rule = lines[i + 1] if i + 1 < len(lines) else None
+            if table.columns(line, rule) is None:
+                continue
+            start = i + 1
+            if rule and rule.strip() and not rule.strip(" -=+"):
+                start += 1
+            end = start
+            while end < len(lines) and lines[end].strip() and not (
+                    table._terminal and table._terminal.search(lines[end])):
+                end += 1
+            body = lines[start:end]
+            if not body:
+                continue
+            body = (body * (rows // len(body) + 1))[:rows]
+            return "\n".join(lines[:start] + body + lines[end:]) + "\n"
+    return output
+
+
+def time_parse(local_class, output, arguments, iterations=100, warmup=5):
+    """Return the parsed output and the median time of a parse, in us."""
+    device = Mock(**{"execute.return_value": output})
+
+    def parse():
+        return local_class(device=device).parse(output=output, **arguments)
+
+    for _ in range(warmup):
+        parsed = parse()
+    times = []
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            parsed = parse()
+            times.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    times.sort()
+    return parsed, round(times[len(times) // 2] * 1e6, 1)
+
+
+def run_benchmark(class_names, rows=None, iterations=100, warmup=5, log=print):
+    """Parse the golden outputs of the parsers with both versions.
+
+    Returns:
+        dict with the environment of the run, the results keyed by
+        "<Class>/<golden output>[/rows_<rows>]", and the errors of the
+        outputs not parsed the same by both versions
+    """
+    results = {}
+    errors = {}
+    for name in class_names:
+        local_class, tables = PARSERS[name]
+        folder_root = os.path.join(
+            get_class_folder("iosxe", name, tests_folder=TESTS_FOLDER), "equal"
+        )
+        for output_file in get_golden_outputs(folder_root):
+            user_test = os.path.basename(output_file[: -len("_output.txt")])
+            golden, arguments, _ = read_golden(folder_root, user_test, expected=False)
+            for count in rows or [None]:
+                key = "/".join(filter(None, [name, user_test, count and f"rows_{count}"]))
+                output = golden
+                if count:
+                    output = scale_output(
+                        golden, [getattr(local_class, table) for table in tables], count
+                    )
+                try:
+                    parsed, table_us = time_parse(
+                        local_class, output, arguments, iterations=iterations, warmup=warmup
+                    )
+                    patchers = parsergen_version(local_class, tables)
+                    for patcher in patchers:
+                        patcher.start()
+                    try:
+                        pg_parsed, parsergen_us = time_parse(
+                            local_class, output, arguments, iterations=iterations,
+                            warmup=warmup
+                        )
+                    finally:
+                        for patcher in patchers:
+                            patcher.stop()
+                except Exception as e:
+                    errors[key] = f"{type(e).__name__}: {e}"
+                    log(f"{key}: {errors[key]}")
+                    continue
+
+                if parsed != pg_parsed:
+                    errors[key] = "Parsed outputs differ"
+                    log(f"{key}: {errors[key]}")
+                results[key] = {
+                    "lines": output.count("\n"),
+                    "table_us": table_us,
+                    "parsergen_us": parsergen_us,
+                    "speedup": round(parsergen_us / table_us, 1) if table_us else None,
+                }
+                log(
+                    "{key}: {lines} lines, table {table_us} us, parsergen "
+                    "{parsergen_us} us, x{speedup}".format(key=key, **results[key])
+                )
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "warmup": warmup,
+        "results": results,
+        "errors": errors,
+    }
+
+
+if __name__ == "__main__":
+
+    # Create the parser
+    my_parser = argparse.ArgumentParser(
+        description="Benchmark the Table based parsers against their parsergen versions"
+    )
+
+    my_parser.add_argument('-c', "--class_name",
+                        type=str,
+                        choices=sorted(PARSERS),
+                        help="The Class you wish to filter on",
+                        default=None)
+    my_parser.add_argument('-i', "--iterations",
+                        type=int,
+                        help="Timed parses per output and version, 100 by default, 5 with --rows",
+                        default=None)
+    my_parser.add_argument('-w', "--warmup",
+                        type=int,
+                        help="Parses per output and version before timing",
+                        default=5)
+    my_parser.add_argument("--rows",
+                        type=str,
+                        help="Numbers of rows of the scaled outputs, such as 100,1000",
+                        default=None)
+    my_parser.add_argument("--output",
+                        type=str,
+                        help="JSON file to write the results to",
+                        default=None)
+    args = my_parser.parse_args()
+
+    rows = [int(count) for count in args.rows.split(",")] if args.rows else None
+    iterations = args.iterations or (5 if rows else 100)
+    report = run_benchmark(
+        [args.class_name] if args.class_name else sorted(PARSERS),
+        rows=rows, iterations=iterations, warmup=args.warmup,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if report["errors"]:
+        exit(1)
@@ -0,0 +1,358 @@
+"""Discovery of the folder tested parsers and of their golden files.
+
+Shared by the folder based test run (ci_folder_parsing.py) and the tools
+running over the same corpus, such as benchmark_folder_parsing.py. Nothing
+here depends on pyATS.
+
+A parser class is folder tested when it has a ``cli`` method, and its
+golden files are found under ``<os>[/<token>]/<Class>/cli/equal``:
+
+* ``<name>_output.txt``: device output
+* ``<name>_expected.py``: ``expected_output``, the parsed output
+* ``<name>_arguments.json``: arguments given to parse(). Optional
+"""
+
+# Python
+import os
+import re
+import glob
+import json
+import inspect
+import importlib.machinery
+
+# Folder holding this file, and the OS symlinks to the golden files
+TESTS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+# Folder holding the OS packages of the parsers
+PARSER_FOLDER = os.path.join(TESTS_FOLDER, "..", "src", "genie", "libs", "parser")
+
+
+def read_from_file(file_path):
+    """Helper function to read from a file."""
+    with open(file_path, "r") as f:
+        return f.read()
+
+
+def read_json_file(file_path):
+    """Helper function to read in json."""
+    with open(file_path) as f:
+        data = json.load(f)
+    return data
+
+
+def read_python_file(file_path):
+    """Helper function to read in a Python file, and look for expected_output."""
+    _module = importlib.machinery.SourceFileLoader("expected", file_path).load_module()
+    return getattr(_module, "expected_output")
+
+
+def get_operating_systems(_os):
+    """Helper Script to get operating systems."""
+    # Update and fix as more OS's converted to folder based tests
+    if _os:
+        return [_os]
+    return ["asa", "ios", "iosxe", "junos"]
+
+
+# The get_tokens function dynamically finds tokens by leveraging globs. This
+# works based on the deterministic folder structure. Within a given OS root folder one can
+# determine that a sub folder is in fact a token, if there is a "tests" directory. Upon removing
+# the .py via [-2], there is now a list of files to import from.
+def get_tokens(folder):
+    tokens = []
+    for path in glob.glob(f"{folder}/*/tests"):
+        tokens.append(path.split("/")[-2])
+    return tokens
+
+
+def get_files(folder, token=None):
+    files = []
+    for parse_file in glob.glob(f"{folder}/*.py"):
+        if parse_file.endswith("__init__.py"):
+            continue
+        files.append({"parse_file": parse_file, "token": token})
+    return files
+
+
+def load_parser_module(parse_file, operating_system, token=None):
+    """Load a parser module from its file, under a name unique per OS and token."""
+    module_name = os.path.basename(parse_file[: -len(".py")])
+    if token:
+        module_name = f"{operating_system}_{token}_{module_name}"
+    else:
+        module_name = f"{operating_system}_{module_name}"
+    return importlib.machinery.SourceFileLoader(
+        module_name, parse_file
+    ).load_module()
+
+
+def import_parser_module(parse_file, operating_system, token=None):
+    """Import a parser module under its package name, such as
+    genie.libs.parser.iosxe.show_bgp.
+
+    The module and the modules it imports are then executed once per
+    process, whichever module is tested first. Falls back on
+    load_parser_module when the importable genie.libs.parser is not the one
+    of this tree.
+    """
+    try:
+        package = importlib.import_module("genie.libs.parser")
+        folders = [os.path.realpath(path) for path in package.__path__]
+    except ImportError:
+        folders = []
+    if os.path.realpath(PARSER_FOLDER) not in folders:
+        return load_parser_module(parse_file, operating_system, token)
+
+    relative = os.path.relpath(os.path.realpath(parse_file),
+                               os.path.realpath(PARSER_FOLDER))
+    module_name = relative[: -len(".py")].replace(os.sep, ".")
+    return importlib.import_module(f"genie.libs.parser.{module_name}")
+
+
+def get_parse_files(operating_system, base_folder=None, _token=None):
+    """Return the parser files of an OS, as {"parse_file", "token"} dicts."""
+    if base_folder is None:
+        base_folder = os.path.join(PARSER_FOLDER, operating_system)
+    # Please refer to get_tokens comments for the how, the what is a genie token, such as
+    # "asr1k" or "c3850" to provide namespaced parsing.
+    tokens = get_tokens(base_folder)
+    parse_files = []
+    parse_files.extend(get_files(base_folder))
+    for token in tokens:
+        parse_files.extend(get_files(f"{base_folder}/{token}", token))
+    # This is used in conjunction with the arguments that are run at command line, to skip over all tests you are
+    # not concerned with, without even loading the other modules.
+    return [details for details in parse_files
+            if not _token or _token == details["token"]]
+
+
+def get_parser_classes(operating_system, base_folder=None, _class=None, _token=None,
+                       on_error=None):
+    """Yield (token, class name, class) for every folder tested parser of an OS.
+
+    Args:
+        operating_system: OS package, such as "iosxe"
+        base_folder: folder of the OS package. Defaults to the one under PARSER_FOLDER
+        _class: only yield the class of that name
+        _token: only yield the classes of that token, such as "asr1k"
+        on_error: called with the file and the exception of a module which
+                  cannot be loaded, which is then skipped. Raised by default
+    """
+    # Get all of the root level files
+    for details in get_parse_files(operating_system, base_folder, _token):
+        parse_file = details["parse_file"]
+        token = details["token"]
+        # Load all of the classes in each of those files, and search for classes
+        # that have a `cli` method
+        try:
+            _module = load_parser_module(parse_file, operating_system, token)
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(parse_file, e)
+            continue
+
+        yield from get_module_classes(_module, operating_system, token, _class)
+
+
+def get_module_classes(_module, operating_system, token=None, _class=None):
+    """Yield (token, class name, class) for the folder tested parsers of a module."""
+    for name, local_class in inspect.getmembers(_module):
+        # The following methods determin when a test is not warranted, further detail will be provided for each method.
+
+        # If there is a token and the "class" was found to be a known whitelist (mainly since there was not existing tests),
+        # skip. Whitelisted items should be cleaned up over time, and this removed to enforce testing always happens.
+        if token and CLASS_SKIP.get(operating_system, {}).get(token, {}).get(
+            name
+        ):
+            continue
+        # Same as previous, but in cases without tokens (which is the majority.)
+        elif not token and CLASS_SKIP.get(operating_system, {}).get(name):
+            continue
+
+        # Same as the token, however, for class
+        if _class and _class != name:
+            continue
+        # Each "globals()" is checked to see if it has a cli attribute, if so, assumed to be a parser. The _osxe, is
+        # since the ios module often refers to the iosxe parser, leveraging this naming convention.
+        if hasattr(local_class, "cli") and not name.endswith("_iosxe"):
+            yield token, name, local_class
+
+
+def get_class_folder(operating_system, class_name, token=None, tests_folder=None):
+    """Return the folder of the golden files of a class, <os>[/<token>]/<Class>/cli."""
+    parts = [operating_system, token, class_name, "cli"]
+    if tests_folder:
+        parts.insert(0, tests_folder)
+    return os.path.join(*filter(None, parts))
+
+
+def get_golden_outputs(folder_root, number=None):
+    """Return the *_output.txt files of a folder, in natural order.
+
+    Args:
+        folder_root: folder of the golden files, such as <os>/<Class>/cli/equal
+        number: only return golden_output<number>_output.txt, or
+                golden_output_<number>_output.txt, both namings are used
+    """
+    # Get list of output files to parse and sort
+    convert = lambda text: int(text) if text.isdigit() else text
+    aph_key = lambda key: [convert(c) for c in re.split("([0-9]+)", key)]
+    if number:
+        return sorted(
+            glob.glob(f"{folder_root}/golden_output{number}_output.txt")
+            + glob.glob(f"{folder_root}/golden_output_{number}_output.txt"),
+            key=aph_key,
+        )
+    return sorted(glob.glob(f"{folder_root}/*_output.txt"), key=aph_key)
+
+
+def read_golden(folder_root, user_test, expected=True):
+    """Read the files of one golden test.
+
+    Returns:
+        (output, arguments, expected output) tuple, the expected output is
+        None when expected is False
+    """
+    output = read_from_file(f"{folder_root}/{user_test}_output.txt")
+    arguments = {}
+    if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
+        arguments = read_json_file(f"{folder_root}/{user_test}_arguments.json")
+    expected_output = None
+    if expected:
+        expected_output = read_python_file(f"{folder_root}/{user_test}_expected.py")
+    return output, arguments, expected_output
+
+
+CLASS_SKIP = {
+    "asa": {
+        "ShowVpnSessiondbSuper": True,
+        },
+    "iosxe": {
+        "c9300": {
+            "ShowInventory": True,
+        },
+        "ShowPimNeighbor": True,
+        "ShowIpInterfaceBrief": True,
+        "ShowIpInterfaceBriefPipeVlan": True,
+        "ShowBfdSessions": True,
+        "ShowBfdSessions_viptela": True,
+        "ShowBfdSummary": True,
+        "ShowDot1x": True,
+        "ShowEnvironmentAll": True,
+        "ShowControlConnections_viptela": True,
+        "ShowControlConnections": True,
+        "ShowEigrpNeighborsSuperParser": True,
+        "ShowIpEigrpNeighborsDetailSuperParser": True,
+        "ShowIpOspfInterface": True,
+        "ShowIpOspfNeighborDetail": True,
+        "ShowIpOspfShamLinks": True,
+        "ShowIpOspfVirtualLinks": True,
+        "ShowIpOspfMplsTrafficEngLink": True,
+        "ShowIpOspfDatabaseOpaqueAreaTypeExtLink": True,
+        "ShowIpOspfDatabaseOpaqueAreaTypeExtLinkAdvRouter": True,
+        "ShowIpOspfDatabaseOpaqueAreaTypeExtLinkSelfOriginate": True,
+        "ShowIpOspfDatabaseTypeParser": True,
+        "ShowIpOspfLinksParser": True,  # super class
+        "ShowIpOspfLinksParser2": True, # super class
+        "ShowIpRouteDistributor": True,
+        "ShowIpv6RouteDistributor": True,
+        "ShowControlLocalProperties_viptela": True,
+        "ShowControlLocalProperties": True,
+        "ShowVrfDetailSuperParser": True,
+        "ShowBgp": True,
+        "ShowBgpAllNeighborsRoutesSuperParser": True,
+        "ShowBgpDetailSuperParser": True,
+        "ShowBgpNeighborSuperParser": True,
+        "ShowBgpNeighborsAdvertisedRoutesSuperParser": True,
+        "ShowBgpNeighborsReceivedRoutes": True,
+        "ShowBgpNeighborsReceivedRoutesSuperParser": True,
+        "ShowBgpNeighborsRoutes": True,
+        "ShowBgpSummarySuperParser": True,
+        "ShowBgpSuperParser": True,
+        "ShowIpBgpAllNeighborsAdvertisedRoutes": True,
+        "ShowIpBgpAllNeighborsReceivedRoutes": True,
+        "ShowIpBgpNeighborsReceivedRoutes": True,
+        "ShowIpBgpNeighborsRoutes": True,
+        "ShowIpBgpRouteDistributer": True,
+        "ShowPolicyMapTypeSuperParser": True,
+        "ShowIpLocalPool": True,
+        "ShowInterfaceDetail": True,
+        "ShowInterfaceIpBrief": True,
+        "ShowInterfaceSummary": True,
+        "ShowAuthenticationSessionsInterface": True,
+        "ShowVersion_viptela": True,
+        "ShowOmpPeers_viptela": True,
+        "ShowBfdSummary_viptela": True,
+        "ShowOmpTlocPath_viptela": True,
+        "ShowOmpTlocs_viptela": True,
+        "ShowSoftwaretab_viptela": True, # PR submitted
+        "ShowRebootHistory_viptela": True,
+        "ShowOmpSummary_viptela": True,
+        "ShowSystemStatus_viptela": True,
+        "ShowTcpProxyStatistics": True, # PR submitted
+        "ShowTcpproxyStatus": True, # PR submitted
+        "ShowPlatformTcamUtilization": True, # PR submitted
+        "ShowLicense": True, # PR submitted
+        "Show_Stackwise_Virtual_Dual_Active_Detection": True, # PR submitted
+        "ShowSoftwaretab": True, # PR submitted
+        "ShowOmpPeers_viptela": True,
+        "ShowOmpTlocPath_viptela": True,
+        "ShowOmpTlocs_viptela": True,
+        "genie": True, # need to check
+    },
+    "ios": {
+        "ShowPimNeighbor": True,
+        "ShowInterfacesTrunk": True,
+        "ShowIpInterfaceBrief": True,
+        "ShowIpInterfaceBriefPipeVlan": True,
+        "ShowDot1x": True,
+        "ShowBoot": True,
+        "ShowPagpNeighbor": True,
+        "ShowIpProtocols": True,
+        "ShowIpv6Rpf": True,
+        "ShowIpOspfDatabaseRouter": True,
+        "ShowIpOspfInterface": True,
+        "ShowIpOspfMplsTrafficEngLink": True,
+        "ShowIpOspfNeighborDetail": True,
+        "ShowIpOspfShamLinks": True,
+        "ShowIpOspfVirtualLinks": True,
+        "ShowIpv6Route": True,
+        "ShowIpBgp": True,
+        "ShowMplsLdpNeighbor": True,
+        "ShowInterfaceDetail": True,
+        "ShowInterfaceIpBrief": True,
+        "ShowInterfaceSummary": True,
+        "ShowInterfaceTransceiverDetail": True,
+        "ShowSdwanSystemStatus": True,
+        "ShowSdwanSoftware": True,
+    },
+    "junos": {
+        "MonitorInterfaceTraffic": True, # issue with Mac
+        "ShowBgpGroupDetailNoMore": True, # need to check
+        "ShowBgpGroupBriefNoMore": True, # need to check
+        "ShowTaskMemory": True, # need to check
+        "ShowConfigurationSystemNtp": True, # need to check
+        "ShowDdosProtectionStatistics": True, # need to check
+        "ShowLDPSession": True, # need to check
+        "ShowOspfRoutePrefix": True, # need to check
+        "ShowOspfNeighborInstance": True, # need to check
+        "ShowOspfDatabaseAdvertisingRouterExtensive": True, # need to check
+        "ShowArpNoMore": True, # need to check
+        "ShowRouteProtocolNoMore": True, # need to check
+        "ShowRouteLogicalSystem": True, # need to check
+        "ShowInterfacesTerseInterface": True, # need to check
+        "ShowInterfacesExtensiveNoForwarding": True, # need to check
+        "ShowInterfacesExtensiveInterface": True, # need to check
+        "ShowOspf3NeighborInstance": True, # need to check
+        "ShowOspf3RoutePrefix": True, # need to check
+    }
+}
+
+EMPTY_SKIP = {
+    "iosxe": {"ShowVersion": True},
+    "ios": {
+        "ShowVersion": True,
+        "ShowIpv6EigrpNeighbors": True,
+        "ShowIpv6EigrpNeighborsDetail": True,
+    },
+}
@@ -0,0 +1,504 @@
+"""Parallel run of the folder based golden tests, without pyATS.
+
+Runs the same tests as ci_folder_parsing.py, the golden outputs of every
+folder tested parser (``<os>[/<token>]/<Class>/cli/equal``) and its empty
+outputs (``cli/empty``), in seconds instead of most of an hour:
+
+* the parser files of the OS's are sharded over ``--jobs`` processes, the
+  largest files first. A file is the unit of work, its module being
+  imported once for all its classes. ``--shard 2/4`` only runs the second
+  quarter of the files, to split a run over several CI jobs
+* the modules are imported under their package name, so a module imported by
+  several others is executed once per process
+* the expected outputs are loaded from a pickle cache in ``--cache-dir``,
+  instead of executing the ``*_expected.py`` files, some of which are tens of
+  thousands of lines long. An entry is rebuilt when the size or modification
+  time of its file changes
+* the parsed and expected outputs are compared with ``==``, and only diffed
+  when they differ
+* the results are kept in ``--results-cache`` with a hash of their inputs per
+  parser class: its module, the modules of its base classes and its golden
+  files. A class whose inputs did not change is not run again, its results
+  are reported from the cache, and a file whose classes all kept their
+  inputs is not even imported. ``--all`` runs every class. Runs filtered
+  with ``-c`` or ``-n`` neither use nor update the cache. Other changes,
+  such as to a helper module of utils, need ``--all``
+
+The failures are printed with their diff, and the command exits with 1 when
+any test failed.
+
+Examples:
+
+    $ python parallel_folder_parsing.py
+    $ python parallel_folder_parsing.py -o iosxe -j 8
+    $ python parallel_folder_parsing.py -o junos -c ShowRoute
+    $ python parallel_folder_parsing.py --shard 1/4
+    $ python parallel_folder_parsing.py --all
+"""
+
+# Python
+import os
+import sys
+import json
+import time
+import fcntl
+import pickle
+import difflib
+import hashlib
+import argparse
+import concurrent.futures
+from unittest.mock import Mock
+
+from folder_discovery import (EMPTY_SKIP, PARSER_FOLDER, TESTS_FOLDER,
+                              get_class_folder, get_golden_outputs,
+                              get_module_classes, get_operating_systems,
+                              get_parse_files, import_parser_module,
+                              read_golden, read_python_file)
+
+# Default folder of the expected outputs cache
+CACHE_FOLDER = os.path.join(TESTS_FOLDER, ".expected_cache")
+# Default file of the results cache
+RESULTS_CACHE = os.path.join(CACHE_FOLDER, "results.json")
+
+
+class ExpectedCache(object):
+    """Expected outputs of the golden tests, pickled once per version of
+    their ``*_expected.py`` file.
+
+    Args:
+        folder: folder of the pickles, None to always execute the files
+    """
+
+    def __init__(self, folder=None):
+        self.folder = folder
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+    def _cache_file(self, path):
+        name = hashlib.sha1(os.path.realpath(path).encode()).hexdigest()
+        return os.path.join(self.folder, f"{name}.pickle")
+
+    def load(self, path):
+        """Return the expected_output of an _expected.py file."""
+        if not self.folder:
+            return read_python_file(path)
+
+        stat = os.stat(path)
+        version = (stat.st_size, stat.st_mtime_ns)
+        cache_file = self._cache_file(path)
+        try:
+            with open(cache_file, "rb") as f:
+                if pickle.load(f) == version:
+                    return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+
+        expected_output = read_python_file(path)
+        # Written aside and renamed, other processes may read the same entry
+        temporary = f"{cache_file}.{os.getpid()}"
+        with open(temporary, "wb") as f:
+            pickle.dump(version, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(expected_output, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_file)
+        return expected_output
+
+
+def digest(path):
+    """Return the sha1 of a file, or of the names and contents of the files of
+    a folder, "" when missing."""
+    sha1 = hashlib.sha1()
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                sha1.update(os.path.relpath(file_path, path).encode() + b"\0")
+                with open(file_path, "rb") as f:
+                    sha1.update(f.read())
+    elif os.path.isfile(path):
+        with open(path, "rb") as f:
+            sha1.update(f.read())
+    else:
+        return ""
+    return sha1.hexdigest()
+
+
+def _relative(path):
+    return os.path.relpath(os.path.realpath(path), os.path.realpath(TESTS_FOLDER))
+
+
+class ResultCache(object):
+    """Results of the parser classes, with the hashes of the inputs they were
+    obtained from, persisted in a JSON file.
+
+    Entries are per parser file:
+
+        {"inputs": {path: sha1, ...},
+         "classes": {class key: {"hash": sha1, "results": [...]}}}
+
+    The inputs of a file are the ones of all its classes, paths being relative
+    to the tests folder. Runs sharing the file, such as the shards of a CI
+    run, only save the entries they updated.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = self._load()
+        self._updated = set()
+        self._digests = {}
+
+    def _load(self):
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path) as f:
+                    return json.load(f)
+            except ValueError:
+                pass
+        return {}
+
+    def digest(self, path):
+        """Return the digest of an input path, computed once per run."""
+        if path not in self._digests:
+            self._digests[path] = digest(os.path.join(TESTS_FOLDER, path))
+        return self._digests[path]
+
+    def unchanged(self, parse_file):
+        """Return the cached entry of a parser file if none of its inputs
+        changed, else None."""
+        entry = self.entries.get(_relative(parse_file))
+        if not entry or not entry["inputs"]:
+            return None
+        for path, sha1 in entry["inputs"].items():
+            if self.digest(path) != sha1:
+                return None
+        return entry
+
+    def classes(self, parse_file):
+        """Return the cached classes of a parser file."""
+        return self.entries.get(_relative(parse_file), {}).get("classes", {})
+
+    def update(self, parse_file, classes, inputs):
+        key = _relative(parse_file)
+        self.entries[key] = {"inputs": inputs, "classes": classes}
+        self._updated.add(key)
+
+    def save(self):
+        """Write the updated entries over the ones of the file, the other
+        entries may have been updated by another run since it was read."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(f"{self.path}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            entries = self._load()
+            entries.update((key, self.entries[key]) for key in self._updated)
+            temporary = f"{self.path}.{os.getpid()}"
+            with open(temporary, "w") as f:
+                json.dump(entries, f, indent=1, sort_keys=True)
+            os.replace(temporary, self.path)
+        self.entries = entries
+
+
+def class_inputs(local_class, class_folder):
+    """Return the inputs of the tests of a class: the modules of the class and
+    of its base classes within the parsers, and its folder of golden files."""
+    parser_folder = os.path.realpath(PARSER_FOLDER) + os.sep
+    inputs = {_relative(class_folder)}
+    for cls in local_class.__mro__:
+        module = sys.modules.get(cls.__module__)
+        module_file = getattr(module, "__file__", None)
+        if module_file and os.path.realpath(module_file).startswith(parser_folder):
+            inputs.add(_relative(module_file))
+    return sorted(inputs)
+
+
+def diff_outputs(parsed_output, expected_output):
+    """Return the difference between the parsed and the expected output."""
+    try:
+        from genie.utils.diff import Diff
+    except ImportError:
+        Diff = None
+    if Diff is not None:
+        dd = Diff(parsed_output, expected_output)
+        dd.findDiff()
+        return str(dd)
+    return "\n".join(difflib.unified_diff(
+        json.dumps(expected_output, indent=4, sort_keys=True, default=str).splitlines(),
+        json.dumps(parsed_output, indent=4, sort_keys=True, default=str).splitlines(),
+        "expected", "parsed", lineterm="",
+    ))
+
+
+def _result(key, status, message=None, diff=None):
+    return {"key": key, "status": status, "message": message, "diff": diff}
+
+
+def test_golden(local_class, folder_root, key, cache, number=None):
+    """Yield the results of the golden outputs of a class."""
+    output_files = get_golden_outputs(folder_root, number)
+    if not output_files and not number:
+        yield _result(key, "failed", "No files found in appropriate directory")
+
+    for output_file in output_files:
+        user_test = os.path.basename(output_file[: -len("_output.txt")])
+        test_key = f"{key}/{user_test}"
+        try:
+            output, arguments, _ = read_golden(folder_root, user_test, expected=False)
+            expected_output = cache.load(f"{folder_root}/{user_test}_expected.py")
+            device = Mock(**{"execute.return_value": output})
+            parsed_output = local_class(device=device).parse(**arguments)
+        except Exception as e:
+            yield _result(test_key, "error", f"{type(e).__name__}: {e}")
+            continue
+
+        if parsed_output == expected_output:
+            yield _result(test_key, "passed")
+        else:
+            yield _result(test_key, "failed",
+                          "Device output and expected output do not match",
+                          diff_outputs(parsed_output, expected_output))
+
+
+def test_empty(local_class, folder_root, key, operating_system):
+    """Yield the results of the empty outputs of a class."""
+    from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+    output_files = get_golden_outputs(folder_root)
+    if not output_files and not EMPTY_SKIP.get(operating_system, {}).get(
+        local_class.__name__
+    ):
+        yield _result(f"{key}/empty", "failed",
+                      "No files found in appropriate directory for empty file")
+
+    for output_file in output_files:
+        user_test = os.path.basename(output_file[: -len("_output.txt")])
+        test_key = f"{key}/empty/{user_test}"
+        output, arguments, _ = read_golden(folder_root, user_test, expected=False)
+        device = Mock(**{"execute.return_value": output})
+        try:
+            local_class(device=device).parse(**arguments)
+        except (SchemaEmptyParserError, AttributeError):
+            yield _result(test_key, "passed")
+        except Exception as e:
+            yield _result(test_key, "error", f"{type(e).__name__}: {e}")
+        else:
+            yield _result(test_key, "failed", "File parsed, when expected not to")
+
+
+def run_file(task):
+    """Run the tests of the classes of a parser file, in a worker process.
+
+    The classes found in the cached classes with the same hash of their inputs
+    are not run again.
+
+    Returns:
+        dict of the results, a list of dicts of key, status (passed, failed
+        or error), message and diff, and of the classes, None when the module
+        cannot be imported, else {class key: {"hash", "inputs", "results"}}
+    """
+    operating_system, token, parse_file, options, cached_classes = task
+    cache = ExpectedCache(options["cache_dir"])
+    try:
+        _module = import_parser_module(parse_file, operating_system, token)
+    except Exception as e:
+        key = os.path.relpath(parse_file, TESTS_FOLDER)
+        return {"results": [_result(key, "error", f"{type(e).__name__}: {e}")],
+                "classes": None}
+
+    digests = ResultCache(None)
+    results = []
+    classes = {}
+    for token, name, local_class in get_module_classes(
+        _module, operating_system, token, options["class_name"]
+    ):
+        key = "/".join(filter(None, [operating_system, token, name]))
+        class_folder = get_class_folder(operating_system, name, token, TESTS_FOLDER)
+        inputs = class_inputs(local_class, class_folder)
+        sha1 = hashlib.sha1("".join(
+            f"{path}:{digests.digest(path)}\n" for path in inputs).encode()
+        ).hexdigest()
+
+        cached = cached_classes.get(key)
+        if cached and cached["hash"] == sha1:
+            class_results = [dict(result, cached=True) for result in cached["results"]]
+        else:
+            class_results = list(test_golden(local_class, f"{class_folder}/equal", key,
+                                             cache, options["number"]))
+            if not options["number"]:
+                class_results.extend(test_empty(local_class, f"{class_folder}/empty",
+                                                key, operating_system))
+        results.extend(class_results)
+        classes[key] = {
+            "hash": sha1,
+            "inputs": {path: digests.digest(path) for path in inputs},
+            "results": [dict(result, cached=False) for result in class_results],
+        }
+    return {"results": results, "classes": classes}
+
+
+def get_tasks(operating_systems, _class=None, _token=None, shard=None):
+    """Return the (os, token, parser file) to run, the largest files first.
+
+    Args:
+        shard: (index, count) tuple, only return the index-th of count shards,
+               counted from 1
+    """
+    tasks = []
+    for operating_system in operating_systems:
+        for details in get_parse_files(operating_system, _token=_token):
+            parse_file = details["parse_file"]
+            if _class:
+                # Only the files naming the class may hold it
+                with open(parse_file) as f:
+                    if _class not in f.read():
+                        continue
+            tasks.append((operating_system, details["token"], parse_file))
+    tasks.sort(key=lambda task: (-os.path.getsize(task[2]), task[2]))
+    if shard:
+        index, count = shard
+        tasks = tasks[index - 1::count]
+    return tasks
+
+
+def run(operating_systems, _class=None, _token=None, number=None, jobs=None,
+        shard=None, cache_dir=CACHE_FOLDER, results_cache=RESULTS_CACHE,
+        run_all=False, log=print):
+    """Run the folder based tests of the given OS's over processes.
+
+    Args:
+        results_cache: JSON file of the results cache, None to run every class
+        run_all: run every class, and update the results cache
+
+    Returns:
+        dict of the results keyed by test, a class imported by several
+        modules of an OS is only reported once. The results reported from
+        the cache have "cached" set
+    """
+    options = {"class_name": _class, "number": number, "cache_dir": cache_dir}
+    # A filtered run does not test whole files
+    if _class or number:
+        results_cache = None
+    result_cache = ResultCache(results_cache)
+
+    results = {}
+
+    def report(file_results):
+        for result in file_results:
+            if result["key"] in results:
+                continue
+            results[result["key"]] = result
+            if result["status"] != "passed":
+                cached = " (cached)" if result.get("cached") else ""
+                log(f"{result['status'].upper()} {result['key']}{cached}: "
+                    f"{result['message']}")
+                if result["diff"]:
+                    log(result["diff"])
+
+    tasks = []
+    for task in get_tasks(operating_systems, _class=_class, _token=_token, shard=shard):
+        parse_file = task[2]
+        entry = None if run_all or not results_cache else result_cache.unchanged(parse_file)
+        if entry:
+            report(dict(result, cached=True)
+                   for class_entry in entry["classes"].values()
+                   for result in class_entry["results"])
+            continue
+        cached_classes = {} if run_all or not results_cache else result_cache.classes(parse_file)
+        tasks.append(task + (options, cached_classes))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        for task, file_results in zip(tasks, executor.map(run_file, tasks)):
+            report(file_results["results"])
+            if file_results["classes"] is not None:
+                inputs = {_relative(task[2]): result_cache.digest(_relative(task[2]))}
+                for class_entry in file_results["classes"].values():
+                    inputs.update(class_entry.pop("inputs"))
+                result_cache.update(task[2], file_results["classes"], inputs)
+
+    # The golden output of the number may be in any folder of the class, the
+    # other shards may hold the class
+    if number and not shard and not any(
+            key.rsplit("/", 1)[-1].startswith("golden_output") for key in results):
+        report([_result(_class, "failed",
+                        f"No golden_output{number} file found in appropriate directory")])
+
+    if results_cache:
+        result_cache.save()
+    return results
+
+
+if __name__ == "__main__":
+
+    # Create the parser
+    my_parser = argparse.ArgumentParser(
+        description="Run the folder based golden tests over processes"
+    )
+
+    my_parser.add_argument('-o', "--operating_system",
+                        type=str,
+                        help='The OS you wish to filter on',
+                        default=None)
+    my_parser.add_argument('-c', "--class_name",
+                        type=str,
+                        help="The Class you wish to filter on, (not the Test File)",
+                        default=None)
+    my_parser.add_argument('-t', "--token",
+                        type=str,
+                        help="The Token associated with the class, such as 'asr1k'",
+                        default=None)
+    my_parser.add_argument('-n', "--number",
+                        type=int,
+                        help="The specific unittest we want to run, such as '25'",
+                        default=None)
+    my_parser.add_argument('-j', "--jobs",
+                        type=int,
+                        help="Number of processes, the number of CPUs by default",
+                        default=None)
+    my_parser.add_argument("--shard",
+                        type=str,
+                        help="Only run one shard of the parser files, such as '2/4'",
+                        default=None)
+    my_parser.add_argument("--cache-dir",
+                        type=str,
+                        help="Folder of the expected outputs cache",
+                        default=CACHE_FOLDER)
+    my_parser.add_argument("--no-cache",
+                        help="Execute the expected output files, without cache",
+                        action='store_true')
+    my_parser.add_argument("--results-cache",
+                        type=str,
+                        help="JSON file of the results of the previous runs",
+                        default=RESULTS_CACHE)
+    my_parser.add_argument("--all",
+                        help="Run every class, even when its inputs did not change",
+                        action='store_true')
+    args = my_parser.parse_args()
+
+    if args.number and not args.class_name:
+        sys.exit("Unittest number provided but missing supporting arguments:"
+                "\n* '-c' or '--class_name' for the parser class")
+    shard = None
+    if args.shard:
+        index, count = (int(part) for part in args.shard.split("/"))
+        if not 1 <= index <= count:
+            sys.exit(f"Invalid shard '{args.shard}', such as '2/4' expected")
+        shard = (index, count)
+
+    start = time.perf_counter()
+    results = run(
+        get_operating_systems(args.operating_system),
+        _class=args.class_name,
+        _token=args.token,
+        number=args.number,
+        jobs=args.jobs,
+        shard=shard,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        results_cache=args.results_cache,
+        run_all=args.all,
+    )
+
+    statuses = [result["status"] for result in results.values()]
+    cached = sum(1 for result in results.values() if result.get("cached"))
+    print(f"{statuses.count('passed')} passed, {statuses.count('failed')} failed, "
+          f"{statuses.count('error')} errors ({cached} from the results cache) "
+          f"in {time.perf_counter() - start:.1f}s")
+    if len(statuses) != statuses.count("passed"):
+        sys.exit(1)
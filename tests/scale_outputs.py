@@ -0,0 +1,331 @@
+"""Synthetic outputs at scale, built from the folder based golden outputs.
+
+The golden outputs are tens of lines long, while a full routing table or the
+interfaces of a chassis are hundreds of thousands. A parser which rescans a
+list or rebuilds a dict for every line stays fast on the goldens, and blows
+up on a real device.
+
+A template takes a golden output and a regex for the first line of its
+per-entity blocks: a route, a BGP prefix, a MAC entry, an interface. The
+lines before the first block are kept once as header, and the lines from the
+``end`` regex on are kept once as trailer. The blocks are replicated, round
+after round, until the requested number of entities, and the keys of every
+round are rewritten to unique values:
+
+* ipv4: the first three octets are renumbered, the last one is kept so the
+  prefixes stay aligned. The first octets of the golden output are never
+  produced, and the masks (224 and above) are kept
+* mac: locally administered addresses, in the format of the golden output
+* interface: the first number of the interface is offset for every round,
+  ``Gi1/0/2`` and ``GigabitEthernet1/0/2`` stay the same interface
+
+A key appearing in several blocks of a round, such as a next hop, keeps the
+same value in the whole round. The first round is the golden output itself.
+IPv6 addresses are kept, so the templates only replicate IPv4 families.
+
+Each output comes with metadata: the number of entities, which the parsed
+output must hold at ``count_path``, and the lines and bytes of the output.
+
+Examples:
+
+    $ python scale_outputs.py --list
+    $ python scale_outputs.py iosxe/ShowIpRoute 1000000 --output-dir /tmp/scale
+"""
+
+# Python
+import os
+import re
+import sys
+import json
+import argparse
+
+from folder_discovery import TESTS_FOLDER, get_class_folder, read_golden
+
+_IPV4 = re.compile(r"(?<![\w.])(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})(?!\.?\d)")
+_MAC = re.compile(r"(?<![\w.:])(?:[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}\.[0-9a-fA-F]{4}"
+                  r"|[0-9a-fA-F]{2}(?::[0-9a-fA-F]{2}){5})(?![\w.:])")
+_INTERFACE = re.compile(
+    r"(?<![\w-])((?:TenGigabitEthernet|TwentyFiveGigE|FortyGigabitEthernet|"
+    r"HundredGigE|GigabitEthernet|FastEthernet|Ethernet|Port-channel|Vlan|"
+    r"Loopback|Tunnel|Te|Gi|Fa|Eth|Po|Vl|Lo|Tu|ge-|xe-|et-|ae)"
+    r")(\d+)((?:/\d+)*(?:\.\d+)?)(?![\w/])"
+)
+
+_PATTERNS = {"ipv4": _IPV4, "mac": _MAC, "interface": _INTERFACE}
+
+
+class Template(object):
+    """Golden output replicated at scale.
+
+    Args:
+        os: OS of the parser, such as "iosxe"
+        parser: parser class name, such as "ShowIpRoute"
+        golden: golden output name, such as "golden_output_1"
+        block: regex of the first line of an entity block
+        end: regex of the first line of the trailer. Optional
+        keys: kinds of keys rewritten in the blocks: ipv4, mac, interface
+        count_path: keys to the entities in the parsed output, "*" for every
+                    key or item of a level
+        token: token of the parser, such as "asr1k". Optional
+    """
+
+    def __init__(self, os, parser, golden, block, end=None, keys=("ipv4",),
+                 count_path=(), token=None):
+        self.os = os
+        self.parser = parser
+        self.golden = golden
+        self.block = re.compile(block)
+        self.end = re.compile(end) if end else None
+        self.keys = keys
+        self.count_path = list(count_path)
+        self.token = token
+
+    @property
+    def name(self):
+        return "/".join(filter(None, [self.os, self.token, self.parser]))
+
+    def read(self):
+        """Return (output, arguments) of the golden output."""
+        folder_root = os.path.join(
+            get_class_folder(self.os, self.parser, self.token, TESTS_FOLDER), "equal"
+        )
+        output, arguments, _ = read_golden(folder_root, self.golden, expected=False)
+        return output, arguments
+
+    def split(self, output):
+        """Split an output into (header, blocks, trailer)."""
+        lines = output.splitlines(True)
+        header, blocks, trailer = [], [], []
+        for line in lines:
+            if trailer or (blocks and self.end and self.end.search(line)):
+                trailer.append(line)
+            elif self.block.search(line):
+                blocks.append([line])
+            elif blocks:
+                blocks[-1].append(line)
+            else:
+                header.append(line)
+        if not blocks:
+            raise Exception(f"No block found in {self.name} {self.golden}")
+        return "".join(header), ["".join(block) for block in blocks], "".join(trailer)
+
+
+class _Renumbering(object):
+    """Unique values of the keys of a round, none of them in the golden output."""
+
+    def __init__(self, blocks, keys):
+        text = "".join(blocks)
+        # Distinct keys of the blocks, numbered in order of appearance
+        self.index = {}
+        for kind in keys:
+            for match in _PATTERNS[kind].finditer(text):
+                key = self._normalized(kind, match)
+                if key is not None:
+                    self.index.setdefault(kind, {}).setdefault(key, len(self.index[kind]))
+
+        # ipv4: the /24s are taken in the first octets unused by the golden output
+        used = {int(prefix.split(".")[0]) for prefix in self.index.get("ipv4", {})}
+        self.first_octets = [o for o in range(1, 224) if o not in used and o != 127]
+        # mac: the first byte of a locally administered unicast address
+        used = {int(mac[:2], 16) for mac in self.index.get("mac", {})}
+        self.mac_byte = next(b for b in range(2, 256, 4) if b not in used)
+        # interface: the first number is offset by a power of ten per round
+        numbers = [int(number) for _, number in self.index.get("interface", {})]
+        self.interface_step = 10 ** len(str(max(numbers, default=0)))
+
+    @staticmethod
+    def _normalized(kind, match):
+        if kind == "ipv4":
+            octets = [int(o) for o in match.groups()]
+            if max(octets) > 255 or octets[0] >= 224:
+                return None
+            return "{}.{}.{}".format(*octets[:3])
+        if kind == "mac":
+            return re.sub("[.:]", "", match.group()).lower()
+        if kind == "interface":
+            return match.group(1), match.group(2)
+
+    def rewrite(self, kind, match, round_):
+        """Return the value of a key match in a round."""
+        key = self._normalized(kind, match)
+        if key is None:
+            return match.group()
+        index = self.index[kind][key]
+        if kind == "ipv4":
+            number = (round_ - 1) * len(self.index[kind]) + index
+            if number >> 16 >= len(self.first_octets):
+                raise Exception("Not enough ipv4 addresses for this scale")
+            return "{}.{}.{}.{}".format(
+                self.first_octets[number >> 16], (number >> 8) & 0xFF,
+                number & 0xFF, match.group(4)
+            )
+        if kind == "mac":
+            number = (round_ - 1) * len(self.index[kind]) + index
+            digits = "{:02x}{:010x}".format(self.mac_byte, number)
+            if match.group() != match.group().lower():
+                digits = digits.upper()
+            if ":" in match.group():
+                return ":".join(digits[i:i + 2] for i in range(0, 12, 2))
+            return ".".join(digits[i:i + 4] for i in range(0, 12, 4))
+        number = int(match.group(2)) + round_ * self.interface_step
+        return f"{match.group(1)}{number}{match.group(3)}"
+
+
+def _compile(block, keys):
+    """Split a block into its literal text and its keys: [text, (kind, match), ...]"""
+    matches = []
+    for kind in keys:
+        matches.extend((match.start(), match.end(), kind, match)
+                       for match in _PATTERNS[kind].finditer(block))
+    parts = []
+    position = 0
+    for start, end, kind, match in sorted(matches, key=lambda m: m[0]):
+        if start < position:
+            # Overlapping match of another kind, the first one wins
+            continue
+        parts.append(block[position:start])
+        parts.append((kind, match))
+        position = end
+    parts.append(block[position:])
+    return parts
+
+
+def generate(template, entities):
+    """Yield the pieces of a synthetic output holding entities blocks."""
+    output, _ = template.read()
+    header, blocks, trailer = template.split(output)
+    renumbering = _Renumbering(blocks, template.keys)
+    compiled = [_compile(block, template.keys) for block in blocks]
+
+    yield header
+    for number in range(entities):
+        round_, index = divmod(number, len(blocks))
+        if round_ == 0:
+            yield blocks[index]
+            continue
+        yield "".join(
+            part if isinstance(part, str) else renumbering.rewrite(part[0], part[1], round_)
+            for part in compiled[index]
+        )
+    yield trailer
+
+
+def build(template, entities, path=None):
+    """Build a synthetic output, in memory or into a file.
+
+    Returns:
+        (output, metadata) tuple, output is None when written to path
+    """
+    _, arguments = template.read()
+    chunks = generate(template, entities)
+    lines = size = 0
+    if path:
+        with open(path, "w") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                lines += chunk.count("\n")
+                size += len(chunk)
+        output = None
+    else:
+        output = "".join(chunks)
+        lines = output.count("\n")
+        size = len(output)
+
+    metadata = {
+        "template": template.name,
+        "golden": template.golden,
+        "arguments": arguments,
+        "entities": entities,
+        "count_path": template.count_path,
+        "lines": lines,
+        "bytes": size,
+    }
+    return output, metadata
+
+
+def count_entities(parsed, path):
+    """Count the entities found at path in a parsed output."""
+    level = [parsed]
+    for key in path:
+        next_level = []
+        for item in level:
+            if key == "*":
+                next_level.extend(item.values() if isinstance(item, dict) else item)
+            elif isinstance(item, dict) and key in item:
+                next_level.append(item[key])
+        level = next_level
+    return sum(len(item) for item in level)
+
+
+TEMPLATES = {
+    template.name: template
+    for template in [
+        Template(
+            "iosxe", "ShowIpRoute", "golden_output_1",
+            block=r"^\S.{0,8}?\s\d{1,3}(?:\.\d{1,3}){3}",
+            count_path=["vrf", "default", "address_family", "ipv4", "routes"],
+        ),
+        Template(
+            "iosxe", "ShowBgpAllDetail", "golden_output1",
+            block=r"^\s*BGP routing table entry for",
+            end=r"^\s*For address family: ",
+            count_path=["instance", "default", "vrf", "default", "address_family",
+                        "ipv4 unicast", "prefixes"],
+        ),
+        Template(
+            "iosxe", "ShowMacAddressTable", "golden_output",
+            block=r"^\s*(?:\*\s*)?(?:All|\d+)\s+[0-9a-fA-F]{4}\.",
+            end=r"^Total Mac Addresses",
+            keys=("mac",),
+            count_path=["mac_table", "vlans", "*", "mac_addresses"],
+        ),
+        Template(
+            "iosxe", "ShowInterfaces", "golden_output",
+            block=r"^\S+ is (?:administratively )?(?:up|down|deleted)",
+            keys=("interface", "ipv4", "mac"),
+        ),
+        Template(
+            "junos", "ShowRouteProtocolExtensive", "golden_output_5",
+            block=r"^\s*\d{1,3}(?:\.\d{1,3}){3}/\d+ \(\d+ entr",
+            end=r"^\s*\S+: \d+ destinations",
+            count_path=["route-information", "route-table", "*", "rt"],
+        ),
+    ]
+}
+
+
+if __name__ == "__main__":
+
+    # Create the parser
+    my_parser = argparse.ArgumentParser(
+        description="Build synthetic outputs at scale from the golden outputs"
+    )
+    my_parser.add_argument("template", nargs="?",
+                        help="Template name, such as 'iosxe/ShowIpRoute'")
+    my_parser.add_argument("entities", nargs="*", type=int,
+                        help="Number of entities of the outputs, such as 1000000")
+    my_parser.add_argument("--output-dir",
+                        type=str,
+                        help="Folder to write the outputs and metadata to",
+                        default=".")
+    my_parser.add_argument("--list",
+                        help="List the templates",
+                        action="store_true")
+    args = my_parser.parse_args()
+
+    if args.list or not args.template:
+        for name, template in sorted(TEMPLATES.items()):
+            print(f"{name}: {template.golden}")
+        sys.exit(0)
+
+    if args.template not in TEMPLATES:
+        sys.exit(f"Unknown template '{args.template}', see --list")
+    template = TEMPLATES[args.template]
+    os.makedirs(args.output_dir, exist_ok=True)
+    for entities in args.entities:
+        base = os.path.join(args.output_dir, f"{template.os}_{template.parser}_{entities}")
+        _, metadata = build(template, entities, path=f"{base}_output.txt")
+        with open(f"{base}_metadata.json", "w") as f:
+            json.dump(metadata, f, indent=4, sort_keys=True)
+        print(f"{base}_output.txt: {metadata['entities']} entities, "
+              f"{metadata['lines']} lines, {metadata['bytes']} bytes")
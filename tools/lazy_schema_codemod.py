@@ -0,0 +1,203 @@
+"""Rewrite the schemas of the parser classes to be built on first access.
+
+A schema class defines its schema as a class attribute, built when the
+module is imported:
+
+    class ShowVersionSchema(MetaParser):
+        schema = {
+            'version': str,
+        }
+
+which this codemod rewrites to a LazySchema, built on first access:
+
+    class ShowVersionSchema(MetaParser):
+        schema = LazySchema(lambda: {
+            'version': str,
+        })
+
+and imports LazySchema from genie.libs.parser.base, after the import of
+MetaParser, or else after the last import at the top of the module. Only the
+text around the dict is changed, its formatting and comments are kept.
+
+A ``schema`` is left as it is when it is not a dict literal, or when the
+dict uses a name defined in the class body, which the lambda would not see.
+
+The codemod needs Python 3.8 or later, for the end positions of the ast.
+With ``--check``, the files are not rewritten: the schemas the codemod would
+rewrite are listed, and the command exits with 1 if any. The schemas it
+leaves as they are, such as the ones validated with a function of their
+class, are only counted.
+
+Examples:
+
+    $ python lazy_schema_codemod.py
+    $ python lazy_schema_codemod.py -o iosxe
+    $ python lazy_schema_codemod.py --check
+"""
+
+# Python
+import os
+import ast
+import sys
+import argparse
+
+PARSER_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "..", "src", "genie", "libs", "parser")
+
+IMPORT = b"from genie.libs.parser.base import LazySchema\n"
+PREFIX = b"LazySchema(lambda: "
+SUFFIX = b")"
+
+
+def get_files(_os=None):
+    """Return the parser modules of an OS, or of every OS, the tests excluded."""
+    folder = os.path.join(PARSER_FOLDER, _os) if _os else PARSER_FOLDER
+    files = []
+    for root, dirs, names in os.walk(folder):
+        dirs[:] = sorted(d for d in dirs if d not in ("tests", "__pycache__"))
+        files.extend(os.path.join(root, name) for name in sorted(names)
+                     if name.endswith(".py"))
+    return files
+
+
+def _class_names(node):
+    """Return the names assigned in the body of a class."""
+    names = set()
+    for statement in node.body:
+        for child in ast.walk(statement):
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+                names.add(child.id)
+        if isinstance(statement, (ast.FunctionDef, ast.ClassDef)):
+            names.add(statement.name)
+    return names
+
+
+def find_schemas(tree):
+    """Return (class name, dict node) of the eager schemas of a module."""
+    schemas = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for statement in node.body:
+            if not (isinstance(statement, ast.Assign)
+                    and len(statement.targets) == 1
+                    and isinstance(statement.targets[0], ast.Name)
+                    and statement.targets[0].id == "schema"
+                    and isinstance(statement.value, ast.Dict)):
+                continue
+            used = {child.id for child in ast.walk(statement.value)
+                    if isinstance(child, ast.Name)}
+            if used & (_class_names(node) - {"schema"}):
+                continue
+            schemas.append((node.name, statement.value))
+    return schemas
+
+
+def count_skipped(tree):
+    """Return the number of schemas of a module which are neither lazy nor
+    rewritten by find_schemas."""
+    rewritten = {node for _, node in find_schemas(tree)}
+    count = 0
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for statement in node.body:
+            if (isinstance(statement, ast.Assign)
+                    and any(isinstance(target, ast.Name) and target.id == "schema"
+                            for target in statement.targets)
+                    and not (isinstance(statement.value, ast.Call)
+                             and isinstance(statement.value.func, ast.Name)
+                             and statement.value.func.id == "LazySchema")
+                    and statement.value not in rewritten):
+                count += 1
+    return count
+
+
+def _import_line(tree):
+    """Return the line after which to import LazySchema."""
+    last = 0
+    if tree.body and isinstance(tree.body[0], ast.Expr) and \
+            isinstance(tree.body[0].value, ast.Constant):
+        # After the docstring of the module, when it has no import
+        last = tree.body[0].end_lineno
+    imports = False
+    for statement in tree.body:
+        if not isinstance(statement, (ast.Import, ast.ImportFrom)):
+            if imports:
+                break
+            continue
+        imports = True
+        last = statement.end_lineno
+        if isinstance(statement, ast.ImportFrom) and statement.module == "genie.metaparser":
+            return last
+    return last
+
+
+def rewrite(source):
+    """Return the source of a module with lazy schemas, and the classes
+    rewritten."""
+    tree = ast.parse(source)
+    schemas = find_schemas(tree)
+    if not schemas:
+        return source, []
+
+    # Offsets of the ast are in bytes of utf-8
+    lines = source.encode().splitlines(True)
+    edits = []
+    for _, node in schemas:
+        edits.append((node.end_lineno - 1, node.end_col_offset, SUFFIX))
+        edits.append((node.lineno - 1, node.col_offset, PREFIX))
+    for line, column, text in sorted(edits, reverse=True):
+        lines[line] = lines[line][:column] + text + lines[line][column:]
+
+    already = any(isinstance(statement, ast.ImportFrom)
+                  and statement.module == "genie.libs.parser.base"
+                  and any(alias.name == "LazySchema" for alias in statement.names)
+                  for statement in tree.body)
+    if not already:
+        lines.insert(_import_line(tree), IMPORT)
+    return b"".join(lines).decode(), [name for name, _ in schemas]
+
+
+if __name__ == "__main__":
+
+    # Create the parser
+    my_parser = argparse.ArgumentParser(
+        description="Rewrite the schemas of the parser classes as LazySchema"
+    )
+    my_parser.add_argument('-o', "--operating_system",
+                        type=str,
+                        help='The OS you wish to filter on',
+                        default=None)
+    my_parser.add_argument("--check",
+                        help="List the schemas to rewrite, without rewriting",
+                        action='store_true')
+    args = my_parser.parse_args()
+
+    total = 0
+    skipped = 0
+    for path in get_files(args.operating_system):
+        # newline="", the line endings are kept
+        with open(path, encoding="utf-8", newline="") as f:
+            source = f.read()
+        if args.check:
+            skipped += count_skipped(ast.parse(source))
+        new_source, classes = rewrite(source)
+        if not classes:
+            continue
+        total += len(classes)
+        relative = os.path.relpath(path, PARSER_FOLDER)
+        if args.check:
+            for name in classes:
+                print(f"{relative}: {name}")
+            continue
+        # The rewritten module must still compile
+        compile(new_source, path, "exec")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(new_source)
+        print(f"{relative}: {len(classes)} schemas")
+
+    if args.check:
+        print(f"{total} schemas to rewrite, {skipped} left as they are")
+        sys.exit(1 if total else 0)
+    print(f"{total} schemas rewritten")